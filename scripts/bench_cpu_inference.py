@@ -0,0 +1,93 @@
+"""
+Measures cpu generation latency and throughput of a small decoder with and
+without dynamic int8 quantization, for each number of torch threads.
+Latency is the time to generate for one prompt. Throughput is generated
+tokens per second for a batch of prompts. Without a checkpoint, a randomly
+initialized Llama of the given size is used.
+"""
+
+import sys
+import argparse
+import time
+from typing import Optional
+
+import torch
+from transformers import LlamaConfig, LlamaForCausalLM, PreTrainedModel
+
+from tactic_gen.train_decoder import get_cpu_model
+
+
+def get_model(
+    checkpoint_loc: Optional[str], hidden_size: int, num_layers: int, quantize: bool
+) -> PreTrainedModel:
+    if checkpoint_loc is not None:
+        return get_cpu_model(checkpoint_loc, quantize=quantize)
+    torch.manual_seed(0)
+    config = LlamaConfig(
+        vocab_size=32000,
+        hidden_size=hidden_size,
+        intermediate_size=4 * hidden_size,
+        num_hidden_layers=num_layers,
+        num_attention_heads=hidden_size // 64,
+    )
+    model = LlamaForCausalLM(config).eval()
+    if quantize:
+        model = torch.ao.quantization.quantize_dynamic(
+            model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+    return model
+
+
+def generate_time(
+    model: PreTrainedModel, batch_size: int, prompt_len: int, new_tokens: int
+) -> float:
+    input_ids = torch.randint(
+        3, model.config.vocab_size, (batch_size, prompt_len), dtype=torch.long
+    )
+    start = time.time()
+    with torch.inference_mode():
+        model.generate(
+            input_ids,
+            attention_mask=torch.ones_like(input_ids),
+            max_new_tokens=new_tokens,
+            min_new_tokens=new_tokens,
+            do_sample=False,
+            pad_token_id=0,
+        )
+    return time.time() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark cpu generation of a small decoder."
+    )
+    parser.add_argument("--checkpoint_loc", default=None)
+    parser.add_argument("--hidden_size", type=int, default=512)
+    parser.add_argument("--num_layers", type=int, default=8)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 4])
+    parser.add_argument("--prompt_len", type=int, default=512)
+    parser.add_argument("--new_tokens", type=int, default=32)
+    parser.add_argument("--batch_size", type=int, default=8)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args(sys.argv[1:])
+
+    for quantize in [False, True]:
+        model = get_model(
+            args.checkpoint_loc, args.hidden_size, args.num_layers, quantize
+        )
+        for num_threads in args.threads:
+            torch.set_num_threads(num_threads)
+            generate_time(model, 1, args.prompt_len, 2)
+            latency = min(
+                generate_time(model, 1, args.prompt_len, args.new_tokens)
+                for _ in range(args.repeats)
+            )
+            batch_time = min(
+                generate_time(model, args.batch_size, args.prompt_len, args.new_tokens)
+                for _ in range(args.repeats)
+            )
+            throughput = args.batch_size * args.new_tokens / batch_time
+            print(
+                f"quantize={quantize} threads={num_threads}: "
+                f"latency {latency:.2f}s; throughput {throughput:.1f} tokens/s"
+            )
@@ -0,0 +1,69 @@
+"""
+Measures the memory held by a DPCache filled with data points.
+Run on two revisions to compare dataset object representations.
+"""
+
+import sys
+import gc
+import argparse
+import random
+import time
+import tracemalloc
+from pathlib import Path
+
+from data_management.dataset_file import DPCache, DATA_POINTS_NAME
+from data_management.sentence_db import SentenceDB
+
+
+def premise_set_time(
+    cache: DPCache, dp_names: list[str], data_loc: Path, sentence_db: SentenceDB
+) -> float:
+    start = time.time()
+    for dp_name in dp_names:
+        dp_obj = cache.get_dp(dp_name, data_loc, sentence_db)
+        premises = set(dp_obj.file_context.avail_premises)
+        for premise in dp_obj.file_context.avail_premises:
+            assert premise in premises
+    return time.time() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Measure the memory of a DPCache holding num_files data points."
+    )
+    parser.add_argument("data_loc", help="Location of the data points.")
+    parser.add_argument("sentence_db_loc", help="Location of the sentence db.")
+    parser.add_argument("--num_files", type=int, default=512)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(sys.argv[1:])
+
+    data_loc = Path(args.data_loc)
+    sentence_db = SentenceDB.load(Path(args.sentence_db_loc), read_only=True)
+    dp_names = sorted(p.name for p in (data_loc / DATA_POINTS_NAME).iterdir())
+    random.seed(args.seed)
+    dp_names = random.sample(dp_names, min(args.num_files, len(dp_names)))
+
+    cache = DPCache(cache_size=len(dp_names), max_bytes=2**62)
+    gc.collect()
+    tracemalloc.start()
+    start = time.time()
+    for dp_name in dp_names:
+        cache.get_dp(dp_name, data_loc, sentence_db)
+    load_time = time.time() - start
+    gc.collect()
+    cache_bytes, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    num_premises = 0
+    num_steps = 0
+    for dp_name in dp_names:
+        dp_obj = cache.get_dp(dp_name, data_loc, sentence_db)
+        num_premises += len(dp_obj.file_context.avail_premises)
+        num_steps += sum(len(p.steps) for p in dp_obj.proofs)
+
+    set_time = premise_set_time(cache, dp_names, data_loc, sentence_db)
+    print(f"{len(dp_names)} files; {num_premises} premises; {num_steps} steps")
+    print(
+        f"cache memory: {cache_bytes / 2**20:.1f}MiB (peak {peak_bytes / 2**20:.1f}MiB)"
+    )
+    print(f"load time: {load_time:.1f}s; premise set time: {set_time:.2f}s")
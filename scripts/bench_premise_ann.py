@@ -0,0 +1,68 @@
+"""
+Compares exact premise top-k against the IVF index of a vector db.
+Queries are perturbed premise embeddings over random allowed subsets.
+"""
+
+import sys
+import argparse
+import time
+from pathlib import Path
+
+import numpy as np
+
+from premise_selection.premise_ann_index import IVFIndex
+from premise_selection.premise_vector_db import VectorDB
+from util.ranking import top_k_indices
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Measure recall@k and latency of the IVF premise index."
+    )
+    parser.add_argument("vector_db_loc", help="Location of the vector db.")
+    parser.add_argument("--num_probes", nargs="+", type=int, default=[8, 32, 128])
+    parser.add_argument("--num_allowed", type=int, default=20000)
+    parser.add_argument("--num_queries", type=int, default=50)
+    parser.add_argument("--k", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(sys.argv[1:])
+
+    vector_db_loc = Path(args.vector_db_loc)
+    vector_db = VectorDB.load(vector_db_loc)
+    assert vector_db.emb_matrix is not None
+    embs = vector_db.emb_matrix.embs
+    scales = vector_db.emb_matrix.scales
+    index = IVFIndex.load(IVFIndex.get_index_loc(vector_db_loc))
+
+    rng = np.random.default_rng(args.seed)
+    queries: list[tuple[np.ndarray, np.ndarray]] = []
+    for _ in range(args.num_queries):
+        allowed_ids = np.sort(
+            rng.choice(len(embs), min(args.num_allowed, len(embs)), replace=False)
+        )
+        query = embs[rng.integers(len(embs))].astype(np.float32)
+        query = query + rng.normal(scale=query.std(), size=query.shape)
+        queries.append((query.astype(np.float32), allowed_ids))
+
+    start = time.time()
+    exact_tops: list[set[int]] = []
+    for query, allowed_ids in queries:
+        scores = embs[allowed_ids].astype(np.float32) @ query
+        if scales is not None:
+            scores *= scales[allowed_ids]
+        exact_tops.append(set(top_k_indices(scores, args.k)))
+    exact_time = (time.time() - start) / len(queries)
+    print(f"exact: {1000 * exact_time:.2f}ms per query")
+
+    for num_probes in args.num_probes:
+        index.num_probes = num_probes
+        recalls: list[float] = []
+        start = time.time()
+        for (query, allowed_ids), exact_top in zip(queries, exact_tops):
+            positions, _ = index.search(query, allowed_ids, args.k, embs, scales)
+            recalls.append(len(exact_top & set(positions)) / max(1, len(exact_top)))
+        ann_time = (time.time() - start) / len(queries)
+        print(
+            f"num_probes={num_probes}: {1000 * ann_time:.2f}ms per query; "
+            f"recall@{args.k} {np.mean(recalls):.3f}"
+        )
@@ -0,0 +1,86 @@
+import sys
+import argparse
+import random
+import time
+
+from coqpyt.coq.structs import TermType
+
+from data_management.dataset_file import (
+    Sentence,
+    Goal,
+    get_ids_from_sentence,
+    get_ids_from_goal,
+)
+from premise_selection.premise_term_matrix import PremiseTermMatrix
+from proof_retrieval.bm25 import bm25
+from proof_retrieval.tfidf import tf_idf
+
+
+def random_ids(vocab: list[str], n: int) -> list[str]:
+    return [random.choice(vocab) for _ in range(n)]
+
+
+def random_premises(vocab: list[str], num_premises: int) -> list[Sentence]:
+    premises: list[Sentence] = []
+    for i in range(num_premises):
+        text = "Lemma " + " ".join(random_ids(vocab, random.randint(4, 40))) + "."
+        premise = Sentence.from_text(text, TermType.LEMMA)
+        premise.db_idx = i
+        premises.append(premise)
+    return premises
+
+
+def time_call(fn, num_queries: int) -> float:
+    start = time.time()
+    for _ in range(num_queries):
+        fn()
+    return (time.time() - start) / num_queries
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compare pure python and matrix sparse premise scoring."
+    )
+    parser.add_argument("--sizes", nargs="+", type=int, default=[10000, 100000])
+    parser.add_argument("--vocab_size", type=int, default=20000)
+    parser.add_argument("--num_queries", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(sys.argv[1:])
+
+    random.seed(args.seed)
+    vocab = [f"id{i}" for i in range(args.vocab_size)]
+    for size in args.sizes:
+        premises = random_premises(vocab, size)
+        goal = Goal(
+            ["H : " + " ".join(random_ids(vocab, 10))], " ".join(random_ids(vocab, 20))
+        )
+        hyp_ids, goal_ids = get_ids_from_goal(goal)
+        query = hyp_ids + goal_ids
+
+        matrix = PremiseTermMatrix()
+        start = time.time()
+        matrix.get_rows(premises)
+        matrix.bm25(query, premises)
+        encode_time = time.time() - start
+
+        for name, python_fn, matrix_fn in [
+            ("bm25", bm25, matrix.bm25),
+            ("tfidf", tf_idf, matrix.tf_idf),
+        ]:
+            python_time = time_call(
+                lambda: python_fn(query, [get_ids_from_sentence(p) for p in premises]),
+                args.num_queries,
+            )
+            matrix_time = time_call(
+                lambda: matrix_fn(query, premises), args.num_queries
+            )
+            python_scores = python_fn(
+                query, [get_ids_from_sentence(p) for p in premises]
+            )
+            assert python_scores == matrix_fn(query, premises)
+            print(
+                f"{size:>7} premises {name:>5}: python {python_time * 1000:8.1f}ms; "
+                f"matrix {matrix_time * 1000:8.1f}ms; "
+                f"speedup {python_time / matrix_time:5.1f}x; "
+                f"one-time encode {encode_time:.1f}s"
+            )
@@ -0,0 +1,64 @@
+"""
+Compares decoding with and without stopping at the end of the first
+tactic sentence. Reports tokens decoded per accepted tactic, where the
+accepted tactics are the distinct ones filter_recs keeps.
+"""
+
+import sys
+import argparse
+import json
+import random
+import time
+from pathlib import Path
+
+from data_management.jsonl_utils import ExampleDB
+from model_deployment.model_wrapper import DecoderLocalWrapper
+from model_deployment.model_result import filter_recs
+from tactic_gen.lm_example import LmExample
+from transformers.trainer_utils import set_seed
+
+
+def run(
+    wrapper: DecoderLocalWrapper, examples: list[LmExample], n: int, beam: bool
+) -> tuple[int, int, float]:
+    wrapper.num_decoded_tokens = 0
+    num_accepted = 0
+    start = time.time()
+    for example in examples:
+        result = wrapper.get_recs(example, n, "", beam, None)
+        filtered = filter_recs(
+            result.next_tactic_list, result.score_list, result.num_tokens_list, []
+        )
+        num_accepted += len(filtered.next_tactic_list)
+    return wrapper.num_decoded_tokens, num_accepted, time.time() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Measure tokens decoded per tactic with and without stopping."
+    )
+    parser.add_argument("checkpoint_loc", help="Checkpoint of the tactic model.")
+    parser.add_argument("example_db_loc", help="Example db of lm examples.")
+    parser.add_argument("--num_examples", type=int, default=50)
+    parser.add_argument("--n", type=int, default=8)
+    parser.add_argument("--beam", action="store_true")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(sys.argv[1:])
+
+    wrapper = DecoderLocalWrapper.from_checkpoint(Path(args.checkpoint_loc))
+    edb = ExampleDB.load(Path(args.example_db_loc))
+    random.seed(args.seed)
+    idxs = random.sample(range(1, edb.size() + 1), min(args.num_examples, edb.size()))
+    examples = [LmExample.from_json(json.loads(edb.retrieve(i))) for i in idxs]
+
+    for stop in [False, True]:
+        wrapper.stop_at_tactic_end = stop
+        set_seed(args.seed)
+        num_decoded, num_accepted, total_time = run(
+            wrapper, examples, args.n, args.beam
+        )
+        print(
+            f"stop_at_tactic_end={stop}: {num_decoded / max(1, num_accepted):.1f} "
+            f"tokens per accepted tactic; {num_accepted} tactics; "
+            f"{total_time / len(examples):.2f}s per example"
+        )
@@ -6,7 +6,11 @@ from coqstoq import get_theorem_list, Split
 from coqstoq.eval_thms import EvalTheorem, get_file_hash
 
 from data_management.sentence_db import SentenceDB
-from data_management.create_file_data_point import get_data_point, get_switch_loc
+from data_management.create_file_data_point import (
+    get_data_point,
+    get_switch_loc,
+    save_data_point,
+)
 
 import logging
 from util.util import set_rango_logger
@@ -74,7 +78,7 @@ def get_coqstoq_data_point(f: CoqStoqFile, sentence_db: SentenceDB, save_loc: Pa
             compile_timeout,
             include_admitted,
         )
-        dp.save(save_loc / dp.dp_name, sentence_db, insert_allowed=True)
+        save_data_point(dp, save_loc / dp.dp_name, sentence_db)
     except ResponseError as e:
         _logger.info(f"Failed to create data point for {f}: {e}")
     except Exception as e:
@@ -0,0 +1,52 @@
+"""
+Converts a data_points directory to the binary data point format.
+DatasetFile.load detects the format, so the converted directory can be
+used in place of the original one.
+"""
+
+import sys, os
+import argparse
+from pathlib import Path
+from tqdm import tqdm
+
+from data_management.dataset_file import DatasetFile, BinaryDatasetFile
+from data_management.sentence_db import SentenceDB
+from util.util import get_basic_logger
+
+_logger = get_basic_logger(__name__)
+
+
+def convert_data_point(
+    json_loc: Path, binary_loc: Path, sentence_db: SentenceDB
+) -> None:
+    dset_file = DatasetFile.load(json_loc, sentence_db)
+    dset_file.save_binary(binary_loc, sentence_db, insert_allowed=False)
+
+
+def convert_data_points(
+    data_points_loc: Path, save_loc: Path, sentence_db: SentenceDB
+) -> None:
+    os.makedirs(save_loc, exist_ok=True)
+    for dp_loc in tqdm(sorted(data_points_loc.iterdir())):
+        binary_loc = save_loc / dp_loc.name
+        if binary_loc.exists():
+            continue
+        if BinaryDatasetFile.is_binary(dp_loc):
+            _logger.info(f"{dp_loc} is already binary.")
+            continue
+        convert_data_point(dp_loc, binary_loc, sentence_db)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Convert json data points to the binary data point format."
+    )
+    parser.add_argument("data_points_loc", help="Directory of json data points.")
+    parser.add_argument("save_loc", help="Directory for the binary data points.")
+    parser.add_argument("sentence_db_loc", help="Location of the sentence db.")
+    args = parser.parse_args(sys.argv[1:])
+
+    data_points_loc = Path(args.data_points_loc)
+    save_loc = Path(args.save_loc)
+    sentence_db = SentenceDB.load(Path(args.sentence_db_loc), read_only=True)
+    convert_data_points(data_points_loc, save_loc, sentence_db)
@@ -8,6 +8,7 @@ import subprocess
 from pathlib import Path
 from data_management.dataset_utils import DatasetConf, data_conf_from_yaml
 from data_management.splits import DataSplit, get_all_files, FileInfo
+from data_management.sentence_db import get_warmup_command
 
 from util.slurm import (
     JobOption,
@@ -64,7 +65,7 @@ if __name__ == "__main__":
             run_local(worker_command, n_workers)
         case SlurmJobConf(_, slurm_conf):
             commands = [
-                f"cp -r {conf.sentence_db_loc} /tmp/{conf.sentence_db_loc.name}",
+                get_warmup_command(conf.sentence_db_loc),
                 worker_command,
             ]
             slurm_conf.write_script(
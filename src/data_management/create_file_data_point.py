@@ -15,7 +15,13 @@ from coqpyt.coq.proof_file import ProofFile
 from coqpyt.coq.proof_file import ProofFile
 from coqpyt.coq.structs import ProofTerm, Term
 
-from data_management.dataset_file import DatasetFile, FocusedStep, FileContext, Proof
+from data_management.dataset_file import (
+    DatasetFile,
+    FocusedStep,
+    FileContext,
+    Proof,
+    Sentence,
+)
 from data_management.sentence_db import SentenceDB
 
 from util.constants import RANGO_LOGGER
@@ -167,6 +173,30 @@ def get_data_point(
         )
 
 
+def get_dp_sentences(dp: DatasetFile) -> list[Sentence]:
+    sentences = list(dp.file_context.avail_premises)
+    for proof in dp.proofs:
+        sentences.append(proof.theorem.term)
+        sentences.extend(proof.theorem.term_context)
+        for step in proof.steps:
+            sentences.append(step.term.term)
+            sentences.extend(step.term.term_context)
+            sentences.extend(step.step.context)
+    return sentences
+
+
+def save_data_point(dp: DatasetFile, save_loc: Path, sentence_db: SentenceDB) -> None:
+    """
+    Saves the data point, inserting its new sentences in a single batch.
+    The file is only written once the batch is committed.
+    """
+    new_sentences = [
+        s.to_db_sentence() for s in get_dp_sentences(dp) if s.db_idx is None
+    ]
+    sentence_db.insert_many(new_sentences)
+    dp.save(save_loc, sentence_db, insert_allowed=True)
+
+
 DATASET_PREFIX = Path("/coq-dataset/repos")
 DATASET_OPAM_PREFIX = "/root/.opam/default"
 COQ_BIN_PATH = Path("bin/coqc")
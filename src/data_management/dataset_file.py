@@ -1,15 +1,17 @@
 from __future__ import annotations
-from typing import Any, Optional
+from typing import Any, Iterator, Optional, Sequence, overload
 from enum import Enum
 import sys, os
 import json
 import re
+import struct
 import string
 import functools
 import multiprocessing as mp
 from pathlib import Path
 import hypothesis.strategies as st
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from collections import OrderedDict
 
 import hypothesis.strategies
 
@@ -50,7 +52,39 @@ def get_ids_from_sentence(s: Sentence) -> list[str]:
     return sentence_ids
 
 
-@dataclass
+# Distinct goals and premises whose ids are kept by the cached getters.
+IDS_CACHE_SIZE = 100000
+
+
+@functools.lru_cache(IDS_CACHE_SIZE)
+def get_ids_from_goal_text(
+    hyps: tuple[str, ...], goal_text: str
+) -> tuple[list[str], list[str]]:
+    return get_ids_from_goal(Goal(list(hyps), goal_text))
+
+
+def get_cached_ids_from_goal(goal: Goal) -> tuple[list[str], list[str]]:
+    """
+    get_ids_from_goal, run once per distinct goal text in a process.
+    The returned lists are shared and must not be modified.
+    """
+    return get_ids_from_goal_text(tuple(goal.hyps), goal.goal)
+
+
+@functools.lru_cache(IDS_CACHE_SIZE)
+def get_cached_ids_from_sentence(s: Sentence) -> list[str]:
+    """
+    get_ids_from_sentence, run once per distinct sentence in a process.
+    The returned list is shared and must not be modified.
+    """
+    return get_ids_from_sentence(s)
+
+
+def intern_module(module: list[str]) -> list[str]:
+    return [sys.intern(m) for m in module]
+
+
+@dataclass(slots=True)
 class Sentence:
     text: str
     file_path: str
@@ -58,18 +92,38 @@ class Sentence:
     sentence_type: TermType
     line: int
     db_idx: Optional[int]
+    # Sentences are used as set and dict keys for every premise of a file.
+    _hash: Optional[int] = field(default=None, init=False, repr=False, compare=False)
 
     def __hash__(self) -> int:
-        tup_module = tuple(self.module)
-        return hash(
-            (self.text, self.file_path, tup_module, self.sentence_type, self.line)
-        )
+        if self._hash is None:
+            tup_module = tuple(self.module)
+            self._hash = hash(
+                (self.text, self.file_path, tup_module, self.sentence_type, self.line)
+            )
+        return self._hash
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, Sentence):
             return False
         return hash(self) == hash(other)
 
+    def __reduce__(self) -> Any:
+        # String hashes differ between processes, so the cached hash is dropped.
+        return (
+            Sentence,
+            (
+                self.text,
+                self.file_path,
+                self.module,
+                self.sentence_type,
+                self.line,
+                self.db_idx,
+            ),
+        )
+
     def to_db_sentence(self) -> DBSentence:
         return DBSentence(
             self.text,
@@ -84,8 +138,8 @@ class Sentence:
     def from_db_sentence(cls, db_sentence: DBSentence) -> Sentence:
         return Sentence(
             db_sentence.text,
-            db_sentence.file_path,
-            json.loads(db_sentence.module),
+            sys.intern(db_sentence.file_path),
+            intern_module(json.loads(db_sentence.module)),
             TermType[db_sentence.sentence_type.split(".")[1]],
             db_sentence.line,
             None,
@@ -125,6 +179,15 @@ class Sentence:
     @classmethod
     def from_idx(cls, idx: int, sentence_db: SentenceDB) -> Sentence:
         db_sentence = sentence_db.retrieve(idx)
+        return cls.from_stored(idx, db_sentence)
+
+    @classmethod
+    def from_idxs(cls, idxs: list[int], sentence_db: SentenceDB) -> list[Sentence]:
+        db_sentences = sentence_db.retrieve_many(idxs)
+        return [cls.from_stored(i, s) for i, s in zip(idxs, db_sentences)]
+
+    @classmethod
+    def from_stored(cls, idx: int, db_sentence: DBSentence) -> Sentence:
         sentence = cls.from_db_sentence(db_sentence)
         return Sentence(
             sentence.text,
@@ -140,8 +203,8 @@ class Sentence:
         if json_data["type"] == "stored":
             return cls.from_idx(json_data["id"], sentence_db)
         text = json_data["text"]
-        file_path = json_data["file_path"]
-        module = json_data["module"]
+        file_path = sys.intern(json_data["file_path"])
+        module = intern_module(json_data["module"])
         sentence_type = TermType[json_data["type"].split(".")[1]]
         line = json_data["line"]
         return cls(text, file_path, module, sentence_type, line, None)
@@ -168,7 +231,7 @@ st.register_type_strategy(
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class Term:
     term: Sentence
     term_context: list[Sentence]
@@ -210,7 +273,7 @@ class Term:
         return cls(term, context)
 
 
-@dataclass
+@dataclass(slots=True)
 class Step:
     text: str
     context: list[Sentence]
@@ -236,6 +299,8 @@ class Step:
 
 
 class Goal:
+    __slots__ = ("hyps", "goal", "cached_hyp_ids", "cached_goal_ids")
+
     def __init__(self, hyps: list[str], goal: str) -> None:
         self.hyps = hyps
         self.goal = goal
@@ -275,22 +340,30 @@ hypothesis.strategies.register_type_strategy(
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class FocusedStep:
     term: Term
     step: Step
     n_step: int
     goals: list[Goal]
+    _hash: Optional[int] = field(default=None, init=False, repr=False, compare=False)
 
     def __hash__(self) -> int:
         # Can make more strict. This will do for now
-        return hash((self.term, self.step.text, self.n_step))
+        if self._hash is None:
+            self._hash = hash((self.term, self.step.text, self.n_step))
+        return self._hash
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, FocusedStep):
             return False
         return hash(self) == hash(other)
 
+    def __reduce__(self) -> Any:
+        return (FocusedStep, (self.term, self.step, self.n_step, self.goals))
+
     def to_json(self, sentence_db: SentenceDB, insert_allowed: bool) -> Any:
         return {
             "term": self.term.to_json(sentence_db, insert_allowed),
@@ -331,11 +404,14 @@ class FocusedStep:
 
 
 class Proof:
+    __slots__ = ("theorem", "steps", "proof_idx", "__text_id")
     name_matches = [
         re.compile(r"\S+\s+(\S+?)[\[\]\{\}\(\):=,\s]"),
     ]
 
-    def __init__(self, theorem: Term, steps: list[FocusedStep], proof_idx: int) -> None:
+    def __init__(
+        self, theorem: Term, steps: Sequence[FocusedStep], proof_idx: int
+    ) -> None:
         self.theorem = theorem
         self.steps = steps
         self.proof_idx = proof_idx
@@ -425,12 +501,27 @@ st.register_type_strategy(
 )
 
 
+CONTEXT_LINE_CACHE_SIZE = 50000
+_context_line_cache: dict[tuple[SentenceDB, str], Sentence] = {}
+
+
 @dataclass
 class FileContext:
     file: str
     workspace: str
     repository: str
     avail_premises: list[Sentence]
+    # Shared by every DatasetFile built on this context.
+    _premise_partition: Optional[tuple[Any, PremisePartition]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def get_premise_partition(self) -> PremisePartition:
+        key = (id(self.avail_premises), len(self.avail_premises), self.file)
+        if self._premise_partition is None or self._premise_partition[0] != key:
+            partition = PremisePartition.from_file_context(self)
+            self._premise_partition = (key, partition)
+        return self._premise_partition[1]
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, FileContext):
@@ -449,20 +540,48 @@ class FileContext:
         return cls(metadata["file"], metadata["workspace"], metadata["repository"], [])
 
     @classmethod
-    @functools.lru_cache(maxsize=50000)
     def context_from_line(cls, line: str, sentence_db: SentenceDB) -> Sentence:
-        line_data = json.loads(line)
-        return Sentence.from_json(line_data, sentence_db)
+        return cls.context_from_line_batch([line], sentence_db)[0]
+
+    @classmethod
+    def context_from_line_batch(
+        cls, lines: list[str], sentence_db: SentenceDB
+    ) -> list[Sentence]:
+        """
+        Files share most of their context, so parsed lines are cached (and
+        the sentences shared). Stored sentences missing from the cache are
+        fetched from the db together.
+        """
+        found: dict[str, Sentence] = {}
+        missing_lines: list[str] = []
+        missing_data: list[Any] = []
+        for line in dict.fromkeys(lines):
+            key = (sentence_db, line)
+            if key in _context_line_cache:
+                found[line] = _context_line_cache.pop(key)
+                _context_line_cache[key] = found[line]
+            else:
+                missing_lines.append(line)
+                missing_data.append(json.loads(line))
+
+        stored_ids = [d["id"] for d in missing_data if d["type"] == "stored"]
+        stored_sentences = iter(Sentence.from_idxs(stored_ids, sentence_db))
+        for line, line_data in zip(missing_lines, missing_data):
+            if line_data["type"] == "stored":
+                found[line] = next(stored_sentences)
+            else:
+                found[line] = Sentence.from_json(line_data, sentence_db)
+            _context_line_cache[(sentence_db, line)] = found[line]
+            if CONTEXT_LINE_CACHE_SIZE < len(_context_line_cache):
+                del _context_line_cache[next(iter(_context_line_cache))]
+        return [found[line] for line in lines]
 
     @classmethod
     def context_from_lines(
         cls, lines: list[str], sentence_db: SentenceDB
     ) -> FileContext:
         empty_context = cls.empty_context_from_lines(lines)
-        context_sentences: list[Sentence] = []
-        for line in lines[1:]:
-            context_sentence = cls.context_from_line(line, sentence_db)
-            context_sentences.append(context_sentence)
+        context_sentences = cls.context_from_line_batch(lines[1:], sentence_db)
         return cls(
             empty_context.file,
             empty_context.workspace,
@@ -529,7 +648,7 @@ def file_contexts(draw) -> FileContext:
 st.register_type_strategy(FileContext, file_contexts())
 
 
-@dataclass
+@dataclass(slots=True)
 class StepID:
     file: str
     proof_idx: int
@@ -567,79 +686,356 @@ class StepID:
         return StepID(dset_file.dp_name, proof_idx, step_idx)
 
 
-class DatasetFile:
-    def __init__(self, file_context: FileContext, proofs: list[Proof]) -> None:
-        # TODO: Turn into list of proofs.
-        self.file_context = file_context
-        self.proofs = proofs
-        self.out_of_file_avail_premises = self.__get_oof_avail_premises()
-        self.in_file_avail_premises = self.__get_in_file_avail_premises()
-        self.dependencies = self.__get_dp_dependencies()
-        self.__cached_dp_names: dict[str, str] = {}
+class BinaryDatasetFile:
+    """
+    Data point stored as length-prefixed records of compact json with an
+    offset table, so that a single proof or step can be decoded without
+    reading the rest of the file. Records are read through a short-lived
+    file handle, so an open BinaryDatasetFile holds no file descriptor.
+
+    Layout (little-endian):
+      magic, version (u32), num_proofs (u64), num_records (u64)
+      proof_starts: u64 * (num_proofs + 1)  -- first record of each proof
+      record_offsets: u64 * (num_records + 1)
+      records: (u32 length, payload) each
+    Record 0 is the file context metadata line, record 1 the list of context
+    lines, then each proof is its theorem followed by its steps.
+    """
+
+    MAGIC = b"RDPB"
+    VERSION = 1
+    HEADER = struct.Struct("<4sIQQ")
+    OFFSET = struct.Struct("<Q")
+    LENGTH = struct.Struct("<I")
+    NUM_META_RECORDS = 2
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        with path.open("rb") as fin:
+            header = fin.read(self.HEADER.size)
+            if len(header) < self.HEADER.size:
+                raise ValueError(f"{path} is not a binary data point.")
+            magic, version, num_proofs, num_records = self.HEADER.unpack(header)
+            if magic != self.MAGIC or version != self.VERSION:
+                raise ValueError(
+                    f"{path} is not a binary data point (v{self.VERSION})."
+                )
+            self.__proof_starts = struct.unpack(
+                f"<{num_proofs + 1}Q", fin.read((num_proofs + 1) * self.OFFSET.size)
+            )
+        self.num_proofs = num_proofs
+        self.num_records = num_records
+        # Estimated size of the decoded objects the lazy views hold on to.
+        self.decoded_bytes = sys.getsizeof(self.__proof_starts)
+        self.__record_offsets_pos = (
+            self.HEADER.size + (num_proofs + 1) * self.OFFSET.size
+        )
+
+    @classmethod
+    def is_binary(cls, path: Path) -> bool:
+        with path.open("rb") as fin:
+            return fin.read(len(cls.MAGIC)) == cls.MAGIC
+
+    def __read_records(self, start: int, end: int) -> list[Any]:
+        """Records start to end (exclusive), which are contiguous on disk."""
+        num_offsets = end - start + 1
+        with self.path.open("rb") as fin:
+            fin.seek(self.__record_offsets_pos + start * self.OFFSET.size)
+            offsets = struct.unpack(
+                f"<{num_offsets}Q", fin.read(num_offsets * self.OFFSET.size)
+            )
+            fin.seek(offsets[0])
+            data = fin.read(offsets[-1] - offsets[0])
+        records: list[Any] = []
+        for offset in offsets[:-1]:
+            pos = offset - offsets[0]
+            (length,) = self.LENGTH.unpack_from(data, pos)
+            payload_start = pos + self.LENGTH.size
+            records.append(json.loads(data[payload_start : payload_start + length]))
+        return records
+
+    def __proof_start(self, proof_idx: int) -> int:
+        if not 0 <= proof_idx < self.num_proofs:
+            raise IndexError(f"Proof {proof_idx} out of range in {self.path}.")
+        return self.__proof_starts[proof_idx]
+
+    def num_steps(self, proof_idx: int) -> int:
+        start = self.__proof_start(proof_idx)
+        return self.__proof_starts[proof_idx + 1] - start - 1
+
+    def get_metadata_line(self) -> str:
+        return self.__read_records(0, 1)[0]
+
+    def get_context_lines(self) -> list[str]:
+        return self.__read_records(1, 2)[0]
+
+    def get_theorem(self, proof_idx: int, sentence_db: SentenceDB) -> Term:
+        start = self.__proof_start(proof_idx)
+        return Term.from_json(self.__read_records(start, start + 1)[0], sentence_db)
+
+    def get_step(
+        self, proof_idx: int, step_idx: int, sentence_db: SentenceDB
+    ) -> FocusedStep:
+        if not 0 <= step_idx < self.num_steps(proof_idx):
+            raise IndexError(f"Step {step_idx} out of range in proof {proof_idx}.")
+        record_idx = self.__proof_start(proof_idx) + 1 + step_idx
+        (step_data,) = self.__read_records(record_idx, record_idx + 1)
+        return FocusedStep.from_json(step_data, sentence_db)
+
+    def get_steps(self, proof_idx: int, sentence_db: SentenceDB) -> list[FocusedStep]:
+        start = self.__proof_start(proof_idx) + 1
+        end = start + self.num_steps(proof_idx)
+        if start == end:
+            return []
+        return [
+            FocusedStep.from_json(s, sentence_db)
+            for s in self.__read_records(start, end)
+        ]
+
+    def get_proof(self, proof_idx: int, sentence_db: SentenceDB) -> Proof:
+        return Proof(
+            self.get_theorem(proof_idx, sentence_db),
+            self.get_steps(proof_idx, sentence_db),
+            proof_idx,
+        )
+
+    @classmethod
+    def write(cls, path: Path, json_data: Any) -> None:
+        """Writes the json data (DatasetFile.to_json) of a data point."""
+        file_context_lines = json_data["file_context"]
+        records: list[Any] = [file_context_lines[0], file_context_lines[1:]]
+        proof_starts: list[int] = []
+        for proof_data in json_data["proofs"]:
+            proof_starts.append(len(records))
+            records.append(proof_data["theorem"])
+            records.extend(proof_data["steps"])
+        proof_starts.append(len(records))
+
+        payloads = [json.dumps(r, separators=(",", ":")).encode() for r in records]
+        data_start = (
+            cls.HEADER.size
+            + len(proof_starts) * cls.OFFSET.size
+            + (len(records) + 1) * cls.OFFSET.size
+        )
+        record_offsets = [data_start]
+        for payload in payloads:
+            record_offsets.append(record_offsets[-1] + cls.LENGTH.size + len(payload))
+
+        os.makedirs(path.parent, exist_ok=True)
+        with path.open("wb") as fout:
+            fout.write(
+                cls.HEADER.pack(
+                    cls.MAGIC, cls.VERSION, len(json_data["proofs"]), len(records)
+                )
+            )
+            for start in proof_starts:
+                fout.write(cls.OFFSET.pack(start))
+            for offset in record_offsets:
+                fout.write(cls.OFFSET.pack(offset))
+            for payload in payloads:
+                fout.write(cls.LENGTH.pack(len(payload)))
+                fout.write(payload)
+
+
+class LazySteps(Sequence[FocusedStep]):
+    """
+    Steps of one proof of a binary data point. Indexing a single step
+    decodes only that step; iterating or slicing decodes the whole proof.
+    """
+
+    def __init__(
+        self, binary_file: BinaryDatasetFile, proof_idx: int, sentence_db: SentenceDB
+    ):
+        self.binary_file = binary_file
+        self.proof_idx = proof_idx
+        self.sentence_db = sentence_db
+        self.__num_steps = binary_file.num_steps(proof_idx)
+        self.__decoded: dict[int, FocusedStep] = {}
+        self.__all_decoded = False
+
+    def __len__(self) -> int:
+        return self.__num_steps
+
+    def __keep(self, step_idx: int, step: FocusedStep) -> None:
+        self.__decoded[step_idx] = step
+        self.binary_file.decoded_bytes += get_step_num_bytes(step)
+
+    def __decode_all(self) -> None:
+        if not self.__all_decoded:
+            steps = self.binary_file.get_steps(self.proof_idx, self.sentence_db)
+            for i, step in enumerate(steps):
+                if i not in self.__decoded:
+                    self.__keep(i, step)
+            self.__all_decoded = True
+
+    def __get_step(self, step_idx: int) -> FocusedStep:
+        if step_idx not in self.__decoded:
+            self.__keep(
+                step_idx,
+                self.binary_file.get_step(self.proof_idx, step_idx, self.sentence_db),
+            )
+        return self.__decoded[step_idx]
+
+    @overload
+    def __getitem__(self, idx: int) -> FocusedStep:
+        ...
+
+    @overload
+    def __getitem__(self, idx: slice) -> list[FocusedStep]:
+        ...
+
+    def __getitem__(self, idx: int | slice) -> FocusedStep | list[FocusedStep]:
+        if isinstance(idx, slice):
+            self.__decode_all()
+            return [self.__decoded[i] for i in range(*idx.indices(len(self)))]
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError(f"Step {idx} out of range.")
+        return self.__get_step(idx)
+
+    def __iter__(self) -> Iterator[FocusedStep]:
+        self.__decode_all()
+        return (self.__decoded[i] for i in range(len(self)))
 
     def __eq__(self, other: object) -> bool:
-        if not isinstance(other, DatasetFile):
+        if not isinstance(other, Sequence):
             return False
-        return self.file_context == other.file_context and self.proofs == other.proofs
-
-    def proofs_to_string(self) -> str:
-        proof_strings = [p.proof_text_to_string() for p in self.proofs]
-        return "\n\n".join(proof_strings)
+        return list(self) == list(other)
+
+    def __reduce__(self) -> Any:
+        # The db connection cannot be pickled.
+        return (list, (list(self),))
+
+
+class LazyProofs(Sequence[Proof]):
+    """
+    Proofs of a binary data point, each decoded on first access. The steps
+    of a decoded proof are a LazySteps.
+    """
+
+    def __init__(self, binary_file: BinaryDatasetFile, sentence_db: SentenceDB):
+        self.binary_file = binary_file
+        self.sentence_db = sentence_db
+        self.__decoded: dict[int, Proof] = {}
+
+    def __len__(self) -> int:
+        return self.binary_file.num_proofs
+
+    def __get_proof(self, proof_idx: int) -> Proof:
+        if proof_idx not in self.__decoded:
+            theorem = self.binary_file.get_theorem(proof_idx, self.sentence_db)
+            self.__decoded[proof_idx] = Proof(
+                theorem,
+                LazySteps(self.binary_file, proof_idx, self.sentence_db),
+                proof_idx,
+            )
+            self.binary_file.decoded_bytes += get_term_num_bytes(theorem)
+        return self.__decoded[proof_idx]
+
+    def get_step(self, proof_idx: int, step_idx: int) -> FocusedStep:
+        if proof_idx in self.__decoded:
+            return self.__decoded[proof_idx].steps[step_idx]
+        return self.binary_file.get_step(proof_idx, step_idx, self.sentence_db)
+
+    @overload
+    def __getitem__(self, idx: int) -> Proof:
+        ...
+
+    @overload
+    def __getitem__(self, idx: slice) -> list[Proof]:
+        ...
+
+    def __getitem__(self, idx: int | slice) -> Proof | list[Proof]:
+        if isinstance(idx, slice):
+            return [self.__get_proof(i) for i in range(*idx.indices(len(self)))]
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError(f"Proof {idx} out of range.")
+        return self.__get_proof(idx)
 
-    @property
-    def dp_name(self) -> str:
-        if self.file_context.file in self.__cached_dp_names:
-            return self.__cached_dp_names[self.file_context.file]
-        dp_names = self.__get_dp_norm_and_unorm_name(self.file_context.file)
-        if dp_names is None:
-            raise ValueError(
-                f"Expected data path {self.file_context.file} to have subpath starting with 'repos'"
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence):
+            return False
+        return list(self) == list(other)
+
+    def __reduce__(self) -> Any:
+        # The db connection cannot be pickled.
+        return (list, (list(self),))
+
+
+class LazyFileContext(FileContext):
+    """
+    File context of a binary data point. Only the metadata is read up
+    front; the available premises are decoded on first access.
+    """
+
+    def __init__(self, binary_file: BinaryDatasetFile, sentence_db: SentenceDB):
+        metadata = json.loads(binary_file.get_metadata_line())
+        self.file = metadata["file"]
+        self.workspace = metadata["workspace"]
+        self.repository = metadata["repository"]
+        self._premise_partition = None
+        self.__binary_file = binary_file
+        self.__sentence_db = sentence_db
+        self.__avail_premises: Optional[list[Sentence]] = None
+
+    @property  # type: ignore[override]
+    def avail_premises(self) -> list[Sentence]:
+        if self.__avail_premises is None:
+            self.__avail_premises = self.context_from_line_batch(
+                self.__binary_file.get_context_lines(), self.__sentence_db
             )
-        norm_name, _ = dp_names
-        self.__cached_dp_names[self.file_context.file] = norm_name
-        return norm_name
+            self.__binary_file.decoded_bytes += get_sentences_num_bytes(
+                self.__avail_premises
+            )
+        return self.__avail_premises
 
-    def __get_dp_norm_and_unorm_name(
-        self, data_file_path: str
-    ) -> Optional[tuple[str, str]]:
-        repo_match = re.search(r"repos/(.*\.v)", data_file_path)
-        if repo_match is None:
-            return None
-        (dp_unnorm_name,) = repo_match.groups()
-        dp_norm_name = dp_unnorm_name.replace("/", "-")
-        if (
-            dp_norm_name == "DmxLarchey-Hydra-theories-Hydra.v"
-        ):  # HACK; Not sure why hydra is named with upper case
-            dp_norm_name = "DmxLarchey-Hydra-theories-hydra.v"
-        return dp_norm_name, dp_unnorm_name
-
-    def __get_dp_dependencies(self) -> list[str]:
-        dependencies: list[str] = []  # formatted as dp with / replaced with -
-        for premise in self.file_context.avail_premises:
-            dp_names = self.__get_dp_norm_and_unorm_name(premise.file_path)
-            if dp_names:
-                dp_norm_name, dp_unnorm_name = dp_names
-                if (
-                    dp_unnorm_name in self.file_context.file
-                    or self.file_context.file in dp_unnorm_name
-                ):
-                    continue
-                if dp_norm_name not in dependencies:
-                    dependencies.append(dp_norm_name)
-        return dependencies
+    @avail_premises.setter
+    def avail_premises(self, avail_premises: list[Sentence]) -> None:
+        self.__avail_premises = avail_premises
 
-    @classmethod
+    def __reduce__(self) -> Any:
+        return (
+            FileContext,
+            (self.file, self.workspace, self.repository, self.avail_premises),
+        )
+
+
+@functools.cache
+def get_dp_norm_and_unorm_name(data_file_path: str) -> Optional[tuple[str, str]]:
+    repo_match = re.search(r"repos/(.*\.v)", data_file_path)
+    if repo_match is None:
+        return None
+    (dp_unnorm_name,) = repo_match.groups()
+    dp_norm_name = dp_unnorm_name.replace("/", "-")
+    if (
+        dp_norm_name == "DmxLarchey-Hydra-theories-Hydra.v"
+    ):  # HACK; Not sure why hydra is named with upper case
+        dp_norm_name = "DmxLarchey-Hydra-theories-hydra.v"
+    return dp_norm_name, dp_unnorm_name
+
+
+@dataclass
+class PremisePartition:
+    out_of_file_premises: list[Sentence]
+    in_file_premises: list[Sentence]
+    dependencies: list[str]  # formatted as dp with / replaced with -
+
+    @staticmethod
     @functools.cache
-    def fix_path(cls, path: str) -> str:
+    def fix_path(path: str) -> str:
         while path.startswith("../") or path.startswith("..\\"):
             path = path[3:]
         return path
 
-    @classmethod
-    def __share_subpath(cls, path1: str, path2: str) -> bool:
+    @staticmethod
+    def share_subpath(path1: str, path2: str) -> bool:
         return path1.endswith(path2) or path2.endswith(path1)
 
-    def __get_oof_avail_premises(self) -> list[Sentence]:
+    @classmethod
+    def from_file_context(cls, file_context: FileContext) -> PremisePartition:
         """
         Not a direct comparison of paths.
         Consider zyla-random-proofs-Interpreter.v where premises
@@ -647,21 +1043,65 @@ class DatasetFile:
         can have file path /coq-dataset/....
         """
         oof_premises: set[Sentence] = set()
-        norm_file_path = self.fix_path(self.file_context.file)
-        for premise in self.file_context.avail_premises:
-            norm_prem_path = self.fix_path(premise.file_path)
-            if not self.__share_subpath(norm_prem_path, norm_file_path):
-                oof_premises.add(premise)
-        return list(oof_premises)
-
-    def __get_in_file_avail_premises(self) -> list[Sentence]:
         in_file_premises: set[Sentence] = set()
-        norm_file_path = self.fix_path(self.file_context.file)
-        for premise in self.file_context.avail_premises:
-            norm_prem_path = self.fix_path(premise.file_path)
-            if self.__share_subpath(norm_prem_path, norm_file_path):
+        dependencies: list[str] = []
+        norm_file_path = cls.fix_path(file_context.file)
+        for premise in file_context.avail_premises:
+            norm_prem_path = cls.fix_path(premise.file_path)
+            if cls.share_subpath(norm_prem_path, norm_file_path):
                 in_file_premises.add(premise)
-        return list(in_file_premises)
+            else:
+                oof_premises.add(premise)
+
+            dp_names = get_dp_norm_and_unorm_name(premise.file_path)
+            if dp_names:
+                dp_norm_name, dp_unnorm_name = dp_names
+                if (
+                    dp_unnorm_name in file_context.file
+                    or file_context.file in dp_unnorm_name
+                ):
+                    continue
+                if dp_norm_name not in dependencies:
+                    dependencies.append(dp_norm_name)
+        return cls(list(oof_premises), list(in_file_premises), dependencies)
+
+
+class DatasetFile:
+    def __init__(self, file_context: FileContext, proofs: Sequence[Proof]) -> None:
+        # TODO: Turn into list of proofs.
+        self.file_context = file_context
+        self.proofs = proofs
+
+    @property
+    def out_of_file_avail_premises(self) -> list[Sentence]:
+        return self.file_context.get_premise_partition().out_of_file_premises
+
+    @property
+    def in_file_avail_premises(self) -> list[Sentence]:
+        return self.file_context.get_premise_partition().in_file_premises
+
+    @property
+    def dependencies(self) -> list[str]:
+        return self.file_context.get_premise_partition().dependencies
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DatasetFile):
+            return False
+        return self.file_context == other.file_context and self.proofs == other.proofs
+
+    def proofs_to_string(self) -> str:
+        proof_strings = [p.proof_text_to_string() for p in self.proofs]
+        return "\n\n".join(proof_strings)
+
+    @property
+    def dp_name(self) -> str:
+        dp_names = get_dp_norm_and_unorm_name(self.file_context.file)
+        if dp_names is None:
+            raise ValueError(
+                f"Expected data path {self.file_context.file} to have subpath starting with 'repos'"
+            )
+        norm_name, _ = dp_names
+        return norm_name
 
     def get_in_file_premises_before(self, proof: Proof) -> list[Sentence]:
         return [
@@ -673,8 +1113,17 @@ class DatasetFile:
 
     def save(self, path: Path, sentence_db: SentenceDB, insert_allowed: bool) -> None:
         os.makedirs(path.parent, exist_ok=True)
+        with sentence_db.write_batch():
+            json_data = self.to_json(sentence_db, insert_allowed)
         with path.open("w") as fout:
-            fout.write(json.dumps(self.to_json(sentence_db, insert_allowed), indent=2))
+            fout.write(json.dumps(json_data, indent=2))
+
+    def save_binary(
+        self, path: Path, sentence_db: SentenceDB, insert_allowed: bool
+    ) -> None:
+        with sentence_db.write_batch():
+            json_data = self.to_json(sentence_db, insert_allowed)
+        BinaryDatasetFile.write(path, json_data)
 
     def to_json(self, sentence_db: SentenceDB, insert_allowed: bool) -> Any:
         return {
@@ -682,6 +1131,12 @@ class DatasetFile:
             "proofs": [p.to_json(sentence_db, insert_allowed) for p in self.proofs],
         }
 
+    def get_step(self, proof_idx: int, step_idx: int) -> FocusedStep:
+        """A single step, decoding only that step of a binary data point."""
+        if isinstance(self.proofs, LazyProofs):
+            return self.proofs.get_step(proof_idx, step_idx)
+        return self.proofs[proof_idx].steps[step_idx]
+
     def get_theorem(self, theorem_name: str) -> Proof:
         for proof in self.proofs:
             if proof.get_theorem_name() == theorem_name:
@@ -692,11 +1147,27 @@ class DatasetFile:
     def load(
         cls, path: Path, sentence_db: SentenceDB, metadata_only: bool = False
     ) -> DatasetFile:
+        if BinaryDatasetFile.is_binary(path):
+            return cls.load_binary(path, sentence_db, metadata_only)
         with path.open("r") as fin:
             json_data = json.load(fin)
         ret_obj = cls.from_json(json_data, sentence_db, metadata_only)
         return ret_obj
 
+    @classmethod
+    def load_binary(
+        cls, path: Path, sentence_db: SentenceDB, metadata_only: bool = False
+    ) -> DatasetFile:
+        binary_file = BinaryDatasetFile(path)
+        file_context: FileContext
+        if metadata_only:
+            file_context = FileContext.empty_context_from_lines(
+                [binary_file.get_metadata_line()]
+            )
+        else:
+            file_context = LazyFileContext(binary_file, sentence_db)
+        return cls(file_context, LazyProofs(binary_file, sentence_db))
+
     @classmethod
     def from_json(
         cls, json_data: Any, sentence_db: SentenceDB, metadata_only: bool = False
@@ -760,25 +1231,123 @@ st.register_type_strategy(
 )
 
 
+DEFAULT_DP_CACHE_BYTES = 4 * 2**30
+POINTER_BYTES = 8
+
+
+def get_sentences_num_bytes(sentences: Sequence[Sentence]) -> int:
+    return sum(
+        POINTER_BYTES + sys.getsizeof(s) + sys.getsizeof(s.text) for s in sentences
+    )
+
+
+def get_term_num_bytes(term: Term) -> int:
+    return get_sentences_num_bytes([term.term]) + get_sentences_num_bytes(
+        term.term_context
+    )
+
+
+def get_step_num_bytes(step: FocusedStep) -> int:
+    num_bytes = sys.getsizeof(step) + get_term_num_bytes(step.term)
+    num_bytes += sys.getsizeof(step.step.text)
+    num_bytes += get_sentences_num_bytes(step.step.context)
+    for goal in step.goals:
+        num_bytes += POINTER_BYTES + sys.getsizeof(goal) + sys.getsizeof(goal.goal)
+        num_bytes += sum(POINTER_BYTES + sys.getsizeof(h) for h in goal.hyps)
+    return num_bytes
+
+
+def get_dp_num_bytes(dp_obj: DatasetFile) -> int:
+    """
+    Estimated in-memory size of a loaded data point. For a binary data
+    point, only the parts decoded so far are counted.
+    """
+    file_context = dp_obj.file_context
+    num_bytes = sys.getsizeof(dp_obj) + sys.getsizeof(file_context)
+    num_bytes += sys.getsizeof(file_context.file)
+    if isinstance(dp_obj.proofs, LazyProofs):
+        num_bytes += dp_obj.proofs.binary_file.decoded_bytes
+        if not isinstance(file_context, LazyFileContext):
+            num_bytes += get_sentences_num_bytes(file_context.avail_premises)
+        return num_bytes
+    num_bytes += get_sentences_num_bytes(file_context.avail_premises)
+    for proof in dp_obj.proofs:
+        num_bytes += get_term_num_bytes(proof.theorem)
+        num_bytes += sum(get_step_num_bytes(s) for s in proof.steps)
+    return num_bytes
+
+
 class DPCache:
-    def __init__(self, cache_size: int = 128):
-        self.__cached_dps: dict[str, DatasetFile] = {}
-        self.__cached_keys: list[str] = []
+    """
+    LRU cache of loaded data points, bounded by their estimated in-memory
+    size (get_dp_num_bytes). Binary data points grow as they are decoded,
+    so their size is measured again on every access. Entries are keyed by
+    the sentence db as well, since the loaded objects hold onto it.
+    get_process_dp_cache() returns the instance shared by every component
+    of a process, so that the same data point is only held once.
+    """
+
+    def __init__(
+        self, cache_size: Optional[int] = None, max_bytes: int = DEFAULT_DP_CACHE_BYTES
+    ):
+        self.__cached_dps: OrderedDict[
+            tuple[str, str, SentenceDB], tuple[DatasetFile, int]
+        ] = OrderedDict()
         self.__cache_size = cache_size
+        self.__max_bytes = max_bytes
+        self.num_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self.__cached_dps)
+
+    def __is_full(self) -> bool:
+        if self.__cache_size is not None and self.__cache_size < len(self):
+            return True
+        return self.__max_bytes < self.num_bytes
 
     def get_dp(
         self, dp_name: str, data_loc: Path, sentence_db: SentenceDB
     ) -> DatasetFile:
-        assert len(self.__cached_keys) == len(self.__cached_dps)
-        if dp_name in self.__cached_dps:
-            cur_idx = self.__cached_keys.index(dp_name)
-            self.__cached_keys.pop(cur_idx)
-            self.__cached_keys.insert(0, dp_name)
-            return self.__cached_dps[dp_name]
-        dp_loc = data_loc / DATA_POINTS_NAME / dp_name
-        dp_obj = DatasetFile.load(dp_loc, sentence_db)
-        self.__cached_dps[dp_name] = dp_obj
-        self.__cached_keys.insert(0, dp_name)
-        if self.__cache_size < len(self.__cached_keys):
-            del self.__cached_dps[self.__cached_keys.pop()]
+        key = (str(data_loc), dp_name, sentence_db)
+        if key in self.__cached_dps:
+            self.hits += 1
+            self.__cached_dps.move_to_end(key)
+            dp_obj, old_size = self.__cached_dps[key]
+            if not isinstance(dp_obj.proofs, LazyProofs):
+                return dp_obj
+        else:
+            self.misses += 1
+            dp_loc = data_loc / DATA_POINTS_NAME / dp_name
+            dp_obj = DatasetFile.load(dp_loc, sentence_db)
+            old_size = 0
+        dp_size = get_dp_num_bytes(dp_obj)
+        self.__cached_dps[key] = (dp_obj, dp_size)
+        self.num_bytes += dp_size - old_size
+        # Always keep the data point just accessed.
+        while 1 < len(self) and self.__is_full():
+            _, (_, evicted_size) = self.__cached_dps.popitem(last=False)
+            self.num_bytes -= evicted_size
+            self.evictions += 1
         return dp_obj
+
+    def get_stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self),
+            "bytes": self.num_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+_process_dp_cache: Optional[DPCache] = None
+
+
+def get_process_dp_cache() -> DPCache:
+    global _process_dp_cache
+    if _process_dp_cache is None:
+        _process_dp_cache = DPCache()
+    return _process_dp_cache
@@ -218,7 +218,7 @@ if __name__ == "__main__":
         port_map = wait_for_servers(next_num)
         data_conf_update_ips(clean_conf, port_map)
 
-    sentence_db = SentenceDB.load(clean_conf.sentence_db_loc)
+    sentence_db = SentenceDB.load(clean_conf.sentence_db_loc, read_only=True)
 
     queue: FileQueue = FileQueue(queue_loc)
     while True:
@@ -1,10 +1,19 @@
 from __future__ import annotations
-from typing import Optional
+from typing import Any, Optional, Iterator
 import sys, os
 import time
 import ipdb
+import json
+import pickle
+import hashlib
+import argparse
 from pathlib import Path
 import functools
+from contextlib import contextmanager
+from urllib.parse import quote
+
+import numpy as np
+import numpy.typing as npt
 
 from dataclasses import dataclass
 from sqlite3 import connect, Connection, Cursor
@@ -12,6 +21,14 @@ from util.util import get_basic_logger
 
 _logger = get_basic_logger(__name__)
 
+WARMUP_CHUNK_SIZE = 1 << 24
+SENTENCE_DB_SCRIPT_LOC = Path("src/data_management/sentence_db.py")
+
+
+def get_warmup_command(db_loc: Path) -> str:
+    """Shell command that loads the db into the page cache of the node."""
+    return f"python3 {SENTENCE_DB_SCRIPT_LOC} {db_loc} --warmup"
+
 
 @dataclass(frozen=True)
 class DBSentence:
@@ -21,22 +38,189 @@ class DBSentence:
     sentence_type: str
     line: int
 
+    def content_hash(self) -> str:
+        key = json.dumps(
+            [self.text, self.file_path, self.module, self.sentence_type, self.line]
+        )
+        return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+
+class SentenceSnapshot:
+    """
+    Read-only columnar copy of a sentence db. Texts are stored as one
+    utf-8 buffer with offsets, file paths, modules and sentence types as
+    codes into small string tables, and lines as ints; all arrays are
+    memory-mapped, so lookups don't touch SQLite. Row i holds sentence id i.
+    db_stamp is the SentenceDB.get_stamp of the db it was built from, so a
+    snapshot of a db that has since changed is not used.
+    """
+
+    COLUMNS = ["text_bytes", "text_offsets", "file_paths", "modules", "types", "lines"]
+    STRINGS_NAME = "strings.pkl"
+    STAMP_NAME = "db-stamp.json"
+
+    def __init__(
+        self,
+        text_bytes: npt.NDArray[np.uint8],
+        text_offsets: npt.NDArray[np.int64],
+        file_paths: npt.NDArray[np.int32],
+        modules: npt.NDArray[np.int32],
+        types: npt.NDArray[np.int32],
+        lines: npt.NDArray[np.int64],
+        strings: dict[str, list[str]],
+        db_stamp: dict[str, Any],
+    ) -> None:
+        self.text_bytes = text_bytes
+        self.text_offsets = text_offsets
+        self.file_paths = file_paths
+        self.modules = modules
+        self.types = types
+        self.lines = lines
+        self.strings = strings
+        self.db_stamp = db_stamp
+
+    @property
+    def num_rows(self) -> int:
+        return len(self.lines)
+
+    def contains_id(self, id: int) -> bool:
+        # Missing ids are stored with code -1.
+        return 0 <= id < self.num_rows and 0 <= self.file_paths[id]
+
+    def retrieve(self, id: int) -> DBSentence:
+        start = self.text_offsets[id]
+        end = self.text_offsets[id + 1]
+        return DBSentence(
+            bytes(self.text_bytes[start:end]).decode("utf-8"),
+            self.strings["file_paths"][self.file_paths[id]],
+            self.strings["modules"][self.modules[id]],
+            self.strings["types"][self.types[id]],
+            int(self.lines[id]),
+        )
+
+    def save(self, path: Path) -> None:
+        os.makedirs(path, exist_ok=True)
+        for column in self.COLUMNS:
+            np.save(path / f"{column}.npy", getattr(self, column))
+        with (path / self.STRINGS_NAME).open("wb") as fout:
+            pickle.dump(self.strings, fout)
+        with (path / self.STAMP_NAME).open("w") as fout:
+            json.dump(self.db_stamp, fout)
+
+    @classmethod
+    def load(cls, path: Path) -> SentenceSnapshot:
+        columns = [np.load(path / f"{c}.npy", mmap_mode="r") for c in cls.COLUMNS]
+        with (path / cls.STRINGS_NAME).open("rb") as fin:
+            strings = pickle.load(fin)
+        # Snapshots without a stamp never match a db.
+        db_stamp: dict[str, Any] = {}
+        if (path / cls.STAMP_NAME).exists():
+            with (path / cls.STAMP_NAME).open("r") as fin:
+                db_stamp = json.load(fin)
+        return cls(*columns, strings, db_stamp)
+
+    @staticmethod
+    def get_snapshot_loc(sentence_db_loc: Path) -> Path:
+        return sentence_db_loc.parent / f"{sentence_db_loc.stem}-snapshot"
+
+    @classmethod
+    def build(cls, sentence_db: SentenceDB) -> SentenceSnapshot:
+        string_ids: dict[str, dict[str, int]] = {
+            "file_paths": {},
+            "modules": {},
+            "types": {},
+        }
+
+        def get_code(column: str, value: str) -> int:
+            column_ids = string_ids[column]
+            if value not in column_ids:
+                column_ids[value] = len(column_ids)
+            return column_ids[value]
+
+        text_chunks: list[bytes] = []
+        text_offsets = [0]
+        codes: dict[str, list[int]] = {c: [] for c in string_ids}
+        lines: list[int] = []
+        for id, db_sentence in sentence_db.iter_sentences():
+            while len(lines) < id:
+                text_offsets.append(text_offsets[-1])
+                for column in codes:
+                    codes[column].append(-1)
+                lines.append(-1)
+            text = db_sentence.text.encode("utf-8")
+            text_chunks.append(text)
+            text_offsets.append(text_offsets[-1] + len(text))
+            codes["file_paths"].append(get_code("file_paths", db_sentence.file_path))
+            codes["modules"].append(get_code("modules", db_sentence.module))
+            codes["types"].append(get_code("types", db_sentence.sentence_type))
+            lines.append(db_sentence.line)
+
+        return cls(
+            np.frombuffer(b"".join(text_chunks), dtype=np.uint8),
+            np.array(text_offsets, dtype=np.int64),
+            np.array(codes["file_paths"], dtype=np.int32),
+            np.array(codes["modules"], dtype=np.int32),
+            np.array(codes["types"], dtype=np.int32),
+            np.array(lines, dtype=np.int64),
+            {c: list(ids) for c, ids in string_ids.items()},
+            sentence_db.get_stamp(),
+        )
+
 
 class SentenceDB:
     TABLE_NAME = "sentence"
+    COLUMNS = "text, file_path, module, sentence_type, line"
+    # Stay under SQLite's default limit on host parameters.
+    MAX_QUERY_IDS = 500
 
-    def __init__(self, connection: Connection, cursor: Cursor) -> None:
+    def __init__(
+        self,
+        connection: Connection,
+        cursor: Cursor,
+        snapshot: Optional[SentenceSnapshot] = None,
+    ) -> None:
         self.connection = connection
         self.cursor = cursor
+        self.snapshot = snapshot
         self.__found_cache: dict[DBSentence, int] = {}
         self.__contains_cache: dict[int, bool] = {}
+        self.__batch_depth = 0
+        self.has_hash_key = self.__check_hash_key()
+
+    def __check_hash_key(self) -> bool:
+        columns = self.cursor.execute(
+            f"PRAGMA table_info({self.TABLE_NAME})"
+        ).fetchall()
+        return any(c[1] == "content_hash" for c in columns)
+
+    @contextmanager
+    def write_batch(self) -> Iterator[SentenceDB]:
+        """Inserts in the block share one transaction, committed at the end."""
+        self.__batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self.__batch_depth -= 1
+            if 0 == self.__batch_depth:
+                self.connection.rollback()
+                # Rolled back ids must not be served from the caches.
+                self.__found_cache.clear()
+                self.__contains_cache.clear()
+                self.insert_sentence.cache_clear()
+                self.retrieve.cache_clear()
+            raise
+        self.__batch_depth -= 1
+        if 0 == self.__batch_depth:
+            self.connection.commit()
 
     def contains_id(self, id: int) -> bool:
+        if self.snapshot is not None and self.snapshot.contains_id(id):
+            return True
         if id in self.__contains_cache:
             return self.__contains_cache[id]
         result = self.cursor.execute(
             f"""
-            SELECT * FROM {self.TABLE_NAME} WHERE id={id}
+            SELECT id FROM {self.TABLE_NAME} WHERE id={id}
                             """
         ).fetchall()
         if 0 == len(result):
@@ -49,7 +233,24 @@ class SentenceDB:
         if sentence in self.__found_cache:
             return self.__found_cache[sentence]
 
-        result = self.cursor.execute(
+        if self.has_hash_key:
+            result = self.cursor.execute(
+                f"""
+                SELECT id FROM {self.TABLE_NAME} WHERE content_hash=?""",
+                (sentence.content_hash(),),
+            ).fetchall()
+        else:
+            result = self.__find_by_columns(sentence)
+        if 0 == len(result):
+            return None
+        if 1 == len(result):
+            (resulting_id,) = result[0]
+            self.__found_cache[sentence] = resulting_id
+            return resulting_id
+        raise ValueError(f"DB has more than one instance of {sentence}")
+
+    def __find_by_columns(self, sentence: DBSentence) -> list[Any]:
+        return self.cursor.execute(
             f"""
             SELECT id FROM {self.TABLE_NAME}
             WHERE
@@ -66,42 +267,100 @@ class SentenceDB:
                 sentence.line,
             ),
         ).fetchall()
-        if 0 == len(result):
-            return None
-        if 1 == len(result):
-            (resulting_id,) = result[0]
-            self.__found_cache[sentence] = resulting_id
-            return resulting_id
-        raise ValueError(f"DB has more than one instance of {sentence}")
 
     @functools.cache
     def insert_sentence(self, sentence: DBSentence) -> int:
         found_id = self.find_sentence(sentence)
         if found_id is not None:
             return found_id
+        resulting_id = self.__insert(sentence)
+        if 0 == self.__batch_depth:
+            self.connection.commit()
+        return resulting_id
 
-        result = self.cursor.execute(
-            f"""
-            INSERT INTO {self.TABLE_NAME}  (text, file_path, module, sentence_type, line) VALUES
-            (?, ?, ?, ?, ?)
-            RETURNING id""",
-            (
-                sentence.text,
-                sentence.file_path,
-                sentence.module,
-                sentence.sentence_type,
-                sentence.line,
-            ),
-        ).fetchall()
-        self.connection.commit()
+    def __insert(self, sentence: DBSentence) -> int:
+        values = (
+            sentence.text,
+            sentence.file_path,
+            sentence.module,
+            sentence.sentence_type,
+            sentence.line,
+        )
+        if self.has_hash_key:
+            result = self.cursor.execute(
+                f"""
+                INSERT INTO {self.TABLE_NAME} ({self.COLUMNS}, content_hash) VALUES
+                (?, ?, ?, ?, ?, ?)
+                RETURNING id""",
+                values + (sentence.content_hash(),),
+            ).fetchall()
+        else:
+            result = self.cursor.execute(
+                f"""
+                INSERT INTO {self.TABLE_NAME} ({self.COLUMNS}) VALUES
+                (?, ?, ?, ?, ?)
+                RETURNING id""",
+                values,
+            ).fetchall()
 
         if len(result) != 1:
             raise ValueError(
                 f"Something went wrong in query. Got {len(result)} after insert."
             )
         (resulting_id,) = result[0]
+        self.__found_cache[sentence] = resulting_id
         return resulting_id
 
+    def insert_many(self, sentences: list[DBSentence]) -> list[int]:
+        """
+        Same as [self.insert_sentence(s) for s in sentences] in a single
+        transaction. With a hash key, existing sentences are found in a few
+        queries instead of one per sentence.
+        """
+        with self.write_batch():
+            unique_sentences = [
+                s for s in dict.fromkeys(sentences) if s not in self.__found_cache
+            ]
+            if self.has_hash_key:
+                hashes = {s.content_hash(): s for s in unique_sentences}
+                hash_list = list(hashes)
+                for i in range(0, len(hash_list), self.MAX_QUERY_IDS):
+                    chunk = hash_list[i : i + self.MAX_QUERY_IDS]
+                    placeholders = ", ".join("?" for _ in chunk)
+                    result = self.cursor.execute(
+                        f"""
+                        SELECT content_hash, id FROM {self.TABLE_NAME}
+                        WHERE content_hash IN ({placeholders})""",
+                        chunk,
+                    ).fetchall()
+                    for content_hash, id in result:
+                        self.__found_cache[hashes[content_hash]] = id
+            for sentence in unique_sentences:
+                if sentence in self.__found_cache:
+                    continue
+                if self.has_hash_key or self.find_sentence(sentence) is None:
+                    self.__insert(sentence)
+            return [self.__found_cache[s] for s in sentences]
+
+    def add_hash_key(self) -> None:
+        """Adds and fills the content hash column of an existing db."""
+        if self.has_hash_key:
+            return
+        with self.write_batch():
+            self.cursor.execute(
+                f"ALTER TABLE {self.TABLE_NAME} ADD COLUMN content_hash TEXT"
+            )
+            self.cursor.executemany(
+                f"UPDATE {self.TABLE_NAME} SET content_hash=? WHERE id=?",
+                [(s.content_hash(), id) for id, s in self.iter_sentences()],
+            )
+            self.cursor.execute(
+                f"""
+                CREATE UNIQUE INDEX content_hash_index
+                ON {self.TABLE_NAME}(content_hash)"""
+            )
+        self.has_hash_key = True
+
     def size(self) -> int:
         result = self.cursor.execute(
             f"""
@@ -113,11 +372,32 @@ class SentenceDB:
         (count,) = result[0]
         return count
 
+    def get_stamp(self) -> dict[str, Any]:
+        """
+        Cheap fingerprint of the rows: their count, the largest id and the
+        content hash of the row with that id. Appending to or rebuilding the
+        db changes it.
+        """
+        ((count, max_id),) = self.cursor.execute(
+            f"SELECT COUNT(*), MAX(id) FROM {self.TABLE_NAME}"
+        ).fetchall()
+        last_hash = None
+        if max_id is not None:
+            ((text, file_path, module, sentence_type, line),) = self.cursor.execute(
+                f"SELECT {self.COLUMNS} FROM {self.TABLE_NAME} WHERE id=?",
+                (max_id,),
+            ).fetchall()
+            last_sentence = DBSentence(text, file_path, module, sentence_type, line)
+            last_hash = last_sentence.content_hash()
+        return {"num_sentences": count, "max_id": max_id, "last_hash": last_hash}
+
     @functools.cache
     def retrieve(self, id: int) -> DBSentence:
+        if self.snapshot is not None and self.snapshot.contains_id(id):
+            return self.snapshot.retrieve(id)
         result = self.cursor.execute(
             f"""
-            SELECT * FROM {self.TABLE_NAME} WHERE id=?
+            SELECT {self.COLUMNS} FROM {self.TABLE_NAME} WHERE id=?
                             """,
             (id,),
         ).fetchall()
@@ -125,9 +405,61 @@ class SentenceDB:
             raise ValueError(
                 f"Expected single result from sentence db. Got {len(result)}"
             )
-        _, text, file_path, module, sentence_type, line = result[0]
+        text, file_path, module, sentence_type, line = result[0]
         return DBSentence(text, file_path, module, sentence_type, line)
 
+    def retrieve_many(self, ids: list[int]) -> list[DBSentence]:
+        """Same as [self.retrieve(id) for id in ids] in a few queries."""
+        found: dict[int, DBSentence] = {}
+        query_ids: list[int] = []
+        for id in dict.fromkeys(ids):
+            if self.snapshot is not None and self.snapshot.contains_id(id):
+                found[id] = self.snapshot.retrieve(id)
+            else:
+                query_ids.append(id)
+
+        for i in range(0, len(query_ids), self.MAX_QUERY_IDS):
+            chunk = query_ids[i : i + self.MAX_QUERY_IDS]
+            placeholders = ", ".join("?" for _ in chunk)
+            result = self.cursor.execute(
+                f"""
+                SELECT id, {self.COLUMNS} FROM {self.TABLE_NAME}
+                WHERE id IN ({placeholders})
+                                """,
+                chunk,
+            ).fetchall()
+            for id, text, file_path, module, sentence_type, line in result:
+                found[id] = DBSentence(text, file_path, module, sentence_type, line)
+
+        if len(found) != len(dict.fromkeys(ids)):
+            missing = [id for id in ids if id not in found]
+            raise ValueError(f"Sentence db has no sentences with ids {missing[:10]}")
+        return [found[id] for id in ids]
+
+    def iter_sentences(self) -> Iterator[tuple[int, DBSentence]]:
+        cursor = self.connection.cursor()
+        try:
+            for id, text, file_path, module, sentence_type, line in cursor.execute(
+                f"""
+                SELECT id, {self.COLUMNS} FROM {self.TABLE_NAME} ORDER BY id
+                                """
+            ):
+                yield id, DBSentence(text, file_path, module, sentence_type, line)
+        finally:
+            cursor.close()
+
+    def iter_texts(self) -> Iterator[tuple[int, str]]:
+        cursor = self.connection.cursor()
+        try:
+            for sentence_id, text in cursor.execute(
+                f"""
+                SELECT id, text FROM {self.TABLE_NAME} ORDER BY id
+                                """
+            ):
+                yield sentence_id, text
+        finally:
+            cursor.close()
+
     def commit(self) -> None:
         self.connection.commit()
 
@@ -135,23 +467,62 @@ class SentenceDB:
         self.cursor.close()
         self.connection.close()
 
+    @staticmethod
+    def warmup(db_path: Path) -> None:
+        """Asks the kernel to read the whole file into the page cache."""
+        with db_path.open("rb") as fin:
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(fin.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+            else:
+                while fin.read(WARMUP_CHUNK_SIZE):
+                    pass
+
     @classmethod
-    def load(cls, db_path: Path) -> SentenceDB:
+    def connect_read_only(cls, db_path: Path) -> Connection:
+        """
+        Opens the db as immutable (no locking or change detection) and maps
+        it into memory, so processes on one host share the page cache
+        instead of each holding its own copy of the pages.
+        """
+        uri = f"file:{quote(str(db_path.resolve()))}?mode=ro&immutable=1"
+        con = connect(uri, uri=True)
+        con.execute(f"PRAGMA mmap_size={db_path.stat().st_size}")
+        con.execute("PRAGMA query_only=1")
+        return con
+
+    @classmethod
+    def load(
+        cls,
+        db_path: Path,
+        use_snapshot: bool = True,
+        read_only: bool = False,
+        warmup: bool = False,
+    ) -> SentenceDB:
         if not db_path.exists():
             raise ValueError(f"Database {db_path} does not exis does not exist.")
-        name = db_path.name
-        fast_db_path = Path("/tmp") / name
-        if fast_db_path.exists():
-            _logger.debug(f"Using local sentence db at {fast_db_path}")
-            db_path = fast_db_path
+        if warmup:
+            cls.warmup(db_path)
+        if read_only:
+            con = cls.connect_read_only(db_path)
         else:
-            _logger.debug(f"Not using local db. {fast_db_path} does not exist.")
-
-        con = connect(
-            db_path,
-        )
+            con = connect(
+                db_path,
+            )
         cur = con.cursor()
-        return cls(con, cur)
+        sentence_db = cls(con, cur)
+
+        snapshot_loc = SentenceSnapshot.get_snapshot_loc(db_path)
+        if use_snapshot and snapshot_loc.exists():
+            snapshot = SentenceSnapshot.load(snapshot_loc)
+            if snapshot.db_stamp == sentence_db.get_stamp():
+                _logger.debug(f"Using sentence snapshot at {snapshot_loc}")
+                sentence_db.snapshot = snapshot
+            else:
+                _logger.warning(
+                    f"Sentence snapshot at {snapshot_loc} does not match "
+                    f"{db_path}; not using it. Rebuild it with {SENTENCE_DB_SCRIPT_LOC}."
+                )
+        return sentence_db
 
     @classmethod
     def create(cls, db_path: Path) -> SentenceDB:
@@ -167,7 +538,8 @@ class SentenceDB:
                 file_path TEXT, 
                 module TEXT, 
                 sentence_type TEXT, 
-                line INTEGER)
+                line INTEGER,
+                content_hash TEXT)
         """
         )
         cur.execute(
@@ -175,4 +547,45 @@ class SentenceDB:
             CREATE INDEX text_index ON {cls.TABLE_NAME}(text)
         """
         )
+        cur.execute(
+            f"""
+            CREATE UNIQUE INDEX content_hash_index ON {cls.TABLE_NAME}(content_hash)
+        """
+        )
         return cls(con, cur)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=(
+            "Write a read-only columnar snapshot of a sentence db, "
+            "add the content hash key to it, or warm up the page cache."
+        )
+    )
+    parser.add_argument("sentence_db_loc", help="Location of the sentence db.")
+    parser.add_argument(
+        "--add_hash_key",
+        action="store_true",
+        help="Add the content hash key to a db created without it.",
+    )
+    parser.add_argument(
+        "--warmup",
+        action="store_true",
+        help="Only load the db into the page cache (e.g. once per node).",
+    )
+    args = parser.parse_args(sys.argv[1:])
+
+    sentence_db_loc = Path(args.sentence_db_loc)
+    if args.warmup:
+        SentenceDB.warmup(sentence_db_loc)
+    elif args.add_hash_key:
+        sentence_db = SentenceDB.load(sentence_db_loc, use_snapshot=False)
+        sentence_db.add_hash_key()
+        sentence_db.close()
+        print(f"Added content hash key to {sentence_db_loc}")
+    else:
+        sentence_db = SentenceDB.load(sentence_db_loc, use_snapshot=False)
+        snapshot = SentenceSnapshot.build(sentence_db)
+        snapshot_loc = SentenceSnapshot.get_snapshot_loc(sentence_db_loc)
+        snapshot.save(snapshot_loc)
+        print(f"Saved snapshot of {snapshot.num_rows - 1} sentences to {snapshot_loc}")
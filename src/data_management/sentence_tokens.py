@@ -0,0 +1,175 @@
+from __future__ import annotations
+from typing import Any, Optional
+import sys, os
+import re
+import pickle
+import argparse
+from pathlib import Path
+
+import numpy as np
+import numpy.typing as npt
+
+from data_management.sentence_db import SentenceDB
+from data_management.dataset_file import (
+    Goal,
+    Sentence,
+    ID_FORM,
+    get_ids_from_goal,
+)
+from util.util import get_basic_logger
+
+_logger = get_basic_logger(__name__)
+
+
+GoalKey = tuple[tuple[str, ...], str]
+
+
+class SentenceTokenTable:
+    """
+    Identifier tokens (see ID_FORM) of every sentence in a SentenceDB,
+    interned to ints and indexed by sentence id. Saved next to the
+    sentence db so retrieval doesn't need to re-run the regex over the
+    premises. Goals are tokenized once per process and kept in an intern
+    table keyed by their hypotheses and goal text.
+    db_stamp is the SentenceDB.get_stamp of the db the table was built
+    from; load_for_db does not use the table of a db that has changed.
+    """
+
+    def __init__(
+        self,
+        vocab: list[str],
+        offsets: npt.NDArray[np.int64],
+        tokens: npt.NDArray[np.int32],
+        db_stamp: dict[str, Any],
+        max_cached_goals: int = 100000,
+    ) -> None:
+        self.vocab = vocab
+        self.token_ids = {t: i for i, t in enumerate(vocab)}
+        self.offsets = offsets
+        self.tokens = tokens
+        self.db_stamp = db_stamp
+        self.max_cached_goals = max_cached_goals
+        self.__goal_tokens: dict[GoalKey, tuple[list[int], list[int]]] = {}
+        self.__sentence_tokens: dict[Sentence, list[int]] = {}
+
+    @property
+    def num_sentences(self) -> int:
+        return len(self.offsets) - 1
+
+    def intern(self, term: str) -> int:
+        if term not in self.token_ids:
+            self.token_ids[term] = len(self.vocab)
+            self.vocab.append(term)
+        return self.token_ids[term]
+
+    def intern_all(self, terms: list[str]) -> list[int]:
+        return [self.intern(t) for t in terms]
+
+    def contains_id(self, sentence_id: int) -> bool:
+        return 0 <= sentence_id < self.num_sentences
+
+    def get_id_tokens(self, sentence_id: int) -> list[int]:
+        start = self.offsets[sentence_id]
+        end = self.offsets[sentence_id + 1]
+        return self.tokens[start:end].tolist()
+
+    def get_sentence_tokens(self, sentence: Sentence) -> list[int]:
+        if sentence.db_idx is not None and self.contains_id(sentence.db_idx):
+            return self.get_id_tokens(sentence.db_idx)
+        # Sentences added to the db after the table was built, or not stored.
+        if sentence not in self.__sentence_tokens:
+            found_ids = re.findall(ID_FORM, sentence.text)
+            self.__sentence_tokens[sentence] = self.intern_all(found_ids)
+        return self.__sentence_tokens[sentence]
+
+    def get_goal_tokens(self, goal: Goal) -> tuple[list[int], list[int]]:
+        key = (tuple(goal.hyps), goal.goal)
+        if key in self.__goal_tokens:
+            return self.__goal_tokens[key]
+        hyp_ids, goal_ids = get_ids_from_goal(goal)
+        goal_tokens = (self.intern_all(hyp_ids), self.intern_all(goal_ids))
+        if self.max_cached_goals <= len(self.__goal_tokens):
+            del self.__goal_tokens[next(iter(self.__goal_tokens))]
+        self.__goal_tokens[key] = goal_tokens
+        return goal_tokens
+
+    def save(self, path: Path) -> None:
+        with path.open("wb") as fout:
+            pickle.dump(
+                {
+                    "vocab": self.vocab,
+                    "offsets": self.offsets,
+                    "tokens": self.tokens,
+                    "db_stamp": self.db_stamp,
+                },
+                fout,
+            )
+
+    @classmethod
+    def load(cls, path: Path) -> SentenceTokenTable:
+        with path.open("rb") as fin:
+            data = pickle.load(fin)
+        # Tables saved without a stamp never match a db.
+        return cls(
+            data["vocab"], data["offsets"], data["tokens"], data.get("db_stamp", {})
+        )
+
+    @staticmethod
+    def get_table_loc(sentence_db_loc: Path) -> Path:
+        return sentence_db_loc.parent / f"{sentence_db_loc.stem}-tokens.pkl"
+
+    @classmethod
+    def load_for_db(
+        cls, sentence_db_loc: Path, sentence_db: SentenceDB
+    ) -> Optional[SentenceTokenTable]:
+        """The saved table of sentence_db, if it was built from its current rows."""
+        table_loc = cls.get_table_loc(sentence_db_loc)
+        if not table_loc.exists():
+            _logger.debug(f"No token table at {table_loc}.")
+            return None
+        table = cls.load(table_loc)
+        if table.db_stamp != sentence_db.get_stamp():
+            _logger.warning(
+                f"Token table at {table_loc} does not match {sentence_db_loc}; "
+                "not using it. Rebuild it with src/data_management/sentence_tokens.py."
+            )
+            return None
+        return table
+
+    @classmethod
+    def empty(cls) -> SentenceTokenTable:
+        return cls([], np.zeros(1, dtype=np.int64), np.zeros(0, dtype=np.int32), {})
+
+    @classmethod
+    def build(cls, sentence_db: SentenceDB) -> SentenceTokenTable:
+        table = cls.empty()
+        table.db_stamp = sentence_db.get_stamp()
+        # Sentence ids start at 1; id 0 is an empty row.
+        offsets = [0, 0]
+        tokens: list[int] = []
+        for sentence_id, text in sentence_db.iter_texts():
+            while len(offsets) < sentence_id + 1:
+                offsets.append(len(tokens))
+            tokens.extend(table.intern_all(re.findall(ID_FORM, text)))
+            offsets.append(len(tokens))
+        table.offsets = np.array(offsets, dtype=np.int64)
+        table.tokens = np.array(tokens, dtype=np.int32)
+        return table
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Precompute the identifier tokens of every sentence in a sentence db."
+    )
+    parser.add_argument("sentence_db_loc", help="Location of the sentence db.")
+    args = parser.parse_args(sys.argv[1:])
+
+    sentence_db_loc = Path(args.sentence_db_loc)
+    sentence_db = SentenceDB.load(sentence_db_loc)
+    table = SentenceTokenTable.build(sentence_db)
+    table_loc = SentenceTokenTable.get_table_loc(sentence_db_loc)
+    table.save(table_loc)
+    print(
+        f"Saved tokens of {table.num_sentences - 1} sentences "
+        f"({len(table.vocab)} distinct ids) to {table_loc}"
+    )
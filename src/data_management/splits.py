@@ -98,18 +98,11 @@ class FileInfo:
 
     def get_dp(self, data_loc: Path, sentence_db: SentenceDB) -> DatasetFile:
         dp_loc = data_loc / DATA_POINTS_NAME / self.dp_name
-        tmp_dp_loc = Path("/tmp") / DATA_POINTS_NAME / self.dp_name
-        if tmp_dp_loc.exists():
-            return DatasetFile.load(tmp_dp_loc, sentence_db)
         return DatasetFile.load(dp_loc, sentence_db)
 
     def get_proofs(self, data_loc: Path, sentence_db: SentenceDB) -> list[Proof]:
         dp_loc = data_loc / DATA_POINTS_NAME / self.dp_name
-        tmp_dp_loc = Path("/tmp") / DATA_POINTS_NAME / self.dp_name
-        if tmp_dp_loc.exists():
-            dset_file = DatasetFile.load(tmp_dp_loc, sentence_db, metadata_only=True)
-        else:
-            dset_file = DatasetFile.load(dp_loc, sentence_db, metadata_only=True)
+        dset_file = DatasetFile.load(dp_loc, sentence_db, metadata_only=True)
         return dset_file.proofs
 
     @functools.cache
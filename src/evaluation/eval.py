@@ -8,6 +8,7 @@ import subprocess
 from pathlib import Path
 from evaluation.eval_utils import EvalConf
 from data_management.splits import DataSplit, get_all_files, FileInfo
+from data_management.sentence_db import get_warmup_command
 from model_deployment.prove import get_save_loc
 
 from coqstoq import get_theorem_list
@@ -81,7 +82,7 @@ if __name__ == "__main__":
             run_local(worker_command, n_workers)
         case SlurmJobConf(_, slurm_conf):
             commands = [
-                f"cp -r {conf.sentence_db_loc} /tmp/{conf.sentence_db_loc.name}",
+                get_warmup_command(conf.sentence_db_loc),
                 f"source unity-module-change-revert",
                 f"module load opam/2.1.2",
                 f"eval $(opam env)",
@@ -92,7 +92,7 @@ if __name__ == "__main__":
     switch = subprocess.run(["opam", "switch", "show"], capture_output=True)
     _logger.info(f"Running with switch {switch.stdout.decode()}")
 
-    sentence_db = SentenceDB.load(eval_conf.sentence_db_loc)
+    sentence_db = SentenceDB.load(eval_conf.sentence_db_loc, read_only=True)
 
     q = FileQueue[EvalTheorem](queue_loc)
 
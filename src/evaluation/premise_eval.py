@@ -7,7 +7,7 @@ from pathlib import Path
 from datetime import datetime
 
 from data_management.splits import DataSplit, Split
-from premise_selection.premise_client import SelectModelConf
+from data_management.sentence_db import get_warmup_command
 from evaluation.eval_utils import PremiseEvalConf, initialize_and_fill_queue
 from util.constants import TMP_LOC, QUEUE_NAME
 from util.file_queue import FileQueue
@@ -28,17 +28,11 @@ def start_workers(
     conf_loc: Path,
     queue_loc: Path,
 ):
-    vec_str = ""
-    if isinstance(premise_eval_conf.premise_conf, SelectModelConf):
-        if premise_eval_conf.premise_conf.vector_db_loc is not None:
-            vec_str = f"cp -r {premise_eval_conf.premise_conf.vector_db_loc} /tmp/{premise_eval_conf.premise_conf.vector_db_loc.name}\n"
-
     total_n_gpus = n_gpu_nodes * n_devices_per_node
     if 0 < total_n_gpus:
         with TASK_FILE_LOC.open("w") as fout:
             fout.write(
                 f"#!/bin/bash\n"
-                f"{vec_str}"
                 f"source venv/bin/activate\n"
                 f"LOG_LEVEL=DEBUG python3 src/evaluation/premise_eval_worker.py {conf_loc} {queue_loc}\n"
             )
@@ -54,7 +48,7 @@ def start_workers(
             f"#SBATCH --constraint=2080ti\n"
             f"#SBATCH --mem-per-cpu=16G\n"
             f"#SBATCH -o slurm/out/slurm-{premise_eval_conf.save_loc.name}-%j.out\n"
-            f"sbcast {premise_eval_conf.sentence_db_loc} /tmp/sentences.db\n"
+            f"{get_warmup_command(premise_eval_conf.sentence_db_loc)}\n"
             f"srun -l {TASK_FILE_LOC}\n"
         )
     else:
@@ -67,7 +61,7 @@ def start_workers(
             f"#SBATCH --mem=16G\n"
             f"#SBATCH -o slurm/out/slurm-{premise_eval_conf.save_loc.name}-%j.out\n"
             f"#SBATCH --job-name={premise_eval_conf.save_loc.name}\n"
-            f"sbcast {premise_eval_conf.sentence_db_loc} /tmp/sentences.db\n"
+            f"{get_warmup_command(premise_eval_conf.sentence_db_loc)}\n"
             f"source venv/bin/activate\n"
             f"LOG_LEVEL=DEBUG python3 src/evaluation/premise_eval_worker.py {conf_loc} {queue_loc}\n"
         )
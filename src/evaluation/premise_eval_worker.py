@@ -99,7 +99,7 @@ if __name__ == "__main__":
     update_ips(premise_client_conf, port_map)  # TODO
 
     assert isinstance(premise_client_conf, PremiseEvalConf)
-    sentence_db = SentenceDB.load(premise_client_conf.sentence_db_loc)
+    sentence_db = SentenceDB.load(premise_client_conf.sentence_db_loc, read_only=True)
 
     q = FileQueue(queue_loc)
     while True:
@@ -4,7 +4,11 @@ import time
 from typing import Optional, Any
 from dataclasses import dataclass
 from data_management.dataset_file import Proof, DatasetFile
-from model_deployment.proof_manager import ProofManager, TacticResult
+from model_deployment.proof_manager import (
+    ProofManager,
+    ProofCheckResult,
+    TacticResult,
+)
 from model_deployment.tactic_gen_client import TacticGenClient
 from model_deployment.goal_comparer import AlphaGoalComparer
 
@@ -19,6 +23,7 @@ class ClassicalSearchConf:
     timeout: int
     beam_decode: bool
     initial_proof: Optional[str]
+    num_proof_workers: int = 1
     ALIAS = "classical"
 
     @classmethod
@@ -30,6 +35,7 @@ class ClassicalSearchConf:
             yaml_data["timeout"],
             yaml_data["beam_decode"],
             yaml_data.get("initial_proof", None),
+            yaml_data.get("num_proof_workers", 1),
         )
 
 
@@ -140,7 +146,7 @@ class ClassicalSearcher:
     ) -> ClassicalSuccess | ClassicalFailure:
         start = time.time()
         num_steps = 0
-        for i in range(self.max_search_steps):
+        while num_steps < self.max_search_steps:
             cur = time.time()
             if self.timeout <= cur - start:
                 return ClassicalFailure(
@@ -150,8 +156,10 @@ class ClassicalSearcher:
                 return ClassicalFailure(
                     cur - start, self.total_model_time, num_steps, self.root_candidate
                 )
-            num_steps += 1
-            possible_success = self.search_step(num_steps, print_proofs)
+            possible_success, num_checked = self.search_step(
+                num_steps + 1, print_proofs, self.max_search_steps - num_steps
+            )
+            num_steps += num_checked
             if possible_success is not None:
                 return ClassicalSuccess(
                     time.time() - start,
@@ -188,16 +196,36 @@ class ClassicalSearcher:
                 return True
         return False
 
-    def search_step(self, attempt_num: int, print_proofs: bool) -> Optional[Candidate]:
-        cur_candidate = heapq.heappop(self.frontier)
+    def search_step(
+        self, attempt_num: int, print_proofs: bool, max_candidates: int
+    ) -> tuple[Optional[Candidate], int]:
+        """
+        Checks the best candidates of the frontier, one per proof worker,
+        and expands them in order. Returns a complete candidate if there is
+        one and the number of candidates checked.
+        """
+        num_candidates = min(
+            self.proof_manager.num_workers, len(self.frontier), max_candidates
+        )
+        candidates = [heapq.heappop(self.frontier) for _ in range(num_candidates)]
         if print_proofs:
-            print(f"===== Attempt {attempt_num} ======")
-            print(cur_candidate.proof_str)
-            print()
-        proof_check_result = self.proof_manager.check_proof(
-            cur_candidate.proof_str,
+            for i, candidate in enumerate(candidates):
+                print(f"===== Attempt {attempt_num + i} ======")
+                print(candidate.proof_str)
+                print()
+        check_results = self.proof_manager.check_proofs(
+            [c.proof_str for c in candidates],
             self.initial_dset_file.proofs[-1].theorem,
         )
+        for cur_candidate, proof_check_result in zip(candidates, check_results):
+            possible_success = self.expand_candidate(cur_candidate, proof_check_result)
+            if possible_success is not None:
+                return possible_success, num_candidates
+        return None, num_candidates
+
+    def expand_candidate(
+        self, cur_candidate: Candidate, proof_check_result: ProofCheckResult
+    ) -> Optional[Candidate]:
         match proof_check_result.tactic_result:
             case TacticResult.COMPLETE:
                 assert proof_check_result.new_proof is not None
@@ -71,8 +71,32 @@ class StartTacticModelCommand:
     alias: str
     checkpoint_loc: Path
     id: int
+    max_batch_size: int = 1
+    max_batch_wait_ms: float = 5
+    prefix_cache_mb: int = 0
+    num_threads: Optional[int] = None
+    quantize: bool = True
     TACTIC_GEN_SERVER_SCRIPT = Path("src/model_deployment/tactic_gen_server.py")
 
+    def server_args(self) -> list[str]:
+        args: list[str] = []
+        if 1 < self.max_batch_size:
+            args.extend(
+                [
+                    "--max_batch_size",
+                    f"{self.max_batch_size}",
+                    "--max_batch_wait_ms",
+                    f"{self.max_batch_wait_ms}",
+                ]
+            )
+        if 0 < self.prefix_cache_mb:
+            args.extend(["--prefix_cache_mb", f"{self.prefix_cache_mb}"])
+        if self.num_threads is not None:
+            args.extend(["--num_threads", f"{self.num_threads}"])
+        if not self.quantize:
+            args.append("--no_quantize")
+        return args
+
     def to_list(self) -> list[str]:
         return [
             "python3",
@@ -81,7 +105,7 @@ class StartTacticModelCommand:
             f"{self.checkpoint_loc}",
             f"{self.id}",
             f"{os.getpid()}",
-        ]
+        ] + self.server_args()
 
     def to_list_slurm(self, env_var_name: str, commands_per_task: int) -> list[str]:
         return [
@@ -92,7 +116,7 @@ class StartTacticModelCommand:
             f"{self.checkpoint_loc}",
             f"$(expr ${env_var_name} \\* {commands_per_task} + {self.id})",
             f"{os.getpid()}",
-        ]
+        ] + self.server_args()
 
 
 @dataclass
@@ -290,6 +314,7 @@ def premise_conf_to_client_conf(
                 filter_conf,
                 data_conf.sentence_db_loc,
                 conf.cached_premise_loc,
+                conf.ann_top_k,
             )
             return new_select_client, next_server_num, [command]
         case RerankConf():
@@ -500,6 +525,8 @@ def get_tactic_server_alias(conf: FidTacticGenConf | DecoderTacticGenConf) -> st
     match conf:
         case FidTacticGenConf():
             return "fid-local"
+        case DecoderTacticGenConf(cpu=True):
+            return "decoder-cpu"
         case DecoderTacticGenConf():
             return "decoder-local"
 
@@ -510,6 +537,13 @@ def get_tactic_gen_command(
     command = StartTacticModelCommand(
         get_tactic_server_alias(conf), conf.checkpoint_loc, start_server_num
     )
+    match conf:
+        case DecoderTacticGenConf():
+            command.max_batch_size = conf.max_batch_size
+            command.max_batch_wait_ms = conf.max_batch_wait_ms
+            command.prefix_cache_mb = conf.prefix_cache_mb
+            command.num_threads = conf.num_threads
+            command.quantize = conf.quantize
     return get_flexible_url(start_server_num, get_ip()), start_server_num + 1, command
 
 
@@ -6,6 +6,7 @@ import time
 import ipdb
 import os
 import signal
+from typing import Any
 
 from coqpyt.coq.structs import Step
 from coqpyt.lsp.structs import *
@@ -18,12 +19,34 @@ from util.util import get_basic_logger
 
 _logger = get_basic_logger(__name__)
 
+# TextDocumentSyncKind.Incremental in the LSP specification.
+INCREMENTAL_SYNC = 2
+
+
+def common_prefix_len(s1: str, s2: str) -> int:
+    """Length of the longest common prefix, found with slice comparisons."""
+    lo, hi = 0, min(len(s1), len(s2))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if s1[lo:mid] == s2[lo:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def offset_to_position(content: str, offset: int) -> Position:
+    line = content.count("\n", 0, offset)
+    line_start = content.rfind("\n", 0, offset) + 1
+    return Position(line, offset - line_start)
+
 
 class ClientWrapper:
     def __init__(self, client: FastLspClient, file_uri: str) -> None:
         self.client = client
         self.file_uri = file_uri
         self.file_version = 1
+        self.content = ""
         self.client.didOpen(
             TextDocumentItem(self.file_uri, "coq", self.file_version, "")
         )
@@ -32,26 +55,58 @@ class ClientWrapper:
         self.file_version = v
 
     def write(self, content: str) -> None:
+        """
+        Replaces the document with content. If the server accepts
+        incremental changes, only the text after the part shared with the
+        previous content is sent.
+        """
         self.file_version += 1
+        if self.client.incremental_sync:
+            start_offset = common_prefix_len(self.content, content)
+            change_range = Range(
+                offset_to_position(self.content, start_offset),
+                offset_to_position(self.content, len(self.content)),
+            )
+            change = TextDocumentContentChangeEvent(
+                change_range, None, content[start_offset:]
+            )
+        else:
+            change = TextDocumentContentChangeEvent(None, None, content)
         self.client.didChange(
             VersionedTextDocumentIdentifier(self.file_uri, self.file_version),
-            [TextDocumentContentChangeEvent(None, None, content)],
+            [change],
         )
+        self.content = content
 
-    def write_and_get_steps(self, content: str) -> list[Step]:
+    def write_and_get_steps(self, content: str, start_offset: int = 0) -> list[Step]:
+        """
+        Writes content and returns its steps. Only spans ending after
+        start_offset are returned, and only the content after the line of
+        start_offset is split into steps.
+        """
         self.write(content)
-        lines = content.split("\n")
+        start = offset_to_position(content, start_offset)
+        first_line_offset = start_offset - start.character
+        lines = content[first_line_offset:].split("\n")
         spans = self.client.get_document(TextDocumentIdentifier(self.file_uri)).spans
         steps: list[Step] = []
-        prev_line, prev_char = (0, 0)
         if spans[-1].span is None:
             spans = spans[:-1]
-        for i, span in enumerate(spans):
+        prev_line, prev_char = (0, 0)
+        for span in spans:
             end_line, end_char = (
                 span.range.end.line,
                 span.range.end.character,
             )
-            cur_lines = lines[prev_line : (end_line + 1)].copy()
+            if (end_line, end_char) <= (start.line, start.character):
+                prev_line, prev_char = end_line, end_char
+                continue
+            # The first returned step starts at start_offset at the earliest.
+            if (prev_line, prev_char) < (start.line, start.character):
+                prev_line, prev_char = (start.line, start.character)
+            cur_lines = lines[
+                (prev_line - start.line) : (end_line - start.line + 1)
+            ].copy()
             cur_lines[-1] = cur_lines[-1][:end_char]
             cur_lines[0] = cur_lines[0][prev_char:]
             text = "\n".join(cur_lines)
@@ -98,7 +153,7 @@ class FastLspClient(LspClient):
         }
         self.init_options = init_options
 
-        self.initialize(
+        result = self.initialize(
             self.proc.pid,
             "",
             root_uri,
@@ -107,8 +162,19 @@ class FastLspClient(LspClient):
             "off",
             workspaces,
         )
+        self.incremental_sync = self.__accepts_incremental(result)
         self.initialized()
 
+    @staticmethod
+    def __accepts_incremental(result: Any) -> bool:
+        try:
+            sync = result["capabilities"]["textDocumentSync"]
+        except (KeyError, TypeError):
+            return False
+        if isinstance(sync, dict):
+            sync = sync.get("change")
+        return sync == INCREMENTAL_SYNC
+
     def didOpen(self, textDocument: TextDocumentItem):
         """Open a text document in the server.
 
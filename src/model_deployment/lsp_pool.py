@@ -0,0 +1,190 @@
+from __future__ import annotations
+from typing import Any, Callable, Optional
+
+import os
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from model_deployment.fast_client import (
+    FastLspClient,
+    ClientWrapper,
+    common_prefix_len,
+)
+from util.util import get_fresh_path, get_basic_logger
+
+_logger = get_basic_logger(__name__)
+
+_aux_path_lock = threading.Lock()
+
+
+class LspWorker:
+    """A coq-lsp process with its own aux file, checked up to the prefix."""
+
+    def __init__(
+        self, workspace_uri: str, file_loc: Path, file_prefix: str, timeout: int
+    ) -> None:
+        # Workers start concurrently, so fresh paths are reserved under a lock.
+        with _aux_path_lock:
+            self.aux_file_path = get_fresh_path(
+                file_loc.parent, "aux_" + str(file_loc.name)
+            ).resolve()
+            with open(self.aux_file_path, "w"):
+                pass
+        self.client = FastLspClient(workspace_uri, timeout=timeout)
+        self.wrapper = ClientWrapper(self.client, f"file://{self.aux_file_path}")
+        if 0 < len(file_prefix):
+            self.wrapper.write_and_get_steps(file_prefix, len(file_prefix))
+
+    def kill(self) -> None:
+        if os.path.exists(self.aux_file_path):
+            os.remove(self.aux_file_path)
+        try:
+            self.client.kill()
+        except Exception as e:
+            _logger.warning(f"Could not kill coq-lsp worker: {e}")
+
+
+class LspWorkerPool:
+    """
+    Warm coq-lsp workers that check candidates concurrently. A crashed
+    worker is replaced by a warm spare, and a new spare is started in the
+    background. If a worker cannot be started and no worker is left to
+    check with, acquire() and peek() raise the start error.
+    """
+
+    START_ATTEMPTS = 2
+
+    def __init__(
+        self,
+        make_worker: Callable[[], LspWorker],
+        num_workers: int,
+        num_spares: int = 1,
+    ) -> None:
+        assert 0 < num_workers
+        self.make_worker = make_worker
+        self.num_workers = num_workers
+        self.num_spares = num_spares
+        self.num_replacements = 0
+        self.__cond = threading.Condition()
+        self.__free: deque[LspWorker] = deque()
+        self.__spares: deque[LspWorker] = deque()
+        self.__busy: set[LspWorker] = set()
+        self.__starting = 0
+        # Workers being started to take the place of a worker with no spare.
+        self.__starting_free = 0
+        self.__start_error: Optional[Exception] = None
+        self.__closed = False
+        with ThreadPoolExecutor(num_workers + num_spares) as executor:
+            workers = list(
+                executor.map(lambda _: make_worker(), range(num_workers + num_spares))
+            )
+        self.__free.extend(workers[:num_workers])
+        self.__spares.extend(workers[num_workers:])
+
+    def acquire(self, content: Optional[str] = None) -> LspWorker:
+        """
+        Takes a free worker. Given the content to check, takes the worker
+        whose document shares the longest prefix with it, since coq-lsp
+        only rechecks the document after the first change.
+        """
+        with self.__cond:
+            self.__wait_for_free()
+            worker = self.__free[0]
+            if content is not None and 1 < len(self.__free):
+                worker = max(
+                    self.__free,
+                    key=lambda w: common_prefix_len(w.wrapper.content, content),
+                )
+            self.__free.remove(worker)
+            self.__busy.add(worker)
+            return worker
+
+    def release(self, worker: LspWorker) -> None:
+        with self.__cond:
+            self.__busy.discard(worker)
+            self.__free.append(worker)
+            self.__cond.notify()
+
+    def replace(self, worker: LspWorker) -> None:
+        """Kills a failed worker and frees a spare in its place."""
+        with self.__cond:
+            self.__busy.discard(worker)
+            self.num_replacements += 1
+            if 0 < len(self.__spares):
+                self.__free.append(self.__spares.popleft())
+                self.__cond.notify()
+                to_free = False
+            else:
+                to_free = True
+                self.__starting_free += 1
+            self.__starting += 1
+        worker.kill()
+        threading.Thread(target=self.__start_worker, args=(to_free,)).start()
+
+    def __start_worker(self, to_free: bool) -> None:
+        new_worker: Optional[LspWorker] = None
+        start_error: Optional[Exception] = None
+        for _ in range(self.START_ATTEMPTS):
+            try:
+                new_worker = self.make_worker()
+                break
+            except Exception as e:
+                _logger.error(f"Could not start coq-lsp worker: {e}")
+                start_error = e
+        with self.__cond:
+            self.__starting -= 1
+            if to_free:
+                self.__starting_free -= 1
+            if new_worker is None:
+                self.__start_error = start_error
+                if to_free and 0 < len(self.__spares):
+                    self.__free.append(self.__spares.popleft())
+            elif not self.__closed:
+                if to_free:
+                    self.__free.append(new_worker)
+                else:
+                    self.__spares.append(new_worker)
+                new_worker = None
+            self.__cond.notify_all()
+        if new_worker is not None:
+            new_worker.kill()
+
+    def __wait_for_free(self) -> None:
+        """Waits for a free worker. Call with the condition held."""
+        while len(self.__free) == 0:
+            if (
+                self.__start_error is not None
+                and 0 == len(self.__busy)
+                and 0 == self.__starting_free
+            ):
+                raise self.__start_error
+            self.__cond.wait()
+
+    def peek(self) -> LspWorker:
+        """A worker to use while no candidates are being checked."""
+        with self.__cond:
+            self.__wait_for_free()
+            return self.__free[0]
+
+    def get_stats(self) -> Any:
+        with self.__cond:
+            return {
+                "num_workers": self.num_workers,
+                "free": len(self.__free),
+                "spares": len(self.__spares),
+                "replacements": self.num_replacements,
+            }
+
+    def close(self) -> None:
+        with self.__cond:
+            self.__closed = True
+            while 0 < self.__starting:
+                self.__cond.wait()
+            workers = list(self.__free) + list(self.__spares) + list(self.__busy)
+            self.__free.clear()
+            self.__spares.clear()
+            self.__busy.clear()
+        for worker in workers:
+            worker.kill()
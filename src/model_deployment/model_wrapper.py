@@ -4,6 +4,7 @@ from pathlib import Path
 import yaml
 import ipdb
 import functools
+from dataclasses import dataclass
 
 import sys, os
 import re
@@ -14,10 +15,13 @@ from transformers import (
     PreTrainedTokenizer,
     PreTrainedModel,
     BitsAndBytesConfig,
+    LogitsProcessor,
+    LogitsProcessorList,
 )
 import torch
 
 from util.train_utils import get_required_arg
+from util.util import get_basic_logger
 
 from tactic_gen.lm_example import (
     LmExample,
@@ -27,6 +31,7 @@ from tactic_gen.train_decoder import (
     load_config,
     get_tokenizer,
     get_model,
+    get_cpu_model,
 )
 from tactic_gen.tactic_data import (
     ExampleCollator,
@@ -37,6 +42,14 @@ from tactic_gen.tactic_data import (
     NEWLINE_RESPONSE_TEMPLATE,
 )
 from model_deployment.model_result import ModelResult, filter_recs
+from model_deployment.prefix_cache import (
+    PrefixKVCache,
+    PastKeyValues,
+    expand_past,
+    to_legacy_past,
+)
+
+_logger = get_basic_logger(__name__)
 
 
 class TokenMask(Enum):
@@ -60,11 +73,25 @@ class TokenMask(Enum):
                 raise ValueError(f"Invalid token mask: {s}")
 
 
+def find_id_start_idxs(t: torch.Tensor, s: torch.Tensor) -> torch.Tensor:
+    """
+    Index of the first occurrence of s in each row of t, or -1 if s does
+    not occur in the row. Compares all windows of each row at once.
+    """
+    num_rows, row_len = t.shape
+    if row_len < s.shape[0]:
+        return torch.full((num_rows,), -1, dtype=torch.long, device=t.device)
+    windows = t.unfold(1, s.shape[0], 1)
+    matches = (windows == s.to(t.device)).all(dim=-1)
+    found = matches.any(dim=-1)
+    # argmax returns the first maximal index.
+    first = matches.to(torch.uint8).argmax(dim=-1)
+    return torch.where(found, first, -1)
+
+
 def find_id_start_idx(t: torch.Tensor, s: torch.Tensor) -> Optional[int]:
-    for i in range(t.shape[0] - s.shape[0] + 1):
-        if torch.all(t[i : i + s.shape[0]] == s):
-            return i
-    return None
+    idx = int(find_id_start_idxs(t.unsqueeze(0), s)[0])
+    return None if idx < 0 else idx
 
 
 def get_enclosing_seps(
@@ -99,27 +126,119 @@ def get_enclosing_seps(
             raise ValueError(f"Token masking not supported for {collator}.")
 
 
+def get_sep_ids(
+    collator: ExampleCollator, tokenizer: PreTrainedTokenizer
+) -> dict[str, torch.Tensor]:
+    """Token ids of every separator the token masks of the collator use."""
+    sep_ids: dict[str, torch.Tensor] = {}
+    for token_mask in TokenMask:
+        try:
+            seps = get_enclosing_seps(collator, token_mask)
+        except ValueError:
+            continue
+        for sep in seps:
+            if sep not in sep_ids:
+                sep_ids[sep] = torch.tensor(
+                    tokenizer.encode(sep, add_special_tokens=False)
+                )
+    return sep_ids
+
+
 def transform_attention_mask(
     collator: ExampleCollator,
     tokenizer: PreTrainedTokenizer,
     token_mask: Optional[TokenMask],
     input_ids: torch.Tensor,
     attn_mask: torch.Tensor,
+    sep_ids: Optional[dict[str, torch.Tensor]] = None,
 ) -> torch.Tensor:
     if token_mask is None:
         return attn_mask
     start_str, end_str = get_enclosing_seps(collator, token_mask)
-    start_ids = tokenizer.encode(start_str, add_special_tokens=False)
-    end_ids = tokenizer.encode(end_str, add_special_tokens=False)
+    if sep_ids is None:
+        sep_ids = get_sep_ids(collator, tokenizer)
+    start_idxs = find_id_start_idxs(input_ids, sep_ids[start_str])
+    end_idxs = find_id_start_idxs(input_ids, sep_ids[end_str])
+    assert bool((0 <= start_idxs).all())
+    assert bool((0 <= end_idxs).all())
+    positions = torch.arange(input_ids.shape[1], device=input_ids.device)
+    masked = (start_idxs[:, None] <= positions) & (positions < end_idxs[:, None])
+    return attn_mask.masked_fill(masked, 0)
+
+
+def offsets_attention_mask(
+    offset_mapping: torch.Tensor,
+    attn_mask: torch.Tensor,
+    start_char: int,
+    end_char: int,
+) -> torch.Tensor:
+    """
+    Masks the tokens that start within [start_char, end_char) of the input
+    string. Special tokens have empty offsets and are never masked.
+    """
+    token_starts = offset_mapping[..., 0]
+    token_ends = offset_mapping[..., 1]
+    masked = (
+        (token_starts < token_ends)
+        & (start_char <= token_starts)
+        & (token_starts < end_char)
+    )
+    return attn_mask.masked_fill(masked, 0)
+
+
+class TacticEndProcessor(LogitsProcessor):
+    """
+    Forces the end of each sequence once it has generated a complete Coq
+    sentence, i.e. a period followed by whitespace. Generate marks the
+    sequence finished, so beams and samples stop independently.
+    """
+
+    SENTENCE_END = re.compile(r"\.\s")
+
+    def __init__(self, tokenizer: PreTrainedTokenizer, prompt_num_tokens: int):
+        self.tokenizer = tokenizer
+        self.prompt_num_tokens = prompt_num_tokens
 
-    changed_mask = attn_mask.clone()
-    for i, id_row in enumerate(input_ids):
-        start_idx = find_id_start_idx(id_row, torch.tensor(start_ids))
-        end_idx = find_id_start_idx(id_row, torch.tensor(end_ids))
-        assert start_idx is not None
-        assert end_idx is not None
-        changed_mask[i, start_idx:end_idx] = 0
-    return changed_mask
+    def __call__(
+        self, input_ids: torch.LongTensor, scores: torch.FloatTensor
+    ) -> torch.FloatTensor:
+        generated = input_ids[:, self.prompt_num_tokens :]
+        if generated.shape[1] == 0:
+            return scores
+        # A sentence end is in the last token or spans the last two.
+        last_texts = self.tokenizer.batch_decode(generated[:, -2:])
+        ended = [i for i, t in enumerate(last_texts) if self.SENTENCE_END.search(t)]
+        if 0 < len(ended):
+            scores[ended] = -torch.inf
+            scores[ended, self.tokenizer.eos_token_id] = 0
+        return scores
+
+    @classmethod
+    def trim(cls, tactic: str) -> str:
+        """Drops the text a sequence generated after its first sentence."""
+        match = cls.SENTENCE_END.search(tactic)
+        if match is None:
+            return tactic
+        return tactic[: match.start() + 1]
+
+
+@dataclass
+class RecRequest:
+    example: LmExample
+    n: int
+    current_proof: str
+    beam: bool
+    token_mask_str: Optional[str]
+    theorem: Optional[str] = None
+
+
+def get_prefix_end_sep(collator: ExampleCollator) -> Optional[str]:
+    """Separator after the sections that stay the same during a search."""
+    match collator:
+        case ProofPremiseCollator() | NoScriptCollator():
+            return collator.STATE_SEP
+        case _:
+            return None
 
 
 class DecoderLocalWrapper:
@@ -131,11 +250,28 @@ class DecoderLocalWrapper:
         tokenizer: PreTrainedTokenizer,
         collator: ExampleCollator,
         hard_seq_len: int,
+        prefix_cache: Optional[PrefixKVCache] = None,
     ):
         self.model = model
         self.tokenizer = tokenizer
         self.collator = collator
         self.hard_seq_len = hard_seq_len
+        self.prefix_cache = prefix_cache
+        # Collators that predict one step stop at the end of its sentence.
+        self.stop_at_tactic_end = not collator.whole_proof
+        self.num_decoded_tokens = 0
+        self.prefix_end_ids: Optional[torch.Tensor] = None
+        prefix_end_sep = get_prefix_end_sep(collator)
+        if prefix_end_sep is not None:
+            self.prefix_end_ids = torch.tensor(
+                tokenizer.encode(prefix_end_sep, add_special_tokens=False)
+            )
+        self.sep_ids = get_sep_ids(collator, tokenizer)
+        # Collators that report section offsets let fast tokenizers mask by
+        # character offsets instead of searching for separator ids.
+        self.mask_by_offsets = tokenizer.is_fast and hasattr(
+            collator, "collate_input_with_offsets"
+        )
 
     def get_recs(
         self,
@@ -144,11 +280,34 @@ class DecoderLocalWrapper:
         current_proof: str,
         beam: bool,
         token_mask_str,
+        theorem: Optional[str] = None,
     ) -> ModelResult:
+        request = RecRequest(example, n, current_proof, beam, token_mask_str, theorem)
+        return self.get_recs_batch([request])[0]
+
+    def get_recs_batch(self, requests: list[RecRequest]) -> list[ModelResult]:
+        """
+        Runs one generate call for each group of requests that share n and
+        beam. Prompts are left padded. Each result only covers the tokens
+        its request would have generated on its own.
+        """
+        results: list[Optional[ModelResult]] = [None] * len(requests)
+        groups: dict[tuple[int, bool], list[int]] = {}
+        for i, request in enumerate(requests):
+            groups.setdefault((request.n, request.beam), []).append(i)
+        for (n, beam), idxs in groups.items():
+            group_results = self.__generate([requests[i] for i in idxs], n, beam)
+            for i, result in zip(idxs, group_results):
+                results[i] = result
+        return [r for r in results if r is not None]
+
+    def __tokenize(self, request: RecRequest) -> tuple[torch.Tensor, torch.Tensor]:
         token_mask = None
-        if token_mask_str is not None:
-            token_mask = TokenMask.from_str(token_mask_str)
-        collated_input = self.collator.collate_input(self.tokenizer, example)
+        if request.token_mask_str is not None:
+            token_mask = TokenMask.from_str(request.token_mask_str)
+        if token_mask is not None and self.mask_by_offsets:
+            return self.__tokenize_offsets(request.example, token_mask)
+        collated_input = self.collator.collate_input(self.tokenizer, request.example)
         inputs = self.tokenizer(
             collated_input,
             max_length=self.hard_seq_len,
@@ -161,10 +320,58 @@ class DecoderLocalWrapper:
             token_mask,
             inputs["input_ids"],
             inputs["attention_mask"],
+            self.sep_ids,
+        )
+        return inputs["input_ids"][0], attention_mask[0]
+
+    def __tokenize_offsets(
+        self, example: LmExample, token_mask: TokenMask
+    ) -> tuple[torch.Tensor, torch.Tensor]:
+        start_str, end_str = get_enclosing_seps(self.collator, token_mask)
+        collated_input, offsets = self.collator.collate_input_with_offsets(
+            self.tokenizer, example
+        )
+        inputs = self.tokenizer(
+            collated_input,
+            max_length=self.hard_seq_len,
+            truncation=True,
+            return_tensors="pt",
+            return_offsets_mapping=True,
+        )
+        attention_mask = offsets_attention_mask(
+            inputs["offset_mapping"],
+            inputs["attention_mask"],
+            offsets[start_str],
+            offsets[end_str],
+        )
+        return inputs["input_ids"][0], attention_mask[0]
+
+    def __generate(
+        self, requests: list[RecRequest], n: int, beam: bool
+    ) -> list[ModelResult]:
+        tokenized = [self.__tokenize(r) for r in requests]
+        input_num_tokens = max(len(ids) for ids, _ in tokenized)
+        pad_id = self.tokenizer.pad_token_id
+        if pad_id is None:
+            pad_id = self.tokenizer.eos_token_id
+        input_ids = torch.full((len(requests), input_num_tokens), pad_id)
+        attention_mask = torch.zeros(
+            (len(requests), input_num_tokens), dtype=torch.long
         )
-        with torch.no_grad():
+        for i, (ids, mask) in enumerate(tokenized):
+            input_ids[i, input_num_tokens - len(ids) :] = ids
+            attention_mask[i, input_num_tokens - len(ids) :] = mask
+        past: Optional[PastKeyValues] = None
+        if self.prefix_cache is not None and len(requests) == 1:
+            past = self.__get_prompt_past(requests[0].theorem, *tokenized[0], n)
+        logits_processor = LogitsProcessorList()
+        if self.stop_at_tactic_end:
+            logits_processor.append(
+                TacticEndProcessor(self.tokenizer, input_num_tokens)
+            )
+        with torch.inference_mode():
             outputs = self.model.generate(
-                inputs["input_ids"].cuda(),
+                input_ids.to(self.model.device),
                 max_new_tokens=128,
                 return_dict_in_generate=True,
                 output_scores=True,
@@ -173,32 +380,115 @@ class DecoderLocalWrapper:
                 temperature=None if beam else 1,
                 do_sample=not beam,
                 num_beams=n if beam and 1 < n else None,
-                attention_mask=attention_mask.cuda(),
+                attention_mask=attention_mask.to(self.model.device),
+                pad_token_id=pad_id,
+                past_key_values=past,
+                logits_processor=logits_processor,
             )
-        input_num_tokens = inputs["input_ids"].shape[1]
         generated_seqs = outputs.sequences[:, input_num_tokens:]
-        tactics = self.tokenizer.batch_decode(generated_seqs, skip_special_tokens=True)
-        non_special_tokens = torch.concat(
-            [(generated_seqs != t)[:, :, None] for t in self.tokenizer.all_special_ids],
-            axis=2,
-        ).all(dim=2)
-        lengths = non_special_tokens.sum(axis=1).tolist()
-        if beam and 1 < n:
-            scores = outputs.sequences_scores.tolist()
-            return ModelResult(tactics, scores, lengths)
-        else:
-            with torch.no_grad():
+        self.num_decoded_tokens += generated_seqs.numel()
+        if not (beam and 1 < n):
+            with torch.inference_mode():
                 transition_scores = self.model.compute_transition_scores(
                     generated_seqs, outputs.scores, normalize_logits=True
                 )
+        results: list[ModelResult] = []
+        for i in range(len(requests)):
+            rows = slice(i * n, (i + 1) * n)
+            num_new_tokens = self.__num_new_tokens(generated_seqs[rows])
+            request_seqs = generated_seqs[rows, :num_new_tokens]
+            tactics = self.tokenizer.batch_decode(
+                request_seqs, skip_special_tokens=True
+            )
+            if self.stop_at_tactic_end:
+                tactics = [TacticEndProcessor.trim(t) for t in tactics]
+            non_special_tokens = torch.concat(
+                [
+                    (request_seqs != t)[:, :, None]
+                    for t in self.tokenizer.all_special_ids
+                ],
+                axis=2,
+            ).all(dim=2)
+            lengths = non_special_tokens.sum(axis=1).tolist()
+            if beam and 1 < n:
+                scores = outputs.sequences_scores[rows].tolist()
+            else:
+                request_scores = transition_scores[rows, :num_new_tokens]
                 scores = (
-                    transition_scores.where(
-                        transition_scores != -torch.inf, torch.tensor(0.0)
+                    request_scores.where(
+                        request_scores != -torch.inf, torch.tensor(0.0)
                     )
                     .sum(axis=1)
                     .tolist()
                 )
-                return ModelResult(tactics, scores, lengths)
+            results.append(ModelResult(tactics, scores, lengths))
+        return results
+
+    def __run_prompt(
+        self,
+        input_ids: torch.Tensor,
+        attention_mask: torch.Tensor,
+        position_ids: torch.Tensor,
+        past: Optional[PastKeyValues],
+    ) -> PastKeyValues:
+        with torch.inference_mode():
+            outputs = self.model(
+                input_ids=input_ids[None].to(self.model.device),
+                attention_mask=attention_mask[None].to(self.model.device),
+                position_ids=position_ids[None].to(self.model.device),
+                past_key_values=past,
+                use_cache=True,
+            )
+        return to_legacy_past(outputs.past_key_values)
+
+    def __get_prompt_past(
+        self,
+        theorem: Optional[str],
+        input_ids: torch.Tensor,
+        attention_mask: torch.Tensor,
+        expand_size: int,
+    ) -> Optional[PastKeyValues]:
+        """
+        Past key values of all but the last prompt token, so generate only
+        runs the last one. The prefix before the state is cached.
+        """
+        assert self.prefix_cache is not None
+        if self.prefix_end_ids is None:
+            return None
+        prefix_len = find_id_start_idx(input_ids, self.prefix_end_ids)
+        num_tokens = len(input_ids)
+        if prefix_len is None or prefix_len == 0 or num_tokens - 1 < prefix_len:
+            return None
+        # The positions generate computes from the attention mask.
+        position_ids = attention_mask.cumsum(-1) - 1
+        position_ids.masked_fill_(attention_mask == 0, 1)
+
+        key = PrefixKVCache.get_key(input_ids[:prefix_len], attention_mask[:prefix_len])
+        past = self.prefix_cache.get(key)
+        self.prefix_cache.record(theorem, past is not None, prefix_len, num_tokens)
+        if past is None:
+            past = self.__run_prompt(
+                input_ids[:prefix_len],
+                attention_mask[:prefix_len],
+                position_ids[:prefix_len],
+                None,
+            )
+            self.prefix_cache.put(key, past)
+        if prefix_len < num_tokens - 1:
+            past = self.__run_prompt(
+                input_ids[prefix_len:-1],
+                attention_mask[:-1],
+                position_ids[prefix_len:-1],
+                past,
+            )
+        return expand_past(past, expand_size)
+
+    def __num_new_tokens(self, seqs: torch.Tensor) -> int:
+        """Tokens generate would have produced for only these sequences."""
+        is_eos = seqs == self.tokenizer.eos_token_id
+        if not is_eos.any(dim=1).all():
+            return seqs.shape[1]
+        return int(is_eos.int().argmax(dim=1).max()) + 1
 
     @classmethod
     def get_training_conf(cls, checkpoint_loc: Path) -> Any:
@@ -208,7 +498,12 @@ class DecoderLocalWrapper:
         return training_conf
 
     @classmethod
-    def from_checkpoint(cls, checkpoint_loc: Path) -> DecoderLocalWrapper:
+    def from_checkpoint(
+        cls,
+        checkpoint_loc: Path,
+        prefix_cache_mb: int = 0,
+        model_loader: Callable[[str], PreTrainedModel] = get_model,
+    ) -> DecoderLocalWrapper:
         training_conf = cls.get_training_conf(checkpoint_loc)
         hard_seq_length = get_required_arg("hard_seq_len", training_conf)
         example_collator_conf = example_collator_conf_from_yaml(
@@ -218,13 +513,55 @@ class DecoderLocalWrapper:
         tokenizer = get_tokenizer(
             get_required_arg("model_name", training_conf), add_eos=False
         )
-        model = get_model(str(checkpoint_loc.resolve()))
-        return cls(model, tokenizer, example_collator, hard_seq_length)
+        model = model_loader(str(checkpoint_loc.resolve()))
+        prefix_cache = None
+        if 0 < prefix_cache_mb:
+            prefix_cache = PrefixKVCache(prefix_cache_mb * 2**20)
+        return cls(model, tokenizer, example_collator, hard_seq_length, prefix_cache)
+
+    @classmethod
+    def from_conf(cls, json_data: Any) -> DecoderLocalWrapper:
+        name = json_data["checkpoint_loc"]
+        return cls.from_checkpoint(Path(name), json_data.get("prefix_cache_mb", 0))
+
+
+class DecoderCPUWrapper(DecoderLocalWrapper):
+    """
+    Runs the fine-tuned checkpoint on cpu with merged LoRA weights and
+    optional dynamic int8 quantization of its linear layers.
+    """
+
+    ALIAS = "decoder-cpu"
+
+    @classmethod
+    def from_checkpoint(
+        cls,
+        checkpoint_loc: Path,
+        prefix_cache_mb: int = 0,
+        num_threads: Optional[int] = None,
+        quantize: bool = True,
+    ) -> DecoderLocalWrapper:
+        if num_threads is not None:
+            torch.set_num_threads(num_threads)
+        _logger.info(
+            f"Loading cpu model with {torch.get_num_threads()} threads; "
+            f"quantize={quantize}"
+        )
+        return super().from_checkpoint(
+            checkpoint_loc,
+            prefix_cache_mb,
+            functools.partial(get_cpu_model, quantize=quantize),
+        )
 
     @classmethod
     def from_conf(cls, json_data: Any) -> DecoderLocalWrapper:
         name = json_data["checkpoint_loc"]
-        return cls.from_checkpoint(Path(name))
+        return cls.from_checkpoint(
+            Path(name),
+            json_data.get("prefix_cache_mb", 0),
+            json_data.get("num_threads", None),
+            json_data.get("quantize", True),
+        )
 
 
 class StubWrapper:
@@ -235,9 +572,13 @@ class StubWrapper:
         current_proof: str,
         beam: bool,
         token_mask: Optional[str],
+        theorem: Optional[str] = None,
     ) -> ModelResult:
         return ModelResult([], [], [])
 
+    def get_recs_batch(self, requests: list[RecRequest]) -> list[ModelResult]:
+        return [ModelResult([], [], []) for _ in requests]
+
 
 ModelWrapper = DecoderLocalWrapper | StubWrapper
 
@@ -251,6 +592,8 @@ def wrapper_from_conf(conf: Any) -> ModelWrapper:
     match attempted_alias:
         case DecoderLocalWrapper.ALIAS:
             return DecoderLocalWrapper.from_conf(conf)
+        case DecoderCPUWrapper.ALIAS:
+            return DecoderCPUWrapper.from_conf(conf)
         case _:
             raise WrapperNotFoundError(
                 f"Could not find model wrapper: {attempted_alias}"
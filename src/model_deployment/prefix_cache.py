@@ -0,0 +1,129 @@
+from __future__ import annotations
+from typing import Any, Optional
+
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import torch
+
+from util.util import get_basic_logger
+
+_logger = get_basic_logger(__name__)
+
+PastKeyValues = tuple[tuple[torch.Tensor, ...], ...]
+
+
+def past_num_bytes(past: PastKeyValues) -> int:
+    return sum(t.numel() * t.element_size() for layer in past for t in layer)
+
+
+def to_legacy_past(past: Any) -> PastKeyValues:
+    # Newer versions of transformers return Cache objects.
+    if hasattr(past, "to_legacy_cache"):
+        return past.to_legacy_cache()
+    return past
+
+
+def expand_past(past: PastKeyValues, expand_size: int) -> PastKeyValues:
+    """Repeats every sequence of past like generate repeats its inputs."""
+    if expand_size == 1:
+        return past
+    return tuple(
+        tuple(t.repeat_interleave(expand_size, dim=0) for t in layer) for layer in past
+    )
+
+
+@dataclass
+class PrefixStats:
+    lookups: int = 0
+    hits: int = 0
+    reused_tokens: int = 0
+    prompt_tokens: int = 0
+
+    def to_json(self) -> Any:
+        return {
+            "lookups": self.lookups,
+            "hits": self.hits,
+            "hit_rate": self.hits / max(1, self.lookups),
+            "reused_tokens": self.reused_tokens,
+            "prompt_tokens": self.prompt_tokens,
+            "reused_token_rate": self.reused_tokens / max(1, self.prompt_tokens),
+        }
+
+
+class PrefixKVCache:
+    """
+    Least recently used past key values of prompt prefixes, keyed by the
+    token ids and attention mask of the prefix. Bounded by the bytes of the
+    cached tensors. Keeps hit statistics for the most recent theorems.
+    """
+
+    MAX_THEOREMS = 1000
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.__cache: OrderedDict[bytes, tuple[PastKeyValues, int]] = OrderedDict()
+        self.num_bytes = 0
+        self.evictions = 0
+        self.total = PrefixStats()
+        self.theorem_stats: OrderedDict[str, PrefixStats] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.__cache)
+
+    @staticmethod
+    def get_key(input_ids: torch.Tensor, attention_mask: torch.Tensor) -> bytes:
+        return (
+            input_ids.cpu().numpy().tobytes()
+            + b"|"
+            + attention_mask.cpu().numpy().tobytes()
+        )
+
+    def get(self, key: bytes) -> Optional[PastKeyValues]:
+        if key not in self.__cache:
+            return None
+        self.__cache.move_to_end(key)
+        return self.__cache[key][0]
+
+    def put(self, key: bytes, past: PastKeyValues) -> None:
+        num_bytes = past_num_bytes(past)
+        if self.max_bytes < num_bytes:
+            return
+        if key in self.__cache:
+            self.num_bytes -= self.__cache.pop(key)[1]
+        self.__cache[key] = (past, num_bytes)
+        self.num_bytes += num_bytes
+        while self.max_bytes < self.num_bytes:
+            _, (_, evicted_bytes) = self.__cache.popitem(last=False)
+            self.num_bytes -= evicted_bytes
+            self.evictions += 1
+
+    def record(
+        self,
+        theorem: Optional[str],
+        hit: bool,
+        prefix_tokens: int,
+        prompt_tokens: int,
+    ) -> None:
+        stats = [self.total]
+        if theorem is not None:
+            if theorem not in self.theorem_stats:
+                self.theorem_stats[theorem] = PrefixStats()
+                if self.MAX_THEOREMS < len(self.theorem_stats):
+                    self.theorem_stats.popitem(last=False)
+            self.theorem_stats.move_to_end(theorem)
+            stats.append(self.theorem_stats[theorem])
+        for s in stats:
+            s.lookups += 1
+            s.hits += int(hit)
+            s.reused_tokens += prefix_tokens if hit else 0
+            s.prompt_tokens += prompt_tokens
+
+    def get_stats(self, theorem: Optional[str] = None) -> Any:
+        if theorem is not None:
+            return self.theorem_stats.get(theorem, PrefixStats()).to_json()
+        return self.total.to_json() | {
+            "num_entries": len(self),
+            "num_bytes": self.num_bytes,
+            "evictions": self.evictions,
+        }
@@ -0,0 +1,136 @@
+from __future__ import annotations
+from typing import Any, Generic, Optional, TypeVar
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+T = TypeVar("T")
+
+
+def normalize_proof(s: str) -> str:
+    return " ".join(s.split())
+
+
+@dataclass
+class TrieNode:
+    children: dict[str, TrieNode] = field(default_factory=dict)
+    count: int = 0
+    num_rejecting: int = 0
+
+
+@dataclass
+class CacheStats:
+    lookups: int = 0
+    hits: int = 0
+    prefix_rejections: int = 0
+
+    def to_json(self) -> Any:
+        return {
+            "lookups": self.lookups,
+            "hits": self.hits,
+            "prefix_rejections": self.prefix_rejections,
+            "hit_rate": (self.hits + self.prefix_rejections) / max(1, self.lookups),
+        }
+
+
+class ProofCheckCache(Generic[T]):
+    """
+    Least recently used check results keyed by the normalized partial
+    proof. The sentences of cached proofs form a trie. A proof that extends
+    a proof with an error at a sentence boundary has the same error, so
+    lookups report the longest such prefix.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self.stats = CacheStats()
+        self.__entries: OrderedDict[str, tuple[T, list[str], bool]] = OrderedDict()
+        self.__root = TrieNode()
+        self.__lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def get(self, key: str) -> Optional[T]:
+        with self.__lock:
+            self.stats.lookups += 1
+            if key in self.__entries:
+                self.__entries.move_to_end(key)
+                self.stats.hits += 1
+                return self.__entries[key][0]
+            return None
+
+    def get_rejecting_prefix(self, key: str) -> Optional[list[str]]:
+        """Sentences of the longest cached proof with an error that key extends."""
+        with self.__lock:
+            node = self.__root
+            sentences: list[str] = []
+            rejecting: Optional[list[str]] = None
+            pos = 0
+            while pos < len(key):
+                child = self.__next_child(node, key, pos)
+                if child is None:
+                    break
+                sentence, node = child
+                sentences.append(sentence)
+                pos += len(sentence) + 1
+                if 0 < node.num_rejecting:
+                    rejecting = sentences.copy()
+            if rejecting is not None:
+                self.stats.prefix_rejections += 1
+            return rejecting
+
+    @staticmethod
+    def __next_child(
+        node: TrieNode, key: str, pos: int
+    ) -> Optional[tuple[str, TrieNode]]:
+        # Normalized sentences are separated by single spaces.
+        end = key.find(" ", pos)
+        while True:
+            sentence = key[pos:] if end < 0 else key[pos:end]
+            if sentence in node.children:
+                return sentence, node.children[sentence]
+            if end < 0:
+                return None
+            end = key.find(" ", end + 1)
+
+    def put(self, key: str, value: T, sentences: list[str], rejects: bool) -> None:
+        """
+        Caches value for key. sentences are the normalized sentences of
+        key. If rejects is set, every extension of key is rejected.
+        """
+        if self.max_entries <= 0:
+            return
+        with self.__lock:
+            if key in self.__entries:
+                self.__entries.move_to_end(key)
+                return
+            # An unfinished last sentence may still become valid.
+            rejects = rejects and 0 < len(sentences) and sentences[-1].endswith(".")
+            self.__entries[key] = (value, sentences, rejects)
+            node = self.__root
+            for sentence in sentences:
+                node = node.children.setdefault(sentence, TrieNode())
+                node.count += 1
+            node.num_rejecting += int(rejects)
+            while self.max_entries < len(self.__entries):
+                _, (_, evicted_sentences, evicted_rejects) = self.__entries.popitem(
+                    last=False
+                )
+                self.__remove_path(evicted_sentences, evicted_rejects)
+
+    def __remove_path(self, sentences: list[str], rejects: bool) -> None:
+        node = self.__root
+        for sentence in sentences:
+            child = node.children[sentence]
+            child.count -= 1
+            if child.count == 0:
+                del node.children[sentence]
+                return
+            node = child
+        node.num_rejecting -= int(rejects)
+
+    def get_stats(self) -> Any:
+        with self.__lock:
+            return self.stats.to_json() | {"num_entries": len(self.__entries)}
@@ -4,6 +4,7 @@ from types import TracebackType
 
 import os
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from dataclasses import dataclass
 
@@ -29,7 +30,13 @@ from tactic_gen.lm_example import (
     LmFormatter,
 )
 
-from model_deployment.fast_client import FastLspClient, ClientWrapper
+from model_deployment.fast_client import (
+    FastLspClient,
+    ClientWrapper,
+    offset_to_position,
+)
+from model_deployment.lsp_pool import LspWorker, LspWorkerPool
+from model_deployment.proof_check_cache import ProofCheckCache, normalize_proof
 from util.constants import RANGO_LOGGER
 
 from coqpyt.coq.lsp.client import (
@@ -64,9 +71,12 @@ class ProofCheckResult:
     current_goals: Optional[list[Goal]]
     new_proof: Optional[Proof]
     steps: Optional[list[CStep]]
+    has_error: bool = False
 
     @classmethod
-    def get_invalid(cls, attempted_steps: list[str]) -> ProofCheckResult:
+    def get_invalid(
+        cls, attempted_steps: list[str], has_error: bool = False
+    ) -> ProofCheckResult:
         current_goals = None
         new_dataset_file = None
         return cls(
@@ -75,6 +85,7 @@ class ProofCheckResult:
             current_goals,
             new_dataset_file,
             None,
+            has_error,
         )
 
 
@@ -97,6 +108,8 @@ class ProofManager:
         workspace_loc: Path,
         sentence_db: SentenceDB,
         data_loc: Path,
+        num_workers: int = 1,
+        check_cache_size: int = 4096,
     ) -> None:
         self.same_file_proofs = same_file_proofs
         self.file_context = file_context
@@ -105,34 +118,32 @@ class ProofManager:
         self.workspace_loc = workspace_loc
         self.sentence_db = sentence_db
         self.data_loc = data_loc
+        self.num_workers = num_workers
+        self.check_cache: ProofCheckCache[ProofCheckResult] = ProofCheckCache(
+            check_cache_size
+        )
+        self.__file_prefix = "".join([s.text for s in proof_info.prefix_steps])
         self.__start_clients()
 
-    def __make_empty(self, p: Path):
-        with open(p, "w") as fout:
-            pass
-
     def __start_clients(self) -> None:
         if not self.SEARCH_DIR.exists():
             os.makedirs(self.SEARCH_DIR)
-        self.fast_aux_file_path = get_fresh_path(
-            self.file_loc.parent, "aux_" + str(self.file_loc.name)
-        ).resolve()
-        self.__make_empty(self.fast_aux_file_path)
-        self.fast_aux_client = FastLspClient(self.workspace_uri, timeout=600)
-        fast_aux_file_uri = f"file://{self.fast_aux_file_path}"
-        self.fast_client = ClientWrapper(self.fast_aux_client, fast_aux_file_uri)
-
-    def __restart_clients(self) -> None:
-        if os.path.exists(self.fast_aux_file_path):
-            os.remove(self.fast_aux_file_path)
-        # self.fast_aux_client.shutdown()
-        # self.fast_aux_client.exit()
-        self.fast_aux_client.kill()
-        self.__start_clients()
+        # A spare only pays off when several workers check at once.
+        num_spares = 1 if 1 < self.num_workers else 0
+        self.pool = LspWorkerPool(self.__make_worker, self.num_workers, num_spares)
+        self.executor = ThreadPoolExecutor(self.num_workers)
+
+    def __make_worker(self) -> LspWorker:
+        return LspWorker(self.workspace_uri, self.file_loc, self.file_prefix, 600)
+
+    @property
+    def fast_client(self) -> ClientWrapper:
+        """Client of a free worker. Only use it while no checks are running."""
+        return self.pool.peek().wrapper
 
     @property
     def file_prefix(self) -> str:
-        return "".join([s.text for s in self.proof_info.prefix_steps])
+        return self.__file_prefix
 
     @property
     def workspace_uri(self) -> str:
@@ -216,31 +227,13 @@ class ProofManager:
             self.same_file_proofs + [new_proof],
         )
 
-    def check_valid(self, client: FastLspClient) -> bool:
-        for diagnostic in client.lsp_endpoint.diagnostics[self.fast_client.file_uri]:
+    def check_valid(self, client: ClientWrapper) -> bool:
+        for diagnostic in client.client.lsp_endpoint.diagnostics[client.file_uri]:
             if diagnostic.severity == 1:
                 print(diagnostic.message)
                 return False
         return True
 
-    def gather_steps(self, steps: list[CStep]) -> tuple[list[CStep], list[CStep]]:
-        agg_str = ""
-        cur_idx = 0
-        for s in steps:
-            agg_str += s.text
-            if not self.file_prefix.startswith(agg_str):
-                break
-            cur_idx += 1
-        prefix_steps = steps[:cur_idx]
-        new_steps = steps[cur_idx:]
-        parsed_prefix = "".join([s.text for s in prefix_steps])
-        if parsed_prefix != self.file_prefix:
-            _logger.error(
-                f"INCOMPATIBLE STEPS; NEW LEN: {len(prefix_steps)}; OLD_LEN: {len(self.proof_info.prefix_steps)}"
-            )
-        assert parsed_prefix == self.file_prefix
-        return prefix_steps, new_steps
-
     def check_proof(
         self,
         partial_proof: str,
@@ -259,73 +252,133 @@ class ProofManager:
             or ("Abort." in partial_proof)
         ):
             return ProofCheckResult.get_invalid([])
-        contents = f"{self.file_prefix}{partial_proof}"
+        key = normalize_proof(partial_proof)
+        if not initial_proof:
+            cached_result = self.check_cache.get(key)
+            if cached_result is not None:
+                return cached_result
+            rejecting_prefix = self.check_cache.get_rejecting_prefix(key)
+            if rejecting_prefix is not None:
+                return ProofCheckResult.get_invalid(rejecting_prefix, has_error=True)
+        worker = self.pool.acquire(f"{self.file_prefix}{partial_proof}")
         try:
-            steps = self.fast_client.write_and_get_steps(contents)
+            result, worker_failed = self.__check_proof_with(
+                worker.wrapper, partial_proof, theorem, initial_proof
+            )
+        except BaseException:
+            self.pool.release(worker)
+            raise
+        if worker_failed:
+            self.pool.replace(worker)
+            return result
+        self.pool.release(worker)
+        if not initial_proof:
+            sentences = [normalize_proof(s) for s in result.attempted_steps]
+            self.check_cache.put(key, result, sentences, result.has_error)
+        return result
+
+    def get_check_stats(self) -> Any:
+        return {
+            "cache": self.check_cache.get_stats(),
+            "workers": self.pool.get_stats(),
+        }
+
+    def check_proofs(
+        self, partial_proofs: list[str], theorem: dataset_file.Term
+    ) -> list[ProofCheckResult]:
+        """Checks independent partial proofs on all free workers at once."""
+        if self.num_workers == 1 or len(partial_proofs) <= 1:
+            return [self.check_proof(p, theorem) for p in partial_proofs]
+        return list(
+            self.executor.map(lambda p: self.check_proof(p, theorem), partial_proofs)
+        )
+
+    def __check_proof_with(
+        self,
+        client: ClientWrapper,
+        partial_proof: str,
+        theorem: dataset_file.Term,
+        initial_proof: bool,
+    ) -> tuple[ProofCheckResult, bool]:
+        """
+        Checks the proof with the client of one worker. Also returns whether
+        the worker failed and should be replaced.
+        """
+        file_prefix = self.file_prefix
+        contents = f"{file_prefix}{partial_proof}"
+        try:
+            new_steps = client.write_and_get_steps(contents, len(file_prefix))
         except ResponseError as e:
             _logger.warning(f"Got repsonse error on proof: {partial_proof[-30:]}")
-            self.__restart_clients()
-            return ProofCheckResult.get_invalid([])
+            return ProofCheckResult.get_invalid([]), True
         except TimeoutError as t:
             _logger.warning(f"Got timeout error on proof: {partial_proof[-30:]}")
-            self.__restart_clients()
-            return ProofCheckResult.get_invalid([])
+            return ProofCheckResult.get_invalid([]), True
 
-        if not self.check_valid(self.fast_client.client):
-            return ProofCheckResult.get_invalid([s.text for s in steps])
+        if not self.check_valid(client):
+            attempted_steps = [s.text for s in new_steps]
+            return ProofCheckResult.get_invalid(attempted_steps, has_error=True), False
 
-        if 0 < len(partial_proof) and "Qed." in steps[-1].text:
-            steps = steps[:-1]  # We detect qed ourselves.
+        if 0 < len(new_steps) and "Qed." in new_steps[-1].text:
+            new_steps = new_steps[:-1]  # We detect qed ourselves.
 
-        prefix_steps, new_steps = self.gather_steps(steps)
         new_step_strs = [s.text for s in new_steps]
 
-        farther_end = steps[-1].ast.range.end
+        if 0 < len(new_steps):
+            farther_end = new_steps[-1].ast.range.end
+        else:
+            # The prefix ends where its last step ends.
+            farther_end = offset_to_position(file_prefix, len(file_prefix))
         try:
-            current_goals = self.fast_client.client.proof_goals(
-                TextDocumentIdentifier(self.fast_client.file_uri), farther_end
+            current_goals = client.client.proof_goals(
+                TextDocumentIdentifier(client.file_uri), farther_end
             )
         except ResponseError as e:
             _logger.warning(f"Got repsonse error on proof: {partial_proof[-10:]}")
-            self.__restart_clients()
-            return ProofCheckResult.get_invalid(new_step_strs)
+            return ProofCheckResult.get_invalid(new_step_strs), True
         except TimeoutError as t:
             _logger.warning(f"Got timeout error on proof: {partial_proof[-10:]}")
-            self.__restart_clients()
-            return ProofCheckResult.get_invalid(new_step_strs)
-        # self.fast_client.client.lsp_endpoint.timeout = 5
+            return ProofCheckResult.get_invalid(new_step_strs), True
 
         if current_goals is None:
-            return ProofCheckResult.get_invalid(new_step_strs)
+            return ProofCheckResult.get_invalid(new_step_strs), False
         if current_goals.goals is None:
-            return ProofCheckResult.get_invalid(new_step_strs)
+            return ProofCheckResult.get_invalid(new_step_strs), False
 
         if initial_proof:
             self.first_goals = current_goals
 
         if self.__can_close_proof(current_goals):
-            must_be_valid = "".join([s.text for s in steps]) + "\nQed."
-            steps = self.fast_client.write_and_get_steps(must_be_valid)
-            if not self.check_valid(self.fast_client.client):
-                return ProofCheckResult.get_invalid(new_step_strs)
+            must_be_valid = file_prefix + "".join(new_step_strs) + "\nQed."
+            steps = self.proof_info.prefix_steps + (
+                client.write_and_get_steps(must_be_valid, len(file_prefix))
+            )
+            if not self.check_valid(client):
+                return ProofCheckResult.get_invalid(new_step_strs), False
             new_proof = self.get_proof_shell(
                 new_step_strs, current_goals, theorem, complete=True
             )
-            return ProofCheckResult(
-                TacticResult.COMPLETE,
-                new_step_strs,
-                get_all_goals(current_goals),
-                new_proof,
-                steps,
+            return (
+                ProofCheckResult(
+                    TacticResult.COMPLETE,
+                    new_step_strs,
+                    get_all_goals(current_goals),
+                    new_proof,
+                    steps,
+                ),
+                False,
             )
 
         new_proof = self.get_proof_shell(new_step_strs, current_goals, theorem)
-        return ProofCheckResult(
-            TacticResult.VALID,
-            new_step_strs,
-            get_all_goals(current_goals),
-            new_proof,
-            None,
+        return (
+            ProofCheckResult(
+                TacticResult.VALID,
+                new_step_strs,
+                get_all_goals(current_goals),
+                new_proof,
+                None,
+            ),
+            False,
         )
 
     def get_example(
@@ -360,8 +413,5 @@ class ProofManager:
         # if os.path.exists(self.aux_file_path):
         #     os.remove(self.aux_file_path)
         # self.aux_client.close()
-        if os.path.exists(self.fast_aux_file_path):
-            os.remove(self.fast_aux_file_path)
-        self.fast_aux_client.kill()
-        # self.fast_aux_client.shutdown()
-        # self.fast_aux_client.exit()
+        self.executor.shutdown()
+        self.pool.close()
@@ -27,6 +27,7 @@ from model_deployment.searcher import (
     FailedSearch,
     SearchResult,
     searcher_from_conf,
+    get_num_proof_workers,
 )
 from model_deployment.tactic_gen_client import TacticGenClient
 
@@ -120,6 +121,7 @@ def run_proof(conf: RunProofConf) -> SuccessfulSearch | FailedSearch:
         conf.loc.workspace_loc,
         conf.loc.sentence_db,
         conf.loc.data_loc,
+        get_num_proof_workers(conf.search_conf),
     ) as proof_manager:
         tree_manager = searcher_from_conf(
             conf.search_conf, conf.tactic_gens, proof_manager
@@ -128,6 +130,7 @@ def run_proof(conf: RunProofConf) -> SuccessfulSearch | FailedSearch:
         result = tree_manager.search(
             print_proofs=conf.print_proofs, print_trees=conf.print_trees
         )
+        print("Proof checks:", proof_manager.get_check_stats())
         return result
 
 
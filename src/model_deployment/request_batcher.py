@@ -0,0 +1,101 @@
+from __future__ import annotations
+from typing import Any, Callable, Generic, TypeVar
+
+import time
+import queue
+import threading
+from collections import Counter
+from concurrent.futures import Future
+
+from util.util import get_basic_logger
+
+_logger = get_basic_logger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class RequestBatcher(Generic[T, R]):
+    """
+    Gathers requests submitted from concurrent threads into batches for a
+    single worker thread. A batch closes when it has max_batch_size
+    requests or max_wait seconds after its first request arrived.
+    run_batch must return one result per request, in order.
+    """
+
+    LOG_EVERY = 100
+
+    def __init__(
+        self,
+        run_batch: Callable[[list[T]], list[R]],
+        max_batch_size: int,
+        max_wait: float,
+    ) -> None:
+        assert 0 < max_batch_size
+        self.run_batch = run_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.__queue: queue.Queue[tuple[T, Future[R], float]] = queue.Queue()
+        self.__stats_lock = threading.Lock()
+        self.batch_sizes: Counter[int] = Counter()
+        self.total_wait = 0.0
+        self.max_seen_wait = 0.0
+        self.__worker = threading.Thread(target=self.__work, daemon=True)
+        self.__worker.start()
+
+    def submit(self, request: T) -> R:
+        """Blocks until the batch holding request has run."""
+        future: Future[R] = Future()
+        self.__queue.put((request, future, time.time()))
+        return future.result()
+
+    def __gather(self) -> list[tuple[T, Future[R], float]]:
+        batch = [self.__queue.get()]
+        deadline = time.time() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.time()
+            try:
+                if remaining <= 0:
+                    batch.append(self.__queue.get_nowait())
+                else:
+                    batch.append(self.__queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def __work(self) -> None:
+        while True:
+            batch = self.__gather()
+            start = time.time()
+            self.__record(len(batch), [start - t for _, _, t in batch])
+            try:
+                results = self.run_batch([r for r, _, _ in batch])
+                assert len(results) == len(batch)
+            except Exception as e:
+                for _, future, _ in batch:
+                    future.set_exception(e)
+                continue
+            for (_, future, _), result in zip(batch, results):
+                future.set_result(result)
+
+    def __record(self, batch_size: int, waits: list[float]) -> None:
+        with self.__stats_lock:
+            self.batch_sizes[batch_size] += 1
+            self.total_wait += sum(waits)
+            self.max_seen_wait = max(self.max_seen_wait, *waits)
+            num_batches = self.batch_sizes.total()
+        if num_batches % self.LOG_EVERY == 0:
+            _logger.info(f"Batching stats: {self.get_stats()}")
+
+    def get_stats(self) -> dict[str, Any]:
+        with self.__stats_lock:
+            num_batches = self.batch_sizes.total()
+            num_requests = sum(s * c for s, c in self.batch_sizes.items())
+            return {
+                "num_batches": num_batches,
+                "num_requests": num_requests,
+                "mean_batch_size": num_requests / max(1, num_batches),
+                "batch_sizes": {str(s): c for s, c in sorted(self.batch_sizes.items())},
+                "mean_queue_wait": self.total_wait / max(1, num_requests),
+                "max_queue_wait": self.max_seen_wait,
+            }
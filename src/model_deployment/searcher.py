@@ -43,6 +43,14 @@ def searcher_conf_from_yaml(yaml_data: Any) -> SearcherConf:
             raise ValueError("Searcher not found.")
 
 
+def get_num_proof_workers(conf: SearcherConf) -> int:
+    match conf:
+        case ClassicalSearchConf() | WholeProofSearcherConf():
+            return conf.num_proof_workers
+        case _:
+            return 1
+
+
 def searcher_from_conf(
     conf: SearcherConf, tactic_gens: list[TacticGenClient], manager: ProofManager
 ) -> Searcher:
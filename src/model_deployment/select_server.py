@@ -49,6 +49,17 @@ def get_scores(
     return wrapper.get_premise_scores(context, idx_premises, other_premises)
 
 
+@dispatcher.add_method
+def get_top_k(
+    context: str, idx_premises: list[int], other_premises_json: list[Any], k: int
+) -> list[tuple[int, float]]:
+    assert wrapper is not None
+    other_premises = [
+        Sentence.from_json(o, wrapper.sentence_db) for o in other_premises_json
+    ]
+    return wrapper.get_top_premises(context, idx_premises, other_premises, k)
+
+
 @Request.application
 def application(request: requests.models.Response):
     response = JSONRPCResponseManager.handle(request.data, dispatcher)
@@ -73,6 +73,12 @@ class DecoderTacticGenConf:
     ALIAS = "decoder"
     checkpoint_loc: Path
     formatter_confs: Optional[list[FormatterConf]]
+    max_batch_size: int = 1
+    max_batch_wait_ms: float = 5
+    prefix_cache_mb: int = 0
+    cpu: bool = False
+    num_threads: Optional[int] = None
+    quantize: bool = True
 
     @classmethod
     def from_yaml(cls, yaml_data: Any) -> DecoderTacticGenConf:
@@ -84,6 +90,12 @@ class DecoderTacticGenConf:
         return cls(
             Path(yaml_data["checkpoint_loc"]),
             formatter_confs,
+            yaml_data.get("max_batch_size", 1),
+            yaml_data.get("max_batch_wait_ms", 5),
+            yaml_data.get("prefix_cache_mb", 0),
+            yaml_data.get("cpu", False),
+            yaml_data.get("num_threads", None),
+            yaml_data.get("quantize", True),
         )
 
 
@@ -151,7 +163,7 @@ class ModelFreeTacticGenClient:
     def get_recs(
         self, step_idx: int, proof: Proof, dset_file: DatasetFile, n: int, **kwargs: Any
     ) -> ModelResult:
-        similar_proof_steps = self.retriever.get_similar_proof_steps(
+        similar_proof_steps = self.retriever.iter_similar_proof_steps(
             step_idx, proof, dset_file, training=False
         )
         similar_tactics: list[str] = []
@@ -196,7 +208,7 @@ class PrevProofTacticGenClient:
     def get_recs(
         self, step_idx: int, proof: Proof, dset_file: DatasetFile, n: int, **kwargs: Any
     ) -> ModelResult:
-        similar_proof_steps = self.retriever.get_similar_proof_steps(
+        similar_proof_steps = self.retriever.iter_similar_proof_steps(
             step_idx, proof, dset_file, training=False
         )
         similar_proofs: set[str] = set()
@@ -427,6 +439,7 @@ class LocalTacticGenClient:
                 proof.proof_text_to_string(include_theorem=False),
                 beam,
                 token_mask,
+                proof.theorem.term.text,
             ],
             "jsonrpc": "2.0",
             "id": request_id,
@@ -19,14 +19,23 @@ import requests
 from jsonrpc import JSONRPCResponseManager, dispatcher
 
 from tactic_gen.lm_example import LmExample
-from model_deployment.model_wrapper import ModelWrapper, StubWrapper, wrapper_from_conf
+from model_deployment.model_wrapper import (
+    ModelWrapper,
+    StubWrapper,
+    DecoderLocalWrapper,
+    RecRequest,
+    wrapper_from_conf,
+)
 from model_deployment.model_result import ModelResult
+from model_deployment.request_batcher import RequestBatcher
+from model_deployment.prefix_cache import PrefixKVCache
 
 from model_deployment.conf_utils import get_ip, get_free_port
 
 from transformers.trainer_utils import set_seed
 
 wrapper: ModelWrapper = StubWrapper()
+batcher: Optional[RequestBatcher[RecRequest, ModelResult]] = None
 
 
 @dispatcher.add_method
@@ -36,19 +45,42 @@ def get_recs(
     current_proof: str,
     beam: bool,
     token_mask: Optional[str],
+    theorem: Optional[str] = None,
 ) -> ModelResult:
     example = LmExample.from_json(example_json)
     start = time.time()
-    result = wrapper.get_recs(example, n, current_proof, beam, token_mask).to_json()
+    if batcher is not None:
+        request = RecRequest(example, n, current_proof, beam, token_mask, theorem)
+        result = batcher.submit(request).to_json()
+    else:
+        result = wrapper.get_recs(
+            example, n, current_proof, beam, token_mask, theorem
+        ).to_json()
     end = time.time()
     return result
 
 
+@dispatcher.add_method
+def get_batch_stats() -> Optional[dict[str, Any]]:
+    if batcher is None:
+        return None
+    return batcher.get_stats()
+
+
 @dispatcher.add_method
 def set_model_seed(seed: int) -> None:
     set_seed(seed)
 
 
+@dispatcher.add_method
+def get_prefix_cache_stats(theorem: Optional[str] = None) -> Optional[dict[str, Any]]:
+    match wrapper:
+        case DecoderLocalWrapper(prefix_cache=PrefixKVCache() as prefix_cache):
+            return prefix_cache.get_stats(theorem)
+        case _:
+            return None
+
+
 @Request.application
 def application(request: requests.models.Response):
     response = JSONRPCResponseManager.handle(request.data, dispatcher)
@@ -63,14 +95,50 @@ if __name__ == "__main__":
     parser.add_argument("checkpoint_loc", help="Checkpoint of the model wrapper")
     parser.add_argument("id", type=int, help="Id of model.")
     parser.add_argument("pid", type=int, help="Id of the parent process.")
+    parser.add_argument(
+        "--max_batch_size",
+        type=int,
+        default=1,
+        help="Batch concurrent requests into one generate call if more than 1.",
+    )
+    parser.add_argument(
+        "--max_batch_wait_ms",
+        type=float,
+        default=5,
+        help="How long a batch waits for more requests after its first one.",
+    )
+    parser.add_argument(
+        "--prefix_cache_mb",
+        type=int,
+        default=0,
+        help="Memory for past key values of prompt prefixes. 0 turns it off.",
+    )
+    parser.add_argument(
+        "--num_threads",
+        type=int,
+        default=None,
+        help="Torch threads of cpu wrappers. Defaults to torch's choice.",
+    )
+    parser.add_argument(
+        "--no_quantize",
+        action="store_true",
+        help="Run cpu wrappers without dynamic int8 quantization.",
+    )
     args = parser.parse_args(sys.argv[1:])
 
     conf = {
         "alias": args.alias,
         "checkpoint_loc": args.checkpoint_loc,
+        "prefix_cache_mb": args.prefix_cache_mb,
+        "num_threads": args.num_threads,
+        "quantize": not args.no_quantize,
     }
     log.info("loading model")
     wrapper = wrapper_from_conf(conf)
+    if 1 < args.max_batch_size:
+        batcher = RequestBatcher(
+            wrapper.get_recs_batch, args.max_batch_size, args.max_batch_wait_ms / 1000
+        )
 
     id = args.id
     ip = get_ip()
@@ -82,4 +150,5 @@ if __name__ == "__main__":
     with port_map_loc.open("a") as fout:
         fout.write(f"{id}\t{ip}\t{port}\n")
 
-    run_simple(ip, port, application)
+    # Requests only run concurrently when a batcher serializes model calls.
+    run_simple(ip, port, application, threaded=batcher is not None)
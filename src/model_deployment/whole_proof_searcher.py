@@ -66,6 +66,7 @@ class WholeProofSearcherConf:
     n_attempts: int
     print_proofs: bool
     rectype: RecType
+    num_proof_workers: int = 1
     timeout = 600
     ALIAS = "whole_proof"
 
@@ -75,6 +76,7 @@ class WholeProofSearcherConf:
             yaml_data["n_attempts"],
             yaml_data["print_proofs"],
             RecType.from_string(yaml_data["rectype"]),
+            yaml_data.get("num_proof_workers", 1),
         )
 
 
@@ -162,12 +164,16 @@ class WholeProofSearcher:
         successful_attempts: list[str] = []
         successful_proof: Proof | None = None
         costs: list[float] = []
-        for i, attempt in enumerate(result.next_tactic_list):
-            if self.print_proofs:
+        if self.print_proofs:
+            for attempt in result.next_tactic_list:
                 print(cur_proof_script + attempt)
-            proof_check_result = self.proof_manager.check_proof(
-                cur_proof_script + attempt, last_proof.theorem
-            )
+        check_results = self.proof_manager.check_proofs(
+            [cur_proof_script + attempt for attempt in result.next_tactic_list],
+            last_proof.theorem,
+        )
+        for i, (attempt, proof_check_result) in enumerate(
+            zip(result.next_tactic_list, check_results)
+        ):
             attempts.append(cur_proof_script + attempt)
             costs.append(result.costs[i] if result.costs is not None else 0)
             match proof_check_result.tactic_result:
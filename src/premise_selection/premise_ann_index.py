@@ -0,0 +1,214 @@
+"""
+An inverted-file (IVF) index over the premise embeddings of a vector db.
+Premises are clustered offline; a query only scores the allowed premises
+in the clusters whose centroids are closest to it.
+"""
+
+from __future__ import annotations
+
+import sys
+import json
+import argparse
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from premise_selection.premise_vector_db import VectorDB
+from util.ranking import top_k_indices
+from util.util import get_basic_logger
+
+_logger = get_basic_logger(__name__)
+
+
+class IVFIndex:
+    INDEX_NAME = "ivf-index"
+    CENTROIDS_NAME = "centroids.npy"
+    ASSIGNMENTS_NAME = "assignments.npy"
+    METADATA_NAME = "metadata.json"
+    ASSIGN_BATCH_SIZE = 65536
+
+    def __init__(
+        self,
+        centroids: npt.NDArray[np.float32],
+        assignments: npt.NDArray[np.int32],
+        num_probes: int,
+        sdb_hash: Optional[str] = None,
+    ) -> None:
+        self.centroids = centroids
+        # Cluster of every vector in the vector db.
+        self.assignments = assignments
+        self.num_probes = num_probes
+        # Sentence db hash of the vector db the index was built from.
+        self.sdb_hash = sdb_hash
+
+    @property
+    def num_lists(self) -> int:
+        return len(self.centroids)
+
+    def search(
+        self,
+        query: npt.NDArray[np.float32],
+        allowed_ids: npt.NDArray[np.int64],
+        k: int,
+        embs: npt.NDArray[np.generic],
+        scales: Optional[npt.NDArray[np.float32]] = None,
+    ) -> tuple[list[int], list[float]]:
+        """
+        Approximate top k of embs[allowed_ids] @ query, with rows multiplied
+        by their scales if embs is quantized. Returns positions into
+        allowed_ids and their scores, best first. Probes the num_probes best
+        clusters that contain allowed ids, and more if they hold fewer than
+        k allowed ids.
+        """
+        allowed_lists = self.assignments[allowed_ids]
+        present_lists = np.unique(allowed_lists)
+        centroid_scores = self.centroids[present_lists] @ query
+        probe_order = present_lists[np.argsort(-1 * centroid_scores, kind="stable")]
+        probe_ranks = np.zeros(self.num_lists, dtype=np.int64)
+        probe_ranks[probe_order] = np.arange(len(probe_order))
+        allowed_ranks = probe_ranks[allowed_lists]
+
+        list_sizes = np.bincount(allowed_ranks, minlength=len(probe_order))
+        min_lists = np.searchsorted(np.cumsum(list_sizes), min(k, len(allowed_ids)))
+        num_lists = max(min(self.num_probes, len(probe_order)), min_lists + 1)
+        positions = np.flatnonzero(allowed_ranks < num_lists)
+
+        candidate_ids = allowed_ids[positions]
+        scores = embs[candidate_ids].astype(np.float32) @ query
+        if scales is not None:
+            scores *= scales[candidate_ids]
+        top_positions = top_k_indices(scores, k)
+        return (
+            positions[top_positions].tolist(),
+            scores[top_positions].tolist(),
+        )
+
+    def save(self, path: Path) -> None:
+        path.mkdir(parents=True, exist_ok=True)
+        np.save(path / self.CENTROIDS_NAME, self.centroids)
+        np.save(path / self.ASSIGNMENTS_NAME, self.assignments)
+        with (path / self.METADATA_NAME).open("w") as fout:
+            json.dump(
+                {
+                    "num_probes": self.num_probes,
+                    "num_vectors": len(self.assignments),
+                    "sdb_hash": self.sdb_hash,
+                },
+                fout,
+            )
+
+    @staticmethod
+    def get_index_loc(vector_db_loc: Path) -> Path:
+        return vector_db_loc / IVFIndex.INDEX_NAME
+
+    @classmethod
+    def load_metadata(cls, path: Path) -> Any:
+        with (path / cls.METADATA_NAME).open("r") as fin:
+            return json.load(fin)
+
+    @classmethod
+    def load_checked(
+        cls, path: Path, num_vectors: int, sdb_hash: Optional[str]
+    ) -> Optional[IVFIndex]:
+        """
+        The index at path if it was built from a vector db with num_vectors
+        vectors and sdb_hash. A stale index is not used.
+        """
+        metadata = cls.load_metadata(path)
+        expected = {"num_vectors": num_vectors, "sdb_hash": sdb_hash}
+        stale_keys = [k for k, v in expected.items() if metadata.get(k) != v]
+        if len(stale_keys) == 0:
+            return cls.load(path)
+        _logger.warning(
+            f"IVF index {path} does not match its vector db "
+            f"({', '.join(stale_keys)}); searching without it. "
+            "Rebuild it with src/premise_selection/premise_ann_index.py."
+        )
+        return None
+
+    @classmethod
+    def load(cls, path: Path) -> IVFIndex:
+        metadata = cls.load_metadata(path)
+        centroids = np.load(path / cls.CENTROIDS_NAME)
+        assignments = np.load(path / cls.ASSIGNMENTS_NAME, mmap_mode="r")
+        return cls(
+            centroids, assignments, metadata["num_probes"], metadata.get("sdb_hash")
+        )
+
+    @classmethod
+    def assign(
+        cls, embs: npt.NDArray[np.generic], centroids: npt.NDArray[np.float32]
+    ) -> npt.NDArray[np.int32]:
+        # Positive row scales do not change the argmax, so quantized
+        # rows can be assigned as they are stored.
+        assignments = np.empty(len(embs), dtype=np.int32)
+        for start in range(0, len(embs), cls.ASSIGN_BATCH_SIZE):
+            batch = embs[start : start + cls.ASSIGN_BATCH_SIZE].astype(np.float32)
+            assignments[start : start + len(batch)] = np.argmax(
+                batch @ centroids.T, axis=1
+            )
+        return assignments
+
+    @classmethod
+    def build(
+        cls,
+        embs: npt.NDArray[np.generic],
+        num_lists: int,
+        num_probes: int,
+        num_iters: int = 10,
+        sample_size: int = 200000,
+        seed: int = 0,
+        scales: Optional[npt.NDArray[np.float32]] = None,
+        sdb_hash: Optional[str] = None,
+    ) -> IVFIndex:
+        """K-means on a sample of embs, with inner-product assignment."""
+        rng = np.random.default_rng(seed)
+        num_lists = min(num_lists, len(embs))
+        sample_idxs = rng.choice(len(embs), min(sample_size, len(embs)), replace=False)
+        sample_idxs = np.sort(sample_idxs)
+        sample = embs[sample_idxs].astype(np.float32)
+        if scales is not None:
+            sample *= scales[sample_idxs, None]
+        centroids = sample[rng.choice(len(sample), num_lists, replace=False)]
+        for i in range(num_iters):
+            sample_assignments = cls.assign(sample, centroids)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, sample_assignments, sample)
+            counts = np.bincount(sample_assignments, minlength=num_lists)
+            nonempty = 0 < counts
+            # Empty clusters keep their old centroid.
+            centroids[nonempty] = sums[nonempty] / counts[nonempty, None]
+            _logger.info(f"K-means iteration {i + 1} of {num_iters}")
+        return cls(centroids, cls.assign(embs, centroids), num_probes, sdb_hash)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Build an IVF index over the embedding matrix of a vector db."
+    )
+    parser.add_argument("vector_db_loc", help="Location of the vector db.")
+    parser.add_argument("--num_lists", type=int, default=1024)
+    parser.add_argument("--num_probes", type=int, default=32)
+    parser.add_argument("--num_iters", type=int, default=10)
+    parser.add_argument("--sample_size", type=int, default=200000)
+    args = parser.parse_args(sys.argv[1:])
+
+    vector_db_loc = Path(args.vector_db_loc)
+    vector_db = VectorDB.load(vector_db_loc)
+    if vector_db.emb_matrix is None:
+        raise ValueError(
+            f"{vector_db_loc} has no embedding matrix. "
+            "Convert it with src/util/vector_db_utils.py first."
+        )
+    index = IVFIndex.build(
+        vector_db.emb_matrix.embs,
+        args.num_lists,
+        args.num_probes,
+        args.num_iters,
+        args.sample_size,
+        scales=vector_db.emb_matrix.scales,
+        sdb_hash=vector_db.sdb_hash,
+    )
+    index.save(IVFIndex.get_index_loc(vector_db_loc))
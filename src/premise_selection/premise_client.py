@@ -14,11 +14,12 @@ from enum import Enum
 from data_management.dataset_file import (
     Goal,
     DatasetFile,
-    DPCache,
-    get_ids_from_sentence,
-    get_ids_from_goal,
+    get_process_dp_cache,
+    get_cached_ids_from_sentence,
+    get_cached_ids_from_goal,
 )
 from data_management.sentence_db import SentenceDB
+from data_management.sentence_tokens import SentenceTokenTable
 from data_management.dataset_file import FocusedStep, Proof, Sentence
 from premise_selection.premise_formatter import (
     ContextFormat,
@@ -28,11 +29,13 @@ from premise_selection.premise_formatter import (
 )
 from premise_selection.premise_filter import PremiseFilter, PremiseFilterConf
 from premise_selection.retrieved_premise_db import RetrievedPremiseDB
+from premise_selection.premise_term_matrix import PremiseTermMatrix
 from proof_retrieval.bm25 import bm25
 from proof_retrieval.tfidf import tf_idf, compute_idfs
 from coqpyt.coq.structs import TermType
 
 from util.util import FlexibleUrl
+from util.ranking import top_k_indices
 
 
 @dataclass
@@ -41,6 +44,7 @@ class SelectModelConf:
     checkpoint_loc: Path
     vector_db_loc: Optional[Path]
     cached_premise_loc: Optional[Path]
+    ann_top_k: bool = False
 
     @classmethod
     def from_yaml(cls, yaml_data: Any) -> SelectModelConf:
@@ -52,6 +56,7 @@ class SelectModelConf:
             Path(yaml_data["checkpoint_loc"]),
             Path(yaml_data["vector_db_loc"]),
             cached_premise_loc,
+            yaml_data.get("ann_top_k", False),
         )
 
 
@@ -80,6 +85,7 @@ class SparseConf:
     premise_filter_conf: PremiseFilterConf
     sentence_db_loc: Path
     cached_premise_loc: Optional[Path]
+    vectorized: bool = True
 
     @classmethod
     def from_yaml(cls, yaml_data: Any) -> SparseConf:
@@ -94,6 +100,7 @@ class SparseConf:
             PremiseFilterConf.from_yaml(yaml_data["premise_filter"]),
             Path(yaml_data["sentence_db_loc"]),
             cached_premise_loc,
+            yaml_data.get("vectorized", True),
         )
 
 
@@ -106,6 +113,8 @@ class SelectModelClientConf:
     premise_filter_conf: PremiseFilterConf
     sentence_db_loc: Path
     cached_premise_loc: Optional[Path]
+    # Ask the server for the top k instead of every score.
+    ann_top_k: bool = False
 
     def merge(self, other: SelectModelClientConf) -> SelectModelClientConf:
         new_urls = self.urls + other.urls
@@ -120,6 +129,7 @@ class SelectModelClientConf:
             self.premise_filter_conf,
             self.sentence_db_loc,
             self.cached_premise_loc,
+            self.ann_top_k,
         )
 
     def update_ips(self, port_map: dict[int, tuple[str, int]]):
@@ -141,6 +151,7 @@ class SelectModelClientConf:
             PremiseFilterConf.from_yaml(yaml_data["premise_filter"]),
             Path(yaml_data["sentence_db_loc"]),
             cached_premise_loc,
+            yaml_data.get("ann_top_k", False),
         )
 
 
@@ -193,12 +204,14 @@ class SelectPremiseClient:
         premise_filter: PremiseFilter,
         sentence_db: SentenceDB,
         cached_premises: Optional[RetrievedPremiseDB],
+        ann_top_k: bool = False,
     ):
         self.context_format = context_format
         self.premise_format = premise_format
         self.premise_filter = premise_filter
         self.sentence_db = sentence_db
         self.cached_premises = cached_premises
+        self.ann_top_k = ann_top_k
         self.session = requests.Session()
         self.urls = urls
 
@@ -228,9 +241,13 @@ class SelectPremiseClient:
             }
             self.session.post(url, json=request_data).json()
 
-    def get_premise_scores_from_strings(
-        self, context_str: str, premises: list[Sentence]
-    ) -> list[float]:
+    def split_premises(
+        self, premises: list[Sentence]
+    ) -> tuple[list[int], list[Any], list[int]]:
+        """
+        Db ids of the stored premises, json of the others, and the original
+        position of every premise in that order.
+        """
         idxs: list[int] = []
         orig_idxs: list[int] = []
         orig_idxs_other: list[int] = []
@@ -246,6 +263,26 @@ class SelectPremiseClient:
         other_premises_json = [
             s.to_json(self.sentence_db, False) for s in other_premises
         ]
+        return idxs, other_premises_json, orig_idxs + orig_idxs_other
+
+    def get_top_k_from_strings(
+        self, context_str: str, premises: list[Sentence], k: int
+    ) -> list[int]:
+        idxs, other_premises_json, orig_idxs = self.split_premises(premises)
+        request_data = {
+            "method": "get_top_k",
+            "params": [context_str, idxs, other_premises_json, k],
+            "jsonrpc": "2.0",
+            "id": 0,
+        }
+        request_url = random.choice(self.urls)
+        response = self.session.post(request_url, json=request_data).json()
+        return [orig_idxs[position] for position, _ in response["result"]]
+
+    def get_premise_scores_from_strings(
+        self, context_str: str, premises: list[Sentence]
+    ) -> list[float]:
+        idxs, other_premises_json, orig_idxs = self.split_premises(premises)
         request_data = {
             "method": "get_scores",
             "params": [context_str, idxs, other_premises_json],
@@ -256,7 +293,6 @@ class SelectPremiseClient:
         response = self.session.post(request_url, json=request_data).json()
         result = response["result"]
 
-        orig_idxs = orig_idxs + orig_idxs_other
         new_order = sorted(range(len(orig_idxs)), key=lambda idx: orig_idxs[idx])
         scores: list[float] = []
         for new_idx in new_order:
@@ -270,24 +306,24 @@ class SelectPremiseClient:
         dp_obj: DatasetFile,
         premises: list[Sentence],
         training: bool,
+        k: Optional[int] = None,
     ) -> list[Sentence]:
         if training:
             cached_scores = get_cached_premises(
                 self.cached_premises, step_idx, proof, dp_obj, self.sentence_db
             )
             if cached_scores:
-                return cached_scores
+                return cached_scores[:k]
         step = proof.steps[step_idx]
         formatted_context = self.context_format.format(step, proof)
+        if self.ann_top_k and k is not None:
+            top_idxs = self.get_top_k_from_strings(formatted_context, premises, k)
+            return [premises[idx] for idx in top_idxs]
         premise_scores = self.get_premise_scores_from_strings(
             formatted_context, premises
         )
-        num_premises = len(premise_scores)
-        arg_sorted_premise_scores = sorted(
-            range(num_premises), key=lambda idx: -1 * premise_scores[idx]
-        )
         ranked_premises: list[Sentence] = []
-        for idx in arg_sorted_premise_scores:
+        for idx in top_k_indices(premise_scores, k):
             ranked_premises.append(premises[idx])
         return ranked_premises
 
@@ -301,12 +337,13 @@ class SelectPremiseClient:
             CONTEXT_ALIASES[conf.context_format_alias],
             PREMISE_ALIASES[conf.premise_format_alias],
             PremiseFilter.from_conf(conf.premise_filter_conf),
-            SentenceDB.load(conf.sentence_db_loc),
+            SentenceDB.load(conf.sentence_db_loc, read_only=True),
             (
                 RetrievedPremiseDB.load(conf.cached_premise_loc)
                 if conf.cached_premise_loc is not None
                 else None
             ),
+            conf.ann_top_k,
         )
 
 
@@ -347,14 +384,32 @@ class SparseClient:
     premise_filter: PremiseFilter
     sentence_db: SentenceDB
     cached_premises: Optional[RetrievedPremiseDB]
+    term_matrix: Optional[PremiseTermMatrix] = None
 
     def get_premise_scores(
         self, context: Goal, premises: list[Sentence]
     ) -> list[float]:
-        # premise_strs = [self.premise_format.format(p) for p in premises]
-        premise_docs = [get_ids_from_sentence(p) for p in premises]
-        query_hyp_ids, query_goal_ids = get_ids_from_goal(context)
+        if self.term_matrix is not None:
+            if self.term_matrix.token_table is not None:
+                (
+                    query_hyp_tokens,
+                    query_goal_tokens,
+                ) = self.term_matrix.token_table.get_goal_tokens(context)
+                query_tokens = query_hyp_tokens + query_goal_tokens
+            else:
+                query_hyp_ids, query_goal_ids = get_cached_ids_from_goal(context)
+                query_tokens = query_hyp_ids + query_goal_ids
+            match self.kind:
+                case SparseKind.TFIDF:
+                    return self.term_matrix.tf_idf(query_tokens, premises)
+                case SparseKind.BM25:
+                    return self.term_matrix.bm25(query_tokens, premises)
+
+        query_hyp_ids, query_goal_ids = get_cached_ids_from_goal(context)
         query_ids = query_hyp_ids + query_goal_ids
+
+        # premise_strs = [self.premise_format.format(p) for p in premises]
+        premise_docs = [get_cached_ids_from_sentence(p) for p in premises]
         # query_ids = query_goal_ids
         # query = tokenize(context_str)
         match self.kind:
@@ -370,13 +425,14 @@ class SparseClient:
         dp_obj: DatasetFile,
         premises: list[Sentence],
         training: bool,
+        k: Optional[int] = None,
     ) -> list[Sentence]:
         if training:
             cached_scores = get_cached_premises(
                 self.cached_premises, step_idx, proof, dp_obj, self.sentence_db
             )
             if cached_scores:
-                return cached_scores
+                return cached_scores[:k]
         step = proof.steps[step_idx]
         if len(step.goals) == 0:
             empty_premises: list[Sentence] = []
@@ -384,12 +440,8 @@ class SparseClient:
         focused_goal = step.goals[0]
         # formatted_context = self.context_format.format(step, proof)
         premise_scores = self.get_premise_scores(focused_goal, premises)
-        num_premises = len(premise_scores)
-        arg_sorted_premise_scores = sorted(
-            range(num_premises), key=lambda idx: -1 * premise_scores[idx]
-        )
         ranked_premises: list[Sentence] = []
-        for idx in arg_sorted_premise_scores:
+        for idx in top_k_indices(premise_scores, k):
             ranked_premises.append(premises[idx])
         return ranked_premises
 
@@ -399,13 +451,22 @@ class SparseClient:
             cached_premises = RetrievedPremiseDB.load(conf.cached_premise_loc)
         else:
             cached_premises = None
+        sentence_db = SentenceDB.load(conf.sentence_db_loc, read_only=True)
+        if conf.vectorized:
+            token_table = SentenceTokenTable.load_for_db(
+                conf.sentence_db_loc, sentence_db
+            )
+            term_matrix = PremiseTermMatrix(token_table)
+        else:
+            term_matrix = None
         return cls(
             conf.kind,
             CONTEXT_ALIASES[conf.context_format_alias],
             PREMISE_ALIASES[conf.premise_format_alias],
             PremiseFilter.from_conf(conf.premise_filter_conf),
-            SentenceDB.load(conf.sentence_db_loc),
+            sentence_db,
             cached_premises,
+            term_matrix,
         )
 
 
@@ -445,6 +506,7 @@ class LookupClient:
         dp_obj: DatasetFile,
         premises: list[Sentence],
         training: bool,
+        k: Optional[int] = None,
     ) -> list[Sentence]:
         step = proof.steps[step_idx]
         if len(step.goals) == 0:
@@ -454,7 +516,7 @@ class LookupClient:
         premise_names = [self.get_name_from_premise(p) for p in premises]
         # print(premise_names)
         premise_scores: list[float] = []
-        hyp_id_list, goal_id_list = get_ids_from_goal(focused_goal)
+        hyp_id_list, goal_id_list = get_cached_ids_from_goal(focused_goal)
         hyp_ids = set(hyp_id_list)
         goal_ids = set(goal_id_list)
         for sentence, name in zip(premises, premise_names):
@@ -475,12 +537,8 @@ class LookupClient:
             else:
                 premise_scores.append(0)
 
-        num_premises = len(premise_scores)
-        arg_sorted_premise_scores = sorted(
-            range(num_premises), key=lambda idx: -1 * premise_scores[idx]
-        )
         ranked_premises: list[Sentence] = []
-        for idx in arg_sorted_premise_scores:
+        for idx in top_k_indices(premise_scores, k):
             if premise_scores[idx] == 0:
                 break
             ranked_premises.append(premises[idx])
@@ -498,7 +556,7 @@ class LookupClient:
 SelectClient = SelectPremiseClient | SparseClient | LookupClient
 
 
-dp_cache = DPCache()
+dp_cache = get_process_dp_cache()
 
 
 def select_client_from_conf(conf: SelectClientConf) -> SelectClient:
@@ -3,6 +3,7 @@ from typing import Iterable, Any, Optional, TypeVar
 
 import sys, os
 from tqdm import tqdm
+import numpy as np
 import torch
 from pathlib import Path
 from transformers import GPT2Tokenizer
@@ -19,6 +20,7 @@ from premise_selection.premise_formatter import (
     CONTEXT_ALIASES,
 )
 from premise_selection.premise_vector_db import VectorDB
+from premise_selection.premise_ann_index import IVFIndex
 from premise_selection.model import PremiseRetriever
 from premise_selection.premise_filter import PremiseFilter
 from premise_selection.rerank_model import PremiseReranker
@@ -29,6 +31,7 @@ from data_management.dataset_file import DatasetFile, Proof, FocusedStep, Senten
 from data_management.sentence_db import SentenceDB
 
 from util.train_utils import get_required_arg
+from util.ranking import top_k_indices
 from util.constants import (
     TRAINING_CONF_NAME,
     RERANK_DATA_CONF_NAME,
@@ -113,6 +116,7 @@ class SelectWrapper:
         premise_format: type[PremiseFormat],
         sentence_db: SentenceDB,
         vector_db: Optional[VectorDB],
+        ann_index: Optional[IVFIndex] = None,
     ) -> None:
         self.retriever = retriever
         self.max_seq_len = max_seq_len
@@ -120,6 +124,7 @@ class SelectWrapper:
         self.premise_format = premise_format
         self.sentence_db = sentence_db
         self.vector_db = vector_db
+        self.ann_index = ann_index
         self.batch_size = 128
         self.__transform_mat: Optional[torch.Tensor] = None
 
@@ -171,10 +176,7 @@ class SelectWrapper:
     def encode_all(
         self, indices: list[int], non_indices: list[Sentence]
     ) -> torch.Tensor:
-        index_sentences: list[Sentence] = []
-        for idx in indices:
-            s = Sentence.from_idx(idx, self.sentence_db)
-            index_sentences.append(s)
+        index_sentences = Sentence.from_idxs(indices, self.sentence_db)
         to_encode = index_sentences + non_indices
         to_encode_strs = [self.premise_format.format(s) for s in to_encode]
         return self.get_premise_embs(to_encode_strs)
@@ -219,6 +221,13 @@ class SelectWrapper:
             premise_embs.append(batch_emb)
         return torch.cat(premise_embs)
 
+    def get_context_encoding(self, context_str: str) -> torch.Tensor:
+        context_inputs = self.get_input(context_str)
+        with torch.no_grad():
+            return self.retriever.encode_context(
+                context_inputs.input_ids, context_inputs.attention_mask
+            ).to(self.retriever.device)
+
     def get_premise_scores(
         self, context_str: str, idx_premises: list[int], other_premises: list[Sentence]
     ) -> list[float]:
@@ -227,17 +236,54 @@ class SelectWrapper:
         premise_matrix = self.encode_premises(idx_premises, other_premises)
         if self.__transform_mat is not None:
             premise_matrix = premise_matrix @ self.__transform_mat
-        context_inputs = self.get_input(context_str)
-        with torch.no_grad():
-            context_encoding = self.retriever.encode_context(
-                context_inputs.input_ids, context_inputs.attention_mask
-            ).to(self.retriever.device)
+        context_encoding = self.get_context_encoding(context_str)
         similarities = torch.mm(
             context_encoding, premise_matrix.t().to(self.retriever.device)
         )
         assert similarities.shape[0] == 1
         return similarities[0].tolist()
 
+    def get_top_premises(
+        self,
+        context_str: str,
+        idx_premises: list[int],
+        other_premises: list[Sentence],
+        k: int,
+    ) -> list[tuple[int, float]]:
+        """
+        The k best premises as (position in idx_premises + other_premises,
+        score). Searches the indexed premises with the ann index if there
+        is one, and scores every premise otherwise.
+        """
+        if (
+            self.ann_index is None
+            or self.vector_db is None
+            or self.vector_db.emb_matrix is None
+            or self.__transform_mat is not None
+            or len(idx_premises) <= k
+        ):
+            scores = self.get_premise_scores(context_str, idx_premises, other_premises)
+            return [(i, scores[i]) for i in top_k_indices(scores, k)]
+        context_encoding = self.get_context_encoding(context_str)
+        query = context_encoding[0].to("cpu", torch.float32).numpy()
+        positions, scores = self.ann_index.search(
+            query,
+            np.asarray(idx_premises, dtype=np.int64),
+            k,
+            self.vector_db.emb_matrix.embs,
+            self.vector_db.emb_matrix.scales,
+        )
+        if 0 < len(other_premises):
+            other_matrix = self.get_premise_embs(
+                [self.premise_format.format(p) for p in other_premises]
+            )
+            other_scores = torch.mm(
+                context_encoding, other_matrix.t().to(self.retriever.device)
+            )
+            positions += [len(idx_premises) + i for i in range(len(other_premises))]
+            scores += other_scores[0].tolist()
+        return [(positions[i], scores[i]) for i in top_k_indices(scores, k)]
+
     @classmethod
     def from_checkpoint(
         cls,
@@ -263,8 +309,17 @@ class SelectWrapper:
         retriever = PremiseRetriever.from_pretrained(checkpoint_loc)
         if torch.cuda.is_available():
             retriever.to("cuda")
+        ann_index: Optional[IVFIndex] = None
         if vector_db_loc is not None:
             vector_db = VectorDB.load(vector_db_loc)
+            ann_index_loc = IVFIndex.get_index_loc(vector_db_loc)
+            # The index is only searched over the embedding matrix.
+            if ann_index_loc.exists() and vector_db.emb_matrix is not None:
+                ann_index = IVFIndex.load_checked(
+                    ann_index_loc,
+                    len(vector_db.emb_matrix.embs),
+                    vector_db.sdb_hash,
+                )
         else:
             vector_db = None
         return cls(
@@ -274,6 +329,7 @@ class SelectWrapper:
             premise_format,
             sentence_db,
             vector_db,
+            ann_index,
         )
 
     @classmethod
@@ -0,0 +1,244 @@
+from __future__ import annotations
+from typing import Optional
+import math
+
+import numpy as np
+import numpy.typing as npt
+from scipy import sparse
+
+from data_management.dataset_file import Sentence, get_ids_from_sentence
+from data_management.sentence_db import SentenceDB
+from data_management.sentence_tokens import SentenceTokenTable
+from proof_retrieval.bm25 import compute_term_freqs
+
+PremiseKey = int | Sentence
+Term = str | int
+
+
+class PremiseTermMatrix:
+    """
+    Term-frequency matrix with one row per premise (keyed by sentence db id,
+    or by the sentence itself if it is not stored) and one column per
+    identifier. Premises are encoded once, the first time they are seen.
+    With a token table, identifiers are the table's interned ints and
+    queries must use them as well.
+
+    Scoring restricts the matrix to the candidate rows and the query
+    columns, and accumulates each term's contribution in the same order
+    as bm25()/tf_idf() so the scores are identical.
+    """
+
+    def __init__(self, token_table: Optional[SentenceTokenTable] = None) -> None:
+        self.token_table = token_table
+        self.vocab: dict[Term, int] = {}
+        self.row_ids: dict[PremiseKey, int] = {}
+        # Encoded rows are kept in blocks of consecutive rows. Each block is
+        # converted to column-major form the first time it is queried.
+        self.__blocks: list[sparse.csr_matrix] = []
+        self.__col_blocks: list[Optional[sparse.csc_matrix]] = []
+        self.__block_starts: list[int] = []
+        self.__block_lens: list[npt.NDArray[np.int64]] = []
+        self.__pending_docs: list[dict[Term, int]] = []
+        self.__pending_lens: list[int] = []
+
+    @property
+    def num_rows(self) -> int:
+        return len(self.row_ids)
+
+    @staticmethod
+    def get_key(premise: Sentence) -> PremiseKey:
+        if premise.db_idx is not None:
+            return premise.db_idx
+        return premise
+
+    def get_doc(self, premise: Sentence) -> list[Term]:
+        if self.token_table is not None:
+            return self.token_table.get_sentence_tokens(premise)
+        return get_ids_from_sentence(premise)
+
+    def add_premise(self, premise: Sentence) -> int:
+        key = self.get_key(premise)
+        if key in self.row_ids:
+            return self.row_ids[key]
+        doc = self.get_doc(premise)
+        term_freqs = compute_term_freqs(doc)
+        for term in term_freqs:
+            if term not in self.vocab:
+                self.vocab[term] = len(self.vocab)
+        row_id = len(self.row_ids)
+        self.row_ids[key] = row_id
+        self.__pending_docs.append(term_freqs)
+        self.__pending_lens.append(len(doc))
+        return row_id
+
+    def add_sentence_db(self, sentence_db: SentenceDB) -> None:
+        for idx in range(1, sentence_db.size() + 1):
+            self.add_premise(Sentence.from_idx(idx, sentence_db))
+        self.finalize()
+
+    def __flush(self) -> None:
+        """
+        Encodes the pending rows as a new block. Blocks are merged with their
+        predecessor while it is no larger, so there are O(log n) blocks and
+        each row is restacked O(log n) times however queries and additions
+        are interleaved.
+        """
+        if 0 == len(self.__pending_docs):
+            return
+        indptr = [0]
+        indices: list[int] = []
+        data: list[int] = []
+        for term_freqs in self.__pending_docs:
+            for term, freq in term_freqs.items():
+                indices.append(self.vocab[term])
+                data.append(freq)
+            indptr.append(len(indices))
+        shape = (len(self.__pending_docs), len(self.vocab))
+        new_rows = sparse.csr_matrix(
+            (
+                np.array(data, dtype=np.int64),
+                np.array(indices, dtype=np.int64),
+                np.array(indptr, dtype=np.int64),
+            ),
+            shape=shape,
+        )
+        self.__blocks.append(new_rows)
+        self.__col_blocks.append(None)
+        self.__block_starts.append(self.num_rows - len(self.__pending_docs))
+        self.__block_lens.append(np.array(self.__pending_lens, dtype=np.int64))
+        self.__pending_docs = []
+        self.__pending_lens = []
+        while (
+            2 <= len(self.__blocks)
+            and self.__blocks[-2].shape[0] <= self.__blocks[-1].shape[0]
+        ):
+            self.__merge_blocks(len(self.__blocks) - 2)
+
+    def __merge_blocks(self, start: int) -> None:
+        """Stacks the blocks from start onwards into one."""
+        blocks = self.__blocks[start:]
+        for block in blocks:
+            block.resize((block.shape[0], len(self.vocab)))
+        self.__blocks[start:] = [sparse.vstack(blocks, format="csr")]
+        self.__col_blocks[start:] = [None]
+        self.__block_starts[start + 1 :] = []
+        self.__block_lens[start:] = [np.concatenate(self.__block_lens[start:])]
+
+    def finalize(self) -> None:
+        """
+        Encodes every pending row and stacks all blocks into a single
+        column-major matrix. Call once after adding premises in bulk.
+        """
+        self.__flush()
+        if 1 < len(self.__blocks):
+            self.__merge_blocks(0)
+        if 1 == len(self.__blocks):
+            self.__get_col_block(0)
+
+    def __get_col_block(self, block_id: int) -> sparse.csc_matrix:
+        col_block = self.__col_blocks[block_id]
+        if col_block is None:
+            block = self.__blocks[block_id]
+            block.resize((block.shape[0], len(self.vocab)))
+            col_block = block.tocsc()
+            self.__col_blocks[block_id] = col_block
+        elif col_block.shape[1] < len(self.vocab):
+            # Terms added since the conversion have no entries in the block.
+            col_block.resize((col_block.shape[0], len(self.vocab)))
+        return col_block
+
+    def __candidate_columns(
+        self, rows: npt.NDArray[np.int64], terms: list[Term]
+    ) -> tuple[
+        dict[Term, tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]],
+        npt.NDArray[np.int64],
+    ]:
+        """
+        For each term in the vocabulary, the candidate positions containing
+        it and its frequency there. Also returns the candidates' lengths.
+        """
+        self.__flush()
+        known_terms = [t for t in terms if t in self.vocab]
+        cols = [self.vocab[t] for t in known_terms]
+        block_ids = np.searchsorted(self.__block_starts, rows, side="right") - 1
+        doc_lens = np.zeros(len(rows), dtype=np.int64)
+        parts: list[sparse.csr_matrix] = []
+        part_positions: list[npt.NDArray[np.int64]] = []
+        for block_id in np.unique(block_ids):
+            positions = np.nonzero(block_ids == block_id)[0]
+            block_rows = rows[positions] - self.__block_starts[block_id]
+            col_block = self.__get_col_block(block_id)
+            parts.append(col_block[:, cols].tocsr()[block_rows])
+            part_positions.append(positions)
+            doc_lens[positions] = self.__block_lens[block_id][block_rows]
+        stacked = sparse.vstack(parts, format="csr")
+        order = np.argsort(np.concatenate(part_positions), kind="stable")
+        candidate_cols = stacked[order].tocsc()
+        columns: dict[Term, tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]] = {}
+        for i, term in enumerate(known_terms):
+            start = candidate_cols.indptr[i]
+            end = candidate_cols.indptr[i + 1]
+            if start < end:
+                columns[term] = (
+                    candidate_cols.indices[start:end],
+                    candidate_cols.data[start:end],
+                )
+        return columns, doc_lens
+
+    def get_rows(self, premises: list[Sentence]) -> npt.NDArray[np.int64]:
+        return np.array([self.add_premise(p) for p in premises], dtype=np.int64)
+
+    def bm25(
+        self,
+        query: list[Term],
+        premises: list[Sentence],
+        k1: float = 1.8,
+        b: float = 0.75,
+    ) -> list[float]:
+        if 0 == len(premises):
+            return []
+        rows = self.get_rows(premises)
+        unique_terms = list(dict.fromkeys(query))
+        columns, doc_lens = self.__candidate_columns(rows, unique_terms)
+        avg_doc_len = int(doc_lens.sum()) / len(premises)
+        num_docs = len(premises)
+
+        term_scores: dict[Term, npt.NDArray[np.float64]] = {}
+        for term, (positions, term_freqs) in columns.items():
+            doc_freq = len(positions)
+            query_idf = math.log((num_docs - doc_freq + 0.5) / (doc_freq + 0.5) + 1)
+            doc_term_num = term_freqs * (k1 + 1)
+            doc_term_denom = term_freqs + k1 * (
+                1 - b + b * doc_lens[positions] / avg_doc_len
+            )
+            term_scores[term] = query_idf * doc_term_num / doc_term_denom
+
+        scores = np.zeros(num_docs, dtype=np.float64)
+        for term in query:
+            if term not in term_scores:
+                continue
+            positions, _ = columns[term]
+            scores[positions] += term_scores[term]
+        return scores.tolist()
+
+    def tf_idf(self, query: list[Term], premises: list[Sentence]) -> list[float]:
+        if 0 == len(premises):
+            return []
+        if 0 == len(query):
+            return [0.0] * len(premises)
+        rows = self.get_rows(premises)
+        query_term_freqs = compute_term_freqs(query)
+        max_term_freq = max(query_term_freqs.values())
+        columns, doc_lens = self.__candidate_columns(rows, list(query_term_freqs))
+        num_docs = len(premises)
+
+        scores = np.zeros(num_docs, dtype=np.float64)
+        for term, query_term_freq in query_term_freqs.items():
+            if term not in columns:
+                continue
+            positions, term_freqs = columns[term]
+            idf = math.log(num_docs / len(positions))
+            query_tf_idf = (0.5 + 0.5 * (query_term_freq / max_term_freq)) * idf
+            doc_tf_idf = (term_freqs / doc_lens[positions]) * idf
+            scores[positions] += query_tf_idf * doc_tf_idf
+        return scores.tolist()
@@ -3,6 +3,9 @@ from typing import Optional, Callable
 
 import os
 import math
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
 from pathlib import Path
 import ipdb
 import functools
@@ -22,18 +25,99 @@ from premise_selection.model import PremiseRetriever
 from premise_selection.select_data import tokenize_strings
 from premise_selection.premise_formatter import PremiseFormat, PREMISE_ALIASES
 from util.train_utils import get_required_arg
-from util.constants import PREMISE_DATA_CONF_NAME, TRAINING_CONF_NAME, TMP_LOC
-from util.vector_db_utils import get_embs, get, get_page_loc
+from util.constants import (
+    PREMISE_DATA_CONF_NAME,
+    TRAINING_CONF_NAME,
+    VECTOR_DB_METADATA,
+)
+from util.vector_db_utils import EmbeddingMatrix, get_embs, get, get_page_loc
 
 from util.util import get_basic_logger
 
 
 _logger = get_basic_logger(__name__)
 
+PremiseEncoder = Callable[[list[DBSentence]], torch.Tensor]
+
+
+@dataclass
+class BuildManifest:
+    """
+    Progress of a premise db build. A page is only listed in done_pages
+    once it is fully written, so a build resumes from exactly the pages
+    that are missing.
+    """
+
+    page_size: int
+    num_pages: int
+    sdb_hash: str
+    done_pages: set[int]
+
+    MANIFEST_NAME = "build-manifest.json"
+
+    def save(self, db_loc: Path) -> None:
+        manifest_loc = self.get_manifest_loc(db_loc)
+        tmp_loc = manifest_loc.with_suffix(".tmp")
+        with tmp_loc.open("w") as fout:
+            json.dump(
+                {
+                    "page_size": self.page_size,
+                    "num_pages": self.num_pages,
+                    "sdb_hash": self.sdb_hash,
+                    "done_pages": sorted(self.done_pages),
+                },
+                fout,
+            )
+        os.replace(tmp_loc, manifest_loc)
+
+    @classmethod
+    def get_manifest_loc(cls, db_loc: Path) -> Path:
+        return db_loc / cls.MANIFEST_NAME
+
+    @classmethod
+    def load(cls, db_loc: Path) -> BuildManifest:
+        with cls.get_manifest_loc(db_loc).open("r") as fin:
+            data = json.load(fin)
+        return cls(
+            data["page_size"],
+            data["num_pages"],
+            data["sdb_hash"],
+            set(data["done_pages"]),
+        )
+
+
+_worker_encoder: Optional[PremiseEncoder] = None
+_worker_sdb: Optional[SentenceDB] = None
+
+
+def _init_build_worker(
+    encoder_factory: Callable[[str], PremiseEncoder],
+    device_queue: mp.Queue,
+    sentence_db_loc: Path,
+    num_threads: int,
+) -> None:
+    global _worker_encoder, _worker_sdb
+    torch.set_num_threads(num_threads)
+    _worker_encoder = encoder_factory(device_queue.get())
+    _worker_sdb = SentenceDB.load(sentence_db_loc, read_only=True)
+
+
+def _build_page(db_loc: Path, page_num: int, page_size: int, sdb_size: int) -> int:
+    assert _worker_encoder is not None
+    assert _worker_sdb is not None
+    sentences = VectorDB.load_page_sentences(page_num, page_size, _worker_sdb, sdb_size)
+    page_embs = _worker_encoder(sentences)
+    assert len(page_embs) == len(sentences)
+    page_loc = get_page_loc(db_loc, page_num)
+    tmp_loc = page_loc.with_suffix(".tmp")
+    torch.save(page_embs, tmp_loc)
+    os.replace(tmp_loc, page_loc)
+    return page_num
+
 
 class VectorDB:
     hash_cache: dict[Path, str] = {}
-    METADATA_LOC = "metadata.json"
+    METADATA_LOC = VECTOR_DB_METADATA
 
     def __init__(
         self,
@@ -47,15 +131,22 @@ class VectorDB:
         self.source = source  # Just for book keeping
         self.sdb_hash = sdb_hash
         self.device = "cpu"
+        self.emb_matrix: Optional[EmbeddingMatrix] = None
+        if EmbeddingMatrix.exists(db_loc):
+            self.emb_matrix = EmbeddingMatrix.load_checked(db_loc, page_size, sdb_hash)
 
     def get_embs(self, idxs: list[int]) -> Optional[torch.Tensor]:
+        if self.emb_matrix is not None:
+            return self.emb_matrix.get_embs(idxs, self.device)
         return get_embs(idxs, self.page_size, self.db_loc, self.device)
 
     def get(self, idx: int) -> Optional[torch.Tensor]:
+        if self.emb_matrix is not None:
+            return self.emb_matrix.get(idx, self.device)
         return get(idx, self.page_size, self.db_loc, self.device)
 
     @classmethod
-    def __hash_sdb(cls, sentence_db_loc: Path) -> str:
+    def hash_sdb(cls, sentence_db_loc: Path) -> str:
         if sentence_db_loc in cls.hash_cache:
             return cls.hash_cache[sentence_db_loc]
         with open(sentence_db_loc, "rb") as fin:
@@ -83,15 +174,8 @@ class VectorDB:
     ) -> VectorDB:
         with open(os.path.join(db_loc, cls.METADATA_LOC)) as fin:
             metadata = json.load(fin)
-        tmp_path = TMP_LOC / db_loc.name
-        if tmp_path.exists():
-            _logger.info(f"Using vector db {tmp_path}")
-            use_path = tmp_path
-        else:
-            use_path = db_loc
-
         return cls(
-            use_path,
+            db_loc,
             metadata["page_size"],
             metadata["source"],
             metadata["sdb_hash"],
@@ -104,13 +188,12 @@ class VectorDB:
         db_sentences: list[DBSentence] = []
         start = page_num * page_size
         end = min(sdb_size + 1, page_num * page_size + page_size)
-        for i in range(start, end):
-            if i == 0:
-                db_sentences.append(
-                    DBSentence("Dummy sentence.", "", "[]", "TermType.LEMMA", 0)
-                )  # IDs start at 1
-            else:
-                db_sentences.append(sdb.retrieve(i))
+        if start == 0:
+            db_sentences.append(
+                DBSentence("Dummy sentence.", "", "[]", "TermType.LEMMA", 0)
+            )  # IDs start at 1
+            start = 1
+        db_sentences.extend(sdb.retrieve_many(list(range(start, end))))
         return db_sentences
 
     @classmethod
@@ -123,7 +206,7 @@ class VectorDB:
         sentence_db_loc: Path,
     ) -> VectorDB:
         sdb = SentenceDB.load(sentence_db_loc)
-        sdb_hash = cls.__hash_sdb(sentence_db_loc)
+        sdb_hash = cls.hash_sdb(sentence_db_loc)
         sdb_size = sdb.size()
         num_written = 0
         cur_page = 0
@@ -144,6 +227,69 @@ class VectorDB:
             _logger.info(f"Processed {num_written} out of {sdb_size}")
         return VectorDB(db_loc, page_size, source, sdb_hash)
 
+    @classmethod
+    def build_premise_db(
+        cls,
+        db_loc: Path,
+        page_size: int,
+        source: str,
+        encoder_factory: Callable[[str], PremiseEncoder],
+        sentence_db_loc: Path,
+        devices: list[str],
+    ) -> VectorDB:
+        """
+        Builds the pages of a premise db with one worker process per entry
+        of devices. encoder_factory is called once in each worker with its
+        device. Progress is kept in a BuildManifest, so calling this again
+        after an interruption only builds the missing pages.
+        """
+        assert 0 < len(devices)
+        sdb = SentenceDB.load(sentence_db_loc, read_only=True)
+        sdb_size = sdb.size()
+        sdb.close()
+        sdb_hash = cls.hash_sdb(sentence_db_loc)
+        num_pages = math.ceil((sdb_size + 1) / page_size)
+
+        os.makedirs(db_loc, exist_ok=True)
+        if BuildManifest.get_manifest_loc(db_loc).exists():
+            manifest = BuildManifest.load(db_loc)
+            if (manifest.page_size, manifest.num_pages, manifest.sdb_hash) != (
+                page_size,
+                num_pages,
+                sdb_hash,
+            ):
+                raise ValueError(
+                    f"{db_loc} was started with a different page size or sentence db."
+                )
+            _logger.info(f"Resuming with {len(manifest.done_pages)} pages done.")
+        else:
+            manifest = BuildManifest(page_size, num_pages, sdb_hash, set())
+            manifest.save(db_loc)
+
+        to_build = [p for p in range(num_pages) if p not in manifest.done_pages]
+        # CUDA cannot be used in forked processes.
+        uses_cuda = any(d.startswith("cuda") for d in devices)
+        mp_context = mp.get_context("spawn" if uses_cuda else None)
+        device_queue = mp_context.Queue()
+        for device in devices:
+            device_queue.put(device)
+        num_threads = max(1, (os.cpu_count() or 1) // len(devices))
+        with ProcessPoolExecutor(
+            len(devices),
+            mp_context=mp_context,
+            initializer=_init_build_worker,
+            initargs=(encoder_factory, device_queue, sentence_db_loc, num_threads),
+        ) as executor:
+            futures = [
+                executor.submit(_build_page, db_loc, p, page_size, sdb_size)
+                for p in to_build
+            ]
+            for future in as_completed(futures):
+                manifest.done_pages.add(future.result())
+                manifest.save(db_loc)
+                _logger.info(f"Built {len(manifest.done_pages)} of {num_pages} pages")
+        return cls(db_loc, page_size, source, sdb_hash)
+
     @classmethod
     def create_proof_db(
         cls,
@@ -185,6 +331,32 @@ def load_retriever(
     return retriever, tokenizer, premise_format, max_seq_len
 
 
+def load_select_encoder(
+    checkpoint_loc: Path, batch_size: int, device: str
+) -> PremiseEncoder:
+    retriever, tokenizer, premise_format, max_seq_len = load_retriever(checkpoint_loc)
+    retriever.to(device)
+    retriever.eval()
+    return functools.partial(
+        select_encode,
+        retriever,
+        tokenizer,
+        premise_format,
+        max_seq_len,
+        batch_size,
+    )
+
+
+def length_order(
+    tokenizer: GPT2Tokenizer, texts: list[str], max_seq_len: int
+) -> list[int]:
+    """Order of texts by tokenized length, so batches need little padding."""
+    if len(texts) == 0:
+        return []
+    input_ids = tokenizer(texts, max_length=max_seq_len, truncation=True).input_ids
+    return sorted(range(len(texts)), key=lambda i: len(input_ids[i]))
+
+
 def select_encode(
     retriever: PremiseRetriever,
     tokenizer: GPT2Tokenizer,
@@ -194,7 +366,8 @@ def select_encode(
     ss: list[DBSentence],
 ) -> torch.Tensor:
     sentence_texts = [premise_format.format(Sentence.from_db_sentence(s)) for s in ss]
-    sentence_batches = batch_sentences(sentence_texts, batch_size)
+    order = length_order(tokenizer, sentence_texts, max_seq_len)
+    sentence_batches = batch_sentences([sentence_texts[i] for i in order], batch_size)
     batch_embs: list[torch.Tensor] = []
     for batch in sentence_batches:
         with torch.no_grad():
@@ -207,7 +380,9 @@ def select_encode(
                 batch_inputs.input_ids, batch_inputs.attention_mask
             )
         batch_embs.append(batch_emb)
-    page_embs = torch.cat(batch_embs).to("cpu")
+    sorted_embs = torch.cat(batch_embs).to("cpu")
+    page_embs = torch.empty_like(sorted_embs)
+    page_embs[torch.tensor(order)] = sorted_embs
     return page_embs
 
 
@@ -222,6 +397,12 @@ if __name__ == "__main__":
         "--select_checkpoint", help="Checkpoint to use for the select model."
     )
     parser.add_argument("--sentence_db_loc", help="Location of the sentence database")
+    parser.add_argument(
+        "--num_workers",
+        type=int,
+        default=1,
+        help="Number of encoding processes. They are spread over the available GPUs.",
+    )
     args = parser.parse_args()
 
     db_loc = Path(args.db_loc)
@@ -236,22 +417,20 @@ if __name__ == "__main__":
     assert checkpoint_loc.exists()
     assert sentence_db_loc.exists()
 
-    retriever, tokenizer, premise_format, max_seq_len = load_retriever(checkpoint_loc)
-    retriever.to("cuda")
-    encode_fn = functools.partial(
-        select_encode,
-        retriever,
-        tokenizer,
-        premise_format,
-        max_seq_len,
-        batch_size,
-    )
+    num_gpus = torch.cuda.device_count()
+    if 0 < num_gpus:
+        devices = [f"cuda:{i % num_gpus}" for i in range(args.num_workers)]
+    else:
+        _logger.warning("No GPU found. Encoding on the CPU.")
+        devices = ["cpu"] * args.num_workers
+    encoder_factory = functools.partial(load_select_encoder, checkpoint_loc, batch_size)
 
-    pdb = VectorDB.create_premise_db(
+    pdb = VectorDB.build_premise_db(
         Path(db_loc),
         page_size,
         str(checkpoint_loc),
-        encode_fn,
+        encoder_factory,
         sentence_db_loc,
+        devices,
     )
     pdb.save()
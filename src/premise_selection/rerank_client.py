@@ -8,7 +8,13 @@ from dataclasses import dataclass
 from pathlib import Path
 
 from data_management.sentence_db import SentenceDB
-from data_management.dataset_file import FocusedStep, Proof, DatasetFile, Sentence, DPCache
+from data_management.dataset_file import (
+    FocusedStep,
+    Proof,
+    DatasetFile,
+    Sentence,
+    get_process_dp_cache,
+)
 from premise_selection.rerank_example import RerankExample
 from premise_selection.retrieved_premise_db import RetrievedPremiseDB
 from premise_selection.rerank_formatter import (
@@ -29,6 +35,7 @@ from premise_selection.premise_client import (
 )
 
 from util.util import FlexibleUrl
+from util.ranking import top_k_indices
 from util.constants import RANGO_LOGGER
 
 _logger = logging.getLogger(RANGO_LOGGER)
@@ -160,7 +167,7 @@ class OracleClient:
         self.purity = purity 
         self.sentence_db = sentence_db
         self.data_loc = data_loc
-        self.dp_cache = DPCache()
+        self.dp_cache = get_process_dp_cache()
         self.context_format = self.base_client.context_format
         self.premise_format = self.base_client.premise_format
         self.premise_filter = self.base_client.premise_filter
@@ -184,6 +191,7 @@ class OracleClient:
         dp_obj: DatasetFile,
         premises: list[Sentence],
         training: bool,
+        k: Optional[int] = None,
     ) -> list[Sentence]:
         orig_dp = self.dp_cache.get_dp(dp_obj.dp_name, self.data_loc, self.sentence_db)
         orig_proof = orig_dp.proofs[proof.proof_idx]
@@ -220,14 +228,14 @@ class OracleClient:
             neg_prems = len(neg_premises)
 
         _logger.info(f"OracleClient (DPName: {dp_obj.dp_name}; Proof: {proof.proof_idx}): Purity {self.purity} requested. Observed purity {pos_prems} / {neg_prems}.")
-        return final_premises 
+        return final_premises[:k]
     
     @classmethod
     def from_conf(cls, conf: OracleClientConf) -> OracleClient:
         return cls(
             premise_client_from_conf(conf.base_client),
             conf.purity,
-            SentenceDB.load(conf.sentence_db_loc),
+            SentenceDB.load(conf.sentence_db_loc, read_only=True),
             conf.data_loc
         )
     
@@ -273,6 +281,7 @@ class RerankClient:
         dp_obj: DatasetFile,
         premises: list[Sentence],
         training: bool,
+        k: Optional[int] = None,
     ) -> list[Sentence]:
         if training:
             cached_scores = get_cached_premises(
@@ -283,27 +292,19 @@ class RerankClient:
                 self.sentence_db,
             )
             if cached_scores is not None:
-                return cached_scores
+                return cached_scores[:k]
         step = proof.steps[step_idx]
-        rerank_premises: list[Sentence] = []
-        for premise in self.select_client.get_ranked_premises(
-            step_idx, proof, dp_obj, premises, training
-        ):
-            rerank_premises.append(premise)
-            if self.rerank_num <= len(rerank_premises):
-                break
+        rerank_premises = self.select_client.get_ranked_premises(
+            step_idx, proof, dp_obj, premises, training, k=self.rerank_num
+        )
         context_str = self.rerank_formatter.get_formatted_context(step, proof, dp_obj)
         rerank_examples = [
             RerankExample(self.premise_format.format(p), context_str, False)
             for p in rerank_premises
         ]
         rerank_scores = self.get_scores(rerank_examples)
-        num_premises = len(rerank_scores)
-        arg_sorted_premise_scores = sorted(
-            range(num_premises), key=lambda idx: -1 * rerank_scores[idx]
-        )
         ranked_premises: list[Sentence] = []
-        for idx in arg_sorted_premise_scores:
+        for idx in top_k_indices(rerank_scores, k):
             ranked_premises.append(rerank_premises[idx])
         return ranked_premises
 
@@ -319,7 +320,7 @@ class RerankClient:
                 if conf.cached_premise_loc is not None
                 else None
             ),
-            SentenceDB.load(conf.sentence_db_loc),
+            SentenceDB.load(conf.sentence_db_loc, read_only=True),
         )
 
 
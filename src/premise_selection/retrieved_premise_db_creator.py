@@ -15,6 +15,7 @@ from premise_selection.rerank_client import (
 from premise_selection.retrieved_premise_db import RetrievedPremiseDB
 from concurrent.futures import ProcessPoolExecutor, Future, as_completed
 from data_management.splits import DataSplit, get_all_files, FileInfo
+from data_management.sentence_db import get_warmup_command
 
 from util.slurm import (
     JobOption,
@@ -100,7 +101,7 @@ if __name__ == "__main__":
             run_local(worker_command, n_workers)
         case SlurmJobConf(_, slurm_conf):
             commands = [
-                f"cp -r {conf.sentence_db_loc} /tmp/{conf.sentence_db_loc.name}",
+                get_warmup_command(conf.sentence_db_loc),
                 worker_command,
             ]
             slurm_conf.write_script(
@@ -52,9 +52,14 @@ def process_f_info(
                 step, proof, file_dp
             )
             premise_generator = premise_client.get_ranked_premises(
-                step_idx, proof, file_dp, filter_result.avail_premises, training=False
+                step_idx,
+                proof,
+                file_dp,
+                filter_result.avail_premises,
+                training=False,
+                k=max_num_premises,
             )
-            retrieved_sentences = list(premise_generator)[:max_num_premises]
+            retrieved_sentences = list(premise_generator)
             file_page_dict[step_id] = retrieved_sentences
     new_page = PremiseDBPage(file_page_dict)
 
@@ -71,7 +76,7 @@ if __name__ == "__main__":
 
     set_rango_logger(__file__, logging.DEBUG)
 
-    sentence_db = SentenceDB.load(conf.sentence_db_loc)
+    sentence_db = SentenceDB.load(conf.sentence_db_loc, read_only=True)
     premise_conf, next_num, commands = premise_conf_to_client_conf(conf.premise_conf, 0)
     if 0 < len(commands):
         clear_port_map()
@@ -1,6 +1,8 @@
+from __future__ import annotations
 from typing import Optional
 import functools
 import math
+from dataclasses import dataclass
 from data_management.dataset_file import get_ids_from_goal, get_ids_from_sentence
 
 
@@ -37,16 +39,55 @@ def compute_doc_freqs(corpus: list[list[str]]) -> dict[str, int]:
     return doc_freqs
 
 
+@dataclass
+class CorpusStats:
+    num_docs: int
+    total_len: int
+    doc_freqs: dict[str, int]
+
+    @property
+    def avg_doc_len(self) -> float:
+        return self.total_len / self.num_docs
+
+    def add(self, other: CorpusStats) -> None:
+        self.num_docs += other.num_docs
+        self.total_len += other.total_len
+        for term, freq in other.doc_freqs.items():
+            if term not in self.doc_freqs:
+                self.doc_freqs[term] = 0
+            self.doc_freqs[term] += freq
+
+    @classmethod
+    def empty(cls) -> CorpusStats:
+        return cls(0, 0, {})
+
+    @classmethod
+    def from_corpus(cls, corpus: list[list[str]]) -> CorpusStats:
+        return cls(len(corpus), sum(len(d) for d in corpus), compute_doc_freqs(corpus))
+
+
 def bm25(
     query: list[str],
     docs: list[list[str]],
     k1: float = 1.8,
     b: float = 0.75,
     doc_freqs: Optional[dict[str, int]] = None,
+    stats: Optional[CorpusStats] = None,
 ) -> list[float]:
+    """
+    Stats (if given) describe the corpus the docs are drawn from and
+    replace the document frequencies, count and average length computed
+    from the docs themselves.
+    """
     if 0 == len(docs):
         return []
-    avg_doc_len = sum([len(d) for d in docs]) / len(docs)
+    if stats is not None:
+        num_docs = stats.num_docs
+        avg_doc_len = stats.avg_doc_len
+        doc_freqs = stats.doc_freqs
+    else:
+        num_docs = len(docs)
+        avg_doc_len = sum([len(d) for d in docs]) / len(docs)
     if doc_freqs is None:
         doc_freqs = compute_doc_freqs(docs)
     doc_term_freqs = [bm_compute_term_freqs(doc_to_hashable(d)) for d in docs]
@@ -60,7 +101,7 @@ def bm25(
             if term not in doc_term_dict:
                 continue
             query_idf = math.log(
-                (len(docs) - doc_freqs[term] + 0.5) / (doc_freqs[term] + 0.5) + 1
+                (num_docs - doc_freqs[term] + 0.5) / (doc_freqs[term] + 0.5) + 1
             )
             doc_term_num = doc_term_dict[term] * (k1 + 1)
             doc_term_denom = doc_term_dict[term] + k1 * (
@@ -0,0 +1,176 @@
+"""
+An offline index of the proofs available from the dependencies of each
+data point in a data_loc. Lets retrievers enumerate the candidate steps
+of a data point's dependencies without loading the dependency files.
+"""
+
+from __future__ import annotations
+from typing import Iterator
+
+import sys, os
+import pickle
+import hashlib
+import argparse
+from pathlib import Path
+from dataclasses import dataclass
+
+from tqdm import tqdm
+
+from data_management.dataset_file import DatasetFile, StepID, DATA_POINTS_NAME
+from data_management.sentence_db import SentenceDB
+from proof_retrieval.proof_idx import ProofStateIdx
+from util.util import get_basic_logger
+
+_logger = get_basic_logger(__name__)
+
+
+@dataclass
+class DPProofTable:
+    # (proof_idx, number of steps, offset of the proof's first step hash)
+    proofs: list[tuple[int, int, int]]
+    # ProofStateIdx hash of every step of every proof.
+    step_hashes: list[int]
+
+    @classmethod
+    def from_dp(cls, dp_obj: DatasetFile) -> DPProofTable:
+        proofs: list[tuple[int, int, int]] = []
+        step_hashes: list[int] = []
+        for proof in dp_obj.proofs:
+            proofs.append((proof.proof_idx, len(proof.steps), len(step_hashes)))
+            for i in range(len(proof.steps)):
+                step_hashes.append(
+                    ProofStateIdx.hash_proof_step(i, proof, dp_obj.dp_name)
+                )
+        return cls(proofs, step_hashes)
+
+
+class DependencyIndex:
+    INDEX_NAME = "dependency-index.pkl"
+    # Bump when the stored tables or step hashes change.
+    VERSION = 1
+
+    def __init__(
+        self,
+        dependencies: dict[str, list[str]],
+        proof_tables: dict[str, DPProofTable],
+        fingerprint: str,
+    ) -> None:
+        # Dependencies of each data point that exist in the data_loc, in order.
+        self.dependencies = dependencies
+        self.proof_tables = proof_tables
+        # get_fingerprint of the data_loc the index was built from.
+        self.fingerprint = fingerprint
+
+    def contains(self, dp_name: str) -> bool:
+        return dp_name in self.dependencies
+
+    def iter_dep_steps(self, dp_name: str) -> Iterator[tuple[StepID, int]]:
+        """
+        Every step of every proof in the dependencies of dp_name, in the
+        order of get_available_proofs, with its ProofStateIdx hash.
+        """
+        for dep in self.dependencies[dp_name]:
+            proof_table = self.proof_tables[dep]
+            for proof_idx, num_steps, hash_offset in proof_table.proofs:
+                for i in range(num_steps):
+                    yield (
+                        StepID(dep, proof_idx, i),
+                        proof_table.step_hashes[hash_offset + i],
+                    )
+
+    def num_dep_steps(self, dp_name: str) -> int:
+        return sum(
+            len(self.proof_tables[dep].step_hashes)
+            for dep in self.dependencies[dp_name]
+        )
+
+    def save(self, path: Path) -> None:
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with tmp_path.open("wb") as fout:
+            pickle.dump(
+                {
+                    "dependencies": self.dependencies,
+                    "proof_tables": self.proof_tables,
+                    "fingerprint": self.fingerprint,
+                },
+                fout,
+            )
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def get_index_loc(data_loc: Path) -> Path:
+        return data_loc / DependencyIndex.INDEX_NAME
+
+    @classmethod
+    def get_fingerprint(cls, data_loc: Path) -> str:
+        """Hash of the name, size and modification time of every data point."""
+        m = hashlib.sha256(str(cls.VERSION).encode())
+        for dp_loc in sorted((data_loc / DATA_POINTS_NAME).iterdir()):
+            stat = dp_loc.stat()
+            m.update(f"{dp_loc.name}\0{stat.st_size}\0{stat.st_mtime_ns}\0".encode())
+        return m.hexdigest()
+
+    @classmethod
+    def load(cls, path: Path) -> DependencyIndex:
+        with path.open("rb") as fin:
+            index_data = pickle.load(fin)
+        # Indices saved without a fingerprint never match a data_loc.
+        return cls(
+            index_data["dependencies"],
+            index_data["proof_tables"],
+            index_data.get("fingerprint", ""),
+        )
+
+    @classmethod
+    def load_or_build(cls, data_loc: Path, sentence_db: SentenceDB) -> DependencyIndex:
+        """
+        The saved index of data_loc if it was built from the current data
+        points. Otherwise the index is rebuilt and saved.
+        """
+        index_loc = cls.get_index_loc(data_loc)
+        if index_loc.exists():
+            index = cls.load(index_loc)
+            if index.fingerprint == cls.get_fingerprint(data_loc):
+                return index
+            _logger.warning(f"{index_loc} is out of date. Rebuilding it.")
+        index = cls.build(data_loc, sentence_db)
+        index.save(index_loc)
+        return index
+
+    @classmethod
+    def build(cls, data_loc: Path, sentence_db: SentenceDB) -> DependencyIndex:
+        # Data points changed while building make the index out of date.
+        fingerprint = cls.get_fingerprint(data_loc)
+        all_dependencies: dict[str, list[str]] = {}
+        proof_tables: dict[str, DPProofTable] = {}
+        for dp_loc in tqdm(sorted((data_loc / DATA_POINTS_NAME).iterdir())):
+            dp_obj = DatasetFile.load(dp_loc, sentence_db)
+            all_dependencies[dp_loc.name] = dp_obj.dependencies
+            proof_tables[dp_loc.name] = DPProofTable.from_dp(dp_obj)
+
+        missing_deps: set[str] = set()
+        for dp_name, dependencies in all_dependencies.items():
+            found_deps: list[str] = []
+            for dep in dependencies:
+                if dep in proof_tables:
+                    found_deps.append(dep)
+                else:
+                    missing_deps.add(dep)
+            all_dependencies[dp_name] = found_deps
+        for dep in sorted(missing_deps):
+            _logger.warning(f"Could not find dependency: {dep}")
+        return cls(all_dependencies, proof_tables, fingerprint)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Build the dependency index of a data_loc."
+    )
+    parser.add_argument("data_loc", help="Location of the data points.")
+    parser.add_argument("sentence_db_loc", help="Location of the sentence db.")
+    args = parser.parse_args(sys.argv[1:])
+
+    data_loc = Path(args.data_loc)
+    sentence_db = SentenceDB.load(Path(args.sentence_db_loc), read_only=True)
+    index = DependencyIndex.build(data_loc, sentence_db)
+    index.save(DependencyIndex.get_index_loc(data_loc))
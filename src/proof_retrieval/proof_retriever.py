@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Any, Optional
+from typing import Any, Iterable, Iterator, Optional
 import functools
 from dataclasses import dataclass
 import requests
@@ -18,15 +18,27 @@ from data_management.dataset_file import (
     Proof,
     DatasetFile,
     DPCache,
+    get_process_dp_cache,
     Goal,
     StepID,
 )
 from proof_retrieval.retrieved_proof_db import RetrievedProofDB
-from proof_retrieval.proof_idx import ProofIdx
-from proof_retrieval.tfidf import tf_idf
-from proof_retrieval.bm25 import bm25
+from proof_retrieval.proof_idx import ProofIdx, ProofStateIdx
+from proof_retrieval.dependency_index import DependencyIndex
+from proof_retrieval.sparse_index import (
+    ProofStepIndex,
+    PrefixIndex,
+    ClosureStatsCache,
+    IndexPart,
+    closure_stats,
+    get_goals_ids,
+    bm25_scores,
+    tf_idf_scores,
+    rank_docs,
+)
 
 from util.util import FlexibleUrl
+from util.ranking import iter_ranked_indices
 from util.constants import PROOF_VECTOR_DB_METADATA, RANGO_LOGGER
 
 import logging
@@ -49,25 +61,43 @@ class SparseKind(Enum):
                 raise ValueError(f"Unknown sparse kind: {s}")
 
 
-def get_steps_from_cache(
-    cached_proofs: Optional[RetrievedProofDB],
+def resolve_step_proofs(
+    step_ids: Iterable[StepID],
+    dp_obj: DatasetFile,
     dp_cache: DPCache,
     data_loc: Path,
     sentence_db: SentenceDB,
-    step_idx: int,
-    proof: Proof,
-    dp_obj: DatasetFile,
-) -> Optional[list[tuple[Proof, StepID]]]:
-    if cached_proofs is None:
-        return None
-    cached_result = cached_proofs.get_steps(step_idx, proof.proof_idx, dp_obj)
-    if cached_result is None:
-        return None
-    return_steps: list[tuple[Proof, StepID]] = []
-    for step_id in cached_result:
-        ref_dp = dp_cache.get_dp(step_id.file, data_loc, sentence_db)
-        return_steps.append((ref_dp.proofs[step_id.proof_idx], step_id))
-    return return_steps
+) -> Iterator[tuple[Proof, StepID]]:
+    """
+    Each step with its proof. The data point of a step is only loaded
+    when the step is reached, so callers that stop early load less.
+    """
+    for step_id in step_ids:
+        if step_id.file == dp_obj.dp_name:
+            ref_dp = dp_obj
+        else:
+            ref_dp = dp_cache.get_dp(step_id.file, data_loc, sentence_db)
+        yield ref_dp.proofs[step_id.proof_idx], step_id
+
+
+def take_num_proofs(
+    step_ids: Iterable[StepID], num_proofs: Optional[int]
+) -> list[StepID]:
+    """Steps up to (and including) the first step of the num_proofs-th distinct proof."""
+    if num_proofs is None:
+        return list(step_ids)
+    taken_steps: list[StepID] = []
+    distinct_proofs: set[tuple[str, int]] = set()
+    for step_id in step_ids:
+        if num_proofs <= len(distinct_proofs):
+            break
+        distinct_proofs.add((step_id.file, step_id.proof_idx))
+        taken_steps.append(step_id)
+    return taken_steps
+
+
+# Number of dependency indices a sparse retriever keeps.
+DEP_INDEX_CACHE_SIZE = 256
 
 
 @dataclass
@@ -78,6 +108,7 @@ class SparseProofRetrieverConf:
     sentence_db_loc: Path
     cached_proof_loc: Optional[Path]
     first_step_only: bool
+    dep_index_cache_size: int = DEP_INDEX_CACHE_SIZE
     ALIAS = "sparse"
 
     @classmethod
@@ -94,12 +125,25 @@ class SparseProofRetrieverConf:
             Path(yaml_data["sentence_db_loc"]),
             cached_proof_loc,
             yaml_data.get("first_step_only", False),
+            yaml_data.get("dep_index_cache_size", DEP_INDEX_CACHE_SIZE),
         )
 
 
 __logged_deps: set[str] = set()
 
 
+def load_dependency(
+    dep: str, dp_cache: DPCache, data_loc: Path, sentence_db: SentenceDB
+) -> Optional[DatasetFile]:
+    try:
+        return dp_cache.get_dp(dep, data_loc, sentence_db)
+    except FileNotFoundError:
+        if dep not in __logged_deps:
+            _logger.warning(f"Could not find dependency: {dep}")
+            __logged_deps.add(dep)
+        return None
+
+
 def get_available_proofs(
     key_proof: Proof,
     dp_obj: DatasetFile,
@@ -115,12 +159,8 @@ def get_available_proofs(
 
     # print("Dependencies", dp_obj.dependencies)
     for dep in dp_obj.dependencies:
-        try:
-            dep_obj = dp_cache.get_dp(dep, data_loc, sentence_db)
-        except FileNotFoundError:
-            if dep not in __logged_deps:
-                _logger.warning(f"Could not find dependency: {dep}")
-                __logged_deps.add(dep)
+        dep_obj = load_dependency(dep, dp_cache, data_loc, sentence_db)
+        if dep_obj is None:
             continue
         for proof in dep_obj.proofs:
             available_proofs.append((proof, dep_obj))
@@ -136,6 +176,7 @@ class SparseProofRetriever:
         sentence_db: SentenceDB,
         cached_proofs: Optional[RetrievedProofDB],
         first_step_only: bool,
+        dep_index_cache_size: int = DEP_INDEX_CACHE_SIZE,
     ) -> None:
         self.kind = kind
         self.max_examples = max_examples
@@ -143,78 +184,135 @@ class SparseProofRetriever:
         self.sentence_db = sentence_db
         self.cached_proofs = cached_proofs
         self.first_step_only = first_step_only
-        self.dp_cache = DPCache(cache_size=512)
+        self.dp_cache = get_process_dp_cache()
+        # Least recently used indices of single dependencies.
+        self.dep_index_cache_size = dep_index_cache_size
+        self.dep_indices: dict[str, ProofStepIndex] = {}
+        self.prefix_index: Optional[PrefixIndex] = None
+        self.closure_stats_cache = ClosureStatsCache()
 
     def get_goal_ids(self, goals: list[Goal]) -> list[str]:
-        ids: list[str] = []
-        for g in goals:
-            hyp_ids, goal_ids = g.get_ids()
-            ids.extend(hyp_ids)
-            ids.extend(goal_ids)
-        return ids
+        return get_goals_ids(goals)
+
+    def get_dep_index(self, dep: str) -> Optional[ProofStepIndex]:
+        if dep in self.dep_indices:
+            dep_index = self.dep_indices.pop(dep)
+            self.dep_indices[dep] = dep_index
+            return dep_index
+        dep_obj = load_dependency(dep, self.dp_cache, self.data_loc, self.sentence_db)
+        if dep_obj is None:
+            return None
+        dep_index = ProofStepIndex.from_proofs(dep, dep_obj.proofs)
+        self.dep_indices[dep] = dep_index
+        if self.dep_index_cache_size < len(self.dep_indices):
+            del self.dep_indices[next(iter(self.dep_indices))]
+        return dep_index
+
+    def get_prefix_part(
+        self, proof: Proof, dp_obj: DatasetFile
+    ) -> tuple[ProofStepIndex, int]:
+        in_file_proofs: list[Proof] = []
+        for in_file_proof in dp_obj.proofs:
+            if in_file_proof == proof:
+                break
+            in_file_proofs.append(in_file_proof)
+        if self.prefix_index is None or (
+            self.prefix_index.step_index.dp_name != dp_obj.dp_name
+        ):
+            self.prefix_index = PrefixIndex(dp_obj.dp_name)
+        limit = self.prefix_index.update(in_file_proofs)
+        return self.prefix_index.step_index, limit
+
+    def get_dep_indices(self, dp_obj: DatasetFile) -> list[ProofStepIndex]:
+        dep_indices: list[ProofStepIndex] = []
+        for dep in dp_obj.dependencies:
+            dep_index = self.get_dep_index(dep)
+            if dep_index is None:
+                continue
+            dep_indices.append(dep_index)
+        return dep_indices
 
-    def get_similar_proof_steps(
+    def get_similar_step_ids(
         self,
         step_idx: int,
         proof: Proof,
         dp_obj: DatasetFile,
         training: bool,
+        k: Optional[int] = None,
         **kwargs: Any,
-    ) -> list[tuple[Proof, StepID]]:
+    ) -> list[StepID]:
+        """
+        Ranked steps, stopping at the first step of the max_examples-th
+        (or k-th, if smaller) distinct proof.
+        """
         if self.first_step_only:
             step_idx = 0
-        if training:
-            cache_result = get_steps_from_cache(
-                self.cached_proofs,
-                self.dp_cache,
-                self.data_loc,
-                self.sentence_db,
-                step_idx,
-                proof,
-                dp_obj,
+        if training and self.cached_proofs is not None:
+            cache_result = self.cached_proofs.get_steps(
+                step_idx, proof.proof_idx, dp_obj
             )
             if cache_result is not None:
-                return cache_result
+                return take_num_proofs(cache_result, k)
         key_step = proof.steps[step_idx]
         if len(key_step.goals) == 0:
             return []
         query_ids = self.get_goal_ids(key_step.goals)
-        available_proofs = get_available_proofs(
-            proof, dp_obj, self.dp_cache, self.data_loc, self.sentence_db
-        )
-        reference_proofs: list[Proof] = []
-        reference_dp_files: list[DatasetFile] = []
-        reference_step_idxs: list[int] = []
-        docs: list[list[str]] = []
-        for ref_proof, ref_dp in available_proofs:
-            for s_idx, step in enumerate(ref_proof.steps):
-                reference_dp_files.append(ref_dp)
-                reference_proofs.append(ref_proof)
-                reference_step_idxs.append(s_idx)
-                docs.append(self.get_goal_ids(step.goals))
-        assert len(docs) == len(reference_proofs)
+
+        # The in-file prefix comes first, as in get_available_proofs.
+        prefix_index, prefix_limit = self.get_prefix_part(proof, dp_obj)
+        dep_indices = self.get_dep_indices(dp_obj)
+        closure = [(prefix_index, prefix_limit)] + [
+            (d, d.index.num_docs) for d in dep_indices
+        ]
+        parts: list[IndexPart] = [(s.index, limit) for s, limit in closure]
+        dep_stats = self.closure_stats_cache.get_stats(dep_indices)
+        stats = closure_stats(query_ids, parts[:1], dep_stats)
         match self.kind:
             case SparseKind.TFIDF:
-                scores = tf_idf(query_ids, docs)
+                scores = tf_idf_scores(query_ids, parts, stats)
             case SparseKind.BM25:
-                scores = bm25(query_ids, docs)
-        arg_sorted_scores = sorted(range(len(scores)), key=lambda idx: -1 * scores[idx])
+                scores = bm25_scores(query_ids, parts, stats)
 
-        references = list(
-            zip(reference_proofs, reference_dp_files, reference_step_idxs)
-        )
-        similar_proof_steps: list[tuple[Proof, StepID]] = []
+        num_proofs = self.max_examples if k is None else min(self.max_examples, k)
+        similar_step_ids: list[StepID] = []
         distinct_proofs: set[tuple[str, int]] = set()
-        for proof_idx in arg_sorted_scores:
-            ref_proof, ref_dp, ref_step_idx = references[proof_idx]
-            key = (ref_dp.dp_name, ref_proof.proof_idx)
-            distinct_proofs.add(key)
-            similar_proof_steps.append(
-                (ref_proof, StepID(ref_dp.dp_name, ref_proof.proof_idx, ref_step_idx))
+        for part_idx, doc_id in rank_docs(scores, parts):
+            step_index, _ = closure[part_idx]
+            ref_proof_idx, ref_step_idx = step_index.step_refs[doc_id]
+            distinct_proofs.add((step_index.dp_name, ref_proof_idx))
+            similar_step_ids.append(
+                StepID(step_index.dp_name, ref_proof_idx, ref_step_idx)
             )
-            if self.max_examples <= len(distinct_proofs):
+            if num_proofs <= len(distinct_proofs):
                 break
-        return similar_proof_steps
+        return similar_step_ids
+
+    def iter_similar_proof_steps(
+        self,
+        step_idx: int,
+        proof: Proof,
+        dp_obj: DatasetFile,
+        training: bool,
+        k: Optional[int] = None,
+        **kwargs: Any,
+    ) -> Iterator[tuple[Proof, StepID]]:
+        step_ids = self.get_similar_step_ids(step_idx, proof, dp_obj, training, k=k)
+        return resolve_step_proofs(
+            step_ids, dp_obj, self.dp_cache, self.data_loc, self.sentence_db
+        )
+
+    def get_similar_proof_steps(
+        self,
+        step_idx: int,
+        proof: Proof,
+        dp_obj: DatasetFile,
+        training: bool,
+        k: Optional[int] = None,
+        **kwargs: Any,
+    ) -> list[tuple[Proof, StepID]]:
+        return list(
+            self.iter_similar_proof_steps(step_idx, proof, dp_obj, training, k=k)
+        )
 
     def get_similar_proofs(
         self,
@@ -222,10 +320,11 @@ class SparseProofRetriever:
         key_proof: Proof,
         dp_obj: DatasetFile,
         training: bool,
+        k: Optional[int] = None,
         **kwargs: Any,
     ) -> list[Proof]:
         similar_proof_steps = self.get_similar_proof_steps(
-            key_step_idx, key_proof, dp_obj, training
+            key_step_idx, key_proof, dp_obj, training, k=k
         )
         similar_proofs: list[Proof] = []
         distinct_proofs: set[tuple[str, int]] = set()
@@ -246,9 +345,10 @@ class SparseProofRetriever:
             SparseKind.from_str(conf.kind),
             conf.max_examples,
             conf.data_loc,
-            SentenceDB.load(conf.sentence_db_loc),
+            SentenceDB.load(conf.sentence_db_loc, read_only=True),
             cached_proofs,
             conf.first_step_only,
+            conf.dep_index_cache_size,
         )
 
 
@@ -325,6 +425,7 @@ class DeepProofRetrieverClient:
         data_loc: Path,
         max_num_proofs: int,
         first_step_only: bool,
+        dep_index: Optional[DependencyIndex] = None,
     ):
         self.urls = urls
         self.proof_idx = proof_idx
@@ -332,7 +433,8 @@ class DeepProofRetrieverClient:
         self.sentence_db = sentence_db
         self.max_num_proofs = max_num_proofs
         self.first_step_only = first_step_only
-        self.dp_cache = DPCache()
+        self.dep_index = dep_index
+        self.dp_cache = get_process_dp_cache()
         self.session = requests.Session()
 
     def get_available_proofs(
@@ -342,14 +444,43 @@ class DeepProofRetrieverClient:
             key_proof, dp_obj, self.dp_cache, self.data_loc, self.sentence_db
         )
 
-    def get_similar_proof_steps(
+    def get_available_step_hashes(
+        self, key_proof: Proof, dp_obj: DatasetFile
+    ) -> list[tuple[StepID, int]]:
+        """
+        The steps of get_available_proofs with their proof_idx hashes.
+        Uses the dependency index, if there is one, instead of loading
+        the dependencies of dp_obj.
+        """
+        if self.dep_index is None or not self.dep_index.contains(dp_obj.dp_name):
+            return [
+                (
+                    StepID(p_obj.dp_name, p.proof_idx, i),
+                    self.proof_idx.hash_proof_step(i, p, p_obj.dp_name),
+                )
+                for p, p_obj in self.get_available_proofs(key_proof, dp_obj)
+                for i in range(len(p.steps))
+            ]
+        step_hashes: list[tuple[StepID, int]] = []
+        for p in dp_obj.proofs:
+            if p == key_proof:
+                break
+            for i in range(len(p.steps)):
+                step_hashes.append(
+                    (
+                        StepID(dp_obj.dp_name, p.proof_idx, i),
+                        self.proof_idx.hash_proof_step(i, p, dp_obj.dp_name),
+                    )
+                )
+        step_hashes.extend(self.dep_index.iter_dep_steps(dp_obj.dp_name))
+        return step_hashes
+
+    def get_step_scores(
         self,
         step_idx: int,
         proof: Proof,
         dp_obj: DatasetFile,
-        training: bool,
-        **kwargs: Any,
-    ) -> list[tuple[Proof, StepID]]:
+    ) -> tuple[list[StepID], list[float]]:
         if self.first_step_only:
             step_idx = 0
         hashed_step_idx = self.proof_idx.hash_proof_step(
@@ -361,21 +492,18 @@ class DeepProofRetrieverClient:
             query_step_idx = None
         # HARD CODED
         goal_str = ProofDBQuery(step_idx, proof, dp_obj.dp_name).format()
-        available_proofs_and_objs = self.get_available_proofs(proof, dp_obj)
+        available_step_hashes = self.get_available_step_hashes(proof, dp_obj)
         available_proof_idxs: list[int] = []
-        available_proof_steps: list[tuple[Proof, StepID]] = []
-        for p, dep_obj in available_proofs_and_objs:
-            for i, step in enumerate(p.steps):
-                try:
-                    step_hash = self.proof_idx.hash_proof_step(i, p, dep_obj.dp_name)
-                    step_idx = self.proof_idx.get_idx(step_hash)
-                    available_proof_idxs.append(step_idx)
-                    available_proof_steps.append(
-                        (p, StepID(dep_obj.dp_name, p.proof_idx, i))
-                    )
-                except KeyError:
-                    _logger.error(f"Could not find step {i} in {dep_obj.dp_name}")
-                    return []
+        available_steps: list[StepID] = []
+        for step_id, step_hash in available_step_hashes:
+            try:
+                available_proof_idxs.append(self.proof_idx.get_idx(step_hash))
+                available_steps.append(step_id)
+            except KeyError:
+                _logger.error(
+                    f"Could not find step {step_id.step_idx} in {step_id.file}"
+                )
+                return [], []
 
         request_url = random.choice(self.urls)
         request_data = {
@@ -386,14 +514,57 @@ class DeepProofRetrieverClient:
         }
         response = self.session.post(request_url, json=request_data).json()
         scores = response["result"]
-        assert len(available_proof_steps) == len(scores)
-        similar_proof_steps = sorted(
-            range(len(available_proof_steps)), key=lambda idx: -1 * scores[idx]
+        assert len(available_steps) == len(scores)
+        return available_steps, scores
+
+    def get_similar_step_ids(
+        self,
+        step_idx: int,
+        proof: Proof,
+        dp_obj: DatasetFile,
+        training: bool,
+        k: Optional[int] = None,
+        **kwargs: Any,
+    ) -> list[StepID]:
+        """
+        Ranked ids of the available steps. With k, only ranks until the
+        first step of the k-th distinct proof. With the dependency index,
+        no dependency is loaded.
+        """
+        available_steps, scores = self.get_step_scores(step_idx, proof, dp_obj)
+        ranked_steps = (available_steps[i] for i in iter_ranked_indices(scores))
+        return take_num_proofs(ranked_steps, k)
+
+    def iter_similar_proof_steps(
+        self,
+        step_idx: int,
+        proof: Proof,
+        dp_obj: DatasetFile,
+        training: bool,
+        k: Optional[int] = None,
+        **kwargs: Any,
+    ) -> Iterator[tuple[Proof, StepID]]:
+        """
+        Ranked steps with their proofs. A step's data point is only loaded
+        when the step is reached.
+        """
+        step_ids = self.get_similar_step_ids(step_idx, proof, dp_obj, training, k=k)
+        return resolve_step_proofs(
+            step_ids, dp_obj, self.dp_cache, self.data_loc, self.sentence_db
+        )
+
+    def get_similar_proof_steps(
+        self,
+        step_idx: int,
+        proof: Proof,
+        dp_obj: DatasetFile,
+        training: bool,
+        k: Optional[int] = None,
+        **kwargs: Any,
+    ) -> list[tuple[Proof, StepID]]:
+        return list(
+            self.iter_similar_proof_steps(step_idx, proof, dp_obj, training, k=k)
         )
-        similar_steps: list[tuple[Proof, StepID]] = []
-        for i in similar_proof_steps:
-            similar_steps.append(available_proof_steps[i])
-        return similar_steps
 
     def get_similar_proofs(
         self,
@@ -401,20 +572,27 @@ class DeepProofRetrieverClient:
         key_proof: Proof,
         dp_obj: DatasetFile,
         training: bool,
+        k: Optional[int] = None,
         **kwargs: Any,
     ) -> list[Proof]:
-        similar_proof_steps = self.get_similar_proof_steps(
-            key_step_idx, key_proof, dp_obj, training
-        )
+        available_steps, scores = self.get_step_scores(key_step_idx, key_proof, dp_obj)
+        num_proofs = self.max_num_proofs if k is None else min(self.max_num_proofs, k)
         similar_proofs: list[Proof] = []
         seen_proofs: set[str] = set()
-        for p, i in similar_proof_steps:
+        ranked_steps = resolve_step_proofs(
+            (available_steps[i] for i in iter_ranked_indices(scores)),
+            dp_obj,
+            self.dp_cache,
+            self.data_loc,
+            self.sentence_db,
+        )
+        for p, _ in ranked_steps:
             proof_key = p.proof_text_to_string()
             if proof_key in seen_proofs:
                 continue
             seen_proofs.add(proof_key)
             similar_proofs.append(p)
-            if self.max_num_proofs <= len(similar_proofs):
+            if num_proofs <= len(similar_proofs):
                 break
         return similar_proofs
 
@@ -424,7 +602,13 @@ class DeepProofRetrieverClient:
         with metadata_loc.open("rb") as fin:
             metadata = pickle.load(fin)
         proof_idx = metadata["proof_idx"]
-        sentence_db = SentenceDB.load(conf.sentence_db_loc)
+        sentence_db = SentenceDB.load(conf.sentence_db_loc, read_only=True)
+        # The dependency index stores ProofStateIdx hashes.
+        dep_index_loc = DependencyIndex.get_index_loc(conf.data_loc)
+        if isinstance(proof_idx, ProofStateIdx) and dep_index_loc.exists():
+            dep_index = DependencyIndex.load_or_build(conf.data_loc, sentence_db)
+        else:
+            dep_index = None
         return cls(
             [u.get_url() for u in conf.urls],
             proof_idx,
@@ -432,6 +616,7 @@ class DeepProofRetrieverClient:
             conf.data_loc,
             conf.max_num_proofs,
             conf.first_step_only,
+            dep_index,
         )
 
 
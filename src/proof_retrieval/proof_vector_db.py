@@ -14,7 +14,7 @@ import multiprocessing
 from proof_retrieval.proof_retriever import ProofDBQuery
 from proof_retrieval.proof_idx import ProofIdx, ProofStateIdx
 from proof_retrieval.proof_ret_model import ProofRetrievalModel
-from util.vector_db_utils import get_embs, get, get_page_loc
+from util.vector_db_utils import EmbeddingMatrix, get_embs, get, get_page_loc
 from util.util import get_basic_logger
 
 from data_management.sentence_db import SentenceDB
@@ -94,6 +94,9 @@ class ProofVectorDB:
         self.source = source
         self.proof_idx = proof_idx
         self.device = "cpu"
+        self.emb_matrix: Optional[EmbeddingMatrix] = None
+        if EmbeddingMatrix.exists(db_loc):
+            self.emb_matrix = EmbeddingMatrix.load_checked(db_loc, page_size, None)
 
     def save(self, path: Path):
         metadata = {
@@ -106,6 +109,8 @@ class ProofVectorDB:
             fout.write(pickle.dumps(metadata))
 
     def get_embs(self, idxs: list[int]) -> Optional[torch.Tensor]:
+        if self.emb_matrix is not None:
+            return self.emb_matrix.get_embs(idxs, self.device)
         return get_embs(idxs, self.page_size, self.db_loc, self.device)
 
     @classmethod
@@ -14,6 +14,7 @@ from proof_retrieval.proof_retriever import (
 from proof_retrieval.retrieved_proof_db import RetrievedProofDB
 from concurrent.futures import ProcessPoolExecutor, Future, as_completed
 from data_management.splits import DataSplit, get_all_files, FileInfo
+from data_management.sentence_db import get_warmup_command
 
 from util.constants import RANGO_LOGGER
 from util.slurm import (
@@ -95,7 +96,7 @@ if __name__ == "__main__":
             run_local(worker_command, n_workers)
         case SlurmJobConf(_, slurm_conf):
             commands = [
-                f"cp -r {conf.sentence_db_loc} /tmp/{conf.sentence_db_loc.name}",
+                get_warmup_command(conf.sentence_db_loc),
                 worker_command,
             ]
             slurm_conf.write_script(
@@ -43,11 +43,9 @@ def process_f_info(
     for proof_idx, proof in enumerate(file_dp.proofs):
         for step_idx, step in enumerate(proof.steps):
             step_id = StepID(file_dp.dp_name, proof_idx, step_idx)
-            retrieved_steps = proof_retriever.get_similar_proof_steps(
+            file_page_dict[step_id] = proof_retriever.get_similar_step_ids(
                 step_idx, proof, file_dp, training=False
             )
-            retrieved_step_ids = [step_id for _, step_id in retrieved_steps]
-            file_page_dict[step_id] = retrieved_step_ids
     new_page = ProofDBPage(file_page_dict)
     with open(save_loc / f_info.dp_name, "w") as f:
         json.dump(new_page.to_json(), f, indent=2)
@@ -61,7 +59,7 @@ if __name__ == "__main__":
     conf = ProofDBCreatorConf.load(conf_loc)
     queue = FileQueue(queue_loc)
 
-    sentence_db = SentenceDB.load(conf.sentence_db_loc)
+    sentence_db = SentenceDB.load(conf.sentence_db_loc, read_only=True)
     proof_ret_conf, next_num, commands = proof_conf_to_client_conf(
         conf.proof_retriever_conf, 0
     )
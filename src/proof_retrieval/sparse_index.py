@@ -0,0 +1,281 @@
+from __future__ import annotations
+from typing import Iterator, Optional
+import math
+import heapq
+import bisect
+
+from data_management.dataset_file import Goal, Proof
+from proof_retrieval.bm25 import CorpusStats, compute_term_freqs
+
+
+def get_goals_ids(goals: list[Goal]) -> list[str]:
+    ids: list[str] = []
+    for g in goals:
+        hyp_ids, goal_ids = g.get_ids()
+        ids.extend(hyp_ids)
+        ids.extend(goal_ids)
+    return ids
+
+
+class InvertedIndex:
+    def __init__(self) -> None:
+        # term -> [(doc_id, term_freq)] with increasing doc ids
+        self.postings: dict[str, list[tuple[int, int]]] = {}
+        self.doc_lens: list[int] = []
+        self.len_prefix: list[int] = [0]
+
+    @property
+    def num_docs(self) -> int:
+        return len(self.doc_lens)
+
+    def add_doc(self, doc: list[str]) -> int:
+        doc_id = len(self.doc_lens)
+        for term, freq in compute_term_freqs(doc).items():
+            if term not in self.postings:
+                self.postings[term] = []
+            self.postings[term].append((doc_id, freq))
+        self.doc_lens.append(len(doc))
+        self.len_prefix.append(self.len_prefix[-1] + len(doc))
+        return doc_id
+
+    def get_postings(self, term: str, limit: int) -> list[tuple[int, int]]:
+        """Postings of the term restricted to documents with id < limit."""
+        if term not in self.postings:
+            return []
+        term_postings = self.postings[term]
+        if limit < self.num_docs:
+            end = bisect.bisect_left(term_postings, limit, key=lambda p: p[0])
+            return term_postings[:end]
+        return term_postings
+
+    def doc_freq(self, term: str, limit: int) -> int:
+        return len(self.get_postings(term, limit))
+
+    def total_len(self, limit: int) -> int:
+        return self.len_prefix[limit]
+
+    def get_stats(self, limit: int) -> CorpusStats:
+        doc_freqs: dict[str, int] = {}
+        for term in self.postings:
+            term_freq = self.doc_freq(term, limit)
+            if 0 < term_freq:
+                doc_freqs[term] = term_freq
+        return CorpusStats(limit, self.total_len(limit), doc_freqs)
+
+
+class ProofStepIndex:
+    """
+    Inverted index over the goal ids of every step of every proof in a
+    data file. Documents are added in proof order so that the steps of
+    the first n proofs are exactly the documents with id < proof_offsets[n].
+    """
+
+    def __init__(self, dp_name: str) -> None:
+        self.dp_name = dp_name
+        self.index = InvertedIndex()
+        self.step_refs: list[tuple[int, int]] = []
+        self.proof_offsets: list[int] = [0]
+
+    @property
+    def num_proofs(self) -> int:
+        return len(self.proof_offsets) - 1
+
+    def add_proof(self, proof: Proof) -> None:
+        for step_idx, step in enumerate(proof.steps):
+            self.index.add_doc(get_goals_ids(step.goals))
+            self.step_refs.append((proof.proof_idx, step_idx))
+        self.proof_offsets.append(self.index.num_docs)
+
+    def docs_before(self, num_proofs: int) -> int:
+        return self.proof_offsets[num_proofs]
+
+    @classmethod
+    def from_proofs(cls, dp_name: str, proofs: list[Proof]) -> ProofStepIndex:
+        step_index = cls(dp_name)
+        for proof in proofs:
+            step_index.add_proof(proof)
+        return step_index
+
+
+# An index together with the number of its documents visible to a query.
+IndexPart = tuple[InvertedIndex, int]
+
+
+def closure_stats(
+    terms: list[str], parts: list[IndexPart], base: Optional[CorpusStats] = None
+) -> CorpusStats:
+    """
+    Statistics of the parts (plus the base corpus, if given) restricted
+    to the given terms.
+    """
+    stats = CorpusStats.empty()
+    if base is not None:
+        stats.num_docs = base.num_docs
+        stats.total_len = base.total_len
+    for index, limit in parts:
+        stats.num_docs += limit
+        stats.total_len += index.total_len(limit)
+    for term in terms:
+        term_freq = sum(index.doc_freq(term, limit) for index, limit in parts)
+        if base is not None:
+            term_freq += base.doc_freqs.get(term, 0)
+        if 0 < term_freq:
+            stats.doc_freqs[term] = term_freq
+    return stats
+
+
+class ClosureStatsCache:
+    """
+    Corpus statistics of whole data files keyed by the set of files.
+    A dependency closure is shared by every proof of a file, so its
+    statistics are merged once and reused by every query.
+    """
+
+    def __init__(self, cache_size: int = 16) -> None:
+        self.__cache_size = cache_size
+        self.__cached_stats: dict[frozenset[str], CorpusStats] = {}
+
+    def get_stats(self, step_indices: list[ProofStepIndex]) -> CorpusStats:
+        key = frozenset(s.dp_name for s in step_indices)
+        if key in self.__cached_stats:
+            stats = self.__cached_stats.pop(key)
+            self.__cached_stats[key] = stats
+            return stats
+        stats = CorpusStats.empty()
+        for step_index in step_indices:
+            stats.add(step_index.index.get_stats(step_index.index.num_docs))
+        self.__cached_stats[key] = stats
+        if self.__cache_size < len(self.__cached_stats):
+            del self.__cached_stats[next(iter(self.__cached_stats))]
+        return stats
+
+
+class PrefixIndex:
+    """
+    Index over the proofs of the current file that come before the queried
+    proof. Queries usually walk a file in order, so the prefix is extended
+    one proof at a time instead of being rebuilt.
+    """
+
+    def __init__(self, dp_name: str) -> None:
+        self.step_index = ProofStepIndex(dp_name)
+        self.proof_ids: list[str] = []
+
+    def __matches(self, proofs: list[Proof]) -> bool:
+        num_shared = min(len(proofs), len(self.proof_ids))
+        if 0 == num_shared:
+            return True
+        last_idx = num_shared - 1
+        return self.proof_ids[last_idx] == proofs[last_idx].proof_text_id()
+
+    def update(self, proofs: list[Proof]) -> int:
+        """Returns the number of documents covering the given prefix."""
+        if not self.__matches(proofs):
+            self.step_index = ProofStepIndex(self.step_index.dp_name)
+            self.proof_ids = []
+        for proof in proofs[len(self.proof_ids) :]:
+            self.step_index.add_proof(proof)
+            self.proof_ids.append(proof.proof_text_id())
+        return self.step_index.docs_before(len(proofs))
+
+
+def bm25_scores(
+    query: list[str],
+    parts: list[IndexPart],
+    stats: Optional[CorpusStats] = None,
+    k1: float = 1.8,
+    b: float = 0.75,
+) -> dict[tuple[int, int], float]:
+    """
+    Same scores as bm25() over the concatenation of the parts' documents,
+    computed only for the documents that share a term with the query.
+    Keys are (part_idx, doc_id). Stats default to those of the parts.
+    """
+    unique_terms = list(dict.fromkeys(query))
+    if stats is None:
+        stats = closure_stats(unique_terms, parts)
+    num_docs = stats.num_docs
+    doc_freqs = stats.doc_freqs
+    if 0 == num_docs or 0 == stats.total_len:
+        return {}
+    avg_doc_len = stats.avg_doc_len
+    term_scores: dict[str, list[tuple[tuple[int, int], float]]] = {}
+    for term in unique_terms:
+        if term not in doc_freqs:
+            continue
+        query_idf = math.log(
+            (num_docs - doc_freqs[term] + 0.5) / (doc_freqs[term] + 0.5) + 1
+        )
+        cur_term_scores: list[tuple[tuple[int, int], float]] = []
+        for part_idx, (index, limit) in enumerate(parts):
+            for doc_id, term_freq in index.get_postings(term, limit):
+                doc_term_num = term_freq * (k1 + 1)
+                doc_term_denom = term_freq + k1 * (
+                    1 - b + b * index.doc_lens[doc_id] / avg_doc_len
+                )
+                cur_term_scores.append(
+                    ((part_idx, doc_id), query_idf * doc_term_num / doc_term_denom)
+                )
+        term_scores[term] = cur_term_scores
+
+    # Accumulate in query order (with repeats) to match bm25() exactly.
+    scores: dict[tuple[int, int], float] = {}
+    for term in query:
+        if term not in term_scores:
+            continue
+        for key, score in term_scores[term]:
+            scores[key] = scores.get(key, 0) + score
+    return scores
+
+
+def tf_idf_scores(
+    query: list[str],
+    parts: list[IndexPart],
+    stats: Optional[CorpusStats] = None,
+) -> dict[tuple[int, int], float]:
+    """
+    Same scores as tf_idf() over the concatenation of the parts' documents,
+    computed only for the documents that share a term with the query.
+    Keys are (part_idx, doc_id). Stats default to those of the parts.
+    """
+    if 0 == len(query):
+        return {}
+    query_term_freqs = compute_term_freqs(query)
+    max_term_freq = max(query_term_freqs.values())
+    if stats is None:
+        stats = closure_stats(list(query_term_freqs), parts)
+    num_docs = stats.num_docs
+    doc_freqs = stats.doc_freqs
+    scores: dict[tuple[int, int], float] = {}
+    for term, query_term_freq in query_term_freqs.items():
+        if term not in doc_freqs:
+            continue
+        idf = math.log(num_docs / doc_freqs[term])
+        query_tf_idf = (0.5 + 0.5 * (query_term_freq / max_term_freq)) * idf
+        for part_idx, (index, limit) in enumerate(parts):
+            for doc_id, term_freq in index.get_postings(term, limit):
+                doc_tf_idf = (term_freq / index.doc_lens[doc_id]) * idf
+                key = (part_idx, doc_id)
+                scores[key] = scores.get(key, 0) + query_tf_idf * doc_tf_idf
+    return scores
+
+
+def rank_docs(
+    scores: dict[tuple[int, int], float], parts: list[IndexPart]
+) -> Iterator[tuple[int, int]]:
+    """
+    Lazily yields (part_idx, doc_id) in the order a stable descending sort
+    of every document's score would produce. Documents without a positive
+    score follow in their original order, and are only visited if the
+    caller consumes that far.
+    """
+    heap = [(-score, key) for key, score in scores.items() if 0 < score]
+    heapq.heapify(heap)
+    while 0 < len(heap):
+        _, key = heapq.heappop(heap)
+        yield key
+    for part_idx, (_, limit) in enumerate(parts):
+        for doc_id in range(limit):
+            if 0 < scores.get((part_idx, doc_id), 0):
+                continue
+            yield part_idx, doc_id
@@ -4,6 +4,7 @@ import math
 import functools
 
 from proof_retrieval.bm25 import (
+    CorpusStats,
     compute_term_freqs,
     compute_doc_freqs,
     doc_to_hashable,
@@ -11,15 +12,17 @@ from proof_retrieval.bm25 import (
 )
 
 
-def compute_idfs(corpus: list[list[str]]) -> dict[str, float]:
-    if 0 == len(corpus):
-        return {}
-    assert 0 < len(corpus)
-    doc_freqs = compute_doc_freqs(corpus)
+def compute_idfs(
+    corpus: list[list[str]], stats: Optional[CorpusStats] = None
+) -> dict[str, float]:
+    if stats is None:
+        if 0 == len(corpus):
+            return {}
+        stats = CorpusStats(len(corpus), 0, compute_doc_freqs(corpus))
 
     idfs: dict[str, float] = {}
-    for k, v in doc_freqs.items():
-        idfs[k] = math.log(len(corpus) / v)
+    for k, v in stats.doc_freqs.items():
+        idfs[k] = math.log(stats.num_docs / v)
     return idfs
 
 
@@ -58,10 +61,13 @@ def compute_query_tf(query: list[str]) -> dict[str, float]:
 
 
 def tf_idf(
-    query: list[str], docs: list[list[str]], idfs: Optional[dict[str, float]] = None
+    query: list[str],
+    docs: list[list[str]],
+    idfs: Optional[dict[str, float]] = None,
+    stats: Optional[CorpusStats] = None,
 ) -> list[float]:
     if idfs is None:
-        idfs = compute_idfs(docs)
+        idfs = compute_idfs(docs, stats)
     query_tfs = compute_query_tf(query)
     doc_tfs = [compute_doc_tf(doc_to_hashable(d)) for d in docs]
     similarities: list[float] = []
@@ -209,7 +209,8 @@ class GeneralFormatter:
                 proof,
                 dp_obj,
                 training,
-            )[: self.num_proofs]
+                k=self.num_proofs,
+            )
             similar_proof_strs = [p.proof_text_to_string() for p in simliar_proofs]
         else:
             similar_proof_strs = None
@@ -222,8 +223,13 @@ class GeneralFormatter:
                 )
             )
             relevant_premises = self.premise_client.get_ranked_premises(
-                step_idx, proof, dp_obj, filtered_result.avail_premises, training
-            )[: self.num_premises]
+                step_idx,
+                proof,
+                dp_obj,
+                filtered_result.avail_premises,
+                training,
+                k=self.num_premises,
+            )
             relevant_premise_strs = [p.text for p in relevant_premises]
         else:
             relevant_premise_strs = None
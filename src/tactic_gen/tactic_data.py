@@ -21,7 +21,7 @@ from data_management.sentence_db import SentenceDB
 from data_management.jsonl_utils import ExampleDB
 from data_management.line_dict import LineDict
 from data_management.splits import Split
-from data_management.dataset_file import DPCache, StepID
+from data_management.dataset_file import DPCache, StepID, get_process_dp_cache
 
 from model_deployment.conf_utils import (
     formatter_conf_to_client_conf,
@@ -99,6 +99,21 @@ def allocate_and_fmt(
         return "\n".join(allowed_passages)
 
 
+def join_sections(sections: list[tuple[str, str]]) -> tuple[str, dict[str, int]]:
+    """
+    Joins (separator, content) sections into an input string. Also returns
+    the character offset of each separator in the string.
+    """
+    offsets: dict[str, int] = {}
+    pieces: list[str] = []
+    cur_offset = 0
+    for sep, content in sections:
+        offsets[sep] = cur_offset
+        pieces.append(sep + content)
+        cur_offset += len(sep) + len(content)
+    return "".join(pieces), offsets
+
+
 @dataclass
 class BasicCollatorConf:
     script_tokens: int
@@ -349,7 +364,9 @@ class ProofPremiseCollator:
     PROOF_SEP = "\n[PROOFS]\n"
     PREMISE_SEP = "\n[PREMISES]\n"
 
-    def collate_input(self, tokenizer: PreTrainedTokenizer, example: LmExample) -> str:
+    def collate_input_sections(
+        self, tokenizer: PreTrainedTokenizer, example: LmExample
+    ) -> list[tuple[str, str]]:
         proof_str = allocate_and_fmt(tokenizer, example.proofs, self.proof_tokens)
         premise_str = allocate_and_fmt(tokenizer, example.premises, self.premise_tokens)
         state_str, _ = allocate_tokens(
@@ -358,17 +375,21 @@ class ProofPremiseCollator:
         script_str, _ = allocate_tokens(
             tokenizer, example.proof_script, self.script_tokens
         )
-        combined_str = (
-            self.PREMISE_SEP
-            + premise_str
-            + self.PROOF_SEP
-            + proof_str
-            + self.STATE_SEP
-            + state_str
-            + self.SCRIPT_SEP
-            + script_str
-            + NEWLINE_RESPONSE_TEMPLATE
-        )
+        return [
+            (self.PREMISE_SEP, premise_str),
+            (self.PROOF_SEP, proof_str),
+            (self.STATE_SEP, state_str),
+            (self.SCRIPT_SEP, script_str),
+            (NEWLINE_RESPONSE_TEMPLATE, ""),
+        ]
+
+    def collate_input_with_offsets(
+        self, tokenizer: PreTrainedTokenizer, example: LmExample
+    ) -> tuple[str, dict[str, int]]:
+        return join_sections(self.collate_input_sections(tokenizer, example))
+
+    def collate_input(self, tokenizer: PreTrainedTokenizer, example: LmExample) -> str:
+        combined_str, _ = self.collate_input_with_offsets(tokenizer, example)
         return combined_str
 
     def collate(self, tokenizer: PreTrainedTokenizer, example: LmExample) -> str:
@@ -427,21 +448,28 @@ class NoScriptCollator:
     PROOF_SEP = "\n[PROOFS]\n"
     PREMISE_SEP = "\n[PREMISES]\n"
 
-    def collate_input(self, tokenizer: PreTrainedTokenizer, example: LmExample) -> str:
+    def collate_input_sections(
+        self, tokenizer: PreTrainedTokenizer, example: LmExample
+    ) -> list[tuple[str, str]]:
         proof_str = allocate_and_fmt(tokenizer, example.proofs, self.proof_tokens)
         premise_str = allocate_and_fmt(tokenizer, example.premises, self.premise_tokens)
         state_str, _ = allocate_tokens(
             tokenizer, example.proof_state, self.state_tokens
         )
-        combined_str = (
-            self.PREMISE_SEP
-            + premise_str
-            + self.PROOF_SEP
-            + proof_str
-            + self.STATE_SEP
-            + state_str
-            + NEWLINE_RESPONSE_TEMPLATE
-        )
+        return [
+            (self.PREMISE_SEP, premise_str),
+            (self.PROOF_SEP, proof_str),
+            (self.STATE_SEP, state_str),
+            (NEWLINE_RESPONSE_TEMPLATE, ""),
+        ]
+
+    def collate_input_with_offsets(
+        self, tokenizer: PreTrainedTokenizer, example: LmExample
+    ) -> tuple[str, dict[str, int]]:
+        return join_sections(self.collate_input_sections(tokenizer, example))
+
+    def collate_input(self, tokenizer: PreTrainedTokenizer, example: LmExample) -> str:
+        combined_str, _ = self.collate_input_with_offsets(tokenizer, example)
         return combined_str
 
     def collate(self, tokenizer: PreTrainedTokenizer, example: LmExample) -> str:
@@ -827,8 +855,9 @@ class LmDataset(Dataset):
         if get_cached is not None:
             example = get_cached
         else:
-            dp = DatasetFile.load(
-                self.data_loc / DATA_POINTS_NAME / step_id.file, self.sentence_db
+            # Binary data points only decode the proof of this step.
+            dp = get_process_dp_cache().get_dp(
+                step_id.file, self.data_loc, self.sentence_db
             )
             example = self.formatter.example_from_step(
                 step_id.step_idx, step_id.proof_idx, dp, training=True
@@ -11,7 +11,12 @@ from pathlib import Path
 from yaml import load, Loader
 import jsonlines
 
-from peft import LoraConfig, get_peft_model, prepare_model_for_kbit_training
+from peft import (
+    AutoPeftModelForCausalLM,
+    LoraConfig,
+    get_peft_model,
+    prepare_model_for_kbit_training,
+)
 import transformers
 from transformers import (
     AutoModelForCausalLM,
@@ -101,6 +106,28 @@ def get_model(model_name: str) -> PreTrainedModel:
     return model
 
 
+def get_cpu_model(model_name: str, quantize: bool = True) -> PreTrainedModel:
+    """
+    Loads a model for inference on cpu. LoRA adapters are merged into the
+    base weights. Linear layers optionally run with dynamic int8 quantization.
+    """
+    if (Path(model_name) / "adapter_config.json").exists():
+        peft_model = AutoPeftModelForCausalLM.from_pretrained(
+            model_name, torch_dtype=torch.float32
+        )
+        model = peft_model.merge_and_unload()
+    else:
+        model = AutoModelForCausalLM.from_pretrained(
+            model_name, torch_dtype=torch.float32
+        )
+    model.eval()
+    if quantize:
+        model = torch.ao.quantization.quantize_dynamic(
+            model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+    return model
+
+
 def get_datasets(
     conf: dict[str, Any],
 ) -> tuple[LmDataset | LmProcessedDataset, LmDataset | LmProcessedDataset]:
@@ -25,6 +25,7 @@ QUEUE_NAME = "queue"
 SLURM_NAME = "slurm"
 
 
+VECTOR_DB_METADATA = "metadata.json"
 PROOF_VECTOR_DB_METADATA = "metadata.pkl"
 
 # Logging
@@ -0,0 +1,36 @@
+"""
+Ranking helpers shared by the premise and proof rankers. Both give the
+same order as sorted(range(n), key=lambda idx: -1 * scores[idx]) (i.e.
+ties keep their original order) without sorting the whole pool.
+"""
+
+from typing import Iterator, Optional, Sequence
+import heapq
+
+import numpy as np
+
+
+def top_k_indices(scores: Sequence[float], k: Optional[int]) -> list[int]:
+    num_scores = len(scores)
+    if k is None or num_scores <= k:
+        return sorted(range(num_scores), key=lambda idx: -1 * scores[idx])
+    if k <= 0:
+        return []
+    neg_scores = -1 * np.asarray(scores, dtype=np.float64)
+    candidates = np.argpartition(neg_scores, k - 1)[:k]
+    kth_score = neg_scores[candidates].max()
+    better = np.flatnonzero(neg_scores < kth_score)
+    # Among scores tied with the k-th, a stable sort keeps the earliest.
+    ties = np.flatnonzero(neg_scores == kth_score)[: k - len(better)]
+    selected = np.concatenate([better, ties])
+    ordered = selected[np.lexsort((selected, neg_scores[selected]))]
+    return ordered.tolist()
+
+
+def iter_ranked_indices(scores: Sequence[float]) -> Iterator[int]:
+    """For callers that don't know in advance how many results they need."""
+    heap = [(-1 * score, idx) for idx, score in enumerate(scores)]
+    heapq.heapify(heap)
+    while 0 < len(heap):
+        _, idx = heapq.heappop(heap)
+        yield idx
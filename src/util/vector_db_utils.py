@@ -1,14 +1,196 @@
+from __future__ import annotations
+import sys, os
+import json
+import argparse
+import pickle
 import functools
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
+import numpy as np
+import numpy.typing as npt
 import torch
 
 from util.util import get_basic_logger
+from util.constants import VECTOR_DB_METADATA, PROOF_VECTOR_DB_METADATA
 
 _logger = get_basic_logger(__name__)
 
 
+class EmbeddingMatrix:
+    """
+    All embeddings of a vector db as one memory-mapped .npy matrix, where
+    row i is vector i. Lookups are a single gather from the matrix, and
+    processes on one host share it through the page cache. The matrix can
+    be stored as float16, or as int8 with one float32 scale per row, and is
+    cast back to the dtype of the pages it was converted from on lookup.
+    """
+
+    EMBS_NAME = "embeddings.npy"
+    SCALES_NAME = "scales.npy"
+    METADATA_NAME = "embeddings.json"
+    STORAGE_DTYPES = ["int8", "float16", "float32"]
+    INT8_MAX = 127
+
+    def __init__(
+        self,
+        embs: npt.NDArray[np.generic],
+        dtype: torch.dtype,
+        scales: Optional[npt.NDArray[np.float32]] = None,
+    ) -> None:
+        self.embs = embs
+        self.dtype = dtype
+        # Row i of the matrix is embs[i] * scales[i] if embs is quantized.
+        self.scales = scales
+
+    def __len__(self) -> int:
+        return len(self.embs)
+
+    def get_embs(self, idxs: list[int], device: str) -> Optional[torch.Tensor]:
+        idx_array = np.asarray(idxs, dtype=np.int64)
+        if 0 < len(idx_array) and (idx_array.min() < 0 or len(self) <= idx_array.max()):
+            bad_idx = idx_array.min() if idx_array.min() < 0 else idx_array.max()
+            _logger.error(f"Index {bad_idx} out of range of {len(self)}.")
+            return None
+        embs = torch.from_numpy(self.embs[idx_array])
+        if self.scales is None:
+            return embs.to(device=device, dtype=self.dtype)
+        # Dequantize after moving the int8 rows to the device.
+        scales = torch.from_numpy(self.scales[idx_array]).to(device)
+        embs = embs.to(device=device, dtype=torch.float32) * scales[:, None]
+        return embs.to(dtype=self.dtype)
+
+    def get(self, idx: int, device: str) -> Optional[torch.Tensor]:
+        embs = self.get_embs([idx], device)
+        if embs is None:
+            return None
+        return embs[0]
+
+    @staticmethod
+    def exists(db_loc: Path) -> bool:
+        return (db_loc / EmbeddingMatrix.EMBS_NAME).exists()
+
+    @classmethod
+    def load_metadata(cls, db_loc: Path) -> Any:
+        with (db_loc / cls.METADATA_NAME).open("r") as fin:
+            return json.load(fin)
+
+    @classmethod
+    def load_checked(
+        cls, db_loc: Path, page_size: int, sdb_hash: Optional[str]
+    ) -> Optional[EmbeddingMatrix]:
+        """
+        The matrix of db_loc if it was converted from the current pages of
+        the db. A stale matrix is not used; lookups fall back to the pages.
+        """
+        metadata = cls.load_metadata(db_loc)
+        expected = {"page_size": page_size, "sdb_hash": sdb_hash}
+        num_vectors = get_num_vectors(db_loc, page_size)
+        if num_vectors is not None:
+            expected["num_vectors"] = num_vectors
+        stale_keys = [k for k, v in expected.items() if metadata.get(k) != v]
+        if len(stale_keys) == 0:
+            return cls.load(db_loc)
+        if num_vectors is None:
+            raise ValueError(
+                f"Embedding matrix of {db_loc} does not match the db "
+                f"({', '.join(stale_keys)}) and there are no pages to use instead."
+            )
+        _logger.warning(
+            f"Embedding matrix of {db_loc} does not match its pages "
+            f"({', '.join(stale_keys)}); using the pages. "
+            "Rebuild it with src/util/vector_db_utils.py --overwrite."
+        )
+        return None
+
+    @classmethod
+    def load(cls, db_loc: Path) -> EmbeddingMatrix:
+        metadata = cls.load_metadata(db_loc)
+        embs = np.load(db_loc / cls.EMBS_NAME, mmap_mode="r")
+        scales: Optional[npt.NDArray[np.float32]] = None
+        if metadata["storage_dtype"] == "int8":
+            scales = np.load(db_loc / cls.SCALES_NAME, mmap_mode="r")
+        return cls(embs, getattr(torch, metadata["dtype"]), scales)
+
+    @classmethod
+    def quantize(
+        cls, embs: npt.NDArray[np.float32]
+    ) -> tuple[npt.NDArray[np.int8], npt.NDArray[np.float32]]:
+        """Symmetric int8 quantization with one scale per row."""
+        scales = np.abs(embs).max(axis=1) / cls.INT8_MAX
+        scales[scales == 0] = 1
+        quantized = np.rint(embs / scales[:, None]).astype(np.int8)
+        return quantized, scales.astype(np.float32)
+
+    @classmethod
+    def from_pages(
+        cls,
+        db_loc: Path,
+        storage_dtype: str,
+        page_size: Optional[int] = None,
+        sdb_hash: Optional[str] = None,
+    ) -> EmbeddingMatrix:
+        """
+        Converts the pages of a vector db. page_size defaults to the size of
+        the first page. The page size and sdb_hash are stored with the
+        matrix so that load_checked can detect a stale matrix.
+        """
+        assert storage_dtype in cls.STORAGE_DTYPES
+        num_pages = get_num_pages(db_loc)
+        if num_pages == 0:
+            raise FileNotFoundError(f"No pages in {db_loc}")
+        if page_size is None:
+            page_size = len(torch.load(str(get_page_loc(db_loc, 0)), mmap=True))
+        num_vectors = get_num_vectors(db_loc, page_size)
+        assert num_vectors is not None
+        last_page = torch.load(str(get_page_loc(db_loc, num_pages - 1)), mmap=True)
+        dim = last_page.shape[1]
+        dtype = str(last_page.dtype).split(".")[1]
+
+        embs_loc = db_loc / cls.EMBS_NAME
+        embs = np.lib.format.open_memmap(
+            embs_loc, mode="w+", dtype=storage_dtype, shape=(num_vectors, dim)
+        )
+        scales: Optional[np.memmap] = None
+        if storage_dtype == "int8":
+            scales = np.lib.format.open_memmap(
+                db_loc / cls.SCALES_NAME,
+                mode="w+",
+                dtype=np.float32,
+                shape=(num_vectors,),
+            )
+        for page_idx in range(num_pages):
+            page = torch.load(str(get_page_loc(db_loc, page_idx)), mmap=True)
+            if page_idx < num_pages - 1:
+                assert len(page) == page_size
+            start = page_idx * page_size
+            # numpy has no bfloat16.
+            page_embs = page.to(torch.float32).numpy()
+            if scales is not None:
+                page_embs, scales[start : start + len(page)] = cls.quantize(page_embs)
+            embs[start : start + len(page)] = page_embs
+            _logger.info(f"Converted page {page_idx + 1} of {num_pages}")
+        embs.flush()
+        del embs
+        if scales is not None:
+            scales.flush()
+            del scales
+
+        with (db_loc / cls.METADATA_NAME).open("w") as fout:
+            json.dump(
+                {
+                    "num_vectors": num_vectors,
+                    "page_size": page_size,
+                    "sdb_hash": sdb_hash,
+                    "dim": dim,
+                    "storage_dtype": storage_dtype,
+                    "dtype": dtype,
+                },
+                fout,
+            )
+        return cls.load(db_loc)
+
+
 @functools.lru_cache(1000)
 def load_page(db_loc: Path, page_idx: int, device: str) -> Optional[torch.Tensor]:
     page_loc = get_page_loc(db_loc, page_idx)
@@ -16,6 +198,9 @@ def load_page(db_loc: Path, page_idx: int, device: str) -> Optional[torch.Tensor
         _logger.error(f"Page {page_idx} does not exist.")
         return None
     # return torch.load(page_loc).to("cuda")
+    if device == "cpu":
+        # Pages are shared through the page cache by processes on one host.
+        return torch.load(str(page_loc), map_location=device, mmap=True)
     return torch.load(page_loc, map_location=device)
 
 
@@ -61,3 +246,57 @@ def get(idx: int, page_size: int, db_loc: Path, device: str) -> Optional[torch.T
 
 def get_page_loc(db_loc: Path, idx: int) -> Path:
     return db_loc / f"{idx}.pt"
+
+
+def get_num_pages(db_loc: Path) -> int:
+    num_pages = 0
+    while get_page_loc(db_loc, num_pages).exists():
+        num_pages += 1
+    return num_pages
+
+
+def get_num_vectors(db_loc: Path, page_size: int) -> Optional[int]:
+    """Number of vectors in the pages of db_loc, or None if it has none."""
+    num_pages = get_num_pages(db_loc)
+    if num_pages == 0:
+        return None
+    # Every page but the last one is full.
+    last_page = torch.load(str(get_page_loc(db_loc, num_pages - 1)), mmap=True)
+    return (num_pages - 1) * page_size + len(last_page)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Convert the pages of a vector db to one embedding matrix."
+    )
+    parser.add_argument("db_loc", help="Location of the vector db.")
+    parser.add_argument(
+        "--dtype", default="float32", choices=EmbeddingMatrix.STORAGE_DTYPES
+    )
+    parser.add_argument(
+        "--remove_pages", action="store_true", help="Remove the pages afterwards."
+    )
+    parser.add_argument(
+        "--overwrite", action="store_true", help="Replace an existing matrix."
+    )
+    args = parser.parse_args(sys.argv[1:])
+
+    db_loc = Path(args.db_loc)
+    if EmbeddingMatrix.exists(db_loc) and not args.overwrite:
+        raise FileExistsError(f"{db_loc / EmbeddingMatrix.EMBS_NAME}")
+    page_size: Optional[int] = None
+    sdb_hash: Optional[str] = None
+    if (db_loc / VECTOR_DB_METADATA).exists():
+        with (db_loc / VECTOR_DB_METADATA).open("r") as fin:
+            db_metadata = json.load(fin)
+        page_size = db_metadata["page_size"]
+        sdb_hash = db_metadata["sdb_hash"]
+    elif (db_loc / PROOF_VECTOR_DB_METADATA).exists():
+        with (db_loc / PROOF_VECTOR_DB_METADATA).open("rb") as fin:
+            page_size = pickle.load(fin)["page_size"]
+    EmbeddingMatrix.from_pages(db_loc, args.dtype, page_size, sdb_hash)
+    if args.remove_pages:
+        page_idx = 0
+        while get_page_loc(db_loc, page_idx).exists():
+            os.remove(get_page_loc(db_loc, page_idx))
+            page_idx += 1
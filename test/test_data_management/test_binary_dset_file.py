@@ -0,0 +1,109 @@
+import os
+import pickle
+from pathlib import Path
+
+from hypothesis import given, settings, HealthCheck, strategies as st
+
+from data_management.dataset_file import (
+    DatasetFile,
+    BinaryDatasetFile,
+    FileContext,
+    LazyFileContext,
+    LazyProofs,
+)
+from data_management.sentence_db import SentenceDB
+
+
+class TestBinaryDsetFile:
+    DB_PATH = Path("binary-dset-test.db")
+    JSON_LOC = Path("binary-dset-test.json")
+    BINARY_LOC = Path("binary-dset-test.bin")
+
+    @settings(
+        max_examples=30,
+        deadline=None,
+        suppress_health_check=[HealthCheck.data_too_large, HealthCheck.too_slow],
+    )
+    @given(st.from_type(DatasetFile))
+    def test_matches_json(self, dset_file: DatasetFile):
+        dset_file.save(self.JSON_LOC, self.db, insert_allowed=False)
+        dset_file.save_binary(self.BINARY_LOC, self.db, insert_allowed=False)
+        assert not BinaryDatasetFile.is_binary(self.JSON_LOC)
+        assert BinaryDatasetFile.is_binary(self.BINARY_LOC)
+
+        json_file = DatasetFile.load(self.JSON_LOC, self.db)
+        binary_file = DatasetFile.load(self.BINARY_LOC, self.db)
+        assert isinstance(binary_file.proofs, LazyProofs)
+        assert binary_file.to_json(self.db, False) == json_file.to_json(self.db, False)
+        assert binary_file == json_file
+
+        metadata_file = DatasetFile.load(self.BINARY_LOC, self.db, metadata_only=True)
+        assert metadata_file.file_context.file == json_file.file_context.file
+        assert len(metadata_file.file_context.avail_premises) == 0
+
+    @settings(
+        max_examples=30,
+        deadline=None,
+        suppress_health_check=[HealthCheck.data_too_large, HealthCheck.too_slow],
+    )
+    @given(st.from_type(DatasetFile))
+    def test_single_step(self, dset_file: DatasetFile):
+        dset_file.save_binary(self.BINARY_LOC, self.db, insert_allowed=False)
+        binary_file = BinaryDatasetFile(self.BINARY_LOC)
+        assert binary_file.num_proofs == len(dset_file.proofs)
+        for proof_idx, proof in enumerate(dset_file.proofs):
+            assert binary_file.num_steps(proof_idx) == len(proof.steps)
+            for step_idx, step in enumerate(proof.steps):
+                loaded_step = binary_file.get_step(proof_idx, step_idx, self.db)
+                assert loaded_step.to_json(self.db, False) == step.to_json(
+                    self.db, False
+                )
+
+        lazy_file = DatasetFile.load(self.BINARY_LOC, self.db)
+        for proof_idx, proof in enumerate(dset_file.proofs):
+            for step_idx, step in enumerate(proof.steps):
+                assert lazy_file.get_step(proof_idx, step_idx) == step
+                assert lazy_file.proofs[proof_idx].steps[step_idx] == step
+            assert lazy_file.proofs[proof_idx].steps == proof.steps
+        lazy_proofs = lazy_file.proofs
+        if 0 < len(lazy_proofs):
+            assert lazy_proofs[-1] == lazy_proofs[len(lazy_proofs) - 1]
+        assert lazy_proofs[1:] == list(lazy_proofs)[1:]
+        assert pickle.loads(pickle.dumps(lazy_proofs)) == list(lazy_proofs)
+
+    @settings(
+        max_examples=10,
+        deadline=None,
+        suppress_health_check=[HealthCheck.data_too_large, HealthCheck.too_slow],
+    )
+    @given(st.from_type(DatasetFile))
+    def test_lazy_file_context(self, dset_file: DatasetFile):
+        dset_file.save_binary(self.BINARY_LOC, self.db, insert_allowed=False)
+        binary_file = DatasetFile.load(self.BINARY_LOC, self.db)
+        file_context = binary_file.file_context
+        assert isinstance(file_context, LazyFileContext)
+        assert file_context.file == dset_file.file_context.file
+        assert file_context.avail_premises == dset_file.file_context.avail_premises
+        assert pickle.loads(pickle.dumps(file_context)) == dset_file.file_context
+
+    def test_holds_no_file_descriptors(self):
+        DatasetFile(FileContext("a.v", "ws", "repo", []), []).save_binary(
+            self.BINARY_LOC, self.db, insert_allowed=False
+        )
+        num_fds = len(os.listdir("/proc/self/fd"))
+        loaded = [DatasetFile.load(self.BINARY_LOC, self.db) for _ in range(50)]
+        assert len(os.listdir("/proc/self/fd")) == num_fds
+        assert all(len(dp.proofs) == 0 for dp in loaded)
+
+    @classmethod
+    def setup_class(cls) -> None:
+        if cls.DB_PATH.exists():
+            os.remove(cls.DB_PATH)
+        cls.db = SentenceDB.create(cls.DB_PATH)
+
+    @classmethod
+    def teardown_class(cls) -> None:
+        cls.db.close()
+        for loc in [cls.DB_PATH, cls.JSON_LOC, cls.BINARY_LOC]:
+            if loc.exists():
+                os.remove(loc)
@@ -0,0 +1,42 @@
+import copy
+import pickle
+
+import pytest
+from hypothesis import given, strategies as st
+
+from data_management.dataset_file import FocusedStep, Goal, Proof, Sentence, StepID
+
+
+class TestCompactObjects:
+    @given(st.from_type(Sentence))
+    def test_sentence_hash(self, sentence: Sentence):
+        orig_hash = hash(sentence)
+        sentence_copy = copy.copy(sentence)
+        assert sentence_copy == sentence
+        assert hash(sentence_copy) == orig_hash
+        loaded_sentence = pickle.loads(pickle.dumps(sentence))
+        assert loaded_sentence._hash is None
+        assert loaded_sentence == sentence
+
+    @given(st.from_type(Proof))
+    def test_proof_pickle(self, proof: Proof):
+        for step in proof.steps:
+            hash(step)
+        proof.proof_text_id()
+        loaded_proof = pickle.loads(pickle.dumps(proof))
+        assert all(s._hash is None for s in loaded_proof.steps)
+        assert loaded_proof == proof
+        assert loaded_proof.proof_text_id() == proof.proof_text_id()
+
+    def test_no_dict(self):
+        objs = [
+            Sentence("a", "b", [], None, 0, None),
+            Goal([], "True"),
+            FocusedStep.from_step_text("auto."),
+            Proof(FocusedStep.from_step_text("auto.").term, [], 0),
+            StepID("a.v", 0, 0),
+        ]
+        for obj in objs:
+            assert not hasattr(obj, "__dict__")
+            with pytest.raises(AttributeError):
+                obj.new_attr = 0
@@ -0,0 +1,119 @@
+import os
+import shutil
+from pathlib import Path
+
+from coqpyt.coq.structs import TermType
+
+from data_management.dataset_file import (
+    DatasetFile,
+    DPCache,
+    FileContext,
+    FocusedStep,
+    Proof,
+    Term,
+    DATA_POINTS_NAME,
+    get_dp_num_bytes,
+    get_process_dp_cache,
+)
+from data_management.sentence_db import SentenceDB
+
+
+class TestDPCache:
+    DB_PATH = Path("dp-cache-test.db")
+    DATA_LOC = Path("dp-cache-test-data")
+    OTHER_DB_PATH = Path("dp-cache-test-other.db")
+    DP_NAMES = ["a", "b", "c"]
+    BINARY_DP_NAME = "d"
+
+    def test_hits_and_misses(self):
+        cache = DPCache()
+        first = cache.get_dp("a", self.DATA_LOC, self.db)
+        assert cache.get_dp("a", self.DATA_LOC, self.db) is first
+        assert cache.get_stats()["hits"] == 1
+        assert cache.get_stats()["misses"] == 1
+        assert cache.num_bytes == self.dp_size("a")
+
+    def test_entry_limit(self):
+        cache = DPCache(cache_size=2)
+        a_dp = cache.get_dp("a", self.DATA_LOC, self.db)
+        cache.get_dp("b", self.DATA_LOC, self.db)
+        cache.get_dp("a", self.DATA_LOC, self.db)
+        cache.get_dp("c", self.DATA_LOC, self.db)
+        assert len(cache) == 2
+        assert cache.evictions == 1
+        assert cache.get_dp("a", self.DATA_LOC, self.db) is a_dp
+        assert cache.num_bytes == self.dp_size("a") + self.dp_size("c")
+
+    def test_byte_limit(self):
+        cache = DPCache(max_bytes=self.dp_size("a") + self.dp_size("b"))
+        for dp_name in self.DP_NAMES:
+            cache.get_dp(dp_name, self.DATA_LOC, self.db)
+        assert len(cache) == 2
+        assert cache.evictions == 1
+        assert cache.num_bytes == self.dp_size("b") + self.dp_size("c")
+
+        small_cache = DPCache(max_bytes=0)
+        small_cache.get_dp("a", self.DATA_LOC, self.db)
+        assert len(small_cache) == 1
+
+    def test_keyed_by_sentence_db(self):
+        cache = DPCache()
+        a_dp = cache.get_dp("a", self.DATA_LOC, self.db)
+        other_a_dp = cache.get_dp("a", self.DATA_LOC, self.other_db)
+        assert other_a_dp is not a_dp
+        assert cache.get_dp("a", self.DATA_LOC, self.db) is a_dp
+        assert cache.get_dp("a", self.DATA_LOC, self.other_db) is other_a_dp
+        assert len(cache) == 2
+
+    def test_binary_size_grows(self):
+        cache = DPCache()
+        dp_obj = cache.get_dp(self.BINARY_DP_NAME, self.DATA_LOC, self.db)
+        loaded_size = cache.num_bytes
+        dp_loc = self.DATA_LOC / DATA_POINTS_NAME / self.BINARY_DP_NAME
+        assert loaded_size < dp_loc.stat().st_size
+        assert dp_obj.proofs[0].steps[1].step.text == "auto."
+        cache.get_dp(self.BINARY_DP_NAME, self.DATA_LOC, self.db)
+        assert loaded_size < cache.num_bytes == get_dp_num_bytes(dp_obj)
+
+    def test_process_cache(self):
+        assert get_process_dp_cache() is get_process_dp_cache()
+
+    def dp_size(self, dp_name: str) -> int:
+        dp_loc = self.DATA_LOC / DATA_POINTS_NAME / dp_name
+        return get_dp_num_bytes(DatasetFile.load(dp_loc, self.db))
+
+    @classmethod
+    def setup_class(cls) -> None:
+        if cls.DB_PATH.exists():
+            os.remove(cls.DB_PATH)
+        cls.db = SentenceDB.create(cls.DB_PATH)
+        if cls.OTHER_DB_PATH.exists():
+            os.remove(cls.OTHER_DB_PATH)
+        cls.other_db = SentenceDB.create(cls.OTHER_DB_PATH)
+        for dp_name in cls.DP_NAMES:
+            file_context = FileContext(f"{dp_name}.v", "ws", "repo", [])
+            DatasetFile(file_context, []).save(
+                cls.DATA_LOC / DATA_POINTS_NAME / dp_name, cls.db, insert_allowed=True
+            )
+        steps = [
+            FocusedStep.from_step_and_goals("Lemma d : True.", text, [])
+            for text in ["Proof.", "auto.", "Qed."] * 20
+        ]
+        theorem = Term.from_text("Lemma d : True.", TermType.LEMMA)
+        DatasetFile(
+            FileContext("d.v", "ws", "repo", []), [Proof(theorem, steps, 0)]
+        ).save_binary(
+            cls.DATA_LOC / DATA_POINTS_NAME / cls.BINARY_DP_NAME,
+            cls.db,
+            insert_allowed=True,
+        )
+
+    @classmethod
+    def teardown_class(cls) -> None:
+        cls.db.close()
+        cls.other_db.close()
+        for db_path in [cls.DB_PATH, cls.OTHER_DB_PATH]:
+            if db_path.exists():
+                os.remove(db_path)
+        if cls.DATA_LOC.exists():
+            shutil.rmtree(cls.DATA_LOC)
@@ -0,0 +1,50 @@
+from hypothesis import given, strategies as st
+
+from data_management.dataset_file import (
+    DatasetFile,
+    FileContext,
+    PremisePartition,
+    Proof,
+    Sentence,
+    file_contexts_from_project,
+)
+
+
+class TestPremisePartition:
+    @given(file_contexts_from_project("/coq-dataset/repos/proj"))
+    def test_partition(self, file_context: FileContext):
+        dset_file = DatasetFile(file_context, [])
+        norm_file = PremisePartition.fix_path(file_context.file)
+        in_file = {
+            p
+            for p in file_context.avail_premises
+            if PremisePartition.share_subpath(
+                PremisePartition.fix_path(p.file_path), norm_file
+            )
+        }
+        assert set(dset_file.in_file_avail_premises) == in_file
+        assert set(dset_file.out_of_file_avail_premises) == (
+            set(file_context.avail_premises) - in_file
+        )
+
+    @given(st.from_type(FileContext), st.lists(st.from_type(Proof), max_size=3))
+    def test_shared_partition(self, file_context: FileContext, proofs: list[Proof]):
+        first = DatasetFile(file_context, proofs)
+        second = DatasetFile(file_context, proofs[:1])
+        assert first.out_of_file_avail_premises is second.out_of_file_avail_premises
+        assert first.dependencies is second.dependencies
+
+    @given(st.from_type(FileContext), st.from_type(Sentence))
+    def test_partition_follows_premises(
+        self, file_context: FileContext, premise: Sentence
+    ):
+        dset_file = DatasetFile(file_context, [])
+        num_premises = len(dset_file.in_file_avail_premises) + len(
+            dset_file.out_of_file_avail_premises
+        )
+        file_context.avail_premises.append(premise)
+        new_num_premises = len(dset_file.in_file_avail_premises) + len(
+            dset_file.out_of_file_avail_premises
+        )
+        assert new_num_premises == len(set(file_context.avail_premises))
+        assert num_premises <= new_num_premises
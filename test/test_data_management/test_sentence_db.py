@@ -1,12 +1,22 @@
 
 
 import os
+import json
 import shutil
 
 import pytest
 from pathlib import Path
+from sqlite3 import connect, Connection, OperationalError
 
-from data_management.sentence_db import DBSentence, SentenceDB
+from coqpyt.coq.structs import TermType
+
+from data_management.sentence_db import DBSentence, SentenceDB, SentenceSnapshot
+from data_management.dataset_file import DatasetFile, FileContext, Sentence
+
+
+class FailingCommitConnection(Connection):
+    def commit(self) -> None:
+        raise OperationalError("disk I/O error")
 
 
 class TestSentenceDB:
@@ -47,4 +57,163 @@ class TestSentenceDB:
     @classmethod
     def teardown_class(cls) -> None:
         if cls.DB_PATH.exists():
-            os.remove(cls.DB_PATH)
\ No newline at end of file
+            os.remove(cls.DB_PATH)
+
+
+SENTENCES = [
+    DBSentence(
+        "Lemma app_nil_r : forall l, l ++ [] = l.", "a.v", "[]", "TermType.LEMMA", 0
+    ),
+    DBSentence("Definition id (x : A) := x.", "a.v", '["M"]', "TermType.DEFINITION", 3),
+    DBSentence("Lemma ünicode : ∀ x, x = x.", "b.v", "[]", "TermType.LEMMA", 7),
+    DBSentence(
+        "Lemma app_nil_r : forall l, l ++ [] = l.", "b.v", "[]", "TermType.LEMMA", 9
+    ),
+]
+
+
+class TestBulkRetrieve:
+    DB_PATH = Path("sentence-db-test.db")
+
+    def test_retrieve_many(self):
+        ids = [3, 1, 3, 4, 2]
+        assert self.db.retrieve_many(ids) == [self.db.retrieve(i) for i in ids]
+        assert self.db.retrieve_many([]) == []
+
+    def test_retrieve_many_chunks(self):
+        ids = list(range(1, len(SENTENCES) + 1)) * (SentenceDB.MAX_QUERY_IDS // 2)
+        assert self.db.retrieve_many(ids) == [SENTENCES[i - 1] for i in ids]
+
+    def test_snapshot(self):
+        snapshot = SentenceSnapshot.build(self.db)
+        assert not snapshot.contains_id(0)
+        for i, db_sentence in enumerate(SENTENCES, start=1):
+            assert snapshot.contains_id(i)
+            assert snapshot.retrieve(i) == db_sentence
+
+    def test_load_snapshot(self):
+        snapshot_loc = SentenceSnapshot.get_snapshot_loc(self.DB_PATH)
+        try:
+            SentenceSnapshot.build(self.db).save(snapshot_loc)
+            loaded_db = SentenceDB.load(self.DB_PATH)
+            assert loaded_db.snapshot is not None
+            ids = list(range(1, len(SENTENCES) + 1))
+            assert loaded_db.retrieve_many(ids) == SENTENCES
+            loaded_db.close()
+
+            new_sentence = DBSentence("Lemma new : True.", "c.v", "[]", "LEMMA", 1)
+            new_id = self.db.insert_sentence(new_sentence)
+            self.db.commit()
+            stale_db = SentenceDB.load(self.DB_PATH)
+            assert stale_db.snapshot is None
+            assert stale_db.retrieve(new_id) == new_sentence
+            stale_db.close()
+        finally:
+            self.db.cursor.execute(
+                f"DELETE FROM {SentenceDB.TABLE_NAME} WHERE id > ?", (len(SENTENCES),)
+            )
+            self.db.commit()
+            if snapshot_loc.exists():
+                shutil.rmtree(snapshot_loc)
+
+    def test_context_from_lines(self):
+        unstored = Sentence.from_text("Lemma new : True.", TermType.LEMMA)
+        context = FileContext(
+            "a.v", "ws", "repo", [Sentence.from_idx(2, self.db), unstored]
+        )
+        lines = context.to_jsonlines(self.db, insert_allowed=False)
+        assert json.loads(lines[1])["type"] == "stored"
+        loaded = FileContext.context_from_lines(lines, self.db)
+        assert loaded == context
+        assert loaded.avail_premises[0].db_idx == 2
+
+    @classmethod
+    def setup_class(cls) -> None:
+        if cls.DB_PATH.exists():
+            os.remove(cls.DB_PATH)
+        cls.db = SentenceDB.create(cls.DB_PATH)
+        for db_sentence in SENTENCES:
+            cls.db.insert_sentence(db_sentence)
+
+    @classmethod
+    def teardown_class(cls) -> None:
+        cls.db.close()
+        if cls.DB_PATH.exists():
+            os.remove(cls.DB_PATH)
+
+
+class TestBatchedInsert:
+    DB_PATH = Path("sentence-db-insert-test.db")
+    DP_PATH = Path("sentence-db-insert-test-dp")
+
+    def test_insert_many(self):
+        db = SentenceDB.create(self.DB_PATH)
+        first_id = db.insert_sentence(SENTENCES[1])
+        ids = db.insert_many(SENTENCES + SENTENCES[:2])
+        assert ids[1] == first_id
+        assert ids[4:] == ids[:2]
+        assert len(set(ids[:4])) == 4
+        assert db.size() == 4
+        assert db.retrieve_many(ids) == SENTENCES + SENTENCES[:2]
+        assert [db.insert_sentence(s) for s in SENTENCES] == ids[:4]
+
+    def test_write_batch_rollback(self):
+        db = SentenceDB.create(self.DB_PATH)
+        with pytest.raises(RuntimeError):
+            with db.write_batch():
+                id = db.insert_sentence(SENTENCES[0])
+                assert db.contains_id(id)
+                assert db.retrieve(id) == SENTENCES[0]
+                raise RuntimeError()
+        assert db.size() == 0
+        assert db.find_sentence(SENTENCES[0]) is None
+        assert not db.contains_id(id)
+        with pytest.raises(ValueError):
+            db.retrieve(id)
+
+    def test_no_file_without_commit(self):
+        SentenceDB.create(self.DB_PATH).close()
+        con = connect(self.DB_PATH, factory=FailingCommitConnection)
+        db = SentenceDB(con, con.cursor())
+        unstored = Sentence.from_text("Lemma new : True.", TermType.LEMMA)
+        dset_file = DatasetFile(FileContext("a.v", "ws", "repo", [unstored]), [])
+        for save in [dset_file.save, dset_file.save_binary]:
+            with pytest.raises(OperationalError):
+                save(self.DP_PATH, db, insert_allowed=True)
+            assert not self.DP_PATH.exists()
+        con.close()
+
+    def test_add_hash_key(self):
+        con = connect(self.DB_PATH)
+        con.execute(
+            f"""
+            CREATE TABLE {SentenceDB.TABLE_NAME} (
+                id INTEGER PRIMARY KEY, text TEXT, file_path TEXT,
+                module TEXT, sentence_type TEXT, line INTEGER)"""
+        )
+        db = SentenceDB(con, con.cursor())
+        assert not db.has_hash_key
+        old_ids = db.insert_many(SENTENCES)
+        db.add_hash_key()
+        assert db.has_hash_key
+        fresh_db = SentenceDB(con, con.cursor())
+        assert fresh_db.has_hash_key
+        assert fresh_db.insert_many(SENTENCES) == old_ids
+        assert fresh_db.size() == len(SENTENCES)
+
+    def test_read_only(self):
+        db = SentenceDB.create(self.DB_PATH)
+        ids = db.insert_many(SENTENCES)
+        db.close()
+        shared_db = SentenceDB.load(self.DB_PATH, read_only=True, warmup=True)
+        assert shared_db.retrieve_many(ids) == SENTENCES
+        assert shared_db.find_sentence(SENTENCES[2]) == ids[2]
+        new_sentence = DBSentence("Lemma new : True.", "c.v", "[]", "TermType.LEMMA", 1)
+        with pytest.raises(OperationalError):
+            shared_db.insert_sentence(new_sentence)
+        shared_db.close()
+
+    def teardown_method(self) -> None:
+        for loc in [self.DB_PATH, self.DP_PATH]:
+            if loc.exists():
+                os.remove(loc)
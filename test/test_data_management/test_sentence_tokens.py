@@ -0,0 +1,117 @@
+import os
+import re
+from pathlib import Path
+
+from coqpyt.coq.structs import TermType
+
+from data_management.sentence_db import DBSentence, SentenceDB
+from data_management.sentence_tokens import SentenceTokenTable
+from data_management.dataset_file import (
+    Goal,
+    Sentence,
+    ID_FORM,
+    get_cached_ids_from_goal,
+    get_cached_ids_from_sentence,
+    get_ids_from_goal,
+    get_ids_from_sentence,
+)
+from premise_selection.premise_term_matrix import PremiseTermMatrix
+from proof_retrieval.bm25 import bm25
+from proof_retrieval.tfidf import tf_idf
+
+
+TEXTS = [
+    "Lemma app_nil_r : forall l, l ++ [] = l.",
+    "Definition rev (l : list A) := fold_left (fun a b => b :: a) l [].",
+    "Lemma rev_involutive : forall l, rev (rev l) = l.",
+    "Lemma app_nil_r : forall l, l ++ [] = l.",
+]
+
+
+class TestSentenceTokens:
+    DB_PATH = Path("token-test.db")
+
+    def test_sentence_tokens(self):
+        for sentence_id, text in enumerate(TEXTS, start=1):
+            sentence = Sentence.from_idx(sentence_id, self.db)
+            tokens = self.table.get_sentence_tokens(sentence)
+            assert [self.table.vocab[t] for t in tokens] == re.findall(ID_FORM, text)
+
+    def test_unstored_sentence(self):
+        sentence = Sentence.from_text("Lemma new : rev nil = nil.", TermType.LEMMA)
+        tokens = self.table.get_sentence_tokens(sentence)
+        assert [self.table.vocab[t] for t in tokens] == get_ids_from_sentence(sentence)
+
+    def test_goal_tokens(self):
+        goal = Goal(["l : list A", "H : rev l = l"], "l ++ [] = rev l")
+        hyp_tokens, goal_tokens = self.table.get_goal_tokens(goal)
+        hyp_ids, goal_ids = get_ids_from_goal(goal)
+        assert [self.table.vocab[t] for t in hyp_tokens] == hyp_ids
+        assert [self.table.vocab[t] for t in goal_tokens] == goal_ids
+        assert self.table.get_goal_tokens(goal) == (hyp_tokens, goal_tokens)
+
+    def test_save_load(self):
+        table_loc = SentenceTokenTable.get_table_loc(self.DB_PATH)
+        try:
+            self.table.save(table_loc)
+            loaded = SentenceTokenTable.load_for_db(self.DB_PATH, self.db)
+            assert loaded is not None
+            for sentence_id in range(1, len(TEXTS) + 1):
+                assert loaded.get_id_tokens(sentence_id) == self.table.get_id_tokens(
+                    sentence_id
+                )
+        finally:
+            if table_loc.exists():
+                os.remove(table_loc)
+
+    def test_stale_table(self):
+        table_loc = SentenceTokenTable.get_table_loc(self.DB_PATH)
+        try:
+            SentenceTokenTable.build(self.db).save(table_loc)
+            assert SentenceTokenTable.load_for_db(self.DB_PATH, self.db) is not None
+            self.db.insert_sentence(
+                DBSentence("Lemma extra : True.", "b.v", "[]", "TermType.LEMMA", 0)
+            )
+            assert SentenceTokenTable.load_for_db(self.DB_PATH, self.db) is None
+        finally:
+            self.db.cursor.execute(
+                f"DELETE FROM {SentenceDB.TABLE_NAME} WHERE id > ?", (len(TEXTS),)
+            )
+            if table_loc.exists():
+                os.remove(table_loc)
+
+    def test_cached_ids(self):
+        goal = Goal(["l : list A", "H : rev l = l"], "l ++ [] = rev l")
+        same_goal = Goal(list(goal.hyps), goal.goal)
+        assert get_cached_ids_from_goal(goal) == get_ids_from_goal(goal)
+        assert get_cached_ids_from_goal(same_goal) is get_cached_ids_from_goal(goal)
+        sentence = Sentence.from_idx(2, self.db)
+        assert get_cached_ids_from_sentence(sentence) == get_ids_from_sentence(sentence)
+
+    def test_term_matrix_scores(self):
+        premises = [Sentence.from_idx(i, self.db) for i in range(1, len(TEXTS) + 1)]
+        docs = [get_ids_from_sentence(p) for p in premises]
+        goal = Goal(["l : list A"], "rev (l ++ []) = rev l")
+        hyp_ids, goal_ids = get_ids_from_goal(goal)
+        hyp_tokens, goal_tokens = self.table.get_goal_tokens(goal)
+        matrix = PremiseTermMatrix(self.table)
+        query = hyp_ids + goal_ids
+        query_tokens = hyp_tokens + goal_tokens
+        assert matrix.bm25(query_tokens, premises) == bm25(query, docs)
+        assert matrix.tf_idf(query_tokens, premises) == tf_idf(query, docs)
+
+    @classmethod
+    def setup_class(cls) -> None:
+        if cls.DB_PATH.exists():
+            os.remove(cls.DB_PATH)
+        cls.db = SentenceDB.create(cls.DB_PATH)
+        for i, text in enumerate(TEXTS):
+            # The repeated text is a distinct sentence (different line).
+            cls.db.insert_sentence(DBSentence(text, "a.v", "[]", "TermType.LEMMA", i))
+        cls.table = SentenceTokenTable.build(cls.db)
+
+    @classmethod
+    def teardown_class(cls) -> None:
+        cls.db.close()
+        if cls.DB_PATH.exists():
+            os.remove(cls.DB_PATH)
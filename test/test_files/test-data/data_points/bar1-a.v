@@ -0,0 +1,21 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar1/a.v\", \"workspace\": \"/coq-dataset/repos/bar1\", \"repository\": \"/coq-dataset/repos/bar1\"}",
+    "{\"type\": \"stored\", \"id\": 3080}",
+    "{\"type\": \"stored\", \"id\": 3081}",
+    "{\"type\": \"stored\", \"id\": 3082}",
+    "{\"type\": \"stored\", \"id\": 3083}",
+    "{\"type\": \"stored\", \"id\": 3084}",
+    "{\"type\": \"stored\", \"id\": 3085}",
+    "{\"type\": \"stored\", \"id\": 3086}",
+    "{\"type\": \"stored\", \"id\": 3087}",
+    "{\"type\": \"stored\", \"id\": 3088}",
+    "{\"type\": \"stored\", \"id\": 3089}",
+    "{\"type\": \"stored\", \"id\": 3090}",
+    "{\"type\": \"stored\", \"id\": 3091}",
+    "{\"type\": \"stored\", \"id\": 3092}",
+    "{\"type\": \"stored\", \"id\": 3093}",
+    "{\"type\": \"stored\", \"id\": 3094}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,6 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar1/a.v.v.v\", \"workspace\": \"/coq-dataset/repos/bar1\", \"repository\": \"/coq-dataset/repos/bar1\"}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,495 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar1/czetzptfjix.v\", \"workspace\": \"/coq-dataset/repos/bar1\", \"repository\": \"/coq-dataset/repos/bar1\"}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 3287,
+        "context": [
+          {
+            "type": "stored",
+            "id": 3288
+          },
+          {
+            "type": "stored",
+            "id": 3289
+          },
+          {
+            "type": "stored",
+            "id": 3290
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 3291,
+            "context": [
+              {
+                "type": "stored",
+                "id": 3292
+              },
+              {
+                "type": "stored",
+                "id": 3293
+              },
+              {
+                "type": "stored",
+                "id": 3294
+              },
+              {
+                "type": "stored",
+                "id": 3295
+              },
+              {
+                "type": "stored",
+                "id": 3296
+              },
+              {
+                "type": "stored",
+                "id": 3297
+              },
+              {
+                "type": "stored",
+                "id": 3298
+              }
+            ]
+          },
+          "step": {
+            "text": "\u0094",
+            "context": [
+              {
+                "type": "stored",
+                "id": 3299
+              },
+              {
+                "type": "stored",
+                "id": 3300
+              },
+              {
+                "type": "stored",
+                "id": 3301
+              },
+              {
+                "type": "stored",
+                "id": 3302
+              },
+              {
+                "type": "stored",
+                "id": 3303
+              },
+              {
+                "type": "stored",
+                "id": 3304
+              },
+              {
+                "type": "stored",
+                "id": 3305
+              },
+              {
+                "type": "stored",
+                "id": 3306
+              },
+              {
+                "type": "stored",
+                "id": 3307
+              },
+              {
+                "type": "stored",
+                "id": 3308
+              },
+              {
+                "type": "stored",
+                "id": 3309
+              },
+              {
+                "type": "stored",
+                "id": 3310
+              },
+              {
+                "type": "stored",
+                "id": 3311
+              },
+              {
+                "type": "stored",
+                "id": 3312
+              },
+              {
+                "type": "stored",
+                "id": 3313
+              },
+              {
+                "type": "stored",
+                "id": 3314
+              },
+              {
+                "type": "stored",
+                "id": 3315
+              },
+              {
+                "type": "stored",
+                "id": 3316
+              }
+            ]
+          },
+          "n_step": -10957,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 3317,
+            "context": []
+          },
+          "step": {
+            "text": "\udb21\udfa4\udbe7\ude81",
+            "context": []
+          },
+          "n_step": -4202,
+          "goals": []
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 3318,
+        "context": []
+      },
+      "steps": []
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 3319,
+        "context": [
+          {
+            "type": "stored",
+            "id": 3320
+          },
+          {
+            "type": "stored",
+            "id": 3321
+          },
+          {
+            "type": "stored",
+            "id": 3322
+          },
+          {
+            "type": "stored",
+            "id": 3323
+          },
+          {
+            "type": "stored",
+            "id": 3324
+          },
+          {
+            "type": "stored",
+            "id": 3325
+          },
+          {
+            "type": "stored",
+            "id": 3326
+          },
+          {
+            "type": "stored",
+            "id": 3327
+          },
+          {
+            "type": "stored",
+            "id": 3328
+          },
+          {
+            "type": "stored",
+            "id": 3329
+          },
+          {
+            "type": "stored",
+            "id": 3330
+          },
+          {
+            "type": "stored",
+            "id": 3331
+          },
+          {
+            "type": "stored",
+            "id": 3332
+          },
+          {
+            "type": "stored",
+            "id": 3333
+          },
+          {
+            "type": "stored",
+            "id": 3334
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 3335,
+            "context": [
+              {
+                "type": "stored",
+                "id": 3336
+              },
+              {
+                "type": "stored",
+                "id": 3337
+              },
+              {
+                "type": "stored",
+                "id": 3338
+              },
+              {
+                "type": "stored",
+                "id": 3339
+              },
+              {
+                "type": "stored",
+                "id": 3340
+              },
+              {
+                "type": "stored",
+                "id": 3341
+              },
+              {
+                "type": "stored",
+                "id": 3342
+              },
+              {
+                "type": "stored",
+                "id": 3343
+              },
+              {
+                "type": "stored",
+                "id": 3344
+              },
+              {
+                "type": "stored",
+                "id": 3345
+              },
+              {
+                "type": "stored",
+                "id": 3346
+              },
+              {
+                "type": "stored",
+                "id": 3347
+              },
+              {
+                "type": "stored",
+                "id": 3348
+              },
+              {
+                "type": "stored",
+                "id": 3349
+              },
+              {
+                "type": "stored",
+                "id": 3350
+              },
+              {
+                "type": "stored",
+                "id": 3351
+              }
+            ]
+          },
+          "step": {
+            "text": "\u001a\u00ae",
+            "context": [
+              {
+                "type": "stored",
+                "id": 3352
+              },
+              {
+                "type": "stored",
+                "id": 3353
+              },
+              {
+                "type": "stored",
+                "id": 3354
+              },
+              {
+                "type": "stored",
+                "id": 3355
+              },
+              {
+                "type": "stored",
+                "id": 3356
+              },
+              {
+                "type": "stored",
+                "id": 3357
+              },
+              {
+                "type": "stored",
+                "id": 3358
+              },
+              {
+                "type": "stored",
+                "id": 3359
+              },
+              {
+                "type": "stored",
+                "id": 3360
+              },
+              {
+                "type": "stored",
+                "id": 3361
+              }
+            ]
+          },
+          "n_step": 1976762,
+          "goals": [
+            "hTarE\n\ngQfVCwgYf",
+            "\n\nQ"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 3362,
+            "context": [
+              {
+                "type": "stored",
+                "id": 3363
+              },
+              {
+                "type": "stored",
+                "id": 3364
+              },
+              {
+                "type": "stored",
+                "id": 3365
+              }
+            ]
+          },
+          "step": {
+            "text": "6\udb99\udda981\udb16\ude38\u00f2\u00a5",
+            "context": [
+              {
+                "type": "stored",
+                "id": 3366
+              },
+              {
+                "type": "stored",
+                "id": 3367
+              },
+              {
+                "type": "stored",
+                "id": 3368
+              },
+              {
+                "type": "stored",
+                "id": 3369
+              },
+              {
+                "type": "stored",
+                "id": 3370
+              },
+              {
+                "type": "stored",
+                "id": 3371
+              }
+            ]
+          },
+          "n_step": 456,
+          "goals": [
+            "\n\nZxk"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 3372,
+            "context": []
+          },
+          "step": {
+            "text": "\u00d3\u0018\u0014\u000e\u00e3\ud832\udf7c\u008b\u00b2\u00f6\u00de*\u0006\u00a2",
+            "context": [
+              {
+                "type": "stored",
+                "id": 3373
+              },
+              {
+                "type": "stored",
+                "id": 3374
+              },
+              {
+                "type": "stored",
+                "id": 3375
+              },
+              {
+                "type": "stored",
+                "id": 3376
+              },
+              {
+                "type": "stored",
+                "id": 3377
+              }
+            ]
+          },
+          "n_step": 1433257,
+          "goals": [
+            "BCErDnsZLstynZedfOXCKPvFXhxpD\nrKtpmaOQCSZr\n\nvhmUEhEOBrSmtvPGn",
+            "\n\naOTBXitVB",
+            "EZgQmQplamWqWUFZ\n\nLmqf",
+            "Ubu\nOyCrIg\nFvkoHK\n\nLXY",
+            "y\nRDxrF\nrJTBPW\njkS\nPcAjn\nLN\nyQXssrL\npdCoNyhHIg\nqpDK\noaoyV\nInf\nAMfm\nAbfvhcwkNwQEzlA\nnx\nt\nF\nwkdWbR\nq\n\nwQO",
+            "A\nTDmho\ntulE\nlXQNYoA\nIthhdxQXsJwf\n\nQNo",
+            "AaO\nWw\nmgEZqPlos\nX\n\niTiZQ",
+            "Lxv\nJL\n\nikcBuE",
+            "jxK\n\ndUScIu",
+            "LZGvh\nzct\nRtWgEkdTdj\naUZutlf\n\nkYuFbx",
+            "qiIXHMsaG\nchsp\n\nPI"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 3378,
+            "context": [
+              {
+                "type": "stored",
+                "id": 3379
+              },
+              {
+                "type": "stored",
+                "id": 3380
+              }
+            ]
+          },
+          "step": {
+            "text": "\ud95b\udcf0Y]>r",
+            "context": [
+              {
+                "type": "stored",
+                "id": 3381
+              },
+              {
+                "type": "stored",
+                "id": 3382
+              },
+              {
+                "type": "stored",
+                "id": 3383
+              },
+              {
+                "type": "stored",
+                "id": 3384
+              }
+            ]
+          },
+          "n_step": -100000000000000000,
+          "goals": []
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
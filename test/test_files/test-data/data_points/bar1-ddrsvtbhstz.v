@@ -0,0 +1,152 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar1/ddrsvtbhstz.v\", \"workspace\": \"/coq-dataset/repos/bar1\", \"repository\": \"/coq-dataset/repos/bar1\"}",
+    "{\"type\": \"stored\", \"id\": 3649}",
+    "{\"type\": \"stored\", \"id\": 3650}",
+    "{\"type\": \"stored\", \"id\": 3651}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 3652,
+        "context": [
+          {
+            "type": "stored",
+            "id": 3653
+          },
+          {
+            "type": "stored",
+            "id": 3654
+          },
+          {
+            "type": "stored",
+            "id": 3655
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 3656,
+            "context": [
+              {
+                "type": "stored",
+                "id": 3657
+              },
+              {
+                "type": "stored",
+                "id": 3658
+              },
+              {
+                "type": "stored",
+                "id": 3659
+              },
+              {
+                "type": "stored",
+                "id": 3660
+              },
+              {
+                "type": "stored",
+                "id": 3661
+              },
+              {
+                "type": "stored",
+                "id": 3662
+              },
+              {
+                "type": "stored",
+                "id": 3663
+              },
+              {
+                "type": "stored",
+                "id": 3664
+              }
+            ]
+          },
+          "step": {
+            "text": "*",
+            "context": [
+              {
+                "type": "stored",
+                "id": 3665
+              },
+              {
+                "type": "stored",
+                "id": 3666
+              },
+              {
+                "type": "stored",
+                "id": 3667
+              },
+              {
+                "type": "stored",
+                "id": 3668
+              }
+            ]
+          },
+          "n_step": 308,
+          "goals": [
+            "eODLLcRklrQmPTBMbG\nVfeAsxDB\n\nt",
+            "ETPHsjqCMTdfPt\nTrue\nr\nj\nfJTG\n\nRuBhtHtnxv",
+            "jwzoNpIBfPGgEofC\nDo\nHiQYlL\ne\nmYpQqPMcVRSeUrEI\nFTMCMPPAdb\nXUsZxvUhQ\nnGaRNfU\nI\nsentence\nrsDOhq\nIt\n\ngdiKe",
+            "qKqgRIE\nnYm\nQo\nHWCs\npVlvoZZU\nYambu\nBjLpX\nauJi\nJUeMKf\nsqXcvl\n\nSCHEME",
+            "\n\nswBZuJo",
+            "Ojpo\n\nh",
+            "XP\nGa\nfZRUOoa\nL\nXjr\nZkqlBJdrSGdUPwHDMUjZ\n\nLseCrAEUx",
+            "CfEMhhx\n\nD",
+            "rdrJEgA\nM\nV\nMGv\nN\nT\nP\nACXh\nEVAxN\ne\n\nF",
+            "H\nfQwqOprP\nyDfJcofkqIEtoom\n\nF"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 3669,
+            "context": [
+              {
+                "type": "stored",
+                "id": 3670
+              },
+              {
+                "type": "stored",
+                "id": 3671
+              },
+              {
+                "type": "stored",
+                "id": 3672
+              },
+              {
+                "type": "stored",
+                "id": 3673
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 3674
+              },
+              {
+                "type": "stored",
+                "id": 3675
+              },
+              {
+                "type": "stored",
+                "id": 3676
+              }
+            ]
+          },
+          "n_step": -8740,
+          "goals": [
+            "Y\nubz\nqNKF\nFjEftLzxnwUk\nTrue\niQpD\n\nkmUlUuSx",
+            "PCygXTyHCDgPpa\nEfQvrnzjqJGWdQwhvYadg\nQhJN\nYHthOY\nNiHzr\nFZuQCXiWqtXGRcgrxJtDx\nKzbYs\no\nT\nDAtOSie\n\nUViuJZtOFn"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
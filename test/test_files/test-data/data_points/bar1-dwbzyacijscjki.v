@@ -0,0 +1,15 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar1/dwbzyacijscjki.v\", \"workspace\": \"/coq-dataset/repos/bar1\", \"repository\": \"/coq-dataset/repos/bar1\"}",
+    "{\"type\": \"stored\", \"id\": 3560}",
+    "{\"type\": \"stored\", \"id\": 3561}",
+    "{\"type\": \"stored\", \"id\": 3562}",
+    "{\"type\": \"stored\", \"id\": 3563}",
+    "{\"type\": \"stored\", \"id\": 3564}",
+    "{\"type\": \"stored\", \"id\": 3565}",
+    "{\"type\": \"stored\", \"id\": 3566}",
+    "{\"type\": \"stored\", \"id\": 3567}",
+    "{\"type\": \"stored\", \"id\": 3568}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
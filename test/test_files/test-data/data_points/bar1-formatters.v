@@ -0,0 +1,13 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar1/formatters.v\", \"workspace\": \"/coq-dataset/repos/bar1\", \"repository\": \"/coq-dataset/repos/bar1\"}",
+    "{\"type\": \"stored\", \"id\": 3553}",
+    "{\"type\": \"stored\", \"id\": 3554}",
+    "{\"type\": \"stored\", \"id\": 3555}",
+    "{\"type\": \"stored\", \"id\": 3556}",
+    "{\"type\": \"stored\", \"id\": 3557}",
+    "{\"type\": \"stored\", \"id\": 3558}",
+    "{\"type\": \"stored\", \"id\": 3559}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,184 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar1/fxwua.v\", \"workspace\": \"/coq-dataset/repos/bar1\", \"repository\": \"/coq-dataset/repos/bar1\"}",
+    "{\"type\": \"stored\", \"id\": 3435}",
+    "{\"type\": \"stored\", \"id\": 3436}",
+    "{\"type\": \"stored\", \"id\": 3437}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 3438,
+        "context": [
+          {
+            "type": "stored",
+            "id": 3439
+          },
+          {
+            "type": "stored",
+            "id": 3440
+          },
+          {
+            "type": "stored",
+            "id": 3441
+          },
+          {
+            "type": "stored",
+            "id": 3442
+          },
+          {
+            "type": "stored",
+            "id": 3443
+          },
+          {
+            "type": "stored",
+            "id": 3444
+          },
+          {
+            "type": "stored",
+            "id": 3445
+          },
+          {
+            "type": "stored",
+            "id": 3446
+          },
+          {
+            "type": "stored",
+            "id": 3447
+          },
+          {
+            "type": "stored",
+            "id": 3448
+          },
+          {
+            "type": "stored",
+            "id": 3449
+          },
+          {
+            "type": "stored",
+            "id": 3450
+          },
+          {
+            "type": "stored",
+            "id": 3451
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 3452,
+            "context": [
+              {
+                "type": "stored",
+                "id": 3453
+              },
+              {
+                "type": "stored",
+                "id": 3454
+              },
+              {
+                "type": "stored",
+                "id": 3455
+              },
+              {
+                "type": "stored",
+                "id": 3456
+              },
+              {
+                "type": "stored",
+                "id": 3457
+              },
+              {
+                "type": "stored",
+                "id": 3458
+              },
+              {
+                "type": "stored",
+                "id": 3459
+              },
+              {
+                "type": "stored",
+                "id": 3460
+              }
+            ]
+          },
+          "step": {
+            "text": "\u009e_",
+            "context": [
+              {
+                "type": "stored",
+                "id": 3461
+              },
+              {
+                "type": "stored",
+                "id": 3462
+              },
+              {
+                "type": "stored",
+                "id": 3463
+              },
+              {
+                "type": "stored",
+                "id": 3464
+              },
+              {
+                "type": "stored",
+                "id": 3465
+              },
+              {
+                "type": "stored",
+                "id": 3466
+              },
+              {
+                "type": "stored",
+                "id": 3467
+              }
+            ]
+          },
+          "n_step": -11158496542621858,
+          "goals": [
+            "pZvZ\nuapYbdZ\ntRUg\nAUboSLE\nJZp\n\nEEN",
+            "eeCxL\nXgJLBA\nTEEE\nrango\nNBYAAnkt\nri\nkm\npU\nmethod\npnr\n\nb",
+            "\n\ngqbPIictFeGRxAD",
+            "\n\nzenIJLGUljpRqWnD",
+            "YMltCIneSBzvkpezerc\nNULL\nTrue\nM\nHxJSrCjJ\nSseyTLfUVYGH\nF\n\nNajemfVJrZ",
+            "FgA\nhvVmvwl\nDOqnnHC\nmmTS\nnEZFV\ngm\nSYjguueD\nDw\nuAYBnMwnaRDETYNWWameEZknBlBnDASx\nVjZMa\nhYbGU\n\nXzuOpZARIrX",
+            "PQbmggY\nzwaFgbvlMXuCZz\nundefined\nkGkIm\nag\nD\nODjjB\nhJBgmPqCzRLJfnlaqHM\nA\n\nAEO",
+            "\n\nB"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 3468,
+            "context": [
+              {
+                "type": "stored",
+                "id": 3469
+              }
+            ]
+          },
+          "step": {
+            "text": "http",
+            "context": []
+          },
+          "n_step": 138697325,
+          "goals": [
+            "jluBqBpfCK\n\neNiUr",
+            "sUCdIOl\nbA\nOxEz\naEomMYrNeNLioBKjzZVajp\nmnBhWDhpKUcWvTML\nylC\nJ\n\nTkSyi",
+            "PTxmhCB\nWB\n\nf",
+            "ihb\nb\nEKTcQSrDuxFcFfq\nq\npEu\nTrue\nMT\nO\nJmi\nRFcG\nFQF\n\nKBY",
+            "S\nCiKvY\n\nelNpIQTn",
+            "VPc\nnh\nfVepWUulbrIuGGtbQqP\nDYOMwmPHbQDzHHp\nGleVpL\nipQaZUado\nQKQlYQMLDNIgZk\nDEBoHz\n\nczLxn",
+            "Vd\nTcvMDN\nRs\nleQcTqrbkUEPRdzomnLT\n\nvps",
+            "e\n\nKf",
+            "\n\nT"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
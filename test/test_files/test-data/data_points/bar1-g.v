@@ -0,0 +1,13 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar1/g.v\", \"workspace\": \"/coq-dataset/repos/bar1\", \"repository\": \"/coq-dataset/repos/bar1\"}",
+    "{\"type\": \"stored\", \"id\": 3073}",
+    "{\"type\": \"stored\", \"id\": 3074}",
+    "{\"type\": \"stored\", \"id\": 3075}",
+    "{\"type\": \"stored\", \"id\": 3076}",
+    "{\"type\": \"stored\", \"id\": 3077}",
+    "{\"type\": \"stored\", \"id\": 3078}",
+    "{\"type\": \"stored\", \"id\": 3079}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,8 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar1/h.v\", \"workspace\": \"/coq-dataset/repos/bar1\", \"repository\": \"/coq-dataset/repos/bar1\"}",
+    "{\"type\": \"stored\", \"id\": 3420}",
+    "{\"type\": \"stored\", \"id\": 3421}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
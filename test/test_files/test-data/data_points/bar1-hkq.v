@@ -0,0 +1,79 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar1/hkq.v\", \"workspace\": \"/coq-dataset/repos/bar1\", \"repository\": \"/coq-dataset/repos/bar1\"}",
+    "{\"type\": \"stored\", \"id\": 3409}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 3410,
+        "context": [
+          {
+            "type": "stored",
+            "id": 3411
+          },
+          {
+            "type": "stored",
+            "id": 3412
+          },
+          {
+            "type": "stored",
+            "id": 3413
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 3414,
+            "context": [
+              {
+                "type": "stored",
+                "id": 3415
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 3416
+              },
+              {
+                "type": "stored",
+                "id": 3417
+              },
+              {
+                "type": "stored",
+                "id": 3418
+              },
+              {
+                "type": "stored",
+                "id": 3419
+              }
+            ]
+          },
+          "n_step": 3499635,
+          "goals": [
+            "REZuwekuKhYPp\n\nif",
+            "GqoAvj\nBHj\nA\ndlnWT\nqFTQ\nA\ntimeout\npq\nNOaMTajVrKMrVbCsisLcD\nxsBWpZyVpINezhw\n\nJWusxCKb",
+            "MveEH\nSf\nxMAb\nNIL\npremises\n\nUGtOzwu",
+            "zAL\nWdwtUScjuBlzUSGZKhChdjfWPlQU\nVdgstWx\nT\nt\nbTYmbwxEvAW\nBn\nJ\n\nki",
+            "n\nSKEtznSOMM\nY\nWYcyzY\nMneg\nSGJiG\nTrue\naxTD\nX\nO\nuClUh\nCtx\npmMhuJ\n\nUKRRINma",
+            "piJ\ntRB\n\nvYGhpENjzTlQsekXknKDjN",
+            "HyowkTlrdDwUzdzJqEhCDEvCpiVnKK\nQ\nEx\n\nU",
+            "EGnk\nRJizvjCluLknemAVr\nC\nBe\n\ne",
+            "ZaJbgb\n\ncOPAU",
+            "O\nCE\n\nNPo",
+            "N\nFalse\nLq\ntimeout\nqOL\nUNYevMz\nMTLQIzR\nC\nAM\nqJzz\nvCL\nujMi\ni\nUWbevInhzSFYRpscVP\nDQKuIZuoYAsc\nrerank\nLJafq\ncnnCgfmwGUkLl\nomMtizV\neItnEWlQeVZ\nQIARUPdCRdfQFtlCXkaJ\noagpT\n\nDbV",
+            "k\nyZ\n\nihilm",
+            "Nf\nM\nAFrxguZwNubX\nlib\nKEn\nkTqlh\nWgPwCy\nKKu\nd\nLke\n\ny"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,223 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar1/ioukqzqdrnjgxtyzi.v\", \"workspace\": \"/coq-dataset/repos/bar1\", \"repository\": \"/coq-dataset/repos/bar1\"}",
+    "{\"type\": \"stored\", \"id\": 3511}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 3512,
+        "context": [
+          {
+            "type": "stored",
+            "id": 3513
+          },
+          {
+            "type": "stored",
+            "id": 3514
+          },
+          {
+            "type": "stored",
+            "id": 3515
+          },
+          {
+            "type": "stored",
+            "id": 3516
+          },
+          {
+            "type": "stored",
+            "id": 3517
+          },
+          {
+            "type": "stored",
+            "id": 3518
+          },
+          {
+            "type": "stored",
+            "id": 3519
+          },
+          {
+            "type": "stored",
+            "id": 3520
+          },
+          {
+            "type": "stored",
+            "id": 3521
+          },
+          {
+            "type": "stored",
+            "id": 3522
+          },
+          {
+            "type": "stored",
+            "id": 3523
+          },
+          {
+            "type": "stored",
+            "id": 3524
+          },
+          {
+            "type": "stored",
+            "id": 3525
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 3526,
+            "context": [
+              {
+                "type": "stored",
+                "id": 3527
+              },
+              {
+                "type": "stored",
+                "id": 3528
+              },
+              {
+                "type": "stored",
+                "id": 3529
+              },
+              {
+                "type": "stored",
+                "id": 3530
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 3531
+              },
+              {
+                "type": "stored",
+                "id": 3532
+              },
+              {
+                "type": "stored",
+                "id": 3533
+              },
+              {
+                "type": "stored",
+                "id": 3534
+              },
+              {
+                "type": "stored",
+                "id": 3535
+              },
+              {
+                "type": "stored",
+                "id": 3536
+              },
+              {
+                "type": "stored",
+                "id": 3537
+              }
+            ]
+          },
+          "n_step": 9796801521,
+          "goals": [
+            "uDRIzl\n\nORsDdrfew",
+            "x\nfSkESkIii\n\nWFs",
+            "fNSlVgoXeNTSylFV\npwFsH\n\nqERU"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 3538,
+            "context": []
+          },
+          "step": {
+            "text": "\t\u00d7\ud94c\udf70",
+            "context": [
+              {
+                "type": "stored",
+                "id": 3539
+              },
+              {
+                "type": "stored",
+                "id": 3540
+              },
+              {
+                "type": "stored",
+                "id": 3541
+              },
+              {
+                "type": "stored",
+                "id": 3542
+              },
+              {
+                "type": "stored",
+                "id": 3543
+              }
+            ]
+          },
+          "n_step": 18027464,
+          "goals": [
+            "eiTqlDUQPlImCxdVr\nPyDSm\nG\n\nLnOJmELszFoaJUv"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 3544,
+            "context": [
+              {
+                "type": "stored",
+                "id": 3545
+              },
+              {
+                "type": "stored",
+                "id": 3546
+              }
+            ]
+          },
+          "step": {
+            "text": "Z\ud90c\uddf2",
+            "context": [
+              {
+                "type": "stored",
+                "id": 3547
+              },
+              {
+                "type": "stored",
+                "id": 3548
+              },
+              {
+                "type": "stored",
+                "id": 3549
+              },
+              {
+                "type": "stored",
+                "id": 3550
+              },
+              {
+                "type": "stored",
+                "id": 3551
+              },
+              {
+                "type": "stored",
+                "id": 3552
+              }
+            ]
+          },
+          "n_step": -2049,
+          "goals": [
+            "GZx\n\nIVMTe",
+            "pW\nnVM\nG\nG\n\nktFNN",
+            "\n\nWwY",
+            "XcL\nAtEtjmViWrX\na\n\nP",
+            "AXvQQqE\n\nRfNtWIbkfH",
+            "\n\nmU"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
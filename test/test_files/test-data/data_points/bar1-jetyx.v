@@ -0,0 +1,12 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar1/jetyx.v\", \"workspace\": \"/coq-dataset/repos/bar1\", \"repository\": \"/coq-dataset/repos/bar1\"}",
+    "{\"type\": \"stored\", \"id\": 3677}",
+    "{\"type\": \"stored\", \"id\": 3678}",
+    "{\"type\": \"stored\", \"id\": 3679}",
+    "{\"type\": \"stored\", \"id\": 3680}",
+    "{\"type\": \"stored\", \"id\": 3681}",
+    "{\"type\": \"stored\", \"id\": 3682}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
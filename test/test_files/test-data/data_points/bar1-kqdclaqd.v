@@ -0,0 +1,348 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar1/kqdclaqd.v\", \"workspace\": \"/coq-dataset/repos/bar1\", \"repository\": \"/coq-dataset/repos/bar1\"}",
+    "{\"type\": \"stored\", \"id\": 3156}",
+    "{\"type\": \"stored\", \"id\": 3157}",
+    "{\"type\": \"stored\", \"id\": 3158}",
+    "{\"type\": \"stored\", \"id\": 3159}",
+    "{\"type\": \"stored\", \"id\": 3160}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 3161,
+        "context": []
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 3162,
+            "context": [
+              {
+                "type": "stored",
+                "id": 3163
+              },
+              {
+                "type": "stored",
+                "id": 3164
+              },
+              {
+                "type": "stored",
+                "id": 3165
+              },
+              {
+                "type": "stored",
+                "id": 3166
+              },
+              {
+                "type": "stored",
+                "id": 3167
+              },
+              {
+                "type": "stored",
+                "id": 3168
+              },
+              {
+                "type": "stored",
+                "id": 3169
+              },
+              {
+                "type": "stored",
+                "id": 3170
+              },
+              {
+                "type": "stored",
+                "id": 3171
+              },
+              {
+                "type": "stored",
+                "id": 3172
+              },
+              {
+                "type": "stored",
+                "id": 3173
+              }
+            ]
+          },
+          "step": {
+            "text": "8[\u00ae\ud912\udc9d\u0a827\b\ud914\udc17T\u00a6\u00e8\u00f7\ud9cf\udcd1W",
+            "context": [
+              {
+                "type": "stored",
+                "id": 3174
+              },
+              {
+                "type": "stored",
+                "id": 3175
+              },
+              {
+                "type": "stored",
+                "id": 3176
+              },
+              {
+                "type": "stored",
+                "id": 3177
+              }
+            ]
+          },
+          "n_step": -1500,
+          "goals": [
+            "rcLQtVgMyNAqem\nJQrwVl\nwU\n\nxJMf"
+          ]
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 3178,
+        "context": [
+          {
+            "type": "stored",
+            "id": 3179
+          },
+          {
+            "type": "stored",
+            "id": 3180
+          },
+          {
+            "type": "stored",
+            "id": 3181
+          },
+          {
+            "type": "stored",
+            "id": 3182
+          },
+          {
+            "type": "stored",
+            "id": 3183
+          },
+          {
+            "type": "stored",
+            "id": 3184
+          },
+          {
+            "type": "stored",
+            "id": 3185
+          },
+          {
+            "type": "stored",
+            "id": 3186
+          },
+          {
+            "type": "stored",
+            "id": 3187
+          },
+          {
+            "type": "stored",
+            "id": 3188
+          }
+        ]
+      },
+      "steps": []
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 3189,
+        "context": [
+          {
+            "type": "stored",
+            "id": 3190
+          },
+          {
+            "type": "stored",
+            "id": 3191
+          },
+          {
+            "type": "stored",
+            "id": 3192
+          },
+          {
+            "type": "stored",
+            "id": 3193
+          },
+          {
+            "type": "stored",
+            "id": 3194
+          },
+          {
+            "type": "stored",
+            "id": 3195
+          },
+          {
+            "type": "stored",
+            "id": 3196
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 3197,
+            "context": [
+              {
+                "type": "stored",
+                "id": 3198
+              },
+              {
+                "type": "stored",
+                "id": 3199
+              },
+              {
+                "type": "stored",
+                "id": 3200
+              },
+              {
+                "type": "stored",
+                "id": 3201
+              },
+              {
+                "type": "stored",
+                "id": 3202
+              },
+              {
+                "type": "stored",
+                "id": 3203
+              },
+              {
+                "type": "stored",
+                "id": 3204
+              },
+              {
+                "type": "stored",
+                "id": 3205
+              },
+              {
+                "type": "stored",
+                "id": 3206
+              },
+              {
+                "type": "stored",
+                "id": 3207
+              },
+              {
+                "type": "stored",
+                "id": 3208
+              },
+              {
+                "type": "stored",
+                "id": 3209
+              },
+              {
+                "type": "stored",
+                "id": 3210
+              },
+              {
+                "type": "stored",
+                "id": 3211
+              },
+              {
+                "type": "stored",
+                "id": 3212
+              },
+              {
+                "type": "stored",
+                "id": 3213
+              },
+              {
+                "type": "stored",
+                "id": 3214
+              },
+              {
+                "type": "stored",
+                "id": 3215
+              },
+              {
+                "type": "stored",
+                "id": 3216
+              },
+              {
+                "type": "stored",
+                "id": 3217
+              },
+              {
+                "type": "stored",
+                "id": 3218
+              }
+            ]
+          },
+          "step": {
+            "text": "*X\u0000\udbb6\ude54\u00aei\u0081\u00c3o\udb84\uddbcP",
+            "context": []
+          },
+          "n_step": -1217,
+          "goals": [
+            "DHWHCzjXqQ\n\nCib"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 3219,
+            "context": [
+              {
+                "type": "stored",
+                "id": 3220
+              },
+              {
+                "type": "stored",
+                "id": 3221
+              },
+              {
+                "type": "stored",
+                "id": 3222
+              },
+              {
+                "type": "stored",
+                "id": 3223
+              },
+              {
+                "type": "stored",
+                "id": 3224
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00f1\ud894\udd81N\u00fa\ud86b\udd29\u001e\u00c8^\ud9f8\udd8f\u00f3cX\udb7e\udecf",
+            "context": [
+              {
+                "type": "stored",
+                "id": 3225
+              },
+              {
+                "type": "stored",
+                "id": 3226
+              },
+              {
+                "type": "stored",
+                "id": 3227
+              },
+              {
+                "type": "stored",
+                "id": 3228
+              },
+              {
+                "type": "stored",
+                "id": 3229
+              }
+            ]
+          },
+          "n_step": -334121852121098957544261410619392,
+          "goals": []
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 3230,
+        "context": []
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,140 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar1/lrhoj.v\", \"workspace\": \"/coq-dataset/repos/bar1\", \"repository\": \"/coq-dataset/repos/bar1\"}",
+    "{\"type\": \"stored\", \"id\": 3470}",
+    "{\"type\": \"stored\", \"id\": 3471}",
+    "{\"type\": \"stored\", \"id\": 3472}",
+    "{\"type\": \"stored\", \"id\": 3473}",
+    "{\"type\": \"stored\", \"id\": 3474}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 3475,
+        "context": [
+          {
+            "type": "stored",
+            "id": 3476
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 3477,
+            "context": [
+              {
+                "type": "stored",
+                "id": 3478
+              },
+              {
+                "type": "stored",
+                "id": 3479
+              },
+              {
+                "type": "stored",
+                "id": 3480
+              },
+              {
+                "type": "stored",
+                "id": 3481
+              },
+              {
+                "type": "stored",
+                "id": 3482
+              },
+              {
+                "type": "stored",
+                "id": 3483
+              },
+              {
+                "type": "stored",
+                "id": 3484
+              }
+            ]
+          },
+          "step": {
+            "text": "\u0091",
+            "context": [
+              {
+                "type": "stored",
+                "id": 3485
+              },
+              {
+                "type": "stored",
+                "id": 3486
+              },
+              {
+                "type": "stored",
+                "id": 3487
+              },
+              {
+                "type": "stored",
+                "id": 3488
+              },
+              {
+                "type": "stored",
+                "id": 3489
+              }
+            ]
+          },
+          "n_step": 80,
+          "goals": [
+            "SyyYSDKhKF\naVYV\nMr\nieVhIvnReawtnywYKRyXWkl\nLiKLKhHuMkEoqEeOp\nnOfJUUu\nsKlvhFQ\nqL\nopTe\nwipPeLtxbDVAYRXDjpnDDhpnJ\nIz\nIPpft\nowZ\n\nAKai",
+            "Tcy\nwgp\nFMLiWTYFmXmGWsc\n\neE",
+            "nnLpj\nE\nbwWJRvdkYqDaTDy\nEd\nOWfxXWKginpIts\nClD\nDXFIhKyu\nlJuiLpMmIXwvx\n\nMdvL"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 3490,
+            "context": [
+              {
+                "type": "stored",
+                "id": 3491
+              },
+              {
+                "type": "stored",
+                "id": 3492
+              },
+              {
+                "type": "stored",
+                "id": 3493
+              },
+              {
+                "type": "stored",
+                "id": 3494
+              },
+              {
+                "type": "stored",
+                "id": 3495
+              },
+              {
+                "type": "stored",
+                "id": 3496
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 3497
+              },
+              {
+                "type": "stored",
+                "id": 3498
+              }
+            ]
+          },
+          "n_step": -33301,
+          "goals": []
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
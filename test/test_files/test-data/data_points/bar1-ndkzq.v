@@ -0,0 +1,398 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar1/ndkzq.v\", \"workspace\": \"/coq-dataset/repos/bar1\", \"repository\": \"/coq-dataset/repos/bar1\"}",
+    "{\"type\": \"stored\", \"id\": 3569}",
+    "{\"type\": \"stored\", \"id\": 3570}",
+    "{\"type\": \"stored\", \"id\": 3571}",
+    "{\"type\": \"stored\", \"id\": 3572}",
+    "{\"type\": \"stored\", \"id\": 3573}",
+    "{\"type\": \"stored\", \"id\": 3574}",
+    "{\"type\": \"stored\", \"id\": 3575}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 3576,
+        "context": [
+          {
+            "type": "stored",
+            "id": 3577
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 3578,
+            "context": [
+              {
+                "type": "stored",
+                "id": 3579
+              }
+            ]
+          },
+          "step": {
+            "text": "__proto__",
+            "context": [
+              {
+                "type": "stored",
+                "id": 3580
+              },
+              {
+                "type": "stored",
+                "id": 3581
+              },
+              {
+                "type": "stored",
+                "id": 3582
+              }
+            ]
+          },
+          "n_step": -26819,
+          "goals": [
+            "QlpqLe\nahv\nthm\nvq\n\nDqvweyNsM",
+            "qgF\nVS\nikicch\nuAh\nnKVqiVTLVrGaLYLnjPGqX\n\nVahfXVnxktgte",
+            "bHHE\nYQRxln\noPCXcfzu\n\nchange"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 3583,
+            "context": []
+          },
+          "step": {
+            "text": "\ud96d\udfbf",
+            "context": [
+              {
+                "type": "stored",
+                "id": 3584
+              },
+              {
+                "type": "stored",
+                "id": 3585
+              }
+            ]
+          },
+          "n_step": 3771,
+          "goals": [
+            "HL\ny\n\nr",
+            "z\nlwqzlNcfcc\ne\nkDc\n\nbUpmvjM"
+          ]
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 3586,
+        "context": [
+          {
+            "type": "stored",
+            "id": 3587
+          }
+        ]
+      },
+      "steps": []
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 3588,
+        "context": [
+          {
+            "type": "stored",
+            "id": 3589
+          },
+          {
+            "type": "stored",
+            "id": 3590
+          },
+          {
+            "type": "stored",
+            "id": 3591
+          },
+          {
+            "type": "stored",
+            "id": 3592
+          },
+          {
+            "type": "stored",
+            "id": 3593
+          },
+          {
+            "type": "stored",
+            "id": 3594
+          },
+          {
+            "type": "stored",
+            "id": 3595
+          },
+          {
+            "type": "stored",
+            "id": 3596
+          },
+          {
+            "type": "stored",
+            "id": 3597
+          },
+          {
+            "type": "stored",
+            "id": 3598
+          },
+          {
+            "type": "stored",
+            "id": 3599
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 3600,
+            "context": [
+              {
+                "type": "stored",
+                "id": 3601
+              }
+            ]
+          },
+          "step": {
+            "text": "\u009c\u00e7\ud9da\udd71\u0003\u000bx\u00e0A\u00a1\ud8bd\udf8d\u00ca",
+            "context": []
+          },
+          "n_step": 34495,
+          "goals": [
+            "OTDW\n\nA",
+            "MXyAhhSA\nWsgIQsqfUVpQvj\nvv\n\niqSKKqnVXGuySxZATTt",
+            "M\nw\n\nkB",
+            "xE\nqU\nYNAGxmR\n\nubH",
+            "\n\nkRVVVo",
+            "\n\nuNy",
+            "O\nj\n\nvfHcbTAedag",
+            "vtLUp\n\nHtJQrgFH",
+            "Inf\nbyPp\nykwfxxjDmfkL\njYvVY\nMBK\n\nsrlz"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 3602,
+            "context": [
+              {
+                "type": "stored",
+                "id": 3603
+              },
+              {
+                "type": "stored",
+                "id": 3604
+              },
+              {
+                "type": "stored",
+                "id": 3605
+              },
+              {
+                "type": "stored",
+                "id": 3606
+              },
+              {
+                "type": "stored",
+                "id": 3607
+              },
+              {
+                "type": "stored",
+                "id": 3608
+              },
+              {
+                "type": "stored",
+                "id": 3609
+              }
+            ]
+          },
+          "step": {
+            "text": "\u0004\u0014*\u00db\u00b0#\u00a2\u00e8\u00d7x\uda2e\udd18v\u0005\udb7c\ude94\ud884\ude64\u00bc",
+            "context": [
+              {
+                "type": "stored",
+                "id": 3610
+              },
+              {
+                "type": "stored",
+                "id": 3611
+              },
+              {
+                "type": "stored",
+                "id": 3612
+              },
+              {
+                "type": "stored",
+                "id": 3613
+              },
+              {
+                "type": "stored",
+                "id": 3614
+              },
+              {
+                "type": "stored",
+                "id": 3615
+              },
+              {
+                "type": "stored",
+                "id": 3616
+              },
+              {
+                "type": "stored",
+                "id": 3617
+              },
+              {
+                "type": "stored",
+                "id": 3618
+              },
+              {
+                "type": "stored",
+                "id": 3619
+              }
+            ]
+          },
+          "n_step": 435,
+          "goals": [
+            "A\n\nixFVjYPj",
+            "JAIkktxGZNmGtllZpeQvWmmjF\nrypdoBZB\nif\nG\nhBsrPnehGuJd\n\nBrZ"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 3620,
+            "context": [
+              {
+                "type": "stored",
+                "id": 3621
+              },
+              {
+                "type": "stored",
+                "id": 3622
+              },
+              {
+                "type": "stored",
+                "id": 3623
+              },
+              {
+                "type": "stored",
+                "id": 3624
+              },
+              {
+                "type": "stored",
+                "id": 3625
+              },
+              {
+                "type": "stored",
+                "id": 3626
+              }
+            ]
+          },
+          "step": {
+            "text": "D\u00e6\u00cc",
+            "context": [
+              {
+                "type": "stored",
+                "id": 3627
+              },
+              {
+                "type": "stored",
+                "id": 3628
+              },
+              {
+                "type": "stored",
+                "id": 3629
+              },
+              {
+                "type": "stored",
+                "id": 3630
+              },
+              {
+                "type": "stored",
+                "id": 3631
+              },
+              {
+                "type": "stored",
+                "id": 3632
+              },
+              {
+                "type": "stored",
+                "id": 3633
+              },
+              {
+                "type": "stored",
+                "id": 3634
+              },
+              {
+                "type": "stored",
+                "id": 3635
+              },
+              {
+                "type": "stored",
+                "id": 3636
+              },
+              {
+                "type": "stored",
+                "id": 3637
+              },
+              {
+                "type": "stored",
+                "id": 3638
+              },
+              {
+                "type": "stored",
+                "id": 3639
+              },
+              {
+                "type": "stored",
+                "id": 3640
+              },
+              {
+                "type": "stored",
+                "id": 3641
+              },
+              {
+                "type": "stored",
+                "id": 3642
+              },
+              {
+                "type": "stored",
+                "id": 3643
+              },
+              {
+                "type": "stored",
+                "id": 3644
+              },
+              {
+                "type": "stored",
+                "id": 3645
+              },
+              {
+                "type": "stored",
+                "id": 3646
+              },
+              {
+                "type": "stored",
+                "id": 3647
+              },
+              {
+                "type": "stored",
+                "id": 3648
+              }
+            ]
+          },
+          "n_step": 6986220,
+          "goals": [
+            "eZzqku\nr\n\nsF"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,245 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar1/oq.v\", \"workspace\": \"/coq-dataset/repos/bar1\", \"repository\": \"/coq-dataset/repos/bar1\"}",
+    "{\"type\": \"stored\", \"id\": 3231}",
+    "{\"type\": \"stored\", \"id\": 3232}",
+    "{\"type\": \"stored\", \"id\": 3233}",
+    "{\"type\": \"stored\", \"id\": 3234}",
+    "{\"type\": \"stored\", \"id\": 3235}",
+    "{\"type\": \"stored\", \"id\": 3236}",
+    "{\"type\": \"stored\", \"id\": 3237}",
+    "{\"type\": \"stored\", \"id\": 3238}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 3239,
+        "context": [
+          {
+            "type": "stored",
+            "id": 3240
+          },
+          {
+            "type": "stored",
+            "id": 3241
+          },
+          {
+            "type": "stored",
+            "id": 3242
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 3243,
+            "context": [
+              {
+                "type": "stored",
+                "id": 3244
+              },
+              {
+                "type": "stored",
+                "id": 3245
+              },
+              {
+                "type": "stored",
+                "id": 3246
+              },
+              {
+                "type": "stored",
+                "id": 3247
+              },
+              {
+                "type": "stored",
+                "id": 3248
+              },
+              {
+                "type": "stored",
+                "id": 3249
+              },
+              {
+                "type": "stored",
+                "id": 3250
+              },
+              {
+                "type": "stored",
+                "id": 3251
+              },
+              {
+                "type": "stored",
+                "id": 3252
+              },
+              {
+                "type": "stored",
+                "id": 3253
+              },
+              {
+                "type": "stored",
+                "id": 3254
+              }
+            ]
+          },
+          "step": {
+            "text": "\udbe3\udea0",
+            "context": [
+              {
+                "type": "stored",
+                "id": 3255
+              },
+              {
+                "type": "stored",
+                "id": 3256
+              },
+              {
+                "type": "stored",
+                "id": 3257
+              },
+              {
+                "type": "stored",
+                "id": 3258
+              },
+              {
+                "type": "stored",
+                "id": 3259
+              }
+            ]
+          },
+          "n_step": -4143479,
+          "goals": [
+            "HfIAfB\npRRu\n\nXep"
+          ]
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 3260,
+        "context": [
+          {
+            "type": "stored",
+            "id": 3261
+          },
+          {
+            "type": "stored",
+            "id": 3262
+          },
+          {
+            "type": "stored",
+            "id": 3263
+          },
+          {
+            "type": "stored",
+            "id": 3264
+          },
+          {
+            "type": "stored",
+            "id": 3265
+          },
+          {
+            "type": "stored",
+            "id": 3266
+          },
+          {
+            "type": "stored",
+            "id": 3267
+          },
+          {
+            "type": "stored",
+            "id": 3268
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 3269,
+            "context": [
+              {
+                "type": "stored",
+                "id": 3270
+              },
+              {
+                "type": "stored",
+                "id": 3271
+              },
+              {
+                "type": "stored",
+                "id": 3272
+              },
+              {
+                "type": "stored",
+                "id": 3273
+              }
+            ]
+          },
+          "step": {
+            "text": "5\u00ac",
+            "context": [
+              {
+                "type": "stored",
+                "id": 3274
+              },
+              {
+                "type": "stored",
+                "id": 3275
+              },
+              {
+                "type": "stored",
+                "id": 3276
+              },
+              {
+                "type": "stored",
+                "id": 3277
+              },
+              {
+                "type": "stored",
+                "id": 3278
+              },
+              {
+                "type": "stored",
+                "id": 3279
+              },
+              {
+                "type": "stored",
+                "id": 3280
+              },
+              {
+                "type": "stored",
+                "id": 3281
+              },
+              {
+                "type": "stored",
+                "id": 3282
+              },
+              {
+                "type": "stored",
+                "id": 3283
+              },
+              {
+                "type": "stored",
+                "id": 3284
+              },
+              {
+                "type": "stored",
+                "id": 3285
+              },
+              {
+                "type": "stored",
+                "id": 3286
+              }
+            ]
+          },
+          "n_step": 132132433,
+          "goals": [
+            "\n\nHYynWxKDqb"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
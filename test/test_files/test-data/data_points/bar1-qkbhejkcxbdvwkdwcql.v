@@ -0,0 +1,100 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar1/qkbhejkcxbdvwkdwcql.v\", \"workspace\": \"/coq-dataset/repos/bar1\", \"repository\": \"/coq-dataset/repos/bar1\"}",
+    "{\"type\": \"stored\", \"id\": 3385}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 3386,
+        "context": [
+          {
+            "type": "stored",
+            "id": 3387
+          },
+          {
+            "type": "stored",
+            "id": 3388
+          },
+          {
+            "type": "stored",
+            "id": 3389
+          },
+          {
+            "type": "stored",
+            "id": 3390
+          },
+          {
+            "type": "stored",
+            "id": 3391
+          },
+          {
+            "type": "stored",
+            "id": 3392
+          },
+          {
+            "type": "stored",
+            "id": 3393
+          },
+          {
+            "type": "stored",
+            "id": 3394
+          },
+          {
+            "type": "stored",
+            "id": 3395
+          },
+          {
+            "type": "stored",
+            "id": 3396
+          },
+          {
+            "type": "stored",
+            "id": 3397
+          },
+          {
+            "type": "stored",
+            "id": 3398
+          },
+          {
+            "type": "stored",
+            "id": 3399
+          },
+          {
+            "type": "stored",
+            "id": 3400
+          },
+          {
+            "type": "stored",
+            "id": 3401
+          },
+          {
+            "type": "stored",
+            "id": 3402
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 3403,
+            "context": []
+          },
+          "step": {
+            "text": "\u092a\u0928\u094d\u0939 \u092a\u0928\u094d\u0939 \u0924\u094d\u0930 \u0930\u094d\u091a \u0915\u0943\u0915\u0943 \u0921\u094d\u0921 \u0928\u094d\u0939\u0943\u0947 \u0625\u0644\u0627 \u0628\u0633\u0645 \u0627\u0644\u0644\u0647",
+            "context": [
+              {
+                "type": "stored",
+                "id": 3404
+              }
+            ]
+          },
+          "n_step": -4143886460879,
+          "goals": []
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
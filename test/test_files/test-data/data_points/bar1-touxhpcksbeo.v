@@ -0,0 +1,7 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar1/touxhpcksbeo.v\", \"workspace\": \"/coq-dataset/repos/bar1\", \"repository\": \"/coq-dataset/repos/bar1\"}",
+    "{\"type\": \"stored\", \"id\": 3683}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
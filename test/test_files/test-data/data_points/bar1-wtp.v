@@ -0,0 +1,19 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar1/wtp.v\", \"workspace\": \"/coq-dataset/repos/bar1\", \"repository\": \"/coq-dataset/repos/bar1\"}",
+    "{\"type\": \"stored\", \"id\": 3422}",
+    "{\"type\": \"stored\", \"id\": 3423}",
+    "{\"type\": \"stored\", \"id\": 3424}",
+    "{\"type\": \"stored\", \"id\": 3425}",
+    "{\"type\": \"stored\", \"id\": 3426}",
+    "{\"type\": \"stored\", \"id\": 3427}",
+    "{\"type\": \"stored\", \"id\": 3428}",
+    "{\"type\": \"stored\", \"id\": 3429}",
+    "{\"type\": \"stored\", \"id\": 3430}",
+    "{\"type\": \"stored\", \"id\": 3431}",
+    "{\"type\": \"stored\", \"id\": 3432}",
+    "{\"type\": \"stored\", \"id\": 3433}",
+    "{\"type\": \"stored\", \"id\": 3434}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
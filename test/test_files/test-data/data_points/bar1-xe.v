@@ -0,0 +1,10 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar1/xe.v\", \"workspace\": \"/coq-dataset/repos/bar1\", \"repository\": \"/coq-dataset/repos/bar1\"}",
+    "{\"type\": \"stored\", \"id\": 3405}",
+    "{\"type\": \"stored\", \"id\": 3406}",
+    "{\"type\": \"stored\", \"id\": 3407}",
+    "{\"type\": \"stored\", \"id\": 3408}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
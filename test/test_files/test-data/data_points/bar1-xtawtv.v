@@ -0,0 +1,11 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar1/xtawtv.v\", \"workspace\": \"/coq-dataset/repos/bar1\", \"repository\": \"/coq-dataset/repos/bar1\"}",
+    "{\"type\": \"stored\", \"id\": 3095}",
+    "{\"type\": \"stored\", \"id\": 3096}",
+    "{\"type\": \"stored\", \"id\": 3097}",
+    "{\"type\": \"stored\", \"id\": 3098}",
+    "{\"type\": \"stored\", \"id\": 3099}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,299 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar1/z.v\", \"workspace\": \"/coq-dataset/repos/bar1\", \"repository\": \"/coq-dataset/repos/bar1\"}",
+    "{\"type\": \"stored\", \"id\": 3100}",
+    "{\"type\": \"stored\", \"id\": 3101}",
+    "{\"type\": \"stored\", \"id\": 3102}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 3103,
+        "context": [
+          {
+            "type": "stored",
+            "id": 3104
+          },
+          {
+            "type": "stored",
+            "id": 3105
+          },
+          {
+            "type": "stored",
+            "id": 3106
+          },
+          {
+            "type": "stored",
+            "id": 3107
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 3108,
+            "context": []
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 3109
+              },
+              {
+                "type": "stored",
+                "id": 3110
+              },
+              {
+                "type": "stored",
+                "id": 3111
+              },
+              {
+                "type": "stored",
+                "id": 3112
+              },
+              {
+                "type": "stored",
+                "id": 3113
+              },
+              {
+                "type": "stored",
+                "id": 3114
+              },
+              {
+                "type": "stored",
+                "id": 3115
+              },
+              {
+                "type": "stored",
+                "id": 3116
+              },
+              {
+                "type": "stored",
+                "id": 3117
+              },
+              {
+                "type": "stored",
+                "id": 3118
+              },
+              {
+                "type": "stored",
+                "id": 3119
+              },
+              {
+                "type": "stored",
+                "id": 3120
+              }
+            ]
+          },
+          "n_step": -98890,
+          "goals": [
+            "lvdnppIvpHnbgtEWTqfiqE\njywHFCJi\nd\nBBZROA\n\nPTNmYf",
+            "p\nPIjPQpXi\neGGesiKd\ndnFUvQ\nO\n\nYCQsixBqH",
+            "Scunthorpe\nLBb\nitxgUmqYW\nLUHdKgysqk\nAK\nH\njslglKOiOhWbxdfIZ\nJGnZlZeQPNpf\ngB\nfO\n\nGMVzGkRKjFegxPSLZwUNKMFeopDmoj",
+            "Y\nwZzfZym\nnCSMb\nOUoYgIKCZ\nFQpC\nzL\nNHLfiTwbjVfr\nk\nU\nwx\nEfVBOYG\nsQ\nnone\nnJGRYZJDokPinFPUE\nUp\nwgwUkDxe\nUIOR\nScunthorpe\nhabDu\n\nNp",
+            "buVf\ncok\nqRsJ\nPjI\npYlNl\nfR\nu\n\nTKpwwxur"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 3121,
+            "context": [
+              {
+                "type": "stored",
+                "id": 3122
+              },
+              {
+                "type": "stored",
+                "id": 3123
+              }
+            ]
+          },
+          "step": {
+            "text": "\ud85d\udf4b\u0096\b",
+            "context": [
+              {
+                "type": "stored",
+                "id": 3124
+              },
+              {
+                "type": "stored",
+                "id": 3125
+              },
+              {
+                "type": "stored",
+                "id": 3126
+              },
+              {
+                "type": "stored",
+                "id": 3127
+              },
+              {
+                "type": "stored",
+                "id": 3128
+              },
+              {
+                "type": "stored",
+                "id": 3129
+              },
+              {
+                "type": "stored",
+                "id": 3130
+              },
+              {
+                "type": "stored",
+                "id": 3131
+              },
+              {
+                "type": "stored",
+                "id": 3132
+              }
+            ]
+          },
+          "n_step": -426654,
+          "goals": [
+            "XFSh\nftpErGo\neYgRP\nENuzYGLdv\nPgF\nnone\n\nIqYWW",
+            "VtGZgCLMqYKbEQDT\nJzoyXMh\nZ\nnOKm\ndmCH\nOzw\nbp\n\nBuekRqs",
+            "\n\nXLgU",
+            "R\nsYBf\nKvXtqehhJSuwqL\nEKEb\nC\n\nPzqnyR",
+            "ewiNZJJa\n\nCLMQwLExoQmfYTegPSJlTbpzftqCEQ"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 3133,
+            "context": [
+              {
+                "type": "stored",
+                "id": 3134
+              },
+              {
+                "type": "stored",
+                "id": 3135
+              },
+              {
+                "type": "stored",
+                "id": 3136
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 3137
+              },
+              {
+                "type": "stored",
+                "id": 3138
+              },
+              {
+                "type": "stored",
+                "id": 3139
+              },
+              {
+                "type": "stored",
+                "id": 3140
+              },
+              {
+                "type": "stored",
+                "id": 3141
+              },
+              {
+                "type": "stored",
+                "id": 3142
+              },
+              {
+                "type": "stored",
+                "id": 3143
+              },
+              {
+                "type": "stored",
+                "id": 3144
+              }
+            ]
+          },
+          "n_step": -19867,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 3145,
+            "context": [
+              {
+                "type": "stored",
+                "id": 3146
+              },
+              {
+                "type": "stored",
+                "id": 3147
+              },
+              {
+                "type": "stored",
+                "id": 3148
+              },
+              {
+                "type": "stored",
+                "id": 3149
+              }
+            ]
+          },
+          "step": {
+            "text": "\r",
+            "context": [
+              {
+                "type": "stored",
+                "id": 3150
+              },
+              {
+                "type": "stored",
+                "id": 3151
+              },
+              {
+                "type": "stored",
+                "id": 3152
+              },
+              {
+                "type": "stored",
+                "id": 3153
+              },
+              {
+                "type": "stored",
+                "id": 3154
+              },
+              {
+                "type": "stored",
+                "id": 3155
+              }
+            ]
+          },
+          "n_step": 979,
+          "goals": [
+            "LbAPynKZ\ndJ\nG\ni\n\nWDDchdF",
+            "MA\nHJfXB\nJut\nrango\nrectype\nvPwALAEJUevvDFQzUXM\ncJ\n\nKmlk",
+            "JdE\nqFrt\noaQ\nsMT\nIF\n\nc",
+            "fShLYoa\nMHln\nQIp\nBDJKJc\nzdRNwOXnOwWJtZvmpRrgkWpdjPI\nNzZ\ntHYNIfFePzAngV\nYGE\n\nMlLz",
+            "Q\n\nbNqorzHJKLgh",
+            "V\nsRxu\nTRUE\nRb\ngjrQ\nfLSTcAmc\nE\nJd\na\npNJJs\nroXgKkE\n\nvz",
+            "zo\nNyCW\npEMAwNpDDXGaFgOn\nfQbByqNfi\nNone\ntTi\ncm\nOnuUxWMQVeZ\nzgKPSeL\nMIdEtmpEJQKejz\nINDUCTIVE\nzdWQH\nYWMVyiprIzEeJeCwVTO\nz\nMIh\nJTTyEyvSvF\n\nnTYtRDWLa",
+            "jGTxGgWrCovos\n\nRUo",
+            "IT\nINF\nM\nIF\nB\nwyT\ne\nwrzS\nPeaCc\nnDn\nFUvnIl\nhSHvbI\n\nQbFwZzoNkR",
+            "proj\nASxJ\nwuy\n\nTW",
+            "ZmW\nxbVBvxRR\nGkBitwrM\ngE\nBcoJ\ni\nCvHP\n\nYsZH",
+            "TTtqm\nJBcB\ntrain\n\nnYVlcU",
+            "\n\nGLI",
+            "wE\n\nUdKtqoxYmjOWI",
+            "\n\nUDynJ"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,18 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar1/zstdkso.v\", \"workspace\": \"/coq-dataset/repos/bar1\", \"repository\": \"/coq-dataset/repos/bar1\"}",
+    "{\"type\": \"stored\", \"id\": 3499}",
+    "{\"type\": \"stored\", \"id\": 3500}",
+    "{\"type\": \"stored\", \"id\": 3501}",
+    "{\"type\": \"stored\", \"id\": 3502}",
+    "{\"type\": \"stored\", \"id\": 3503}",
+    "{\"type\": \"stored\", \"id\": 3504}",
+    "{\"type\": \"stored\", \"id\": 3505}",
+    "{\"type\": \"stored\", \"id\": 3506}",
+    "{\"type\": \"stored\", \"id\": 3507}",
+    "{\"type\": \"stored\", \"id\": 3508}",
+    "{\"type\": \"stored\", \"id\": 3509}",
+    "{\"type\": \"stored\", \"id\": 3510}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
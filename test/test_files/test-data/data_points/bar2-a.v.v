@@ -0,0 +1,6 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar2/a.v.v\", \"workspace\": \"/coq-dataset/repos/bar2\", \"repository\": \"/coq-dataset/repos/bar2\"}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
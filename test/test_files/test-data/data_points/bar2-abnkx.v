@@ -0,0 +1,318 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar2/abnkx.v\", \"workspace\": \"/coq-dataset/repos/bar2\", \"repository\": \"/coq-dataset/repos/bar2\"}",
+    "{\"type\": \"stored\", \"id\": 3849}",
+    "{\"type\": \"stored\", \"id\": 3850}",
+    "{\"type\": \"stored\", \"id\": 3851}",
+    "{\"type\": \"stored\", \"id\": 3852}",
+    "{\"type\": \"stored\", \"id\": 3853}",
+    "{\"type\": \"stored\", \"id\": 3854}",
+    "{\"type\": \"stored\", \"id\": 3855}",
+    "{\"type\": \"stored\", \"id\": 3856}",
+    "{\"type\": \"stored\", \"id\": 3857}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 3858,
+        "context": [
+          {
+            "type": "stored",
+            "id": 3859
+          },
+          {
+            "type": "stored",
+            "id": 3860
+          },
+          {
+            "type": "stored",
+            "id": 3861
+          },
+          {
+            "type": "stored",
+            "id": 3862
+          },
+          {
+            "type": "stored",
+            "id": 3863
+          },
+          {
+            "type": "stored",
+            "id": 3864
+          },
+          {
+            "type": "stored",
+            "id": 3865
+          },
+          {
+            "type": "stored",
+            "id": 3866
+          },
+          {
+            "type": "stored",
+            "id": 3867
+          },
+          {
+            "type": "stored",
+            "id": 3868
+          },
+          {
+            "type": "stored",
+            "id": 3869
+          },
+          {
+            "type": "stored",
+            "id": 3870
+          },
+          {
+            "type": "stored",
+            "id": 3871
+          },
+          {
+            "type": "stored",
+            "id": 3872
+          },
+          {
+            "type": "stored",
+            "id": 3873
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 3874,
+            "context": []
+          },
+          "step": {
+            "text": "%\u00f9",
+            "context": [
+              {
+                "type": "stored",
+                "id": 3875
+              },
+              {
+                "type": "stored",
+                "id": 3876
+              },
+              {
+                "type": "stored",
+                "id": 3877
+              },
+              {
+                "type": "stored",
+                "id": 3878
+              },
+              {
+                "type": "stored",
+                "id": 3879
+              },
+              {
+                "type": "stored",
+                "id": 3880
+              },
+              {
+                "type": "stored",
+                "id": 3881
+              },
+              {
+                "type": "stored",
+                "id": 3882
+              }
+            ]
+          },
+          "n_step": -55929,
+          "goals": [
+            "\n\nWIUBHlWatZvSX"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 3883,
+            "context": [
+              {
+                "type": "stored",
+                "id": 3884
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 3885
+              },
+              {
+                "type": "stored",
+                "id": 3886
+              },
+              {
+                "type": "stored",
+                "id": 3887
+              }
+            ]
+          },
+          "n_step": 51662,
+          "goals": [
+            "BgvW\nXVXjWj\n\nhr",
+            "BKXrNvS\nPam\nVS\nM\nbTKueNHvmzzEH\nPCqy\nIfRjDsGJQeEOCkFj\nPHyPyn\ndYYkee\nfDY\nb\nRgl\nNuWr\nJH\nkRiQtcpmrkZ\nxOZEM\nSXcZGbdsSJzTA\nzwU\ncLgLkSAOqzyBH\nTRUE\n\nZ",
+            "OUhSfwfrc\ncPO\ner\n\ndUxghzdfrhhcGmKOE",
+            "Qe\noecQdgdx\ntmPN\nZ\nl\nUW\n\nlmzjZWXqEtjJIKjDqk"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 3888,
+            "context": [
+              {
+                "type": "stored",
+                "id": 3889
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00a7\u008e\u0097\u0019#\ud840\uddf5\u00b8\u0085\u00de\u009b\u000b\u0092\udab1\udf8a\u009e\ud873\udfad+\u00cd\u00da",
+            "context": []
+          },
+          "n_step": -202115,
+          "goals": [
+            "yeCQcDUs\nIXg\nrwXJdvifWQCWNc\n\ne",
+            "free\n\nKdqOukXomSzIAsqRzodxQGFb",
+            "FALSE\nS\nZV\nhChJonIH\nR\nLEbDI\n\nTA",
+            "dvMqxsIvk\ndnYBKVjrXz\nlG\njkYouRG\nwE\nvPbVpqFiNXp\nf\nL\nTjQHkkGTJnWAZxhLHUQKma\nOPMgyTkYbDHsNfKHZT\ndYy\nbuADxk\n\nLWMKeu",
+            "yLv\n\nvF",
+            "JmRInF\n\nJcunw",
+            "HU\nKgsLtdLA\nyHjk\nzPlWDkld\nTjo\nz\nNJOxLi\ncUhR\ntSOmGmOtfGwXWaQR\nqhOhnPr\ngGJggBmGEYfYuuLem\n\ncOUvdMTSeurB",
+            "BhanfrAvE\njA\nMcS\nGYUhT\nYw\nw\nVd\nyIZpq\n\nW",
+            "VK\naHRbF\nkCAxJMZoi\nsbuF\nkGhgTt\nakC\nxQgft\n\nrfD",
+            "Behar\nmiEL\nEZoe\nbFYhomeFjjNgToZpLSZLDZdtwy\ncuda\n\nPkBqdaAOI"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 3890,
+            "context": [
+              {
+                "type": "stored",
+                "id": 3891
+              },
+              {
+                "type": "stored",
+                "id": 3892
+              },
+              {
+                "type": "stored",
+                "id": 3893
+              },
+              {
+                "type": "stored",
+                "id": 3894
+              },
+              {
+                "type": "stored",
+                "id": 3895
+              },
+              {
+                "type": "stored",
+                "id": 3896
+              },
+              {
+                "type": "stored",
+                "id": 3897
+              },
+              {
+                "type": "stored",
+                "id": 3898
+              },
+              {
+                "type": "stored",
+                "id": 3899
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00bd\\\u00bb",
+            "context": [
+              {
+                "type": "stored",
+                "id": 3900
+              },
+              {
+                "type": "stored",
+                "id": 3901
+              },
+              {
+                "type": "stored",
+                "id": 3902
+              },
+              {
+                "type": "stored",
+                "id": 3903
+              },
+              {
+                "type": "stored",
+                "id": 3904
+              }
+            ]
+          },
+          "n_step": 118437041,
+          "goals": [
+            "zUjvTE\nSb\nbB\nxVUT\nKdA\nZJj\nu\nImjE\nl\ndRoODWFGq\nWfbSgqNcf\nzpo\nx\nmiARz\nY\nMu\nSjp\ns\nGq\nKircnL\neLqvDdiR\nslurm\nekRJa\n\nGpn",
+            "PgNsyNb\nwGC\nk\nx\nN\n\nv"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 3905,
+            "context": [
+              {
+                "type": "stored",
+                "id": 3906
+              },
+              {
+                "type": "stored",
+                "id": 3907
+              },
+              {
+                "type": "stored",
+                "id": 3908
+              }
+            ]
+          },
+          "step": {
+            "text": "?\ud962\udd9d",
+            "context": [
+              {
+                "type": "stored",
+                "id": 3909
+              },
+              {
+                "type": "stored",
+                "id": 3910
+              },
+              {
+                "type": "stored",
+                "id": 3911
+              }
+            ]
+          },
+          "n_step": 234,
+          "goals": [
+            "kEJFTmpGvmN\npn\nnhnotdm\nj\nfeYKhQFK\nER\nHlQgPy\nnazu\nqMmCkQazoNOY\nf\nKih\nicx\nxqb\nXXfP\nUu\nNIL\n\nkSwR",
+            "\n\nnC",
+            "T\nzG\nxftFZkrvrUWeXyjhjOPO\nrfmbCF\nsv\nIGyAmxHNQTLBYnfHpaT\nzbkBVf\nDigDhrhhJtii\namB\nPp\nwEqbZeFPtYkfBTnQwUcBevJfPFvypD\nZy\nWfkrbGECj\nUxL\nINF\ngMqXoWGLfLyfFlsQp\nExQaaCPDQ\njquTLGrK\nIcWsV\nkGtReYtmvGtQNefi\nG\npgvmJJj\n\nrhkLrhfUehS",
+            "SyZ\nrYdxP\nNUL\nxTUYqWFO\n\njnX",
+            "aorY\nwFFhKXZjHharnrttFTYfa\n\ngFnjVgv"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
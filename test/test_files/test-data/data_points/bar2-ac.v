@@ -0,0 +1,10 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar2/ac.v\", \"workspace\": \"/coq-dataset/repos/bar2\", \"repository\": \"/coq-dataset/repos/bar2\"}",
+    "{\"type\": \"stored\", \"id\": 3912}",
+    "{\"type\": \"stored\", \"id\": 3913}",
+    "{\"type\": \"stored\", \"id\": 3914}",
+    "{\"type\": \"stored\", \"id\": 3915}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
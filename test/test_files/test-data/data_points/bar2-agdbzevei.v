@@ -0,0 +1,270 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar2/agdbzevei.v\", \"workspace\": \"/coq-dataset/repos/bar2\", \"repository\": \"/coq-dataset/repos/bar2\"}",
+    "{\"type\": \"stored\", \"id\": 3796}",
+    "{\"type\": \"stored\", \"id\": 3797}",
+    "{\"type\": \"stored\", \"id\": 3798}",
+    "{\"type\": \"stored\", \"id\": 3799}",
+    "{\"type\": \"stored\", \"id\": 3800}",
+    "{\"type\": \"stored\", \"id\": 3801}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 3802,
+        "context": [
+          {
+            "type": "stored",
+            "id": 3803
+          },
+          {
+            "type": "stored",
+            "id": 3804
+          },
+          {
+            "type": "stored",
+            "id": 3805
+          },
+          {
+            "type": "stored",
+            "id": 3806
+          },
+          {
+            "type": "stored",
+            "id": 3807
+          },
+          {
+            "type": "stored",
+            "id": 3808
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 3809,
+            "context": [
+              {
+                "type": "stored",
+                "id": 3810
+              },
+              {
+                "type": "stored",
+                "id": 3811
+              },
+              {
+                "type": "stored",
+                "id": 3812
+              },
+              {
+                "type": "stored",
+                "id": 3813
+              },
+              {
+                "type": "stored",
+                "id": 3814
+              },
+              {
+                "type": "stored",
+                "id": 3815
+              },
+              {
+                "type": "stored",
+                "id": 3816
+              },
+              {
+                "type": "stored",
+                "id": 3817
+              }
+            ]
+          },
+          "step": {
+            "text": "\uda79\udf6bS\ud93c\udd9f",
+            "context": []
+          },
+          "n_step": 17392,
+          "goals": [
+            "nHVcRjxDgPruowmfEFRxR\nObxw\nEtboBZFg\nOHcQCHoNjRIXWXEbDGbdISemlF\ntuhySav\nmxcfjXPs\nnWS\nbraTzZEHWUkjniQRYNk\nY\nGjEYJQBYORIWsI\nfonUwwYF\nBzGD\nFup\nMisUwXBIsUMCgXBiWRKaHKQpVi\nt\nbYcXGYaFTBL\nTrue\nRc\nOjFCV\nKotioypRbObVBul\nthen\nzaQE\ntLvbqvJlI\nUPoS\nrooxgeZbQS\nhw\nYOx\nAL\nUIgS\njXKJw\nJnxlThgADCVsXyXAemPOcNn\n\nVdQ",
+            "OTcvCkIviefGgh\n\naP"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 3818,
+            "context": [
+              {
+                "type": "stored",
+                "id": 3819
+              },
+              {
+                "type": "stored",
+                "id": 3820
+              },
+              {
+                "type": "stored",
+                "id": 3821
+              },
+              {
+                "type": "stored",
+                "id": 3822
+              },
+              {
+                "type": "stored",
+                "id": 3823
+              },
+              {
+                "type": "stored",
+                "id": 3824
+              },
+              {
+                "type": "stored",
+                "id": 3825
+              }
+            ]
+          },
+          "step": {
+            "text": "\b\u00e8\u00b2\uda00\udcce\ud92f\udca6\u00dc",
+            "context": [
+              {
+                "type": "stored",
+                "id": 3826
+              },
+              {
+                "type": "stored",
+                "id": 3827
+              },
+              {
+                "type": "stored",
+                "id": 3828
+              },
+              {
+                "type": "stored",
+                "id": 3829
+              }
+            ]
+          },
+          "n_step": -641937337,
+          "goals": [
+            "AMa\nj\nBAkkNPVjFO\n\nTBnNsJ",
+            "Rm\nC\n\nu"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 3830,
+            "context": [
+              {
+                "type": "stored",
+                "id": 3831
+              },
+              {
+                "type": "stored",
+                "id": 3832
+              },
+              {
+                "type": "stored",
+                "id": 3833
+              },
+              {
+                "type": "stored",
+                "id": 3834
+              },
+              {
+                "type": "stored",
+                "id": 3835
+              },
+              {
+                "type": "stored",
+                "id": 3836
+              }
+            ]
+          },
+          "step": {
+            "text": "i#\ud9d6\ude2a\u00ae\u00b9\u00d5V\u00e7\ud9d1\udfdd\u00be\r\ud8c6\udd01",
+            "context": [
+              {
+                "type": "stored",
+                "id": 3837
+              },
+              {
+                "type": "stored",
+                "id": 3838
+              },
+              {
+                "type": "stored",
+                "id": 3839
+              },
+              {
+                "type": "stored",
+                "id": 3840
+              },
+              {
+                "type": "stored",
+                "id": 3841
+              },
+              {
+                "type": "stored",
+                "id": 3842
+              },
+              {
+                "type": "stored",
+                "id": 3843
+              }
+            ]
+          },
+          "n_step": 482156,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 3844,
+            "context": [
+              {
+                "type": "stored",
+                "id": 3845
+              },
+              {
+                "type": "stored",
+                "id": 3846
+              },
+              {
+                "type": "stored",
+                "id": 3847
+              }
+            ]
+          },
+          "step": {
+            "text": "\u008e~",
+            "context": [
+              {
+                "type": "stored",
+                "id": 3848
+              }
+            ]
+          },
+          "n_step": -1039,
+          "goals": [
+            "\n\nfieDKufHqtah",
+            "W\n\nyXA",
+            "n\nOVmKsqHG\nAhcA\nGc\nPyvglUUy\nvB\nHrN\nFIXPOINT\nMWni\nGxXfy\nQq\naZpNyp\ncZKKHE\nlpBhuN\npzn\nqordhji\nV\nK\nOA\naHqcoWN\ni\nnu\n\nU",
+            "EmvF\njKSGpkPi\nYBuO\nGzo\nFixVN\n\nGUKPQ",
+            "VTWEhyxJB\nWJgLFssC\nepiv\nosOTd\npzOMJYJSj\n\nInfinity",
+            "u\nTI\na\nqTZqMdKb\nsL\nzW\nrE\n\nFdz",
+            "Q\nY\n\nzYOj",
+            "\n\noGqwReYr",
+            "FKvpkqAv\nzDUoIy\nrq\nEOsXNY\nwkKfekYyJBcxBh\nVdp\nwF\nRvhyrvKBo\nhQjxm\nF\n\nRgsJs",
+            "MVSKPgXUtDuCc\nMV\nEa\nJXGLaq\n\nuCEzMaQx",
+            "vOSQaKneLrH\nn\nXIlItMV\nsX\nHiZFgjBUFkYUsxQukmFEsPs\nxVGKzh\n\nugVGiizMvz",
+            "zYKNJbTbUEXxuVmt\ntDF\nuanSIGY\nuDPHTXy\nLXMJ\nwUUxRNLwC\n\nILPnbkQ",
+            "eAhslncXDu\nyrDtwcmaYNuFQxE\njxAV\nRL\nxhIUPMODyPBqFm\nMGSok\nmxwujCPJUyVaom\nWFnqBR\nyHlMxkEK\nTRUE\nccfGblZ\nNone\n\nLc"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,89 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar2/aoimtqljv.v\", \"workspace\": \"/coq-dataset/repos/bar2\", \"repository\": \"/coq-dataset/repos/bar2\"}",
+    "{\"type\": \"stored\", \"id\": 3684}",
+    "{\"type\": \"stored\", \"id\": 3685}",
+    "{\"type\": \"stored\", \"id\": 3686}",
+    "{\"type\": \"stored\", \"id\": 3687}",
+    "{\"type\": \"stored\", \"id\": 3688}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 3689,
+        "context": [
+          {
+            "type": "stored",
+            "id": 3690
+          },
+          {
+            "type": "stored",
+            "id": 3691
+          },
+          {
+            "type": "stored",
+            "id": 3692
+          },
+          {
+            "type": "stored",
+            "id": 3693
+          },
+          {
+            "type": "stored",
+            "id": 3694
+          },
+          {
+            "type": "stored",
+            "id": 3695
+          },
+          {
+            "type": "stored",
+            "id": 3696
+          },
+          {
+            "type": "stored",
+            "id": 3697
+          },
+          {
+            "type": "stored",
+            "id": 3698
+          },
+          {
+            "type": "stored",
+            "id": 3699
+          },
+          {
+            "type": "stored",
+            "id": 3700
+          },
+          {
+            "type": "stored",
+            "id": 3701
+          },
+          {
+            "type": "stored",
+            "id": 3702
+          },
+          {
+            "type": "stored",
+            "id": 3703
+          },
+          {
+            "type": "stored",
+            "id": 3704
+          },
+          {
+            "type": "stored",
+            "id": 3705
+          },
+          {
+            "type": "stored",
+            "id": 3706
+          }
+        ]
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,280 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar2/arpricc.v\", \"workspace\": \"/coq-dataset/repos/bar2\", \"repository\": \"/coq-dataset/repos/bar2\"}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 4054,
+        "context": [
+          {
+            "type": "stored",
+            "id": 4055
+          },
+          {
+            "type": "stored",
+            "id": 4056
+          },
+          {
+            "type": "stored",
+            "id": 4057
+          },
+          {
+            "type": "stored",
+            "id": 4058
+          },
+          {
+            "type": "stored",
+            "id": 4059
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 4060,
+            "context": [
+              {
+                "type": "stored",
+                "id": 4061
+              },
+              {
+                "type": "stored",
+                "id": 4062
+              },
+              {
+                "type": "stored",
+                "id": 4063
+              },
+              {
+                "type": "stored",
+                "id": 4064
+              },
+              {
+                "type": "stored",
+                "id": 4065
+              },
+              {
+                "type": "stored",
+                "id": 4066
+              },
+              {
+                "type": "stored",
+                "id": 4067
+              },
+              {
+                "type": "stored",
+                "id": 4068
+              },
+              {
+                "type": "stored",
+                "id": 4069
+              },
+              {
+                "type": "stored",
+                "id": 4070
+              },
+              {
+                "type": "stored",
+                "id": 4071
+              },
+              {
+                "type": "stored",
+                "id": 4072
+              },
+              {
+                "type": "stored",
+                "id": 4073
+              },
+              {
+                "type": "stored",
+                "id": 4074
+              },
+              {
+                "type": "stored",
+                "id": 4075
+              },
+              {
+                "type": "stored",
+                "id": 4076
+              },
+              {
+                "type": "stored",
+                "id": 4077
+              },
+              {
+                "type": "stored",
+                "id": 4078
+              },
+              {
+                "type": "stored",
+                "id": 4079
+              },
+              {
+                "type": "stored",
+                "id": 4080
+              },
+              {
+                "type": "stored",
+                "id": 4081
+              },
+              {
+                "type": "stored",
+                "id": 4082
+              },
+              {
+                "type": "stored",
+                "id": 4083
+              },
+              {
+                "type": "stored",
+                "id": 4084
+              },
+              {
+                "type": "stored",
+                "id": 4085
+              },
+              {
+                "type": "stored",
+                "id": 4086
+              },
+              {
+                "type": "stored",
+                "id": 4087
+              },
+              {
+                "type": "stored",
+                "id": 4088
+              },
+              {
+                "type": "stored",
+                "id": 4089
+              },
+              {
+                "type": "stored",
+                "id": 4090
+              },
+              {
+                "type": "stored",
+                "id": 4091
+              },
+              {
+                "type": "stored",
+                "id": 4092
+              },
+              {
+                "type": "stored",
+                "id": 4093
+              },
+              {
+                "type": "stored",
+                "id": 4094
+              },
+              {
+                "type": "stored",
+                "id": 4095
+              },
+              {
+                "type": "stored",
+                "id": 4096
+              },
+              {
+                "type": "stored",
+                "id": 4097
+              },
+              {
+                "type": "stored",
+                "id": 4098
+              }
+            ]
+          },
+          "step": {
+            "text": "\ud973\udda0\udbad\udf9c",
+            "context": [
+              {
+                "type": "stored",
+                "id": 4099
+              },
+              {
+                "type": "stored",
+                "id": 4100
+              },
+              {
+                "type": "stored",
+                "id": 4101
+              },
+              {
+                "type": "stored",
+                "id": 4102
+              },
+              {
+                "type": "stored",
+                "id": 4103
+              },
+              {
+                "type": "stored",
+                "id": 4104
+              },
+              {
+                "type": "stored",
+                "id": 4105
+              },
+              {
+                "type": "stored",
+                "id": 4106
+              },
+              {
+                "type": "stored",
+                "id": 4107
+              },
+              {
+                "type": "stored",
+                "id": 4108
+              },
+              {
+                "type": "stored",
+                "id": 4109
+              },
+              {
+                "type": "stored",
+                "id": 4110
+              },
+              {
+                "type": "stored",
+                "id": 4111
+              },
+              {
+                "type": "stored",
+                "id": 4112
+              },
+              {
+                "type": "stored",
+                "id": 4113
+              },
+              {
+                "type": "stored",
+                "id": 4114
+              },
+              {
+                "type": "stored",
+                "id": 4115
+              },
+              {
+                "type": "stored",
+                "id": 4116
+              },
+              {
+                "type": "stored",
+                "id": 4117
+              }
+            ]
+          },
+          "n_step": -17690944261,
+          "goals": []
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,113 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar2/avihr.v\", \"workspace\": \"/coq-dataset/repos/bar2\", \"repository\": \"/coq-dataset/repos/bar2\"}",
+    "{\"type\": \"stored\", \"id\": 4140}",
+    "{\"type\": \"stored\", \"id\": 4141}",
+    "{\"type\": \"stored\", \"id\": 4142}",
+    "{\"type\": \"stored\", \"id\": 4143}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 4144,
+        "context": [
+          {
+            "type": "stored",
+            "id": 4145
+          },
+          {
+            "type": "stored",
+            "id": 4146
+          },
+          {
+            "type": "stored",
+            "id": 4147
+          },
+          {
+            "type": "stored",
+            "id": 4148
+          },
+          {
+            "type": "stored",
+            "id": 4149
+          },
+          {
+            "type": "stored",
+            "id": 4150
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 4151,
+            "context": [
+              {
+                "type": "stored",
+                "id": 4152
+              },
+              {
+                "type": "stored",
+                "id": 4153
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00ca\ud92a\udcc1",
+            "context": []
+          },
+          "n_step": 85639716,
+          "goals": [
+            "qwFPEUmgaXm\nQYqF\nfVKjNBPQvAQsASELGTj\neYwVJddXcH\n\nomsLGiXJ"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 4154,
+            "context": [
+              {
+                "type": "stored",
+                "id": 4155
+              },
+              {
+                "type": "stored",
+                "id": 4156
+              },
+              {
+                "type": "stored",
+                "id": 4157
+              },
+              {
+                "type": "stored",
+                "id": 4158
+              }
+            ]
+          },
+          "step": {
+            "text": "\\1\u0012i\u008d\u0002\u001f\ud9f2\udfb4P",
+            "context": [
+              {
+                "type": "stored",
+                "id": 4159
+              }
+            ]
+          },
+          "n_step": -416175,
+          "goals": [
+            "T\n\nJ",
+            "AKSq\nddxKt\nmethod\nY\nWQIODncc\nh\nNus\nVaBhh\nBxSPlm\ngLlJCX\nYi\nhAvY\nrLEUReTxXumNzsQULj\nIlVWjlWNvZk\nGXRbu\naEYNHIeCzTrDKqrpcGAR\nhSRYodL\nP\nnil\nEtCcfwRHI\nZhL\nUQIS\nFoMBov\noXAtAFXDQF\nuDfLAwofyxMZtXd\n\nthen",
+            "\n\nNn",
+            "D\ndZIx\nyX\nm\nrFd\n\nFpYxZWZ",
+            "RaRdXOLvQyzqNCKfTrNT\nYq\nS\nQ\nuH\n\ncgxi",
+            "\n\ny",
+            "\n\nk",
+            "nwnmofVS\nctPgQ\nalocbqwQLDUBiUDpwh\nv\n\nWEAxQT"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,364 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar2/cvdbpy.v\", \"workspace\": \"/coq-dataset/repos/bar2\", \"repository\": \"/coq-dataset/repos/bar2\"}",
+    "{\"type\": \"stored\", \"id\": 3707}",
+    "{\"type\": \"stored\", \"id\": 3708}",
+    "{\"type\": \"stored\", \"id\": 3709}",
+    "{\"type\": \"stored\", \"id\": 3710}",
+    "{\"type\": \"stored\", \"id\": 3711}",
+    "{\"type\": \"stored\", \"id\": 3712}",
+    "{\"type\": \"stored\", \"id\": 3713}",
+    "{\"type\": \"stored\", \"id\": 3714}",
+    "{\"type\": \"stored\", \"id\": 3715}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 3716,
+        "context": [
+          {
+            "type": "stored",
+            "id": 3717
+          },
+          {
+            "type": "stored",
+            "id": 3718
+          },
+          {
+            "type": "stored",
+            "id": 3719
+          },
+          {
+            "type": "stored",
+            "id": 3720
+          },
+          {
+            "type": "stored",
+            "id": 3721
+          },
+          {
+            "type": "stored",
+            "id": 3722
+          },
+          {
+            "type": "stored",
+            "id": 3723
+          },
+          {
+            "type": "stored",
+            "id": 3724
+          },
+          {
+            "type": "stored",
+            "id": 3725
+          },
+          {
+            "type": "stored",
+            "id": 3726
+          },
+          {
+            "type": "stored",
+            "id": 3727
+          },
+          {
+            "type": "stored",
+            "id": 3728
+          },
+          {
+            "type": "stored",
+            "id": 3729
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 3730,
+            "context": [
+              {
+                "type": "stored",
+                "id": 3731
+              },
+              {
+                "type": "stored",
+                "id": 3732
+              }
+            ]
+          },
+          "step": {
+            "text": "muvm\u00d0\u00c7\u00d0z\ud860\udf49\u0091",
+            "context": [
+              {
+                "type": "stored",
+                "id": 3733
+              },
+              {
+                "type": "stored",
+                "id": 3734
+              }
+            ]
+          },
+          "n_step": -550,
+          "goals": [
+            "yx\nLN\ngv\nsKDO\nU\nVK\nwRAIo\nPZHsau\nQ\nhbdo\nK\neQ\nE\nd\n\nFbuRQyQDrkt",
+            "HhhAFIniPcBOyP\nfBHPY\nwSfAvWke\nXVVNYe\nByCmtacJtfqDl\ndlVDurfpnyk\nrAobD\nkhSjdMiFZDmAxMb\nSaving\nr\n\nevictions",
+            "eJ\nufQzUKivTDC\nNMoBQhE\nKNBU\nRgkQLtEDdJELjAipelyWakjUJq\n\nMjWLTV",
+            "qbW\niwQ\n\njYE",
+            "vBZRS\nVQHlZwgvBYGZAGh\nzQGTbQCbnqCBwENkFYpkj\n\nFuMObjshJjDVNqrr",
+            "EfKGMHpIKyoE\nSqOvQ\nFGbzSdMSptKiXyYGcqPcv\nQHTcn\nGgktHT\nmy\ngjpXLNL\n\nVxT",
+            "HRjiqmPkFwEtpvGj\nRTLwFrnqMiO\nbDvQL\nP\nEQJqGpdbpIEaKwqCItAIC\n\nOl",
+            "JLHRwp\nH\nP\n\nPnzBTrDrl",
+            "WoRFFsOJR\nou\n\nIXuya",
+            "yABCrikWAQJv\nId\n\nm",
+            "oI\nlnbXi\nscvInkK\n\niRTXYsQiBWg"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 3735,
+            "context": [
+              {
+                "type": "stored",
+                "id": 3736
+              },
+              {
+                "type": "stored",
+                "id": 3737
+              },
+              {
+                "type": "stored",
+                "id": 3738
+              },
+              {
+                "type": "stored",
+                "id": 3739
+              },
+              {
+                "type": "stored",
+                "id": 3740
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00f6",
+            "context": [
+              {
+                "type": "stored",
+                "id": 3741
+              },
+              {
+                "type": "stored",
+                "id": 3742
+              },
+              {
+                "type": "stored",
+                "id": 3743
+              },
+              {
+                "type": "stored",
+                "id": 3744
+              },
+              {
+                "type": "stored",
+                "id": 3745
+              },
+              {
+                "type": "stored",
+                "id": 3746
+              }
+            ]
+          },
+          "n_step": 7518629788,
+          "goals": [
+            "\n\nwHRkIHKuFZy",
+            "IwMswg\nbuJIFWSy\nMFNlJpWl\nX\ncbxtHc\nzebQBBQu\nH\n\nF",
+            "R\nX\n\nm",
+            "OADOg\nuxnWW\nl\nLNPd\n\ngpWAh",
+            "e\nef\nmpRA\nJY\nHJQNPHbC\nnaQZb\nVv\n\nyGnUgLQ",
+            "alias\nIgycVsBBPiUlK\nYu\nYxTy\naSDksSkGGaN\nK\ngJpIafHqebWW\n\nEbexaBSBI"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 3747,
+            "context": [
+              {
+                "type": "stored",
+                "id": 3748
+              },
+              {
+                "type": "stored",
+                "id": 3749
+              },
+              {
+                "type": "stored",
+                "id": 3750
+              },
+              {
+                "type": "stored",
+                "id": 3751
+              },
+              {
+                "type": "stored",
+                "id": 3752
+              },
+              {
+                "type": "stored",
+                "id": 3753
+              },
+              {
+                "type": "stored",
+                "id": 3754
+              },
+              {
+                "type": "stored",
+                "id": 3755
+              },
+              {
+                "type": "stored",
+                "id": 3756
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 3757
+              }
+            ]
+          },
+          "n_step": -668474,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 3758,
+            "context": [
+              {
+                "type": "stored",
+                "id": 3759
+              },
+              {
+                "type": "stored",
+                "id": 3760
+              },
+              {
+                "type": "stored",
+                "id": 3761
+              },
+              {
+                "type": "stored",
+                "id": 3762
+              },
+              {
+                "type": "stored",
+                "id": 3763
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 3764
+              }
+            ]
+          },
+          "n_step": 1306427,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 3765,
+            "context": []
+          },
+          "step": {
+            "text": "+\udaf6\ude38\u00f7\ud8c6\udff4t\u0016",
+            "context": [
+              {
+                "type": "stored",
+                "id": 3766
+              },
+              {
+                "type": "stored",
+                "id": 3767
+              },
+              {
+                "type": "stored",
+                "id": 3768
+              },
+              {
+                "type": "stored",
+                "id": 3769
+              },
+              {
+                "type": "stored",
+                "id": 3770
+              },
+              {
+                "type": "stored",
+                "id": 3771
+              }
+            ]
+          },
+          "n_step": 1253,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 3772,
+            "context": []
+          },
+          "step": {
+            "text": "\u00cb\u0003\udb2b\udca8",
+            "context": [
+              {
+                "type": "stored",
+                "id": 3773
+              },
+              {
+                "type": "stored",
+                "id": 3774
+              },
+              {
+                "type": "stored",
+                "id": 3775
+              },
+              {
+                "type": "stored",
+                "id": 3776
+              },
+              {
+                "type": "stored",
+                "id": 3777
+              },
+              {
+                "type": "stored",
+                "id": 3778
+              },
+              {
+                "type": "stored",
+                "id": 3779
+              }
+            ]
+          },
+          "n_step": -118885,
+          "goals": [
+            "Xmho\n\nI",
+            "QuD\nQZUKSyiKSH\npdq\noJ\n\nr"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,457 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar2/false.v\", \"workspace\": \"/coq-dataset/repos/bar2\", \"repository\": \"/coq-dataset/repos/bar2\"}",
+    "{\"type\": \"stored\", \"id\": 4227}",
+    "{\"type\": \"stored\", \"id\": 4228}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 4229,
+        "context": [
+          {
+            "type": "stored",
+            "id": 4230
+          },
+          {
+            "type": "stored",
+            "id": 4231
+          },
+          {
+            "type": "stored",
+            "id": 4232
+          },
+          {
+            "type": "stored",
+            "id": 4233
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 4234,
+            "context": []
+          },
+          "step": {
+            "text": "\u00fc\u00ed\ud95b\udec4\udaee\ude02\u00da\u00b7\udb7e\udc70*g,",
+            "context": [
+              {
+                "type": "stored",
+                "id": 4235
+              },
+              {
+                "type": "stored",
+                "id": 4236
+              },
+              {
+                "type": "stored",
+                "id": 4237
+              },
+              {
+                "type": "stored",
+                "id": 4238
+              }
+            ]
+          },
+          "n_step": 336,
+          "goals": [
+            "Z\nMH\nXLDGiuJp\ncontext\nT\nGOfTd\nkZHhGQMaHOVeHpMLCccBOIh\nHEsiuesXwpjmAde\nBwFWEGiV\nxvP\nHS\n\njwd",
+            "\n\nMfdtghcflYzNl",
+            "N\nCZk\nKcjrVBzrsRR\n\nD"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 4239,
+            "context": []
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 4240
+              },
+              {
+                "type": "stored",
+                "id": 4241
+              },
+              {
+                "type": "stored",
+                "id": 4242
+              },
+              {
+                "type": "stored",
+                "id": 4243
+              },
+              {
+                "type": "stored",
+                "id": 4244
+              },
+              {
+                "type": "stored",
+                "id": 4245
+              },
+              {
+                "type": "stored",
+                "id": 4246
+              },
+              {
+                "type": "stored",
+                "id": 4247
+              },
+              {
+                "type": "stored",
+                "id": 4248
+              },
+              {
+                "type": "stored",
+                "id": 4249
+              }
+            ]
+          },
+          "n_step": -12644,
+          "goals": [
+            "E\nKUvl\nUOJWYWmdBRPmvldOBjCBNc\ncwRfSFnlKhdprTy\nvP\nH\n\nrcLPzq",
+            "yhKbXCrt\nCaWABNGjxemTiu\nj\nQ\nC\nUs\ntO\n\nS",
+            "\n\nCPBtrh",
+            "CYF\nTmmvcoSNA\nxHcnPWk\nDhhr\nhoerJcPgBn\nNz\nIviSqJFjmOTyrstJwpry\nBkVygxGxziftHuf\njNjIlageMDt\nGY\n\njxUlqpFbypMelIqIiphaSwQFMPzzlQmmcpG",
+            "\n\nsUU",
+            "WWe\n\nhH",
+            "cl\n\nDFjywU",
+            "XOS\nhSZqPjPXIGTIuG\nKtQLMhFNrTBQCTAciYN\nrbz\nRCJFXbJhnekYZbM\nmNOgXbyLfHjNcKFQFfYGO\nzoPdKeKoYoVNYbmqsJNkVJEIHsCsdnNMCpGVB\nH\nrnmMI\ng\nScunthorpe\njevxE\nZB\nKmll\npBc\nloc\n\ndyshYsC"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 4250,
+            "context": [
+              {
+                "type": "stored",
+                "id": 4251
+              },
+              {
+                "type": "stored",
+                "id": 4252
+              },
+              {
+                "type": "stored",
+                "id": 4253
+              }
+            ]
+          },
+          "step": {
+            "text": "\r?.E(\u0087U",
+            "context": [
+              {
+                "type": "stored",
+                "id": 4254
+              },
+              {
+                "type": "stored",
+                "id": 4255
+              },
+              {
+                "type": "stored",
+                "id": 4256
+              },
+              {
+                "type": "stored",
+                "id": 4257
+              },
+              {
+                "type": "stored",
+                "id": 4258
+              },
+              {
+                "type": "stored",
+                "id": 4259
+              }
+            ]
+          },
+          "n_step": -5988441,
+          "goals": [
+            "NJB\nbjzxQrpVVrrBbqG\ne\nWfJKIG\n\nJO",
+            "Nr\nakYXCRg\noolAbHfZ\nRuqpEzvvJIUYh\nOutX\n\nv",
+            "nil\ntfidf\nxL\nM\nIhtN\nAw\nFalse\nN\nvwr\n\nelse",
+            "HeuvjDtUVEc\nTKRRV\nqFtfUIEhJfAIxY\nZ\nFU\nqzzyA\nzPvr\n\nIKAM"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 4260,
+            "context": [
+              {
+                "type": "stored",
+                "id": 4261
+              },
+              {
+                "type": "stored",
+                "id": 4262
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00e3\u0004\ud8d4\udd1a\uda2c\udef9\u008e\ud927\udcc9aUl",
+            "context": [
+              {
+                "type": "stored",
+                "id": 4263
+              },
+              {
+                "type": "stored",
+                "id": 4264
+              },
+              {
+                "type": "stored",
+                "id": 4265
+              },
+              {
+                "type": "stored",
+                "id": 4266
+              }
+            ]
+          },
+          "n_step": 3664,
+          "goals": [
+            "inUW\n\nzExeHQtSM",
+            "\n\nMYhOvSM",
+            "D\nZHEqn\nV\noZTctn\nqr\nrutm\nWJUZZK\npwYzAlsklbGCL\n\nsmL",
+            "M\nAnrlIi\n\nmgJ"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 4267,
+            "context": [
+              {
+                "type": "stored",
+                "id": 4268
+              },
+              {
+                "type": "stored",
+                "id": 4269
+              },
+              {
+                "type": "stored",
+                "id": 4270
+              },
+              {
+                "type": "stored",
+                "id": 4271
+              },
+              {
+                "type": "stored",
+                "id": 4272
+              },
+              {
+                "type": "stored",
+                "id": 4273
+              },
+              {
+                "type": "stored",
+                "id": 4274
+              },
+              {
+                "type": "stored",
+                "id": 4275
+              },
+              {
+                "type": "stored",
+                "id": 4276
+              },
+              {
+                "type": "stored",
+                "id": 4277
+              },
+              {
+                "type": "stored",
+                "id": 4278
+              },
+              {
+                "type": "stored",
+                "id": 4279
+              },
+              {
+                "type": "stored",
+                "id": 4280
+              },
+              {
+                "type": "stored",
+                "id": 4281
+              },
+              {
+                "type": "stored",
+                "id": 4282
+              },
+              {
+                "type": "stored",
+                "id": 4283
+              },
+              {
+                "type": "stored",
+                "id": 4284
+              },
+              {
+                "type": "stored",
+                "id": 4285
+              },
+              {
+                "type": "stored",
+                "id": 4286
+              }
+            ]
+          },
+          "step": {
+            "text": "J\u00a4b\u00c7",
+            "context": [
+              {
+                "type": "stored",
+                "id": 4287
+              }
+            ]
+          },
+          "n_step": 242578163,
+          "goals": [
+            "G\nEVZF\n\nCKRXkUR",
+            "P\nohObDmoAzId\nlHjZypsPKlyJyR\nUE\nq\nUOklu\n\nZRcSEzY",
+            "ZOnVVwPGZvqj\naXnXaWAmr\nwuWGxtY\n\nXRfpWUBkkjgJzZDZp",
+            "null\n\nDeUIHUhQb"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 4288,
+            "context": [
+              {
+                "type": "stored",
+                "id": 4289
+              },
+              {
+                "type": "stored",
+                "id": 4290
+              },
+              {
+                "type": "stored",
+                "id": 4291
+              },
+              {
+                "type": "stored",
+                "id": 4292
+              },
+              {
+                "type": "stored",
+                "id": 4293
+              }
+            ]
+          },
+          "step": {
+            "text": "\u0098\u008a\u00d5e",
+            "context": [
+              {
+                "type": "stored",
+                "id": 4294
+              },
+              {
+                "type": "stored",
+                "id": 4295
+              },
+              {
+                "type": "stored",
+                "id": 4296
+              },
+              {
+                "type": "stored",
+                "id": 4297
+              }
+            ]
+          },
+          "n_step": 12642,
+          "goals": [
+            "NULL\nlcPpwhCF\nJDGlvm\nzmNQ\nP\nE\nYH\nE\nDwJ\nO\nentries\nxgOnUXWgH\nJCwjEWWqqTzICtxAIXYAbue\noZJMNqHWY\ngyxj\nVOxHg\nkER\namCQXfxE\njtI\n\nDqqEcVzt",
+            "C\nuUpQTNHyk\nKJSOctcgmWNCHRbcdnJDfEBHgZLA\n\nt",
+            "CUo\nVu\nPSESu\ny\nCN\ntSAQdLncoJ\n\nJjmCI"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 4298,
+            "context": [
+              {
+                "type": "stored",
+                "id": 4299
+              },
+              {
+                "type": "stored",
+                "id": 4300
+              },
+              {
+                "type": "stored",
+                "id": 4301
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00ad\u00db\u00eb\ud824\udfda\u0082\udbbb\uddc9\u00f8\u00ab\u00a5\u00c8*\udbab\ude40\u0085G\u0011w",
+            "context": [
+              {
+                "type": "stored",
+                "id": 4302
+              },
+              {
+                "type": "stored",
+                "id": 4303
+              },
+              {
+                "type": "stored",
+                "id": 4304
+              },
+              {
+                "type": "stored",
+                "id": 4305
+              },
+              {
+                "type": "stored",
+                "id": 4306
+              },
+              {
+                "type": "stored",
+                "id": 4307
+              },
+              {
+                "type": "stored",
+                "id": 4308
+              },
+              {
+                "type": "stored",
+                "id": 4309
+              },
+              {
+                "type": "stored",
+                "id": 4310
+              },
+              {
+                "type": "stored",
+                "id": 4311
+              }
+            ]
+          },
+          "n_step": -88127178718518848,
+          "goals": [
+            "\n\nNPaMQvBiPCFwzjotWi",
+            "\n\nxQod"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,227 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar2/grlf.v\", \"workspace\": \"/coq-dataset/repos/bar2\", \"repository\": \"/coq-dataset/repos/bar2\"}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 4312,
+        "context": [
+          {
+            "type": "stored",
+            "id": 4313
+          },
+          {
+            "type": "stored",
+            "id": 4314
+          },
+          {
+            "type": "stored",
+            "id": 4315
+          },
+          {
+            "type": "stored",
+            "id": 4316
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 4317,
+            "context": []
+          },
+          "step": {
+            "text": "\udaf2\udebbQ\uda67\udf98\u0094\f\u00b1",
+            "context": [
+              {
+                "type": "stored",
+                "id": 4318
+              },
+              {
+                "type": "stored",
+                "id": 4319
+              },
+              {
+                "type": "stored",
+                "id": 4320
+              },
+              {
+                "type": "stored",
+                "id": 4321
+              },
+              {
+                "type": "stored",
+                "id": 4322
+              },
+              {
+                "type": "stored",
+                "id": 4323
+              },
+              {
+                "type": "stored",
+                "id": 4324
+              },
+              {
+                "type": "stored",
+                "id": 4325
+              },
+              {
+                "type": "stored",
+                "id": 4326
+              },
+              {
+                "type": "stored",
+                "id": 4327
+              },
+              {
+                "type": "stored",
+                "id": 4328
+              },
+              {
+                "type": "stored",
+                "id": 4329
+              },
+              {
+                "type": "stored",
+                "id": 4330
+              },
+              {
+                "type": "stored",
+                "id": 4331
+              }
+            ]
+          },
+          "n_step": -582,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 4332,
+            "context": [
+              {
+                "type": "stored",
+                "id": 4333
+              },
+              {
+                "type": "stored",
+                "id": 4334
+              },
+              {
+                "type": "stored",
+                "id": 4335
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": []
+          },
+          "n_step": 24513,
+          "goals": [
+            "\n\nyGdfCoLKiFvO",
+            "IY\nyGRYGjk\ntNCD\nR\nocH\nlDGBdTwavh\nrO\n\netbX",
+            "VB\nQGSfEw\nr\nmrbPkEoLSyK\njn\n\nzQmCi",
+            "tfidf\ntryM\nsW\nwLDQWyob\ny\nwVfvoZvouGtx\nHaquKxRq\nDuAHX\nIynr\nnJZkWqsvML\nL\nFGSUBvOjBh\nGsjTDyqHBELfVcnpaBlI\nlXB\nahAY\nNaN\n\nSDXQmbyCFDWnF",
+            "hwZAk\n\nhiKuvtWxxa"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 4336,
+            "context": [
+              {
+                "type": "stored",
+                "id": 4337
+              },
+              {
+                "type": "stored",
+                "id": 4338
+              },
+              {
+                "type": "stored",
+                "id": 4339
+              },
+              {
+                "type": "stored",
+                "id": 4340
+              },
+              {
+                "type": "stored",
+                "id": 4341
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00fc\ud96b\uddb99\u00db\u0080\u0016\ud93a\udddf\u008c\ud904\udf32\u00db",
+            "context": [
+              {
+                "type": "stored",
+                "id": 4342
+              }
+            ]
+          },
+          "n_step": -38438036,
+          "goals": [
+            "q\ncO\nIj\nhIZaQCo\nundefined\nrbYVn\nwGa\na\nHuDS\nIkxYep\n\nbJesIrsDYUpkejCaCrIdDasnD",
+            "vEYpHZImAkVJxn\n\nYf",
+            "W\nAOSoGaNAaFh\nZb\nx\nwzO\n\nGSFvGwcrxO",
+            "eQx\nNFunu\nXp\nNaN\nZBNekWsr\nProposition\n\nPWj",
+            "fifSa\nJbQgxhlBTXEGWAQQgbibwAWarubuvJxoQQiDx\nRlChmvNSaEOMjFlevQaBVDczT\nw\nFlY\nhWV\nhuTfI\nzUGumYeQUAr\nin\nB\nFN\n\nfYJp",
+            "Inf\nb\nzLogVMZ\nO\noxwh\nidzhxXFf\ndlBGRFs\nL\nk\nNO\nKGZ\n\nCspLyuILdstQVTDNECRNeqo",
+            "RmSS\n\nBGti",
+            "WkJQs\nSOnZae\nssvSpNjhrL\nm\nK\nPJbd\nnB\nxbh\nlabel\nqgu\n\nmf",
+            "i\nLFYlgZ\nQav\nMfV\nb\nk\n\nUGlnZJ",
+            "hNApr\nhHCuZQ\nf\n\nNb",
+            "QbhT\nqymCoAnjvEfKO\nXBaIluR\nDniuD\nFVqe\nGTZlrGrLpqcE\nQgg\nJnHYgPZIeBZJLDtFQfh\n\nBOmxDayzAMz"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 4343,
+            "context": [
+              {
+                "type": "stored",
+                "id": 4344
+              },
+              {
+                "type": "stored",
+                "id": 4345
+              },
+              {
+                "type": "stored",
+                "id": 4346
+              },
+              {
+                "type": "stored",
+                "id": 4347
+              }
+            ]
+          },
+          "step": {
+            "text": "2\uda9e\udecbec\udbac\udc4eE\u00b6\u00b2C",
+            "context": []
+          },
+          "n_step": -18,
+          "goals": [
+            "FezlzytQM\nWMOpc\n\nSGUBBHEHLRSEMY",
+            "ylpt\nzdqkowyMtXAUQjvLirJs\nEDm\nUsKoXtgMy\nkumCfWGSmT\nE\nK\nYhsS\nt\nbA\n\nbr",
+            "zQOEwDsyN\npip\nINF\nvxOaawye\n\nfUPqweBZKpEajJr",
+            "pwKxsQnQixljnpAgbJTWoh\nnG\niJRwNJMnA\nk\nN\nCLMTSXlJhQLDB\nAPh\n\nFalse",
+            "JjRnZ\npip\nHy\nrAuD\n\nepRekXcdTSvlDfzAAwaovgrpR",
+            "\n\nT",
+            "\n\nH",
+            "kteMBvJNTQIs\nSabN\nJZYAqySzthVs\nQ\nNbKjKOzOe\nOCwAxvB\nqr\nw\nBdHpEXZ\nnnHwA\n\nMQIkxFyogoKYk",
+            "DUxdbOufppBKTb\ncOwlQ\nTGcmywCALFazsfmnB\nvr\ntI\n\nBrgnPzFlt",
+            "F\n\nUANs"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
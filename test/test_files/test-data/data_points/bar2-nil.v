@@ -0,0 +1,7 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar2/nil.v\", \"workspace\": \"/coq-dataset/repos/bar2\", \"repository\": \"/coq-dataset/repos/bar2\"}",
+    "{\"type\": \"stored\", \"id\": 4209}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
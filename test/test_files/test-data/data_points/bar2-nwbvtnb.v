@@ -0,0 +1,14 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar2/nwbvtnb.v\", \"workspace\": \"/coq-dataset/repos/bar2\", \"repository\": \"/coq-dataset/repos/bar2\"}",
+    "{\"type\": \"stored\", \"id\": 4160}",
+    "{\"type\": \"stored\", \"id\": 4161}",
+    "{\"type\": \"stored\", \"id\": 4162}",
+    "{\"type\": \"stored\", \"id\": 4163}",
+    "{\"type\": \"stored\", \"id\": 4164}",
+    "{\"type\": \"stored\", \"id\": 4165}",
+    "{\"type\": \"stored\", \"id\": 4166}",
+    "{\"type\": \"stored\", \"id\": 4167}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,22 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar2/o.v\", \"workspace\": \"/coq-dataset/repos/bar2\", \"repository\": \"/coq-dataset/repos/bar2\"}",
+    "{\"type\": \"stored\", \"id\": 3780}",
+    "{\"type\": \"stored\", \"id\": 3781}",
+    "{\"type\": \"stored\", \"id\": 3782}",
+    "{\"type\": \"stored\", \"id\": 3783}",
+    "{\"type\": \"stored\", \"id\": 3784}",
+    "{\"type\": \"stored\", \"id\": 3785}",
+    "{\"type\": \"stored\", \"id\": 3786}",
+    "{\"type\": \"stored\", \"id\": 3787}",
+    "{\"type\": \"stored\", \"id\": 3788}",
+    "{\"type\": \"stored\", \"id\": 3789}",
+    "{\"type\": \"stored\", \"id\": 3790}",
+    "{\"type\": \"stored\", \"id\": 3791}",
+    "{\"type\": \"stored\", \"id\": 3792}",
+    "{\"type\": \"stored\", \"id\": 3793}",
+    "{\"type\": \"stored\", \"id\": 3794}",
+    "{\"type\": \"stored\", \"id\": 3795}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
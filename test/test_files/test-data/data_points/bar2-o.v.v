@@ -0,0 +1,91 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar2/o.v.v\", \"workspace\": \"/coq-dataset/repos/bar2\", \"repository\": \"/coq-dataset/repos/bar2\"}",
+    "{\"type\": \"stored\", \"id\": 4212}",
+    "{\"type\": \"stored\", \"id\": 4213}",
+    "{\"type\": \"stored\", \"id\": 4214}",
+    "{\"type\": \"stored\", \"id\": 4215}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 4216,
+        "context": [
+          {
+            "type": "stored",
+            "id": 4217
+          },
+          {
+            "type": "stored",
+            "id": 4218
+          },
+          {
+            "type": "stored",
+            "id": 4219
+          },
+          {
+            "type": "stored",
+            "id": 4220
+          },
+          {
+            "type": "stored",
+            "id": 4221
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 4222,
+            "context": [
+              {
+                "type": "stored",
+                "id": 4223
+              }
+            ]
+          },
+          "step": {
+            "text": "c\u0015\u00c3\u008b",
+            "context": [
+              {
+                "type": "stored",
+                "id": 4224
+              }
+            ]
+          },
+          "n_step": -294787,
+          "goals": [
+            "h\nx\nlziTl\nAbkj\nJPjN\nPIwl\nRXeIh\ngRKMxrOUDxPAYEWKRuh\nf\nPYH\nvXgXGgZgc\nbvo\nN\nINFO\n\nvlARFU"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 4225,
+            "context": [
+              {
+                "type": "stored",
+                "id": 4226
+              }
+            ]
+          },
+          "step": {
+            "text": " t\u00d6",
+            "context": []
+          },
+          "n_step": -1254086,
+          "goals": [
+            "Da\ncxdm\n\nT",
+            "D\nrj\ngopAAoeSFzf\nptIeArDet\nnZrTTEV\nval\nRJV\nOdaZpKoVWX\nciLJaYS\nFzTBCaA\nanyRMDnyIsTra\n\nlkYHJKu",
+            "gDM\n\nKEZQ",
+            "O\nMmg\nGgjNMwPbapGdakCW\nwn\nLfYFHX\nxb\nP\n\nDeaaZhlu",
+            "\n\nSBM",
+            "\n\nfP"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
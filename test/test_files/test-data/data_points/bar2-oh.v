@@ -0,0 +1,123 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar2/oh.v\", \"workspace\": \"/coq-dataset/repos/bar2\", \"repository\": \"/coq-dataset/repos/bar2\"}",
+    "{\"type\": \"stored\", \"id\": 4169}",
+    "{\"type\": \"stored\", \"id\": 4170}",
+    "{\"type\": \"stored\", \"id\": 4171}",
+    "{\"type\": \"stored\", \"id\": 4172}",
+    "{\"type\": \"stored\", \"id\": 4173}",
+    "{\"type\": \"stored\", \"id\": 4174}",
+    "{\"type\": \"stored\", \"id\": 4175}",
+    "{\"type\": \"stored\", \"id\": 4176}",
+    "{\"type\": \"stored\", \"id\": 4177}",
+    "{\"type\": \"stored\", \"id\": 4178}",
+    "{\"type\": \"stored\", \"id\": 4179}",
+    "{\"type\": \"stored\", \"id\": 4180}",
+    "{\"type\": \"stored\", \"id\": 4181}",
+    "{\"type\": \"stored\", \"id\": 4182}",
+    "{\"type\": \"stored\", \"id\": 4183}",
+    "{\"type\": \"stored\", \"id\": 4184}",
+    "{\"type\": \"stored\", \"id\": 4185}",
+    "{\"type\": \"stored\", \"id\": 4186}",
+    "{\"type\": \"stored\", \"id\": 4187}",
+    "{\"type\": \"stored\", \"id\": 4188}",
+    "{\"type\": \"stored\", \"id\": 4189}",
+    "{\"type\": \"stored\", \"id\": 4190}",
+    "{\"type\": \"stored\", \"id\": 4191}",
+    "{\"type\": \"stored\", \"id\": 4192}",
+    "{\"type\": \"stored\", \"id\": 4193}",
+    "{\"type\": \"stored\", \"id\": 4194}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 4195,
+        "context": [
+          {
+            "type": "stored",
+            "id": 4196
+          },
+          {
+            "type": "stored",
+            "id": 4197
+          },
+          {
+            "type": "stored",
+            "id": 4198
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 4199,
+            "context": [
+              {
+                "type": "stored",
+                "id": 4200
+              },
+              {
+                "type": "stored",
+                "id": 4201
+              },
+              {
+                "type": "stored",
+                "id": 4202
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00e4]q\u00ae\ud9ad\udd11I\u0007\udb69\udc90\u0014\u00b9\u00c27",
+            "context": [
+              {
+                "type": "stored",
+                "id": 4203
+              },
+              {
+                "type": "stored",
+                "id": 4204
+              },
+              {
+                "type": "stored",
+                "id": 4205
+              },
+              {
+                "type": "stored",
+                "id": 4206
+              },
+              {
+                "type": "stored",
+                "id": 4207
+              },
+              {
+                "type": "stored",
+                "id": 4208
+              }
+            ]
+          },
+          "n_step": -252548411,
+          "goals": [
+            "UscxC\n\nRaPlHsDxcYpOBq",
+            "zpBam\nt\nuYklkbNureDeWTM\nnMJDy\n\nLnale",
+            "KkeqEwvaMfaY\ngsz\noyos\ngwATAVNyYkqQGDTfTe\nG\nIYeKSqFG\nq\nlkS\nCyCJpdGJJSPQeDxSzCyiwnmOgkmYgwCuGKuUYbXhhjIhNBQJiKUwUFXhoPClZtUvGkamEzn\n\nmacJvwNM",
+            "njHPm\ngK\nn\npgHqe\nvWFF\nsJk\nBemvndQ\n\nHIX",
+            "k\nnaLp\nQRDgQNfmHisc\n\nsjPjhOCGhFlCQ",
+            "RftVI\nkxCa\nzzahoWPcJbEerEIMqsyNRUv\no\n\nneb",
+            "D\nCPHeIVxR\njHYYchtRwW\nhMN\nV\nffqjmrOcUI\nLaMQOCtdp\n\njSZKc",
+            "\n\nz",
+            "\n\nQPts",
+            "M\nO\no\nFu\nzVeH\nyy\nZbhQEx\nlimvnAgRNLb\nE\ntJ\nMslIh\niuJwOYinqA\nTBnbejMMePsw\nfVYVljbvGlimPHD\nMkFao\njhDL\nZhIfEaMiaAvwJKPVd\nY\nt\nHp\nCnrZ\ntTwN\ncnOMHgkW\nFRy\ngMSKy\nC\nIu\nvqDhAml\nUIA\nvPMYlpHnifx\n\nrUMZdjbekwzaFNYjDO",
+            "nkvxgnUQ\npremise\nJ\nWim\nafi\nFo\nlYuZOEEGnSqhPR\nrpIqhYdJ\nF\nbYR\nCOROLLARY\nV\nnIL\nBxAOY\n\nggF",
+            "tnBaVeXxe\nwarning\noTzFGFMCRLFQ\nSeDKfV\nhFmxLAJCxWpNX\n\nxS",
+            "d\nSBAvpttQwUv\nKs\nxshDxvjYt\nwIqEtBBLO\nTjQjjjMUizdAuDtOvG\nRrHPnl\nnil\nAjcrSh\nhHwodtYo\nzLKE\ndkfrlCDOHWWzCW\nIMK\nSuazbFuxuQ\nC\nUlf\nckacDf\nUM\nih\n\nFdtjyCDGmtlmb",
+            "Ff\nqiRB\nif\nQthahqRJw\nNaN\nLhqpJEsXpVO\n\niI",
+            "\n\nakFnWBZV",
+            "\n\nUOERwbwtvOdt"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,330 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar2/pgkocpscru.v\", \"workspace\": \"/coq-dataset/repos/bar2\", \"repository\": \"/coq-dataset/repos/bar2\"}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 3997,
+        "context": [
+          {
+            "type": "stored",
+            "id": 3998
+          },
+          {
+            "type": "stored",
+            "id": 3999
+          },
+          {
+            "type": "stored",
+            "id": 4000
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 4001,
+            "context": []
+          },
+          "step": {
+            "text": "\u0081\u000e\u001b\ud9ce\udf47\u0002",
+            "context": [
+              {
+                "type": "stored",
+                "id": 4002
+              }
+            ]
+          },
+          "n_step": -26773,
+          "goals": [
+            "RNl\nOGVqwaHRYhthh\nY\nL\nFJDl\nlNMagJN\n\neKjbNYQxA"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 4003,
+            "context": [
+              {
+                "type": "stored",
+                "id": 4004
+              }
+            ]
+          },
+          "step": {
+            "text": "\u001b",
+            "context": []
+          },
+          "n_step": -56749689830787301376,
+          "goals": [
+            "LpA\nbN\nTACTIC\ncvMC\n\nZe",
+            "\n\nqEtS",
+            "POkgm\nstored\nxwdmnsAaqajdLsq\nDGUZN\nSS\nJpiD\nMjTDQmbiEPQwjWlCQ\nvocab\n\niqUzhnSi",
+            "UqZzIDrCogvcnjXvH\ntRxc\njft\nfphzqG\nIp\niblWAkw\nEEyd\naH\nH\ny\nKiXNx\nK\nHQxzAk\nzmfOvpBjnlxsLcfOHYmFCZX\nN\nL\na\nWiDImuQpQnBH\nTJhIabdXmCVX\nUYdWYqLWqphh\nOIfDQ\nLQ\n\nBMahX",
+            "\n\nTRUE",
+            "zcqae\n\nMAW",
+            "SgSdUl\nwNfFtJILLvkTZ\nGqgfC\n\nthen"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 4005,
+            "context": [
+              {
+                "type": "stored",
+                "id": 4006
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 4007
+              },
+              {
+                "type": "stored",
+                "id": 4008
+              },
+              {
+                "type": "stored",
+                "id": 4009
+              },
+              {
+                "type": "stored",
+                "id": 4010
+              }
+            ]
+          },
+          "n_step": 111,
+          "goals": [
+            "t\nfJTFLwaKw\naqj\nRRIkKGnwenrGujQsvmx\nx\nhlNV\niUfQIb\nA\nIDZYuM\nUDB\ntpi\niCeLoF\nsSYgpzlJ\nImBsk\nhyps\n\njf"
+          ]
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 4011,
+        "context": [
+          {
+            "type": "stored",
+            "id": 4012
+          },
+          {
+            "type": "stored",
+            "id": 4013
+          },
+          {
+            "type": "stored",
+            "id": 4014
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 4015,
+            "context": [
+              {
+                "type": "stored",
+                "id": 4016
+              },
+              {
+                "type": "stored",
+                "id": 4017
+              },
+              {
+                "type": "stored",
+                "id": 4018
+              },
+              {
+                "type": "stored",
+                "id": 4019
+              },
+              {
+                "type": "stored",
+                "id": 4020
+              },
+              {
+                "type": "stored",
+                "id": 4021
+              },
+              {
+                "type": "stored",
+                "id": 4022
+              },
+              {
+                "type": "stored",
+                "id": 4023
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00c9\u001eU\u0017\ud862\ude4f\udbe4\udd46\ud9aa\udff6\ud85b\ude5d\ud863\udf7b\u00b5\uda85\uddb9\u0014\udada\ude32\ud8c6\udf3a",
+            "context": [
+              {
+                "type": "stored",
+                "id": 4024
+              },
+              {
+                "type": "stored",
+                "id": 4025
+              },
+              {
+                "type": "stored",
+                "id": 4026
+              },
+              {
+                "type": "stored",
+                "id": 4027
+              }
+            ]
+          },
+          "n_step": -10214,
+          "goals": [
+            "uU\nvBNahJilgS\nltrbr\n\nU",
+            "c\narray\nfKf\nB\ng\n\nOXwOhT"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 4028,
+            "context": [
+              {
+                "type": "stored",
+                "id": 4029
+              },
+              {
+                "type": "stored",
+                "id": 4030
+              },
+              {
+                "type": "stored",
+                "id": 4031
+              },
+              {
+                "type": "stored",
+                "id": 4032
+              },
+              {
+                "type": "stored",
+                "id": 4033
+              },
+              {
+                "type": "stored",
+                "id": 4034
+              },
+              {
+                "type": "stored",
+                "id": 4035
+              },
+              {
+                "type": "stored",
+                "id": 4036
+              },
+              {
+                "type": "stored",
+                "id": 4037
+              },
+              {
+                "type": "stored",
+                "id": 4038
+              },
+              {
+                "type": "stored",
+                "id": 4039
+              },
+              {
+                "type": "stored",
+                "id": 4040
+              },
+              {
+                "type": "stored",
+                "id": 4041
+              },
+              {
+                "type": "stored",
+                "id": 4042
+              },
+              {
+                "type": "stored",
+                "id": 4043
+              }
+            ]
+          },
+          "step": {
+            "text": "\ud895\udf53",
+            "context": [
+              {
+                "type": "stored",
+                "id": 4044
+              },
+              {
+                "type": "stored",
+                "id": 4045
+              },
+              {
+                "type": "stored",
+                "id": 4046
+              },
+              {
+                "type": "stored",
+                "id": 4047
+              },
+              {
+                "type": "stored",
+                "id": 4048
+              },
+              {
+                "type": "stored",
+                "id": 4049
+              }
+            ]
+          },
+          "n_step": 65536,
+          "goals": [
+            "Il\n\nFssJBD",
+            "CKMNbmriHDayvfXm\nE\nqCj\nOE\nJB\nebyy\nUYgNNSBlMw\n\nB"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 4050,
+            "context": []
+          },
+          "step": {
+            "text": "\u00f0",
+            "context": [
+              {
+                "type": "stored",
+                "id": 4051
+              }
+            ]
+          },
+          "n_step": -1262061574725647,
+          "goals": [
+            "\n\nJ"
+          ]
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 4052,
+        "context": []
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,8 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar2/rectype.v\", \"workspace\": \"/coq-dataset/repos/bar2\", \"repository\": \"/coq-dataset/repos/bar2\"}",
+    "{\"type\": \"stored\", \"id\": 4210}",
+    "{\"type\": \"stored\", \"id\": 4211}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,24 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar2/rharvw.v\", \"workspace\": \"/coq-dataset/repos/bar2\", \"repository\": \"/coq-dataset/repos/bar2\"}",
+    "{\"type\": \"stored\", \"id\": 4118}",
+    "{\"type\": \"stored\", \"id\": 4119}",
+    "{\"type\": \"stored\", \"id\": 4120}",
+    "{\"type\": \"stored\", \"id\": 4121}",
+    "{\"type\": \"stored\", \"id\": 4122}",
+    "{\"type\": \"stored\", \"id\": 4123}",
+    "{\"type\": \"stored\", \"id\": 4124}",
+    "{\"type\": \"stored\", \"id\": 4125}",
+    "{\"type\": \"stored\", \"id\": 4126}",
+    "{\"type\": \"stored\", \"id\": 4127}",
+    "{\"type\": \"stored\", \"id\": 4128}",
+    "{\"type\": \"stored\", \"id\": 4129}",
+    "{\"type\": \"stored\", \"id\": 4130}",
+    "{\"type\": \"stored\", \"id\": 4131}",
+    "{\"type\": \"stored\", \"id\": 4132}",
+    "{\"type\": \"stored\", \"id\": 4133}",
+    "{\"type\": \"stored\", \"id\": 4134}",
+    "{\"type\": \"stored\", \"id\": 4135}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,347 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar2/rzpkvtuhcn.v\", \"workspace\": \"/coq-dataset/repos/bar2\", \"repository\": \"/coq-dataset/repos/bar2\"}",
+    "{\"type\": \"stored\", \"id\": 3916}",
+    "{\"type\": \"stored\", \"id\": 3917}",
+    "{\"type\": \"stored\", \"id\": 3918}",
+    "{\"type\": \"stored\", \"id\": 3919}",
+    "{\"type\": \"stored\", \"id\": 3920}",
+    "{\"type\": \"stored\", \"id\": 3921}",
+    "{\"type\": \"stored\", \"id\": 3922}",
+    "{\"type\": \"stored\", \"id\": 3923}",
+    "{\"type\": \"stored\", \"id\": 3924}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 3925,
+        "context": []
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 3926,
+            "context": []
+          },
+          "step": {
+            "text": "\u00b5\udb3b\uddbaB\ud8e9\udcf5\uda63\uddbf\u00a4\ud81a\udf9f\u0096}",
+            "context": [
+              {
+                "type": "stored",
+                "id": 3927
+              },
+              {
+                "type": "stored",
+                "id": 3928
+              },
+              {
+                "type": "stored",
+                "id": 3929
+              },
+              {
+                "type": "stored",
+                "id": 3930
+              },
+              {
+                "type": "stored",
+                "id": 3931
+              },
+              {
+                "type": "stored",
+                "id": 3932
+              },
+              {
+                "type": "stored",
+                "id": 3933
+              },
+              {
+                "type": "stored",
+                "id": 3934
+              },
+              {
+                "type": "stored",
+                "id": 3935
+              },
+              {
+                "type": "stored",
+                "id": 3936
+              },
+              {
+                "type": "stored",
+                "id": 3937
+              },
+              {
+                "type": "stored",
+                "id": 3938
+              },
+              {
+                "type": "stored",
+                "id": 3939
+              },
+              {
+                "type": "stored",
+                "id": 3940
+              },
+              {
+                "type": "stored",
+                "id": 3941
+              }
+            ]
+          },
+          "n_step": -27615,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 3942,
+            "context": [
+              {
+                "type": "stored",
+                "id": 3943
+              },
+              {
+                "type": "stored",
+                "id": 3944
+              },
+              {
+                "type": "stored",
+                "id": 3945
+              },
+              {
+                "type": "stored",
+                "id": 3946
+              },
+              {
+                "type": "stored",
+                "id": 3947
+              }
+            ]
+          },
+          "step": {
+            "text": "\ud865\udcd3\udabb\uddef<\u00a2\u00b6",
+            "context": [
+              {
+                "type": "stored",
+                "id": 3948
+              },
+              {
+                "type": "stored",
+                "id": 3949
+              },
+              {
+                "type": "stored",
+                "id": 3950
+              },
+              {
+                "type": "stored",
+                "id": 3951
+              },
+              {
+                "type": "stored",
+                "id": 3952
+              },
+              {
+                "type": "stored",
+                "id": 3953
+              },
+              {
+                "type": "stored",
+                "id": 3954
+              },
+              {
+                "type": "stored",
+                "id": 3955
+              },
+              {
+                "type": "stored",
+                "id": 3956
+              },
+              {
+                "type": "stored",
+                "id": 3957
+              },
+              {
+                "type": "stored",
+                "id": 3958
+              },
+              {
+                "type": "stored",
+                "id": 3959
+              },
+              {
+                "type": "stored",
+                "id": 3960
+              },
+              {
+                "type": "stored",
+                "id": 3961
+              },
+              {
+                "type": "stored",
+                "id": 3962
+              },
+              {
+                "type": "stored",
+                "id": 3963
+              },
+              {
+                "type": "stored",
+                "id": 3964
+              },
+              {
+                "type": "stored",
+                "id": 3965
+              },
+              {
+                "type": "stored",
+                "id": 3966
+              },
+              {
+                "type": "stored",
+                "id": 3967
+              }
+            ]
+          },
+          "n_step": 23110,
+          "goals": []
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 3968,
+        "context": [
+          {
+            "type": "stored",
+            "id": 3969
+          },
+          {
+            "type": "stored",
+            "id": 3970
+          },
+          {
+            "type": "stored",
+            "id": 3971
+          },
+          {
+            "type": "stored",
+            "id": 3972
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 3973,
+            "context": [
+              {
+                "type": "stored",
+                "id": 3974
+              },
+              {
+                "type": "stored",
+                "id": 3975
+              },
+              {
+                "type": "stored",
+                "id": 3976
+              },
+              {
+                "type": "stored",
+                "id": 3977
+              },
+              {
+                "type": "stored",
+                "id": 3978
+              },
+              {
+                "type": "stored",
+                "id": 3979
+              },
+              {
+                "type": "stored",
+                "id": 3980
+              },
+              {
+                "type": "stored",
+                "id": 3981
+              },
+              {
+                "type": "stored",
+                "id": 3982
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": []
+          },
+          "n_step": -653,
+          "goals": [
+            "gnlrw\n\nCACrbPZEVYKmAuHkMHyFtLSvwWfAKAlszTYqiCsniMpQas",
+            "EXypsbPAxH\nO\nxxF\nxr\ntVqsdgEZFNdVGt\njriOUAH\nyjxFlaJ\ndBTKkVDaUl\n\nm",
+            "r\nmxiUJuIBfUJ\nBqIgD\ntGeCuTW\nNULL\nFLHbX\nscripts\nEs\nR\naV\n\nquantize",
+            "d\nDll\nWSKi\nMRfAAQpiSrRz\nj\nKty\nTiFnWLA\n\nm",
+            "ccschpcjHKwB\nVyb\nDgq\nU\n\nLXjy",
+            "b\nqxfLgYuUmbTJReAB\nAU\ndVtx\n\nJXEe",
+            "rw\nQ\nD\nJZ\nUitmdrtXwhimDpdhkreSQ\nAui\no\n\nretriever",
+            "ODsHx\nTLJVqG\nM\nLxJA\nILm\niHoS\nkVx\n\nGxK",
+            "fs\nlHYA\nPqhDiRdmXp\njJAEPi\n\nmpyJxKzrW",
+            "ItAbqcmOTH\nPpVOw\nvfAyXhjX\ncTPo\nas\nBP\nXAY\nICqVUioHNK\nwEsA\nPYQ\nwElKNTzHBVeIC\nLnY\njIHS\nqll\nhjRHg\nU\nJaj\nij\nheoKeyEvtVxEtmQo\ndNwh\nboX\nSSeStIRchjn\nl\n\nE",
+            "P\nV\nFx\nIty\nX\nxNZTmU\nGN\nm\nKaihNZxBAb\nVernacDefinition\nV\nQVSW\nezaGAVuE\n\ncNkb",
+            "ZFJToFxp\n\nTmzHjbGum",
+            "\n\nqsE",
+            "\n\nMJV",
+            "sMs\nON\n\nMFTHFQ",
+            "uUXaJglXklzJKSHX\ny\nKVZMnnnqeh\nZWqpwAfVFmCsscPaFIE\nngMXfChaiAJm\nPNqQb\nJVrEMgANGXMniKZQ\naGKuXVCvGOkGSAlS\nL\nmidWnpbV\niFTPakmZYw\n\nWujtFxhbZUhA"
+          ]
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 3983,
+        "context": []
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 3984,
+            "context": [
+              {
+                "type": "stored",
+                "id": 3985
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 3986
+              },
+              {
+                "type": "stored",
+                "id": 3987
+              },
+              {
+                "type": "stored",
+                "id": 3988
+              }
+            ]
+          },
+          "n_step": -2383609675240544,
+          "goals": []
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,38 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar2/sviyl.v\", \"workspace\": \"/coq-dataset/repos/bar2\", \"repository\": \"/coq-dataset/repos/bar2\"}",
+    "{\"type\": \"stored\", \"id\": 3989}",
+    "{\"type\": \"stored\", \"id\": 3990}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 3991,
+        "context": [
+          {
+            "type": "stored",
+            "id": 3992
+          },
+          {
+            "type": "stored",
+            "id": 3993
+          },
+          {
+            "type": "stored",
+            "id": 3994
+          },
+          {
+            "type": "stored",
+            "id": 3995
+          },
+          {
+            "type": "stored",
+            "id": 3996
+          }
+        ]
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,10 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar2/xyfziet.v\", \"workspace\": \"/coq-dataset/repos/bar2\", \"repository\": \"/coq-dataset/repos/bar2\"}",
+    "{\"type\": \"stored\", \"id\": 4136}",
+    "{\"type\": \"stored\", \"id\": 4137}",
+    "{\"type\": \"stored\", \"id\": 4138}",
+    "{\"type\": \"stored\", \"id\": 4139}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
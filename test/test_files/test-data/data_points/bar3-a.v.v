@@ -0,0 +1,6 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar3/a.v.v\", \"workspace\": \"/coq-dataset/repos/bar3\", \"repository\": \"/coq-dataset/repos/bar3\"}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
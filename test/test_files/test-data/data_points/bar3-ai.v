@@ -0,0 +1,340 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar3/ai.v\", \"workspace\": \"/coq-dataset/repos/bar3\", \"repository\": \"/coq-dataset/repos/bar3\"}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 4365,
+        "context": [
+          {
+            "type": "stored",
+            "id": 4366
+          },
+          {
+            "type": "stored",
+            "id": 4367
+          },
+          {
+            "type": "stored",
+            "id": 4368
+          },
+          {
+            "type": "stored",
+            "id": 4369
+          },
+          {
+            "type": "stored",
+            "id": 4370
+          },
+          {
+            "type": "stored",
+            "id": 4371
+          },
+          {
+            "type": "stored",
+            "id": 4372
+          },
+          {
+            "type": "stored",
+            "id": 4373
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 4374,
+            "context": [
+              {
+                "type": "stored",
+                "id": 4375
+              },
+              {
+                "type": "stored",
+                "id": 4376
+              },
+              {
+                "type": "stored",
+                "id": 4377
+              },
+              {
+                "type": "stored",
+                "id": 4378
+              },
+              {
+                "type": "stored",
+                "id": 4379
+              },
+              {
+                "type": "stored",
+                "id": 4380
+              },
+              {
+                "type": "stored",
+                "id": 4381
+              },
+              {
+                "type": "stored",
+                "id": 4382
+              },
+              {
+                "type": "stored",
+                "id": 4383
+              },
+              {
+                "type": "stored",
+                "id": 4384
+              },
+              {
+                "type": "stored",
+                "id": 4385
+              },
+              {
+                "type": "stored",
+                "id": 4386
+              },
+              {
+                "type": "stored",
+                "id": 4387
+              }
+            ]
+          },
+          "step": {
+            "text": "go\udb6a\udf44\u0083\u00f4\u001d\u00a0\u00e2\u0d62U",
+            "context": [
+              {
+                "type": "stored",
+                "id": 4388
+              },
+              {
+                "type": "stored",
+                "id": 4389
+              },
+              {
+                "type": "stored",
+                "id": 4390
+              }
+            ]
+          },
+          "n_step": -5515373760348528198814617567232,
+          "goals": [
+            "VOV\n\nirO",
+            "z\nHJftIn\n\nK",
+            "UTABEz\nFiMwSnD\n\nNi"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 4391,
+            "context": []
+          },
+          "step": {
+            "text": "\u00f9\u0086\uda4e\udffe\u00de\udb99\uded7",
+            "context": [
+              {
+                "type": "stored",
+                "id": 4392
+              },
+              {
+                "type": "stored",
+                "id": 4393
+              },
+              {
+                "type": "stored",
+                "id": 4394
+              },
+              {
+                "type": "stored",
+                "id": 4395
+              },
+              {
+                "type": "stored",
+                "id": 4396
+              },
+              {
+                "type": "stored",
+                "id": 4397
+              },
+              {
+                "type": "stored",
+                "id": 4398
+              },
+              {
+                "type": "stored",
+                "id": 4399
+              },
+              {
+                "type": "stored",
+                "id": 4400
+              },
+              {
+                "type": "stored",
+                "id": 4401
+              },
+              {
+                "type": "stored",
+                "id": 4402
+              },
+              {
+                "type": "stored",
+                "id": 4403
+              },
+              {
+                "type": "stored",
+                "id": 4404
+              },
+              {
+                "type": "stored",
+                "id": 4405
+              }
+            ]
+          },
+          "n_step": 2826144,
+          "goals": [
+            "jMkTR\nBTx\nYgMzvmIBAFNzvZmSBYDSUxqgFjyPzB\nhNZSgBeCpaoYlMyNIWZgIBEzImDTLTtiIjSAxY\nXTET\n\nMkHUXlDpTuurYQLNGnuAFIm",
+            "gQt\nKfAGUcUAPKe\nsrUAi\nNNXAlPF\nGdkSRX\nXJDBMlgDMpzrJpcb\nEJUD\nRW\nWJOXQJKjPCfhzmoZkdt\n\nhPe",
+            "cJJiV\nwlytMSvTZRLmPnWj\njltPmdqdkNly\nxbpze\ncb\nIAzdzKXVbUjILqf\nd\n\nIDEUHgRchtDT",
+            "QuMQsseJmn\n\ndOtiJLWNwblYM",
+            "TRUE\nsdkkDLGGxXH\nwfEC\n\nOdWo",
+            "whIMGNY\ngKvNphbtgV\nK\nPtqOfIRZ\nTprAAFGosOhKpeMKlEfZQJaQWTe\nlrJZa\nM\nyBN\n\nNYn",
+            "LEFC\nk\n\nE",
+            "\n\ngohWWdtXo",
+            "Wh\n\nmBi",
+            "UBG\nIpvmbXyITwSKAfWe\n\nq",
+            "bS\n\nj",
+            "RLt\nci\nolxH\ne\nl\nZPccgaSDzoNupW\nsIbgQBXoLYe\nNWpHErCLLUTdpyHnDFygllPyyIr\n\nDAqeN",
+            "GG\nG\nYBmjCD\nID\nTrue\nOWrTTPoxnp\nSINDJY\nqRvYNuMmicKzveYgWILolMAZMNxPvSDB\nNUL\nc\nmi\nY\nutsjPv\nrp\nLwwkYLD\nMp\nP\nFalse\nRwm\n\nOOiLEnEjh",
+            "TRUE\nCZrzjgzIEQ\nuFMXARdliHAdg\nYCIDkh\nbPoeOn\nCSQ\njxZEtquwy\n\nlzG",
+            "zWZcXeDUL\nkQ\n\nxJKihkjwQqe",
+            "Ybek\n\nZD"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 4406,
+            "context": [
+              {
+                "type": "stored",
+                "id": 4407
+              }
+            ]
+          },
+          "step": {
+            "text": "train_files",
+            "context": [
+              {
+                "type": "stored",
+                "id": 4408
+              },
+              {
+                "type": "stored",
+                "id": 4409
+              },
+              {
+                "type": "stored",
+                "id": 4410
+              }
+            ]
+          },
+          "n_step": -17573,
+          "goals": [
+            "oPhG\nNM\nI\nubA\nE\nJX\nmWsiCK\nYXap\nwTf\n\nu",
+            "Z\nfgMkipkSutVNoMtiftdGCtvipGXFd\nYkyHRv\nz\nJQw\nGyv\nPvA\n\nwUHe",
+            "\n\nLtWd"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 4411,
+            "context": [
+              {
+                "type": "stored",
+                "id": 4412
+              },
+              {
+                "type": "stored",
+                "id": 4413
+              },
+              {
+                "type": "stored",
+                "id": 4414
+              },
+              {
+                "type": "stored",
+                "id": 4415
+              },
+              {
+                "type": "stored",
+                "id": 4416
+              },
+              {
+                "type": "stored",
+                "id": 4417
+              },
+              {
+                "type": "stored",
+                "id": 4418
+              },
+              {
+                "type": "stored",
+                "id": 4419
+              },
+              {
+                "type": "stored",
+                "id": 4420
+              }
+            ]
+          },
+          "step": {
+            "text": "\ud9d5\udd31\u00f1",
+            "context": [
+              {
+                "type": "stored",
+                "id": 4421
+              },
+              {
+                "type": "stored",
+                "id": 4422
+              },
+              {
+                "type": "stored",
+                "id": 4423
+              },
+              {
+                "type": "stored",
+                "id": 4424
+              },
+              {
+                "type": "stored",
+                "id": 4425
+              },
+              {
+                "type": "stored",
+                "id": 4426
+              },
+              {
+                "type": "stored",
+                "id": 4427
+              }
+            ]
+          },
+          "n_step": -13488434,
+          "goals": [
+            "Xi\nYC\nBO\ncbmAEp\nRFTqJka\noXXuHLU\nI\nWAzMvzwydaZ\nqekANEY\n\nTeF",
+            "ttkLCHulZOz\nDeWmcUKKJOyQG\nbGnxTz\nehuU\niJ\nUFVEZxSAIun\nBs\nmaE\nYbsXLVk\nIEuMOxZ\nTqcrqwqnVsXet\n\nPbTETozd",
+            "lFczJhSLjAF\nlodxRwlJQwz\nmgy\ni\nmpgKkHpi\nrc\nkH\n\nmfEl",
+            "DSFmNkq\nK\nR\nuSnlK\nb\noBhT\noPwA\nFMrdOAZV\nLPaMpleHnhOC\nReNlsEABMP\nm\nDvKR\nmfJHrX\nnbOGrdpmN\n\nBCg",
+            "D\nwX\n\ntVeOMM",
+            "ErcuW\nIO\nKc\n\nuvIDfljb"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
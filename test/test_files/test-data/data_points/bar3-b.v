@@ -0,0 +1,32 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar3/b.v\", \"workspace\": \"/coq-dataset/repos/bar3\", \"repository\": \"/coq-dataset/repos/bar3\"}",
+    "{\"type\": \"stored\", \"id\": 4881}",
+    "{\"type\": \"stored\", \"id\": 4882}",
+    "{\"type\": \"stored\", \"id\": 4883}",
+    "{\"type\": \"stored\", \"id\": 4884}",
+    "{\"type\": \"stored\", \"id\": 4885}",
+    "{\"type\": \"stored\", \"id\": 4886}",
+    "{\"type\": \"stored\", \"id\": 4887}",
+    "{\"type\": \"stored\", \"id\": 4888}",
+    "{\"type\": \"stored\", \"id\": 4889}",
+    "{\"type\": \"stored\", \"id\": 4890}",
+    "{\"type\": \"stored\", \"id\": 4891}",
+    "{\"type\": \"stored\", \"id\": 4892}",
+    "{\"type\": \"stored\", \"id\": 4893}",
+    "{\"type\": \"stored\", \"id\": 4894}",
+    "{\"type\": \"stored\", \"id\": 4895}",
+    "{\"type\": \"stored\", \"id\": 4896}",
+    "{\"type\": \"stored\", \"id\": 4897}",
+    "{\"type\": \"stored\", \"id\": 4898}",
+    "{\"type\": \"stored\", \"id\": 4899}",
+    "{\"type\": \"stored\", \"id\": 4900}",
+    "{\"type\": \"stored\", \"id\": 4901}",
+    "{\"type\": \"stored\", \"id\": 4902}",
+    "{\"type\": \"stored\", \"id\": 4903}",
+    "{\"type\": \"stored\", \"id\": 4904}",
+    "{\"type\": \"stored\", \"id\": 4905}",
+    "{\"type\": \"stored\", \"id\": 4906}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,80 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar3/cnosktwrlflqtydbz.v\", \"workspace\": \"/coq-dataset/repos/bar3\", \"repository\": \"/coq-dataset/repos/bar3\"}",
+    "{\"type\": \"stored\", \"id\": 4489}",
+    "{\"type\": \"stored\", \"id\": 4490}",
+    "{\"type\": \"stored\", \"id\": 4491}",
+    "{\"type\": \"stored\", \"id\": 4492}",
+    "{\"type\": \"stored\", \"id\": 4493}",
+    "{\"type\": \"stored\", \"id\": 4494}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 4495,
+        "context": [
+          {
+            "type": "stored",
+            "id": 4496
+          },
+          {
+            "type": "stored",
+            "id": 4497
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 4498,
+            "context": [
+              {
+                "type": "stored",
+                "id": 4499
+              },
+              {
+                "type": "stored",
+                "id": 4500
+              },
+              {
+                "type": "stored",
+                "id": 4501
+              },
+              {
+                "type": "stored",
+                "id": 4502
+              },
+              {
+                "type": "stored",
+                "id": 4503
+              }
+            ]
+          },
+          "step": {
+            "text": "\u0007\udb94\udca2",
+            "context": []
+          },
+          "n_step": -4275,
+          "goals": [
+            "GBguFC\njtHECuuPf\nUGx\ngx\nn\nIBhWBvPlZP\naweqPVKSwWfLmJKQbhoiOrJ\na\nINF\nSJymodUDDMaESVJbkuUC\njrNxrYDo\n\nrpj"
+          ]
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 4504,
+        "context": [
+          {
+            "type": "stored",
+            "id": 4505
+          }
+        ]
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
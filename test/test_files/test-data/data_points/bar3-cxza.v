@@ -0,0 +1,88 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar3/cxza.v\", \"workspace\": \"/coq-dataset/repos/bar3\", \"repository\": \"/coq-dataset/repos/bar3\"}",
+    "{\"type\": \"stored\", \"id\": 4713}",
+    "{\"type\": \"stored\", \"id\": 4714}",
+    "{\"type\": \"stored\", \"id\": 4715}",
+    "{\"type\": \"stored\", \"id\": 4716}",
+    "{\"type\": \"stored\", \"id\": 4717}",
+    "{\"type\": \"stored\", \"id\": 4718}",
+    "{\"type\": \"stored\", \"id\": 4719}",
+    "{\"type\": \"stored\", \"id\": 4720}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 4721,
+        "context": [
+          {
+            "type": "stored",
+            "id": 4722
+          },
+          {
+            "type": "stored",
+            "id": 4723
+          },
+          {
+            "type": "stored",
+            "id": 4724
+          },
+          {
+            "type": "stored",
+            "id": 4725
+          },
+          {
+            "type": "stored",
+            "id": 4726
+          },
+          {
+            "type": "stored",
+            "id": 4727
+          },
+          {
+            "type": "stored",
+            "id": 4728
+          },
+          {
+            "type": "stored",
+            "id": 4729
+          },
+          {
+            "type": "stored",
+            "id": 4730
+          },
+          {
+            "type": "stored",
+            "id": 4731
+          },
+          {
+            "type": "stored",
+            "id": 4732
+          },
+          {
+            "type": "stored",
+            "id": 4733
+          },
+          {
+            "type": "stored",
+            "id": 4734
+          },
+          {
+            "type": "stored",
+            "id": 4735
+          },
+          {
+            "type": "stored",
+            "id": 4736
+          },
+          {
+            "type": "stored",
+            "id": 4737
+          }
+        ]
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,415 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar3/dzd.v\", \"workspace\": \"/coq-dataset/repos/bar3\", \"repository\": \"/coq-dataset/repos/bar3\"}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 4738,
+        "context": [
+          {
+            "type": "stored",
+            "id": 4739
+          },
+          {
+            "type": "stored",
+            "id": 4740
+          },
+          {
+            "type": "stored",
+            "id": 4741
+          },
+          {
+            "type": "stored",
+            "id": 4742
+          },
+          {
+            "type": "stored",
+            "id": 4743
+          },
+          {
+            "type": "stored",
+            "id": 4744
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 4745,
+            "context": []
+          },
+          "step": {
+            "text": "\u00e0\ud9d6\udc17\u00d6\udb67\udf36f\u00e7/\u00c8",
+            "context": [
+              {
+                "type": "stored",
+                "id": 4746
+              },
+              {
+                "type": "stored",
+                "id": 4747
+              }
+            ]
+          },
+          "n_step": 14498514,
+          "goals": [
+            "then\n\nI",
+            "\n\ncontent",
+            "\n\nF",
+            "\n\ns"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 4748,
+            "context": [
+              {
+                "type": "stored",
+                "id": 4749
+              },
+              {
+                "type": "stored",
+                "id": 4750
+              }
+            ]
+          },
+          "step": {
+            "text": "\u007f",
+            "context": [
+              {
+                "type": "stored",
+                "id": 4751
+              },
+              {
+                "type": "stored",
+                "id": 4752
+              },
+              {
+                "type": "stored",
+                "id": 4753
+              }
+            ]
+          },
+          "n_step": 309250,
+          "goals": [
+            "r\na\nVVP\nbksBLknOzaDqMFjoq\nbK\ntGI\n\newFNkigINFTj",
+            "\n\nkJrdtULeaVsOv",
+            "N\nCeWEbN\ndJ\nxSjxHxxFFFMvTNsADg\nanRRef\nT\naDKDbsSduQ\nqHG\nDqD\nB\nNaN\nVyppEPLgNxEjqBU\n\ntXGwYv",
+            "dSCfAfyihocfahxzAwjCATiSZdtjnQ\n\ndv",
+            "TmlLKF\ncp\nSqdoNgGoWkmlHSNpUsGAmbip\nrcApNgqoHQfr\nGjJ\nFhukmKOyH\nrYEUQCiTue\nterm\nxXzs\nUQd\nn\nGm\nTJPqlUG\nvA\nGmLmxY\nMxkfvaJGs\nB\n\nnil"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 4754,
+            "context": [
+              {
+                "type": "stored",
+                "id": 4755
+              },
+              {
+                "type": "stored",
+                "id": 4756
+              },
+              {
+                "type": "stored",
+                "id": 4757
+              },
+              {
+                "type": "stored",
+                "id": 4758
+              },
+              {
+                "type": "stored",
+                "id": 4759
+              },
+              {
+                "type": "stored",
+                "id": 4760
+              },
+              {
+                "type": "stored",
+                "id": 4761
+              },
+              {
+                "type": "stored",
+                "id": 4762
+              },
+              {
+                "type": "stored",
+                "id": 4763
+              },
+              {
+                "type": "stored",
+                "id": 4764
+              },
+              {
+                "type": "stored",
+                "id": 4765
+              },
+              {
+                "type": "stored",
+                "id": 4766
+              },
+              {
+                "type": "stored",
+                "id": 4767
+              }
+            ]
+          },
+          "step": {
+            "text": "\u0080\u00b7\u00f0S",
+            "context": [
+              {
+                "type": "stored",
+                "id": 4768
+              },
+              {
+                "type": "stored",
+                "id": 4769
+              },
+              {
+                "type": "stored",
+                "id": 4770
+              },
+              {
+                "type": "stored",
+                "id": 4771
+              },
+              {
+                "type": "stored",
+                "id": 4772
+              },
+              {
+                "type": "stored",
+                "id": 4773
+              },
+              {
+                "type": "stored",
+                "id": 4774
+              }
+            ]
+          },
+          "n_step": -343,
+          "goals": [
+            "ATJJKcdQgBgdARYb\nztjDOx\nYFMnHPgQAlh\n\nmKxpIq",
+            "dy\nZbAJJWivke\nH\n\nhO",
+            "\n\ndecoder",
+            "uggR\n\nPtAfX",
+            "\n\nJSBrNPqs",
+            "v\nT\nclient\nZkRfvaCJtjN\nxUreFWQ\nqbKCM\nmIjDujUq\nlrqyljAAozfb\nyXLCMiAZvv\nCx\nqgh\nCbKZF\nEmTwP\n\nblduAAki",
+            "m\nname\nOIss\naAx\nUccmMuo\nAuzJik\n\nf"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 4775,
+            "context": []
+          },
+          "step": {
+            "text": "U\u00e1",
+            "context": [
+              {
+                "type": "stored",
+                "id": 4776
+              },
+              {
+                "type": "stored",
+                "id": 4777
+              },
+              {
+                "type": "stored",
+                "id": 4778
+              },
+              {
+                "type": "stored",
+                "id": 4779
+              },
+              {
+                "type": "stored",
+                "id": 4780
+              },
+              {
+                "type": "stored",
+                "id": 4781
+              },
+              {
+                "type": "stored",
+                "id": 4782
+              },
+              {
+                "type": "stored",
+                "id": 4783
+              },
+              {
+                "type": "stored",
+                "id": 4784
+              },
+              {
+                "type": "stored",
+                "id": 4785
+              }
+            ]
+          },
+          "n_step": -103962123,
+          "goals": [
+            "\n\ntCwRr",
+            "ni\nLOdBfLimIEv\nJ\nKlIsJJU\nMfxWyfhPMW\nQVcgeCLR\nA\n\ncTGCvPJujF"
+          ]
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 4786,
+        "context": [
+          {
+            "type": "stored",
+            "id": 4787
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 4788,
+            "context": [
+              {
+                "type": "stored",
+                "id": 4789
+              },
+              {
+                "type": "stored",
+                "id": 4790
+              },
+              {
+                "type": "stored",
+                "id": 4791
+              },
+              {
+                "type": "stored",
+                "id": 4792
+              },
+              {
+                "type": "stored",
+                "id": 4793
+              },
+              {
+                "type": "stored",
+                "id": 4794
+              },
+              {
+                "type": "stored",
+                "id": 4795
+              },
+              {
+                "type": "stored",
+                "id": 4796
+              },
+              {
+                "type": "stored",
+                "id": 4797
+              },
+              {
+                "type": "stored",
+                "id": 4798
+              },
+              {
+                "type": "stored",
+                "id": 4799
+              },
+              {
+                "type": "stored",
+                "id": 4800
+              },
+              {
+                "type": "stored",
+                "id": 4801
+              },
+              {
+                "type": "stored",
+                "id": 4802
+              },
+              {
+                "type": "stored",
+                "id": 4803
+              },
+              {
+                "type": "stored",
+                "id": 4804
+              },
+              {
+                "type": "stored",
+                "id": 4805
+              },
+              {
+                "type": "stored",
+                "id": 4806
+              },
+              {
+                "type": "stored",
+                "id": 4807
+              },
+              {
+                "type": "stored",
+                "id": 4808
+              }
+            ]
+          },
+          "step": {
+            "text": "&",
+            "context": [
+              {
+                "type": "stored",
+                "id": 4809
+              }
+            ]
+          },
+          "n_step": 560108,
+          "goals": [
+            "xkMFoJ\n\ntPgnTeo",
+            "d\nag\nurm\n\nkznBSR",
+            "UObJ\n\nXXiDIK",
+            "UZb\nahcCSyinD\n\nskoyP",
+            "QZyLnehav\n\nilgCtJZFeTWj"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 4810,
+            "context": [
+              {
+                "type": "stored",
+                "id": 4811
+              },
+              {
+                "type": "stored",
+                "id": 4812
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00c6",
+            "context": [
+              {
+                "type": "stored",
+                "id": 4813
+              }
+            ]
+          },
+          "n_step": 631842652,
+          "goals": []
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,230 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar3/efksx.v\", \"workspace\": \"/coq-dataset/repos/bar3\", \"repository\": \"/coq-dataset/repos/bar3\"}",
+    "{\"type\": \"stored\", \"id\": 4958}",
+    "{\"type\": \"stored\", \"id\": 4959}",
+    "{\"type\": \"stored\", \"id\": 4960}",
+    "{\"type\": \"stored\", \"id\": 4961}",
+    "{\"type\": \"stored\", \"id\": 4962}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 4963,
+        "context": [
+          {
+            "type": "stored",
+            "id": 4964
+          },
+          {
+            "type": "stored",
+            "id": 4965
+          },
+          {
+            "type": "stored",
+            "id": 4966
+          },
+          {
+            "type": "stored",
+            "id": 4967
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 4968,
+            "context": [
+              {
+                "type": "stored",
+                "id": 4969
+              },
+              {
+                "type": "stored",
+                "id": 4970
+              },
+              {
+                "type": "stored",
+                "id": 4971
+              },
+              {
+                "type": "stored",
+                "id": 4972
+              },
+              {
+                "type": "stored",
+                "id": 4973
+              },
+              {
+                "type": "stored",
+                "id": 4974
+              },
+              {
+                "type": "stored",
+                "id": 4975
+              },
+              {
+                "type": "stored",
+                "id": 4976
+              },
+              {
+                "type": "stored",
+                "id": 4977
+              },
+              {
+                "type": "stored",
+                "id": 4978
+              },
+              {
+                "type": "stored",
+                "id": 4979
+              },
+              {
+                "type": "stored",
+                "id": 4980
+              },
+              {
+                "type": "stored",
+                "id": 4981
+              },
+              {
+                "type": "stored",
+                "id": 4982
+              },
+              {
+                "type": "stored",
+                "id": 4983
+              },
+              {
+                "type": "stored",
+                "id": 4984
+              },
+              {
+                "type": "stored",
+                "id": 4985
+              },
+              {
+                "type": "stored",
+                "id": 4986
+              },
+              {
+                "type": "stored",
+                "id": 4987
+              },
+              {
+                "type": "stored",
+                "id": 4988
+              },
+              {
+                "type": "stored",
+                "id": 4989
+              },
+              {
+                "type": "stored",
+                "id": 4990
+              },
+              {
+                "type": "stored",
+                "id": 4991
+              },
+              {
+                "type": "stored",
+                "id": 4992
+              },
+              {
+                "type": "stored",
+                "id": 4993
+              },
+              {
+                "type": "stored",
+                "id": 4994
+              },
+              {
+                "type": "stored",
+                "id": 4995
+              },
+              {
+                "type": "stored",
+                "id": 4996
+              },
+              {
+                "type": "stored",
+                "id": 4997
+              },
+              {
+                "type": "stored",
+                "id": 4998
+              },
+              {
+                "type": "stored",
+                "id": 4999
+              },
+              {
+                "type": "stored",
+                "id": 5000
+              },
+              {
+                "type": "stored",
+                "id": 5001
+              },
+              {
+                "type": "stored",
+                "id": 5002
+              },
+              {
+                "type": "stored",
+                "id": 5003
+              },
+              {
+                "type": "stored",
+                "id": 5004
+              },
+              {
+                "type": "stored",
+                "id": 5005
+              },
+              {
+                "type": "stored",
+                "id": 5006
+              },
+              {
+                "type": "stored",
+                "id": 5007
+              },
+              {
+                "type": "stored",
+                "id": 5008
+              }
+            ]
+          },
+          "step": {
+            "text": "8\udace\udcc2\u0002\u0013\u00eef\u009e\u00a2R{s\ud9b8\udf1a",
+            "context": [
+              {
+                "type": "stored",
+                "id": 5009
+              },
+              {
+                "type": "stored",
+                "id": 5010
+              },
+              {
+                "type": "stored",
+                "id": 5011
+              }
+            ]
+          },
+          "n_step": -242,
+          "goals": [
+            "\n\nLYAyhmAyMdEjYKZStMZRFnki",
+            "\n\nxCBv",
+            "kFzjp\n\nrGqhb",
+            "oFMmhbpssh\nDYfGcUpXNq\n\nCTpOexeSSdFKvY"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,10 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar3/erylhxd.v\", \"workspace\": \"/coq-dataset/repos/bar3\", \"repository\": \"/coq-dataset/repos/bar3\"}",
+    "{\"type\": \"stored\", \"id\": 4360}",
+    "{\"type\": \"stored\", \"id\": 4361}",
+    "{\"type\": \"stored\", \"id\": 4362}",
+    "{\"type\": \"stored\", \"id\": 4363}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
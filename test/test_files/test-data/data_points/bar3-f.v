@@ -0,0 +1,7 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar3/f.v\", \"workspace\": \"/coq-dataset/repos/bar3\", \"repository\": \"/coq-dataset/repos/bar3\"}",
+    "{\"type\": \"stored\", \"id\": 4488}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
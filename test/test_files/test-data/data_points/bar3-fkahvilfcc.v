@@ -0,0 +1,11 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar3/fkahvilfcc.v\", \"workspace\": \"/coq-dataset/repos/bar3\", \"repository\": \"/coq-dataset/repos/bar3\"}",
+    "{\"type\": \"stored\", \"id\": 4473}",
+    "{\"type\": \"stored\", \"id\": 4474}",
+    "{\"type\": \"stored\", \"id\": 4475}",
+    "{\"type\": \"stored\", \"id\": 4476}",
+    "{\"type\": \"stored\", \"id\": 4477}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
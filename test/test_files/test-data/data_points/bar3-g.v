@@ -0,0 +1,441 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar3/g.v\", \"workspace\": \"/coq-dataset/repos/bar3\", \"repository\": \"/coq-dataset/repos/bar3\"}",
+    "{\"type\": \"stored\", \"id\": 4525}",
+    "{\"type\": \"stored\", \"id\": 4526}",
+    "{\"type\": \"stored\", \"id\": 4527}",
+    "{\"type\": \"stored\", \"id\": 4528}",
+    "{\"type\": \"stored\", \"id\": 4529}",
+    "{\"type\": \"stored\", \"id\": 4530}",
+    "{\"type\": \"stored\", \"id\": 4531}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 4532,
+        "context": [
+          {
+            "type": "stored",
+            "id": 4533
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 4534,
+            "context": []
+          },
+          "step": {
+            "text": "\udb50\uddb3v\u00bc\u00eb\u008d\ud94e\udce6\uda82\uddf6\u00b4t`H\u00d7\ud9ff\udc55\u0018",
+            "context": []
+          },
+          "n_step": 424,
+          "goals": []
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 4535,
+        "context": [
+          {
+            "type": "stored",
+            "id": 4536
+          },
+          {
+            "type": "stored",
+            "id": 4537
+          },
+          {
+            "type": "stored",
+            "id": 4538
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 4539,
+            "context": [
+              {
+                "type": "stored",
+                "id": 4540
+              },
+              {
+                "type": "stored",
+                "id": 4541
+              },
+              {
+                "type": "stored",
+                "id": 4542
+              },
+              {
+                "type": "stored",
+                "id": 4543
+              },
+              {
+                "type": "stored",
+                "id": 4544
+              },
+              {
+                "type": "stored",
+                "id": 4545
+              },
+              {
+                "type": "stored",
+                "id": 4546
+              },
+              {
+                "type": "stored",
+                "id": 4547
+              },
+              {
+                "type": "stored",
+                "id": 4548
+              },
+              {
+                "type": "stored",
+                "id": 4549
+              },
+              {
+                "type": "stored",
+                "id": 4550
+              },
+              {
+                "type": "stored",
+                "id": 4551
+              },
+              {
+                "type": "stored",
+                "id": 4552
+              },
+              {
+                "type": "stored",
+                "id": 4553
+              },
+              {
+                "type": "stored",
+                "id": 4554
+              },
+              {
+                "type": "stored",
+                "id": 4555
+              },
+              {
+                "type": "stored",
+                "id": 4556
+              },
+              {
+                "type": "stored",
+                "id": 4557
+              },
+              {
+                "type": "stored",
+                "id": 4558
+              },
+              {
+                "type": "stored",
+                "id": 4559
+              },
+              {
+                "type": "stored",
+                "id": 4560
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 4561
+              },
+              {
+                "type": "stored",
+                "id": 4562
+              },
+              {
+                "type": "stored",
+                "id": 4563
+              },
+              {
+                "type": "stored",
+                "id": 4564
+              },
+              {
+                "type": "stored",
+                "id": 4565
+              },
+              {
+                "type": "stored",
+                "id": 4566
+              },
+              {
+                "type": "stored",
+                "id": 4567
+              }
+            ]
+          },
+          "n_step": 4987312233,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 4568,
+            "context": [
+              {
+                "type": "stored",
+                "id": 4569
+              },
+              {
+                "type": "stored",
+                "id": 4570
+              },
+              {
+                "type": "stored",
+                "id": 4571
+              },
+              {
+                "type": "stored",
+                "id": 4572
+              }
+            ]
+          },
+          "step": {
+            "text": "P^\u0015\u008e\n",
+            "context": [
+              {
+                "type": "stored",
+                "id": 4573
+              }
+            ]
+          },
+          "n_step": 15207,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 4574,
+            "context": [
+              {
+                "type": "stored",
+                "id": 4575
+              },
+              {
+                "type": "stored",
+                "id": 4576
+              },
+              {
+                "type": "stored",
+                "id": 4577
+              },
+              {
+                "type": "stored",
+                "id": 4578
+              }
+            ]
+          },
+          "step": {
+            "text": "X\ud828\udcd8\ud82f\udf64\u00bf7\udb02\udf9f",
+            "context": [
+              {
+                "type": "stored",
+                "id": 4579
+              },
+              {
+                "type": "stored",
+                "id": 4580
+              }
+            ]
+          },
+          "n_step": -667,
+          "goals": [
+            "\n\nXc",
+            "o\npad\ndtOoHC\nj\niOZsC\nIhs\nRWiV\ndP\nGANzWBHXXxdWIUH\nVBAfT\nzh\nAuhuDkrIFxbnE\nDEtpb\nwcssbltr\nr\nFsmpdUY\nPKeHiEVkgPMXxoTusGOoZBlHeyyPu\nBvSDRH\nk\nzpsaBXSmGZAe\nbUyO\nIZ\nJhr\nm\nnHL\ndLtemdOeeBuEKdY\nsMZw\nhuwo\nnJ\nyoCdV\n\nq",
+            "TU\n\nYqVdM",
+            "RgQHRn\nrjQBCaILardIo\n\nxY",
+            "aUecX\nk\n\np",
+            "mQckPhqSvqD\nWGoVzLcn\nB\nTKQHKPC\nXH\n\nf",
+            "LWgAM\nnmxbziECcfnO\nAKWAy\ncfv\nKYxDMKotILfkCNuWgGYhoc\nx\nfQpFPbXodX\ne\n\nBvE",
+            "H\nX\nfe\nL\n\nHAp",
+            "H\nexhxhbvRmsUEFo\ngqSA\nca\nFEiChYTt\nUT\nYGhkmCEioPusAgodBT\nFr\nyGrMmThpNI\nmYT\nYuRbQeey\nKytmYVKXgiBbkIyR\nWDgRK\nvOgG\nAnon\nunZV\nfXVdI\n\no",
+            "FklW\nOXcrxPiQAr\n\nzbf",
+            "Tbq\nXGo\n\nz",
+            "ksR\nUz\nuT\n\nj",
+            "\n\npZhC",
+            "K\ngo\nU\n\ny"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 4581,
+            "context": [
+              {
+                "type": "stored",
+                "id": 4582
+              },
+              {
+                "type": "stored",
+                "id": 4583
+              },
+              {
+                "type": "stored",
+                "id": 4584
+              }
+            ]
+          },
+          "step": {
+            "text": "\u0092\u0006b\u00d8",
+            "context": [
+              {
+                "type": "stored",
+                "id": 4585
+              },
+              {
+                "type": "stored",
+                "id": 4586
+              },
+              {
+                "type": "stored",
+                "id": 4587
+              },
+              {
+                "type": "stored",
+                "id": 4588
+              },
+              {
+                "type": "stored",
+                "id": 4589
+              },
+              {
+                "type": "stored",
+                "id": 4590
+              },
+              {
+                "type": "stored",
+                "id": 4591
+              }
+            ]
+          },
+          "n_step": 1000,
+          "goals": [
+            "P\nC\nmgOMp\nK\nHoX\nPivZf\njl\nMLdoZTqzhtMyNNRl\nYArP\nPQ\np\naW\n\nlWeA"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 4592,
+            "context": []
+          },
+          "step": {
+            "text": "LOG_LEVEL=DEBUG",
+            "context": [
+              {
+                "type": "stored",
+                "id": 4593
+              },
+              {
+                "type": "stored",
+                "id": 4594
+              }
+            ]
+          },
+          "n_step": -34205,
+          "goals": [
+            "W\ngrMpmJ\nYientB\nolHjNjIhywreZHqaRCOl\nBJE\nHltcigxc\nBKTEQQ\nVv\n\nwrqnfckk",
+            "QkEnfVDghm\ngausukpFjQVMP\nmXH\n\nC",
+            "\n\ns",
+            "nYog\nhCtoj\nh\nWkuKYjxt\nA\nRdNmnrTPpLzaLt\nXTiYU\nHAeSQYyBAM\n\nkUflz"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 4595,
+            "context": [
+              {
+                "type": "stored",
+                "id": 4596
+              }
+            ]
+          },
+          "step": {
+            "text": "\ud95a\udf18\uda60\ude44",
+            "context": []
+          },
+          "n_step": -775529360,
+          "goals": [
+            "ZVAbYupWWTyPTjSCwtUpJcVlZ\nWs\nMKt\nIyCGTMpp\nZmz\nFN\nyS\nRYDEepjCKrcLC\nworkspace\nTrue\nAj\nPnIf\nqaYhlBBRaoMKMLK\nRW\n\nnS",
+            "Gu\nQaEXVvgeUI\nPpTVCCDKit\nJh\noTaHYDeQ\nxToERo\nmrWgBZU\n\nreqpaM"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 4597,
+            "context": [
+              {
+                "type": "stored",
+                "id": 4598
+              },
+              {
+                "type": "stored",
+                "id": 4599
+              }
+            ]
+          },
+          "step": {
+            "text": "\ud95b\uddbf\u00c16\u00d4b",
+            "context": [
+              {
+                "type": "stored",
+                "id": 4600
+              },
+              {
+                "type": "stored",
+                "id": 4601
+              }
+            ]
+          },
+          "n_step": -2016087109,
+          "goals": [
+            "ZAl\n\nrasTYRxBmaqoQ",
+            "\n\noLyXDrlDjdhPpjcLXpwUgl",
+            "VIacZAeAdy\nu\n\nOUJ",
+            "GqrzV\n\nUgyQorHVixkqvyAKUBOPVLeiupGj"
+          ]
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 4602,
+        "context": [
+          {
+            "type": "stored",
+            "id": 4603
+          }
+        ]
+      },
+      "steps": []
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 4604,
+        "context": []
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
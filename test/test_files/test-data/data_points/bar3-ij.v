@@ -0,0 +1,405 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar3/ij.v\", \"workspace\": \"/coq-dataset/repos/bar3\", \"repository\": \"/coq-dataset/repos/bar3\"}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 4814,
+        "context": []
+      },
+      "steps": []
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 4815,
+        "context": [
+          {
+            "type": "stored",
+            "id": 4816
+          },
+          {
+            "type": "stored",
+            "id": 4817
+          },
+          {
+            "type": "stored",
+            "id": 4818
+          },
+          {
+            "type": "stored",
+            "id": 4819
+          },
+          {
+            "type": "stored",
+            "id": 4820
+          },
+          {
+            "type": "stored",
+            "id": 4821
+          },
+          {
+            "type": "stored",
+            "id": 4822
+          },
+          {
+            "type": "stored",
+            "id": 4823
+          },
+          {
+            "type": "stored",
+            "id": 4824
+          },
+          {
+            "type": "stored",
+            "id": 4825
+          },
+          {
+            "type": "stored",
+            "id": 4826
+          },
+          {
+            "type": "stored",
+            "id": 4827
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 4828,
+            "context": [
+              {
+                "type": "stored",
+                "id": 4829
+              }
+            ]
+          },
+          "step": {
+            "text": "j\u001d\u0082\uba4c\u00c1\u00c8",
+            "context": [
+              {
+                "type": "stored",
+                "id": 4830
+              },
+              {
+                "type": "stored",
+                "id": 4831
+              },
+              {
+                "type": "stored",
+                "id": 4832
+              }
+            ]
+          },
+          "n_step": 6190679902392313856,
+          "goals": [
+            "cnBbUa\n\nwH",
+            "vVSAXmBiIpdurefgNQ\ng\nJIypHn\nNaN\ntemnDjbVLrF\n\nu",
+            "eMs\nAzUYSQMp\nQ\nbEHTOqIuCLt\nkw\nS\npChyWWL\npzsjWyNjg\nGsADx\nRqbktbwVy\ntzLrFlfkqn\nb\n\nrmNGt",
+            "hxuN\nZwT\nt\nu\n\nTulVgAmLNSlkhcmjbmj",
+            "aC\nVFK\nxJbp\nz\n\nMyrwsc",
+            "FReBv\nI\nD\niMfdQ\nSVi\n\nwmbzC"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 4833,
+            "context": [
+              {
+                "type": "stored",
+                "id": 4834
+              },
+              {
+                "type": "stored",
+                "id": 4835
+              }
+            ]
+          },
+          "step": {
+            "text": "\u009bC",
+            "context": [
+              {
+                "type": "stored",
+                "id": 4836
+              },
+              {
+                "type": "stored",
+                "id": 4837
+              },
+              {
+                "type": "stored",
+                "id": 4838
+              },
+              {
+                "type": "stored",
+                "id": 4839
+              }
+            ]
+          },
+          "n_step": -7618,
+          "goals": [
+            "t\n\nll",
+            "mSIXUNgAVloukwZcQV\nU\n\nLR",
+            "rkMUV\nGpKBnOkgAcJgOuhTYSpho\nU\nGGNI\netddoebY\nFKOnRHdxWJL\ndo\nWBIdmfbKM\njrGqab\nAcR\npqQgEuuBtTj\nGtmAgLJlJ\nJhzOcTP\n\nUKzeYaMCMT",
+            "kJ\nzdpUnxhnd\nowLcdDuTjuf\nOxWfMQpB\nuMPxIQCr\nCHxfkPXxVQZBbXcHZe\nKm\nABJj\nYVRRzo\nD\nmlIooQer\npRO\n\nYGSn",
+            "thAr\nB\nShBgvSkLJ\nYTPcBBy\nOmnWGo\nm\nYRbGrDnoqxKBujK\nFtsMzdqgnnUTGvDkgHRy\nOkMqjNsTGKbSPs\nJo\nA\nG\nfatSw\nhDjmwydSDFAodBx\noqkC\nFzPOjPDA\n\ncie",
+            "hdlnDWxtkER\nIDnuov\nXyv\nFdcRcALW\nfVBH\n\nigNhVPVHq",
+            "O\nvEJgpy\n\nFE",
+            "source\nriLUwprePshiwrrVtzzt\nydQzL\nqopdbe\nwKSOPfg\nyowiF\nwQRrcWGEJEpyjnegPg\nsuLSgCIBd\nINF\n\nXw",
+            "RIb\nTDVgcRNv\nwiu\nHLbHS\nznxmwexOewyH\nbcxScfgqE\nJGOaDIr\na\n\nOTg"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 4840,
+            "context": [
+              {
+                "type": "stored",
+                "id": 4841
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 4842
+              }
+            ]
+          },
+          "n_step": -1229,
+          "goals": [
+            "MzQLdlQ\nBYmnkT\nTWP\n\nPzzi",
+            "Sf\nKNdilLieC\nUNu\n\nl",
+            "Od\nhZfDGHbEymOsoNknJgDlHZ\nheZuJR\n\nsrc"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 4843,
+            "context": [
+              {
+                "type": "stored",
+                "id": 4844
+              },
+              {
+                "type": "stored",
+                "id": 4845
+              },
+              {
+                "type": "stored",
+                "id": 4846
+              },
+              {
+                "type": "stored",
+                "id": 4847
+              }
+            ]
+          },
+          "step": {
+            "text": "w",
+            "context": [
+              {
+                "type": "stored",
+                "id": 4848
+              },
+              {
+                "type": "stored",
+                "id": 4849
+              },
+              {
+                "type": "stored",
+                "id": 4850
+              },
+              {
+                "type": "stored",
+                "id": 4851
+              },
+              {
+                "type": "stored",
+                "id": 4852
+              }
+            ]
+          },
+          "n_step": -22480,
+          "goals": [
+            "\n\nOX"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 4853,
+            "context": [
+              {
+                "type": "stored",
+                "id": 4854
+              },
+              {
+                "type": "stored",
+                "id": 4855
+              },
+              {
+                "type": "stored",
+                "id": 4856
+              }
+            ]
+          },
+          "step": {
+            "text": "W\t\udbac\udf2d3\u00d2\uda89\udf63\u0093\u0017\udae4\udd1a",
+            "context": [
+              {
+                "type": "stored",
+                "id": 4857
+              },
+              {
+                "type": "stored",
+                "id": 4858
+              },
+              {
+                "type": "stored",
+                "id": 4859
+              },
+              {
+                "type": "stored",
+                "id": 4860
+              },
+              {
+                "type": "stored",
+                "id": 4861
+              },
+              {
+                "type": "stored",
+                "id": 4862
+              },
+              {
+                "type": "stored",
+                "id": 4863
+              },
+              {
+                "type": "stored",
+                "id": 4864
+              }
+            ]
+          },
+          "n_step": 144267,
+          "goals": [
+            "XsyRjkUVLKOoCLzCK\nmNrYew\nT\nRtlV\nBG\nghIZGCsv\n\nyAXLTJ",
+            "RO\nxifMTL\nZg\ndependencies\ntKR\nNQTjM\nQsEBXNNsVcSmBK\nslaIzrzRXvb\n\nXoSdQG"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 4865,
+            "context": []
+          },
+          "step": {
+            "text": "N\u000b",
+            "context": [
+              {
+                "type": "stored",
+                "id": 4866
+              },
+              {
+                "type": "stored",
+                "id": 4867
+              },
+              {
+                "type": "stored",
+                "id": 4868
+              },
+              {
+                "type": "stored",
+                "id": 4869
+              },
+              {
+                "type": "stored",
+                "id": 4870
+              }
+            ]
+          },
+          "n_step": -113568,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 4871,
+            "context": [
+              {
+                "type": "stored",
+                "id": 4872
+              },
+              {
+                "type": "stored",
+                "id": 4873
+              },
+              {
+                "type": "stored",
+                "id": 4874
+              },
+              {
+                "type": "stored",
+                "id": 4875
+              },
+              {
+                "type": "stored",
+                "id": 4876
+              },
+              {
+                "type": "stored",
+                "id": 4877
+              },
+              {
+                "type": "stored",
+                "id": 4878
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": []
+          },
+          "n_step": -2298,
+          "goals": [
+            "AnyMK\nokedEKOsmdeJvOznZ\nm\newKUEmzYKjGwWKc\nPHB\nlwD\nsu\nOJM\nijGbyZZJA\n\nGKWyGmbv",
+            "h\nu\nVPIqRvPFYxdEHM\ndyTqyGRNljONyT\ntkAoElV\nnPdw\nEJuHD\nboGUO\ndtype\nhDJgVf\nl\nQRGf\nkZDvhE\n\nwTvbUIo",
+            "QUhRizbKK\ntkqoHFKmMqgUzssjJvVwrykDhgl\nhLMPr\nblaSikQ\n\nHCOjtKXQWrgBsmiBrvPUGy",
+            "\n\nIiKEIujmIP",
+            "True\niXuj\noyVnpJCyn\nKvfTsMumG\nmXI\n\ny",
+            "Kfz\ngDo\nFGoqgXBVtG\nBfV\n\nMnVjLgkjBSarDMnsnmtVdbrGTEZWBKyvh"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 4879,
+            "context": [
+              {
+                "type": "stored",
+                "id": 4880
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00ac\ud819\udcb9\u00b6",
+            "context": []
+          },
+          "n_step": -2476343,
+          "goals": [
+            "q\nOmwdut\n\nO"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,155 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar3/ikw.v\", \"workspace\": \"/coq-dataset/repos/bar3\", \"repository\": \"/coq-dataset/repos/bar3\"}",
+    "{\"type\": \"stored\", \"id\": 4442}",
+    "{\"type\": \"stored\", \"id\": 4443}",
+    "{\"type\": \"stored\", \"id\": 4444}",
+    "{\"type\": \"stored\", \"id\": 4445}",
+    "{\"type\": \"stored\", \"id\": 4446}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 4447,
+        "context": [
+          {
+            "type": "stored",
+            "id": 4448
+          },
+          {
+            "type": "stored",
+            "id": 4449
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 4450,
+            "context": [
+              {
+                "type": "stored",
+                "id": 4451
+              },
+              {
+                "type": "stored",
+                "id": 4452
+              },
+              {
+                "type": "stored",
+                "id": 4453
+              },
+              {
+                "type": "stored",
+                "id": 4454
+              },
+              {
+                "type": "stored",
+                "id": 4455
+              },
+              {
+                "type": "stored",
+                "id": 4456
+              },
+              {
+                "type": "stored",
+                "id": 4457
+              },
+              {
+                "type": "stored",
+                "id": 4458
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00eai\u000e\u00c6\u0006\u0083f",
+            "context": [
+              {
+                "type": "stored",
+                "id": 4459
+              },
+              {
+                "type": "stored",
+                "id": 4460
+              },
+              {
+                "type": "stored",
+                "id": 4461
+              },
+              {
+                "type": "stored",
+                "id": 4462
+              },
+              {
+                "type": "stored",
+                "id": 4463
+              },
+              {
+                "type": "stored",
+                "id": 4464
+              }
+            ]
+          },
+          "n_step": 208414201,
+          "goals": [
+            "Y\nTtnz\nKDhIoOSU\ndo\nc\nR\nupXVLkh\nK\n\nTZzttB",
+            "\n\nLtkDGroeohtqtP",
+            "ZMztFmN\ncbAkBPQdgwTSDPcJ\nZxnM\no\nDxqJXz\nPr\nGIDwgri\nDvqVakSejGgCcUnXiTQCpv\nUJ\nlAHQb\nZ\nAf\nH\nbVJYXgGKGUgQzkVvj\nlFyTvln\nMemnmb\neZDWfTcIGhLoeO\nyPt\nc\n\nWyeQLhHEIo",
+            "\n\nEpCtJk",
+            "\n\nvpyxWvCKs"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 4465,
+            "context": [
+              {
+                "type": "stored",
+                "id": 4466
+              },
+              {
+                "type": "stored",
+                "id": 4467
+              },
+              {
+                "type": "stored",
+                "id": 4468
+              },
+              {
+                "type": "stored",
+                "id": 4469
+              },
+              {
+                "type": "stored",
+                "id": 4470
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00f7\b\u00f6\udb9a\udca1\ud8be\udd95YX",
+            "context": [
+              {
+                "type": "stored",
+                "id": 4471
+              },
+              {
+                "type": "stored",
+                "id": 4472
+              }
+            ]
+          },
+          "n_step": 15442,
+          "goals": [
+            "gZM\n\nX",
+            "srCPSYvRcOqFGWOiTdDFnCbshWjJzlQnQSHM\nNFNnaaRDF\nCn\nweDdYSURiLuCnP\ncRKbD\nfBhxPIKAQYx\nvLNZMTMYrpDWeI\nzV\nJ\ndeep\ni\nP\nexUGDCo\nX\nmeiu\nWJvlhmJC\npprtIiu\n\nlzP",
+            "ZgNksRYGPFE\nET\nwEs\n\nHaOEV",
+            "Cen\noAhjaDgTjza\n\nX"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,19 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar3/j.v\", \"workspace\": \"/coq-dataset/repos/bar3\", \"repository\": \"/coq-dataset/repos/bar3\"}",
+    "{\"type\": \"stored\", \"id\": 4679}",
+    "{\"type\": \"stored\", \"id\": 4680}",
+    "{\"type\": \"stored\", \"id\": 4681}",
+    "{\"type\": \"stored\", \"id\": 4682}",
+    "{\"type\": \"stored\", \"id\": 4683}",
+    "{\"type\": \"stored\", \"id\": 4684}",
+    "{\"type\": \"stored\", \"id\": 4685}",
+    "{\"type\": \"stored\", \"id\": 4686}",
+    "{\"type\": \"stored\", \"id\": 4687}",
+    "{\"type\": \"stored\", \"id\": 4688}",
+    "{\"type\": \"stored\", \"id\": 4689}",
+    "{\"type\": \"stored\", \"id\": 4690}",
+    "{\"type\": \"stored\", \"id\": 4691}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
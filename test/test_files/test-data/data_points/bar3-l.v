@@ -0,0 +1,20 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar3/l.v\", \"workspace\": \"/coq-dataset/repos/bar3\", \"repository\": \"/coq-dataset/repos/bar3\"}",
+    "{\"type\": \"stored\", \"id\": 4428}",
+    "{\"type\": \"stored\", \"id\": 4429}",
+    "{\"type\": \"stored\", \"id\": 4430}",
+    "{\"type\": \"stored\", \"id\": 4431}",
+    "{\"type\": \"stored\", \"id\": 4432}",
+    "{\"type\": \"stored\", \"id\": 4433}",
+    "{\"type\": \"stored\", \"id\": 4434}",
+    "{\"type\": \"stored\", \"id\": 4435}",
+    "{\"type\": \"stored\", \"id\": 4436}",
+    "{\"type\": \"stored\", \"id\": 4437}",
+    "{\"type\": \"stored\", \"id\": 4438}",
+    "{\"type\": \"stored\", \"id\": 4439}",
+    "{\"type\": \"stored\", \"id\": 4440}",
+    "{\"type\": \"stored\", \"id\": 4441}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
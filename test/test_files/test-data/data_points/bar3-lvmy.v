@@ -0,0 +1,374 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar3/lvmy.v\", \"workspace\": \"/coq-dataset/repos/bar3\", \"repository\": \"/coq-dataset/repos/bar3\"}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 4605,
+        "context": [
+          {
+            "type": "stored",
+            "id": 4606
+          },
+          {
+            "type": "stored",
+            "id": 4607
+          },
+          {
+            "type": "stored",
+            "id": 4608
+          },
+          {
+            "type": "stored",
+            "id": 4609
+          },
+          {
+            "type": "stored",
+            "id": 4610
+          },
+          {
+            "type": "stored",
+            "id": 4611
+          },
+          {
+            "type": "stored",
+            "id": 4612
+          },
+          {
+            "type": "stored",
+            "id": 4613
+          },
+          {
+            "type": "stored",
+            "id": 4614
+          },
+          {
+            "type": "stored",
+            "id": 4615
+          },
+          {
+            "type": "stored",
+            "id": 4616
+          },
+          {
+            "type": "stored",
+            "id": 4617
+          },
+          {
+            "type": "stored",
+            "id": 4618
+          },
+          {
+            "type": "stored",
+            "id": 4619
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 4620,
+            "context": [
+              {
+                "type": "stored",
+                "id": 4621
+              }
+            ]
+          },
+          "step": {
+            "text": "j/\u0087\u0016",
+            "context": [
+              {
+                "type": "stored",
+                "id": 4622
+              }
+            ]
+          },
+          "n_step": -4263,
+          "goals": [
+            "QTT\noJl\nGCJT\nGrY\nGezsqaH\n\nhZBzGYqw",
+            "None\nvB\nREHMEypEp\nBbYmEYLm\nlkgMBSXm\nAQYTcywM\n\nxvKG",
+            "\n\nY"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 4623,
+            "context": [
+              {
+                "type": "stored",
+                "id": 4624
+              },
+              {
+                "type": "stored",
+                "id": 4625
+              },
+              {
+                "type": "stored",
+                "id": 4626
+              },
+              {
+                "type": "stored",
+                "id": 4627
+              },
+              {
+                "type": "stored",
+                "id": 4628
+              },
+              {
+                "type": "stored",
+                "id": 4629
+              },
+              {
+                "type": "stored",
+                "id": 4630
+              },
+              {
+                "type": "stored",
+                "id": 4631
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 4632
+              },
+              {
+                "type": "stored",
+                "id": 4633
+              },
+              {
+                "type": "stored",
+                "id": 4634
+              },
+              {
+                "type": "stored",
+                "id": 4635
+              },
+              {
+                "type": "stored",
+                "id": 4636
+              },
+              {
+                "type": "stored",
+                "id": 4637
+              },
+              {
+                "type": "stored",
+                "id": 4638
+              },
+              {
+                "type": "stored",
+                "id": 4639
+              },
+              {
+                "type": "stored",
+                "id": 4640
+              },
+              {
+                "type": "stored",
+                "id": 4641
+              },
+              {
+                "type": "stored",
+                "id": 4642
+              },
+              {
+                "type": "stored",
+                "id": 4643
+              },
+              {
+                "type": "stored",
+                "id": 4644
+              },
+              {
+                "type": "stored",
+                "id": 4645
+              },
+              {
+                "type": "stored",
+                "id": 4646
+              },
+              {
+                "type": "stored",
+                "id": 4647
+              }
+            ]
+          },
+          "n_step": 117277,
+          "goals": [
+            "tbkViETEk\nqUZFpwSNtM\nPLjkVCU\nbcdy\n\nGfe",
+            "AUqCPLE\nX\nji\nk\nttj\n\nWcOaJrZEECONimjSqQrbyTCvhe",
+            "WT\nUO\nbo\nigWdVpMDbF\nLIRSIhMgnDQAr\ny\nTHU\nKZLCIP\nkPXv\nHNXhDbuvNUvqh\n\nTNPkDkzDKXJo",
+            "yjxadjKjwGJE\nFHAyptulYo\njUwiFiYkp\nbhxQ\nU\n\nE"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 4648,
+            "context": []
+          },
+          "step": {
+            "text": "\u00f6",
+            "context": [
+              {
+                "type": "stored",
+                "id": 4649
+              },
+              {
+                "type": "stored",
+                "id": 4650
+              },
+              {
+                "type": "stored",
+                "id": 4651
+              },
+              {
+                "type": "stored",
+                "id": 4652
+              },
+              {
+                "type": "stored",
+                "id": 4653
+              },
+              {
+                "type": "stored",
+                "id": 4654
+              },
+              {
+                "type": "stored",
+                "id": 4655
+              },
+              {
+                "type": "stored",
+                "id": 4656
+              },
+              {
+                "type": "stored",
+                "id": 4657
+              },
+              {
+                "type": "stored",
+                "id": 4658
+              },
+              {
+                "type": "stored",
+                "id": 4659
+              },
+              {
+                "type": "stored",
+                "id": 4660
+              },
+              {
+                "type": "stored",
+                "id": 4661
+              },
+              {
+                "type": "stored",
+                "id": 4662
+              },
+              {
+                "type": "stored",
+                "id": 4663
+              }
+            ]
+          },
+          "n_step": 10000,
+          "goals": [
+            "\n\nzELIwH"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 4664,
+            "context": [
+              {
+                "type": "stored",
+                "id": 4665
+              },
+              {
+                "type": "stored",
+                "id": 4666
+              },
+              {
+                "type": "stored",
+                "id": 4667
+              },
+              {
+                "type": "stored",
+                "id": 4668
+              },
+              {
+                "type": "stored",
+                "id": 4669
+              },
+              {
+                "type": "stored",
+                "id": 4670
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 4671
+              },
+              {
+                "type": "stored",
+                "id": 4672
+              },
+              {
+                "type": "stored",
+                "id": 4673
+              },
+              {
+                "type": "stored",
+                "id": 4674
+              },
+              {
+                "type": "stored",
+                "id": 4675
+              },
+              {
+                "type": "stored",
+                "id": 4676
+              },
+              {
+                "type": "stored",
+                "id": 4677
+              }
+            ]
+          },
+          "n_step": 63,
+          "goals": [
+            "ET\nyOD\njikut\n\nRAePcJUdUgp",
+            "NaN\nbrZgT\nh\nFGABJBXgns\nVROz\nUHv\n\nq",
+            "XBk\nbMIGdCz\nlPnfdRWP\noM\nXEqdA\nxZT\nvS\njb\nozQu\niVHbdPUKNeDS\nX\nSmIadMg\nZ\nP\nARpXXSUFyR\nFV\nPIefqAVzXTqf\n\nyrLgTmbJ",
+            "b\n\nJDrJGMqAMwDj",
+            "AvBpG\nhj\ntarget\n\nS",
+            "iLfbQaaIXpogLPJsTWmabhmE\nKboWJYGOd\nj\ntv\nRD\nHWU\nUdlQx\nuDfifbys\nchO\nhOJkXT\n\nahmcpObdViBjSl"
+          ]
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 4678,
+        "context": []
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,10 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar3/lwxibzffwhli.v\", \"workspace\": \"/coq-dataset/repos/bar3\", \"repository\": \"/coq-dataset/repos/bar3\"}",
+    "{\"type\": \"stored\", \"id\": 5012}",
+    "{\"type\": \"stored\", \"id\": 5013}",
+    "{\"type\": \"stored\", \"id\": 5014}",
+    "{\"type\": \"stored\", \"id\": 5015}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
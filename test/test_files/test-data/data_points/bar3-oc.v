@@ -0,0 +1,18 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar3/oc.v\", \"workspace\": \"/coq-dataset/repos/bar3\", \"repository\": \"/coq-dataset/repos/bar3\"}",
+    "{\"type\": \"stored\", \"id\": 4348}",
+    "{\"type\": \"stored\", \"id\": 4349}",
+    "{\"type\": \"stored\", \"id\": 4350}",
+    "{\"type\": \"stored\", \"id\": 4351}",
+    "{\"type\": \"stored\", \"id\": 4352}",
+    "{\"type\": \"stored\", \"id\": 4353}",
+    "{\"type\": \"stored\", \"id\": 4354}",
+    "{\"type\": \"stored\", \"id\": 4355}",
+    "{\"type\": \"stored\", \"id\": 4356}",
+    "{\"type\": \"stored\", \"id\": 4357}",
+    "{\"type\": \"stored\", \"id\": 4358}",
+    "{\"type\": \"stored\", \"id\": 4359}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,15 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar3/op.v\", \"workspace\": \"/coq-dataset/repos/bar3\", \"repository\": \"/coq-dataset/repos/bar3\"}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 4692,
+        "context": []
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
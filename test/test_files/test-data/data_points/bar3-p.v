@@ -0,0 +1,122 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar3/p.v\", \"workspace\": \"/coq-dataset/repos/bar3\", \"repository\": \"/coq-dataset/repos/bar3\"}",
+    "{\"type\": \"stored\", \"id\": 4506}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 4507,
+        "context": [
+          {
+            "type": "stored",
+            "id": 4508
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 4509,
+            "context": []
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 4510
+              }
+            ]
+          },
+          "n_step": 864289,
+          "goals": [
+            "mvc\nIfRVX\n\np",
+            "\n\nRPYTHcoyjuh",
+            "K\nGySqpBms\nJHgaG\nI\nNxovfO\nJmJUCyrCzJOndGmiyO\n\nqMRstrdQvUlv",
+            "RRt\n\nenjkom",
+            "hWmjcrrlho\nAT\nxTjJp\nnone\n\nnnCw",
+            "gpfMBfSkoVuUjtjgFReWz\nRm\nRMPxtE\n\nrERpsV",
+            "DtW\nthm\n\nLCATAsdnk",
+            "UrRJ\nA\nfED\n\nansAplHMQiC",
+            "IVvKXJfJeY\n\nDYje",
+            "v\nL\nK\nUxSrQhaAHpj\nb\nGz\nXUW\npL\nXplZabhieNqCkwtkgECuXoJm\n\nSLquPB",
+            "hde\nOItHtTa\nu\nj\nBXnp\nheZZVL\nu\nsboV\n\nFMlQHSGWW",
+            "XWwiyn\neVl\nMn\nzdqENZn\nld\nL\ncOs\nvnaskGFTF\nREf\nk\nQfxYXMlIZ\nOCH\nr\nZV\nKKpfuHifqDTLLwDqEqktBGz\nPz\nmethod\nE\nApyKr\nR\nfphgd\n\nkOnb",
+            "mguAsWaoNcWppUHYeKUmKi\n\nEsUhRYg",
+            "then\nPhbPQAlvj\nYBoELNlIRKxtryQYV\nRV\ny\nVNTYCfnJZNJKL\nhQtLMgm\n\nL"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 4511,
+            "context": [
+              {
+                "type": "stored",
+                "id": 4512
+              }
+            ]
+          },
+          "step": {
+            "text": "\u0085\uda84\udc0b",
+            "context": [
+              {
+                "type": "stored",
+                "id": 4513
+              },
+              {
+                "type": "stored",
+                "id": 4514
+              },
+              {
+                "type": "stored",
+                "id": 4515
+              },
+              {
+                "type": "stored",
+                "id": 4516
+              },
+              {
+                "type": "stored",
+                "id": 4517
+              },
+              {
+                "type": "stored",
+                "id": 4518
+              },
+              {
+                "type": "stored",
+                "id": 4519
+              },
+              {
+                "type": "stored",
+                "id": 4520
+              },
+              {
+                "type": "stored",
+                "id": 4521
+              },
+              {
+                "type": "stored",
+                "id": 4522
+              },
+              {
+                "type": "stored",
+                "id": 4523
+              },
+              {
+                "type": "stored",
+                "id": 4524
+              }
+            ]
+          },
+          "n_step": 100,
+          "goals": []
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,16 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar3/tcbisld.v\", \"workspace\": \"/coq-dataset/repos/bar3\", \"repository\": \"/coq-dataset/repos/bar3\"}",
+    "{\"type\": \"stored\", \"id\": 4478}",
+    "{\"type\": \"stored\", \"id\": 4479}",
+    "{\"type\": \"stored\", \"id\": 4480}",
+    "{\"type\": \"stored\", \"id\": 4481}",
+    "{\"type\": \"stored\", \"id\": 4482}",
+    "{\"type\": \"stored\", \"id\": 4483}",
+    "{\"type\": \"stored\", \"id\": 4484}",
+    "{\"type\": \"stored\", \"id\": 4485}",
+    "{\"type\": \"stored\", \"id\": 4486}",
+    "{\"type\": \"stored\", \"id\": 4487}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
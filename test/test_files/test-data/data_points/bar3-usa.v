@@ -0,0 +1,26 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar3/usa.v\", \"workspace\": \"/coq-dataset/repos/bar3\", \"repository\": \"/coq-dataset/repos/bar3\"}",
+    "{\"type\": \"stored\", \"id\": 4693}",
+    "{\"type\": \"stored\", \"id\": 4694}",
+    "{\"type\": \"stored\", \"id\": 4695}",
+    "{\"type\": \"stored\", \"id\": 4696}",
+    "{\"type\": \"stored\", \"id\": 4697}",
+    "{\"type\": \"stored\", \"id\": 4698}",
+    "{\"type\": \"stored\", \"id\": 4699}",
+    "{\"type\": \"stored\", \"id\": 4700}",
+    "{\"type\": \"stored\", \"id\": 4701}",
+    "{\"type\": \"stored\", \"id\": 4702}",
+    "{\"type\": \"stored\", \"id\": 4703}",
+    "{\"type\": \"stored\", \"id\": 4704}",
+    "{\"type\": \"stored\", \"id\": 4705}",
+    "{\"type\": \"stored\", \"id\": 4706}",
+    "{\"type\": \"stored\", \"id\": 4707}",
+    "{\"type\": \"stored\", \"id\": 4708}",
+    "{\"type\": \"stored\", \"id\": 4709}",
+    "{\"type\": \"stored\", \"id\": 4710}",
+    "{\"type\": \"stored\", \"id\": 4711}",
+    "{\"type\": \"stored\", \"id\": 4712}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,257 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar3/w.v\", \"workspace\": \"/coq-dataset/repos/bar3\", \"repository\": \"/coq-dataset/repos/bar3\"}",
+    "{\"type\": \"stored\", \"id\": 4907}",
+    "{\"type\": \"stored\", \"id\": 4908}",
+    "{\"type\": \"stored\", \"id\": 4909}",
+    "{\"type\": \"stored\", \"id\": 4910}",
+    "{\"type\": \"stored\", \"id\": 4911}",
+    "{\"type\": \"stored\", \"id\": 4912}",
+    "{\"type\": \"stored\", \"id\": 4913}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 4914,
+        "context": []
+      },
+      "steps": []
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 4915,
+        "context": [
+          {
+            "type": "stored",
+            "id": 4916
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 4917,
+            "context": [
+              {
+                "type": "stored",
+                "id": 4918
+              },
+              {
+                "type": "stored",
+                "id": 4919
+              },
+              {
+                "type": "stored",
+                "id": 4920
+              },
+              {
+                "type": "stored",
+                "id": 4921
+              },
+              {
+                "type": "stored",
+                "id": 4922
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00a3\udbfe\udf8ai",
+            "context": [
+              {
+                "type": "stored",
+                "id": 4923
+              },
+              {
+                "type": "stored",
+                "id": 4924
+              }
+            ]
+          },
+          "n_step": -308679,
+          "goals": [
+            "RkxLtBZs\nc\nyQHnOVrBk\n\nj",
+            "Kgd\n\ntrue",
+            "\n\nmQEk"
+          ]
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 4925,
+        "context": [
+          {
+            "type": "stored",
+            "id": 4926
+          },
+          {
+            "type": "stored",
+            "id": 4927
+          },
+          {
+            "type": "stored",
+            "id": 4928
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 4929,
+            "context": [
+              {
+                "type": "stored",
+                "id": 4930
+              },
+              {
+                "type": "stored",
+                "id": 4931
+              },
+              {
+                "type": "stored",
+                "id": 4932
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 4933
+              }
+            ]
+          },
+          "n_step": -3434,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 4934,
+            "context": [
+              {
+                "type": "stored",
+                "id": 4935
+              },
+              {
+                "type": "stored",
+                "id": 4936
+              },
+              {
+                "type": "stored",
+                "id": 4937
+              },
+              {
+                "type": "stored",
+                "id": 4938
+              },
+              {
+                "type": "stored",
+                "id": 4939
+              }
+            ]
+          },
+          "step": {
+            "text": "%\u0099",
+            "context": [
+              {
+                "type": "stored",
+                "id": 4940
+              },
+              {
+                "type": "stored",
+                "id": 4941
+              },
+              {
+                "type": "stored",
+                "id": 4942
+              }
+            ]
+          },
+          "n_step": 1087899878,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 4943,
+            "context": [
+              {
+                "type": "stored",
+                "id": 4944
+              },
+              {
+                "type": "stored",
+                "id": 4945
+              },
+              {
+                "type": "stored",
+                "id": 4946
+              },
+              {
+                "type": "stored",
+                "id": 4947
+              },
+              {
+                "type": "stored",
+                "id": 4948
+              },
+              {
+                "type": "stored",
+                "id": 4949
+              },
+              {
+                "type": "stored",
+                "id": 4950
+              },
+              {
+                "type": "stored",
+                "id": 4951
+              },
+              {
+                "type": "stored",
+                "id": 4952
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 4953
+              },
+              {
+                "type": "stored",
+                "id": 4954
+              },
+              {
+                "type": "stored",
+                "id": 4955
+              },
+              {
+                "type": "stored",
+                "id": 4956
+              },
+              {
+                "type": "stored",
+                "id": 4957
+              }
+            ]
+          },
+          "n_step": -690202434197146,
+          "goals": [
+            "bo\n\nQoOpVf",
+            "\n\nb"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
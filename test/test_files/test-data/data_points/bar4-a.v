@@ -0,0 +1,6 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar4/a.v\", \"workspace\": \"/coq-dataset/repos/bar4\", \"repository\": \"/coq-dataset/repos/bar4\"}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,211 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar4/b.v\", \"workspace\": \"/coq-dataset/repos/bar4\", \"repository\": \"/coq-dataset/repos/bar4\"}",
+    "{\"type\": \"stored\", \"id\": 5450}",
+    "{\"type\": \"stored\", \"id\": 5451}",
+    "{\"type\": \"stored\", \"id\": 5452}",
+    "{\"type\": \"stored\", \"id\": 5453}",
+    "{\"type\": \"stored\", \"id\": 5454}",
+    "{\"type\": \"stored\", \"id\": 5455}",
+    "{\"type\": \"stored\", \"id\": 5456}",
+    "{\"type\": \"stored\", \"id\": 5457}",
+    "{\"type\": \"stored\", \"id\": 5458}",
+    "{\"type\": \"stored\", \"id\": 5459}",
+    "{\"type\": \"stored\", \"id\": 5460}",
+    "{\"type\": \"stored\", \"id\": 5461}",
+    "{\"type\": \"stored\", \"id\": 5462}",
+    "{\"type\": \"stored\", \"id\": 5463}",
+    "{\"type\": \"stored\", \"id\": 5464}",
+    "{\"type\": \"stored\", \"id\": 5465}",
+    "{\"type\": \"stored\", \"id\": 5466}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 5467,
+        "context": [
+          {
+            "type": "stored",
+            "id": 5468
+          },
+          {
+            "type": "stored",
+            "id": 5469
+          },
+          {
+            "type": "stored",
+            "id": 5470
+          },
+          {
+            "type": "stored",
+            "id": 5471
+          },
+          {
+            "type": "stored",
+            "id": 5472
+          },
+          {
+            "type": "stored",
+            "id": 5473
+          },
+          {
+            "type": "stored",
+            "id": 5474
+          },
+          {
+            "type": "stored",
+            "id": 5475
+          },
+          {
+            "type": "stored",
+            "id": 5476
+          },
+          {
+            "type": "stored",
+            "id": 5477
+          },
+          {
+            "type": "stored",
+            "id": 5478
+          },
+          {
+            "type": "stored",
+            "id": 5479
+          },
+          {
+            "type": "stored",
+            "id": 5480
+          },
+          {
+            "type": "stored",
+            "id": 5481
+          },
+          {
+            "type": "stored",
+            "id": 5482
+          },
+          {
+            "type": "stored",
+            "id": 5483
+          },
+          {
+            "type": "stored",
+            "id": 5484
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 5485,
+            "context": [
+              {
+                "type": "stored",
+                "id": 5486
+              },
+              {
+                "type": "stored",
+                "id": 5487
+              },
+              {
+                "type": "stored",
+                "id": 5488
+              },
+              {
+                "type": "stored",
+                "id": 5489
+              },
+              {
+                "type": "stored",
+                "id": 5490
+              },
+              {
+                "type": "stored",
+                "id": 5491
+              },
+              {
+                "type": "stored",
+                "id": 5492
+              }
+            ]
+          },
+          "step": {
+            "text": "--num_workers",
+            "context": [
+              {
+                "type": "stored",
+                "id": 5493
+              },
+              {
+                "type": "stored",
+                "id": 5494
+              },
+              {
+                "type": "stored",
+                "id": 5495
+              }
+            ]
+          },
+          "n_step": 119,
+          "goals": [
+            "UOMEJ\nU\n\nkvLiy",
+            "AeQkA\n\noEYDNfyMF",
+            "\n\nWvRRtWEgQVywPOguYK",
+            "AYVjpjhTRPTVreapHxTCRHcyZYt\n\nVAMe",
+            "nWcHSuETJrHP\nnone\nZ\nvoAikS\nhp\nz\n\nf",
+            "Z\nrYHeAih\n\nopyfQ"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 5496,
+            "context": [
+              {
+                "type": "stored",
+                "id": 5497
+              },
+              {
+                "type": "stored",
+                "id": 5498
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 5499
+              },
+              {
+                "type": "stored",
+                "id": 5500
+              },
+              {
+                "type": "stored",
+                "id": 5501
+              },
+              {
+                "type": "stored",
+                "id": 5502
+              },
+              {
+                "type": "stored",
+                "id": 5503
+              },
+              {
+                "type": "stored",
+                "id": 5504
+              }
+            ]
+          },
+          "n_step": 392749040,
+          "goals": []
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,128 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar4/ckga.v\", \"workspace\": \"/coq-dataset/repos/bar4\", \"repository\": \"/coq-dataset/repos/bar4\"}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 5332,
+        "context": []
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 5333,
+            "context": [
+              {
+                "type": "stored",
+                "id": 5334
+              },
+              {
+                "type": "stored",
+                "id": 5335
+              },
+              {
+                "type": "stored",
+                "id": 5336
+              },
+              {
+                "type": "stored",
+                "id": 5337
+              },
+              {
+                "type": "stored",
+                "id": 5338
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00a4\u00be",
+            "context": [
+              {
+                "type": "stored",
+                "id": 5339
+              }
+            ]
+          },
+          "n_step": 19015,
+          "goals": [
+            "MjHG\n\nEqcnunBQvKRfM",
+            "RoOG\n\nydlIX",
+            "eTRmWmwqiIRwSChmpdrHXP\nundefined\nW\nPE\nm\nNTMf\nbxqQezxkQbTFbXRLRwJrvXyMnpZaHnW\nUoHZnBvO\nw\n\nSZ",
+            "\n\nr",
+            "B\nINqugedxNFhz\nrXiabeLuacV\nAjOGxM\noUqBWBzj\nMgbNrDh\nRfwA\nkq\n\ntgxfMYqOchlnsGyJEFoavevVjyvFQbXsmD"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 5340,
+            "context": [
+              {
+                "type": "stored",
+                "id": 5341
+              },
+              {
+                "type": "stored",
+                "id": 5342
+              },
+              {
+                "type": "stored",
+                "id": 5343
+              },
+              {
+                "type": "stored",
+                "id": 5344
+              }
+            ]
+          },
+          "step": {
+            "text": "\u009fx\u00d4Bz\u0081\ud9d5\udfdf\u00ed",
+            "context": [
+              {
+                "type": "stored",
+                "id": 5345
+              },
+              {
+                "type": "stored",
+                "id": 5346
+              },
+              {
+                "type": "stored",
+                "id": 5347
+              },
+              {
+                "type": "stored",
+                "id": 5348
+              },
+              {
+                "type": "stored",
+                "id": 5349
+              },
+              {
+                "type": "stored",
+                "id": 5350
+              },
+              {
+                "type": "stored",
+                "id": 5351
+              },
+              {
+                "type": "stored",
+                "id": 5352
+              },
+              {
+                "type": "stored",
+                "id": 5353
+              }
+            ]
+          },
+          "n_step": 12711368,
+          "goals": []
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,347 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar4/ihxatmtbsdjtkcbotxailyuzculjg.v\", \"workspace\": \"/coq-dataset/repos/bar4\", \"repository\": \"/coq-dataset/repos/bar4\"}",
+    "{\"type\": \"stored\", \"id\": 5218}",
+    "{\"type\": \"stored\", \"id\": 5219}",
+    "{\"type\": \"stored\", \"id\": 5220}",
+    "{\"type\": \"stored\", \"id\": 5221}",
+    "{\"type\": \"stored\", \"id\": 5222}",
+    "{\"type\": \"stored\", \"id\": 5223}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 5224,
+        "context": []
+      },
+      "steps": []
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 5225,
+        "context": [
+          {
+            "type": "stored",
+            "id": 5226
+          },
+          {
+            "type": "stored",
+            "id": 5227
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 5228,
+            "context": [
+              {
+                "type": "stored",
+                "id": 5229
+              },
+              {
+                "type": "stored",
+                "id": 5230
+              },
+              {
+                "type": "stored",
+                "id": 5231
+              }
+            ]
+          },
+          "step": {
+            "text": "!\ud922\udf27\u00a3",
+            "context": [
+              {
+                "type": "stored",
+                "id": 5232
+              },
+              {
+                "type": "stored",
+                "id": 5233
+              },
+              {
+                "type": "stored",
+                "id": 5234
+              }
+            ]
+          },
+          "n_step": 303490,
+          "goals": [
+            "KeIV\nf\nEVlV\nWYuv\nlAufkntnUOxZKRex\nIhsvnijFCdIvwVPDvL\ndzFrwZ\nFCA\nscript\n\nc",
+            "HCgpLpONnrom\nFKfKj\ndfO\no\nwPoYTsBlziXJyFoMsflEMLginu\n\nZHn",
+            "jENchk\nsearch\nInf\nkUw\nVI\naH\nFqjX\nHm\nHzDOUloZ\nF\nFIG\nAMZejUNTpc\nccLbX\n\ntTL"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 5235,
+            "context": [
+              {
+                "type": "stored",
+                "id": 5236
+              },
+              {
+                "type": "stored",
+                "id": 5237
+              },
+              {
+                "type": "stored",
+                "id": 5238
+              },
+              {
+                "type": "stored",
+                "id": 5239
+              },
+              {
+                "type": "stored",
+                "id": 5240
+              },
+              {
+                "type": "stored",
+                "id": 5241
+              },
+              {
+                "type": "stored",
+                "id": 5242
+              }
+            ]
+          },
+          "step": {
+            "text": "\udb36\ude20\uda25\udca8M\u5125\u00b5\u00ac%",
+            "context": [
+              {
+                "type": "stored",
+                "id": 5243
+              },
+              {
+                "type": "stored",
+                "id": 5244
+              },
+              {
+                "type": "stored",
+                "id": 5245
+              },
+              {
+                "type": "stored",
+                "id": 5246
+              },
+              {
+                "type": "stored",
+                "id": 5247
+              },
+              {
+                "type": "stored",
+                "id": 5248
+              }
+            ]
+          },
+          "n_step": -465482,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 5249,
+            "context": [
+              {
+                "type": "stored",
+                "id": 5250
+              }
+            ]
+          },
+          "step": {
+            "text": "t\u00ac\u00e3",
+            "context": [
+              {
+                "type": "stored",
+                "id": 5251
+              }
+            ]
+          },
+          "n_step": 1000,
+          "goals": [
+            "DxrhvmCI\n\nWeYKmK"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 5252,
+            "context": [
+              {
+                "type": "stored",
+                "id": 5253
+              },
+              {
+                "type": "stored",
+                "id": 5254
+              },
+              {
+                "type": "stored",
+                "id": 5255
+              },
+              {
+                "type": "stored",
+                "id": 5256
+              },
+              {
+                "type": "stored",
+                "id": 5257
+              },
+              {
+                "type": "stored",
+                "id": 5258
+              },
+              {
+                "type": "stored",
+                "id": 5259
+              },
+              {
+                "type": "stored",
+                "id": 5260
+              },
+              {
+                "type": "stored",
+                "id": 5261
+              },
+              {
+                "type": "stored",
+                "id": 5262
+              },
+              {
+                "type": "stored",
+                "id": 5263
+              },
+              {
+                "type": "stored",
+                "id": 5264
+              },
+              {
+                "type": "stored",
+                "id": 5265
+              }
+            ]
+          },
+          "step": {
+            "text": "~\u00e1\u00a6\u009b\ud8db\udf20\udb29\udd1b\ud9a8\ude3b",
+            "context": []
+          },
+          "n_step": -107,
+          "goals": [
+            "\n\nYy",
+            "hP\ndAe\nUNkRwlvt\nX\nngyjjEDipF\nTSPMgoxkr\nDhVii\nfXTylZJWTOLDogrH\nlyA\nvbJNldQzO\ncWNCVUE\na\nsGgfIw\nmE\nw\n\nHPFB"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 5266,
+            "context": [
+              {
+                "type": "stored",
+                "id": 5267
+              },
+              {
+                "type": "stored",
+                "id": 5268
+              },
+              {
+                "type": "stored",
+                "id": 5269
+              },
+              {
+                "type": "stored",
+                "id": 5270
+              },
+              {
+                "type": "stored",
+                "id": 5271
+              },
+              {
+                "type": "stored",
+                "id": 5272
+              },
+              {
+                "type": "stored",
+                "id": 5273
+              },
+              {
+                "type": "stored",
+                "id": 5274
+              },
+              {
+                "type": "stored",
+                "id": 5275
+              },
+              {
+                "type": "stored",
+                "id": 5276
+              },
+              {
+                "type": "stored",
+                "id": 5277
+              },
+              {
+                "type": "stored",
+                "id": 5278
+              },
+              {
+                "type": "stored",
+                "id": 5279
+              },
+              {
+                "type": "stored",
+                "id": 5280
+              },
+              {
+                "type": "stored",
+                "id": 5281
+              },
+              {
+                "type": "stored",
+                "id": 5282
+              },
+              {
+                "type": "stored",
+                "id": 5283
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00d0On",
+            "context": [
+              {
+                "type": "stored",
+                "id": 5284
+              },
+              {
+                "type": "stored",
+                "id": 5285
+              }
+            ]
+          },
+          "n_step": 11246352219,
+          "goals": [
+            "lpvpowrt\nNwi\n\nGTZjohWFmKVFXRtg",
+            "RQLdia\n\ne",
+            "\n\ngGx",
+            "CR\nC\nhGNAeyZbClLqeGD\n\nmPV",
+            "l\nloc\n\nCOROLLARY",
+            "\n\nQ",
+            "EjbxDWxAhsSn\n\nIvLQwG",
+            "\n\nfWLtHE",
+            "x\nogDjnhyAjGokTm\n\njfsFipPaFc",
+            "F\nwJILbKmDZhZdZrqCZOhqI\nDrO\n\nKnh",
+            "DeEnKIjYYqZXSADURH\nP\n\npW",
+            "\n\nt"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,10 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar4/iyvcxbxiwnfdevon.v\", \"workspace\": \"/coq-dataset/repos/bar4\", \"repository\": \"/coq-dataset/repos/bar4\"}",
+    "{\"type\": \"stored\", \"id\": 5437}",
+    "{\"type\": \"stored\", \"id\": 5438}",
+    "{\"type\": \"stored\", \"id\": 5439}",
+    "{\"type\": \"stored\", \"id\": 5440}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,8 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar4/ktful.v\", \"workspace\": \"/coq-dataset/repos/bar4\", \"repository\": \"/coq-dataset/repos/bar4\"}",
+    "{\"type\": \"stored\", \"id\": 5286}",
+    "{\"type\": \"stored\", \"id\": 5287}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,27 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar4/nnpe.v\", \"workspace\": \"/coq-dataset/repos/bar4\", \"repository\": \"/coq-dataset/repos/bar4\"}",
+    "{\"type\": \"stored\", \"id\": 5441}",
+    "{\"type\": \"stored\", \"id\": 5442}",
+    "{\"type\": \"stored\", \"id\": 5443}",
+    "{\"type\": \"stored\", \"id\": 5444}",
+    "{\"type\": \"stored\", \"id\": 5445}",
+    "{\"type\": \"stored\", \"id\": 5446}",
+    "{\"type\": \"stored\", \"id\": 5447}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 5448,
+        "context": [
+          {
+            "type": "stored",
+            "id": 5449
+          }
+        ]
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,14 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar4/none.v\", \"workspace\": \"/coq-dataset/repos/bar4\", \"repository\": \"/coq-dataset/repos/bar4\"}",
+    "{\"type\": \"stored\", \"id\": 5031}",
+    "{\"type\": \"stored\", \"id\": 5032}",
+    "{\"type\": \"stored\", \"id\": 5033}",
+    "{\"type\": \"stored\", \"id\": 5034}",
+    "{\"type\": \"stored\", \"id\": 5035}",
+    "{\"type\": \"stored\", \"id\": 5036}",
+    "{\"type\": \"stored\", \"id\": 5037}",
+    "{\"type\": \"stored\", \"id\": 5038}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
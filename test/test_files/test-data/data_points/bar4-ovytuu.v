@@ -0,0 +1,8 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar4/ovytuu.v\", \"workspace\": \"/coq-dataset/repos/bar4\", \"repository\": \"/coq-dataset/repos/bar4\"}",
+    "{\"type\": \"stored\", \"id\": 5016}",
+    "{\"type\": \"stored\", \"id\": 5017}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
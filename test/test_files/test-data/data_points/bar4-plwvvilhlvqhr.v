@@ -0,0 +1,244 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar4/plwvvilhlvqhr.v\", \"workspace\": \"/coq-dataset/repos/bar4\", \"repository\": \"/coq-dataset/repos/bar4\"}",
+    "{\"type\": \"stored\", \"id\": 5288}",
+    "{\"type\": \"stored\", \"id\": 5289}",
+    "{\"type\": \"stored\", \"id\": 5290}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 5291,
+        "context": []
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 5292,
+            "context": [
+              {
+                "type": "stored",
+                "id": 5293
+              },
+              {
+                "type": "stored",
+                "id": 5294
+              },
+              {
+                "type": "stored",
+                "id": 5295
+              },
+              {
+                "type": "stored",
+                "id": 5296
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 5297
+              },
+              {
+                "type": "stored",
+                "id": 5298
+              },
+              {
+                "type": "stored",
+                "id": 5299
+              },
+              {
+                "type": "stored",
+                "id": 5300
+              },
+              {
+                "type": "stored",
+                "id": 5301
+              },
+              {
+                "type": "stored",
+                "id": 5302
+              },
+              {
+                "type": "stored",
+                "id": 5303
+              },
+              {
+                "type": "stored",
+                "id": 5304
+              },
+              {
+                "type": "stored",
+                "id": 5305
+              },
+              {
+                "type": "stored",
+                "id": 5306
+              },
+              {
+                "type": "stored",
+                "id": 5307
+              },
+              {
+                "type": "stored",
+                "id": 5308
+              },
+              {
+                "type": "stored",
+                "id": 5309
+              },
+              {
+                "type": "stored",
+                "id": 5310
+              },
+              {
+                "type": "stored",
+                "id": 5311
+              }
+            ]
+          },
+          "n_step": -5239,
+          "goals": [
+            "zABKZbgOTunNCvWM\nYHsCclvqtMysGqRI\nZoSt\nAdF\nDVB\nETGsaXtCZ\nJ\nenhoda\ndeep\nOvLbHaPd\nnLd\nztJxwePRAxVwKhKh\nr\n\nB",
+            "IK\nCorollary\nks\nyTM\nxrVpL\ndN\nkIATEytRQSNoI\nCeaH\nHrUan\nWmROgD\n\nFKLcdTZcsO",
+            "T\nEFHIsKagZlX\n\nmHGzVGJvH",
+            "Scunthorpe\ngg\n\nR",
+            "w\nl\nl\nQLOFr\nS\nK\n\nXxotwi"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 5312,
+            "context": [
+              {
+                "type": "stored",
+                "id": 5313
+              },
+              {
+                "type": "stored",
+                "id": 5314
+              },
+              {
+                "type": "stored",
+                "id": 5315
+              },
+              {
+                "type": "stored",
+                "id": 5316
+              },
+              {
+                "type": "stored",
+                "id": 5317
+              },
+              {
+                "type": "stored",
+                "id": 5318
+              },
+              {
+                "type": "stored",
+                "id": 5319
+              },
+              {
+                "type": "stored",
+                "id": 5320
+              },
+              {
+                "type": "stored",
+                "id": 5321
+              },
+              {
+                "type": "stored",
+                "id": 5322
+              }
+            ]
+          },
+          "step": {
+            "text": "\ud8d8\udddc{z\u0096",
+            "context": [
+              {
+                "type": "stored",
+                "id": 5323
+              },
+              {
+                "type": "stored",
+                "id": 5324
+              },
+              {
+                "type": "stored",
+                "id": 5325
+              },
+              {
+                "type": "stored",
+                "id": 5326
+              }
+            ]
+          },
+          "n_step": 13875,
+          "goals": [
+            "\n\nu",
+            "Xw\ntCiP\njrnweB\nTRlR\nO\nZZv\nrlPaIzSiySCvEnCa\nUnMito\nA\nlr\nOzIQqtNdp\n\nz"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 5327,
+            "context": [
+              {
+                "type": "stored",
+                "id": 5328
+              },
+              {
+                "type": "stored",
+                "id": 5329
+              },
+              {
+                "type": "stored",
+                "id": 5330
+              }
+            ]
+          },
+          "step": {
+            "text": "2\u00f2",
+            "context": []
+          },
+          "n_step": -453,
+          "goals": [
+            "OdlJ\nqLAayDfs\n\ni",
+            "\n\nZwAZzBqe",
+            "spawn\n\nNVyeyWKhttxvwAET",
+            "BIzkaBMGTadAKD\nlKgrLTVt\n\nhhC",
+            "\n\nNsyzNezdExSYw"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 5331,
+            "context": []
+          },
+          "step": {
+            "text": "\ud8ff\udf86\u008c\u0099\u00a5\ud9ff\udd2f\f",
+            "context": []
+          },
+          "n_step": -4648890794,
+          "goals": [
+            "\n\nVa",
+            "kygkZam\norMyYVlbqqzknJnFFNx\nOprM\nVG\nX\nMcImBrBrNFIw\n\nGVF",
+            "eGB\nJd\nBleG\nSxg\nyLDRFrWMoSkEbJkDubgsGG\n\nWStoDeIlUr",
+            "gsnH\nzSbgtHEKqB\nRAKeAWZfVpEkFm\nVp\n\nVq",
+            "WFpMctV\nb\nFK\n\nTn",
+            "CREULog\nNSxiPRwk\nB\nXvDJaagnVQBkorAivcfA\nxk\nT\nVBGlsVOk\n\nNPlpFhTn",
+            "\n\nUy",
+            "KZ\nQGrLxGZtHjRuQ\nxX\n\nUhU"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,316 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar4/pxxpvekccehtmzsvbh.v\", \"workspace\": \"/coq-dataset/repos/bar4\", \"repository\": \"/coq-dataset/repos/bar4\"}",
+    "{\"type\": \"stored\", \"id\": 5129}",
+    "{\"type\": \"stored\", \"id\": 5130}",
+    "{\"type\": \"stored\", \"id\": 5131}",
+    "{\"type\": \"stored\", \"id\": 5132}",
+    "{\"type\": \"stored\", \"id\": 5133}",
+    "{\"type\": \"stored\", \"id\": 5134}",
+    "{\"type\": \"stored\", \"id\": 5135}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 5136,
+        "context": [
+          {
+            "type": "stored",
+            "id": 5137
+          },
+          {
+            "type": "stored",
+            "id": 5138
+          },
+          {
+            "type": "stored",
+            "id": 5139
+          },
+          {
+            "type": "stored",
+            "id": 5140
+          },
+          {
+            "type": "stored",
+            "id": 5141
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 5142,
+            "context": [
+              {
+                "type": "stored",
+                "id": 5143
+              }
+            ]
+          },
+          "step": {
+            "text": "'\u00b0\u00bd\u0018\u0001\u0083\udab0\udd25\u00b4\u0082\u00b1\u00fa\u00aa",
+            "context": []
+          },
+          "n_step": 22987086794780908,
+          "goals": [
+            "\n\nSMy"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 5144,
+            "context": [
+              {
+                "type": "stored",
+                "id": 5145
+              },
+              {
+                "type": "stored",
+                "id": 5146
+              },
+              {
+                "type": "stored",
+                "id": 5147
+              },
+              {
+                "type": "stored",
+                "id": 5148
+              },
+              {
+                "type": "stored",
+                "id": 5149
+              },
+              {
+                "type": "stored",
+                "id": 5150
+              }
+            ]
+          },
+          "step": {
+            "text": "\udb49\ude2c\u0085\ud9a1\udf1f\u00f5\u001dO(V\f\u00ab\udbef\udc06",
+            "context": [
+              {
+                "type": "stored",
+                "id": 5151
+              },
+              {
+                "type": "stored",
+                "id": 5152
+              },
+              {
+                "type": "stored",
+                "id": 5153
+              },
+              {
+                "type": "stored",
+                "id": 5154
+              },
+              {
+                "type": "stored",
+                "id": 5155
+              },
+              {
+                "type": "stored",
+                "id": 5156
+              },
+              {
+                "type": "stored",
+                "id": 5157
+              },
+              {
+                "type": "stored",
+                "id": 5158
+              },
+              {
+                "type": "stored",
+                "id": 5159
+              },
+              {
+                "type": "stored",
+                "id": 5160
+              },
+              {
+                "type": "stored",
+                "id": 5161
+              },
+              {
+                "type": "stored",
+                "id": 5162
+              }
+            ]
+          },
+          "n_step": 1327196872637322,
+          "goals": [
+            "BVd\n\nvDlGw",
+            "S\nxTap\nHRhMHz\naE\nbRsQCSu\nWYgeqDAAdhggf\nQrzbfdX\nqzl\nfa\nknJF\n\nuWSJJK",
+            "\n\nT"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 5163,
+            "context": [
+              {
+                "type": "stored",
+                "id": 5164
+              },
+              {
+                "type": "stored",
+                "id": 5165
+              },
+              {
+                "type": "stored",
+                "id": 5166
+              },
+              {
+                "type": "stored",
+                "id": 5167
+              },
+              {
+                "type": "stored",
+                "id": 5168
+              },
+              {
+                "type": "stored",
+                "id": 5169
+              },
+              {
+                "type": "stored",
+                "id": 5170
+              },
+              {
+                "type": "stored",
+                "id": 5171
+              },
+              {
+                "type": "stored",
+                "id": 5172
+              },
+              {
+                "type": "stored",
+                "id": 5173
+              },
+              {
+                "type": "stored",
+                "id": 5174
+              },
+              {
+                "type": "stored",
+                "id": 5175
+              },
+              {
+                "type": "stored",
+                "id": 5176
+              },
+              {
+                "type": "stored",
+                "id": 5177
+              },
+              {
+                "type": "stored",
+                "id": 5178
+              },
+              {
+                "type": "stored",
+                "id": 5179
+              },
+              {
+                "type": "stored",
+                "id": 5180
+              },
+              {
+                "type": "stored",
+                "id": 5181
+              },
+              {
+                "type": "stored",
+                "id": 5182
+              },
+              {
+                "type": "stored",
+                "id": 5183
+              },
+              {
+                "type": "stored",
+                "id": 5184
+              },
+              {
+                "type": "stored",
+                "id": 5185
+              },
+              {
+                "type": "stored",
+                "id": 5186
+              },
+              {
+                "type": "stored",
+                "id": 5187
+              },
+              {
+                "type": "stored",
+                "id": 5188
+              },
+              {
+                "type": "stored",
+                "id": 5189
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00d9\u00e3\u00c4",
+            "context": [
+              {
+                "type": "stored",
+                "id": 5190
+              },
+              {
+                "type": "stored",
+                "id": 5191
+              }
+            ]
+          },
+          "n_step": -5239,
+          "goals": [
+            "yL\nNUL\nTydoCMiHr\nDq\n\nif",
+            "ylKHJAdu\nxf\nYdRc\n\nMOyNKLvtvEBDuz",
+            "AvpPk\nvHwjAepaJxRX\nhMT\nXOPp\nIO\nOeH\n\nGFJRsaUS",
+            "\n\nvocab",
+            "akpWBclqb\ncHZV\nmodules\nRXSpVapxTUTsA\n\nx",
+            "cpu\n\ntiopPpHqJCfWZVqoBP"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 5192,
+            "context": [
+              {
+                "type": "stored",
+                "id": 5193
+              },
+              {
+                "type": "stored",
+                "id": 5194
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 5195
+              }
+            ]
+          },
+          "n_step": 8820,
+          "goals": []
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
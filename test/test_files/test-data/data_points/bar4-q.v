@@ -0,0 +1,9 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar4/q.v\", \"workspace\": \"/coq-dataset/repos/bar4\", \"repository\": \"/coq-dataset/repos/bar4\"}",
+    "{\"type\": \"stored\", \"id\": 5215}",
+    "{\"type\": \"stored\", \"id\": 5216}",
+    "{\"type\": \"stored\", \"id\": 5217}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,19 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar4/rc.v\", \"workspace\": \"/coq-dataset/repos/bar4\", \"repository\": \"/coq-dataset/repos/bar4\"}",
+    "{\"type\": \"stored\", \"id\": 5018}",
+    "{\"type\": \"stored\", \"id\": 5019}",
+    "{\"type\": \"stored\", \"id\": 5020}",
+    "{\"type\": \"stored\", \"id\": 5021}",
+    "{\"type\": \"stored\", \"id\": 5022}",
+    "{\"type\": \"stored\", \"id\": 5023}",
+    "{\"type\": \"stored\", \"id\": 5024}",
+    "{\"type\": \"stored\", \"id\": 5025}",
+    "{\"type\": \"stored\", \"id\": 5026}",
+    "{\"type\": \"stored\", \"id\": 5027}",
+    "{\"type\": \"stored\", \"id\": 5028}",
+    "{\"type\": \"stored\", \"id\": 5029}",
+    "{\"type\": \"stored\", \"id\": 5030}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,12 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar4/t.v\", \"workspace\": \"/coq-dataset/repos/bar4\", \"repository\": \"/coq-dataset/repos/bar4\"}",
+    "{\"type\": \"stored\", \"id\": 5048}",
+    "{\"type\": \"stored\", \"id\": 5049}",
+    "{\"type\": \"stored\", \"id\": 5050}",
+    "{\"type\": \"stored\", \"id\": 5051}",
+    "{\"type\": \"stored\", \"id\": 5052}",
+    "{\"type\": \"stored\", \"id\": 5053}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,115 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar4/u.v\", \"workspace\": \"/coq-dataset/repos/bar4\", \"repository\": \"/coq-dataset/repos/bar4\"}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 5364,
+        "context": [
+          {
+            "type": "stored",
+            "id": 5365
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 5366,
+            "context": []
+          },
+          "step": {
+            "text": "\ud909\udec5\u00a1\ud849\ude58\u00e0\ud90c\udfb9",
+            "context": [
+              {
+                "type": "stored",
+                "id": 5367
+              },
+              {
+                "type": "stored",
+                "id": 5368
+              },
+              {
+                "type": "stored",
+                "id": 5369
+              },
+              {
+                "type": "stored",
+                "id": 5370
+              }
+            ]
+          },
+          "n_step": 165,
+          "goals": [
+            "\n\nYdm",
+            "WJF\nYGD\noIIdQlWNoAyqZJqOZYgRrZcOUr\nnone\n\nNDX"
+          ]
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 5371,
+        "context": [
+          {
+            "type": "stored",
+            "id": 5372
+          },
+          {
+            "type": "stored",
+            "id": 5373
+          },
+          {
+            "type": "stored",
+            "id": 5374
+          },
+          {
+            "type": "stored",
+            "id": 5375
+          },
+          {
+            "type": "stored",
+            "id": 5376
+          },
+          {
+            "type": "stored",
+            "id": 5377
+          },
+          {
+            "type": "stored",
+            "id": 5378
+          },
+          {
+            "type": "stored",
+            "id": 5379
+          },
+          {
+            "type": "stored",
+            "id": 5380
+          },
+          {
+            "type": "stored",
+            "id": 5381
+          },
+          {
+            "type": "stored",
+            "id": 5382
+          },
+          {
+            "type": "stored",
+            "id": 5383
+          },
+          {
+            "type": "stored",
+            "id": 5384
+          }
+        ]
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,250 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar4/u.v.v\", \"workspace\": \"/coq-dataset/repos/bar4\", \"repository\": \"/coq-dataset/repos/bar4\"}",
+    "{\"type\": \"stored\", \"id\": 5385}",
+    "{\"type\": \"stored\", \"id\": 5386}",
+    "{\"type\": \"stored\", \"id\": 5387}",
+    "{\"type\": \"stored\", \"id\": 5388}",
+    "{\"type\": \"stored\", \"id\": 5389}",
+    "{\"type\": \"stored\", \"id\": 5390}",
+    "{\"type\": \"stored\", \"id\": 5391}",
+    "{\"type\": \"stored\", \"id\": 5392}",
+    "{\"type\": \"stored\", \"id\": 5393}",
+    "{\"type\": \"stored\", \"id\": 5394}",
+    "{\"type\": \"stored\", \"id\": 5395}",
+    "{\"type\": \"stored\", \"id\": 5396}",
+    "{\"type\": \"stored\", \"id\": 5397}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 5398,
+        "context": []
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 5399,
+            "context": [
+              {
+                "type": "stored",
+                "id": 5400
+              }
+            ]
+          },
+          "step": {
+            "text": "\ud9e0\udd62\u00de",
+            "context": [
+              {
+                "type": "stored",
+                "id": 5401
+              },
+              {
+                "type": "stored",
+                "id": 5402
+              }
+            ]
+          },
+          "n_step": 3254470,
+          "goals": [
+            "KTlAqDrs\nTRUE\njmCOTVBoiPdsbUoI\naHJR\naBF\nuMP\nkbRWzNnzhb\nCfzuC\nDn\nLB\nPb\nKgBNd\nNone\n\nrHgrfyBn",
+            "aLyUl\nEjnERe\n\nkmqaE",
+            "eW\n\nLY"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 5403,
+            "context": [
+              {
+                "type": "stored",
+                "id": 5404
+              },
+              {
+                "type": "stored",
+                "id": 5405
+              },
+              {
+                "type": "stored",
+                "id": 5406
+              },
+              {
+                "type": "stored",
+                "id": 5407
+              },
+              {
+                "type": "stored",
+                "id": 5408
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00cdY~F\u00ec\u0016Y\udba8\udcfdQ\uda35\udd56",
+            "context": [
+              {
+                "type": "stored",
+                "id": 5409
+              },
+              {
+                "type": "stored",
+                "id": 5410
+              },
+              {
+                "type": "stored",
+                "id": 5411
+              },
+              {
+                "type": "stored",
+                "id": 5412
+              },
+              {
+                "type": "stored",
+                "id": 5413
+              },
+              {
+                "type": "stored",
+                "id": 5414
+              },
+              {
+                "type": "stored",
+                "id": 5415
+              },
+              {
+                "type": "stored",
+                "id": 5416
+              },
+              {
+                "type": "stored",
+                "id": 5417
+              },
+              {
+                "type": "stored",
+                "id": 5418
+              },
+              {
+                "type": "stored",
+                "id": 5419
+              },
+              {
+                "type": "stored",
+                "id": 5420
+              }
+            ]
+          },
+          "n_step": -563720,
+          "goals": [
+            "uW\nxEXqt\nHgyG\ny\nxVrepGzalY\n\nTRUE"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 5421,
+            "context": [
+              {
+                "type": "stored",
+                "id": 5422
+              },
+              {
+                "type": "stored",
+                "id": 5423
+              },
+              {
+                "type": "stored",
+                "id": 5424
+              },
+              {
+                "type": "stored",
+                "id": 5425
+              },
+              {
+                "type": "stored",
+                "id": 5426
+              },
+              {
+                "type": "stored",
+                "id": 5427
+              }
+            ]
+          },
+          "step": {
+            "text": "d7",
+            "context": [
+              {
+                "type": "stored",
+                "id": 5428
+              }
+            ]
+          },
+          "n_step": -36028797018963968,
+          "goals": [
+            "YcwYFK\nZof\nUpMK\nanU\ngnnX\n\nNIL",
+            "BIKuutcyt\nyo\n\nYIl",
+            "MBjLodBQqD\ngg\nVYrBIVxzwZCBcu\nsentence\nDsQ\naTImkTsRjAxC\n\nAyaEO",
+            "\n\nRZ",
+            "qTorQ\ngoNBJYms\nCGMbQ\nDah\nhQNKnyaKhEI\nb\n\nprrzhG",
+            "none\nU\nfLx\nUxSrjrgVOgOeQRLUvOt\nXxDGI\nYcVGnfH\nytd\nhtXJMXtZ\n\nXUCBvzXsINgsmldz",
+            "FKQ\nhRR\nuDeYMLg\nDhvsDtpFxMD\nQopkfCICg\nmVl\nB\nrrxZW\nh\ndsnPOW\n\nPREfZrqijy",
+            "K\n\nRDBzXvHPae",
+            "kOMK\ny\n\nhOaaUS",
+            "cFlm\nrjPRXt\nyaS\n\ngl",
+            "\n\nInf"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 5429,
+            "context": []
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 5430
+              },
+              {
+                "type": "stored",
+                "id": 5431
+              },
+              {
+                "type": "stored",
+                "id": 5432
+              },
+              {
+                "type": "stored",
+                "id": 5433
+              },
+              {
+                "type": "stored",
+                "id": 5434
+              },
+              {
+                "type": "stored",
+                "id": 5435
+              },
+              {
+                "type": "stored",
+                "id": 5436
+              }
+            ]
+          },
+          "n_step": -166714,
+          "goals": [
+            "\n\npjofNI",
+            "On\nyCdjZunKkSb\nhGiYyTd\nFAZYfEyZvasFqsnasTb\nEcNicq\ntrain\nFuW\nw\nk\ndmu\nelse\nAmKOxL\nKOpAolVE\nnjsuRJH\nFgkiwVWgfdo\nvjIuF\nnRh\nhAXTrWc\nHalefoHHo\nwEIsHYk\nVQj\nm\nwm\n\nTXMD",
+            "Xe\nEPlXOChorDnStur\nKQmPAwnwjcRQNS\nU\n\nUHANFdwH",
+            "KmgG\nKcfBtcORhE\nVVkjdiZx\nXHl\nfmYGcbAxP\n\nAB",
+            "JKhHpgGI\nnq\nFK\n\nC",
+            "ucwsRCpoYW\n\nNSoIX",
+            "RfOHxFk\n\nj"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,96 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar4/vhlkrv.v\", \"workspace\": \"/coq-dataset/repos/bar4\", \"repository\": \"/coq-dataset/repos/bar4\"}",
+    "{\"type\": \"stored\", \"id\": 5108}",
+    "{\"type\": \"stored\", \"id\": 5109}",
+    "{\"type\": \"stored\", \"id\": 5110}",
+    "{\"type\": \"stored\", \"id\": 5111}",
+    "{\"type\": \"stored\", \"id\": 5112}",
+    "{\"type\": \"stored\", \"id\": 5113}",
+    "{\"type\": \"stored\", \"id\": 5114}",
+    "{\"type\": \"stored\", \"id\": 5115}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 5116,
+        "context": [
+          {
+            "type": "stored",
+            "id": 5117
+          },
+          {
+            "type": "stored",
+            "id": 5118
+          },
+          {
+            "type": "stored",
+            "id": 5119
+          },
+          {
+            "type": "stored",
+            "id": 5120
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 5121,
+            "context": [
+              {
+                "type": "stored",
+                "id": 5122
+              },
+              {
+                "type": "stored",
+                "id": 5123
+              },
+              {
+                "type": "stored",
+                "id": 5124
+              },
+              {
+                "type": "stored",
+                "id": 5125
+              },
+              {
+                "type": "stored",
+                "id": 5126
+              },
+              {
+                "type": "stored",
+                "id": 5127
+              }
+            ]
+          },
+          "step": {
+            "text": "{\u008a\u00c5",
+            "context": [
+              {
+                "type": "stored",
+                "id": 5128
+              }
+            ]
+          },
+          "n_step": -413868,
+          "goals": [
+            "OZqgsekYMgcKaOiZPneHAbpCG\nfsZGULV\nSVANOpKr\n\nSYZvKIIZQH",
+            "hA\nWk\nLdja\nTTTYWrTlSKP\n\nXhHvwwEyq",
+            "Uon\nmghjWSHjUUMtLAG\nCXUmYP\ntlBwqn\neUdQYBBsidWLXafRlxwDWoHHhlkyOSs\nEt\nfEa\ns\neJTJ\nW\nkQMuJcYbAw\nLvBzTfwgHWAGWI\nQygqWj\nhL\nmodules\n\nesOo",
+            "\n\nrQV",
+            "\n\nSAMmFOYiQPgI",
+            "dj\nA\n\neV",
+            "UVmIOdcQPA\nRkLA\n\nlCoKTHe",
+            "MSi\n\nVU",
+            "CXbljNf\nSt\n\nZDIHGFUAAwFpu",
+            "zgWkwIeof\nmVHybE\nZNRphFfXfnvVSuOWgztCGUKrNAY\niLS\nu\nkYAQRogd\npjlu\nFcPvvXsTvFTUDK\nLyK\nKX\n\nnwfEUe",
+            "zdy\nwle\nJpkwy\nzqNHQFQrnOeg\nNBs\nyV\nqyyQKXiiV\n\nhh"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
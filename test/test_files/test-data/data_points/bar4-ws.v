@@ -0,0 +1,37 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar4/ws.v\", \"workspace\": \"/coq-dataset/repos/bar4\", \"repository\": \"/coq-dataset/repos/bar4\"}",
+    "{\"type\": \"stored\", \"id\": 5196}",
+    "{\"type\": \"stored\", \"id\": 5197}",
+    "{\"type\": \"stored\", \"id\": 5198}",
+    "{\"type\": \"stored\", \"id\": 5199}",
+    "{\"type\": \"stored\", \"id\": 5200}",
+    "{\"type\": \"stored\", \"id\": 5201}",
+    "{\"type\": \"stored\", \"id\": 5202}",
+    "{\"type\": \"stored\", \"id\": 5203}",
+    "{\"type\": \"stored\", \"id\": 5204}",
+    "{\"type\": \"stored\", \"id\": 5205}",
+    "{\"type\": \"stored\", \"id\": 5206}",
+    "{\"type\": \"stored\", \"id\": 5207}",
+    "{\"type\": \"stored\", \"id\": 5208}",
+    "{\"type\": \"stored\", \"id\": 5209}",
+    "{\"type\": \"stored\", \"id\": 5210}",
+    "{\"type\": \"stored\", \"id\": 5211}",
+    "{\"type\": \"stored\", \"id\": 5212}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 5213,
+        "context": [
+          {
+            "type": "stored",
+            "id": 5214
+          }
+        ]
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
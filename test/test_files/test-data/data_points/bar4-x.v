@@ -0,0 +1,57 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar4/x.v\", \"workspace\": \"/coq-dataset/repos/bar4\", \"repository\": \"/coq-dataset/repos/bar4\"}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 5039,
+        "context": []
+      },
+      "steps": []
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 5040,
+        "context": [
+          {
+            "type": "stored",
+            "id": 5041
+          },
+          {
+            "type": "stored",
+            "id": 5042
+          },
+          {
+            "type": "stored",
+            "id": 5043
+          }
+        ]
+      },
+      "steps": []
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 5044,
+        "context": [
+          {
+            "type": "stored",
+            "id": 5045
+          },
+          {
+            "type": "stored",
+            "id": 5046
+          },
+          {
+            "type": "stored",
+            "id": 5047
+          }
+        ]
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,16 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar4/xpcfsxphptll.v\", \"workspace\": \"/coq-dataset/repos/bar4\", \"repository\": \"/coq-dataset/repos/bar4\"}",
+    "{\"type\": \"stored\", \"id\": 5354}",
+    "{\"type\": \"stored\", \"id\": 5355}",
+    "{\"type\": \"stored\", \"id\": 5356}",
+    "{\"type\": \"stored\", \"id\": 5357}",
+    "{\"type\": \"stored\", \"id\": 5358}",
+    "{\"type\": \"stored\", \"id\": 5359}",
+    "{\"type\": \"stored\", \"id\": 5360}",
+    "{\"type\": \"stored\", \"id\": 5361}",
+    "{\"type\": \"stored\", \"id\": 5362}",
+    "{\"type\": \"stored\", \"id\": 5363}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
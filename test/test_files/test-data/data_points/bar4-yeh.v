@@ -0,0 +1,258 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar4/yeh.v\", \"workspace\": \"/coq-dataset/repos/bar4\", \"repository\": \"/coq-dataset/repos/bar4\"}",
+    "{\"type\": \"stored\", \"id\": 5054}",
+    "{\"type\": \"stored\", \"id\": 5055}",
+    "{\"type\": \"stored\", \"id\": 5056}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 5057,
+        "context": [
+          {
+            "type": "stored",
+            "id": 5058
+          },
+          {
+            "type": "stored",
+            "id": 5059
+          },
+          {
+            "type": "stored",
+            "id": 5060
+          },
+          {
+            "type": "stored",
+            "id": 5061
+          },
+          {
+            "type": "stored",
+            "id": 5062
+          },
+          {
+            "type": "stored",
+            "id": 5063
+          },
+          {
+            "type": "stored",
+            "id": 5064
+          },
+          {
+            "type": "stored",
+            "id": 5065
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 5066,
+            "context": [
+              {
+                "type": "stored",
+                "id": 5067
+              },
+              {
+                "type": "stored",
+                "id": 5068
+              },
+              {
+                "type": "stored",
+                "id": 5069
+              },
+              {
+                "type": "stored",
+                "id": 5070
+              },
+              {
+                "type": "stored",
+                "id": 5071
+              }
+            ]
+          },
+          "step": {
+            "text": "\u008c\u00b7\u00ec",
+            "context": [
+              {
+                "type": "stored",
+                "id": 5072
+              },
+              {
+                "type": "stored",
+                "id": 5073
+              },
+              {
+                "type": "stored",
+                "id": 5074
+              },
+              {
+                "type": "stored",
+                "id": 5075
+              },
+              {
+                "type": "stored",
+                "id": 5076
+              },
+              {
+                "type": "stored",
+                "id": 5077
+              },
+              {
+                "type": "stored",
+                "id": 5078
+              },
+              {
+                "type": "stored",
+                "id": 5079
+              },
+              {
+                "type": "stored",
+                "id": 5080
+              },
+              {
+                "type": "stored",
+                "id": 5081
+              },
+              {
+                "type": "stored",
+                "id": 5082
+              },
+              {
+                "type": "stored",
+                "id": 5083
+              }
+            ]
+          },
+          "n_step": 46380,
+          "goals": [
+            "aNptS\nyX\noCfBgJUAjPX\nvSl\njRcXXdY\nYiQ\nK\nwQ\nio\nE\nKJ\nTafSeBMQOPAqyD\nF\nFfiuon\nLPktSNyXLUZRelCZruoiPeiqZWttxQR\n\nSVWxM",
+            "q\nE\n\nBJFQ",
+            "\n\nYxegJqNg",
+            "QOYvTRRtZtrtxUcNzKyBFzOusq\nUzEEXYtcZ\npXa\nzYB\ncQdYAwlPkPQNHTcEx\nsbmOcRQP\n\nrepository",
+            "xUsU\niKx\nSc\nrcjT\nfoui\n\nRbteddLRb",
+            "VHXy\nk\nUSML\nbvi\njh\nGEUXn\n\nUlJsCWYNJFrrkP",
+            "PNIENfcCxDItq\nuJm\n\nOxVJPIxwovCtg",
+            "LrPOhMvch\nqNsVJ\nZIWMml\nlines\n\nVTi"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 5084,
+            "context": [
+              {
+                "type": "stored",
+                "id": 5085
+              },
+              {
+                "type": "stored",
+                "id": 5086
+              },
+              {
+                "type": "stored",
+                "id": 5087
+              },
+              {
+                "type": "stored",
+                "id": 5088
+              },
+              {
+                "type": "stored",
+                "id": 5089
+              }
+            ]
+          },
+          "step": {
+            "text": "f\u0095",
+            "context": [
+              {
+                "type": "stored",
+                "id": 5090
+              },
+              {
+                "type": "stored",
+                "id": 5091
+              },
+              {
+                "type": "stored",
+                "id": 5092
+              }
+            ]
+          },
+          "n_step": 8809,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 5093,
+            "context": [
+              {
+                "type": "stored",
+                "id": 5094
+              },
+              {
+                "type": "stored",
+                "id": 5095
+              },
+              {
+                "type": "stored",
+                "id": 5096
+              },
+              {
+                "type": "stored",
+                "id": 5097
+              },
+              {
+                "type": "stored",
+                "id": 5098
+              },
+              {
+                "type": "stored",
+                "id": 5099
+              },
+              {
+                "type": "stored",
+                "id": 5100
+              },
+              {
+                "type": "stored",
+                "id": 5101
+              },
+              {
+                "type": "stored",
+                "id": 5102
+              },
+              {
+                "type": "stored",
+                "id": 5103
+              },
+              {
+                "type": "stored",
+                "id": 5104
+              }
+            ]
+          },
+          "step": {
+            "text": "\uda4e\udf7cy\u008e\u00d8\ud88a\udd29\u0007Z\u00d8\u00c9\u00e8",
+            "context": [
+              {
+                "type": "stored",
+                "id": 5105
+              },
+              {
+                "type": "stored",
+                "id": 5106
+              }
+            ]
+          },
+          "n_step": 736,
+          "goals": []
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
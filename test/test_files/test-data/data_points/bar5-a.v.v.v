@@ -0,0 +1,6 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar5/a.v.v.v\", \"workspace\": \"/coq-dataset/repos/bar5\", \"repository\": \"/coq-dataset/repos/bar5\"}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,202 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar5/bt.v\", \"workspace\": \"/coq-dataset/repos/bar5\", \"repository\": \"/coq-dataset/repos/bar5\"}",
+    "{\"type\": \"stored\", \"id\": 5529}",
+    "{\"type\": \"stored\", \"id\": 5530}",
+    "{\"type\": \"stored\", \"id\": 5531}",
+    "{\"type\": \"stored\", \"id\": 5532}",
+    "{\"type\": \"stored\", \"id\": 5533}",
+    "{\"type\": \"stored\", \"id\": 5534}",
+    "{\"type\": \"stored\", \"id\": 5535}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 5536,
+        "context": [
+          {
+            "type": "stored",
+            "id": 5537
+          },
+          {
+            "type": "stored",
+            "id": 5538
+          },
+          {
+            "type": "stored",
+            "id": 5539
+          },
+          {
+            "type": "stored",
+            "id": 5540
+          },
+          {
+            "type": "stored",
+            "id": 5541
+          },
+          {
+            "type": "stored",
+            "id": 5542
+          },
+          {
+            "type": "stored",
+            "id": 5543
+          },
+          {
+            "type": "stored",
+            "id": 5544
+          },
+          {
+            "type": "stored",
+            "id": 5545
+          },
+          {
+            "type": "stored",
+            "id": 5546
+          },
+          {
+            "type": "stored",
+            "id": 5547
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 5548,
+            "context": [
+              {
+                "type": "stored",
+                "id": 5549
+              },
+              {
+                "type": "stored",
+                "id": 5550
+              },
+              {
+                "type": "stored",
+                "id": 5551
+              },
+              {
+                "type": "stored",
+                "id": 5552
+              },
+              {
+                "type": "stored",
+                "id": 5553
+              },
+              {
+                "type": "stored",
+                "id": 5554
+              },
+              {
+                "type": "stored",
+                "id": 5555
+              },
+              {
+                "type": "stored",
+                "id": 5556
+              },
+              {
+                "type": "stored",
+                "id": 5557
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00c7\u007f\u0086\uda90\udd16\u008e",
+            "context": [
+              {
+                "type": "stored",
+                "id": 5558
+              },
+              {
+                "type": "stored",
+                "id": 5559
+              },
+              {
+                "type": "stored",
+                "id": 5560
+              },
+              {
+                "type": "stored",
+                "id": 5561
+              },
+              {
+                "type": "stored",
+                "id": 5562
+              }
+            ]
+          },
+          "n_step": 100264247895315264237473890304,
+          "goals": [
+            "GWmLZhl\ngSeYeRwuWbAm\nVyKN\niKjt\nk\nQFO\nmdHma\nha\nXSYecA\n\nph",
+            "PsjCc\ncuSDY\nAOfz\nhyV\n\nZd",
+            "\n\nFL",
+            "X\ny\nwK\nyIw\nokBYu\nie\nYTr\nUsnIEJoVQ\n\naXx",
+            "k\nucFUyy\npcjquXfzVub\nclassical\nULozx\nCtMkIiqhGmgdrgID\nf\nHqH\nxdtwprN\n\noRnB",
+            "sdBMkSIx\nSnQPlYqGfavcLmo\nZG\nundefined\n\nFNezIwU",
+            "yvXQ\nMOkOBpg\n\nABCgDM",
+            "tKeCOEfFJvFiNZ\nNone\nYjdq\n\ntiPrWpZlbtnpZ",
+            "hF\n\ntXE",
+            "LXJn\nODdlHRCwDHWQoMvCvnLVCGPGzyuz\ngmY\nL\nqPjttdjPj\nuy\nYNoGii\nI\nDBEQaa\nG\nyQIKh\n\ncHy"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 5563,
+            "context": [
+              {
+                "type": "stored",
+                "id": 5564
+              },
+              {
+                "type": "stored",
+                "id": 5565
+              },
+              {
+                "type": "stored",
+                "id": 5566
+              }
+            ]
+          },
+          "step": {
+            "text": "\u008b\u00b4\udbc5\udc97",
+            "context": [
+              {
+                "type": "stored",
+                "id": 5567
+              },
+              {
+                "type": "stored",
+                "id": 5568
+              },
+              {
+                "type": "stored",
+                "id": 5569
+              },
+              {
+                "type": "stored",
+                "id": 5570
+              },
+              {
+                "type": "stored",
+                "id": 5571
+              }
+            ]
+          },
+          "n_step": 524267479401,
+          "goals": [
+            "\n\nFlJJl",
+            "oNZ\nneUesN\n\nchange",
+            "\n\nTIWZXbZg",
+            "a\nkiNyBqmRLvJybdsIDrIJJX\ne\nwFSAvzFHfotnVF\n\nQmUKCgxRX"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,7 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar5/czjsywiet.v\", \"workspace\": \"/coq-dataset/repos/bar5\", \"repository\": \"/coq-dataset/repos/bar5\"}",
+    "{\"type\": \"stored\", \"id\": 5661}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
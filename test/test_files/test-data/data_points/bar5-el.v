@@ -0,0 +1,9 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar5/el.v\", \"workspace\": \"/coq-dataset/repos/bar5\", \"repository\": \"/coq-dataset/repos/bar5\"}",
+    "{\"type\": \"stored\", \"id\": 5662}",
+    "{\"type\": \"stored\", \"id\": 5663}",
+    "{\"type\": \"stored\", \"id\": 5664}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
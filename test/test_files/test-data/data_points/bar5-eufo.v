@@ -0,0 +1,21 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar5/eufo.v\", \"workspace\": \"/coq-dataset/repos/bar5\", \"repository\": \"/coq-dataset/repos/bar5\"}",
+    "{\"type\": \"stored\", \"id\": 5636}",
+    "{\"type\": \"stored\", \"id\": 5637}",
+    "{\"type\": \"stored\", \"id\": 5638}",
+    "{\"type\": \"stored\", \"id\": 5639}",
+    "{\"type\": \"stored\", \"id\": 5640}",
+    "{\"type\": \"stored\", \"id\": 5641}",
+    "{\"type\": \"stored\", \"id\": 5642}",
+    "{\"type\": \"stored\", \"id\": 5643}",
+    "{\"type\": \"stored\", \"id\": 5644}",
+    "{\"type\": \"stored\", \"id\": 5645}",
+    "{\"type\": \"stored\", \"id\": 5646}",
+    "{\"type\": \"stored\", \"id\": 5647}",
+    "{\"type\": \"stored\", \"id\": 5648}",
+    "{\"type\": \"stored\", \"id\": 5649}",
+    "{\"type\": \"stored\", \"id\": 5650}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
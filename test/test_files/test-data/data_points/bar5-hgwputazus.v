@@ -0,0 +1,15 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar5/hgwputazus.v\", \"workspace\": \"/coq-dataset/repos/bar5\", \"repository\": \"/coq-dataset/repos/bar5\"}",
+    "{\"type\": \"stored\", \"id\": 5667}",
+    "{\"type\": \"stored\", \"id\": 5668}",
+    "{\"type\": \"stored\", \"id\": 5669}",
+    "{\"type\": \"stored\", \"id\": 5670}",
+    "{\"type\": \"stored\", \"id\": 5671}",
+    "{\"type\": \"stored\", \"id\": 5672}",
+    "{\"type\": \"stored\", \"id\": 5673}",
+    "{\"type\": \"stored\", \"id\": 5674}",
+    "{\"type\": \"stored\", \"id\": 5675}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,9 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar5/inta.v\", \"workspace\": \"/coq-dataset/repos/bar5\", \"repository\": \"/coq-dataset/repos/bar5\"}",
+    "{\"type\": \"stored\", \"id\": 5658}",
+    "{\"type\": \"stored\", \"id\": 5659}",
+    "{\"type\": \"stored\", \"id\": 5660}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,20 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar5/jx.v\", \"workspace\": \"/coq-dataset/repos/bar5\", \"repository\": \"/coq-dataset/repos/bar5\"}",
+    "{\"type\": \"stored\", \"id\": 5676}",
+    "{\"type\": \"stored\", \"id\": 5677}",
+    "{\"type\": \"stored\", \"id\": 5678}",
+    "{\"type\": \"stored\", \"id\": 5679}",
+    "{\"type\": \"stored\", \"id\": 5680}",
+    "{\"type\": \"stored\", \"id\": 5681}",
+    "{\"type\": \"stored\", \"id\": 5682}",
+    "{\"type\": \"stored\", \"id\": 5683}",
+    "{\"type\": \"stored\", \"id\": 5684}",
+    "{\"type\": \"stored\", \"id\": 5685}",
+    "{\"type\": \"stored\", \"id\": 5686}",
+    "{\"type\": \"stored\", \"id\": 5687}",
+    "{\"type\": \"stored\", \"id\": 5688}",
+    "{\"type\": \"stored\", \"id\": 5689}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
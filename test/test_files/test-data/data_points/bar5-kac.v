@@ -0,0 +1,231 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar5/kac.v\", \"workspace\": \"/coq-dataset/repos/bar5\", \"repository\": \"/coq-dataset/repos/bar5\"}",
+    "{\"type\": \"stored\", \"id\": 5690}",
+    "{\"type\": \"stored\", \"id\": 5691}",
+    "{\"type\": \"stored\", \"id\": 5692}",
+    "{\"type\": \"stored\", \"id\": 5693}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 5694,
+        "context": [
+          {
+            "type": "stored",
+            "id": 5695
+          },
+          {
+            "type": "stored",
+            "id": 5696
+          },
+          {
+            "type": "stored",
+            "id": 5697
+          },
+          {
+            "type": "stored",
+            "id": 5698
+          },
+          {
+            "type": "stored",
+            "id": 5699
+          },
+          {
+            "type": "stored",
+            "id": 5700
+          },
+          {
+            "type": "stored",
+            "id": 5701
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 5702,
+            "context": [
+              {
+                "type": "stored",
+                "id": 5703
+              }
+            ]
+          },
+          "step": {
+            "text": "PRAGMA query_only=1",
+            "context": [
+              {
+                "type": "stored",
+                "id": 5704
+              },
+              {
+                "type": "stored",
+                "id": 5705
+              },
+              {
+                "type": "stored",
+                "id": 5706
+              },
+              {
+                "type": "stored",
+                "id": 5707
+              },
+              {
+                "type": "stored",
+                "id": 5708
+              },
+              {
+                "type": "stored",
+                "id": 5709
+              },
+              {
+                "type": "stored",
+                "id": 5710
+              }
+            ]
+          },
+          "n_step": -1104,
+          "goals": [
+            "Mh\nVJlDwkgoQnolyNxlO\nf\nXlSLdUWoJAYpyRytvxcf\nTRUE\nBzW\nWt\nCMFiQ\nnMrCGy\npfLYwg\nidTxvffZutZKsm\nbdDy\nvFPyTd\ndzgPSEAfmwYrE\nqK\nline\naIqUtccKayjWa\n\nr",
+            "\n\nbUIVzrosRH",
+            "wpr\nCYU\nKV\nJNHw\nJjaxcxxE\n\nw"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 5711,
+            "context": [
+              {
+                "type": "stored",
+                "id": 5712
+              },
+              {
+                "type": "stored",
+                "id": 5713
+              },
+              {
+                "type": "stored",
+                "id": 5714
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00eb\ud9fd\udcbf\u0092\u00db",
+            "context": [
+              {
+                "type": "stored",
+                "id": 5715
+              },
+              {
+                "type": "stored",
+                "id": 5716
+              },
+              {
+                "type": "stored",
+                "id": 5717
+              },
+              {
+                "type": "stored",
+                "id": 5718
+              },
+              {
+                "type": "stored",
+                "id": 5719
+              },
+              {
+                "type": "stored",
+                "id": 5720
+              },
+              {
+                "type": "stored",
+                "id": 5721
+              },
+              {
+                "type": "stored",
+                "id": 5722
+              }
+            ]
+          },
+          "n_step": 18471109,
+          "goals": [
+            "SWylFVBRCHirzQRIwJpgN\nHW\nyJ\nOknJ\n\nfUqTLOa",
+            "CJDbiUTjsvJiXm\nG\ndYh\n\nrH",
+            "B\nhbmIIHDE\nnZXmTY\nSEc\n\nMeIOFWge",
+            "XAQ\nqET\nagvEDAu\n\no",
+            "Cxftuv\n\necGerGpa",
+            "XNfS\nNIL\nlI\n\nFerXxZNuuQu",
+            "KAFiT\nLFhnkZVbuKz\nT\nFBdc\ngopsEbOfZcreEjT\ndTvnYSiojj\n\nDgqJYyqDICsedofmT",
+            "FUNCTION\ntGLf\nLEt\nHSZMH\nkBTomf\nU\no\ndDMythu\nOAWs\nJanHN\nZFqWQia\nrepos\nNs\n\ndhCpy"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 5723,
+            "context": [
+              {
+                "type": "stored",
+                "id": 5724
+              },
+              {
+                "type": "stored",
+                "id": 5725
+              }
+            ]
+          },
+          "step": {
+            "text": "@",
+            "context": [
+              {
+                "type": "stored",
+                "id": 5726
+              },
+              {
+                "type": "stored",
+                "id": 5727
+              }
+            ]
+          },
+          "n_step": -4244,
+          "goals": [
+            "\n\neIN",
+            "uX\nHjsOMXdSLnZkucStwvGVV\np\nAIV\nSjmnrJw\nugRNcmtTsc\nbM\n\nMGAQyWhe",
+            "\n\nSpWEXUWYWIfafKcT",
+            "e\nQUw\nwjZjztDeteX\nsUhb\ncBmKYqYwZcmbOMtbixHdMsFuHYx\ng\nU\nhVQNmiAHYW\nxxBUqqZjWEu\ncbLRP\n\nhq",
+            "NqKMKzWOwTtz\nU\n\nOTLMNnHo"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 5728,
+            "context": []
+          },
+          "step": {
+            "text": "\u0000j\ud988\udeaa\b\u00a7\u00a80\u0018\u00ed\u00dc\u00f4\u00d5\u00eb\u00f5\ud857\udc32\udb4b\ude01\u0092",
+            "context": [
+              {
+                "type": "stored",
+                "id": 5729
+              },
+              {
+                "type": "stored",
+                "id": 5730
+              },
+              {
+                "type": "stored",
+                "id": 5731
+              }
+            ]
+          },
+          "n_step": -142817,
+          "goals": []
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
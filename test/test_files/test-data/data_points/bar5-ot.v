@@ -0,0 +1,262 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar5/ot.v\", \"workspace\": \"/coq-dataset/repos/bar5\", \"repository\": \"/coq-dataset/repos/bar5\"}",
+    "{\"type\": \"stored\", \"id\": 5732}",
+    "{\"type\": \"stored\", \"id\": 5733}",
+    "{\"type\": \"stored\", \"id\": 5734}",
+    "{\"type\": \"stored\", \"id\": 5735}",
+    "{\"type\": \"stored\", \"id\": 5736}",
+    "{\"type\": \"stored\", \"id\": 5737}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 5738,
+        "context": []
+      },
+      "steps": []
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 5739,
+        "context": [
+          {
+            "type": "stored",
+            "id": 5740
+          },
+          {
+            "type": "stored",
+            "id": 5741
+          },
+          {
+            "type": "stored",
+            "id": 5742
+          },
+          {
+            "type": "stored",
+            "id": 5743
+          },
+          {
+            "type": "stored",
+            "id": 5744
+          },
+          {
+            "type": "stored",
+            "id": 5745
+          },
+          {
+            "type": "stored",
+            "id": 5746
+          },
+          {
+            "type": "stored",
+            "id": 5747
+          },
+          {
+            "type": "stored",
+            "id": 5748
+          },
+          {
+            "type": "stored",
+            "id": 5749
+          },
+          {
+            "type": "stored",
+            "id": 5750
+          },
+          {
+            "type": "stored",
+            "id": 5751
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 5752,
+            "context": [
+              {
+                "type": "stored",
+                "id": 5753
+              },
+              {
+                "type": "stored",
+                "id": 5754
+              },
+              {
+                "type": "stored",
+                "id": 5755
+              },
+              {
+                "type": "stored",
+                "id": 5756
+              },
+              {
+                "type": "stored",
+                "id": 5757
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 5758
+              },
+              {
+                "type": "stored",
+                "id": 5759
+              }
+            ]
+          },
+          "n_step": 5679,
+          "goals": [
+            "VTtYq\nXxbImNnAYtsFNcgc\nRraQcEmhyVhbaQWzYmDZARn\nqvAp\nht\n\nVshPQ",
+            "nNJoNS\nNkn\ndependencies\nFeJKfFNfTJVbHk\nfabLnrMfMgJfz\nFalse\nIEbkOLSQGhvkXPtsKx\nHPtitc\nT\nNwoHMnzPeiZqT\nmW\nY\nLX\nZf\n\ncsr",
+            "VJ\nD\nINF\nEyzFqs\n\nYePUrxbVF",
+            "bStDp\nxtYpbHZf\nmMrleeiPvHmGJMCHx\nulE\nJhcrqTg\n\nksrfNavnLfn",
+            "\n\nHQGN",
+            "eI\nv\nc\n\nklX",
+            "tbVvmdGK\nOXIMjji\nloDyLtXH\nA\nYUJjtrvJojyHImRjT\nc\nzwYRTJM\ny\nLBjo\nRIsWNO\nZc\n\nRuHcLHhkbQpdIuKzcPPBWPBy",
+            "Tbxfcnkyqbq\n\ns",
+            "hoCUUhM\n\nwNxi",
+            "A\n\nzkHc",
+            "jqiIuReDuDaY\nC\netoy\nAnvfb\nRZtALtclHaY\nS\nfWRkwIMWMQPVWbXXYAZ\nxDjS\nGwj\nHxaGEkaqkoYltWIR\nkm\n\nnone",
+            "git\nQcp\nZ\nJa\n\nXewplbTjWjpWNYAeg",
+            "v\nvluKMlbxYO\nNYeNc\n\nam",
+            "ioQ\nz\nlkCVOIzBlCR\nY\nsVJLTGBZRrf\nrango\n\nwNqU",
+            "K\nM\nXevveroDksWs\nYOOelZzO\nckCqLvGnfzzBegb\nf\n\nNsVEKTQ",
+            "CR\nrLEUJsrP\nhrT\nEyuzMf\nCw\nXaSdS\nBTMNElm\nNKw\nl\nNIL\n\npbX",
+            "v\n\ndEXOO",
+            "m\nLY\ndoyVzs\nDefined\nvyIjSiF\ngpeGEjz\nX\nokyafZQ\n\nFALSE",
+            "sbatch\ncTFn\nfpA\niVyHYz\njUX\naNg\nundefined\ntyY\nLqRM\n\nInf",
+            "zECm\nFQMemdWP\nle\nU\nWjGdzGZYL\neuhNcnPARbcYYJTJmNQqC\nvntaIA\nFTBz\nGuzuCRqTs\nLpGtuPiTdOzwjO\nhdBv\ncQT\nEPkkKzWXr\n\nK",
+            "jjckpqZlxwJFZcPvdDpdab\nLoPSELrr\nogjD\n\nctXhuja",
+            "\n\nj",
+            "VHPRseQ\n\nPeipOcvJL",
+            "vLn\nUmJHfvyyKOjweJBVLQPoyY\nssJ\nVLioFDGm\nWAXh\nolV\ndependencies\nga\ncodellama\npttZJR\nllsdLMpGiqFEUR\n\nFALSE",
+            "Z\nHntvncte\nyw\n\nfBMqmbY",
+            "vb\nn\nnKCb\nxH\nkJd\nkTrzg\nVQuE\n\nTz",
+            "\n\nhits",
+            "\n\ngrCNUWdoGMSgHgcteq",
+            "sl\n\nWA",
+            "kZgFHpL\nFidjYppJvdoFeSDEafmgoB\nNIL\n\nTxC",
+            "ZZBbJF\nadG\nUbp\n\nmyDU",
+            "JUmNQwOhkIxjI\nhCxVvqZkqycJB\n\nbHBq",
+            "\n\nHBd",
+            "TKGKrgGJW\ndyyDHhoVZx\ni\nvPTapYpoMYUPJSuJwJ\nzIH\nML\n\nPXOFmXAxsMNm",
+            "IsdzCAmrCeUOliRghQavaT\nkJ\nIVQxH\n\nUXPp",
+            "r\nE\nLBkax\neK\nZHAcgkwpk\nz\nG\ngS\ndnjv\nim\n\nNone",
+            "nil\nNxql\n\nysor",
+            "rVEuFVhDpZIo\nw\nQbIAyV\nsz\nIfqN\nHO\nePbJaBiqB\nSt\nLHIe\n\nundefined",
+            "wiMYqUhhVfdJkwwZbaRFmZmQzI\ncPEJIgs\npn\nKIFuxhpntsVSq\nBrSWc\nVDZpJgpqpGabCBNFpfBpVFVtfv\nHL\nU\njp\neGUmAdo\njZw\ntrue\npUcJnBylE\nVkXj\nCQ\nK\nGjN\nw\nFnjoumL\n\nQLogIfA"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 5760,
+            "context": [
+              {
+                "type": "stored",
+                "id": 5761
+              },
+              {
+                "type": "stored",
+                "id": 5762
+              },
+              {
+                "type": "stored",
+                "id": 5763
+              },
+              {
+                "type": "stored",
+                "id": 5764
+              },
+              {
+                "type": "stored",
+                "id": 5765
+              },
+              {
+                "type": "stored",
+                "id": 5766
+              },
+              {
+                "type": "stored",
+                "id": 5767
+              },
+              {
+                "type": "stored",
+                "id": 5768
+              },
+              {
+                "type": "stored",
+                "id": 5769
+              }
+            ]
+          },
+          "step": {
+            "text": "\udb2f\udfae1\u00cf\u0096\udbee\udf55\u008f\u0005\ud962\udc55\uda4c\udf39\u00e4\u0081\u0087N\u00e2\u00eat\u0094\u0085",
+            "context": [
+              {
+                "type": "stored",
+                "id": 5770
+              },
+              {
+                "type": "stored",
+                "id": 5771
+              },
+              {
+                "type": "stored",
+                "id": 5772
+              },
+              {
+                "type": "stored",
+                "id": 5773
+              },
+              {
+                "type": "stored",
+                "id": 5774
+              },
+              {
+                "type": "stored",
+                "id": 5775
+              },
+              {
+                "type": "stored",
+                "id": 5776
+              },
+              {
+                "type": "stored",
+                "id": 5777
+              }
+            ]
+          },
+          "n_step": -798607290131,
+          "goals": [
+            "eD\ncynp\nVFk\nPWFtOL\nDKvCQue\nEGkDBFPp\nD\nbZ\n\nVhQOPWVDDkqwmZb",
+            "ehU\nHPspqnvgVT\nZaHC\nwEq\ngLIbcn\njHUohQOGxOdsrNsxgAtOS\ne\nTuB\nWveoD\nHns\na\n\nMPyQCZLHZs",
+            "Dmou\n\nZa",
+            "O\nQNfaK\njbD\nUAKFn\neVG\ncoq\nwSlxmQ\ndDPSEN\nnMMeftsOu\n\nmCQCWm",
+            "lGQjtK\nEWghnEAILy\nP\nsXdpSwWKoj\nHGrKs\novLZ\ne\nC\n\nXQSJKstXOUTULpc",
+            "FALSE\nFL\noFiqAqMhuBjosKKcSB\n\nR",
+            "fHQbK\nx\nj\njqJqp\nOocx\nFalse\nNzJnPrWVSuv\nourkp\nsII\nA\nzhHmwGuPpWF\nja\nrM\nsXTZPjN\nETxxsmfHnfuajMA\nJmDAkWIwvyk\nmJPMEWYw\nJYg\nnD\ny\nFjdr\n\ncTs",
+            "bNVNNXO\nU\nNd\n\nf",
+            "ZYwM\n\nwB",
+            "rPTtAaLef\nj\n\nH",
+            "T\nbQf\ncJdmYgHJJOXosEHFhPBniZHWGSI\nTrue\n\nwFpp",
+            "S\nYcN\n\nqV",
+            "lookups\nBA\nMFKSu\nkJ\nFwtJLSnPw\n\nvYhpcB",
+            "uab\nRIgx\nAHWLsiYFUeYhvKEGZ\nkaD\nwq\n\nfk",
+            "\n\nLVcZIbPlAChJ",
+            "h\n\ne"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
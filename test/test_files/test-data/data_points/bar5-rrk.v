@@ -0,0 +1,8 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar5/rrk.v\", \"workspace\": \"/coq-dataset/repos/bar5\", \"repository\": \"/coq-dataset/repos/bar5\"}",
+    "{\"type\": \"stored\", \"id\": 5578}",
+    "{\"type\": \"stored\", \"id\": 5579}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,91 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar5/vrkzsozqvbx.v\", \"workspace\": \"/coq-dataset/repos/bar5\", \"repository\": \"/coq-dataset/repos/bar5\"}",
+    "{\"type\": \"stored\", \"id\": 5505}",
+    "{\"type\": \"stored\", \"id\": 5506}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 5507,
+        "context": [
+          {
+            "type": "stored",
+            "id": 5508
+          },
+          {
+            "type": "stored",
+            "id": 5509
+          },
+          {
+            "type": "stored",
+            "id": 5510
+          },
+          {
+            "type": "stored",
+            "id": 5511
+          },
+          {
+            "type": "stored",
+            "id": 5512
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 5513,
+            "context": [
+              {
+                "type": "stored",
+                "id": 5514
+              },
+              {
+                "type": "stored",
+                "id": 5515
+              },
+              {
+                "type": "stored",
+                "id": 5516
+              },
+              {
+                "type": "stored",
+                "id": 5517
+              },
+              {
+                "type": "stored",
+                "id": 5518
+              },
+              {
+                "type": "stored",
+                "id": 5519
+              },
+              {
+                "type": "stored",
+                "id": 5520
+              },
+              {
+                "type": "stored",
+                "id": 5521
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": []
+          },
+          "n_step": -1519375,
+          "goals": [
+            "MNdFqu\nhfrnhpE\nFBmnAQHqXrXvzFooeu\nBPSxZsnJFvmrv\nj\nRxZjiV\nTFcHvTRaRJs\nQHsqaBWzmkXBvaoZnUedbb\nFSgaXsFArRYKsCBVMw\nM\n\nwb",
+            "UbNQfrNNLMv\nfoQeQxHo\nHQM\nhQrIJJitemOLwur\nAY\nmraXp\nPaGzJNvyIWBnntg\nmwRFyn\n\nemUQ",
+            "YRZS\nfd\nCNIN\nS\n\nIvRhIWv",
+            "qKQ\nNbOiVzc\nY\now\nwehM\nip\nRpLksCl\nz\nBemfK\nrXIhvtZ\nNM\n\nFB",
+            "NUajwWdnIqYwd\neTbCNPwvsZxXbnmNBHE\nRvEetFLb\navqlCX\nU\nbrXuvVAoXZBowKRcT\n\nd"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
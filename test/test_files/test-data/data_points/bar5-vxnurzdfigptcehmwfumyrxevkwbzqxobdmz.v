@@ -0,0 +1,7 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar5/vxnurzdfigptcehmwfumyrxevkwbzqxobdmz.v\", \"workspace\": \"/coq-dataset/repos/bar5\", \"repository\": \"/coq-dataset/repos/bar5\"}",
+    "{\"type\": \"stored\", \"id\": 5796}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
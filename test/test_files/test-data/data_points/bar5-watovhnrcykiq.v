@@ -0,0 +1,9 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar5/watovhnrcykiq.v\", \"workspace\": \"/coq-dataset/repos/bar5\", \"repository\": \"/coq-dataset/repos/bar5\"}",
+    "{\"type\": \"stored\", \"id\": 5522}",
+    "{\"type\": \"stored\", \"id\": 5523}",
+    "{\"type\": \"stored\", \"id\": 5524}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,10 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar5/wkf.v\", \"workspace\": \"/coq-dataset/repos/bar5\", \"repository\": \"/coq-dataset/repos/bar5\"}",
+    "{\"type\": \"stored\", \"id\": 5778}",
+    "{\"type\": \"stored\", \"id\": 5779}",
+    "{\"type\": \"stored\", \"id\": 5780}",
+    "{\"type\": \"stored\", \"id\": 5781}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,65 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar5/wndmbmyv.v\", \"workspace\": \"/coq-dataset/repos/bar5\", \"repository\": \"/coq-dataset/repos/bar5\"}",
+    "{\"type\": \"stored\", \"id\": 5782}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 5783,
+        "context": [
+          {
+            "type": "stored",
+            "id": 5784
+          },
+          {
+            "type": "stored",
+            "id": 5785
+          },
+          {
+            "type": "stored",
+            "id": 5786
+          },
+          {
+            "type": "stored",
+            "id": 5787
+          },
+          {
+            "type": "stored",
+            "id": 5788
+          },
+          {
+            "type": "stored",
+            "id": 5789
+          },
+          {
+            "type": "stored",
+            "id": 5790
+          },
+          {
+            "type": "stored",
+            "id": 5791
+          },
+          {
+            "type": "stored",
+            "id": 5792
+          },
+          {
+            "type": "stored",
+            "id": 5793
+          },
+          {
+            "type": "stored",
+            "id": 5794
+          },
+          {
+            "type": "stored",
+            "id": 5795
+          }
+        ]
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,13 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar5/wpjggatrmljoimpvvhaxn.v\", \"workspace\": \"/coq-dataset/repos/bar5\", \"repository\": \"/coq-dataset/repos/bar5\"}",
+    "{\"type\": \"stored\", \"id\": 5651}",
+    "{\"type\": \"stored\", \"id\": 5652}",
+    "{\"type\": \"stored\", \"id\": 5653}",
+    "{\"type\": \"stored\", \"id\": 5654}",
+    "{\"type\": \"stored\", \"id\": 5655}",
+    "{\"type\": \"stored\", \"id\": 5656}",
+    "{\"type\": \"stored\", \"id\": 5657}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
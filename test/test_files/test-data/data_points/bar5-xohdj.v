@@ -0,0 +1,330 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar5/xohdj.v\", \"workspace\": \"/coq-dataset/repos/bar5\", \"repository\": \"/coq-dataset/repos/bar5\"}",
+    "{\"type\": \"stored\", \"id\": 5580}",
+    "{\"type\": \"stored\", \"id\": 5581}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 5582,
+        "context": [
+          {
+            "type": "stored",
+            "id": 5583
+          },
+          {
+            "type": "stored",
+            "id": 5584
+          },
+          {
+            "type": "stored",
+            "id": 5585
+          },
+          {
+            "type": "stored",
+            "id": 5586
+          },
+          {
+            "type": "stored",
+            "id": 5587
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 5588,
+            "context": [
+              {
+                "type": "stored",
+                "id": 5589
+              }
+            ]
+          },
+          "step": {
+            "text": "X`\u00bf\u00d1\ud819\udecdi",
+            "context": [
+              {
+                "type": "stored",
+                "id": 5590
+              },
+              {
+                "type": "stored",
+                "id": 5591
+              },
+              {
+                "type": "stored",
+                "id": 5592
+              },
+              {
+                "type": "stored",
+                "id": 5593
+              },
+              {
+                "type": "stored",
+                "id": 5594
+              },
+              {
+                "type": "stored",
+                "id": 5595
+              }
+            ]
+          },
+          "n_step": 1527,
+          "goals": [
+            "slurm\nNacwQwgX\n\nXNXawbAzHeWBUYlAa",
+            "h\niAKY\n\nvtW",
+            "\n\nRe",
+            "TwfTMPjw\nfJjNJtfZc\nLk\nYtotRc\n\nTid"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 5596,
+            "context": [
+              {
+                "type": "stored",
+                "id": 5597
+              },
+              {
+                "type": "stored",
+                "id": 5598
+              }
+            ]
+          },
+          "step": {
+            "text": "\u0005b^",
+            "context": [
+              {
+                "type": "stored",
+                "id": 5599
+              },
+              {
+                "type": "stored",
+                "id": 5600
+              },
+              {
+                "type": "stored",
+                "id": 5601
+              }
+            ]
+          },
+          "n_step": -56171799,
+          "goals": [
+            "\n\nkcOFJQUFKQZ",
+            "lF\nExsGtI\n\nx",
+            "COFIXPOINT\nvdBaTEMdCixSaVt\nOBLIGATION\n\nmodule",
+            "\n\nZ",
+            "A\nTYNZxLAdbxajBK\nnovWQn\nXowera\nBEa\nWgpDoys\nA\nHY\nbunQIPxCwmuze\njW\n\nB"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 5602,
+            "context": [
+              {
+                "type": "stored",
+                "id": 5603
+              },
+              {
+                "type": "stored",
+                "id": 5604
+              },
+              {
+                "type": "stored",
+                "id": 5605
+              },
+              {
+                "type": "stored",
+                "id": 5606
+              },
+              {
+                "type": "stored",
+                "id": 5607
+              },
+              {
+                "type": "stored",
+                "id": 5608
+              },
+              {
+                "type": "stored",
+                "id": 5609
+              },
+              {
+                "type": "stored",
+                "id": 5610
+              },
+              {
+                "type": "stored",
+                "id": 5611
+              },
+              {
+                "type": "stored",
+                "id": 5612
+              },
+              {
+                "type": "stored",
+                "id": 5613
+              },
+              {
+                "type": "stored",
+                "id": 5614
+              },
+              {
+                "type": "stored",
+                "id": 5615
+              },
+              {
+                "type": "stored",
+                "id": 5616
+              }
+            ]
+          },
+          "step": {
+            "text": "\ud835\udc13\ud835\udc21\ud835\udc1e \ud835\udc2a\ud835\udc2e\ud835\udc22\ud835\udc1c\ud835\udc24 \ud835\udc1b\ud835\udc2b\ud835\udc28\ud835\udc30\ud835\udc27 \ud835\udc1f\ud835\udc28\ud835\udc31 \ud835\udc23\ud835\udc2e\ud835\udc26\ud835\udc29\ud835\udc2c \ud835\udc28\ud835\udc2f\ud835\udc1e\ud835\udc2b \ud835\udc2d\ud835\udc21\ud835\udc1e \ud835\udc25\ud835\udc1a\ud835\udc33\ud835\udc32 \ud835\udc1d\ud835\udc28\ud835\udc20",
+            "context": [
+              {
+                "type": "stored",
+                "id": 5617
+              },
+              {
+                "type": "stored",
+                "id": 5618
+              },
+              {
+                "type": "stored",
+                "id": 5619
+              },
+              {
+                "type": "stored",
+                "id": 5620
+              },
+              {
+                "type": "stored",
+                "id": 5621
+              },
+              {
+                "type": "stored",
+                "id": 5622
+              },
+              {
+                "type": "stored",
+                "id": 5623
+              },
+              {
+                "type": "stored",
+                "id": 5624
+              },
+              {
+                "type": "stored",
+                "id": 5625
+              },
+              {
+                "type": "stored",
+                "id": 5626
+              },
+              {
+                "type": "stored",
+                "id": 5627
+              }
+            ]
+          },
+          "n_step": 1865355,
+          "goals": [
+            "LKThGtfR\nNone\nDefined\nGTOs\nD\nNBcLWeFFNNaq\nt\nJUYefbDaHypDJFemqKr\nfGvTjamA\nQwNvn\nvZneZYlMGhHSAeCzrDjhm\n\nz",
+            "eA\n\nlLLYumx",
+            "PWUfpIuN\nKdfkSKLBTP\nIbP\njlXH\nPo\n\neV",
+            "Cx\nr\no\nxIfol\nelse\n\nP",
+            "CLZjwCqjp\nCjyB\n\nVnmvK",
+            "WcfP\nQ\nVPPZyJJqqI\nnn\n\nkIkIzbgTMXQDMiS",
+            "oq\nJjKkY\nNtwl\nryu\nX\njoJfi\nqVSbRzy\nkN\n\nQjKfaQB",
+            "k\netcMFqjQgU\nvkl\nJkwRXLazxeQZSqpvwOsIIfg\n\nsm",
+            "\n\nD",
+            "\n\nUZPjQWN",
+            "jcfkbUWbuTm\n\nzVzUCmBEeR",
+            "zcQNMCHXPvcfw\nebe\nQHPTi\nOF\nZsjzwBAR\nugbYmggFW\nyyEI\nvxBHfSBvN\nAvvLaRTkGER\ncNX\n\narLa",
+            "CNjXXBMNmlpzE\nV\nPPYimgWVgSqvcCdidYtgKs\n\nBCJ",
+            "PE\nkuwMC\nEAak\nSr\nxjaJSh\nvHqjBitPEir\nqvPX\nZqaRffKOCexQrrSal\nEqWJZNSfVsk\nyUi\nmoh\nCLda\nundefined\nbtVGfcQAbCTRVhR\nif\nKxa\n\no",
+            "\n\nYrxji",
+            "S\nfgSxS\nF\nKjEeuzDdv\ntc\nXnBzkZxrpuqjPBJhM\ndERDPtZhQ\nXQh\n\nntYJf",
+            "JrEtiKOHL\nQdMFQZ\naDSk\nyrBVWWBiqWqU\nP\naSBjzWEdzXkG\neRe\ndK\ntgY\nxLQtpYLvTGnTZxN\nwydT\nE\nEjIGMYYmqjUjn\n\njRXcXi",
+            "s\nkbOaJsdFgfUR\n\nePncQ",
+            "tbhN\nIRHP\nvt\nXoz\nb\nPCoLCnZ\n\ndZfx",
+            "vKDoPkVNFiToNqpVBZmCYaywu\nwJVaccwC\nxa\nLeN\n\nyHszfCIiJJt",
+            "\n\nf",
+            "BKwkyCiI\n\nj",
+            "Cxudnb\nV\nEJhhPnjCFCJlDC\ntuRKAjEjgyDtC\nEZAceXFE\nkYtHUWPYtjPCvP\ngdUfMmpxc\n\nCtYijvYB"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 5628,
+            "context": []
+          },
+          "step": {
+            "text": "h",
+            "context": []
+          },
+          "n_step": -12313,
+          "goals": [
+            "rya\ntO\nyaWVZv\nILLgUvTwUgFxj\nNgPC\nbfRYdVrMdr\nAaX\nOIsIMjQduq\nbreadth\ngS\nypT\n\nALSYYLQcAl",
+            "yWu\nnone\ne\nFOTAKheqXA\n\nf",
+            "h\n\ng",
+            "p\n\nxh",
+            "lXIVqMvBwOFgppg\nEB\nj\nyQYsHWVcUIjQhtO\niRUA\ntypes\nJ\nEZeWYCgSFEwOOd\nCHuZFtFi\nFzKWSsL\nLnxkpvXLe\n\nZB",
+            "rango\nCcft\n\nT",
+            "bLrXYQCKNJXHS\nSS\nrp\nLTlKmY\nJL\nfWs\nxD\nTRUE\n\nSjpSrGseAUIKEydLlDUbNjWJmbWs"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 5629,
+            "context": [
+              {
+                "type": "stored",
+                "id": 5630
+              },
+              {
+                "type": "stored",
+                "id": 5631
+              },
+              {
+                "type": "stored",
+                "id": 5632
+              },
+              {
+                "type": "stored",
+                "id": 5633
+              },
+              {
+                "type": "stored",
+                "id": 5634
+              },
+              {
+                "type": "stored",
+                "id": 5635
+              }
+            ]
+          },
+          "step": {
+            "text": " \u0006\u00f9",
+            "context": []
+          },
+          "n_step": 60007,
+          "goals": [
+            "QWltH\nXfgpI\nod\nLl\n\nl",
+            "rBAhVsKdLly\nGtMJAlYXs\nkhIhjVp\nz\nXInDe\nrJHUZErr\n\nnXR",
+            "BpapPWTWSknz\nGRRVsrGENPR\nc\n\nVZHH"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
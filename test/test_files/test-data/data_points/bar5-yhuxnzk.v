@@ -0,0 +1,10 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar5/yhuxnzk.v\", \"workspace\": \"/coq-dataset/repos/bar5\", \"repository\": \"/coq-dataset/repos/bar5\"}",
+    "{\"type\": \"stored\", \"id\": 5525}",
+    "{\"type\": \"stored\", \"id\": 5526}",
+    "{\"type\": \"stored\", \"id\": 5527}",
+    "{\"type\": \"stored\", \"id\": 5528}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,31 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar5/zxj.v\", \"workspace\": \"/coq-dataset/repos/bar5\", \"repository\": \"/coq-dataset/repos/bar5\"}",
+    "{\"type\": \"stored\", \"id\": 5572}",
+    "{\"type\": \"stored\", \"id\": 5573}",
+    "{\"type\": \"stored\", \"id\": 5574}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 5575,
+        "context": []
+      },
+      "steps": []
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 5576,
+        "context": [
+          {
+            "type": "stored",
+            "id": 5577
+          }
+        ]
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,21 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar6/awodmzrf.v\", \"workspace\": \"/coq-dataset/repos/bar6\", \"repository\": \"/coq-dataset/repos/bar6\"}",
+    "{\"type\": \"stored\", \"id\": 6224}",
+    "{\"type\": \"stored\", \"id\": 6225}",
+    "{\"type\": \"stored\", \"id\": 6226}",
+    "{\"type\": \"stored\", \"id\": 6227}",
+    "{\"type\": \"stored\", \"id\": 6228}",
+    "{\"type\": \"stored\", \"id\": 6229}",
+    "{\"type\": \"stored\", \"id\": 6230}",
+    "{\"type\": \"stored\", \"id\": 6231}",
+    "{\"type\": \"stored\", \"id\": 6232}",
+    "{\"type\": \"stored\", \"id\": 6233}",
+    "{\"type\": \"stored\", \"id\": 6234}",
+    "{\"type\": \"stored\", \"id\": 6235}",
+    "{\"type\": \"stored\", \"id\": 6236}",
+    "{\"type\": \"stored\", \"id\": 6237}",
+    "{\"type\": \"stored\", \"id\": 6238}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
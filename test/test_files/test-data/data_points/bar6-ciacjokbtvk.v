@@ -0,0 +1,12 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar6/ciacjokbtvk.v\", \"workspace\": \"/coq-dataset/repos/bar6\", \"repository\": \"/coq-dataset/repos/bar6\"}",
+    "{\"type\": \"stored\", \"id\": 6248}",
+    "{\"type\": \"stored\", \"id\": 6249}",
+    "{\"type\": \"stored\", \"id\": 6250}",
+    "{\"type\": \"stored\", \"id\": 6251}",
+    "{\"type\": \"stored\", \"id\": 6252}",
+    "{\"type\": \"stored\", \"id\": 6253}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,151 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar6/e.v\", \"workspace\": \"/coq-dataset/repos/bar6\", \"repository\": \"/coq-dataset/repos/bar6\"}",
+    "{\"type\": \"stored\", \"id\": 6193}",
+    "{\"type\": \"stored\", \"id\": 6194}",
+    "{\"type\": \"stored\", \"id\": 6195}",
+    "{\"type\": \"stored\", \"id\": 6196}",
+    "{\"type\": \"stored\", \"id\": 6197}",
+    "{\"type\": \"stored\", \"id\": 6198}",
+    "{\"type\": \"stored\", \"id\": 6199}",
+    "{\"type\": \"stored\", \"id\": 6200}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 6201,
+        "context": [
+          {
+            "type": "stored",
+            "id": 6202
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 6203,
+            "context": [
+              {
+                "type": "stored",
+                "id": 6204
+              },
+              {
+                "type": "stored",
+                "id": 6205
+              },
+              {
+                "type": "stored",
+                "id": 6206
+              },
+              {
+                "type": "stored",
+                "id": 6207
+              },
+              {
+                "type": "stored",
+                "id": 6208
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00a5~p\u00a7\udb84\ude72\u00d8w(\u00de\u00cda\u6fd9\u00d1",
+            "context": []
+          },
+          "n_step": -69798,
+          "goals": [
+            "P\nnmw\nGG\nSQCWpDD\nrF\nDKtceG\nQopCc\nUqRSzt\nWJAtlncK\n\nBZvyD",
+            "DvKMVq\nyXGT\nYsshDrsncQLxbFuaRYs\nfVGP\nh\nsHNVqgGnXNeXLy\nau\nxO\nbttcK\n\nvgqeU",
+            "BgcpOKRjA\nSTCgwTwdEafwFlkT\ntmD\nsD\n\nNIL",
+            "Dm\nL\nhxNKVtA\nsExN\nnSUrTNYbWE\nS\nKRFvQuoxAsitPSRL\ns\nr\nNoidJ\nX\nNftoMuNYbdZ\n\npIXPLOJg"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 6209,
+            "context": [
+              {
+                "type": "stored",
+                "id": 6210
+              },
+              {
+                "type": "stored",
+                "id": 6211
+              },
+              {
+                "type": "stored",
+                "id": 6212
+              }
+            ]
+          },
+          "step": {
+            "text": "b\u0096u\u001e",
+            "context": [
+              {
+                "type": "stored",
+                "id": 6213
+              },
+              {
+                "type": "stored",
+                "id": 6214
+              },
+              {
+                "type": "stored",
+                "id": 6215
+              },
+              {
+                "type": "stored",
+                "id": 6216
+              },
+              {
+                "type": "stored",
+                "id": 6217
+              },
+              {
+                "type": "stored",
+                "id": 6218
+              },
+              {
+                "type": "stored",
+                "id": 6219
+              },
+              {
+                "type": "stored",
+                "id": 6220
+              },
+              {
+                "type": "stored",
+                "id": 6221
+              }
+            ]
+          },
+          "n_step": -3719545800111,
+          "goals": [
+            "mvGUYc\njY\nEz\nKlQOO\nxiqA\ngOGlfj\n\npartition",
+            "LadaAD\ntwnvLlqtgNzreqe\n\nQ",
+            "qygKFtBOVx\nDcvDyvzOpw\nrDO\n\ng",
+            "jLouM\n\nq",
+            "bfd\nKYYL\nx\ny\nTdfG\nzoWT\nhK\nKhyRjDRSTKRskudDXE\nHBEM\nId\nP\nkSOPcplcAOlmgikKgjP\ntrue\nsgQIPSPshnakAqqbn\n\nyjyIMy",
+            "jbieRURcgwgEv\ne\nfGS\nBrzIjhybLO\nie\nMGhuN\nMsffZMle\nnIpIHCSwunw\naRbhQfuDOZ\nMpEITHfm\nEwkuux\nqeKmVcV\nNwAZTSaYf\nMlxokjFcKAS\npCcI\n\ni"
+          ]
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 6222,
+        "context": [
+          {
+            "type": "stored",
+            "id": 6223
+          }
+        ]
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,80 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar6/explicit.v\", \"workspace\": \"/coq-dataset/repos/bar6\", \"repository\": \"/coq-dataset/repos/bar6\"}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 6074,
+        "context": [
+          {
+            "type": "stored",
+            "id": 6075
+          },
+          {
+            "type": "stored",
+            "id": 6076
+          },
+          {
+            "type": "stored",
+            "id": 6077
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 6078,
+            "context": [
+              {
+                "type": "stored",
+                "id": 6079
+              }
+            ]
+          },
+          "step": {
+            "text": "\u008b(\u00a5",
+            "context": []
+          },
+          "n_step": 602,
+          "goals": [
+            "PNXrdekWEQiQ\nBdBFY\nbboqd\npDAf\nXQs\ngJypsbvoT\ngrW\nkpz\nZP\n\nSRt",
+            "\n\nJ",
+            "MSa\nb\nFWsXyGUJ\n\ndddBuG",
+            "z\nyWNBQWwZzTJxWQe\n\nYdUIrgulYKvIdeu",
+            "zhxeM\nnlt\nHNIRluqWaNna\nqirfm\nTCUHjnj\nRemark\nJYS\nAVu\nirkJ\nurls\nCxNe\nqXhiBObEMSjmGSwFjlO\nUHWeFOUPVDF\nV\nBafhdT\nWMuGCFNFcrcylnDe\nLikO\nhfb\nZS\nZ\nFHYNO\nKM\n\npkDHcj",
+            "EzbFM\nDchYafcZgq\n\nNRLWB",
+            "Q\nm\nGJirWR\nP\nmyzbbOxRZurEGNUH\nKtwhmAadq\nvaSv\nRoJMtVRUJwoAAO\nPy\n\nsqubRbYOMBogaLxrne",
+            "\n\nlabel",
+            "v\nB\nsyyUMQtMVdbmw\n\nitfbcKG",
+            "\n\nT",
+            "KtrnczPnTjaIRGsONOL\neMA\ngtnz\nSdmOSsbNKGPHwFnNnnsxolThg\nD\nnxOdsoisfIOhLxEU\nEURQYQNrPZrwDrLxctYRzxNZc\nksoPpWYplln\nGwSmkXijJTeS\nrrevN\nyXClM\nAzEayLlpbG\nw\nRxyP\nxEhAmqbiRyjaUVmv\nEHupGmgZBnwK\nhdYpw\niCk\ncontent\n\npwJewwpFpq",
+            "hxQQS\neSU\n\nV",
+            "\n\nZgvhYxWQr",
+            "HNWpQsLQaCx\nnPhg\nPEUcCxxTuKq\nYrq\nMwFwQW\nxEPkyd\nwqpwP\nXYPMJnpbnFQxgK\ny\n\nc",
+            "ZDls\nRbMFPszT\nWFhyLZEDLJrGhpzLsTaXgxtQaPauAYGXIU\nb\nCDyABl\n\nd",
+            "S\nYGjrmamblVteMa\nF\n\nBlXFyJoNjsp",
+            "jMOPUWCyBWG\nMYGBuzDiFLyKydqVU\nkoJtHQGfDjDgvh\n\nlUriiCBATP",
+            "kTFtf\n\nyvZb",
+            "vDyHfe\ngDIxrGTIxa\nwpqGIuLvIjojV\nTdNFOXnq\nuHJfSbHDNePiMOekuVJuJlSlGqtBC\nY\nTsc\n\nrXkLr",
+            "formatters\n\nL",
+            "eRQnMkdTsjpwtHAfAOsaKygfWfyWerljZCjXx\n\nPrxOkfnMmGgn",
+            "\n\nzT",
+            "\n\nBLpWKaetzjmFEi",
+            "\n\nJf",
+            "\n\nSrzrXoT",
+            "nZej\nA\nVW\nOLPTOmKsXCnYT\nw\nf\noCEt\nC\nSi\nQTAAxl\n\nFsddAv",
+            "cache\nzvhUIBjP\ns\neJu\nhGD\nliZLMvHzktqSDPCMbbPNkMHz\nXeBKWY\nDeD\n\nPROPERTY",
+            "IXS\nrCmioKw\nlZej\nQKfmd\njpVCJdvEnyFgIY\nQ\nPKU\nKd\n\nrrRxdygVYuHXWMmjkmFcgXED",
+            "\n\nVTKCYcpUANCEQhEddfiet",
+            "wOJUATBKLSNgx\nxljRtL\nivsSCyK\npe\nFoiKggDGv\nVgCJSboDpzgGjwz\ngwXRGZZqcBOiBhFs\nqALHW\nDofrSH\nZnWrCYWoL\nfgzyQE\nSIGc\nvAhoHdSlZSPzKNv\nlW\nnLd\nHS\n\nmznXr",
+            "NNANVSmJgaMQcLk\nMBQhShDeoK\nPnmaTURI\niV\nrypI\nItwyx\nIakZiDfK\n\nqe",
+            "\n\nYM"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
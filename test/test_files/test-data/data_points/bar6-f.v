@@ -0,0 +1,15 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar6/f.v\", \"workspace\": \"/coq-dataset/repos/bar6\", \"repository\": \"/coq-dataset/repos/bar6\"}",
+    "{\"type\": \"stored\", \"id\": 6105}",
+    "{\"type\": \"stored\", \"id\": 6106}",
+    "{\"type\": \"stored\", \"id\": 6107}",
+    "{\"type\": \"stored\", \"id\": 6108}",
+    "{\"type\": \"stored\", \"id\": 6109}",
+    "{\"type\": \"stored\", \"id\": 6110}",
+    "{\"type\": \"stored\", \"id\": 6111}",
+    "{\"type\": \"stored\", \"id\": 6112}",
+    "{\"type\": \"stored\", \"id\": 6113}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,13 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar6/fzowqeyrgf.v\", \"workspace\": \"/coq-dataset/repos/bar6\", \"repository\": \"/coq-dataset/repos/bar6\"}",
+    "{\"type\": \"stored\", \"id\": 5797}",
+    "{\"type\": \"stored\", \"id\": 5798}",
+    "{\"type\": \"stored\", \"id\": 5799}",
+    "{\"type\": \"stored\", \"id\": 5800}",
+    "{\"type\": \"stored\", \"id\": 5801}",
+    "{\"type\": \"stored\", \"id\": 5802}",
+    "{\"type\": \"stored\", \"id\": 5803}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,161 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar6/lutkcwkz.v\", \"workspace\": \"/coq-dataset/repos/bar6\", \"repository\": \"/coq-dataset/repos/bar6\"}",
+    "{\"type\": \"stored\", \"id\": 6366}",
+    "{\"type\": \"stored\", \"id\": 6367}",
+    "{\"type\": \"stored\", \"id\": 6368}",
+    "{\"type\": \"stored\", \"id\": 6369}",
+    "{\"type\": \"stored\", \"id\": 6370}",
+    "{\"type\": \"stored\", \"id\": 6371}",
+    "{\"type\": \"stored\", \"id\": 6372}",
+    "{\"type\": \"stored\", \"id\": 6373}",
+    "{\"type\": \"stored\", \"id\": 6374}",
+    "{\"type\": \"stored\", \"id\": 6375}",
+    "{\"type\": \"stored\", \"id\": 6376}",
+    "{\"type\": \"stored\", \"id\": 6377}",
+    "{\"type\": \"stored\", \"id\": 6378}",
+    "{\"type\": \"stored\", \"id\": 6379}",
+    "{\"type\": \"stored\", \"id\": 6380}",
+    "{\"type\": \"stored\", \"id\": 6381}",
+    "{\"type\": \"stored\", \"id\": 6382}",
+    "{\"type\": \"stored\", \"id\": 6383}",
+    "{\"type\": \"stored\", \"id\": 6384}",
+    "{\"type\": \"stored\", \"id\": 6385}",
+    "{\"type\": \"stored\", \"id\": 6386}",
+    "{\"type\": \"stored\", \"id\": 6387}",
+    "{\"type\": \"stored\", \"id\": 6388}",
+    "{\"type\": \"stored\", \"id\": 6389}",
+    "{\"type\": \"stored\", \"id\": 6390}",
+    "{\"type\": \"stored\", \"id\": 6391}",
+    "{\"type\": \"stored\", \"id\": 6392}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 6393,
+        "context": [
+          {
+            "type": "stored",
+            "id": 6394
+          },
+          {
+            "type": "stored",
+            "id": 6395
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 6396,
+            "context": [
+              {
+                "type": "stored",
+                "id": 6397
+              },
+              {
+                "type": "stored",
+                "id": 6398
+              },
+              {
+                "type": "stored",
+                "id": 6399
+              },
+              {
+                "type": "stored",
+                "id": 6400
+              },
+              {
+                "type": "stored",
+                "id": 6401
+              },
+              {
+                "type": "stored",
+                "id": 6402
+              },
+              {
+                "type": "stored",
+                "id": 6403
+              },
+              {
+                "type": "stored",
+                "id": 6404
+              },
+              {
+                "type": "stored",
+                "id": 6405
+              },
+              {
+                "type": "stored",
+                "id": 6406
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 6407
+              },
+              {
+                "type": "stored",
+                "id": 6408
+              },
+              {
+                "type": "stored",
+                "id": 6409
+              },
+              {
+                "type": "stored",
+                "id": 6410
+              }
+            ]
+          },
+          "n_step": -101937240,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 6411,
+            "context": [
+              {
+                "type": "stored",
+                "id": 6412
+              },
+              {
+                "type": "stored",
+                "id": 6413
+              },
+              {
+                "type": "stored",
+                "id": 6414
+              },
+              {
+                "type": "stored",
+                "id": 6415
+              },
+              {
+                "type": "stored",
+                "id": 6416
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00c55\u0004\ud96d\udd94\u00d4\u00e8",
+            "context": []
+          },
+          "n_step": -1221878,
+          "goals": [
+            "ejdz\nVlJNdUG\nMdTbF\nZWv\n\nTheorem",
+            "hEwQvCkiRCFD\nyHjWaFlxRVUGfCOUj\nnil\n\nQDRjWzjnkgjDxqTI",
+            "nuYXZIS\n\nJB"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,357 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar6/mqzuvyc.v\", \"workspace\": \"/coq-dataset/repos/bar6\", \"repository\": \"/coq-dataset/repos/bar6\"}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 5806,
+        "context": [
+          {
+            "type": "stored",
+            "id": 5807
+          },
+          {
+            "type": "stored",
+            "id": 5808
+          },
+          {
+            "type": "stored",
+            "id": 5809
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 5810,
+            "context": [
+              {
+                "type": "stored",
+                "id": 5811
+              },
+              {
+                "type": "stored",
+                "id": 5812
+              }
+            ]
+          },
+          "step": {
+            "text": "9\u9e1e\u001f\u0010",
+            "context": [
+              {
+                "type": "stored",
+                "id": 5813
+              },
+              {
+                "type": "stored",
+                "id": 5814
+              },
+              {
+                "type": "stored",
+                "id": 5815
+              },
+              {
+                "type": "stored",
+                "id": 5816
+              },
+              {
+                "type": "stored",
+                "id": 5817
+              },
+              {
+                "type": "stored",
+                "id": 5818
+              },
+              {
+                "type": "stored",
+                "id": 5819
+              },
+              {
+                "type": "stored",
+                "id": 5820
+              },
+              {
+                "type": "stored",
+                "id": 5821
+              },
+              {
+                "type": "stored",
+                "id": 5822
+              }
+            ]
+          },
+          "n_step": -30935,
+          "goals": [
+            "\n\nRT",
+            "SjtAnEmEKagmoUgmvtLUDbl\ngISyYlQW\nI\nFAL\n\nUVTyw",
+            "nkSC\nlrjCUV\nNtX\nfNcO\nbQOQ\nheTmmr\nsdLXS\nZxrt\nD\nJvBb\njAmM\n\nVbl",
+            "uEeoIyY\nKUg\nWPObtCk\nlQAH\nYlQhCv\nrivoloqU\nK\nGxvM\nr\nw\na\nKz\ngB\nmGs\nJ\nNI\nR\nJV\nkWLBJp\nIhEPlMBEGUew\nmisses\n\nGoCiujygPS",
+            "oxPU\nzpfITgS\nFObew\nYGz\nIVx\nhzzLSmCU\nelse\nU\ntlfYRA\nr\nV\n\nD",
+            "EjiuHd\nMaXQzm\n\nNIM",
+            "ryBXTSB\nngSCGy\ndLl\n\nRyZ",
+            "vD\nGuFLrKPbLExiIhLAADRC\nBFq\nUnkDDX\nUhkRw\ngSrtYqxqFVBswahVSWO\neZl\nNsZn\n\nI",
+            "tfXdAwdbPENU\nmup\nyQNrvkIlzu\nKGatuc\nvsEoohJkIhWeGEByMLPd\nioZ\nN\nL\nBg\nLianFJfyZ\njU\nkKeMDsFhmfPFWzmsBlgBMn\ncqYpSXrqJynpU\np\nH\n\nbcl",
+            "ZSeobS\nXvZccpUb\n\nL",
+            "Xm\nJraRZqLrxtJpbShkmcKVS\nEfyfwzmmT\n\nXcGgHoNbSLkNNO",
+            "NqVlgq\nCCsNGo\nJkJvKT\nl\nyJEhn\n\ngTR"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 5823,
+            "context": [
+              {
+                "type": "stored",
+                "id": 5824
+              }
+            ]
+          },
+          "step": {
+            "text": "\ud907\udf83",
+            "context": [
+              {
+                "type": "stored",
+                "id": 5825
+              },
+              {
+                "type": "stored",
+                "id": 5826
+              },
+              {
+                "type": "stored",
+                "id": 5827
+              },
+              {
+                "type": "stored",
+                "id": 5828
+              },
+              {
+                "type": "stored",
+                "id": 5829
+              },
+              {
+                "type": "stored",
+                "id": 5830
+              }
+            ]
+          },
+          "n_step": 500,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 5831,
+            "context": [
+              {
+                "type": "stored",
+                "id": 5832
+              },
+              {
+                "type": "stored",
+                "id": 5833
+              },
+              {
+                "type": "stored",
+                "id": 5834
+              },
+              {
+                "type": "stored",
+                "id": 5835
+              }
+            ]
+          },
+          "step": {
+            "text": ":\u009d\u007fJ\u00e0",
+            "context": [
+              {
+                "type": "stored",
+                "id": 5836
+              },
+              {
+                "type": "stored",
+                "id": 5837
+              },
+              {
+                "type": "stored",
+                "id": 5838
+              },
+              {
+                "type": "stored",
+                "id": 5839
+              },
+              {
+                "type": "stored",
+                "id": 5840
+              }
+            ]
+          },
+          "n_step": 643,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 5841,
+            "context": [
+              {
+                "type": "stored",
+                "id": 5842
+              },
+              {
+                "type": "stored",
+                "id": 5843
+              },
+              {
+                "type": "stored",
+                "id": 5844
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 5845
+              },
+              {
+                "type": "stored",
+                "id": 5846
+              },
+              {
+                "type": "stored",
+                "id": 5847
+              },
+              {
+                "type": "stored",
+                "id": 5848
+              }
+            ]
+          },
+          "n_step": -51295134853333056,
+          "goals": [
+            "FIXPOINT\n\ngv",
+            "MfsQ\nWBNADTVn\nTiuyVeLyO\nAokZBe\nxyEH\n\nrlws",
+            "VC\n\nuvRlTEmjf",
+            "dw\ncAp\nzlBHk\nXugmcZjGwMdxGf\noMxd\n\nlRU",
+            "PUGkjEuGXWVIDvQ\nQWFzXYIzlLP\nNpMtvqLuCiUcoHZmrCJfxSxaCuDQwbwKTSaKa\n\ngplwOUHAz",
+            "cfUWNhkSXRG\n\nNBxVxdxFk"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 5849,
+            "context": [
+              {
+                "type": "stored",
+                "id": 5850
+              },
+              {
+                "type": "stored",
+                "id": 5851
+              },
+              {
+                "type": "stored",
+                "id": 5852
+              },
+              {
+                "type": "stored",
+                "id": 5853
+              },
+              {
+                "type": "stored",
+                "id": 5854
+              },
+              {
+                "type": "stored",
+                "id": 5855
+              },
+              {
+                "type": "stored",
+                "id": 5856
+              },
+              {
+                "type": "stored",
+                "id": 5857
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 5858
+              },
+              {
+                "type": "stored",
+                "id": 5859
+              },
+              {
+                "type": "stored",
+                "id": 5860
+              },
+              {
+                "type": "stored",
+                "id": 5861
+              },
+              {
+                "type": "stored",
+                "id": 5862
+              },
+              {
+                "type": "stored",
+                "id": 5863
+              },
+              {
+                "type": "stored",
+                "id": 5864
+              },
+              {
+                "type": "stored",
+                "id": 5865
+              },
+              {
+                "type": "stored",
+                "id": 5866
+              },
+              {
+                "type": "stored",
+                "id": 5867
+              },
+              {
+                "type": "stored",
+                "id": 5868
+              },
+              {
+                "type": "stored",
+                "id": 5869
+              },
+              {
+                "type": "stored",
+                "id": 5870
+              },
+              {
+                "type": "stored",
+                "id": 5871
+              }
+            ]
+          },
+          "n_step": -1535509965166,
+          "goals": [
+            "CK\nVkHWCkgTmh\ntgOuE\ncutoff\nivwh\n\nBFY",
+            "PJYkMg\nNULL\nZ\nbK\nDLSI\nzoZPeszdJaXTIWd\nN\nirOscRUUWeJfG\nCbp\nUoBPL\nresult\nGAik\nO\n\nDEOGU",
+            "\n\nxPunPP",
+            "pNgwXlLO\nzN\nPQnkHBnDJFuORNWxorrJJROGuc\nnStodoNFIhurVbLwskLDSSA\ns\n\noJYHP"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
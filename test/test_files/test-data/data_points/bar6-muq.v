@@ -0,0 +1,214 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar6/muq.v\", \"workspace\": \"/coq-dataset/repos/bar6\", \"repository\": \"/coq-dataset/repos/bar6\"}",
+    "{\"type\": \"stored\", \"id\": 5953}",
+    "{\"type\": \"stored\", \"id\": 5954}",
+    "{\"type\": \"stored\", \"id\": 5955}",
+    "{\"type\": \"stored\", \"id\": 5956}",
+    "{\"type\": \"stored\", \"id\": 5957}",
+    "{\"type\": \"stored\", \"id\": 5958}",
+    "{\"type\": \"stored\", \"id\": 5959}",
+    "{\"type\": \"stored\", \"id\": 5960}",
+    "{\"type\": \"stored\", \"id\": 5961}",
+    "{\"type\": \"stored\", \"id\": 5962}",
+    "{\"type\": \"stored\", \"id\": 5963}",
+    "{\"type\": \"stored\", \"id\": 5964}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 5965,
+        "context": [
+          {
+            "type": "stored",
+            "id": 5966
+          },
+          {
+            "type": "stored",
+            "id": 5967
+          },
+          {
+            "type": "stored",
+            "id": 5968
+          },
+          {
+            "type": "stored",
+            "id": 5969
+          },
+          {
+            "type": "stored",
+            "id": 5970
+          },
+          {
+            "type": "stored",
+            "id": 5971
+          }
+        ]
+      },
+      "steps": []
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 5972,
+        "context": [
+          {
+            "type": "stored",
+            "id": 5973
+          },
+          {
+            "type": "stored",
+            "id": 5974
+          },
+          {
+            "type": "stored",
+            "id": 5975
+          },
+          {
+            "type": "stored",
+            "id": 5976
+          },
+          {
+            "type": "stored",
+            "id": 5977
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 5978,
+            "context": [
+              {
+                "type": "stored",
+                "id": 5979
+              },
+              {
+                "type": "stored",
+                "id": 5980
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00a6",
+            "context": [
+              {
+                "type": "stored",
+                "id": 5981
+              },
+              {
+                "type": "stored",
+                "id": 5982
+              }
+            ]
+          },
+          "n_step": 13394091,
+          "goals": [
+            "LboAukKkcw\nfpbBpdJOCfKPfpMjEzjxErPEaUkyDyYNarwK\nblihcb\nxjnBvUzDspZ\nW\nMzB\ngit\n\nalDarty",
+            "mFjghaQn\nnone\nONQjs\n\nBZbVavmDBLB"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 5983,
+            "context": []
+          },
+          "step": {
+            "text": "\udbc2\udf23\u00db",
+            "context": [
+              {
+                "type": "stored",
+                "id": 5984
+              }
+            ]
+          },
+          "n_step": -14105358867126951876185030656,
+          "goals": [
+            "fVSYMffnAj\n\nxCREcxd",
+            "TZXEJQpCx\nrZm\nK\nzaEYdBCoT\nD\nxZC\nY\n\nfalse"
+          ]
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 5985,
+        "context": [
+          {
+            "type": "stored",
+            "id": 5986
+          },
+          {
+            "type": "stored",
+            "id": 5987
+          },
+          {
+            "type": "stored",
+            "id": 5988
+          },
+          {
+            "type": "stored",
+            "id": 5989
+          },
+          {
+            "type": "stored",
+            "id": 5990
+          },
+          {
+            "type": "stored",
+            "id": 5991
+          },
+          {
+            "type": "stored",
+            "id": 5992
+          },
+          {
+            "type": "stored",
+            "id": 5993
+          },
+          {
+            "type": "stored",
+            "id": 5994
+          },
+          {
+            "type": "stored",
+            "id": 5995
+          },
+          {
+            "type": "stored",
+            "id": 5996
+          },
+          {
+            "type": "stored",
+            "id": 5997
+          },
+          {
+            "type": "stored",
+            "id": 5998
+          },
+          {
+            "type": "stored",
+            "id": 5999
+          },
+          {
+            "type": "stored",
+            "id": 6000
+          },
+          {
+            "type": "stored",
+            "id": 6001
+          },
+          {
+            "type": "stored",
+            "id": 6002
+          }
+        ]
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
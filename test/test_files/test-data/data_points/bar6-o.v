@@ -0,0 +1,8 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar6/o.v\", \"workspace\": \"/coq-dataset/repos/bar6\", \"repository\": \"/coq-dataset/repos/bar6\"}",
+    "{\"type\": \"stored\", \"id\": 5804}",
+    "{\"type\": \"stored\", \"id\": 5805}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,358 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar6/ros.v\", \"workspace\": \"/coq-dataset/repos/bar6\", \"repository\": \"/coq-dataset/repos/bar6\"}",
+    "{\"type\": \"stored\", \"id\": 6254}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 6255,
+        "context": [
+          {
+            "type": "stored",
+            "id": 6256
+          },
+          {
+            "type": "stored",
+            "id": 6257
+          },
+          {
+            "type": "stored",
+            "id": 6258
+          },
+          {
+            "type": "stored",
+            "id": 6259
+          },
+          {
+            "type": "stored",
+            "id": 6260
+          },
+          {
+            "type": "stored",
+            "id": 6261
+          },
+          {
+            "type": "stored",
+            "id": 6262
+          },
+          {
+            "type": "stored",
+            "id": 6263
+          },
+          {
+            "type": "stored",
+            "id": 6264
+          },
+          {
+            "type": "stored",
+            "id": 6265
+          },
+          {
+            "type": "stored",
+            "id": 6266
+          },
+          {
+            "type": "stored",
+            "id": 6267
+          },
+          {
+            "type": "stored",
+            "id": 6268
+          },
+          {
+            "type": "stored",
+            "id": 6269
+          },
+          {
+            "type": "stored",
+            "id": 6270
+          },
+          {
+            "type": "stored",
+            "id": 6271
+          },
+          {
+            "type": "stored",
+            "id": 6272
+          },
+          {
+            "type": "stored",
+            "id": 6273
+          },
+          {
+            "type": "stored",
+            "id": 6274
+          },
+          {
+            "type": "stored",
+            "id": 6275
+          },
+          {
+            "type": "stored",
+            "id": 6276
+          },
+          {
+            "type": "stored",
+            "id": 6277
+          },
+          {
+            "type": "stored",
+            "id": 6278
+          },
+          {
+            "type": "stored",
+            "id": 6279
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 6280,
+            "context": [
+              {
+                "type": "stored",
+                "id": 6281
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 6282
+              },
+              {
+                "type": "stored",
+                "id": 6283
+              },
+              {
+                "type": "stored",
+                "id": 6284
+              },
+              {
+                "type": "stored",
+                "id": 6285
+              },
+              {
+                "type": "stored",
+                "id": 6286
+              },
+              {
+                "type": "stored",
+                "id": 6287
+              },
+              {
+                "type": "stored",
+                "id": 6288
+              }
+            ]
+          },
+          "n_step": -627695,
+          "goals": [
+            "WCY\nj\n\nFgazqOutZYEWUrdcC",
+            "XGmfk\npHHn\nFaplbauGl\nwVA\nTBaWwnJVMfwPVtnIAh\nE\ntarget\nTXp\nKMvFWzj\n\nImTODZxNkxiKpY",
+            "Th\neqzwOdDxPGiNb\nUEON\nJEyv\nufDOEh\nyXK\nrSZuRkGblq\nO\nQPVHWCjbK\nemI\n\nGGwQjWiczZ",
+            "RClXyfKPO\nLiZXVbaV\nbAclhtNDjYoqv\nEsNQ\nW\nbDP\nbj\nZTEJFxtBcqyGBtR\n\niX",
+            "Pxmv\nhvj\nQhp\nZwNODB\n\nBTLb",
+            "Bh\nacBbkYR\nRjYyMnEK\nb\nBt\njdtHalbK\nNKzprnHB\nhSi\nrUHJdKpyuQ\nVkSFRhmCmE\nLaErzv\npybFMx\n\nRLm",
+            "\n\nQ",
+            "l\nHUm\nRSQo\nGdk\n\nundefined",
+            "yjoxkPWzW\ns\n\nfXxmm",
+            "C\nT\ny\nX\ngiLu\nVNrJJFWJJxanb\nEyxfEhIAjgVcTpc\nLR\n\nkhpa",
+            "\n\naZ",
+            "zxV\ncbfbgkzCwxCl\nkSE\nJkKB\nZxGmBMsYUG\nLRtH\nrETDNA\nT\n\nJtnjYn",
+            "rA\nxIuBxvqNLfNqThsqWlSQpp\nrE\nuSKKtE\nvbLBrwyfMr\nuTI\nPYOM\nMHRQL\ndF\nGQXMjCPi\ngYglQXtUE\noCI\n\nu",
+            "tWQeMqqk\nI\n\nTvm",
+            "False\n\nANGGfsnVDWTkULlQOJk"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 6289,
+            "context": [
+              {
+                "type": "stored",
+                "id": 6290
+              },
+              {
+                "type": "stored",
+                "id": 6291
+              }
+            ]
+          },
+          "step": {
+            "text": "\u0087",
+            "context": [
+              {
+                "type": "stored",
+                "id": 6292
+              }
+            ]
+          },
+          "n_step": 734112540,
+          "goals": [
+            "qrl\nEG\nMnlomZrPpSVc\nkqWFUMbzhvTProY\nU\nX\nMBfjkJDLImTiztHRpqZyUCTewSYzlrFKH\nKK\nNXTU\nnF\nK\n\nBqcn",
+            "kt\nLDqkjuNfHiT\n\nJ",
+            "\n\ngJEqvYxDV",
+            "CeckLg\nEwuJITGVqAhWpGF\nIgo\nqnaPEhpGdFZfxvJJjNadm\nUGFJ\n\nGZvmSaodNUoeb",
+            "\n\nhzqIvC",
+            "\n\nKtKAF"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 6293,
+            "context": [
+              {
+                "type": "stored",
+                "id": 6294
+              },
+              {
+                "type": "stored",
+                "id": 6295
+              },
+              {
+                "type": "stored",
+                "id": 6296
+              },
+              {
+                "type": "stored",
+                "id": 6297
+              },
+              {
+                "type": "stored",
+                "id": 6298
+              },
+              {
+                "type": "stored",
+                "id": 6299
+              },
+              {
+                "type": "stored",
+                "id": 6300
+              },
+              {
+                "type": "stored",
+                "id": 6301
+              },
+              {
+                "type": "stored",
+                "id": 6302
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 6303
+              },
+              {
+                "type": "stored",
+                "id": 6304
+              },
+              {
+                "type": "stored",
+                "id": 6305
+              },
+              {
+                "type": "stored",
+                "id": 6306
+              }
+            ]
+          },
+          "n_step": -143,
+          "goals": [
+            "MfhcBiozofbQgokw\ncpTDTQQ\n\neV",
+            "gPEf\nYw\nfz\n\nh",
+            "YGnoUGraUTf\nXP\nxt\npKsS\n\nuE",
+            "\n\nBuyrhj"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 6307,
+            "context": [
+              {
+                "type": "stored",
+                "id": 6308
+              },
+              {
+                "type": "stored",
+                "id": 6309
+              },
+              {
+                "type": "stored",
+                "id": 6310
+              },
+              {
+                "type": "stored",
+                "id": 6311
+              },
+              {
+                "type": "stored",
+                "id": 6312
+              },
+              {
+                "type": "stored",
+                "id": 6313
+              },
+              {
+                "type": "stored",
+                "id": 6314
+              },
+              {
+                "type": "stored",
+                "id": 6315
+              }
+            ]
+          },
+          "step": {
+            "text": "@",
+            "context": [
+              {
+                "type": "stored",
+                "id": 6316
+              },
+              {
+                "type": "stored",
+                "id": 6317
+              },
+              {
+                "type": "stored",
+                "id": 6318
+              },
+              {
+                "type": "stored",
+                "id": 6319
+              },
+              {
+                "type": "stored",
+                "id": 6320
+              },
+              {
+                "type": "stored",
+                "id": 6321
+              },
+              {
+                "type": "stored",
+                "id": 6322
+              }
+            ]
+          },
+          "n_step": -8934126,
+          "goals": []
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,105 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar6/rrjjtrapbtrz.v\", \"workspace\": \"/coq-dataset/repos/bar6\", \"repository\": \"/coq-dataset/repos/bar6\"}",
+    "{\"type\": \"stored\", \"id\": 6080}",
+    "{\"type\": \"stored\", \"id\": 6081}",
+    "{\"type\": \"stored\", \"id\": 6082}",
+    "{\"type\": \"stored\", \"id\": 6083}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 6084,
+        "context": [
+          {
+            "type": "stored",
+            "id": 6085
+          },
+          {
+            "type": "stored",
+            "id": 6086
+          },
+          {
+            "type": "stored",
+            "id": 6087
+          },
+          {
+            "type": "stored",
+            "id": 6088
+          },
+          {
+            "type": "stored",
+            "id": 6089
+          },
+          {
+            "type": "stored",
+            "id": 6090
+          },
+          {
+            "type": "stored",
+            "id": 6091
+          },
+          {
+            "type": "stored",
+            "id": 6092
+          },
+          {
+            "type": "stored",
+            "id": 6093
+          },
+          {
+            "type": "stored",
+            "id": 6094
+          },
+          {
+            "type": "stored",
+            "id": 6095
+          }
+        ]
+      },
+      "steps": []
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 6096,
+        "context": []
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 6097,
+            "context": [
+              {
+                "type": "stored",
+                "id": 6098
+              },
+              {
+                "type": "stored",
+                "id": 6099
+              }
+            ]
+          },
+          "step": {
+            "text": "\udb07\ude98\u0099\ud9da\ude15",
+            "context": []
+          },
+          "n_step": 8099046082,
+          "goals": [
+            "Inf\n\nzxt",
+            "Oqoc\nfFl\nZnFpw\nPpBnf\nK\njNN\nlqu\nc\nIsS\ndw\nFowBTegsTyy\ntrue\nkOIRAWXcxaj\nJbgnhEmOVQhAjg\n\nN",
+            "\n\nLfDPd",
+            "BOZXGX\nwPb\nV\nZPcOuaDUbAqUN\n\ngqLycFzmH",
+            "ZovgSaTKw\n\nxqM",
+            "dyGCJkYmJ\n\ncZCmgO",
+            "J\n\ngEjBdRgZmvO",
+            "NG\n\nPheQbC",
+            "nl\nKJXdrOy\nuBnuTz\n\nGVEIxi"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,337 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar6/taaasso.v\", \"workspace\": \"/coq-dataset/repos/bar6\", \"repository\": \"/coq-dataset/repos/bar6\"}",
+    "{\"type\": \"stored\", \"id\": 5883}",
+    "{\"type\": \"stored\", \"id\": 5884}",
+    "{\"type\": \"stored\", \"id\": 5885}",
+    "{\"type\": \"stored\", \"id\": 5886}",
+    "{\"type\": \"stored\", \"id\": 5887}",
+    "{\"type\": \"stored\", \"id\": 5888}",
+    "{\"type\": \"stored\", \"id\": 5889}",
+    "{\"type\": \"stored\", \"id\": 5890}",
+    "{\"type\": \"stored\", \"id\": 5891}",
+    "{\"type\": \"stored\", \"id\": 5892}",
+    "{\"type\": \"stored\", \"id\": 5893}",
+    "{\"type\": \"stored\", \"id\": 5894}",
+    "{\"type\": \"stored\", \"id\": 5895}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 5896,
+        "context": [
+          {
+            "type": "stored",
+            "id": 5897
+          },
+          {
+            "type": "stored",
+            "id": 5898
+          },
+          {
+            "type": "stored",
+            "id": 5899
+          },
+          {
+            "type": "stored",
+            "id": 5900
+          },
+          {
+            "type": "stored",
+            "id": 5901
+          },
+          {
+            "type": "stored",
+            "id": 5902
+          },
+          {
+            "type": "stored",
+            "id": 5903
+          },
+          {
+            "type": "stored",
+            "id": 5904
+          },
+          {
+            "type": "stored",
+            "id": 5905
+          },
+          {
+            "type": "stored",
+            "id": 5906
+          },
+          {
+            "type": "stored",
+            "id": 5907
+          },
+          {
+            "type": "stored",
+            "id": 5908
+          },
+          {
+            "type": "stored",
+            "id": 5909
+          },
+          {
+            "type": "stored",
+            "id": 5910
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 5911,
+            "context": [
+              {
+                "type": "stored",
+                "id": 5912
+              },
+              {
+                "type": "stored",
+                "id": 5913
+              },
+              {
+                "type": "stored",
+                "id": 5914
+              },
+              {
+                "type": "stored",
+                "id": 5915
+              },
+              {
+                "type": "stored",
+                "id": 5916
+              },
+              {
+                "type": "stored",
+                "id": 5917
+              },
+              {
+                "type": "stored",
+                "id": 5918
+              },
+              {
+                "type": "stored",
+                "id": 5919
+              },
+              {
+                "type": "stored",
+                "id": 5920
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00afn\u00dd\u0093\u00ea\r\ud882\udcd6",
+            "context": [
+              {
+                "type": "stored",
+                "id": 5921
+              },
+              {
+                "type": "stored",
+                "id": 5922
+              }
+            ]
+          },
+          "n_step": -8796093022209,
+          "goals": [
+            "costs\nIxt\nsMELaiMK\npg\nnZRcn\nflYRglpeYDc\nuLMnncTbILrTj\nlYSrW\nspVUtk\nT\nklDNcsHt\nckZd\nKzIx\nHzNQf\nfalse\n\nmqlPNXKKJioyGrCT"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 5923,
+            "context": [
+              {
+                "type": "stored",
+                "id": 5924
+              },
+              {
+                "type": "stored",
+                "id": 5925
+              }
+            ]
+          },
+          "step": {
+            "text": "\uda86\udc1e\u00f1\u0097\ud9de\udf73\u0016",
+            "context": [
+              {
+                "type": "stored",
+                "id": 5926
+              }
+            ]
+          },
+          "n_step": -164722,
+          "goals": [
+            "\n\nQzroUHWKIq"
+          ]
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 5927,
+        "context": [
+          {
+            "type": "stored",
+            "id": 5928
+          },
+          {
+            "type": "stored",
+            "id": 5929
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 5930,
+            "context": [
+              {
+                "type": "stored",
+                "id": 5931
+              },
+              {
+                "type": "stored",
+                "id": 5932
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 5933
+              },
+              {
+                "type": "stored",
+                "id": 5934
+              },
+              {
+                "type": "stored",
+                "id": 5935
+              },
+              {
+                "type": "stored",
+                "id": 5936
+              },
+              {
+                "type": "stored",
+                "id": 5937
+              },
+              {
+                "type": "stored",
+                "id": 5938
+              },
+              {
+                "type": "stored",
+                "id": 5939
+              }
+            ]
+          },
+          "n_step": -635320,
+          "goals": [
+            "\n\nWwaUepPbU",
+            "kwGxeS\ncUAMF\nPIgFOFUinxzYIXeMF\nOBg\nTppD\nNmPZNW\nGpxKbyivluONFX\nsDu\nG\n\nC",
+            "rEPBvY\nrjx\nNUL\nfile\nAv\nFUNCTION\nJZ\ndDSxIqqf\nlqnZmBCKwEN\nut\nUcvmFHHx\nKktj\nAWRutfEk\n\nMiblHa",
+            "dD\ntactic\nkttT\nCLXWLCP\nXSyXZiaTQRzAMJIenMYGpfbe\nQMSikmUj\njFocsS\npTDcAIO\nIbQ\ne\ncxl\ntarget\nfe\nHaIf\nNdNRula\nMMYHxHXIFXaQvHg\nmisses\nLepiX\nXBN\n\nOFAhHpuTIQETLyA",
+            "fj\n\nhyB"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 5940,
+            "context": []
+          },
+          "step": {
+            "text": "&;_\nC0\udb37\udff6\u00a7u\u001cU\udbb9\udcaa",
+            "context": [
+              {
+                "type": "stored",
+                "id": 5941
+              },
+              {
+                "type": "stored",
+                "id": 5942
+              },
+              {
+                "type": "stored",
+                "id": 5943
+              },
+              {
+                "type": "stored",
+                "id": 5944
+              },
+              {
+                "type": "stored",
+                "id": 5945
+              },
+              {
+                "type": "stored",
+                "id": 5946
+              },
+              {
+                "type": "stored",
+                "id": 5947
+              }
+            ]
+          },
+          "n_step": 14669193531100555683580346368,
+          "goals": [
+            "DPbu\nfsWTuUjrykCXfMxBuVvlYbm\nerUMZdqtrydSGJqE\nundefined\nf\nk\nZZlHAPetwyXhWxYFz\nxGnFmxSn\njQcEWUtMpC\ntFJIk\nmJiZ\nPI\nzaJcYlkYaeyG\nSc\nloeo\nW\nTycb\nfiam\nCcgzfG\nySc\nmdSp\nhlgoznIyhKEdsTvPv\nXjvkKTK\nInf\ntKfd\njAHUZ\nuPqyyLDG\nmj\nrepos\neWeMmxR\n\nKos",
+            "DHay\nSwzseG\nRd\nE\n\nLp",
+            "rEd\n\nYPzN"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 5948,
+            "context": [
+              {
+                "type": "stored",
+                "id": 5949
+              },
+              {
+                "type": "stored",
+                "id": 5950
+              }
+            ]
+          },
+          "step": {
+            "text": "#\u00c9n\u008f\ud84a\udfb5}\udb71\udd60",
+            "context": [
+              {
+                "type": "stored",
+                "id": 5951
+              },
+              {
+                "type": "stored",
+                "id": 5952
+              }
+            ]
+          },
+          "n_step": 10994,
+          "goals": [
+            "PS\nEq\nQqNmvsYMtQ\nkHfLyUspUmd\no\nBel\nInf\nPdsSWycxi\nUspouoDV\nl\nzeijlxZ\nOoxe\n\nYehT",
+            "R\nNAkg\nyRrBVLMSfDCkdELOMZulFAmMvco\ngcBVNkM\ndlnY\n\na",
+            "Zh\nPXcsOSE\n\nsQbUBC",
+            "H\nMyGY\nFbwV\n\nJOFeVDSiytz",
+            "lRjR\nc\nGstLOl\ndHUht\nXQu\nqfJlnnoI\n\nwXtF",
+            "S\noCmk\nOlKydycAAQ\nWqAL\nrcHRbemKsbZAF\n\nv",
+            "\n\nm",
+            "N\nJosM\nSSEImUdLAOYaRABTbUV\nqYEvgXS\nsfdAUQ\nWARNING\nRzFxOmEdx\nCSKqmH\nN\noBHzlWsEacLbnl\nNIL\nYgzmy\nIUlSiJj\nDrYgWOiIyTEzSi\n\npabzc"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
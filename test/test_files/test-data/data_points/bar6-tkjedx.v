@@ -0,0 +1,8 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar6/tkjedx.v\", \"workspace\": \"/coq-dataset/repos/bar6\", \"repository\": \"/coq-dataset/repos/bar6\"}",
+    "{\"type\": \"stored\", \"id\": 5872}",
+    "{\"type\": \"stored\", \"id\": 5873}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,42 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar6/tpdgzwp.v\", \"workspace\": \"/coq-dataset/repos/bar6\", \"repository\": \"/coq-dataset/repos/bar6\"}",
+    "{\"type\": \"stored\", \"id\": 6239}",
+    "{\"type\": \"stored\", \"id\": 6240}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 6241,
+        "context": [
+          {
+            "type": "stored",
+            "id": 6242
+          },
+          {
+            "type": "stored",
+            "id": 6243
+          },
+          {
+            "type": "stored",
+            "id": 6244
+          },
+          {
+            "type": "stored",
+            "id": 6245
+          },
+          {
+            "type": "stored",
+            "id": 6246
+          },
+          {
+            "type": "stored",
+            "id": 6247
+          }
+        ]
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,208 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar6/vvtnjmdonqdocfjfsxupnw.v\", \"workspace\": \"/coq-dataset/repos/bar6\", \"repository\": \"/coq-dataset/repos/bar6\"}",
+    "{\"type\": \"stored\", \"id\": 6114}",
+    "{\"type\": \"stored\", \"id\": 6115}",
+    "{\"type\": \"stored\", \"id\": 6116}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 6117,
+        "context": [
+          {
+            "type": "stored",
+            "id": 6118
+          },
+          {
+            "type": "stored",
+            "id": 6119
+          },
+          {
+            "type": "stored",
+            "id": 6120
+          },
+          {
+            "type": "stored",
+            "id": 6121
+          },
+          {
+            "type": "stored",
+            "id": 6122
+          },
+          {
+            "type": "stored",
+            "id": 6123
+          },
+          {
+            "type": "stored",
+            "id": 6124
+          },
+          {
+            "type": "stored",
+            "id": 6125
+          },
+          {
+            "type": "stored",
+            "id": 6126
+          },
+          {
+            "type": "stored",
+            "id": 6127
+          },
+          {
+            "type": "stored",
+            "id": 6128
+          },
+          {
+            "type": "stored",
+            "id": 6129
+          },
+          {
+            "type": "stored",
+            "id": 6130
+          },
+          {
+            "type": "stored",
+            "id": 6131
+          },
+          {
+            "type": "stored",
+            "id": 6132
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 6133,
+            "context": [
+              {
+                "type": "stored",
+                "id": 6134
+              },
+              {
+                "type": "stored",
+                "id": 6135
+              },
+              {
+                "type": "stored",
+                "id": 6136
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 6137
+              },
+              {
+                "type": "stored",
+                "id": 6138
+              },
+              {
+                "type": "stored",
+                "id": 6139
+              },
+              {
+                "type": "stored",
+                "id": 6140
+              }
+            ]
+          },
+          "n_step": -140737488355329,
+          "goals": [
+            "rGnQ\nWT\nOYJBixQal\nJFOhm\n\nnkToi",
+            "T\nCh\n\nWFCecjNhY",
+            "h\njBueJj\nS\nM\ngWfJV\negGpSjZP\n\njKIflt",
+            "mystapG\n\nPatuZqxY"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 6141,
+            "context": [
+              {
+                "type": "stored",
+                "id": 6142
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00a3\uda8e\udf40\u0094\u00d8",
+            "context": [
+              {
+                "type": "stored",
+                "id": 6143
+              },
+              {
+                "type": "stored",
+                "id": 6144
+              },
+              {
+                "type": "stored",
+                "id": 6145
+              },
+              {
+                "type": "stored",
+                "id": 6146
+              }
+            ]
+          },
+          "n_step": 23254,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 6147,
+            "context": [
+              {
+                "type": "stored",
+                "id": 6148
+              },
+              {
+                "type": "stored",
+                "id": 6149
+              }
+            ]
+          },
+          "step": {
+            "text": "\u0099\uda78\udf05",
+            "context": [
+              {
+                "type": "stored",
+                "id": 6150
+              },
+              {
+                "type": "stored",
+                "id": 6151
+              }
+            ]
+          },
+          "n_step": -501,
+          "goals": [
+            "false\nS\n\njsqdCJjq",
+            "n\nScunthorpe\n\nfKMrEizYFDOdlvx",
+            "s\nKZ\nVTd\nDQxSeSpC\nhgxyGAS\nNOigcigQxoYKfbagLrrfNjrQoQJCpnjZF\nraJbkaH\nWkth\nIv\nBHp\nFF\nIxJtm\n\nNeoCDsaVzzF",
+            "NPPySyqpA\nptRO\n\nxPNGOIKyby",
+            "VrctFHp\nIcnEbkFfSbPd\nrPQKqizAyclA\n\nUCmCn",
+            "\n\nF",
+            "NxkZYaoX\nk\nuSFQWRJk\nLggzkmp\nguWaCRJiJY\ncTaXoJ\nwh\nKPeiWsD\nZwXX\noQlNSGntIDEvMQdm\nC\nMeFmQDY\nNIL\nyisc\nqGhaKye\nNtCj\nvqgsv\n\nx",
+            "nERJ\ndlPg\n\nproYdBpySjOmlwNNcmHeMftWBmYz",
+            "vLwjDQdGhF\naKCILCNffUEqs\nwt\nGshxluj\nEHDLJGPt\nHX\nLH\nYOXKHpg\nthm\n\nLChtwXLkFn",
+            "FtldHeQFiSziawosvDWAp\nNIL\nFxtGDUFeKg\nXdFCztWZgdzURhBD\nrFnLogvbgeM\nzZ\n\nWCP",
+            "iwV\nFYamMMXgW\n\nQxMERCOFlZujcMd",
+            "wwW\n\nLKA",
+            "SzZLhC\n\nkoATllBN"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,256 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar6/x.v\", \"workspace\": \"/coq-dataset/repos/bar6\", \"repository\": \"/coq-dataset/repos/bar6\"}",
+    "{\"type\": \"stored\", \"id\": 6152}",
+    "{\"type\": \"stored\", \"id\": 6153}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 6154,
+        "context": [
+          {
+            "type": "stored",
+            "id": 6155
+          },
+          {
+            "type": "stored",
+            "id": 6156
+          },
+          {
+            "type": "stored",
+            "id": 6157
+          },
+          {
+            "type": "stored",
+            "id": 6158
+          },
+          {
+            "type": "stored",
+            "id": 6159
+          },
+          {
+            "type": "stored",
+            "id": 6160
+          },
+          {
+            "type": "stored",
+            "id": 6161
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 6162,
+            "context": [
+              {
+                "type": "stored",
+                "id": 6163
+              },
+              {
+                "type": "stored",
+                "id": 6164
+              },
+              {
+                "type": "stored",
+                "id": 6165
+              }
+            ]
+          },
+          "step": {
+            "text": "~\u00d5~",
+            "context": [
+              {
+                "type": "stored",
+                "id": 6166
+              },
+              {
+                "type": "stored",
+                "id": 6167
+              },
+              {
+                "type": "stored",
+                "id": 6168
+              },
+              {
+                "type": "stored",
+                "id": 6169
+              },
+              {
+                "type": "stored",
+                "id": 6170
+              },
+              {
+                "type": "stored",
+                "id": 6171
+              }
+            ]
+          },
+          "n_step": 54046517,
+          "goals": [
+            "Jg\nqcxZEjCch\n\nCz",
+            "ZjRTlk\nsgSIRdfVnRnwh\nJdJjeWGJJ\nRsRYUbsWSeLPuqAYbfEUfWKUo\noe\nTEnpxJfQ\nyLCFxn\n\nSIT",
+            "jaKbkcstgGlvb\n\nVOZsJA",
+            "lIgTFJaAQ\njPfLV\nbMuO\nSgoS\nqjrcj\nPjbjM\nuPVvkpOHA\nV\nbbs\nRTnTAUP\nmjSEUlQj\njFKD\ngJjTRNALdXNqZRTTcUF\n\nDefined",
+            "GY\nY\nzv\nVO\nZJXWm\nN\nvObTwPumB\n\nYsfWVfkS",
+            "HOlI\n\nS",
+            "iRrnLdrwVpYcow\nr\nPUnyhHDtOJ\nI\nBNjvDPS\nu\n\nIz",
+            "DnCNlO\nrRYyYvIPjMlhWmYDE\nQHfkJWASbdqTKO\nZGCUgYP\nVAZiC\nzVzhD\nXb\n\nSgl"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 6172,
+            "context": []
+          },
+          "step": {
+            "text": "\udba7\udc65e",
+            "context": [
+              {
+                "type": "stored",
+                "id": 6173
+              },
+              {
+                "type": "stored",
+                "id": 6174
+              },
+              {
+                "type": "stored",
+                "id": 6175
+              }
+            ]
+          },
+          "n_step": -2305843009213693952,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 6176,
+            "context": [
+              {
+                "type": "stored",
+                "id": 6177
+              },
+              {
+                "type": "stored",
+                "id": 6178
+              },
+              {
+                "type": "stored",
+                "id": 6179
+              }
+            ]
+          },
+          "step": {
+            "text": "*",
+            "context": [
+              {
+                "type": "stored",
+                "id": 6180
+              },
+              {
+                "type": "stored",
+                "id": 6181
+              },
+              {
+                "type": "stored",
+                "id": 6182
+              },
+              {
+                "type": "stored",
+                "id": 6183
+              },
+              {
+                "type": "stored",
+                "id": 6184
+              },
+              {
+                "type": "stored",
+                "id": 6185
+              },
+              {
+                "type": "stored",
+                "id": 6186
+              }
+            ]
+          },
+          "n_step": 679,
+          "goals": [
+            "tubqnP\n\nYn"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 6187,
+            "context": [
+              {
+                "type": "stored",
+                "id": 6188
+              }
+            ]
+          },
+          "step": {
+            "text": "\udba2\ude3a\udad1\udf2b\u008a\udbf7\udd81\u0015\u00fe",
+            "context": []
+          },
+          "n_step": -44773,
+          "goals": [
+            "k\nCJFoHxBIEVjmIDz\nTfFr\n\nDGy"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 6189,
+            "context": []
+          },
+          "step": {
+            "text": "\ud9b5\udf58\u00f0\ud95a\udfe8i\u008ag\u00db\u0001",
+            "context": [
+              {
+                "type": "stored",
+                "id": 6190
+              },
+              {
+                "type": "stored",
+                "id": 6191
+              }
+            ]
+          },
+          "n_step": -406,
+          "goals": [
+            "\n\ngHWMrD"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 6192,
+            "context": []
+          },
+          "step": {
+            "text": "",
+            "context": []
+          },
+          "n_step": -54216997,
+          "goals": [
+            "GH\nvfvQGkPosh\nG\ngj\nqWSKpVnW\nmhtPuhtv\nAT\n\nOcz",
+            "otIXw\nJA\nmU\nxAmXHqHElCcsiU\nQes\nak\npAPpZBv\nkDwNMPFbgNb\noXm\nY\nczNAkx\nywh\nfrs\nrnqw\n\nR",
+            "raCD\nsplit\n\nHVpxona",
+            "CtuHgwbLob\nY\n\nQz",
+            "RlTdVH\nNEWgRJQvhdGYA\nBBh\nTACTIC\n\nwSiXp",
+            "GVRse\nqJ\nBXTJ\nrMLnxrXPhK\ny\nSDy\nPtPdYWK\nj\nnull\nxqgmEbvKfmaT\nNeANXV\nX\n\nAzdfsjrOh",
+            "\n\nZNSbFpWnqjN",
+            "\n\nfEGwhdzv"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
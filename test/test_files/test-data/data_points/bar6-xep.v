@@ -0,0 +1,10 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar6/xep.v\", \"workspace\": \"/coq-dataset/repos/bar6\", \"repository\": \"/coq-dataset/repos/bar6\"}",
+    "{\"type\": \"stored\", \"id\": 6100}",
+    "{\"type\": \"stored\", \"id\": 6101}",
+    "{\"type\": \"stored\", \"id\": 6102}",
+    "{\"type\": \"stored\", \"id\": 6103}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
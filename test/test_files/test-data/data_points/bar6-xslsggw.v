@@ -0,0 +1,328 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar6/xslsggw.v\", \"workspace\": \"/coq-dataset/repos/bar6\", \"repository\": \"/coq-dataset/repos/bar6\"}",
+    "{\"type\": \"stored\", \"id\": 6003}",
+    "{\"type\": \"stored\", \"id\": 6004}",
+    "{\"type\": \"stored\", \"id\": 6005}",
+    "{\"type\": \"stored\", \"id\": 6006}",
+    "{\"type\": \"stored\", \"id\": 6007}",
+    "{\"type\": \"stored\", \"id\": 6008}",
+    "{\"type\": \"stored\", \"id\": 6009}",
+    "{\"type\": \"stored\", \"id\": 6010}",
+    "{\"type\": \"stored\", \"id\": 6011}",
+    "{\"type\": \"stored\", \"id\": 6012}",
+    "{\"type\": \"stored\", \"id\": 6013}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 6014,
+        "context": [
+          {
+            "type": "stored",
+            "id": 6015
+          },
+          {
+            "type": "stored",
+            "id": 6016
+          },
+          {
+            "type": "stored",
+            "id": 6017
+          },
+          {
+            "type": "stored",
+            "id": 6018
+          },
+          {
+            "type": "stored",
+            "id": 6019
+          },
+          {
+            "type": "stored",
+            "id": 6020
+          },
+          {
+            "type": "stored",
+            "id": 6021
+          },
+          {
+            "type": "stored",
+            "id": 6022
+          },
+          {
+            "type": "stored",
+            "id": 6023
+          },
+          {
+            "type": "stored",
+            "id": 6024
+          },
+          {
+            "type": "stored",
+            "id": 6025
+          },
+          {
+            "type": "stored",
+            "id": 6026
+          },
+          {
+            "type": "stored",
+            "id": 6027
+          },
+          {
+            "type": "stored",
+            "id": 6028
+          },
+          {
+            "type": "stored",
+            "id": 6029
+          },
+          {
+            "type": "stored",
+            "id": 6030
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 6031,
+            "context": [
+              {
+                "type": "stored",
+                "id": 6032
+              },
+              {
+                "type": "stored",
+                "id": 6033
+              },
+              {
+                "type": "stored",
+                "id": 6034
+              },
+              {
+                "type": "stored",
+                "id": 6035
+              }
+            ]
+          },
+          "step": {
+            "text": "E\uda4d\ude93\u001b\udb8d\udde86H",
+            "context": []
+          },
+          "n_step": -406917,
+          "goals": [
+            "\n\nU",
+            "rtgxdN\nJBfqddLzBvUqpD\nrvL\ng\nf\nAmndw\n\nmxx",
+            "HClwCgGjC\nKew\nMzqKxKG\nNIL\nuBKTC\nL\n\ndOBYyQOBUEjQ",
+            "qgYP\nlinux\nNhx\nmRTP\n\nDk",
+            "qMpJdly\n\nNEoXXSVUhFcKn",
+            "hvnGl\nhdqdRIqn\nHPOetX\nkRlJFoTBUYjSRv\nXfvzIbx\ndvl\nKsXNYyWk\n\nyqKPjtaeQHhw",
+            "CxFGUzGJkxbM\n\nPb"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 6036,
+            "context": [
+              {
+                "type": "stored",
+                "id": 6037
+              },
+              {
+                "type": "stored",
+                "id": 6038
+              },
+              {
+                "type": "stored",
+                "id": 6039
+              },
+              {
+                "type": "stored",
+                "id": 6040
+              },
+              {
+                "type": "stored",
+                "id": 6041
+              },
+              {
+                "type": "stored",
+                "id": 6042
+              },
+              {
+                "type": "stored",
+                "id": 6043
+              },
+              {
+                "type": "stored",
+                "id": 6044
+              },
+              {
+                "type": "stored",
+                "id": 6045
+              },
+              {
+                "type": "stored",
+                "id": 6046
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 6047
+              },
+              {
+                "type": "stored",
+                "id": 6048
+              },
+              {
+                "type": "stored",
+                "id": 6049
+              },
+              {
+                "type": "stored",
+                "id": 6050
+              }
+            ]
+          },
+          "n_step": -7154,
+          "goals": [
+            "\n\nPKe",
+            "Uhu\nytR\nmZQk\ncHSo\ntzINEhf\ng\nJKRYRvNJU\nCwEJYXCylzL\nHtKeIN\nVYYU\nX\nIL\nQ\nhEyhOknOSFtIeBg\nWgluxtXQ\n\nOBp",
+            "DFOXmNeffz\nInfinity\nHZJY\nnull\nmqIGlx\nituLyJEdQ\n\nretriever",
+            "AvpD\nNJonG\n\nE",
+            "Dyz\n\nTrue",
+            "\n\nmqqeymVf"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 6051,
+            "context": [
+              {
+                "type": "stored",
+                "id": 6052
+              },
+              {
+                "type": "stored",
+                "id": 6053
+              },
+              {
+                "type": "stored",
+                "id": 6054
+              },
+              {
+                "type": "stored",
+                "id": 6055
+              },
+              {
+                "type": "stored",
+                "id": 6056
+              },
+              {
+                "type": "stored",
+                "id": 6057
+              },
+              {
+                "type": "stored",
+                "id": 6058
+              },
+              {
+                "type": "stored",
+                "id": 6059
+              },
+              {
+                "type": "stored",
+                "id": 6060
+              },
+              {
+                "type": "stored",
+                "id": 6061
+              }
+            ]
+          },
+          "step": {
+            "text": "\u008d\u00cf\u0011\t7\u00e5\ud911\ude14\u00d3\u0084\u0095",
+            "context": [
+              {
+                "type": "stored",
+                "id": 6062
+              },
+              {
+                "type": "stored",
+                "id": 6063
+              },
+              {
+                "type": "stored",
+                "id": 6064
+              },
+              {
+                "type": "stored",
+                "id": 6065
+              },
+              {
+                "type": "stored",
+                "id": 6066
+              },
+              {
+                "type": "stored",
+                "id": 6067
+              }
+            ]
+          },
+          "n_step": -7124905155,
+          "goals": [
+            "\n\ngYfL",
+            "\n\nc",
+            "JumOyd\najsMoDnxeZf\nOuNs\neihEcuGXMnY\nE\nGdRVQ\no\nAlfxOUbyjff\niiOdHZMlGr\nGr\nrCckK\nAuMfY\nCorollary\nzflHk\nc\nkiLyWD\nsGbhUMuGL\nXrOGtOln\n\nmxrG",
+            "QYd\nwUDNPbblWIvWnPYiXszCr\nXK\ngahZmofJqfRBF\nBG\nsvDx\nsDORuGhkLKEv\noGz\nqu\nKanzjIxI\nNmyHjibltsokxwLzmuyMqkzGjCaIkDyYh\nyP\nuex\ncPkmFa\nSxMwzWYIbwpOSEYO\nJHU\nj\nPSOyBTwMJGIz\niJ\nEcbR\njGS\nkroNlmRUJdm\nTRUE\n\nIXGJLmUaVT",
+            "xl\n\nJj"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 6068,
+            "context": [
+              {
+                "type": "stored",
+                "id": 6069
+              }
+            ]
+          },
+          "step": {
+            "text": "\u0086|\uda2e\uddb2`\u0011\u00ae\u00f1\u00de\u00ff\u8862",
+            "context": [
+              {
+                "type": "stored",
+                "id": 6070
+              },
+              {
+                "type": "stored",
+                "id": 6071
+              },
+              {
+                "type": "stored",
+                "id": 6072
+              },
+              {
+                "type": "stored",
+                "id": 6073
+              }
+            ]
+          },
+          "n_step": -67427,
+          "goals": []
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
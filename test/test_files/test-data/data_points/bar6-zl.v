@@ -0,0 +1,15 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar6/zl.v\", \"workspace\": \"/coq-dataset/repos/bar6\", \"repository\": \"/coq-dataset/repos/bar6\"}",
+    "{\"type\": \"stored\", \"id\": 5874}",
+    "{\"type\": \"stored\", \"id\": 5875}",
+    "{\"type\": \"stored\", \"id\": 5876}",
+    "{\"type\": \"stored\", \"id\": 5877}",
+    "{\"type\": \"stored\", \"id\": 5878}",
+    "{\"type\": \"stored\", \"id\": 5879}",
+    "{\"type\": \"stored\", \"id\": 5880}",
+    "{\"type\": \"stored\", \"id\": 5881}",
+    "{\"type\": \"stored\", \"id\": 5882}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
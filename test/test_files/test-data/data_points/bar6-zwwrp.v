@@ -0,0 +1,244 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/bar6/zwwrp.v\", \"workspace\": \"/coq-dataset/repos/bar6\", \"repository\": \"/coq-dataset/repos/bar6\"}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 6323,
+        "context": [
+          {
+            "type": "stored",
+            "id": 6324
+          },
+          {
+            "type": "stored",
+            "id": 6325
+          },
+          {
+            "type": "stored",
+            "id": 6326
+          },
+          {
+            "type": "stored",
+            "id": 6327
+          },
+          {
+            "type": "stored",
+            "id": 6328
+          },
+          {
+            "type": "stored",
+            "id": 6329
+          },
+          {
+            "type": "stored",
+            "id": 6330
+          },
+          {
+            "type": "stored",
+            "id": 6331
+          },
+          {
+            "type": "stored",
+            "id": 6332
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 6333,
+            "context": []
+          },
+          "step": {
+            "text": "\u0010\ud5ec\u0005\uda2b\udd7bV\ud9a9\udf99\udbd4\ude55\ud89e\udebf\udb50\udd9f\u00ae\u0081\u00c1@ff",
+            "context": [
+              {
+                "type": "stored",
+                "id": 6334
+              },
+              {
+                "type": "stored",
+                "id": 6335
+              },
+              {
+                "type": "stored",
+                "id": 6336
+              },
+              {
+                "type": "stored",
+                "id": 6337
+              }
+            ]
+          },
+          "n_step": -2222,
+          "goals": [
+            "R\nU\nSTnIvnKUAc\nvKKmtk\n\nk"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 6338,
+            "context": [
+              {
+                "type": "stored",
+                "id": 6339
+              },
+              {
+                "type": "stored",
+                "id": 6340
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00a1",
+            "context": [
+              {
+                "type": "stored",
+                "id": 6341
+              },
+              {
+                "type": "stored",
+                "id": 6342
+              },
+              {
+                "type": "stored",
+                "id": 6343
+              }
+            ]
+          },
+          "n_step": -71559260,
+          "goals": [
+            "wjJADUQjHsgPjdzoT\nVWk\nfGuwMB\n\nt",
+            "hm\nKqXcJC\n\nLXYqsR",
+            "lAaBQ\n\njJ",
+            "oWPPrRph\nQaKKtEf\nRRF\nCChmutTXbM\nZQA\nYwBMr\n\njpSyANPKqZJ",
+            "bV\nc\nZWWncWFtPC\ndOvFRJkE\nYrKa\noi\nUiEifHpEBMq\neFWND\nyB\nAVBvgw\nfdOddVGVhebwuUrJATPDtofXkK\nrqIzJdrKSc\n\nuYUMOnQ",
+            "l\npH\nJgEqKlSc\nTwMJ\nCp\nENrrDZgq\nZrIYCkBNRY\n\nFaqdVdNzPHNj",
+            "y\nmLeQBgvCH\nINF\ntPstYaUydNPgQqRslCsIkLubbwDDX\nyWLooJrKKIWxbwnmV\nnvvAoHhFIQzlQo\n\nzYSOgeTfW",
+            "r\nqVMj\nSiEKq\nZK\nQhScEBPN\nrlgX\neLMgqiInbPWwssawrP\nQ\nnull\nFGpuPZ\nMHsDJLJKxWXSBAak\nqNkRrz\nTx\n\ntest",
+            "t\nQVEK\nVcULZOeTC\nrwyoqR\nwO\n\nrWXvKegwGDxzztcTsjynHkTOQcWJxoNdtfyms",
+            "d\njR\nDK\n\ndhvbPgqrLsQhE",
+            "a\nnHueYu\nyAqKwiPxb\nJN\nAdMZrxFamwqDaF\n\nssNfYTxdQWjjh",
+            "ukA\nSAlMs\n\nNgfBSHENANjNj"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 6344,
+            "context": [
+              {
+                "type": "stored",
+                "id": 6345
+              },
+              {
+                "type": "stored",
+                "id": 6346
+              },
+              {
+                "type": "stored",
+                "id": 6347
+              },
+              {
+                "type": "stored",
+                "id": 6348
+              },
+              {
+                "type": "stored",
+                "id": 6349
+              },
+              {
+                "type": "stored",
+                "id": 6350
+              },
+              {
+                "type": "stored",
+                "id": 6351
+              },
+              {
+                "type": "stored",
+                "id": 6352
+              },
+              {
+                "type": "stored",
+                "id": 6353
+              },
+              {
+                "type": "stored",
+                "id": 6354
+              },
+              {
+                "type": "stored",
+                "id": 6355
+              },
+              {
+                "type": "stored",
+                "id": 6356
+              },
+              {
+                "type": "stored",
+                "id": 6357
+              },
+              {
+                "type": "stored",
+                "id": 6358
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 6359
+              },
+              {
+                "type": "stored",
+                "id": 6360
+              },
+              {
+                "type": "stored",
+                "id": 6361
+              },
+              {
+                "type": "stored",
+                "id": 6362
+              },
+              {
+                "type": "stored",
+                "id": 6363
+              },
+              {
+                "type": "stored",
+                "id": 6364
+              },
+              {
+                "type": "stored",
+                "id": 6365
+              }
+            ]
+          },
+          "n_step": 2107,
+          "goals": [
+            "GvDgNhLhy\n\nCwdZe",
+            "BCVePbG\nd\nN\nLDQ\nUmM\nyCHq\n\nvLgyB",
+            "xCkWetYCrc\n\nJ",
+            "Z\nNBiyx\numBDbQNeRZSLtMnRzZfVXHgK\ny\nmUJcpPKU\nTGoqdahHmhDSIZlVC\n\nYjBr",
+            "ZC\nONow\nq\nniuq\naFi\nvsexwnfoVIeqag\nh\nf\nPl\nd\nt\nQUwIVLjRmaLU\n\ns",
+            "YM\nK\nlhZLI\nT\nxMVkrCgDsPfSn\n\nxZVxYDCH",
+            "KPspz\n\nyMYaU",
+            "deFMVv\nOcZVUEY\nKlx\n\nAH",
+            "XcoNtWFkiMsdqFWzR\nPhdsVZbTHJn\nCb\ncq\n\nH",
+            "\n\nhpjEzCkTG",
+            "BSZxZ\nMgygqSKt\nTHW\nrmKsBpqhnI\nNZotZL\nfrdushVqFDwPUEADmqFse\nasOB\n\nwvKLeYmJs"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,6 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz1/a.v.v\", \"workspace\": \"/coq-dataset/repos/baz1\", \"repository\": \"/coq-dataset/repos/baz1\"}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,7 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz1/aaaydkair.v\", \"workspace\": \"/coq-dataset/repos/baz1\", \"repository\": \"/coq-dataset/repos/baz1\"}",
+    "{\"type\": \"stored\", \"id\": 6807}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
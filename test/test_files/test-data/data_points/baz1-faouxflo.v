@@ -0,0 +1,10 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz1/faouxflo.v\", \"workspace\": \"/coq-dataset/repos/baz1\", \"repository\": \"/coq-dataset/repos/baz1\"}",
+    "{\"type\": \"stored\", \"id\": 6679}",
+    "{\"type\": \"stored\", \"id\": 6680}",
+    "{\"type\": \"stored\", \"id\": 6681}",
+    "{\"type\": \"stored\", \"id\": 6682}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,29 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz1/giyuj.v\", \"workspace\": \"/coq-dataset/repos/baz1\", \"repository\": \"/coq-dataset/repos/baz1\"}",
+    "{\"type\": \"stored\", \"id\": 6613}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 6614,
+        "context": [
+          {
+            "type": "stored",
+            "id": 6615
+          },
+          {
+            "type": "stored",
+            "id": 6616
+          },
+          {
+            "type": "stored",
+            "id": 6617
+          }
+        ]
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
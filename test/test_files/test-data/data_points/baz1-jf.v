@@ -0,0 +1,9 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz1/jf.v\", \"workspace\": \"/coq-dataset/repos/baz1\", \"repository\": \"/coq-dataset/repos/baz1\"}",
+    "{\"type\": \"stored\", \"id\": 6802}",
+    "{\"type\": \"stored\", \"id\": 6803}",
+    "{\"type\": \"stored\", \"id\": 6804}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,15 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz1/jgfrjxbmcjd.v\", \"workspace\": \"/coq-dataset/repos/baz1\", \"repository\": \"/coq-dataset/repos/baz1\"}",
+    "{\"type\": \"stored\", \"id\": 6787}",
+    "{\"type\": \"stored\", \"id\": 6788}",
+    "{\"type\": \"stored\", \"id\": 6789}",
+    "{\"type\": \"stored\", \"id\": 6790}",
+    "{\"type\": \"stored\", \"id\": 6791}",
+    "{\"type\": \"stored\", \"id\": 6792}",
+    "{\"type\": \"stored\", \"id\": 6793}",
+    "{\"type\": \"stored\", \"id\": 6794}",
+    "{\"type\": \"stored\", \"id\": 6795}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
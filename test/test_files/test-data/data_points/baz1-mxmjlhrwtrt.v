@@ -0,0 +1,75 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz1/mxmjlhrwtrt.v\", \"workspace\": \"/coq-dataset/repos/baz1\", \"repository\": \"/coq-dataset/repos/baz1\"}",
+    "{\"type\": \"stored\", \"id\": 6520}",
+    "{\"type\": \"stored\", \"id\": 6521}",
+    "{\"type\": \"stored\", \"id\": 6522}",
+    "{\"type\": \"stored\", \"id\": 6523}",
+    "{\"type\": \"stored\", \"id\": 6524}",
+    "{\"type\": \"stored\", \"id\": 6525}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 6526,
+        "context": [
+          {
+            "type": "stored",
+            "id": 6527
+          },
+          {
+            "type": "stored",
+            "id": 6528
+          },
+          {
+            "type": "stored",
+            "id": 6529
+          },
+          {
+            "type": "stored",
+            "id": 6530
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 6531,
+            "context": [
+              {
+                "type": "stored",
+                "id": 6532
+              },
+              {
+                "type": "stored",
+                "id": 6533
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00c3\u00c8%r\u00db\u0081\uda9b\udf67s\u00f9L",
+            "context": [
+              {
+                "type": "stored",
+                "id": 6534
+              }
+            ]
+          },
+          "n_step": 15067,
+          "goals": [
+            "aaRWFmDmsask\nBVOVQScanvik\nCkCnHhPSVAIWNAYzlYQGZhb\nYkzEed\nF\nresult\nuvDHcJYM\nBVBUzRFAskdVBMmbTqP\ncl\n\nf",
+            "\n\njkfnA",
+            "CyxXk\nnone\nx\nAVO\nx\nYLEg\nCBasTe\nrkA\ndHMuHa\nmDvMDdACyJgtiCdP\nw\n\ngXTLA",
+            "N\nhjxeDNL\nJL\nhw\nceKpJA\nW\nGY\n\nOnW",
+            "\n\nLflAJB",
+            "\n\nrmB",
+            "\n\nVjCZ",
+            "then\ndqQUP\nXTDOHjHcSEsJdZ\nJ\ntpA\n\nTA"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
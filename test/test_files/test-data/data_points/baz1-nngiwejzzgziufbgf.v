@@ -0,0 +1,262 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz1/nngiwejzzgziufbgf.v\", \"workspace\": \"/coq-dataset/repos/baz1\", \"repository\": \"/coq-dataset/repos/baz1\"}",
+    "{\"type\": \"stored\", \"id\": 6425}",
+    "{\"type\": \"stored\", \"id\": 6426}",
+    "{\"type\": \"stored\", \"id\": 6427}",
+    "{\"type\": \"stored\", \"id\": 6428}",
+    "{\"type\": \"stored\", \"id\": 6429}",
+    "{\"type\": \"stored\", \"id\": 6430}",
+    "{\"type\": \"stored\", \"id\": 6431}",
+    "{\"type\": \"stored\", \"id\": 6432}",
+    "{\"type\": \"stored\", \"id\": 6433}",
+    "{\"type\": \"stored\", \"id\": 6434}",
+    "{\"type\": \"stored\", \"id\": 6435}",
+    "{\"type\": \"stored\", \"id\": 6436}",
+    "{\"type\": \"stored\", \"id\": 6437}",
+    "{\"type\": \"stored\", \"id\": 6438}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 6439,
+        "context": [
+          {
+            "type": "stored",
+            "id": 6440
+          },
+          {
+            "type": "stored",
+            "id": 6441
+          },
+          {
+            "type": "stored",
+            "id": 6442
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 6443,
+            "context": []
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 6444
+              },
+              {
+                "type": "stored",
+                "id": 6445
+              },
+              {
+                "type": "stored",
+                "id": 6446
+              },
+              {
+                "type": "stored",
+                "id": 6447
+              }
+            ]
+          },
+          "n_step": 3145,
+          "goals": [
+            "qdX\nJ\nW\nvYQX\nBcNXFlrEgAlZY\n\nDiDyPUp",
+            "o\nuANfALpFgXjyyQtwqpHb\n\nrwtI",
+            "wvCzWoaXSDfsWzznDghxVnDzvm\n\nqrjBGiYwPQAEkyXdV",
+            "GieZ\nZuQjS\n\nN",
+            "KiyAUPRq\nbyoUyNYgeRJA\nNG\niL\nRRLG\nHEQtlEVR\n\nsYwWaavkFRDHPiVSDN",
+            "T\nrdyTk\nLmrmJCFfrx\njUNOqOJPyCS\ngPKQGoX\nOqaJHNyPcEocTA\nOl\nJbWcKBfIHlP\n\nA",
+            "LgbYVjk\nOHbO\nqJzHV\n\nPCf",
+            "\n\nT",
+            "\n\nG",
+            "L\nU\ns\nVJGJuE\nGLxrWH\n\nsrQ",
+            "None\nR\nghtFcIKnxsG\nfuMuKIWB\n\ng",
+            "N\nukj\nnone\nUBOea\nDr\natNwM\n\nl",
+            "\n\nZKBHVeHKCAgTo",
+            "ZapztSigEva\nO\nVup\ny\nt\nybggCuS\ne\nvZ\nOqCCGB\n\nJ"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 6448,
+            "context": [
+              {
+                "type": "stored",
+                "id": 6449
+              },
+              {
+                "type": "stored",
+                "id": 6450
+              },
+              {
+                "type": "stored",
+                "id": 6451
+              },
+              {
+                "type": "stored",
+                "id": 6452
+              },
+              {
+                "type": "stored",
+                "id": 6453
+              },
+              {
+                "type": "stored",
+                "id": 6454
+              }
+            ]
+          },
+          "step": {
+            "text": "\udade\ude6ejy\u009e\u00e9\\.\ud8b9\udd2a\\\u00d8",
+            "context": [
+              {
+                "type": "stored",
+                "id": 6455
+              },
+              {
+                "type": "stored",
+                "id": 6456
+              },
+              {
+                "type": "stored",
+                "id": 6457
+              },
+              {
+                "type": "stored",
+                "id": 6458
+              },
+              {
+                "type": "stored",
+                "id": 6459
+              },
+              {
+                "type": "stored",
+                "id": 6460
+              },
+              {
+                "type": "stored",
+                "id": 6461
+              },
+              {
+                "type": "stored",
+                "id": 6462
+              },
+              {
+                "type": "stored",
+                "id": 6463
+              },
+              {
+                "type": "stored",
+                "id": 6464
+              },
+              {
+                "type": "stored",
+                "id": 6465
+              },
+              {
+                "type": "stored",
+                "id": 6466
+              },
+              {
+                "type": "stored",
+                "id": 6467
+              },
+              {
+                "type": "stored",
+                "id": 6468
+              },
+              {
+                "type": "stored",
+                "id": 6469
+              },
+              {
+                "type": "stored",
+                "id": 6470
+              },
+              {
+                "type": "stored",
+                "id": 6471
+              },
+              {
+                "type": "stored",
+                "id": 6472
+              },
+              {
+                "type": "stored",
+                "id": 6473
+              },
+              {
+                "type": "stored",
+                "id": 6474
+              }
+            ]
+          },
+          "n_step": -5147900659,
+          "goals": [
+            "GeYzDwlwZajnVtja\nktWnxFQrJYDjlg\no\nt\nyrLebEvuJVpeyUQ\nNIL\nUy\ncipPIYKD\nQVdT\nBH\n\nowaxZGzK",
+            "iaCKdNBrLvH\ntuhxK\nxzBVGyyNbstu\n\nrJLmNYMklC",
+            "mVMDlG\nq\niBkPKSfirUODL\n\nMQi",
+            "\n\nSbT"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 6475,
+            "context": [
+              {
+                "type": "stored",
+                "id": 6476
+              },
+              {
+                "type": "stored",
+                "id": 6477
+              },
+              {
+                "type": "stored",
+                "id": 6478
+              },
+              {
+                "type": "stored",
+                "id": 6479
+              },
+              {
+                "type": "stored",
+                "id": 6480
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 6481
+              }
+            ]
+          },
+          "n_step": 7409781,
+          "goals": [
+            "y\nhCbZk\nXBeqqnOzgPQ\nVnlpSCpZ\nEO\nwM\ntXravFCeqn\n\nhrKHzYWvZwh",
+            "Pfgetu\neQOCeI\nPqU\n\nsjsWA",
+            "tsM\nuiUbucxF\nE\nNaN\nRPeAWPAE\n\nOUWhFqZIYyVycQ",
+            "ik\nFaWVzzSqoD\nFZI\n\nXqtIsP",
+            "\n\nVKwKGcw",
+            "zTraLHi\nYbELIByHDfuIGlZ\n\ndeotdNrpT",
+            "NdknF\nZ\nTjAk\nQveOarD\n\nnull",
+            "EOXWQSon\nzS\nHxseqmJMTCYJMIde\niTygg\nhC\nJ\n\nijkpSHSJBYLkjjQWCz",
+            "\n\nHacQHXm",
+            "l\nh\nt\noNXGUVkZzjL\njSGdzKl\nZMdC\npPa\nXdLPQSH\nA\nVXCLx\nScunthorpe\nbldrbqcAc\nwqmvYf\nxgtlQDzbFBlyrKhgLGk\ncpu\n\nMT"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
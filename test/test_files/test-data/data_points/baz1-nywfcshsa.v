@@ -0,0 +1,20 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz1/nywfcshsa.v\", \"workspace\": \"/coq-dataset/repos/baz1\", \"repository\": \"/coq-dataset/repos/baz1\"}",
+    "{\"type\": \"stored\", \"id\": 6796}",
+    "{\"type\": \"stored\", \"id\": 6797}",
+    "{\"type\": \"stored\", \"id\": 6798}",
+    "{\"type\": \"stored\", \"id\": 6799}",
+    "{\"type\": \"stored\", \"id\": 6800}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 6801,
+        "context": []
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
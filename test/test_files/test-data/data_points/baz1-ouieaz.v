@@ -0,0 +1,8 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz1/ouieaz.v\", \"workspace\": \"/coq-dataset/repos/baz1\", \"repository\": \"/coq-dataset/repos/baz1\"}",
+    "{\"type\": \"stored\", \"id\": 6805}",
+    "{\"type\": \"stored\", \"id\": 6806}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,240 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz1/r.v\", \"workspace\": \"/coq-dataset/repos/baz1\", \"repository\": \"/coq-dataset/repos/baz1\"}",
+    "{\"type\": \"stored\", \"id\": 6618}",
+    "{\"type\": \"stored\", \"id\": 6619}",
+    "{\"type\": \"stored\", \"id\": 6620}",
+    "{\"type\": \"stored\", \"id\": 6621}",
+    "{\"type\": \"stored\", \"id\": 6622}",
+    "{\"type\": \"stored\", \"id\": 6623}",
+    "{\"type\": \"stored\", \"id\": 6624}",
+    "{\"type\": \"stored\", \"id\": 6625}",
+    "{\"type\": \"stored\", \"id\": 6626}",
+    "{\"type\": \"stored\", \"id\": 6627}",
+    "{\"type\": \"stored\", \"id\": 6628}",
+    "{\"type\": \"stored\", \"id\": 6629}",
+    "{\"type\": \"stored\", \"id\": 6630}",
+    "{\"type\": \"stored\", \"id\": 6631}",
+    "{\"type\": \"stored\", \"id\": 6632}",
+    "{\"type\": \"stored\", \"id\": 6633}",
+    "{\"type\": \"stored\", \"id\": 6634}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 6635,
+        "context": [
+          {
+            "type": "stored",
+            "id": 6636
+          },
+          {
+            "type": "stored",
+            "id": 6637
+          },
+          {
+            "type": "stored",
+            "id": 6638
+          },
+          {
+            "type": "stored",
+            "id": 6639
+          },
+          {
+            "type": "stored",
+            "id": 6640
+          },
+          {
+            "type": "stored",
+            "id": 6641
+          },
+          {
+            "type": "stored",
+            "id": 6642
+          },
+          {
+            "type": "stored",
+            "id": 6643
+          },
+          {
+            "type": "stored",
+            "id": 6644
+          },
+          {
+            "type": "stored",
+            "id": 6645
+          },
+          {
+            "type": "stored",
+            "id": 6646
+          },
+          {
+            "type": "stored",
+            "id": 6647
+          },
+          {
+            "type": "stored",
+            "id": 6648
+          },
+          {
+            "type": "stored",
+            "id": 6649
+          },
+          {
+            "type": "stored",
+            "id": 6650
+          },
+          {
+            "type": "stored",
+            "id": 6651
+          },
+          {
+            "type": "stored",
+            "id": 6652
+          },
+          {
+            "type": "stored",
+            "id": 6653
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 6654,
+            "context": [
+              {
+                "type": "stored",
+                "id": 6655
+              },
+              {
+                "type": "stored",
+                "id": 6656
+              },
+              {
+                "type": "stored",
+                "id": 6657
+              },
+              {
+                "type": "stored",
+                "id": 6658
+              },
+              {
+                "type": "stored",
+                "id": 6659
+              },
+              {
+                "type": "stored",
+                "id": 6660
+              },
+              {
+                "type": "stored",
+                "id": 6661
+              },
+              {
+                "type": "stored",
+                "id": 6662
+              },
+              {
+                "type": "stored",
+                "id": 6663
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00dd2\ud805\udc2c\u00af",
+            "context": [
+              {
+                "type": "stored",
+                "id": 6664
+              },
+              {
+                "type": "stored",
+                "id": 6665
+              },
+              {
+                "type": "stored",
+                "id": 6666
+              },
+              {
+                "type": "stored",
+                "id": 6667
+              },
+              {
+                "type": "stored",
+                "id": 6668
+              },
+              {
+                "type": "stored",
+                "id": 6669
+              },
+              {
+                "type": "stored",
+                "id": 6670
+              },
+              {
+                "type": "stored",
+                "id": 6671
+              },
+              {
+                "type": "stored",
+                "id": 6672
+              },
+              {
+                "type": "stored",
+                "id": 6673
+              },
+              {
+                "type": "stored",
+                "id": 6674
+              }
+            ]
+          },
+          "n_step": -2160,
+          "goals": [
+            "P\nN\nxKRf\nv\nnVrW\nKFCS\nEslrDuV\noDQYXZoIgFv\nQSSsZcgGAQZy\nJYfJGULdHblGjrt\nrjyvrfKZSS\nNtfpnAUaypeXganXmYrdlNEmz\ntype\nvf\nUIp\n\nthen",
+            "iNc\n\nUGJIsDtkS",
+            "yha\n\nOwe",
+            "WQ\nmp\nSCo\nfdnTKyCq\nL\nedQt\nr\nPE\n\ncMyrN",
+            "SlUcAFQqrIb\ni\nSSEuvRO\nDXBLrJtl\npmUHMmiAwzh\nBRyH\nPUVhUIeN\n\nHSOn",
+            "hlbEsHGZpAO\nixGuftCoB\nC\njYTAgMrMkMbGwYVt\nbzJuscDDaPgZlRCQg\nNQ\nXNytRnJPLA\nJnpo\nudeN\nZ\nVE\nhgxSei\nyJ\nKTbK\nTYnaWwlJ\niJJ\nx\nTJMpQPH\nywdkye\naDejkxmn\nXmBdbVUweyfHMjwg\nqvN\neJU\nDEFINITION\nlongest\nI\nDPbKaLeBY\naDGWGeI\nZav\nh\nk\n\nrb",
+            "onHgrsX\n\nOuXATF",
+            "NDco\nPnvFWLgD\nSr\nNFXZTx\nY\nw\n\nBtuRgKdtbZ"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 6675,
+            "context": [
+              {
+                "type": "stored",
+                "id": 6676
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 6677
+              },
+              {
+                "type": "stored",
+                "id": 6678
+              }
+            ]
+          },
+          "n_step": 82,
+          "goals": [
+            "kYAdUk\nQOmxfvft\n\nZ",
+            "COaB\nR\nyO\n\ne"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,119 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz1/rxhlfg.v\", \"workspace\": \"/coq-dataset/repos/baz1\", \"repository\": \"/coq-dataset/repos/baz1\"}",
+    "{\"type\": \"stored\", \"id\": 6748}",
+    "{\"type\": \"stored\", \"id\": 6749}",
+    "{\"type\": \"stored\", \"id\": 6750}",
+    "{\"type\": \"stored\", \"id\": 6751}",
+    "{\"type\": \"stored\", \"id\": 6752}",
+    "{\"type\": \"stored\", \"id\": 6753}",
+    "{\"type\": \"stored\", \"id\": 6754}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 6755,
+        "context": [
+          {
+            "type": "stored",
+            "id": 6756
+          },
+          {
+            "type": "stored",
+            "id": 6757
+          },
+          {
+            "type": "stored",
+            "id": 6758
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 6759,
+            "context": [
+              {
+                "type": "stored",
+                "id": 6760
+              },
+              {
+                "type": "stored",
+                "id": 6761
+              },
+              {
+                "type": "stored",
+                "id": 6762
+              },
+              {
+                "type": "stored",
+                "id": 6763
+              },
+              {
+                "type": "stored",
+                "id": 6764
+              },
+              {
+                "type": "stored",
+                "id": 6765
+              },
+              {
+                "type": "stored",
+                "id": 6766
+              },
+              {
+                "type": "stored",
+                "id": 6767
+              },
+              {
+                "type": "stored",
+                "id": 6768
+              },
+              {
+                "type": "stored",
+                "id": 6769
+              },
+              {
+                "type": "stored",
+                "id": 6770
+              },
+              {
+                "type": "stored",
+                "id": 6771
+              },
+              {
+                "type": "stored",
+                "id": 6772
+              },
+              {
+                "type": "stored",
+                "id": 6773
+              },
+              {
+                "type": "stored",
+                "id": 6774
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 6775
+              },
+              {
+                "type": "stored",
+                "id": 6776
+              }
+            ]
+          },
+          "n_step": 538354302,
+          "goals": []
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
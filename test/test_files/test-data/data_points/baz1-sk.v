@@ -0,0 +1,8 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz1/sk.v\", \"workspace\": \"/coq-dataset/repos/baz1\", \"repository\": \"/coq-dataset/repos/baz1\"}",
+    "{\"type\": \"stored\", \"id\": 6740}",
+    "{\"type\": \"stored\", \"id\": 6741}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
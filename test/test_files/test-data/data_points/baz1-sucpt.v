@@ -0,0 +1,17 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz1/sucpt.v\", \"workspace\": \"/coq-dataset/repos/baz1\", \"repository\": \"/coq-dataset/repos/baz1\"}",
+    "{\"type\": \"stored\", \"id\": 6808}",
+    "{\"type\": \"stored\", \"id\": 6809}",
+    "{\"type\": \"stored\", \"id\": 6810}",
+    "{\"type\": \"stored\", \"id\": 6811}",
+    "{\"type\": \"stored\", \"id\": 6812}",
+    "{\"type\": \"stored\", \"id\": 6813}",
+    "{\"type\": \"stored\", \"id\": 6814}",
+    "{\"type\": \"stored\", \"id\": 6815}",
+    "{\"type\": \"stored\", \"id\": 6816}",
+    "{\"type\": \"stored\", \"id\": 6817}",
+    "{\"type\": \"stored\", \"id\": 6818}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,12 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz1/true.v\", \"workspace\": \"/coq-dataset/repos/baz1\", \"repository\": \"/coq-dataset/repos/baz1\"}",
+    "{\"type\": \"stored\", \"id\": 6742}",
+    "{\"type\": \"stored\", \"id\": 6743}",
+    "{\"type\": \"stored\", \"id\": 6744}",
+    "{\"type\": \"stored\", \"id\": 6745}",
+    "{\"type\": \"stored\", \"id\": 6746}",
+    "{\"type\": \"stored\", \"id\": 6747}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,290 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz1/tvogwd.v\", \"workspace\": \"/coq-dataset/repos/baz1\", \"repository\": \"/coq-dataset/repos/baz1\"}",
+    "{\"type\": \"stored\", \"id\": 6552}",
+    "{\"type\": \"stored\", \"id\": 6553}",
+    "{\"type\": \"stored\", \"id\": 6554}",
+    "{\"type\": \"stored\", \"id\": 6555}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 6556,
+        "context": [
+          {
+            "type": "stored",
+            "id": 6557
+          },
+          {
+            "type": "stored",
+            "id": 6558
+          },
+          {
+            "type": "stored",
+            "id": 6559
+          },
+          {
+            "type": "stored",
+            "id": 6560
+          },
+          {
+            "type": "stored",
+            "id": 6561
+          },
+          {
+            "type": "stored",
+            "id": 6562
+          },
+          {
+            "type": "stored",
+            "id": 6563
+          },
+          {
+            "type": "stored",
+            "id": 6564
+          },
+          {
+            "type": "stored",
+            "id": 6565
+          },
+          {
+            "type": "stored",
+            "id": 6566
+          },
+          {
+            "type": "stored",
+            "id": 6567
+          }
+        ]
+      },
+      "steps": []
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 6568,
+        "context": [
+          {
+            "type": "stored",
+            "id": 6569
+          },
+          {
+            "type": "stored",
+            "id": 6570
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 6571,
+            "context": [
+              {
+                "type": "stored",
+                "id": 6572
+              },
+              {
+                "type": "stored",
+                "id": 6573
+              },
+              {
+                "type": "stored",
+                "id": 6574
+              },
+              {
+                "type": "stored",
+                "id": 6575
+              }
+            ]
+          },
+          "step": {
+            "text": "\u000f\u00b7",
+            "context": [
+              {
+                "type": "stored",
+                "id": 6576
+              }
+            ]
+          },
+          "n_step": -10742,
+          "goals": []
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 6577,
+        "context": [
+          {
+            "type": "stored",
+            "id": 6578
+          }
+        ]
+      },
+      "steps": []
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 6579,
+        "context": [
+          {
+            "type": "stored",
+            "id": 6580
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 6581,
+            "context": [
+              {
+                "type": "stored",
+                "id": 6582
+              },
+              {
+                "type": "stored",
+                "id": 6583
+              },
+              {
+                "type": "stored",
+                "id": 6584
+              },
+              {
+                "type": "stored",
+                "id": 6585
+              },
+              {
+                "type": "stored",
+                "id": 6586
+              },
+              {
+                "type": "stored",
+                "id": 6587
+              },
+              {
+                "type": "stored",
+                "id": 6588
+              },
+              {
+                "type": "stored",
+                "id": 6589
+              },
+              {
+                "type": "stored",
+                "id": 6590
+              },
+              {
+                "type": "stored",
+                "id": 6591
+              },
+              {
+                "type": "stored",
+                "id": 6592
+              },
+              {
+                "type": "stored",
+                "id": 6593
+              },
+              {
+                "type": "stored",
+                "id": 6594
+              },
+              {
+                "type": "stored",
+                "id": 6595
+              },
+              {
+                "type": "stored",
+                "id": 6596
+              },
+              {
+                "type": "stored",
+                "id": 6597
+              },
+              {
+                "type": "stored",
+                "id": 6598
+              },
+              {
+                "type": "stored",
+                "id": 6599
+              },
+              {
+                "type": "stored",
+                "id": 6600
+              },
+              {
+                "type": "stored",
+                "id": 6601
+              },
+              {
+                "type": "stored",
+                "id": 6602
+              },
+              {
+                "type": "stored",
+                "id": 6603
+              },
+              {
+                "type": "stored",
+                "id": 6604
+              },
+              {
+                "type": "stored",
+                "id": 6605
+              },
+              {
+                "type": "stored",
+                "id": 6606
+              }
+            ]
+          },
+          "step": {
+            "text": "num_vectors",
+            "context": [
+              {
+                "type": "stored",
+                "id": 6607
+              },
+              {
+                "type": "stored",
+                "id": 6608
+              },
+              {
+                "type": "stored",
+                "id": 6609
+              },
+              {
+                "type": "stored",
+                "id": 6610
+              },
+              {
+                "type": "stored",
+                "id": 6611
+              },
+              {
+                "type": "stored",
+                "id": 6612
+              }
+            ]
+          },
+          "n_step": -1594,
+          "goals": [
+            "Inf\nmTtVeU\n\nsMM",
+            "viEuWJ\nXbpguogFI\nsJBHvhiWe\nKQYOLbiwgNDLWHWskK\nfn\nkjYfJdQ\nYbjWFaHBcmeQnvdS\n\nOLEdocXKoRUodQ",
+            "MvEiBkudyk\nmYUrdLLQ\nyGPhjERBUUBlQ\nkUIaBbYf\nlI\nxTZIscNB\nKiL\noT\n\nsj",
+            "iaFwIHDeikCr\nvzc\n\nzJ",
+            "\n\nK",
+            "\n\nvtp"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,170 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz1/u.v\", \"workspace\": \"/coq-dataset/repos/baz1\", \"repository\": \"/coq-dataset/repos/baz1\"}",
+    "{\"type\": \"stored\", \"id\": 6482}",
+    "{\"type\": \"stored\", \"id\": 6483}",
+    "{\"type\": \"stored\", \"id\": 6484}",
+    "{\"type\": \"stored\", \"id\": 6485}",
+    "{\"type\": \"stored\", \"id\": 6486}",
+    "{\"type\": \"stored\", \"id\": 6487}",
+    "{\"type\": \"stored\", \"id\": 6488}",
+    "{\"type\": \"stored\", \"id\": 6489}",
+    "{\"type\": \"stored\", \"id\": 6490}",
+    "{\"type\": \"stored\", \"id\": 6491}",
+    "{\"type\": \"stored\", \"id\": 6492}",
+    "{\"type\": \"stored\", \"id\": 6493}",
+    "{\"type\": \"stored\", \"id\": 6494}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 6495,
+        "context": [
+          {
+            "type": "stored",
+            "id": 6496
+          },
+          {
+            "type": "stored",
+            "id": 6497
+          },
+          {
+            "type": "stored",
+            "id": 6498
+          },
+          {
+            "type": "stored",
+            "id": 6499
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 6500,
+            "context": [
+              {
+                "type": "stored",
+                "id": 6501
+              },
+              {
+                "type": "stored",
+                "id": 6502
+              }
+            ]
+          },
+          "step": {
+            "text": "~\u00a0\udb85\udda8(\ud94b\ude66@f\u00b9",
+            "context": []
+          },
+          "n_step": 1980904,
+          "goals": [
+            "\n\nsxEo"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 6503,
+            "context": [
+              {
+                "type": "stored",
+                "id": 6504
+              }
+            ]
+          },
+          "step": {
+            "text": "&\u00b05]\t\ud8d6\udf38u\u008b\u00e8\u0093\u00d3`\ud9e5\udd3ab\u00fc\u00cf\ud817\udf5a",
+            "context": [
+              {
+                "type": "stored",
+                "id": 6505
+              }
+            ]
+          },
+          "n_step": 155852,
+          "goals": [
+            "free\nr\ntWn\nhRpxAYMIZsxQbh\nC\nYjXmgFWCQIu\nbuHA\nTrcM\n\nGRir",
+            "\n\nECZqlUE"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 6506,
+            "context": [
+              {
+                "type": "stored",
+                "id": 6507
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00f7",
+            "context": [
+              {
+                "type": "stored",
+                "id": 6508
+              },
+              {
+                "type": "stored",
+                "id": 6509
+              },
+              {
+                "type": "stored",
+                "id": 6510
+              },
+              {
+                "type": "stored",
+                "id": 6511
+              },
+              {
+                "type": "stored",
+                "id": 6512
+              },
+              {
+                "type": "stored",
+                "id": 6513
+              }
+            ]
+          },
+          "n_step": 158743,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 6514,
+            "context": [
+              {
+                "type": "stored",
+                "id": 6515
+              },
+              {
+                "type": "stored",
+                "id": 6516
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00c6\u0096(\udaff\udcd1m\u00aa\u00dd",
+            "context": [
+              {
+                "type": "stored",
+                "id": 6517
+              },
+              {
+                "type": "stored",
+                "id": 6518
+              }
+            ]
+          },
+          "n_step": -95833170403056271360,
+          "goals": []
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
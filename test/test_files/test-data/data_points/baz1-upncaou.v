@@ -0,0 +1,14 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz1/upncaou.v\", \"workspace\": \"/coq-dataset/repos/baz1\", \"repository\": \"/coq-dataset/repos/baz1\"}",
+    "{\"type\": \"stored\", \"id\": 6417}",
+    "{\"type\": \"stored\", \"id\": 6418}",
+    "{\"type\": \"stored\", \"id\": 6419}",
+    "{\"type\": \"stored\", \"id\": 6420}",
+    "{\"type\": \"stored\", \"id\": 6421}",
+    "{\"type\": \"stored\", \"id\": 6422}",
+    "{\"type\": \"stored\", \"id\": 6423}",
+    "{\"type\": \"stored\", \"id\": 6424}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,283 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz1/uv.v\", \"workspace\": \"/coq-dataset/repos/baz1\", \"repository\": \"/coq-dataset/repos/baz1\"}",
+    "{\"type\": \"stored\", \"id\": 6683}",
+    "{\"type\": \"stored\", \"id\": 6684}",
+    "{\"type\": \"stored\", \"id\": 6685}",
+    "{\"type\": \"stored\", \"id\": 6686}",
+    "{\"type\": \"stored\", \"id\": 6687}",
+    "{\"type\": \"stored\", \"id\": 6688}",
+    "{\"type\": \"stored\", \"id\": 6689}",
+    "{\"type\": \"stored\", \"id\": 6690}",
+    "{\"type\": \"stored\", \"id\": 6691}",
+    "{\"type\": \"stored\", \"id\": 6692}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 6693,
+        "context": [
+          {
+            "type": "stored",
+            "id": 6694
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 6695,
+            "context": [
+              {
+                "type": "stored",
+                "id": 6696
+              },
+              {
+                "type": "stored",
+                "id": 6697
+              },
+              {
+                "type": "stored",
+                "id": 6698
+              },
+              {
+                "type": "stored",
+                "id": 6699
+              },
+              {
+                "type": "stored",
+                "id": 6700
+              },
+              {
+                "type": "stored",
+                "id": 6701
+              },
+              {
+                "type": "stored",
+                "id": 6702
+              },
+              {
+                "type": "stored",
+                "id": 6703
+              }
+            ]
+          },
+          "step": {
+            "text": "WE\udab7\udcb1Ty\u0082\u00d6\ud8f7\uded0\u00e9Y\u0000:W\u00aa\u0092\u0081\u00a2\udb39\ude9b\udb56\udf0b\ud9b0\udfa0\ud985\udcef\u0083\u00c2\u00da\u00a7\u00dfZ\f\u0087",
+            "context": [
+              {
+                "type": "stored",
+                "id": 6704
+              },
+              {
+                "type": "stored",
+                "id": 6705
+              },
+              {
+                "type": "stored",
+                "id": 6706
+              },
+              {
+                "type": "stored",
+                "id": 6707
+              },
+              {
+                "type": "stored",
+                "id": 6708
+              },
+              {
+                "type": "stored",
+                "id": 6709
+              },
+              {
+                "type": "stored",
+                "id": 6710
+              },
+              {
+                "type": "stored",
+                "id": 6711
+              },
+              {
+                "type": "stored",
+                "id": 6712
+              },
+              {
+                "type": "stored",
+                "id": 6713
+              },
+              {
+                "type": "stored",
+                "id": 6714
+              },
+              {
+                "type": "stored",
+                "id": 6715
+              },
+              {
+                "type": "stored",
+                "id": 6716
+              }
+            ]
+          },
+          "n_step": -6729,
+          "goals": [
+            "\n\nXnZNEGGe",
+            "gzaXJaWhlD\nqewu\nz\nhFKTbTnIpuDcGlPpYe\nJvbJbPleZ\nKL\nY\nk\noff\njderAX\ntimeout\nUUKK\nrectype\nMcE\n\nJ",
+            "x\nZQobTMWpTOGRDE\n\nscf"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 6717,
+            "context": [
+              {
+                "type": "stored",
+                "id": 6718
+              },
+              {
+                "type": "stored",
+                "id": 6719
+              },
+              {
+                "type": "stored",
+                "id": 6720
+              },
+              {
+                "type": "stored",
+                "id": 6721
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 6722
+              },
+              {
+                "type": "stored",
+                "id": 6723
+              },
+              {
+                "type": "stored",
+                "id": 6724
+              }
+            ]
+          },
+          "n_step": 264,
+          "goals": [
+            "uza\nG\nB\noX\nE\n\nDY"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 6725,
+            "context": [
+              {
+                "type": "stored",
+                "id": 6726
+              },
+              {
+                "type": "stored",
+                "id": 6727
+              },
+              {
+                "type": "stored",
+                "id": 6728
+              },
+              {
+                "type": "stored",
+                "id": 6729
+              },
+              {
+                "type": "stored",
+                "id": 6730
+              },
+              {
+                "type": "stored",
+                "id": 6731
+              },
+              {
+                "type": "stored",
+                "id": 6732
+              },
+              {
+                "type": "stored",
+                "id": 6733
+              },
+              {
+                "type": "stored",
+                "id": 6734
+              },
+              {
+                "type": "stored",
+                "id": 6735
+              }
+            ]
+          },
+          "step": {
+            "text": "l\ud835\udd2b\uda53\uddca`\u00a4K7.\u0017o\ud898\udde1F\u00efU\u00ab\u00f0\u00ad",
+            "context": []
+          },
+          "n_step": -1720,
+          "goals": [
+            "ts\nBegkP\n\nqJqvoWu",
+            "MBzkuRLZZATx\nkopiaD\nuvSXdaC\nmFYKy\npcepra\n\nOVS",
+            "QXi\nrGQlO\nEE\nbYn\nTK\neFesBMLEjoXgwh\n\nq",
+            "quH\njCnXpyk\nFdMedjSn\nKEjNXxfiSrPGz\nLzpxmbsMs\nk\nSxr\nEGx\nVj\nwEimI\nmEZZrUqJs\nWRwfKi\n\nV",
+            "kx\n\nMnTaLUoDbegsLlUj",
+            "a\neoQJ\nTbEK\nCt\ndV\nH\nSSUYEydo\ntrain\n\nE"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 6736,
+            "context": [
+              {
+                "type": "stored",
+                "id": 6737
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": []
+          },
+          "n_step": -1549,
+          "goals": [
+            "o\nLhScBqqJrwb\nPQxq\nMBEw\neHzsSDEfwHN\nBBKMHEaA\niVN\nSjn\niqo\n\nUOfQbUcxt",
+            "FEkyLlDQUI\nTWO\nwkWzexJX\n\nuGeQyyDGTe"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 6738,
+            "context": []
+          },
+          "step": {
+            "text": "\u000fIN\u0083\u00d7 \u0080",
+            "context": [
+              {
+                "type": "stored",
+                "id": 6739
+              }
+            ]
+          },
+          "n_step": -47,
+          "goals": [
+            "a\nhu\nGQOf\n\nOxfGTF",
+            "lmbUN\n\nmlwqsmOaYjjDuOxuzisUaI",
+            "bOyGQchqIunHZOTMi\nNjaVMkVl\n\nUibSdMmppVEc"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,31 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz1/vkm.v\", \"workspace\": \"/coq-dataset/repos/baz1\", \"repository\": \"/coq-dataset/repos/baz1\"}",
+    "{\"type\": \"stored\", \"id\": 6777}",
+    "{\"type\": \"stored\", \"id\": 6778}",
+    "{\"type\": \"stored\", \"id\": 6779}",
+    "{\"type\": \"stored\", \"id\": 6780}",
+    "{\"type\": \"stored\", \"id\": 6781}",
+    "{\"type\": \"stored\", \"id\": 6782}",
+    "{\"type\": \"stored\", \"id\": 6783}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 6784,
+        "context": [
+          {
+            "type": "stored",
+            "id": 6785
+          },
+          {
+            "type": "stored",
+            "id": 6786
+          }
+        ]
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
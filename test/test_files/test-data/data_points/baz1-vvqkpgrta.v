@@ -0,0 +1,10 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz1/vvqkpgrta.v\", \"workspace\": \"/coq-dataset/repos/baz1\", \"repository\": \"/coq-dataset/repos/baz1\"}",
+    "{\"type\": \"stored\", \"id\": 6535}",
+    "{\"type\": \"stored\", \"id\": 6536}",
+    "{\"type\": \"stored\", \"id\": 6537}",
+    "{\"type\": \"stored\", \"id\": 6538}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,19 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz1/zxx.v\", \"workspace\": \"/coq-dataset/repos/baz1\", \"repository\": \"/coq-dataset/repos/baz1\"}",
+    "{\"type\": \"stored\", \"id\": 6539}",
+    "{\"type\": \"stored\", \"id\": 6540}",
+    "{\"type\": \"stored\", \"id\": 6541}",
+    "{\"type\": \"stored\", \"id\": 6542}",
+    "{\"type\": \"stored\", \"id\": 6543}",
+    "{\"type\": \"stored\", \"id\": 6544}",
+    "{\"type\": \"stored\", \"id\": 6545}",
+    "{\"type\": \"stored\", \"id\": 6546}",
+    "{\"type\": \"stored\", \"id\": 6547}",
+    "{\"type\": \"stored\", \"id\": 6548}",
+    "{\"type\": \"stored\", \"id\": 6549}",
+    "{\"type\": \"stored\", \"id\": 6550}",
+    "{\"type\": \"stored\", \"id\": 6551}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,6 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz2/a.v.v.v\", \"workspace\": \"/coq-dataset/repos/baz2\", \"repository\": \"/coq-dataset/repos/baz2\"}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
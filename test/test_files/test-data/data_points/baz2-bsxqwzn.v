@@ -0,0 +1,334 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz2/bsxqwzn.v\", \"workspace\": \"/coq-dataset/repos/baz2\", \"repository\": \"/coq-dataset/repos/baz2\"}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 6853,
+        "context": [
+          {
+            "type": "stored",
+            "id": 6854
+          },
+          {
+            "type": "stored",
+            "id": 6855
+          },
+          {
+            "type": "stored",
+            "id": 6856
+          },
+          {
+            "type": "stored",
+            "id": 6857
+          },
+          {
+            "type": "stored",
+            "id": 6858
+          },
+          {
+            "type": "stored",
+            "id": 6859
+          },
+          {
+            "type": "stored",
+            "id": 6860
+          },
+          {
+            "type": "stored",
+            "id": 6861
+          },
+          {
+            "type": "stored",
+            "id": 6862
+          },
+          {
+            "type": "stored",
+            "id": 6863
+          },
+          {
+            "type": "stored",
+            "id": 6864
+          },
+          {
+            "type": "stored",
+            "id": 6865
+          }
+        ]
+      },
+      "steps": []
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 6866,
+        "context": [
+          {
+            "type": "stored",
+            "id": 6867
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 6868,
+            "context": [
+              {
+                "type": "stored",
+                "id": 6869
+              },
+              {
+                "type": "stored",
+                "id": 6870
+              },
+              {
+                "type": "stored",
+                "id": 6871
+              },
+              {
+                "type": "stored",
+                "id": 6872
+              },
+              {
+                "type": "stored",
+                "id": 6873
+              },
+              {
+                "type": "stored",
+                "id": 6874
+              },
+              {
+                "type": "stored",
+                "id": 6875
+              },
+              {
+                "type": "stored",
+                "id": 6876
+              },
+              {
+                "type": "stored",
+                "id": 6877
+              },
+              {
+                "type": "stored",
+                "id": 6878
+              },
+              {
+                "type": "stored",
+                "id": 6879
+              },
+              {
+                "type": "stored",
+                "id": 6880
+              },
+              {
+                "type": "stored",
+                "id": 6881
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 6882
+              },
+              {
+                "type": "stored",
+                "id": 6883
+              },
+              {
+                "type": "stored",
+                "id": 6884
+              },
+              {
+                "type": "stored",
+                "id": 6885
+              },
+              {
+                "type": "stored",
+                "id": 6886
+              }
+            ]
+          },
+          "n_step": 29461,
+          "goals": [
+            "uewfhEGYxLwL\nCie\nE\ns\nCOFIXPOINT\nmpXQGdXlaUT\njm\nvcby\n\nhNBYwuwOSwLyR",
+            "iaUksdYJQnC\ny\n\nDefined",
+            "VJHgH\nF\n\nwkkacnMTc",
+            "Infinity\nu\nufkCj\nMhrlrGPRlPC\nAWjL\nJIKXYU\n\nI",
+            "EK\n\nssvL",
+            "P\npdRpw\nnjH\n\nBLtn"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 6887,
+            "context": [
+              {
+                "type": "stored",
+                "id": 6888
+              },
+              {
+                "type": "stored",
+                "id": 6889
+              },
+              {
+                "type": "stored",
+                "id": 6890
+              }
+            ]
+          },
+          "step": {
+            "text": "\u0007\u009f\u001fM\u00cb",
+            "context": [
+              {
+                "type": "stored",
+                "id": 6891
+              },
+              {
+                "type": "stored",
+                "id": 6892
+              },
+              {
+                "type": "stored",
+                "id": 6893
+              },
+              {
+                "type": "stored",
+                "id": 6894
+              },
+              {
+                "type": "stored",
+                "id": 6895
+              }
+            ]
+          },
+          "n_step": -9730512238147,
+          "goals": [
+            "\n\nE",
+            "GatN\nZdaBUm\nRk\nbZpIeQqtBjUi\ne\nvK\n\nGUaJ",
+            "\n\nitsrfGQFFC",
+            "kkBvFDcka\n\niZR"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 6896,
+            "context": [
+              {
+                "type": "stored",
+                "id": 6897
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00ba[\ud816\uddf4\u0080(\u26ff~\u00bf",
+            "context": [
+              {
+                "type": "stored",
+                "id": 6898
+              },
+              {
+                "type": "stored",
+                "id": 6899
+              },
+              {
+                "type": "stored",
+                "id": 6900
+              },
+              {
+                "type": "stored",
+                "id": 6901
+              },
+              {
+                "type": "stored",
+                "id": 6902
+              },
+              {
+                "type": "stored",
+                "id": 6903
+              },
+              {
+                "type": "stored",
+                "id": 6904
+              }
+            ]
+          },
+          "n_step": 43977548,
+          "goals": [
+            "vO\nIqs\n\nldg",
+            "dW\nAHqWGnDj\noSJWjgj\nSpUWQpnKayqd\nIGFBtG\nhjyUDBkIaoNCyxkmfdqksKaLW\nv\nInf\nIFjJ\ncm\nEtSKUiuygonTniSg\nZI\nlKfxEJbQiTSEUfVeHHeCkpkSArjbIp\nfalse\npldjWMAbmjiR\nJPoykcwB\n\naggSYRV",
+            "V\n\nWnQWocYaacWmRu"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 6905,
+            "context": [
+              {
+                "type": "stored",
+                "id": 6906
+              },
+              {
+                "type": "stored",
+                "id": 6907
+              },
+              {
+                "type": "stored",
+                "id": 6908
+              },
+              {
+                "type": "stored",
+                "id": 6909
+              }
+            ]
+          },
+          "step": {
+            "text": "`\u0013",
+            "context": [
+              {
+                "type": "stored",
+                "id": 6910
+              },
+              {
+                "type": "stored",
+                "id": 6911
+              },
+              {
+                "type": "stored",
+                "id": 6912
+              },
+              {
+                "type": "stored",
+                "id": 6913
+              },
+              {
+                "type": "stored",
+                "id": 6914
+              }
+            ]
+          },
+          "n_step": -26358,
+          "goals": [
+            "rGacPl\nyxDaYOl\nQ\nsYKoPsOjjiTFfbNlKPJBFXvq\nYSLc\nnb\nkZWVCCkZKeR\nIQlHnuUsjmmPk\nmyDaBVdAoRVD\nhHyWQcX\ndnwt\n\nFt",
+            "XR\nmntPKTCGd\nINFO\nJ\nRd\nSK\nXRHwBI\nlawdXatSJX\n\nmLj",
+            "IJKP\nJrUDDwrPiuJa\nwB\nZqwifhED\n\nraIovxlSM",
+            "HPcgVl\nlxkMj\nMl\n\nV",
+            "ZUUOMUmqi\ntm\nTBJmn\nIfV\nQygkKdRN\njEoj\nIKpMwmWbE\nh\ntcGH\nC\nGUhFmUS\nl\nYHnWIQfi\n\nAzXTFzmFOxrpn",
+            "N\nIhuzOPAubtIjhDZ\nito\nvBwWVUMHZwbGSqdKqYjFhr\neOa\n\nOUDTw",
+            "pXOpQGoff\nuDNbpF\nxdGkD\nI\njtPAcD\nK\nx\n\ncjt"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
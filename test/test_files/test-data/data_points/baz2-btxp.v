@@ -0,0 +1,12 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz2/btxp.v\", \"workspace\": \"/coq-dataset/repos/baz2\", \"repository\": \"/coq-dataset/repos/baz2\"}",
+    "{\"type\": \"stored\", \"id\": 6955}",
+    "{\"type\": \"stored\", \"id\": 6956}",
+    "{\"type\": \"stored\", \"id\": 6957}",
+    "{\"type\": \"stored\", \"id\": 6958}",
+    "{\"type\": \"stored\", \"id\": 6959}",
+    "{\"type\": \"stored\", \"id\": 6960}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
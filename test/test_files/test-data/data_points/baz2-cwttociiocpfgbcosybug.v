@@ -0,0 +1,119 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz2/cwttociiocpfgbcosybug.v\", \"workspace\": \"/coq-dataset/repos/baz2\", \"repository\": \"/coq-dataset/repos/baz2\"}",
+    "{\"type\": \"stored\", \"id\": 7022}",
+    "{\"type\": \"stored\", \"id\": 7023}",
+    "{\"type\": \"stored\", \"id\": 7024}",
+    "{\"type\": \"stored\", \"id\": 7025}",
+    "{\"type\": \"stored\", \"id\": 7026}",
+    "{\"type\": \"stored\", \"id\": 7027}",
+    "{\"type\": \"stored\", \"id\": 7028}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 7029,
+        "context": [
+          {
+            "type": "stored",
+            "id": 7030
+          },
+          {
+            "type": "stored",
+            "id": 7031
+          },
+          {
+            "type": "stored",
+            "id": 7032
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 7033,
+            "context": [
+              {
+                "type": "stored",
+                "id": 7034
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00acO\u00af\u00df\uda3e\udd18\u00f0#",
+            "context": [
+              {
+                "type": "stored",
+                "id": 7035
+              },
+              {
+                "type": "stored",
+                "id": 7036
+              },
+              {
+                "type": "stored",
+                "id": 7037
+              },
+              {
+                "type": "stored",
+                "id": 7038
+              },
+              {
+                "type": "stored",
+                "id": 7039
+              }
+            ]
+          },
+          "n_step": 3200874,
+          "goals": [
+            "oaCegfkEFdDSjUA\nedFOO\nJhbrgniqmcz\nymMJ\nkJsdg\nxy\noHhO\nEdUBtDnK\nfamwG\ng\nBuWbY\nLWPx\njruDkX\nqFDUZ\nTktMqC\nvLeaMxcXAlle\nIZSYfqzuBUwvYXd\n\ncS",
+            "INF\nQVmWsQBmtkJ\nbJcz\nijwhOMhF\nEzbQJnwPpnci\ntuU\nJ\nH\nOiGLtsohFkzatG\nYrSLgNT\nykEBTKIdRc\npvJM\nazhSFMkT\n\nFA",
+            "MrB\nXj\nZwwoYJFi\nf\nYczCRFZcEgpn\n\nIhXEdi",
+            "TSR\nSaving\nRJpsY\n\nCoMGqmd",
+            "fSch\nqr\n\nquLEb",
+            "MVc\nv\nHfVpHI\nKF\nEBbLq\nBDCWvx\n\nEaNVlhLgfPHBsGeUOAsjru",
+            "WieqRCbL\n\nsVOhA",
+            "El\nosrtDuthRIzb\nYnrg\noRFTKg\nZta\nVhnfTpRRhBMJkJDaHvp\n\nnTK",
+            "kuzS\n\nkZuvrWuoLazRtk",
+            "zwM\n\nmAbB"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 7040,
+            "context": []
+          },
+          "step": {
+            "text": "\u00fb\f\udba9\uddb7\ud9a4\udc46`\ud875\udfdc\u009b\ud9ba\udc07\uda58\udfa1N\u00b9\t",
+            "context": [
+              {
+                "type": "stored",
+                "id": 7041
+              },
+              {
+                "type": "stored",
+                "id": 7042
+              },
+              {
+                "type": "stored",
+                "id": 7043
+              }
+            ]
+          },
+          "n_step": -381,
+          "goals": [
+            "RnaUyjMC\nTJOnjAx\n\ntg",
+            "oXFaC\nnM\nkFDzcNEjtzfclqV\nhWGbwpmj\nHx\nKEPW\nW\nyU\nSLdO\n\nJAptTwCYU",
+            "XNZ\n\nipftRWRxKkB",
+            "kWJOma\nZ\nFcCRZtjNfdT\nlpsMrxAeTxKKvxpT\nNIL\nF\nHOPIz\noyO\n\ntgjc",
+            "TkmjeYqm\nRC\nipm\nkEPt\nfa\nf\ndNKb\nG\nzlrSmvAbyVbT\n\ny",
+            "NpVHUszoyMhfHoZhmydSiRjJpGn\nP\nvNA\nUhalJuF\nwVKIAHZHww\nCsE\nnPlPaJZwtFS\n\nuHOSZp"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,7 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz2/d.v\", \"workspace\": \"/coq-dataset/repos/baz2\", \"repository\": \"/coq-dataset/repos/baz2\"}",
+    "{\"type\": \"stored\", \"id\": 6820}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,10 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz2/dbtuffppep.v\", \"workspace\": \"/coq-dataset/repos/baz2\", \"repository\": \"/coq-dataset/repos/baz2\"}",
+    "{\"type\": \"stored\", \"id\": 6849}",
+    "{\"type\": \"stored\", \"id\": 6850}",
+    "{\"type\": \"stored\", \"id\": 6851}",
+    "{\"type\": \"stored\", \"id\": 6852}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,17 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz2/eefrfgcpq.v\", \"workspace\": \"/coq-dataset/repos/baz2\", \"repository\": \"/coq-dataset/repos/baz2\"}",
+    "{\"type\": \"stored\", \"id\": 7049}",
+    "{\"type\": \"stored\", \"id\": 7050}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 7051,
+        "context": []
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,11 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz2/gztkqjkjmr.v\", \"workspace\": \"/coq-dataset/repos/baz2\", \"repository\": \"/coq-dataset/repos/baz2\"}",
+    "{\"type\": \"stored\", \"id\": 7044}",
+    "{\"type\": \"stored\", \"id\": 7045}",
+    "{\"type\": \"stored\", \"id\": 7046}",
+    "{\"type\": \"stored\", \"id\": 7047}",
+    "{\"type\": \"stored\", \"id\": 7048}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
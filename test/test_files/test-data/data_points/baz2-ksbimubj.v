@@ -0,0 +1,12 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz2/ksbimubj.v\", \"workspace\": \"/coq-dataset/repos/baz2\", \"repository\": \"/coq-dataset/repos/baz2\"}",
+    "{\"type\": \"stored\", \"id\": 7096}",
+    "{\"type\": \"stored\", \"id\": 7097}",
+    "{\"type\": \"stored\", \"id\": 7098}",
+    "{\"type\": \"stored\", \"id\": 7099}",
+    "{\"type\": \"stored\", \"id\": 7100}",
+    "{\"type\": \"stored\", \"id\": 7101}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,18 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz2/lines.v\", \"workspace\": \"/coq-dataset/repos/baz2\", \"repository\": \"/coq-dataset/repos/baz2\"}",
+    "{\"type\": \"stored\", \"id\": 7110}",
+    "{\"type\": \"stored\", \"id\": 7111}",
+    "{\"type\": \"stored\", \"id\": 7112}",
+    "{\"type\": \"stored\", \"id\": 7113}",
+    "{\"type\": \"stored\", \"id\": 7114}",
+    "{\"type\": \"stored\", \"id\": 7115}",
+    "{\"type\": \"stored\", \"id\": 7116}",
+    "{\"type\": \"stored\", \"id\": 7117}",
+    "{\"type\": \"stored\", \"id\": 7118}",
+    "{\"type\": \"stored\", \"id\": 7119}",
+    "{\"type\": \"stored\", \"id\": 7120}",
+    "{\"type\": \"stored\", \"id\": 7121}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
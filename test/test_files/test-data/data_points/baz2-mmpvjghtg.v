@@ -0,0 +1,312 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz2/mmpvjghtg.v\", \"workspace\": \"/coq-dataset/repos/baz2\", \"repository\": \"/coq-dataset/repos/baz2\"}",
+    "{\"type\": \"stored\", \"id\": 6963}",
+    "{\"type\": \"stored\", \"id\": 6964}",
+    "{\"type\": \"stored\", \"id\": 6965}",
+    "{\"type\": \"stored\", \"id\": 6966}",
+    "{\"type\": \"stored\", \"id\": 6967}",
+    "{\"type\": \"stored\", \"id\": 6968}",
+    "{\"type\": \"stored\", \"id\": 6969}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 6970,
+        "context": [
+          {
+            "type": "stored",
+            "id": 6971
+          },
+          {
+            "type": "stored",
+            "id": 6972
+          },
+          {
+            "type": "stored",
+            "id": 6973
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 6974,
+            "context": [
+              {
+                "type": "stored",
+                "id": 6975
+              },
+              {
+                "type": "stored",
+                "id": 6976
+              },
+              {
+                "type": "stored",
+                "id": 6977
+              },
+              {
+                "type": "stored",
+                "id": 6978
+              },
+              {
+                "type": "stored",
+                "id": 6979
+              },
+              {
+                "type": "stored",
+                "id": 6980
+              },
+              {
+                "type": "stored",
+                "id": 6981
+              },
+              {
+                "type": "stored",
+                "id": 6982
+              },
+              {
+                "type": "stored",
+                "id": 6983
+              },
+              {
+                "type": "stored",
+                "id": 6984
+              }
+            ]
+          },
+          "step": {
+            "text": "s\udbc9\udf27\u00ae\b\\\f\u0081",
+            "context": [
+              {
+                "type": "stored",
+                "id": 6985
+              },
+              {
+                "type": "stored",
+                "id": 6986
+              },
+              {
+                "type": "stored",
+                "id": 6987
+              }
+            ]
+          },
+          "n_step": 90284973,
+          "goals": [
+            "\n\nlkc",
+            "uT\nvyIfTa\nBnWuFLfNWuOwimA\n\nZ",
+            "\n\niLfsPvQm",
+            "\n\nPQe",
+            "lRxCkA\n\nKlWvCBUuQg",
+            "zYQF\nNKyVqt\nykGWSCqlWeN\nOMmPjPZjZJmlrg\nkLXUMX\nJlt\nPLo\nZDIP\nBSoFGcy\nSoXKjKv\n\nlSIlukRWkMbEcYNZUeMJQ",
+            "fYVbsj\nMtLyLZH\nkkKw\n\neIeCXKXIdva",
+            "\n\nDyN",
+            "ep\n\nI",
+            "yA\nM\nFg\nmooPkO\n\nVqfjrHnSORD",
+            "B\nEW\ntJolX\n\ndOyj",
+            "s\nTQuDvyzSBVvtzILbtTTUY\nYitX\nX\n\njpQybkQutESPXmOkUQTzu"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 6988,
+            "context": [
+              {
+                "type": "stored",
+                "id": 6989
+              },
+              {
+                "type": "stored",
+                "id": 6990
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00f5v\udabe\uddf3\ud873\udf5c\u00fd\udb66\udcaa\ud8ae\udffd\udacd\udec6\u00b0\u0097\u00c5q\uda20\ude17\u00b1\ud9db\udf10\u00be\ud801\udd0f\u00d3\u00b0\u00b6\u00a1\ud86b\udec6\ue7c7\ud80b\udda6\u0019",
+            "context": [
+              {
+                "type": "stored",
+                "id": 6991
+              },
+              {
+                "type": "stored",
+                "id": 6992
+              },
+              {
+                "type": "stored",
+                "id": 6993
+              },
+              {
+                "type": "stored",
+                "id": 6994
+              },
+              {
+                "type": "stored",
+                "id": 6995
+              }
+            ]
+          },
+          "n_step": 324544,
+          "goals": [
+            "brKYz\nJkNZD\n\nsqcGYLUdVYRbX",
+            "j\nbacB\nJdFuilgdyXfpGReNmH\nQrfeqAp\nk\nx\np\ncAyl\nS\n\nbI"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 6996,
+            "context": [
+              {
+                "type": "stored",
+                "id": 6997
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00b5\udb7a\udde3\udb6b\udecc\u00e8\u00f3\\",
+            "context": [
+              {
+                "type": "stored",
+                "id": 6998
+              },
+              {
+                "type": "stored",
+                "id": 6999
+              },
+              {
+                "type": "stored",
+                "id": 7000
+              }
+            ]
+          },
+          "n_step": 41591,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 7001,
+            "context": [
+              {
+                "type": "stored",
+                "id": 7002
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 7003
+              },
+              {
+                "type": "stored",
+                "id": 7004
+              },
+              {
+                "type": "stored",
+                "id": 7005
+              },
+              {
+                "type": "stored",
+                "id": 7006
+              },
+              {
+                "type": "stored",
+                "id": 7007
+              }
+            ]
+          },
+          "n_step": -6910,
+          "goals": [
+            "x\nNIL\n\nEvpQh",
+            "mcr\n\nNUL",
+            "HU\n\nOaLgwRCgdbNT",
+            "hV\n\nDmx"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 7008,
+            "context": [
+              {
+                "type": "stored",
+                "id": 7009
+              },
+              {
+                "type": "stored",
+                "id": 7010
+              },
+              {
+                "type": "stored",
+                "id": 7011
+              },
+              {
+                "type": "stored",
+                "id": 7012
+              },
+              {
+                "type": "stored",
+                "id": 7013
+              },
+              {
+                "type": "stored",
+                "id": 7014
+              }
+            ]
+          },
+          "step": {
+            "text": "8(\ud811\udead\u00a6\udbdf\udc3b^&\ud969\udf52(?a",
+            "context": [
+              {
+                "type": "stored",
+                "id": 7015
+              },
+              {
+                "type": "stored",
+                "id": 7016
+              },
+              {
+                "type": "stored",
+                "id": 7017
+              },
+              {
+                "type": "stored",
+                "id": 7018
+              }
+            ]
+          },
+          "n_step": -244,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 7019,
+            "context": [
+              {
+                "type": "stored",
+                "id": 7020
+              }
+            ]
+          },
+          "step": {
+            "text": "storage_dtype",
+            "context": []
+          },
+          "n_step": -1291,
+          "goals": [
+            "oJVqTrXbXedTz\nuMaOe\nudLYxuMapDgfidwntOdPHMmJHgJd\nGslsr\nesDkzh\nnFCS\nBpTAq\n\nK"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,134 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz2/null.v\", \"workspace\": \"/coq-dataset/repos/baz2\", \"repository\": \"/coq-dataset/repos/baz2\"}",
+    "{\"type\": \"stored\", \"id\": 6934}",
+    "{\"type\": \"stored\", \"id\": 6935}",
+    "{\"type\": \"stored\", \"id\": 6936}",
+    "{\"type\": \"stored\", \"id\": 6937}",
+    "{\"type\": \"stored\", \"id\": 6938}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 6939,
+        "context": [
+          {
+            "type": "stored",
+            "id": 6940
+          },
+          {
+            "type": "stored",
+            "id": 6941
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 6942,
+            "context": []
+          },
+          "step": {
+            "text": "\"",
+            "context": [
+              {
+                "type": "stored",
+                "id": 6943
+              }
+            ]
+          },
+          "n_step": 4545737,
+          "goals": [
+            "rX\n\nZrBZZsQmvCInvnCYSqOlOkL",
+            "NMANK\n\noiqlwwn",
+            "kYsEcuQA\n\nStAIbCVXGuyU",
+            "Eu\nzH\ncEwdRVBarr\nUw\nZYyqZezz\nawZNic\nLsAfD\nZk\nhRMoInN\nxjNzgYQKCzF\nFebynKiG\n\nSOUiaTRF",
+            "aGZxKL\nXTHpmmN\nltIrvU\n\njchQnhy",
+            "bn\nM\ncJZV\nEhUpr\nW\nnd\n\nTygHcwMlOzxNuYx",
+            "MY\nsxIRKrgiopqLJ\nRTX\nM\nZJMMaYsantSFrAHMXirWDBYKA\nG\ndVuAUNuqecdcL\nzHuLhYcowo\nls\n\nA",
+            "rBCkubFXw\nruB\nziPGFC\nZUaVpGq\nzuzJmhQvqsJ\nbYxTPGftenCsPYbUNTXxrQDoNchvkdbI\naMne\namYFlvXJy\njPQCaUW\noTkfuWt\n\neVPDJXZZrX",
+            "pQJrUjvwwv\nYH\nkgDLhukfEEm\nNdOyCTBb\nJypnt\nQIgTgFZZAZ\nCCTlb\n\neEhLzhOhZOp"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 6944,
+            "context": [
+              {
+                "type": "stored",
+                "id": 6945
+              },
+              {
+                "type": "stored",
+                "id": 6946
+              },
+              {
+                "type": "stored",
+                "id": 6947
+              },
+              {
+                "type": "stored",
+                "id": 6948
+              },
+              {
+                "type": "stored",
+                "id": 6949
+              }
+            ]
+          },
+          "step": {
+            "text": "\u023e",
+            "context": [
+              {
+                "type": "stored",
+                "id": 6950
+              },
+              {
+                "type": "stored",
+                "id": 6951
+              },
+              {
+                "type": "stored",
+                "id": 6952
+              },
+              {
+                "type": "stored",
+                "id": 6953
+              },
+              {
+                "type": "stored",
+                "id": 6954
+              }
+            ]
+          },
+          "n_step": 298520232490965206564864,
+          "goals": [
+            "pPAoiypGkXPeeOaQOIdVUoq\nK\niXmelLlawf\nh\nUx\nQ\nZqCwX\nqWVqpiTKiEOmlEP\nEcrkDJShNgQGB\naHtpYIrvfZeqPiFPWA\nmBGZVnsqq\n\noXvWxXyiFyPYvvh",
+            "z\nzmOXr\nqf\n\nyWStYkpTzjJd",
+            "eQ\n\nX",
+            "UjzXGsraeRHj\nCw\npqsq\nkrJ\nVsB\nxrrKPLuB\nChNIn\n\nd",
+            "iRt\n\nyI",
+            "WFMToLxr\nm\nxyiY\nEbZvDPpkhqVazq\ndK\na\n\nevG",
+            "m\nXiS\nx\nlS\n\nurhpz",
+            "aZNUwZYYehdTRtsiiDtBbnpqPURrNZQUuvcHqTWPtDADIbh\nkWZZhoS\nUOH\nMBu\nOiAPkhP\nScunthorpe\nywASBUYOlZd\nNEwvo\nYNYquorIKlRsOwVFHO\nsyZgSNH\noSquxwi\nK\no\nKrH\nv\ncosts\nG\nEnTW\nd\nSLC\nG\nFv\n\nlKRVjBklolLxZsEoUEsVWM",
+            "ONY\nW\nOShA\n\nkrVLkzGmq",
+            "jxtAgiFgZF\nM\nkVlAjEUWb\nusqkid\nNhcxV\nScunthorpe\nL\nm\nIFL\nWZ\ntQc\nTRUE\nt\nKqPNBho\n\neKUjPYVWZvzUL",
+            "zMEEa\nqOWCdQZGu\n\nnuFBBdP",
+            "LymChHsHHl\nBsweTW\nGBb\ndyLANvQmg\nJLBaRcFaktnjBZ\nABvvTHgsvGl\n\nDGp",
+            "Z\nyyUutu\nyo\n\nEzCSTkzI",
+            "xYL\niSD\n\nGO",
+            "MBSwtW\nEO\ngJPz\nItSkpDY\no\nNbg\nJBawGvWQ\nph\ncDS\n\nvCZ",
+            "ULcqmtEwn\nlib\n\nnkOacmgedSiKKinNy",
+            "peLJWwLsKhuoA\n\nOaGrAn",
+            "\n\nZy",
+            "JHcU\nHc\nr\npPPxyuIzWJyl\nMozjATUMVstGnMoXQswajz\nJY\nQbiEk\nlA\nCMZWbdhLE\nLemma\nrbL\n\nziWpkUCOw",
+            "XWyQGPkhORe\n\nmSkRaILqwRlNZ"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
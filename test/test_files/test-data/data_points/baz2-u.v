@@ -0,0 +1,11 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz2/u.v\", \"workspace\": \"/coq-dataset/repos/baz2\", \"repository\": \"/coq-dataset/repos/baz2\"}",
+    "{\"type\": \"stored\", \"id\": 6915}",
+    "{\"type\": \"stored\", \"id\": 6916}",
+    "{\"type\": \"stored\", \"id\": 6917}",
+    "{\"type\": \"stored\", \"id\": 6918}",
+    "{\"type\": \"stored\", \"id\": 6919}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,436 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz2/usksf.v\", \"workspace\": \"/coq-dataset/repos/baz2\", \"repository\": \"/coq-dataset/repos/baz2\"}",
+    "{\"type\": \"stored\", \"id\": 7122}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 7123,
+        "context": [
+          {
+            "type": "stored",
+            "id": 7124
+          },
+          {
+            "type": "stored",
+            "id": 7125
+          },
+          {
+            "type": "stored",
+            "id": 7126
+          },
+          {
+            "type": "stored",
+            "id": 7127
+          },
+          {
+            "type": "stored",
+            "id": 7128
+          },
+          {
+            "type": "stored",
+            "id": 7129
+          },
+          {
+            "type": "stored",
+            "id": 7130
+          },
+          {
+            "type": "stored",
+            "id": 7131
+          },
+          {
+            "type": "stored",
+            "id": 7132
+          },
+          {
+            "type": "stored",
+            "id": 7133
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 7134,
+            "context": []
+          },
+          "step": {
+            "text": "\uda12\udd3e\u0086\u00c6",
+            "context": [
+              {
+                "type": "stored",
+                "id": 7135
+              },
+              {
+                "type": "stored",
+                "id": 7136
+              },
+              {
+                "type": "stored",
+                "id": 7137
+              },
+              {
+                "type": "stored",
+                "id": 7138
+              },
+              {
+                "type": "stored",
+                "id": 7139
+              },
+              {
+                "type": "stored",
+                "id": 7140
+              },
+              {
+                "type": "stored",
+                "id": 7141
+              },
+              {
+                "type": "stored",
+                "id": 7142
+              },
+              {
+                "type": "stored",
+                "id": 7143
+              }
+            ]
+          },
+          "n_step": -211719,
+          "goals": [
+            "LrfCYiXOArG\nyPL\nBtIuFSIZcdFF\nNQS\nQi\nyJXlcedXHKiRtyQXKk\nkT\nvlEiI\nGVuax\nZIzMEWfQfqrcxCNOesMf\nDRUgdpqpU\n\nYInUzxlAEhObr",
+            "undefined\nvwHX\nHBazfnQvOL\nsGYIhy\nwyNgQcA\n\nNULL",
+            "RrAguM\nWoIo\n\njwoQOlty",
+            "IDak\nD\nMm\nUKA\nCfDPLlWEyBWlD\n\nRqim",
+            "\n\nBAHKTCD",
+            "EOwo\n\nJRSPNj",
+            "L\nfgH\n\nHxjCZdWDoLwBQPYWtrVmgLecandLy",
+            "HvDFjCNTB\nnull\nthen\ne\nkvPLpTNJbHMIeZndaF\ntz\nDUfiHkMjofR\nXcWxFWq\nNIL\nH\nnfZectWDJIBqQ\nHhkGVZ\n\nf",
+            "PwYG\n\nROcX",
+            "AjiVDL\nPROPOSITION\n\nKIcfkveC"
+          ]
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 7144,
+        "context": [
+          {
+            "type": "stored",
+            "id": 7145
+          },
+          {
+            "type": "stored",
+            "id": 7146
+          },
+          {
+            "type": "stored",
+            "id": 7147
+          },
+          {
+            "type": "stored",
+            "id": 7148
+          },
+          {
+            "type": "stored",
+            "id": 7149
+          },
+          {
+            "type": "stored",
+            "id": 7150
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 7151,
+            "context": [
+              {
+                "type": "stored",
+                "id": 7152
+              },
+              {
+                "type": "stored",
+                "id": 7153
+              }
+            ]
+          },
+          "step": {
+            "text": "\udbec\udd39\u0012\ud96a\udd77\u00e0/\udbc3\udd1dO\u00072,?Z\udad2\udd4d",
+            "context": []
+          },
+          "n_step": -74436,
+          "goals": [
+            "ydZdW\n\numav",
+            "fp\nkUe\n\nz",
+            "Yn\nMIGh\nlJaTW\nKfxXVpo\n\nP"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 7154,
+            "context": [
+              {
+                "type": "stored",
+                "id": 7155
+              },
+              {
+                "type": "stored",
+                "id": 7156
+              }
+            ]
+          },
+          "step": {
+            "text": "\u0097\u001d\uda80\ude6a\u00f2\u00b2\u0091\u00f8\udbb5\uddd3\u00b7\u008c\ud96c\uded8",
+            "context": [
+              {
+                "type": "stored",
+                "id": 7157
+              },
+              {
+                "type": "stored",
+                "id": 7158
+              }
+            ]
+          },
+          "n_step": 185665307,
+          "goals": [
+            "INMYFt\nO\nG\n\ne"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 7159,
+            "context": [
+              {
+                "type": "stored",
+                "id": 7160
+              },
+              {
+                "type": "stored",
+                "id": 7161
+              },
+              {
+                "type": "stored",
+                "id": 7162
+              },
+              {
+                "type": "stored",
+                "id": 7163
+              },
+              {
+                "type": "stored",
+                "id": 7164
+              },
+              {
+                "type": "stored",
+                "id": 7165
+              },
+              {
+                "type": "stored",
+                "id": 7166
+              },
+              {
+                "type": "stored",
+                "id": 7167
+              },
+              {
+                "type": "stored",
+                "id": 7168
+              },
+              {
+                "type": "stored",
+                "id": 7169
+              },
+              {
+                "type": "stored",
+                "id": 7170
+              },
+              {
+                "type": "stored",
+                "id": 7171
+              },
+              {
+                "type": "stored",
+                "id": 7172
+              },
+              {
+                "type": "stored",
+                "id": 7173
+              },
+              {
+                "type": "stored",
+                "id": 7174
+              },
+              {
+                "type": "stored",
+                "id": 7175
+              },
+              {
+                "type": "stored",
+                "id": 7176
+              }
+            ]
+          },
+          "step": {
+            "text": "\u0084\u00c4\u0096\u00c3\u00f3\udb1f\uddc6\u00c5\ud90f\udeb4\u00a7",
+            "context": [
+              {
+                "type": "stored",
+                "id": 7177
+              },
+              {
+                "type": "stored",
+                "id": 7178
+              },
+              {
+                "type": "stored",
+                "id": 7179
+              },
+              {
+                "type": "stored",
+                "id": 7180
+              },
+              {
+                "type": "stored",
+                "id": 7181
+              },
+              {
+                "type": "stored",
+                "id": 7182
+              },
+              {
+                "type": "stored",
+                "id": 7183
+              },
+              {
+                "type": "stored",
+                "id": 7184
+              }
+            ]
+          },
+          "n_step": 5972,
+          "goals": [
+            "QPViLgza\ntrue\nry\noAOHiDpPgBy\npCdcCTjMY\n\niYmHweM",
+            "cIATnOKc\njokY\n\njVVuPwtteRhp",
+            "vDskDQPRPVXIFCFYvsdewBMKsa\nJVSVNtpnV\nVGUJRU\nASYqMsWUZr\nu\niitIUDIkCorOZRKVuN\nI\n\nEWn",
+            "hXE\nJEiLMubhAme\nLuoIJIuDqPn\n\nElRbFy",
+            "raVNybCd\n\nwyrW"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 7185,
+            "context": [
+              {
+                "type": "stored",
+                "id": 7186
+              },
+              {
+                "type": "stored",
+                "id": 7187
+              }
+            ]
+          },
+          "step": {
+            "text": "\ud961\ude6f\u00a7",
+            "context": [
+              {
+                "type": "stored",
+                "id": 7188
+              }
+            ]
+          },
+          "n_step": -2725432524518516398995013632,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 7189,
+            "context": [
+              {
+                "type": "stored",
+                "id": 7190
+              },
+              {
+                "type": "stored",
+                "id": 7191
+              },
+              {
+                "type": "stored",
+                "id": 7192
+              }
+            ]
+          },
+          "step": {
+            "text": "\u000f\ud92b\udcf9\u00eb\u00ff\u00d6$]",
+            "context": [
+              {
+                "type": "stored",
+                "id": 7193
+              },
+              {
+                "type": "stored",
+                "id": 7194
+              }
+            ]
+          },
+          "n_step": 3718,
+          "goals": [
+            "\n\nsFBnUNaI"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 7195,
+            "context": []
+          },
+          "step": {
+            "text": "\u00db\ud96a\udf05g\u00f8\u0010",
+            "context": [
+              {
+                "type": "stored",
+                "id": 7196
+              },
+              {
+                "type": "stored",
+                "id": 7197
+              },
+              {
+                "type": "stored",
+                "id": 7198
+              }
+            ]
+          },
+          "n_step": -1886938,
+          "goals": [
+            "\n\nEDVXzd",
+            "iG\nxWElaj\nWKjHmrOBwczKzP\n\nINF",
+            "\n\nyHIBck",
+            "\n\nGsVPMG",
+            "Sk\n\nneOhRCFcUN",
+            "GGhPSUA\nBcuB\nELXdujibyVSH\nACP\nrKLek\nQWCPAlgrvqzraxF\n\nXbDVEFKWTwOHMdeJlHoAjQzzqUxEjrA",
+            "\n\nbR",
+            "JLZ\nFNQx\ngFlswiNI\nPBggksClAQb\nScunthorpe\ntXR\nnil\nqcX\n\nsjR",
+            "NPZP\nOBDrJquFudbKsxluWjrruL\neod\nw\n\neUWmTtNHA",
+            "OUVw\nDvdHThJiFIQDMzRnxtyzd\neY\n\nJ",
+            "GgwmcwU\n\nngbH",
+            "\n\nFPHNfHqvL"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,267 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz2/v.v\", \"workspace\": \"/coq-dataset/repos/baz2\", \"repository\": \"/coq-dataset/repos/baz2\"}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 7052,
+        "context": [
+          {
+            "type": "stored",
+            "id": 7053
+          },
+          {
+            "type": "stored",
+            "id": 7054
+          },
+          {
+            "type": "stored",
+            "id": 7055
+          },
+          {
+            "type": "stored",
+            "id": 7056
+          },
+          {
+            "type": "stored",
+            "id": 7057
+          },
+          {
+            "type": "stored",
+            "id": 7058
+          },
+          {
+            "type": "stored",
+            "id": 7059
+          },
+          {
+            "type": "stored",
+            "id": 7060
+          },
+          {
+            "type": "stored",
+            "id": 7061
+          },
+          {
+            "type": "stored",
+            "id": 7062
+          },
+          {
+            "type": "stored",
+            "id": 7063
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 7064,
+            "context": [
+              {
+                "type": "stored",
+                "id": 7065
+              },
+              {
+                "type": "stored",
+                "id": 7066
+              },
+              {
+                "type": "stored",
+                "id": 7067
+              },
+              {
+                "type": "stored",
+                "id": 7068
+              },
+              {
+                "type": "stored",
+                "id": 7069
+              },
+              {
+                "type": "stored",
+                "id": 7070
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 7071
+              },
+              {
+                "type": "stored",
+                "id": 7072
+              },
+              {
+                "type": "stored",
+                "id": 7073
+              }
+            ]
+          },
+          "n_step": -20400160,
+          "goals": [
+            "H\nYCMb\nzWb\nBDDLhUnGOxRvp\ndBP\nrtcEytj\n\nhux",
+            "HV\nJtvueGOW\nV\n\neO",
+            "\n\nzySn",
+            "GZWAeM\npsuaTvbODgYuLOLexgbfUCZbjvb\nCpN\nENM\nKC\nFXEvxsvKi\nn\nReXcsn\nPN\n\npXFFHCLckfDlMDGq",
+            "\n\nsNSF",
+            "\n\nJFjB",
+            "kVi\nZkew\niY\nAt\nU\noszDEEsNwDvhhjWNaGbjL\n\nDHVCjVxsAbqLSsKT",
+            "\n\nfOeT",
+            "ZfCrq\nNone\nVHTJtbA\nuBZIuMVBjo\nHao\nbOtWmhXJF\nuVGS\nwS\n\nZMuK",
+            "mJ\n\nN",
+            "jaONo\nz\nM\nh\nIkds\nfv\nnmtqphDhqAYOiPh\naF\nyo\nnGaGI\nftZEHykVAhN\n\nAVXVySQ",
+            "L\nKcF\nFw\nb\nKT\nqmTA\nbU\ndTPuMrxWVt\nao\ncaaDfsAKiB\nm\njWQVuZvHKUmWxffejDfgcVaruH\nSoIOgFSu\nFk\n\nJrCn",
+            "bYsuR\nP\nbxPDfEgzk\nqbASjH\nZ\nPzGfrbyqYW\nu\ntn\ncXlQJsulASmILh\nKqKdV\ny\nNEmQCM\nvLx\niBjKIdWoKJvqcLcLKijUD\nL\nidFfu\n\njAFqbbUM",
+            "\n\nT"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 7074,
+            "context": [
+              {
+                "type": "stored",
+                "id": 7075
+              },
+              {
+                "type": "stored",
+                "id": 7076
+              }
+            ]
+          },
+          "step": {
+            "text": "3\u00d4",
+            "context": [
+              {
+                "type": "stored",
+                "id": 7077
+              },
+              {
+                "type": "stored",
+                "id": 7078
+              },
+              {
+                "type": "stored",
+                "id": 7079
+              },
+              {
+                "type": "stored",
+                "id": 7080
+              }
+            ]
+          },
+          "n_step": -87178291200,
+          "goals": [
+            "rLK\npYPA\nnGTrFPh\n\nNRNPLeZrfz",
+            "free\n\nDLyWZkDqE"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 7081,
+            "context": [
+              {
+                "type": "stored",
+                "id": 7082
+              },
+              {
+                "type": "stored",
+                "id": 7083
+              },
+              {
+                "type": "stored",
+                "id": 7084
+              }
+            ]
+          },
+          "step": {
+            "text": "\u001e\u009f_LHoH\u0082\u00ca\u00fd\u00a7\u00fd\u008c",
+            "context": [
+              {
+                "type": "stored",
+                "id": 7085
+              },
+              {
+                "type": "stored",
+                "id": 7086
+              },
+              {
+                "type": "stored",
+                "id": 7087
+              },
+              {
+                "type": "stored",
+                "id": 7088
+              },
+              {
+                "type": "stored",
+                "id": 7089
+              }
+            ]
+          },
+          "n_step": 1631538912,
+          "goals": [
+            "jo\nLD\nPZ\n\nqx",
+            "Je\nuSz\nO\nndwk\nM\ny\nOn\nt\n\nU",
+            "my\nKL\nNaN\nektdxk\n\nyiQ",
+            "TK\nSv\n\nAyf",
+            "tvE\nCiiAZrnZv\nbljljBEjn\nIS\nbL\n\nhKfY",
+            "zaG\nUhNRfgRiqcd\nK\nr\nf\nxCG\nfApXGU\n\nZrRF",
+            "Lb\nV\ntAVomzvqd\ndrMf\nCOVH\n\noJpLSuXkyDTH",
+            "breadth\n\ncS",
+            "Ll\nihIxVd\ns\nENu\ndurcA\ny\nbpBlGS\nG\n\nQDZ",
+            "\n\nzEFs",
+            "TjC\nGqegWV\nAYcWyUQWgI\npMzstj\nYMAJ\nq\nN\nkCsbqbJ\n\nkcSLPQtpLLEhoY",
+            "pZlEn\nvZKqquoDAULK\npremises\nTthve\n\nJ",
+            "\n\nxgKrEi",
+            "Mmy\nyJWYhcUdj\ne\nBNjSKqL\nmmthJO\niYd\nPseSBdMqQ\n\nc",
+            "lAc\nTwaHHntmOyRy\ntYeUr\njcTeUSo\nJGRE\nU\nkKNhmpA\ntrue\nv\n\neePwefoRH"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 7090,
+            "context": [
+              {
+                "type": "stored",
+                "id": 7091
+              },
+              {
+                "type": "stored",
+                "id": 7092
+              },
+              {
+                "type": "stored",
+                "id": 7093
+              },
+              {
+                "type": "stored",
+                "id": 7094
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00ba",
+            "context": [
+              {
+                "type": "stored",
+                "id": 7095
+              }
+            ]
+          },
+          "n_step": -11059953715672,
+          "goals": []
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,13 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz2/vol.v\", \"workspace\": \"/coq-dataset/repos/baz2\", \"repository\": \"/coq-dataset/repos/baz2\"}",
+    "{\"type\": \"stored\", \"id\": 6920}",
+    "{\"type\": \"stored\", \"id\": 6921}",
+    "{\"type\": \"stored\", \"id\": 6922}",
+    "{\"type\": \"stored\", \"id\": 6923}",
+    "{\"type\": \"stored\", \"id\": 6924}",
+    "{\"type\": \"stored\", \"id\": 6925}",
+    "{\"type\": \"stored\", \"id\": 6926}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
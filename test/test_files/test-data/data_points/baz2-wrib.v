@@ -0,0 +1,8 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz2/wrib.v\", \"workspace\": \"/coq-dataset/repos/baz2\", \"repository\": \"/coq-dataset/repos/baz2\"}",
+    "{\"type\": \"stored\", \"id\": 6961}",
+    "{\"type\": \"stored\", \"id\": 6962}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,14 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz2/wwmjdn.v\", \"workspace\": \"/coq-dataset/repos/baz2\", \"repository\": \"/coq-dataset/repos/baz2\"}",
+    "{\"type\": \"stored\", \"id\": 7102}",
+    "{\"type\": \"stored\", \"id\": 7103}",
+    "{\"type\": \"stored\", \"id\": 7104}",
+    "{\"type\": \"stored\", \"id\": 7105}",
+    "{\"type\": \"stored\", \"id\": 7106}",
+    "{\"type\": \"stored\", \"id\": 7107}",
+    "{\"type\": \"stored\", \"id\": 7108}",
+    "{\"type\": \"stored\", \"id\": 7109}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,13 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz2/xl.v\", \"workspace\": \"/coq-dataset/repos/baz2\", \"repository\": \"/coq-dataset/repos/baz2\"}",
+    "{\"type\": \"stored\", \"id\": 6927}",
+    "{\"type\": \"stored\", \"id\": 6928}",
+    "{\"type\": \"stored\", \"id\": 6929}",
+    "{\"type\": \"stored\", \"id\": 6930}",
+    "{\"type\": \"stored\", \"id\": 6931}",
+    "{\"type\": \"stored\", \"id\": 6932}",
+    "{\"type\": \"stored\", \"id\": 6933}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
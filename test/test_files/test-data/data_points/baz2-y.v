@@ -0,0 +1,8 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz2/y.v\", \"workspace\": \"/coq-dataset/repos/baz2\", \"repository\": \"/coq-dataset/repos/baz2\"}",
+    "{\"type\": \"stored\", \"id\": 7199}",
+    "{\"type\": \"stored\", \"id\": 7200}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
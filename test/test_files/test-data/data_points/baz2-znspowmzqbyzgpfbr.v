@@ -0,0 +1,61 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz2/znspowmzqbyzgpfbr.v\", \"workspace\": \"/coq-dataset/repos/baz2\", \"repository\": \"/coq-dataset/repos/baz2\"}",
+    "{\"type\": \"stored\", \"id\": 6821}",
+    "{\"type\": \"stored\", \"id\": 6822}",
+    "{\"type\": \"stored\", \"id\": 6823}",
+    "{\"type\": \"stored\", \"id\": 6824}",
+    "{\"type\": \"stored\", \"id\": 6825}",
+    "{\"type\": \"stored\", \"id\": 6826}",
+    "{\"type\": \"stored\", \"id\": 6827}",
+    "{\"type\": \"stored\", \"id\": 6828}",
+    "{\"type\": \"stored\", \"id\": 6829}",
+    "{\"type\": \"stored\", \"id\": 6830}",
+    "{\"type\": \"stored\", \"id\": 6831}",
+    "{\"type\": \"stored\", \"id\": 6832}",
+    "{\"type\": \"stored\", \"id\": 6833}",
+    "{\"type\": \"stored\", \"id\": 6834}",
+    "{\"type\": \"stored\", \"id\": 6835}",
+    "{\"type\": \"stored\", \"id\": 6836}",
+    "{\"type\": \"stored\", \"id\": 6837}",
+    "{\"type\": \"stored\", \"id\": 6838}",
+    "{\"type\": \"stored\", \"id\": 6839}",
+    "{\"type\": \"stored\", \"id\": 6840}",
+    "{\"type\": \"stored\", \"id\": 6841}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 6842,
+        "context": [
+          {
+            "type": "stored",
+            "id": 6843
+          },
+          {
+            "type": "stored",
+            "id": 6844
+          },
+          {
+            "type": "stored",
+            "id": 6845
+          },
+          {
+            "type": "stored",
+            "id": 6846
+          },
+          {
+            "type": "stored",
+            "id": 6847
+          },
+          {
+            "type": "stored",
+            "id": 6848
+          }
+        ]
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
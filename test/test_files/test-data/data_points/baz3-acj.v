@@ -0,0 +1,268 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz3/acj.v\", \"workspace\": \"/coq-dataset/repos/baz3\", \"repository\": \"/coq-dataset/repos/baz3\"}",
+    "{\"type\": \"stored\", \"id\": 7530}",
+    "{\"type\": \"stored\", \"id\": 7531}",
+    "{\"type\": \"stored\", \"id\": 7532}",
+    "{\"type\": \"stored\", \"id\": 7533}",
+    "{\"type\": \"stored\", \"id\": 7534}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 7535,
+        "context": [
+          {
+            "type": "stored",
+            "id": 7536
+          },
+          {
+            "type": "stored",
+            "id": 7537
+          },
+          {
+            "type": "stored",
+            "id": 7538
+          },
+          {
+            "type": "stored",
+            "id": 7539
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 7540,
+            "context": [
+              {
+                "type": "stored",
+                "id": 7541
+              },
+              {
+                "type": "stored",
+                "id": 7542
+              },
+              {
+                "type": "stored",
+                "id": 7543
+              },
+              {
+                "type": "stored",
+                "id": 7544
+              },
+              {
+                "type": "stored",
+                "id": 7545
+              },
+              {
+                "type": "stored",
+                "id": 7546
+              },
+              {
+                "type": "stored",
+                "id": 7547
+              },
+              {
+                "type": "stored",
+                "id": 7548
+              },
+              {
+                "type": "stored",
+                "id": 7549
+              },
+              {
+                "type": "stored",
+                "id": 7550
+              },
+              {
+                "type": "stored",
+                "id": 7551
+              },
+              {
+                "type": "stored",
+                "id": 7552
+              },
+              {
+                "type": "stored",
+                "id": 7553
+              },
+              {
+                "type": "stored",
+                "id": 7554
+              },
+              {
+                "type": "stored",
+                "id": 7555
+              },
+              {
+                "type": "stored",
+                "id": 7556
+              },
+              {
+                "type": "stored",
+                "id": 7557
+              },
+              {
+                "type": "stored",
+                "id": 7558
+              },
+              {
+                "type": "stored",
+                "id": 7559
+              },
+              {
+                "type": "stored",
+                "id": 7560
+              }
+            ]
+          },
+          "step": {
+            "text": "\u0018",
+            "context": []
+          },
+          "n_step": 42446192642,
+          "goals": [
+            "oPTal\npLjqy\nuxQEzSFZVj\nnxk\nSxAglCC\n\nPfuI",
+            "Uta\nlez\nH\nTJAns\nzpWhEEyCXM\nefW\nQjgi\n\nproof"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 7561,
+            "context": [
+              {
+                "type": "stored",
+                "id": 7562
+              }
+            ]
+          },
+          "step": {
+            "text": "P\u0019\ud882\udc70V\ud9c2\udc4c\u00fb\u00b6\u00fd3(\udb3b\udff6\uda38\ude91It\u00ed\f\u008f\u00ca\u00d8",
+            "context": [
+              {
+                "type": "stored",
+                "id": 7563
+              },
+              {
+                "type": "stored",
+                "id": 7564
+              },
+              {
+                "type": "stored",
+                "id": 7565
+              },
+              {
+                "type": "stored",
+                "id": 7566
+              },
+              {
+                "type": "stored",
+                "id": 7567
+              }
+            ]
+          },
+          "n_step": -469,
+          "goals": [
+            "breadth\nhFGyQdSxQbG\nxC\nd\ncapabilities\nLPi\nt\nrEuJimYxB\nOeCXBgD\ncXOyvRnPMOy\nitil\nGOogSIMaEXAjlJejI\nGybccUxHqcEzQsXIChjMkLrHQfQjdaQckTu\nb\nm\n\nt",
+            "TRUE\n\neBywyuYaugKCn",
+            "v\n\nf",
+            "\n\nwxu",
+            "NHAKatcBARq\nWoHnCEc\nO\nr\nSzaDPntXa\nvectorized\ns\nBlbQnEExo\nOaqABLSmQ\nRcy\nQaUnC\n\ntrue",
+            "Lf\n\nAsiTfZW",
+            "\n\nJKTfeMYrubyoHw",
+            "R\nZv\nZDH\nSSlLSg\nbx\nsplit\n\nz"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 7568,
+            "context": []
+          },
+          "step": {
+            "text": "\u00e7,s\u0004JI",
+            "context": [
+              {
+                "type": "stored",
+                "id": 7569
+              },
+              {
+                "type": "stored",
+                "id": 7570
+              },
+              {
+                "type": "stored",
+                "id": 7571
+              }
+            ]
+          },
+          "n_step": 4506,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 7572,
+            "context": [
+              {
+                "type": "stored",
+                "id": 7573
+              },
+              {
+                "type": "stored",
+                "id": 7574
+              },
+              {
+                "type": "stored",
+                "id": 7575
+              },
+              {
+                "type": "stored",
+                "id": 7576
+              },
+              {
+                "type": "stored",
+                "id": 7577
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00c5L",
+            "context": []
+          },
+          "n_step": -321,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 7578,
+            "context": [
+              {
+                "type": "stored",
+                "id": 7579
+              },
+              {
+                "type": "stored",
+                "id": 7580
+              }
+            ]
+          },
+          "step": {
+            "text": ":\u00bbZ\u00c6^\u00e7\u001dD\fXG\ud9ac\ude81\u001a.^\u0003\u00cf\uda89\udd0b\ud951\udc2aL\ud8cf\udf9b )\u00d9\u00e1\u0002",
+            "context": []
+          },
+          "n_step": 1024,
+          "goals": [
+            "\n\nKnRHDJn",
+            "E\n\nw"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
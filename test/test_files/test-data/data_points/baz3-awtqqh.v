@@ -0,0 +1,35 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz3/awtqqh.v\", \"workspace\": \"/coq-dataset/repos/baz3\", \"repository\": \"/coq-dataset/repos/baz3\"}",
+    "{\"type\": \"stored\", \"id\": 7758}",
+    "{\"type\": \"stored\", \"id\": 7759}",
+    "{\"type\": \"stored\", \"id\": 7760}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 7761,
+        "context": []
+      },
+      "steps": []
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 7762,
+        "context": [
+          {
+            "type": "stored",
+            "id": 7763
+          },
+          {
+            "type": "stored",
+            "id": 7764
+          }
+        ]
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
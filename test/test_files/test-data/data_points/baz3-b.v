@@ -0,0 +1,223 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz3/b.v\", \"workspace\": \"/coq-dataset/repos/baz3\", \"repository\": \"/coq-dataset/repos/baz3\"}",
+    "{\"type\": \"stored\", \"id\": 7478}",
+    "{\"type\": \"stored\", \"id\": 7479}",
+    "{\"type\": \"stored\", \"id\": 7480}",
+    "{\"type\": \"stored\", \"id\": 7481}",
+    "{\"type\": \"stored\", \"id\": 7482}",
+    "{\"type\": \"stored\", \"id\": 7483}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 7484,
+        "context": []
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 7485,
+            "context": [
+              {
+                "type": "stored",
+                "id": 7486
+              }
+            ]
+          },
+          "step": {
+            "text": "\uda16\udeb6\ud822\udd5e?\u00cf\u009f\u008b\ud914\ude49",
+            "context": []
+          },
+          "n_step": 50000,
+          "goals": [
+            "Fcyp\nHwT\niH\n\nhH",
+            "dKlEGN\nT\n\nXlVdVdyNaAF",
+            "\n\nY",
+            "MKbK\nnPUC\nHYbeYhpOAzWxRbToCV\n\nDh",
+            "\n\njPgWMftvnCX",
+            "ehA\nY\ne\njQ\ndxXMjIl\nzUO\nMj\naA\ns\ndUM\n\nj",
+            "wsciRLq\nNZTxDBL\ncgvFol\nfiacNBdLdVRtGQCKONHCMv\nD\nP\n\nlZ",
+            "FKRPLbhUBZeIWHHE\nDVxTmiXhV\n\nDh"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 7487,
+            "context": [
+              {
+                "type": "stored",
+                "id": 7488
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00dc",
+            "context": [
+              {
+                "type": "stored",
+                "id": 7489
+              },
+              {
+                "type": "stored",
+                "id": 7490
+              },
+              {
+                "type": "stored",
+                "id": 7491
+              },
+              {
+                "type": "stored",
+                "id": 7492
+              },
+              {
+                "type": "stored",
+                "id": 7493
+              }
+            ]
+          },
+          "n_step": -1256,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 7494,
+            "context": [
+              {
+                "type": "stored",
+                "id": 7495
+              },
+              {
+                "type": "stored",
+                "id": 7496
+              },
+              {
+                "type": "stored",
+                "id": 7497
+              },
+              {
+                "type": "stored",
+                "id": 7498
+              },
+              {
+                "type": "stored",
+                "id": 7499
+              },
+              {
+                "type": "stored",
+                "id": 7500
+              },
+              {
+                "type": "stored",
+                "id": 7501
+              },
+              {
+                "type": "stored",
+                "id": 7502
+              },
+              {
+                "type": "stored",
+                "id": 7503
+              },
+              {
+                "type": "stored",
+                "id": 7504
+              }
+            ]
+          },
+          "step": {
+            "text": "ID",
+            "context": [
+              {
+                "type": "stored",
+                "id": 7505
+              },
+              {
+                "type": "stored",
+                "id": 7506
+              },
+              {
+                "type": "stored",
+                "id": 7507
+              },
+              {
+                "type": "stored",
+                "id": 7508
+              },
+              {
+                "type": "stored",
+                "id": 7509
+              },
+              {
+                "type": "stored",
+                "id": 7510
+              },
+              {
+                "type": "stored",
+                "id": 7511
+              },
+              {
+                "type": "stored",
+                "id": 7512
+              },
+              {
+                "type": "stored",
+                "id": 7513
+              },
+              {
+                "type": "stored",
+                "id": 7514
+              },
+              {
+                "type": "stored",
+                "id": 7515
+              },
+              {
+                "type": "stored",
+                "id": 7516
+              }
+            ]
+          },
+          "n_step": 349930154,
+          "goals": [
+            "uBFOatqorNNs\nCs\nfiDCSpP\nLgKCEFeJ\niK\nMVaD\nFIBHmCDoJ\n\nR",
+            "CIR\nrd\nId\nxvtEjUxvs\n\nhOE",
+            "GoxLCbaUB\nLoRZuBkr\n\njkQ",
+            "yPVxQIXyCAozhsTmcyBuYhMV\n\nyr",
+            "OXVogJGrQSHhcJbNi\nPYa\nMM\nZB\nOO\nRO\nVhOr\nV\nbXyV\nNIL\n\nsZ",
+            "sHj\n\nYZ",
+            "LK\n\nlabel",
+            "Do\nR\n\nSSZDYLGzFgovEDxrFvkDyacDygCrfuQzpjVQfmfvwmbleqSW",
+            "ap\nVFmf\nXTb\nshLDShBr\npMoxOHho\n\nhkmYqTpaWNXeBp",
+            "txXHKafFosjPZ\nwjtwES\nvMMML\nnDdocJqKUCbYbTlpXqtaSy\n\nHaUGPXhlCwdORiFGcjvhfoT",
+            "SWQwZ\nej\nVTKJIBIe\nJDQpioCTn\nmYys\n\nbRywKeRa",
+            "GjJbpRGF\ncVygsHpC\nE\nQWUfV\nFpgy\nMn\nkRpLp\npcoW\nbBouCqrreFdDjNA\njXmF\nGLVw\nuyRJE\nLWFU\n\niy"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 7517,
+            "context": []
+          },
+          "step": {
+            "text": "TO\u009e\u00d3\u00f9\"",
+            "context": []
+          },
+          "n_step": -58572489,
+          "goals": [
+            "h\n\nZk",
+            "sRky\nZbYSNcLDMaTWChma\nFwtENgTzbjn\nzuuyXMdPouYgrpzABqloYA\nRp\neV\nNPzelIOPRkuZBQhj\ngl\nW\nr\n\ncKTPQjiXpraDQKjMJ",
+            "Ft\nfxmjjzOg\nNcDKaqGg\nzcmbOmsmxeS\npjeNzaWCWSYt\n\nkhM",
+            "GGADOOdY\njjes\nx\noT\nkqxIF\nak\nRyAHtDLov\n\nnQxJAFGNYz",
+            "qfeU\nWZzRfEnGk\nIqSEHn\nWRpt\nax\nSYyD\nEuhvB\ncO\nmwCcC\nOTHER\nWtCIQaeBzD\nX\nE\nzkjHRFhCdlu\nTheorem\nXw\npkJZPPEEjzBajgua\nQdZqPa\nAmugwa\nn\npiYFe\nqENKLWjJKR\ngt\nscripts\n\nglAQjkcMeqw"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
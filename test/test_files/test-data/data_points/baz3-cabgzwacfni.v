@@ -0,0 +1,163 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz3/cabgzwacfni.v\", \"workspace\": \"/coq-dataset/repos/baz3\", \"repository\": \"/coq-dataset/repos/baz3\"}",
+    "{\"type\": \"stored\", \"id\": 7203}",
+    "{\"type\": \"stored\", \"id\": 7204}",
+    "{\"type\": \"stored\", \"id\": 7205}",
+    "{\"type\": \"stored\", \"id\": 7206}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 7207,
+        "context": [
+          {
+            "type": "stored",
+            "id": 7208
+          },
+          {
+            "type": "stored",
+            "id": 7209
+          },
+          {
+            "type": "stored",
+            "id": 7210
+          },
+          {
+            "type": "stored",
+            "id": 7211
+          },
+          {
+            "type": "stored",
+            "id": 7212
+          },
+          {
+            "type": "stored",
+            "id": 7213
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 7214,
+            "context": [
+              {
+                "type": "stored",
+                "id": 7215
+              },
+              {
+                "type": "stored",
+                "id": 7216
+              },
+              {
+                "type": "stored",
+                "id": 7217
+              },
+              {
+                "type": "stored",
+                "id": 7218
+              },
+              {
+                "type": "stored",
+                "id": 7219
+              },
+              {
+                "type": "stored",
+                "id": 7220
+              },
+              {
+                "type": "stored",
+                "id": 7221
+              },
+              {
+                "type": "stored",
+                "id": 7222
+              },
+              {
+                "type": "stored",
+                "id": 7223
+              },
+              {
+                "type": "stored",
+                "id": 7224
+              },
+              {
+                "type": "stored",
+                "id": 7225
+              },
+              {
+                "type": "stored",
+                "id": 7226
+              },
+              {
+                "type": "stored",
+                "id": 7227
+              },
+              {
+                "type": "stored",
+                "id": 7228
+              },
+              {
+                "type": "stored",
+                "id": 7229
+              },
+              {
+                "type": "stored",
+                "id": 7230
+              }
+            ]
+          },
+          "step": {
+            "text": "\u009e\u00ff\u00ec",
+            "context": [
+              {
+                "type": "stored",
+                "id": 7231
+              },
+              {
+                "type": "stored",
+                "id": 7232
+              }
+            ]
+          },
+          "n_step": 80097152,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 7233,
+            "context": [
+              {
+                "type": "stored",
+                "id": 7234
+              },
+              {
+                "type": "stored",
+                "id": 7235
+              },
+              {
+                "type": "stored",
+                "id": 7236
+              }
+            ]
+          },
+          "step": {
+            "text": "\u0000",
+            "context": [
+              {
+                "type": "stored",
+                "id": 7237
+              }
+            ]
+          },
+          "n_step": -1000000000001,
+          "goals": []
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,277 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz3/ciwt.v\", \"workspace\": \"/coq-dataset/repos/baz3\", \"repository\": \"/coq-dataset/repos/baz3\"}",
+    "{\"type\": \"stored\", \"id\": 7357}",
+    "{\"type\": \"stored\", \"id\": 7358}",
+    "{\"type\": \"stored\", \"id\": 7359}",
+    "{\"type\": \"stored\", \"id\": 7360}",
+    "{\"type\": \"stored\", \"id\": 7361}",
+    "{\"type\": \"stored\", \"id\": 7362}",
+    "{\"type\": \"stored\", \"id\": 7363}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 7364,
+        "context": [
+          {
+            "type": "stored",
+            "id": 7365
+          },
+          {
+            "type": "stored",
+            "id": 7366
+          },
+          {
+            "type": "stored",
+            "id": 7367
+          },
+          {
+            "type": "stored",
+            "id": 7368
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 7369,
+            "context": [
+              {
+                "type": "stored",
+                "id": 7370
+              },
+              {
+                "type": "stored",
+                "id": 7371
+              },
+              {
+                "type": "stored",
+                "id": 7372
+              },
+              {
+                "type": "stored",
+                "id": 7373
+              },
+              {
+                "type": "stored",
+                "id": 7374
+              },
+              {
+                "type": "stored",
+                "id": 7375
+              },
+              {
+                "type": "stored",
+                "id": 7376
+              },
+              {
+                "type": "stored",
+                "id": 7377
+              },
+              {
+                "type": "stored",
+                "id": 7378
+              },
+              {
+                "type": "stored",
+                "id": 7379
+              },
+              {
+                "type": "stored",
+                "id": 7380
+              },
+              {
+                "type": "stored",
+                "id": 7381
+              },
+              {
+                "type": "stored",
+                "id": 7382
+              },
+              {
+                "type": "stored",
+                "id": 7383
+              },
+              {
+                "type": "stored",
+                "id": 7384
+              },
+              {
+                "type": "stored",
+                "id": 7385
+              },
+              {
+                "type": "stored",
+                "id": 7386
+              },
+              {
+                "type": "stored",
+                "id": 7387
+              },
+              {
+                "type": "stored",
+                "id": 7388
+              },
+              {
+                "type": "stored",
+                "id": 7389
+              },
+              {
+                "type": "stored",
+                "id": 7390
+              },
+              {
+                "type": "stored",
+                "id": 7391
+              },
+              {
+                "type": "stored",
+                "id": 7392
+              },
+              {
+                "type": "stored",
+                "id": 7393
+              },
+              {
+                "type": "stored",
+                "id": 7394
+              },
+              {
+                "type": "stored",
+                "id": 7395
+              },
+              {
+                "type": "stored",
+                "id": 7396
+              },
+              {
+                "type": "stored",
+                "id": 7397
+              },
+              {
+                "type": "stored",
+                "id": 7398
+              },
+              {
+                "type": "stored",
+                "id": 7399
+              },
+              {
+                "type": "stored",
+                "id": 7400
+              },
+              {
+                "type": "stored",
+                "id": 7401
+              },
+              {
+                "type": "stored",
+                "id": 7402
+              }
+            ]
+          },
+          "step": {
+            "text": "vocab",
+            "context": [
+              {
+                "type": "stored",
+                "id": 7403
+              },
+              {
+                "type": "stored",
+                "id": 7404
+              },
+              {
+                "type": "stored",
+                "id": 7405
+              },
+              {
+                "type": "stored",
+                "id": 7406
+              },
+              {
+                "type": "stored",
+                "id": 7407
+              },
+              {
+                "type": "stored",
+                "id": 7408
+              }
+            ]
+          },
+          "n_step": 594855432326352,
+          "goals": [
+            "\n\nEoNWQJI",
+            "R\ne\nr\nvocab\nzqWH\nlcdb\nfZPrBL\noT\nhvJAMRqLLrYPFoBXXAbQH\n\nyZJrhaS",
+            "Scunthorpe\n\nGfDwhN"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 7409,
+            "context": [
+              {
+                "type": "stored",
+                "id": 7410
+              }
+            ]
+          },
+          "step": {
+            "text": "_\u00cdY\u00c1\u00c7",
+            "context": [
+              {
+                "type": "stored",
+                "id": 7411
+              },
+              {
+                "type": "stored",
+                "id": 7412
+              },
+              {
+                "type": "stored",
+                "id": 7413
+              },
+              {
+                "type": "stored",
+                "id": 7414
+              },
+              {
+                "type": "stored",
+                "id": 7415
+              },
+              {
+                "type": "stored",
+                "id": 7416
+              },
+              {
+                "type": "stored",
+                "id": 7417
+              },
+              {
+                "type": "stored",
+                "id": 7418
+              }
+            ]
+          },
+          "n_step": 764,
+          "goals": [
+            "VQLl\nvxbhF\n\ngObKxoiMtAwOq",
+            "ay\n\ntextDocumentSync",
+            "szSrk\niyirTUb\nYrMZkAlW\ncUbhupY\nn\nr\n\ngxusjvgJVn",
+            "UPJGPzrC\nfvUVzWWXhNh\nvNrbEdOzkvY\nqhV\nZaV\nG\np\ncE\neb\noxycH\nmTitXlHlt\n\nzpnUFfv",
+            "aPIHN\n\npkhU",
+            "hv\nXAOw\noyQ\nopenai\nrKZdoYULqJClEPjlWH\n\nmwf",
+            "\n\nBfh",
+            "oHkQzvI\n\nRtp",
+            "k\nUUUpszRSv\nkbCKNqf\n\nhbKmgyUkv",
+            "eKvymn\nxloIsPidoaVPTeyNPUDCX\nFalse\nO\nsCvLy\ngIv\nwlG\nIrKxEpvfAOZjfWLNbqGZ\n\nb"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,23 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz3/cqhlgcc.v\", \"workspace\": \"/coq-dataset/repos/baz3\", \"repository\": \"/coq-dataset/repos/baz3\"}",
+    "{\"type\": \"stored\", \"id\": 7287}",
+    "{\"type\": \"stored\", \"id\": 7288}",
+    "{\"type\": \"stored\", \"id\": 7289}",
+    "{\"type\": \"stored\", \"id\": 7290}",
+    "{\"type\": \"stored\", \"id\": 7291}",
+    "{\"type\": \"stored\", \"id\": 7292}",
+    "{\"type\": \"stored\", \"id\": 7293}",
+    "{\"type\": \"stored\", \"id\": 7294}",
+    "{\"type\": \"stored\", \"id\": 7295}",
+    "{\"type\": \"stored\", \"id\": 7296}",
+    "{\"type\": \"stored\", \"id\": 7297}",
+    "{\"type\": \"stored\", \"id\": 7298}",
+    "{\"type\": \"stored\", \"id\": 7299}",
+    "{\"type\": \"stored\", \"id\": 7300}",
+    "{\"type\": \"stored\", \"id\": 7301}",
+    "{\"type\": \"stored\", \"id\": 7302}",
+    "{\"type\": \"stored\", \"id\": 7303}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
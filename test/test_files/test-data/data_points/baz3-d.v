@@ -0,0 +1,106 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz3/d.v\", \"workspace\": \"/coq-dataset/repos/baz3\", \"repository\": \"/coq-dataset/repos/baz3\"}",
+    "{\"type\": \"stored\", \"id\": 7452}",
+    "{\"type\": \"stored\", \"id\": 7453}",
+    "{\"type\": \"stored\", \"id\": 7454}",
+    "{\"type\": \"stored\", \"id\": 7455}",
+    "{\"type\": \"stored\", \"id\": 7456}",
+    "{\"type\": \"stored\", \"id\": 7457}",
+    "{\"type\": \"stored\", \"id\": 7458}",
+    "{\"type\": \"stored\", \"id\": 7459}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 7460,
+        "context": []
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 7461,
+            "context": [
+              {
+                "type": "stored",
+                "id": 7462
+              },
+              {
+                "type": "stored",
+                "id": 7463
+              },
+              {
+                "type": "stored",
+                "id": 7464
+              },
+              {
+                "type": "stored",
+                "id": 7465
+              },
+              {
+                "type": "stored",
+                "id": 7466
+              },
+              {
+                "type": "stored",
+                "id": 7467
+              },
+              {
+                "type": "stored",
+                "id": 7468
+              },
+              {
+                "type": "stored",
+                "id": 7469
+              },
+              {
+                "type": "stored",
+                "id": 7470
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00f2\u00f4n",
+            "context": [
+              {
+                "type": "stored",
+                "id": 7471
+              },
+              {
+                "type": "stored",
+                "id": 7472
+              },
+              {
+                "type": "stored",
+                "id": 7473
+              },
+              {
+                "type": "stored",
+                "id": 7474
+              },
+              {
+                "type": "stored",
+                "id": 7475
+              },
+              {
+                "type": "stored",
+                "id": 7476
+              },
+              {
+                "type": "stored",
+                "id": 7477
+              }
+            ]
+          },
+          "n_step": 100,
+          "goals": [
+            "GftZCIU\nC\nfalse\ndufNRaHlWsVf\nIiC\nQVViHzThGQ\n\nI",
+            "g\n\nqweqqvBLDO"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
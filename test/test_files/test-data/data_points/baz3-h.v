@@ -0,0 +1,9 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz3/h.v\", \"workspace\": \"/coq-dataset/repos/baz3\", \"repository\": \"/coq-dataset/repos/baz3\"}",
+    "{\"type\": \"stored\", \"id\": 7765}",
+    "{\"type\": \"stored\", \"id\": 7766}",
+    "{\"type\": \"stored\", \"id\": 7767}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
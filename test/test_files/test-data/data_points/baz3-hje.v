@@ -0,0 +1,12 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz3/hje.v\", \"workspace\": \"/coq-dataset/repos/baz3\", \"repository\": \"/coq-dataset/repos/baz3\"}",
+    "{\"type\": \"stored\", \"id\": 7281}",
+    "{\"type\": \"stored\", \"id\": 7282}",
+    "{\"type\": \"stored\", \"id\": 7283}",
+    "{\"type\": \"stored\", \"id\": 7284}",
+    "{\"type\": \"stored\", \"id\": 7285}",
+    "{\"type\": \"stored\", \"id\": 7286}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
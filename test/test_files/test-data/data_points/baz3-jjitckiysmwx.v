@@ -0,0 +1,93 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz3/jjitckiysmwx.v\", \"workspace\": \"/coq-dataset/repos/baz3\", \"repository\": \"/coq-dataset/repos/baz3\"}",
+    "{\"type\": \"stored\", \"id\": 7627}",
+    "{\"type\": \"stored\", \"id\": 7628}",
+    "{\"type\": \"stored\", \"id\": 7629}",
+    "{\"type\": \"stored\", \"id\": 7630}",
+    "{\"type\": \"stored\", \"id\": 7631}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 7632,
+        "context": [
+          {
+            "type": "stored",
+            "id": 7633
+          },
+          {
+            "type": "stored",
+            "id": 7634
+          },
+          {
+            "type": "stored",
+            "id": 7635
+          },
+          {
+            "type": "stored",
+            "id": 7636
+          },
+          {
+            "type": "stored",
+            "id": 7637
+          },
+          {
+            "type": "stored",
+            "id": 7638
+          },
+          {
+            "type": "stored",
+            "id": 7639
+          },
+          {
+            "type": "stored",
+            "id": 7640
+          },
+          {
+            "type": "stored",
+            "id": 7641
+          },
+          {
+            "type": "stored",
+            "id": 7642
+          },
+          {
+            "type": "stored",
+            "id": 7643
+          },
+          {
+            "type": "stored",
+            "id": 7644
+          },
+          {
+            "type": "stored",
+            "id": 7645
+          },
+          {
+            "type": "stored",
+            "id": 7646
+          },
+          {
+            "type": "stored",
+            "id": 7647
+          },
+          {
+            "type": "stored",
+            "id": 7648
+          },
+          {
+            "type": "stored",
+            "id": 7649
+          },
+          {
+            "type": "stored",
+            "id": 7650
+          }
+        ]
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,23 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz3/kdd.v\", \"workspace\": \"/coq-dataset/repos/baz3\", \"repository\": \"/coq-dataset/repos/baz3\"}",
+    "{\"type\": \"stored\", \"id\": 7419}",
+    "{\"type\": \"stored\", \"id\": 7420}",
+    "{\"type\": \"stored\", \"id\": 7421}",
+    "{\"type\": \"stored\", \"id\": 7422}",
+    "{\"type\": \"stored\", \"id\": 7423}",
+    "{\"type\": \"stored\", \"id\": 7424}",
+    "{\"type\": \"stored\", \"id\": 7425}",
+    "{\"type\": \"stored\", \"id\": 7426}",
+    "{\"type\": \"stored\", \"id\": 7427}",
+    "{\"type\": \"stored\", \"id\": 7428}",
+    "{\"type\": \"stored\", \"id\": 7429}",
+    "{\"type\": \"stored\", \"id\": 7430}",
+    "{\"type\": \"stored\", \"id\": 7431}",
+    "{\"type\": \"stored\", \"id\": 7432}",
+    "{\"type\": \"stored\", \"id\": 7433}",
+    "{\"type\": \"stored\", \"id\": 7434}",
+    "{\"type\": \"stored\", \"id\": 7435}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
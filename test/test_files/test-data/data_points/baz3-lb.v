@@ -0,0 +1,18 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz3/lb.v\", \"workspace\": \"/coq-dataset/repos/baz3\", \"repository\": \"/coq-dataset/repos/baz3\"}",
+    "{\"type\": \"stored\", \"id\": 7518}",
+    "{\"type\": \"stored\", \"id\": 7519}",
+    "{\"type\": \"stored\", \"id\": 7520}",
+    "{\"type\": \"stored\", \"id\": 7521}",
+    "{\"type\": \"stored\", \"id\": 7522}",
+    "{\"type\": \"stored\", \"id\": 7523}",
+    "{\"type\": \"stored\", \"id\": 7524}",
+    "{\"type\": \"stored\", \"id\": 7525}",
+    "{\"type\": \"stored\", \"id\": 7526}",
+    "{\"type\": \"stored\", \"id\": 7527}",
+    "{\"type\": \"stored\", \"id\": 7528}",
+    "{\"type\": \"stored\", \"id\": 7529}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
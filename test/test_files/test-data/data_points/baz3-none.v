@@ -0,0 +1,18 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz3/none.v\", \"workspace\": \"/coq-dataset/repos/baz3\", \"repository\": \"/coq-dataset/repos/baz3\"}",
+    "{\"type\": \"stored\", \"id\": 7768}",
+    "{\"type\": \"stored\", \"id\": 7769}",
+    "{\"type\": \"stored\", \"id\": 7770}",
+    "{\"type\": \"stored\", \"id\": 7771}",
+    "{\"type\": \"stored\", \"id\": 7772}",
+    "{\"type\": \"stored\", \"id\": 7773}",
+    "{\"type\": \"stored\", \"id\": 7774}",
+    "{\"type\": \"stored\", \"id\": 7775}",
+    "{\"type\": \"stored\", \"id\": 7776}",
+    "{\"type\": \"stored\", \"id\": 7777}",
+    "{\"type\": \"stored\", \"id\": 7778}",
+    "{\"type\": \"stored\", \"id\": 7779}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,227 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz3/nvwgwdg.v\", \"workspace\": \"/coq-dataset/repos/baz3\", \"repository\": \"/coq-dataset/repos/baz3\"}",
+    "{\"type\": \"stored\", \"id\": 7238}",
+    "{\"type\": \"stored\", \"id\": 7239}",
+    "{\"type\": \"stored\", \"id\": 7240}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 7241,
+        "context": [
+          {
+            "type": "stored",
+            "id": 7242
+          },
+          {
+            "type": "stored",
+            "id": 7243
+          },
+          {
+            "type": "stored",
+            "id": 7244
+          },
+          {
+            "type": "stored",
+            "id": 7245
+          },
+          {
+            "type": "stored",
+            "id": 7246
+          },
+          {
+            "type": "stored",
+            "id": 7247
+          },
+          {
+            "type": "stored",
+            "id": 7248
+          },
+          {
+            "type": "stored",
+            "id": 7249
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 7250,
+            "context": [
+              {
+                "type": "stored",
+                "id": 7251
+              },
+              {
+                "type": "stored",
+                "id": 7252
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00ca",
+            "context": [
+              {
+                "type": "stored",
+                "id": 7253
+              },
+              {
+                "type": "stored",
+                "id": 7254
+              },
+              {
+                "type": "stored",
+                "id": 7255
+              },
+              {
+                "type": "stored",
+                "id": 7256
+              }
+            ]
+          },
+          "n_step": 86065991,
+          "goals": [
+            "wL\npD\nOyMXtrSMvH\nA\nXVLh\nfpPKympGJM\nk\n\nbSp",
+            "\n\nrR",
+            "OuaWHjzaoCTZ\neKh\n\ncYuaxhoKzUnJbiObdzH",
+            "\n\nz"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 7257,
+            "context": [
+              {
+                "type": "stored",
+                "id": 7258
+              },
+              {
+                "type": "stored",
+                "id": 7259
+              },
+              {
+                "type": "stored",
+                "id": 7260
+              },
+              {
+                "type": "stored",
+                "id": 7261
+              }
+            ]
+          },
+          "step": {
+            "text": "\u0098\u0089p\u00c4 \u00cc\ud9c3\ude4c\u00d7f\u008dsV\u001c\ud91a\udc0f\ud900\ude2e\u00ad\ud94e\ude36\u00e9",
+            "context": []
+          },
+          "n_step": 10944385310550086,
+          "goals": [
+            "tZrkPywAG\nyWNcCuXc\nzAJU\nif\nkukqTFrYKEpMsjro\nZm\n\npXY",
+            "VX\n\nrbHBg",
+            "\n\nNoF",
+            "E\ngAwBv\np\nxNIhcd\niAHDvyyYtQB\nekq\n\nfree",
+            "T\n\nXY"
+          ]
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 7262,
+        "context": [
+          {
+            "type": "stored",
+            "id": 7263
+          },
+          {
+            "type": "stored",
+            "id": 7264
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 7265,
+            "context": [
+              {
+                "type": "stored",
+                "id": 7266
+              },
+              {
+                "type": "stored",
+                "id": 7267
+              },
+              {
+                "type": "stored",
+                "id": 7268
+              },
+              {
+                "type": "stored",
+                "id": 7269
+              },
+              {
+                "type": "stored",
+                "id": 7270
+              },
+              {
+                "type": "stored",
+                "id": 7271
+              },
+              {
+                "type": "stored",
+                "id": 7272
+              },
+              {
+                "type": "stored",
+                "id": 7273
+              },
+              {
+                "type": "stored",
+                "id": 7274
+              },
+              {
+                "type": "stored",
+                "id": 7275
+              },
+              {
+                "type": "stored",
+                "id": 7276
+              },
+              {
+                "type": "stored",
+                "id": 7277
+              },
+              {
+                "type": "stored",
+                "id": 7278
+              },
+              {
+                "type": "stored",
+                "id": 7279
+              }
+            ]
+          },
+          "step": {
+            "text": "&\u0083\u008c",
+            "context": [
+              {
+                "type": "stored",
+                "id": 7280
+              }
+            ]
+          },
+          "n_step": 585,
+          "goals": [
+            "\n\nBs"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
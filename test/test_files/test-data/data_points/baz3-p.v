@@ -0,0 +1,209 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz3/p.v\", \"workspace\": \"/coq-dataset/repos/baz3\", \"repository\": \"/coq-dataset/repos/baz3\"}",
+    "{\"type\": \"stored\", \"id\": 7581}",
+    "{\"type\": \"stored\", \"id\": 7582}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 7583,
+        "context": [
+          {
+            "type": "stored",
+            "id": 7584
+          },
+          {
+            "type": "stored",
+            "id": 7585
+          },
+          {
+            "type": "stored",
+            "id": 7586
+          },
+          {
+            "type": "stored",
+            "id": 7587
+          },
+          {
+            "type": "stored",
+            "id": 7588
+          },
+          {
+            "type": "stored",
+            "id": 7589
+          },
+          {
+            "type": "stored",
+            "id": 7590
+          },
+          {
+            "type": "stored",
+            "id": 7591
+          },
+          {
+            "type": "stored",
+            "id": 7592
+          },
+          {
+            "type": "stored",
+            "id": 7593
+          },
+          {
+            "type": "stored",
+            "id": 7594
+          },
+          {
+            "type": "stored",
+            "id": 7595
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 7596,
+            "context": [
+              {
+                "type": "stored",
+                "id": 7597
+              },
+              {
+                "type": "stored",
+                "id": 7598
+              },
+              {
+                "type": "stored",
+                "id": 7599
+              },
+              {
+                "type": "stored",
+                "id": 7600
+              },
+              {
+                "type": "stored",
+                "id": 7601
+              },
+              {
+                "type": "stored",
+                "id": 7602
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00b3h\u00a4@~I\u00db\ud8c7\ude00\u00a1\u0017\u0090~x,",
+            "context": [
+              {
+                "type": "stored",
+                "id": 7603
+              },
+              {
+                "type": "stored",
+                "id": 7604
+              },
+              {
+                "type": "stored",
+                "id": 7605
+              },
+              {
+                "type": "stored",
+                "id": 7606
+              },
+              {
+                "type": "stored",
+                "id": 7607
+              },
+              {
+                "type": "stored",
+                "id": 7608
+              },
+              {
+                "type": "stored",
+                "id": 7609
+              },
+              {
+                "type": "stored",
+                "id": 7610
+              }
+            ]
+          },
+          "n_step": -20404713,
+          "goals": [
+            "vV\ngMMMiyTdcbtm\nR\nQs\nwYdqR\neyN\npHvOj\nLhrE\n\nckng"
+          ]
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 7611,
+        "context": [
+          {
+            "type": "stored",
+            "id": 7612
+          },
+          {
+            "type": "stored",
+            "id": 7613
+          },
+          {
+            "type": "stored",
+            "id": 7614
+          },
+          {
+            "type": "stored",
+            "id": 7615
+          },
+          {
+            "type": "stored",
+            "id": 7616
+          },
+          {
+            "type": "stored",
+            "id": 7617
+          },
+          {
+            "type": "stored",
+            "id": 7618
+          },
+          {
+            "type": "stored",
+            "id": 7619
+          },
+          {
+            "type": "stored",
+            "id": 7620
+          },
+          {
+            "type": "stored",
+            "id": 7621
+          },
+          {
+            "type": "stored",
+            "id": 7622
+          },
+          {
+            "type": "stored",
+            "id": 7623
+          },
+          {
+            "type": "stored",
+            "id": 7624
+          },
+          {
+            "type": "stored",
+            "id": 7625
+          },
+          {
+            "type": "stored",
+            "id": 7626
+          }
+        ]
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,34 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz3/qy.v\", \"workspace\": \"/coq-dataset/repos/baz3\", \"repository\": \"/coq-dataset/repos/baz3\"}",
+    "{\"type\": \"stored\", \"id\": 7347}",
+    "{\"type\": \"stored\", \"id\": 7348}",
+    "{\"type\": \"stored\", \"id\": 7349}",
+    "{\"type\": \"stored\", \"id\": 7350}",
+    "{\"type\": \"stored\", \"id\": 7351}",
+    "{\"type\": \"stored\", \"id\": 7352}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 7353,
+        "context": [
+          {
+            "type": "stored",
+            "id": 7354
+          },
+          {
+            "type": "stored",
+            "id": 7355
+          },
+          {
+            "type": "stored",
+            "id": 7356
+          }
+        ]
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
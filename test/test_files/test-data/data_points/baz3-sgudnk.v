@@ -0,0 +1,63 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz3/sgudnk.v\", \"workspace\": \"/coq-dataset/repos/baz3\", \"repository\": \"/coq-dataset/repos/baz3\"}",
+    "{\"type\": \"stored\", \"id\": 7753}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 7754,
+        "context": []
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 7755,
+            "context": [
+              {
+                "type": "stored",
+                "id": 7756
+              }
+            ]
+          },
+          "step": {
+            "text": "\\(",
+            "context": []
+          },
+          "n_step": 866,
+          "goals": [
+            "fjyAiJjdWosDzfRpkAr\nvKa\n\nns",
+            "dtE\niX\nIsOPvK\n\ng",
+            "\n\nxKgNaoPyE",
+            "S\nKqWQxcoLpw\nUZqKuITgRv\n\nRd",
+            "\n\nqHKZ",
+            "uEGPjVyq\ndErNILnMgZeBmD\n\nIR",
+            "Ejf\nAQjwAHmUgxcBvBamcMxP\nJujeXoXvdYv\nIpwuvEh\nfm\n\nvEgf",
+            "BrreJEEMQzCA\n\nnFM",
+            "wC\nbMq\ntheories\nAzJzqUi\n\nRnmvbqHMpL",
+            "PIDdE\nRodNGvSjCpVvF\nZiqiSfApl\nsOc\nfFw\nAlTRpNXYrpXg\nlDEDxOKAULEIj\nyDvKNsk\nuri\nBlLUoYdz\ntCnNJ\njAtNJEGlE\nDt\noPaUTkjJGcDvzkmfbg\noffsets\nEYUdOejN\ngBGPD\nUDyfzDUfAZrbezrF\nQl\nRmcZyltM\nbKdAzgr\nPNe\ndff\nVSgykDmGao\n\nVcrxaOAOe",
+            "em\nnhD\nxA\nSB\nSvLnBF\nA\nUkpmHoe\ngfDwp\nxLCPx\nXHNXjWZVcffVJn\nsxZIvPKYUhv\nrOTOlSeBrAzLnFbZFvi\nbMWtW\niRvUQPGJdcBi\nqjBdA\nRJD\nBjMRGE\n\nmsLUwiKlZYiVFEW",
+            "JNRXOP\nIX\nLKinaJQLfwrtP\nUCAKiaI\nIpBLWxj\nPnehBPyb\nEUGiymCpOsSD\nNgGVMP\nSibubuQeW\n\nDgGrW",
+            "K\nbv\n\nnDaHUvPegaL",
+            "\n\nUU",
+            "FdyGNnImKUiTTKLtHCCj\nstored\nBDR\njAcyxB\nGS\n\nLALkrl",
+            "DiBVIkxuFymAqoRhR\nq\ndlAciQEOEeaPSusOkAHAgHzeCa\nbmQg\ndNp\nyq\n\nGNR",
+            "BGIn\nS\nkY\n\nX",
+            "yvSAzNpkTEznEE\nxXNsfTvtkL\nvMhLLFaXgOSUhjF\ntJGHCerf\nuu\nkvikWOBxLbCSWnvbV\ne\nYDX\ngWBnZuboVdAIlI\nZlnkhcGa\n\nqXs",
+            "uz\nysR\nZGBJSzPYZy\n\nCuDL",
+            "LuYGdH\nBMZHej\nFkd\nwQHh\ncapabilities\nvnAL\nk\nGhgYLQBol\nN\n\nydbMSxj",
+            "ztZkkpa\nKArLOBT\nUS\nK\ntNrVRSlPSa\nwLjGWDN\nVw\ntRtPPE\nOCjTRFRCCZW\noSrBIaxzhy\nZdbHXm\nZmQY\nzqgJgsS\nK\nbdU\nDFLRnK\nBfvFzEWpTSWnDaOWzkrDp\n\ndDqdDH",
+            "zu\nXK\nU\nu\n\nDxLGnoZG",
+            "ox\nv\n\nnmTF",
+            "aDUTrxhNhzk\nvWW\nnhcRhOoq\nhioNCqwf\niaQodjNK\nQkL\nXa\nK\nQMTwhxu\ngit\nSXLdIGkFqJAp\n\nnxbZ",
+            "INF\nfdfGfrVT\nTD\ni\nkaUVtZr\nmP\ncoq\nye\nYAfpCduLsjRSB\nYOJZRpAayvAiCX\nlAUReokozsexZBSr\neehS\ndLfB\nA\n\nwO",
+            "qefGGL\n\nPn",
+            "To\n\nuUsal"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
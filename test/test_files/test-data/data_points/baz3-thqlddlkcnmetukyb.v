@@ -0,0 +1,293 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz3/thqlddlkcnmetukyb.v\", \"workspace\": \"/coq-dataset/repos/baz3\", \"repository\": \"/coq-dataset/repos/baz3\"}",
+    "{\"type\": \"stored\", \"id\": 7694}",
+    "{\"type\": \"stored\", \"id\": 7695}",
+    "{\"type\": \"stored\", \"id\": 7696}",
+    "{\"type\": \"stored\", \"id\": 7697}",
+    "{\"type\": \"stored\", \"id\": 7698}",
+    "{\"type\": \"stored\", \"id\": 7699}",
+    "{\"type\": \"stored\", \"id\": 7700}",
+    "{\"type\": \"stored\", \"id\": 7701}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 7702,
+        "context": []
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 7703,
+            "context": [
+              {
+                "type": "stored",
+                "id": 7704
+              },
+              {
+                "type": "stored",
+                "id": 7705
+              },
+              {
+                "type": "stored",
+                "id": 7706
+              },
+              {
+                "type": "stored",
+                "id": 7707
+              },
+              {
+                "type": "stored",
+                "id": 7708
+              },
+              {
+                "type": "stored",
+                "id": 7709
+              },
+              {
+                "type": "stored",
+                "id": 7710
+              },
+              {
+                "type": "stored",
+                "id": 7711
+              },
+              {
+                "type": "stored",
+                "id": 7712
+              },
+              {
+                "type": "stored",
+                "id": 7713
+              },
+              {
+                "type": "stored",
+                "id": 7714
+              },
+              {
+                "type": "stored",
+                "id": 7715
+              },
+              {
+                "type": "stored",
+                "id": 7716
+              },
+              {
+                "type": "stored",
+                "id": 7717
+              },
+              {
+                "type": "stored",
+                "id": 7718
+              },
+              {
+                "type": "stored",
+                "id": 7719
+              },
+              {
+                "type": "stored",
+                "id": 7720
+              },
+              {
+                "type": "stored",
+                "id": 7721
+              },
+              {
+                "type": "stored",
+                "id": 7722
+              },
+              {
+                "type": "stored",
+                "id": 7723
+              },
+              {
+                "type": "stored",
+                "id": 7724
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 7725
+              },
+              {
+                "type": "stored",
+                "id": 7726
+              },
+              {
+                "type": "stored",
+                "id": 7727
+              },
+              {
+                "type": "stored",
+                "id": 7728
+              },
+              {
+                "type": "stored",
+                "id": 7729
+              },
+              {
+                "type": "stored",
+                "id": 7730
+              }
+            ]
+          },
+          "n_step": 177,
+          "goals": [
+            "Ym\n\nt"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 7731,
+            "context": []
+          },
+          "step": {
+            "text": "\u00b4\u00bf\udaf6\udd4b",
+            "context": [
+              {
+                "type": "stored",
+                "id": 7732
+              },
+              {
+                "type": "stored",
+                "id": 7733
+              },
+              {
+                "type": "stored",
+                "id": 7734
+              },
+              {
+                "type": "stored",
+                "id": 7735
+              },
+              {
+                "type": "stored",
+                "id": 7736
+              }
+            ]
+          },
+          "n_step": -2345,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 7737,
+            "context": [
+              {
+                "type": "stored",
+                "id": 7738
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00c4\u0099\u00bbx\u00fbm\u007f\u0089",
+            "context": []
+          },
+          "n_step": -50,
+          "goals": [
+            "nvhKT\nG\nYqeagzm\nYTjKOWFavP\n\nRnGqYadVg",
+            "costs\n\ncTz",
+            "loSyY\nOChQOtk\nuqwVTQzOdNproq\nmupbB\ndUxylcOJTv\ndsfc\nUcW\nGBcH\nboTaLee\nNone\nviCV\neVwZuDjyO\nEL\ncontext\nerRCUz\njKuqgRP\nD\ntqdOA\nByeSsf\nwSDRTEyqk\nBOQD\nnkc\nXATDmVZp\n\nQIwxTWpmuclNuph",
+            "\n\nmC",
+            "codellama\njyfC\nwVJk\nWXBCBaLNgdqEcmoMopRiijUh\njWVlCXq\nYbXE\n\nYR",
+            "\n\nFouaGgGVMjwrQUZzijkkgximTD"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 7739,
+            "context": [
+              {
+                "type": "stored",
+                "id": 7740
+              },
+              {
+                "type": "stored",
+                "id": 7741
+              },
+              {
+                "type": "stored",
+                "id": 7742
+              },
+              {
+                "type": "stored",
+                "id": 7743
+              },
+              {
+                "type": "stored",
+                "id": 7744
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00ad\u0018W\u00b8\u0011\u0016",
+            "context": [
+              {
+                "type": "stored",
+                "id": 7745
+              },
+              {
+                "type": "stored",
+                "id": 7746
+              }
+            ]
+          },
+          "n_step": -2332,
+          "goals": []
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 7747,
+        "context": []
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 7748,
+            "context": [
+              {
+                "type": "stored",
+                "id": 7749
+              },
+              {
+                "type": "stored",
+                "id": 7750
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00e9\udb8c\udc25\b",
+            "context": [
+              {
+                "type": "stored",
+                "id": 7751
+              },
+              {
+                "type": "stored",
+                "id": 7752
+              }
+            ]
+          },
+          "n_step": 140035817,
+          "goals": [
+            "xlQdJn\nsKfUnFikPZ\ndWJngkejEZhRbu\neBgc\nW\n\nkk"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
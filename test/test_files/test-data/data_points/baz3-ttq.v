@@ -0,0 +1,22 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz3/ttq.v\", \"workspace\": \"/coq-dataset/repos/baz3\", \"repository\": \"/coq-dataset/repos/baz3\"}",
+    "{\"type\": \"stored\", \"id\": 7436}",
+    "{\"type\": \"stored\", \"id\": 7437}",
+    "{\"type\": \"stored\", \"id\": 7438}",
+    "{\"type\": \"stored\", \"id\": 7439}",
+    "{\"type\": \"stored\", \"id\": 7440}",
+    "{\"type\": \"stored\", \"id\": 7441}",
+    "{\"type\": \"stored\", \"id\": 7442}",
+    "{\"type\": \"stored\", \"id\": 7443}",
+    "{\"type\": \"stored\", \"id\": 7444}",
+    "{\"type\": \"stored\", \"id\": 7445}",
+    "{\"type\": \"stored\", \"id\": 7446}",
+    "{\"type\": \"stored\", \"id\": 7447}",
+    "{\"type\": \"stored\", \"id\": 7448}",
+    "{\"type\": \"stored\", \"id\": 7449}",
+    "{\"type\": \"stored\", \"id\": 7450}",
+    "{\"type\": \"stored\", \"id\": 7451}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
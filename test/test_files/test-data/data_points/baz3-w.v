@@ -0,0 +1,185 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz3/w.v\", \"workspace\": \"/coq-dataset/repos/baz3\", \"repository\": \"/coq-dataset/repos/baz3\"}",
+    "{\"type\": \"stored\", \"id\": 7651}",
+    "{\"type\": \"stored\", \"id\": 7652}",
+    "{\"type\": \"stored\", \"id\": 7653}",
+    "{\"type\": \"stored\", \"id\": 7654}",
+    "{\"type\": \"stored\", \"id\": 7655}",
+    "{\"type\": \"stored\", \"id\": 7656}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 7657,
+        "context": [
+          {
+            "type": "stored",
+            "id": 7658
+          },
+          {
+            "type": "stored",
+            "id": 7659
+          },
+          {
+            "type": "stored",
+            "id": 7660
+          },
+          {
+            "type": "stored",
+            "id": 7661
+          }
+        ]
+      },
+      "steps": []
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 7662,
+        "context": [
+          {
+            "type": "stored",
+            "id": 7663
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 7664,
+            "context": [
+              {
+                "type": "stored",
+                "id": 7665
+              },
+              {
+                "type": "stored",
+                "id": 7666
+              },
+              {
+                "type": "stored",
+                "id": 7667
+              },
+              {
+                "type": "stored",
+                "id": 7668
+              },
+              {
+                "type": "stored",
+                "id": 7669
+              },
+              {
+                "type": "stored",
+                "id": 7670
+              },
+              {
+                "type": "stored",
+                "id": 7671
+              },
+              {
+                "type": "stored",
+                "id": 7672
+              },
+              {
+                "type": "stored",
+                "id": 7673
+              },
+              {
+                "type": "stored",
+                "id": 7674
+              },
+              {
+                "type": "stored",
+                "id": 7675
+              },
+              {
+                "type": "stored",
+                "id": 7676
+              },
+              {
+                "type": "stored",
+                "id": 7677
+              },
+              {
+                "type": "stored",
+                "id": 7678
+              },
+              {
+                "type": "stored",
+                "id": 7679
+              },
+              {
+                "type": "stored",
+                "id": 7680
+              },
+              {
+                "type": "stored",
+                "id": 7681
+              },
+              {
+                "type": "stored",
+                "id": 7682
+              },
+              {
+                "type": "stored",
+                "id": 7683
+              },
+              {
+                "type": "stored",
+                "id": 7684
+              },
+              {
+                "type": "stored",
+                "id": 7685
+              },
+              {
+                "type": "stored",
+                "id": 7686
+              },
+              {
+                "type": "stored",
+                "id": 7687
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00b4\u009f\u00c6{\u00fd\u00cdW)X",
+            "context": [
+              {
+                "type": "stored",
+                "id": 7688
+              },
+              {
+                "type": "stored",
+                "id": 7689
+              },
+              {
+                "type": "stored",
+                "id": 7690
+              },
+              {
+                "type": "stored",
+                "id": 7691
+              },
+              {
+                "type": "stored",
+                "id": 7692
+              },
+              {
+                "type": "stored",
+                "id": 7693
+              }
+            ]
+          },
+          "n_step": 565941,
+          "goals": [
+            "skzVfSGEhNXdE\n\nqKhC"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
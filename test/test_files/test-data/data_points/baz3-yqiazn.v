@@ -0,0 +1,226 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz3/yqiazn.v\", \"workspace\": \"/coq-dataset/repos/baz3\", \"repository\": \"/coq-dataset/repos/baz3\"}",
+    "{\"type\": \"stored\", \"id\": 7304}",
+    "{\"type\": \"stored\", \"id\": 7305}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 7306,
+        "context": [
+          {
+            "type": "stored",
+            "id": 7307
+          },
+          {
+            "type": "stored",
+            "id": 7308
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 7309,
+            "context": [
+              {
+                "type": "stored",
+                "id": 7310
+              },
+              {
+                "type": "stored",
+                "id": 7311
+              }
+            ]
+          },
+          "step": {
+            "text": "J\f\ud8c3\ude99",
+            "context": []
+          },
+          "n_step": 111136259964,
+          "goals": [
+            "awQGt\nXClwAXnn\ngN\nMOx\n\nrdi",
+            "\n\nXnlzVxUC",
+            "IDAWEgKkKDNVUkfPzxvpzEFrryJYSx\neHdx\nZrzaPSDRymyle\nQ\njit\nxiKkX\nT\nFvrYUuFRvYCg\nRTOn\nUISC\ndttdSPOPPzvUpr\nV\nvB\neFejaZR\ntiho\nV\nNUL\nlGnt\nRQD\nzeyAMjOUHxk\nTALAh\n\nGfFhRAiBWwt",
+            "X\ntrue\nLvLpWZBGa\nOvjqoDRSfgn\nj\nrTpKsfY\n\navBd",
+            "xxFJFTRg\ncZCWYrKdetVKK\nC\n\nU",
+            "\n\nkRg",
+            "\n\nb"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 7312,
+            "context": [
+              {
+                "type": "stored",
+                "id": 7313
+              },
+              {
+                "type": "stored",
+                "id": 7314
+              },
+              {
+                "type": "stored",
+                "id": 7315
+              },
+              {
+                "type": "stored",
+                "id": 7316
+              },
+              {
+                "type": "stored",
+                "id": 7317
+              },
+              {
+                "type": "stored",
+                "id": 7318
+              },
+              {
+                "type": "stored",
+                "id": 7319
+              },
+              {
+                "type": "stored",
+                "id": 7320
+              },
+              {
+                "type": "stored",
+                "id": 7321
+              },
+              {
+                "type": "stored",
+                "id": 7322
+              },
+              {
+                "type": "stored",
+                "id": 7323
+              },
+              {
+                "type": "stored",
+                "id": 7324
+              },
+              {
+                "type": "stored",
+                "id": 7325
+              },
+              {
+                "type": "stored",
+                "id": 7326
+              },
+              {
+                "type": "stored",
+                "id": 7327
+              },
+              {
+                "type": "stored",
+                "id": 7328
+              },
+              {
+                "type": "stored",
+                "id": 7329
+              },
+              {
+                "type": "stored",
+                "id": 7330
+              },
+              {
+                "type": "stored",
+                "id": 7331
+              },
+              {
+                "type": "stored",
+                "id": 7332
+              },
+              {
+                "type": "stored",
+                "id": 7333
+              },
+              {
+                "type": "stored",
+                "id": 7334
+              },
+              {
+                "type": "stored",
+                "id": 7335
+              },
+              {
+                "type": "stored",
+                "id": 7336
+              },
+              {
+                "type": "stored",
+                "id": 7337
+              }
+            ]
+          },
+          "step": {
+            "text": "Vv\u00a0",
+            "context": [
+              {
+                "type": "stored",
+                "id": 7338
+              }
+            ]
+          },
+          "n_step": -318978906344,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 7339,
+            "context": [
+              {
+                "type": "stored",
+                "id": 7340
+              },
+              {
+                "type": "stored",
+                "id": 7341
+              },
+              {
+                "type": "stored",
+                "id": 7342
+              },
+              {
+                "type": "stored",
+                "id": 7343
+              }
+            ]
+          },
+          "step": {
+            "text": "\ud9e1\udfb8\udaf0\udebd\u00a4\udbe2\udc14\u00ecl\u00c1\ud826\udcec\u0012|\u00ddE\u00ad",
+            "context": [
+              {
+                "type": "stored",
+                "id": 7344
+              },
+              {
+                "type": "stored",
+                "id": 7345
+              },
+              {
+                "type": "stored",
+                "id": 7346
+              }
+            ]
+          },
+          "n_step": 20936149,
+          "goals": [
+            "ALqydL\nX\n\nkQAMyCi",
+            "JPhDyR\nUIb\nJ\nXG\nPiObnjdSj\ngRTlw\n\ngydx",
+            "jHlmv\n\nHqrc",
+            "rs\nH\nECtlu\nfv\n\nCjODkcybygoAKRirBhEAVHTxEynEg",
+            "yfQAELq\ngsy\nYxEevjcANfTZC\n\nd",
+            "VA\nqdZxySqBsuoavKlPhS\nKkOfivRZqf\n\nTPQpR"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
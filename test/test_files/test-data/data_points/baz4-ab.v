@@ -0,0 +1,302 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz4/ab.v\", \"workspace\": \"/coq-dataset/repos/baz4\", \"repository\": \"/coq-dataset/repos/baz4\"}",
+    "{\"type\": \"stored\", \"id\": 8176}",
+    "{\"type\": \"stored\", \"id\": 8177}",
+    "{\"type\": \"stored\", \"id\": 8178}",
+    "{\"type\": \"stored\", \"id\": 8179}",
+    "{\"type\": \"stored\", \"id\": 8180}",
+    "{\"type\": \"stored\", \"id\": 8181}",
+    "{\"type\": \"stored\", \"id\": 8182}",
+    "{\"type\": \"stored\", \"id\": 8183}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 8184,
+        "context": []
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 8185,
+            "context": [
+              {
+                "type": "stored",
+                "id": 8186
+              }
+            ]
+          },
+          "step": {
+            "text": "\u0092i\udb06\udf9e\udb0f\udd5e\u008c\u00b3\u00fd",
+            "context": [
+              {
+                "type": "stored",
+                "id": 8187
+              },
+              {
+                "type": "stored",
+                "id": 8188
+              },
+              {
+                "type": "stored",
+                "id": 8189
+              },
+              {
+                "type": "stored",
+                "id": 8190
+              },
+              {
+                "type": "stored",
+                "id": 8191
+              },
+              {
+                "type": "stored",
+                "id": 8192
+              },
+              {
+                "type": "stored",
+                "id": 8193
+              },
+              {
+                "type": "stored",
+                "id": 8194
+              },
+              {
+                "type": "stored",
+                "id": 8195
+              },
+              {
+                "type": "stored",
+                "id": 8196
+              },
+              {
+                "type": "stored",
+                "id": 8197
+              }
+            ]
+          },
+          "n_step": -327,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 8198,
+            "context": [
+              {
+                "type": "stored",
+                "id": 8199
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00bb\udb62\udd4a",
+            "context": [
+              {
+                "type": "stored",
+                "id": 8200
+              },
+              {
+                "type": "stored",
+                "id": 8201
+              }
+            ]
+          },
+          "n_step": -921,
+          "goals": [
+            "rHyhUz\nwmej\n\nHHFguOQCiuHfBdH",
+            "M\nG\niQqZ\nuQcSKeVe\ntrue\nV\n\nPE",
+            "fid\nTmViP\nTBaNIPKlGv\nguVT\ngIMSdqAqcX\nyQ\nZ\norRRxvNjjyCWvZRz\nFalse\n\no",
+            "FUt\nwNRE\n\nVCSzLVGSNA",
+            "TbELdeqqmmsvwqMx\nQ\nhp\n\nHpLpcRuuyMgkQASaQ",
+            "Ap\nIpfwXseP\nmINM\njLx\nc\nworkers\ngdNSgI\nWceU\nlqMfYLABY\ntmTOCua\nInf\nFUNCTION\ngW\nLF\njuiImTrBJGFK\n\nI",
+            "Qi\negzFhVYyHFZYdCsiR\nUNqHErtRBlzjdAjeGZm\nq\nxl\nVdnsEp\nCGUjgRjXvC\nllWb\n\nvLu",
+            "Q\nenRWS\nIOkhNmReU\nqPlObyEtiIlwCfswjT\n\nT"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 8202,
+            "context": [
+              {
+                "type": "stored",
+                "id": 8203
+              },
+              {
+                "type": "stored",
+                "id": 8204
+              }
+            ]
+          },
+          "step": {
+            "text": "\u0010Q]!-\u001cA\u009e",
+            "context": [
+              {
+                "type": "stored",
+                "id": 8205
+              },
+              {
+                "type": "stored",
+                "id": 8206
+              },
+              {
+                "type": "stored",
+                "id": 8207
+              },
+              {
+                "type": "stored",
+                "id": 8208
+              },
+              {
+                "type": "stored",
+                "id": 8209
+              },
+              {
+                "type": "stored",
+                "id": 8210
+              },
+              {
+                "type": "stored",
+                "id": 8211
+              }
+            ]
+          },
+          "n_step": 65536,
+          "goals": [
+            "BJoEthD\nKpYBg\nvwhBBz\nfVqkfQR\ns\nmypa\nRiXDrL\nTFEVgKsCaKRDOqtBJB\nML\nMUS\nb\n\nsYOV",
+            "enIdbfum\narray\nw\nzk\nDu\nHV\n\nhnVkH",
+            "ZoS\nNdiVv\ndc\nGjWCsZTOHHILpFDzJi\naaROaYHbXkn\n\nip",
+            "\n\nMlGC",
+            "zBCvfx\nBLQb\n\nKoil",
+            "UYsxDsKtiDQxF\nXSosltfqnRBR\nMXgVs\nuZnhxCwLQUV\nOJBmNOahNorcPytCRcNMsvdDfd\nrQLCmKhBTr\noGvELhynSq\nd\nRN\nif\nSd\n\nPdsUYbgXnXbAArcLU",
+            "lZN\nt\nlwCFlKdUzvX\nxRxnXhGKRjZzDZbv\nkI\nKdpWH\n\nvyKAS",
+            "JPAX\ni\n\nTPgum",
+            "MSoNMFvps\nINF\nHcnalfauLuvaD\nKrErUA\nIUUrhBYfARVpHB\nMdQlfsCgduCo\nlzNulO\n\ntdHKKbHsNGTW",
+            "lines\nqq\n\nv"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 8212,
+            "context": [
+              {
+                "type": "stored",
+                "id": 8213
+              },
+              {
+                "type": "stored",
+                "id": 8214
+              },
+              {
+                "type": "stored",
+                "id": 8215
+              },
+              {
+                "type": "stored",
+                "id": 8216
+              },
+              {
+                "type": "stored",
+                "id": 8217
+              },
+              {
+                "type": "stored",
+                "id": 8218
+              },
+              {
+                "type": "stored",
+                "id": 8219
+              },
+              {
+                "type": "stored",
+                "id": 8220
+              }
+            ]
+          },
+          "step": {
+            "text": "Jm\ud84d\uddb9\u001aW\u00bb\uda6a\udda4\u000f\u0098\ud9c3\udf0e\u000b\u00ad\uda76\ude94\u0094",
+            "context": [
+              {
+                "type": "stored",
+                "id": 8221
+              }
+            ]
+          },
+          "n_step": 77085014,
+          "goals": [
+            "ooUhbH\nyKAi\n\nHs",
+            "QSP\nCyh\n\nru",
+            "FB\nPATxLTQM\nc\nrKoe\nn\nflSRhGh\nAL\n\nDX",
+            "nyz\nlZ\nGjCR\nPLu\n\nMSMRpKb",
+            "jRTsYaAWFo\nWg\nrFCGcW\nouXkqsM\nDTZMI\nTgEmq\n\nMBYoEQxmdsTFWqKErqwj",
+            "VAAyZqGULdet\nxY\n\nPEcUTXQMhEENw",
+            "W\noiugXiVv\ndsgJ\nEqqP\nitWoWndpl\nIUp\nglZmeL\nmVaKQw\npXsdVf\naM\nTGcTKpP\nnqV\nwWXDvj\nuAP\ngTKOtSfSUWF\nDu\nocPSLXqMph\nqScRKcQ\nMtzuCCuY\n\ndXMtjkgGqlulBeKYJSBZfhHd"
+          ]
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 8222,
+        "context": [
+          {
+            "type": "stored",
+            "id": 8223
+          },
+          {
+            "type": "stored",
+            "id": 8224
+          },
+          {
+            "type": "stored",
+            "id": 8225
+          },
+          {
+            "type": "stored",
+            "id": 8226
+          },
+          {
+            "type": "stored",
+            "id": 8227
+          },
+          {
+            "type": "stored",
+            "id": 8228
+          },
+          {
+            "type": "stored",
+            "id": 8229
+          }
+        ]
+      },
+      "steps": []
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 8230,
+        "context": [
+          {
+            "type": "stored",
+            "id": 8231
+          },
+          {
+            "type": "stored",
+            "id": 8232
+          },
+          {
+            "type": "stored",
+            "id": 8233
+          }
+        ]
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,7 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz4/aoitrlapmr.v\", \"workspace\": \"/coq-dataset/repos/baz4\", \"repository\": \"/coq-dataset/repos/baz4\"}",
+    "{\"type\": \"stored\", \"id\": 8165}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
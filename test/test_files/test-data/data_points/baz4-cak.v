@@ -0,0 +1,7 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz4/cak.v\", \"workspace\": \"/coq-dataset/repos/baz4\", \"repository\": \"/coq-dataset/repos/baz4\"}",
+    "{\"type\": \"stored\", \"id\": 8044}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,227 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz4/cvbotobfqjtqzzpneuloijuoacuj.v\", \"workspace\": \"/coq-dataset/repos/baz4\", \"repository\": \"/coq-dataset/repos/baz4\"}",
+    "{\"type\": \"stored\", \"id\": 8119}",
+    "{\"type\": \"stored\", \"id\": 8120}",
+    "{\"type\": \"stored\", \"id\": 8121}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 8122,
+        "context": [
+          {
+            "type": "stored",
+            "id": 8123
+          },
+          {
+            "type": "stored",
+            "id": 8124
+          },
+          {
+            "type": "stored",
+            "id": 8125
+          },
+          {
+            "type": "stored",
+            "id": 8126
+          },
+          {
+            "type": "stored",
+            "id": 8127
+          },
+          {
+            "type": "stored",
+            "id": 8128
+          },
+          {
+            "type": "stored",
+            "id": 8129
+          },
+          {
+            "type": "stored",
+            "id": 8130
+          },
+          {
+            "type": "stored",
+            "id": 8131
+          },
+          {
+            "type": "stored",
+            "id": 8132
+          },
+          {
+            "type": "stored",
+            "id": 8133
+          },
+          {
+            "type": "stored",
+            "id": 8134
+          }
+        ]
+      },
+      "steps": []
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 8135,
+        "context": [
+          {
+            "type": "stored",
+            "id": 8136
+          },
+          {
+            "type": "stored",
+            "id": 8137
+          },
+          {
+            "type": "stored",
+            "id": 8138
+          },
+          {
+            "type": "stored",
+            "id": 8139
+          },
+          {
+            "type": "stored",
+            "id": 8140
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 8141,
+            "context": [
+              {
+                "type": "stored",
+                "id": 8142
+              }
+            ]
+          },
+          "step": {
+            "text": "\udbab\udff6N\ud97a\udc2d\u00d6\u0012\u00a6\u00a0",
+            "context": [
+              {
+                "type": "stored",
+                "id": 8143
+              },
+              {
+                "type": "stored",
+                "id": 8144
+              },
+              {
+                "type": "stored",
+                "id": 8145
+              },
+              {
+                "type": "stored",
+                "id": 8146
+              },
+              {
+                "type": "stored",
+                "id": 8147
+              },
+              {
+                "type": "stored",
+                "id": 8148
+              },
+              {
+                "type": "stored",
+                "id": 8149
+              },
+              {
+                "type": "stored",
+                "id": 8150
+              },
+              {
+                "type": "stored",
+                "id": 8151
+              },
+              {
+                "type": "stored",
+                "id": 8152
+              },
+              {
+                "type": "stored",
+                "id": 8153
+              },
+              {
+                "type": "stored",
+                "id": 8154
+              },
+              {
+                "type": "stored",
+                "id": 8155
+              },
+              {
+                "type": "stored",
+                "id": 8156
+              },
+              {
+                "type": "stored",
+                "id": 8157
+              }
+            ]
+          },
+          "n_step": 308857,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 8158,
+            "context": [
+              {
+                "type": "stored",
+                "id": 8159
+              },
+              {
+                "type": "stored",
+                "id": 8160
+              }
+            ]
+          },
+          "step": {
+            "text": "\u0012\u008c\u00eb\u00ca\u00f1\u00c2",
+            "context": [
+              {
+                "type": "stored",
+                "id": 8161
+              },
+              {
+                "type": "stored",
+                "id": 8162
+              },
+              {
+                "type": "stored",
+                "id": 8163
+              },
+              {
+                "type": "stored",
+                "id": 8164
+              }
+            ]
+          },
+          "n_step": 1710777713,
+          "goals": [
+            "x\nlhePbcT\nrZ\nbwUjFtedBsLOXjqvQeKjIOp\neX\nmoWFwaiydCqjTrhqYXvdjpX\nZoUGtz\nQuozrKrdCOvM\n\nQnEHtt",
+            "hce\nHPWOgMw\ngA\nEXVDRxHWKi\naz\n\np",
+            "dYfQEBnRWEJlutRKy\nG\n\noM",
+            "jEQkhsBR\nOJx\nFsOJW\nHUxeaFDfoTQRGy\nEUtMWjKzIXZ\nnKfh\nLz\nVgpr\n\nQC",
+            "L\nAyWPnlgymtDfqqk\nfsnc\nytmOYFjxR\nUQYVO\n\nBj",
+            "pHAD\nyWIV\nKbFsdJ\nRTX\n\nTkZoUrq",
+            "assistant\nDhRZ\nDjhqyGdtI\nL\n\nT",
+            "eZEaSKatBzoD\nOFxNPzQrob\nO\nPEQtDUT\nXkQpPx\n\nhzzogZusKC",
+            "meBsIXQ\na\nzVCDtSMhGme\nEMKLrizq\nfczOiUROTjeJvk\ngwpWq\n\naik",
+            "NP\nSLLJWwKKnBRX\nZNXsyJI\nFTRE\n\nG",
+            "pWuplkK\ntIzG\nws\nresult\ncCiNid\nKgOWUkFyi\nd\naRPoO\nyHEGjy\nhXqNpYEyKVgPCv\nIUOJ\nMbJHwYaxv\nAf\nUf\n\nBhZony"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
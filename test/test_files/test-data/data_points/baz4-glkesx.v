@@ -0,0 +1,122 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz4/glkesx.v\", \"workspace\": \"/coq-dataset/repos/baz4\", \"repository\": \"/coq-dataset/repos/baz4\"}",
+    "{\"type\": \"stored\", \"id\": 7793}",
+    "{\"type\": \"stored\", \"id\": 7794}",
+    "{\"type\": \"stored\", \"id\": 7795}",
+    "{\"type\": \"stored\", \"id\": 7796}",
+    "{\"type\": \"stored\", \"id\": 7797}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 7798,
+        "context": [
+          {
+            "type": "stored",
+            "id": 7799
+          },
+          {
+            "type": "stored",
+            "id": 7800
+          },
+          {
+            "type": "stored",
+            "id": 7801
+          },
+          {
+            "type": "stored",
+            "id": 7802
+          },
+          {
+            "type": "stored",
+            "id": 7803
+          },
+          {
+            "type": "stored",
+            "id": 7804
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 7805,
+            "context": [
+              {
+                "type": "stored",
+                "id": 7806
+              },
+              {
+                "type": "stored",
+                "id": 7807
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00ce",
+            "context": []
+          },
+          "n_step": -862805,
+          "goals": [
+            "m\n\nuyIzRyGjMADEN",
+            "EpboEiVZa\nKycPrBG\n\nDewlGhxRC"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 7808,
+            "context": [
+              {
+                "type": "stored",
+                "id": 7809
+              },
+              {
+                "type": "stored",
+                "id": 7810
+              },
+              {
+                "type": "stored",
+                "id": 7811
+              }
+            ]
+          },
+          "step": {
+            "text": "\u009a\u0093\u00ff\u00ce\udb76\udc35\u00aa",
+            "context": [
+              {
+                "type": "stored",
+                "id": 7812
+              },
+              {
+                "type": "stored",
+                "id": 7813
+              },
+              {
+                "type": "stored",
+                "id": 7814
+              },
+              {
+                "type": "stored",
+                "id": 7815
+              }
+            ]
+          },
+          "n_step": 80550313345683772407808,
+          "goals": [
+            "\n\nMvDlSLlP",
+            "WZEFJnQ\ntplrfrJNrEDaxH\neyieWuQBmQpuv\n\nNpuPWqB",
+            "LTG\ntj\n\nb",
+            "\n\nJcTUbXB",
+            "VdfGG\nZq\nB\nzvJzs\nNCxHAUoASxgqIVIqs\nMXyex\ntBn\nSkyx\nTRUE\nPoNYB\nPyLr\nDttmhBlRqohAtyuGtjJtixTBJYxNtEZMuAmZo\nsrc\nLYNZ\nZ\nCSogP\nkE\nG\nJVE\n\nE",
+            "ofypBTVLKO\nV\nO\nBywanHotMqZnN\n\na",
+            "\n\nvglD"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
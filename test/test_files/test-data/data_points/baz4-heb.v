@@ -0,0 +1,62 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz4/heb.v\", \"workspace\": \"/coq-dataset/repos/baz4\", \"repository\": \"/coq-dataset/repos/baz4\"}",
+    "{\"type\": \"stored\", \"id\": 7927}",
+    "{\"type\": \"stored\", \"id\": 7928}",
+    "{\"type\": \"stored\", \"id\": 7929}",
+    "{\"type\": \"stored\", \"id\": 7930}",
+    "{\"type\": \"stored\", \"id\": 7931}",
+    "{\"type\": \"stored\", \"id\": 7932}",
+    "{\"type\": \"stored\", \"id\": 7933}",
+    "{\"type\": \"stored\", \"id\": 7934}",
+    "{\"type\": \"stored\", \"id\": 7935}",
+    "{\"type\": \"stored\", \"id\": 7936}",
+    "{\"type\": \"stored\", \"id\": 7937}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 7938,
+        "context": [
+          {
+            "type": "stored",
+            "id": 7939
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 7940,
+            "context": []
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 7941
+              },
+              {
+                "type": "stored",
+                "id": 7942
+              },
+              {
+                "type": "stored",
+                "id": 7943
+              }
+            ]
+          },
+          "n_step": -179604800,
+          "goals": [
+            "\n\nKqVdxemfPNj",
+            "EKST\n\nx",
+            "cK\n\nh"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,8 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz4/hexjcpvdjq.v\", \"workspace\": \"/coq-dataset/repos/baz4\", \"repository\": \"/coq-dataset/repos/baz4\"}",
+    "{\"type\": \"stored\", \"id\": 8045}",
+    "{\"type\": \"stored\", \"id\": 8046}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,12 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz4/i.v\", \"workspace\": \"/coq-dataset/repos/baz4\", \"repository\": \"/coq-dataset/repos/baz4\"}",
+    "{\"type\": \"stored\", \"id\": 7885}",
+    "{\"type\": \"stored\", \"id\": 7886}",
+    "{\"type\": \"stored\", \"id\": 7887}",
+    "{\"type\": \"stored\", \"id\": 7888}",
+    "{\"type\": \"stored\", \"id\": 7889}",
+    "{\"type\": \"stored\", \"id\": 7890}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
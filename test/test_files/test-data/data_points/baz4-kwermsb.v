@@ -0,0 +1,46 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz4/kwermsb.v\", \"workspace\": \"/coq-dataset/repos/baz4\", \"repository\": \"/coq-dataset/repos/baz4\"}",
+    "{\"type\": \"stored\", \"id\": 8166}",
+    "{\"type\": \"stored\", \"id\": 8167}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 8168,
+        "context": [
+          {
+            "type": "stored",
+            "id": 8169
+          },
+          {
+            "type": "stored",
+            "id": 8170
+          },
+          {
+            "type": "stored",
+            "id": 8171
+          },
+          {
+            "type": "stored",
+            "id": 8172
+          },
+          {
+            "type": "stored",
+            "id": 8173
+          },
+          {
+            "type": "stored",
+            "id": 8174
+          },
+          {
+            "type": "stored",
+            "id": 8175
+          }
+        ]
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,172 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz4/motpvnz.v\", \"workspace\": \"/coq-dataset/repos/baz4\", \"repository\": \"/coq-dataset/repos/baz4\"}",
+    "{\"type\": \"stored\", \"id\": 7891}",
+    "{\"type\": \"stored\", \"id\": 7892}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 7893,
+        "context": [
+          {
+            "type": "stored",
+            "id": 7894
+          },
+          {
+            "type": "stored",
+            "id": 7895
+          },
+          {
+            "type": "stored",
+            "id": 7896
+          },
+          {
+            "type": "stored",
+            "id": 7897
+          },
+          {
+            "type": "stored",
+            "id": 7898
+          },
+          {
+            "type": "stored",
+            "id": 7899
+          },
+          {
+            "type": "stored",
+            "id": 7900
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 7901,
+            "context": [
+              {
+                "type": "stored",
+                "id": 7902
+              },
+              {
+                "type": "stored",
+                "id": 7903
+              },
+              {
+                "type": "stored",
+                "id": 7904
+              },
+              {
+                "type": "stored",
+                "id": 7905
+              },
+              {
+                "type": "stored",
+                "id": 7906
+              },
+              {
+                "type": "stored",
+                "id": 7907
+              },
+              {
+                "type": "stored",
+                "id": 7908
+              },
+              {
+                "type": "stored",
+                "id": 7909
+              },
+              {
+                "type": "stored",
+                "id": 7910
+              }
+            ]
+          },
+          "step": {
+            "text": "@mR\u00e3\udb70\udfcd\udb08\udcb9)7\udba7\udcf6",
+            "context": [
+              {
+                "type": "stored",
+                "id": 7911
+              },
+              {
+                "type": "stored",
+                "id": 7912
+              },
+              {
+                "type": "stored",
+                "id": 7913
+              },
+              {
+                "type": "stored",
+                "id": 7914
+              },
+              {
+                "type": "stored",
+                "id": 7915
+              },
+              {
+                "type": "stored",
+                "id": 7916
+              },
+              {
+                "type": "stored",
+                "id": 7917
+              },
+              {
+                "type": "stored",
+                "id": 7918
+              }
+            ]
+          },
+          "n_step": -6508813336884,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 7919,
+            "context": []
+          },
+          "step": {
+            "text": "\ud93b\udd7c",
+            "context": [
+              {
+                "type": "stored",
+                "id": 7920
+              },
+              {
+                "type": "stored",
+                "id": 7921
+              },
+              {
+                "type": "stored",
+                "id": 7922
+              },
+              {
+                "type": "stored",
+                "id": 7923
+              },
+              {
+                "type": "stored",
+                "id": 7924
+              },
+              {
+                "type": "stored",
+                "id": 7925
+              },
+              {
+                "type": "stored",
+                "id": 7926
+              }
+            ]
+          },
+          "n_step": -147,
+          "goals": []
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,139 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz4/r.v.v\", \"workspace\": \"/coq-dataset/repos/baz4\", \"repository\": \"/coq-dataset/repos/baz4\"}",
+    "{\"type\": \"stored\", \"id\": 7854}",
+    "{\"type\": \"stored\", \"id\": 7855}",
+    "{\"type\": \"stored\", \"id\": 7856}",
+    "{\"type\": \"stored\", \"id\": 7857}",
+    "{\"type\": \"stored\", \"id\": 7858}",
+    "{\"type\": \"stored\", \"id\": 7859}",
+    "{\"type\": \"stored\", \"id\": 7860}",
+    "{\"type\": \"stored\", \"id\": 7861}",
+    "{\"type\": \"stored\", \"id\": 7862}",
+    "{\"type\": \"stored\", \"id\": 7863}",
+    "{\"type\": \"stored\", \"id\": 7864}",
+    "{\"type\": \"stored\", \"id\": 7865}",
+    "{\"type\": \"stored\", \"id\": 7866}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 7867,
+        "context": [
+          {
+            "type": "stored",
+            "id": 7868
+          },
+          {
+            "type": "stored",
+            "id": 7869
+          },
+          {
+            "type": "stored",
+            "id": 7870
+          },
+          {
+            "type": "stored",
+            "id": 7871
+          },
+          {
+            "type": "stored",
+            "id": 7872
+          },
+          {
+            "type": "stored",
+            "id": 7873
+          },
+          {
+            "type": "stored",
+            "id": 7874
+          },
+          {
+            "type": "stored",
+            "id": 7875
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 7876,
+            "context": [
+              {
+                "type": "stored",
+                "id": 7877
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00bd\udb25\udec0\u00f2Mc",
+            "context": []
+          },
+          "n_step": 40984,
+          "goals": [
+            "\n\nmRMD",
+            "spawn\nvq\nKWCz\nfsQL\neORTlsgs\nprotocol\nMIFZJGlCYCpkEqEln\nZeFBYjTWP\n\nWBUOW",
+            "AlG\n\nTRUE",
+            "SbrwS\n\nBBSwYEbDvk",
+            "VFbuD\nqwepWYHnEZkvEIAq\nyCDSdWYjJsIc\nyKjqjYSXDPisE\nWojPf\n\nZo",
+            "ywYUwwRuJcXSu\nhcjYSE\n\nh"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 7878,
+            "context": [
+              {
+                "type": "stored",
+                "id": 7879
+              }
+            ]
+          },
+          "step": {
+            "text": "\u0084\u00e9",
+            "context": [
+              {
+                "type": "stored",
+                "id": 7880
+              },
+              {
+                "type": "stored",
+                "id": 7881
+              },
+              {
+                "type": "stored",
+                "id": 7882
+              },
+              {
+                "type": "stored",
+                "id": 7883
+              },
+              {
+                "type": "stored",
+                "id": 7884
+              }
+            ]
+          },
+          "n_step": 100000,
+          "goals": [
+            "j\n\nPAM",
+            "GUmEzM\nzoGxULZTONUTVU\nE\nCHBDivGBa\nurls\nF\nQCe\nelse\nKwDxqxm\nDRnMJcJyK\ndpZQ\nfu\nrDCRgubIr\nFALSE\nkkZgchewTlT\nJd\nbB\ntiMo\nwqpJJMSK\nuBZd\nShWvfhGQ\nSAYGTPpCeT\nGWt\ntR\n\nTcb",
+            "aa\n\nH",
+            "True\ncQ\nvQ\nlw\naYJ\n\nqAa",
+            "\n\nYwCvH",
+            "hTXawmQ\nSTiBhSLv\nD\nM\nwwgMdnLJRz\nXv\njr\n\nZ",
+            "\n\ntjEkzMJV",
+            "D\nRTW\nUVvy\nga\nwDDgjUcPuZY\nLsAUatmp\ne\nclj\nbx\nuAeBq\nvkTzc\nXSiOKcbhQMBSjizxy\nScunthorpe\nTE\nVzv\njlLzZ\nDyirfre\nf\ntFCo\nQgbfMvXVzJUYutCxORN\nusOM\npdChfrhbzxzJbQQxZp\nztd\nEsD\nrb\nw\n\nUZnVzwTCQzDQCZCGdXVX",
+            "\n\noRzCgBgFot",
+            "\n\nsUoedoFPSh",
+            "Z\nFD\nwLP\nSK\nLgEBnmSKryZnfApH\nLemma\n\nS",
+            "qzP\n\ndBXcgfBXIx"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,22 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz4/r.v.v.v\", \"workspace\": \"/coq-dataset/repos/baz4\", \"repository\": \"/coq-dataset/repos/baz4\"}",
+    "{\"type\": \"stored\", \"id\": 7944}",
+    "{\"type\": \"stored\", \"id\": 7945}",
+    "{\"type\": \"stored\", \"id\": 7946}",
+    "{\"type\": \"stored\", \"id\": 7947}",
+    "{\"type\": \"stored\", \"id\": 7948}",
+    "{\"type\": \"stored\", \"id\": 7949}",
+    "{\"type\": \"stored\", \"id\": 7950}",
+    "{\"type\": \"stored\", \"id\": 7951}",
+    "{\"type\": \"stored\", \"id\": 7952}",
+    "{\"type\": \"stored\", \"id\": 7953}",
+    "{\"type\": \"stored\", \"id\": 7954}",
+    "{\"type\": \"stored\", \"id\": 7955}",
+    "{\"type\": \"stored\", \"id\": 7956}",
+    "{\"type\": \"stored\", \"id\": 7957}",
+    "{\"type\": \"stored\", \"id\": 7958}",
+    "{\"type\": \"stored\", \"id\": 7959}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
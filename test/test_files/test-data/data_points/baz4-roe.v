@@ -0,0 +1,17 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz4/roe.v\", \"workspace\": \"/coq-dataset/repos/baz4\", \"repository\": \"/coq-dataset/repos/baz4\"}",
+    "{\"type\": \"stored\", \"id\": 7818}",
+    "{\"type\": \"stored\", \"id\": 7819}",
+    "{\"type\": \"stored\", \"id\": 7820}",
+    "{\"type\": \"stored\", \"id\": 7821}",
+    "{\"type\": \"stored\", \"id\": 7822}",
+    "{\"type\": \"stored\", \"id\": 7823}",
+    "{\"type\": \"stored\", \"id\": 7824}",
+    "{\"type\": \"stored\", \"id\": 7825}",
+    "{\"type\": \"stored\", \"id\": 7826}",
+    "{\"type\": \"stored\", \"id\": 7827}",
+    "{\"type\": \"stored\", \"id\": 7828}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,19 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz4/slousxbhtc.v\", \"workspace\": \"/coq-dataset/repos/baz4\", \"repository\": \"/coq-dataset/repos/baz4\"}",
+    "{\"type\": \"stored\", \"id\": 7780}",
+    "{\"type\": \"stored\", \"id\": 7781}",
+    "{\"type\": \"stored\", \"id\": 7782}",
+    "{\"type\": \"stored\", \"id\": 7783}",
+    "{\"type\": \"stored\", \"id\": 7784}",
+    "{\"type\": \"stored\", \"id\": 7785}",
+    "{\"type\": \"stored\", \"id\": 7786}",
+    "{\"type\": \"stored\", \"id\": 7787}",
+    "{\"type\": \"stored\", \"id\": 7788}",
+    "{\"type\": \"stored\", \"id\": 7789}",
+    "{\"type\": \"stored\", \"id\": 7790}",
+    "{\"type\": \"stored\", \"id\": 7791}",
+    "{\"type\": \"stored\", \"id\": 7792}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,8 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz4/spares.v\", \"workspace\": \"/coq-dataset/repos/baz4\", \"repository\": \"/coq-dataset/repos/baz4\"}",
+    "{\"type\": \"stored\", \"id\": 7816}",
+    "{\"type\": \"stored\", \"id\": 7817}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,30 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz4/ufjdulyhbovda.v\", \"workspace\": \"/coq-dataset/repos/baz4\", \"repository\": \"/coq-dataset/repos/baz4\"}",
+    "{\"type\": \"stored\", \"id\": 7829}",
+    "{\"type\": \"stored\", \"id\": 7830}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 7831,
+        "context": [
+          {
+            "type": "stored",
+            "id": 7832
+          },
+          {
+            "type": "stored",
+            "id": 7833
+          },
+          {
+            "type": "stored",
+            "id": 7834
+          }
+        ]
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
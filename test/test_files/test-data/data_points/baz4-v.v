@@ -0,0 +1,9 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz4/v.v\", \"workspace\": \"/coq-dataset/repos/baz4\", \"repository\": \"/coq-dataset/repos/baz4\"}",
+    "{\"type\": \"stored\", \"id\": 8234}",
+    "{\"type\": \"stored\", \"id\": 8235}",
+    "{\"type\": \"stored\", \"id\": 8236}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,110 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz4/vwtf.v\", \"workspace\": \"/coq-dataset/repos/baz4\", \"repository\": \"/coq-dataset/repos/baz4\"}",
+    "{\"type\": \"stored\", \"id\": 7835}",
+    "{\"type\": \"stored\", \"id\": 7836}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 7837,
+        "context": []
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 7838,
+            "context": []
+          },
+          "step": {
+            "text": "\u00c2#\u00dfKj\udb0e\udfe1\u0013\uda02\udde7",
+            "context": [
+              {
+                "type": "stored",
+                "id": 7839
+              },
+              {
+                "type": "stored",
+                "id": 7840
+              }
+            ]
+          },
+          "n_step": -445,
+          "goals": [
+            "u\nmUer\nSX\niT\nL\nhPt\nOQpcVNUBTji\n\nTs",
+            "SUSySDUn\nNj\ncoPpGEh\n\nF",
+            "BxwSit\nyX\nbfCdxRzyyqPTs\nBQCgdEF\nWeBjvnOyEBm\niXkO\nzyjiKqdfKBs\n\nrLxf",
+            "g\nWamQyX\ngnCtwQhEYdfoF\nA\nh\n\nd",
+            "\n\nVRW",
+            "J\nh\nQeFEXBEJCYaTDu\nUmpqAVwpOQtiJHEYUdmPauM\nXBX\nzc\na\nihGYnwS\nhJ\n\nwErwcQtQatJWTAixBwVRMqxtjB"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 7841,
+            "context": [
+              {
+                "type": "stored",
+                "id": 7842
+              },
+              {
+                "type": "stored",
+                "id": 7843
+              },
+              {
+                "type": "stored",
+                "id": 7844
+              },
+              {
+                "type": "stored",
+                "id": 7845
+              }
+            ]
+          },
+          "step": {
+            "text": "rerank-client",
+            "context": [
+              {
+                "type": "stored",
+                "id": 7846
+              },
+              {
+                "type": "stored",
+                "id": 7847
+              },
+              {
+                "type": "stored",
+                "id": 7848
+              },
+              {
+                "type": "stored",
+                "id": 7849
+              },
+              {
+                "type": "stored",
+                "id": 7850
+              },
+              {
+                "type": "stored",
+                "id": 7851
+              },
+              {
+                "type": "stored",
+                "id": 7852
+              },
+              {
+                "type": "stored",
+                "id": 7853
+              }
+            ]
+          },
+          "n_step": 33,
+          "goals": []
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
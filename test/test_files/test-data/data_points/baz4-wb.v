@@ -0,0 +1,380 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz4/wb.v\", \"workspace\": \"/coq-dataset/repos/baz4\", \"repository\": \"/coq-dataset/repos/baz4\"}",
+    "{\"type\": \"stored\", \"id\": 8047}",
+    "{\"type\": \"stored\", \"id\": 8048}",
+    "{\"type\": \"stored\", \"id\": 8049}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 8050,
+        "context": [
+          {
+            "type": "stored",
+            "id": 8051
+          },
+          {
+            "type": "stored",
+            "id": 8052
+          },
+          {
+            "type": "stored",
+            "id": 8053
+          },
+          {
+            "type": "stored",
+            "id": 8054
+          },
+          {
+            "type": "stored",
+            "id": 8055
+          },
+          {
+            "type": "stored",
+            "id": 8056
+          },
+          {
+            "type": "stored",
+            "id": 8057
+          },
+          {
+            "type": "stored",
+            "id": 8058
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 8059,
+            "context": [
+              {
+                "type": "stored",
+                "id": 8060
+              }
+            ]
+          },
+          "step": {
+            "text": "M",
+            "context": [
+              {
+                "type": "stored",
+                "id": 8061
+              },
+              {
+                "type": "stored",
+                "id": 8062
+              },
+              {
+                "type": "stored",
+                "id": 8063
+              },
+              {
+                "type": "stored",
+                "id": 8064
+              },
+              {
+                "type": "stored",
+                "id": 8065
+              },
+              {
+                "type": "stored",
+                "id": 8066
+              },
+              {
+                "type": "stored",
+                "id": 8067
+              },
+              {
+                "type": "stored",
+                "id": 8068
+              },
+              {
+                "type": "stored",
+                "id": 8069
+              }
+            ]
+          },
+          "n_step": -925582,
+          "goals": [
+            "okGo\nHBCuKNWlI\nTVx\nsIGaOUSDd\nqA\nmQsx\n\nW",
+            "JF\nfAck\nbTEYAZKyUTiSsyaBfsn\n\nmJKJq"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 8070,
+            "context": [
+              {
+                "type": "stored",
+                "id": 8071
+              },
+              {
+                "type": "stored",
+                "id": 8072
+              },
+              {
+                "type": "stored",
+                "id": 8073
+              },
+              {
+                "type": "stored",
+                "id": 8074
+              },
+              {
+                "type": "stored",
+                "id": 8075
+              },
+              {
+                "type": "stored",
+                "id": 8076
+              },
+              {
+                "type": "stored",
+                "id": 8077
+              },
+              {
+                "type": "stored",
+                "id": 8078
+              },
+              {
+                "type": "stored",
+                "id": 8079
+              },
+              {
+                "type": "stored",
+                "id": 8080
+              },
+              {
+                "type": "stored",
+                "id": 8081
+              },
+              {
+                "type": "stored",
+                "id": 8082
+              },
+              {
+                "type": "stored",
+                "id": 8083
+              },
+              {
+                "type": "stored",
+                "id": 8084
+              },
+              {
+                "type": "stored",
+                "id": 8085
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": []
+          },
+          "n_step": -32731378,
+          "goals": [
+            "lekNGhjriHi\n\nxhEpHhuVzC",
+            "c\nFnkXv\nH\nW\nXKNtgwN\np\njB\nGgrfVg\nLpd\nT\nE\nWkuh\npCwgUmpB\nGkaL\n\nline",
+            "\n\nonoqt",
+            "jyHULW\nGrcyV\nr\nlnEOU\nD\nYwInybBVlMT\nVx\nwxFnZSa\nVNMsTENAhooVERHkPbpRbEAdnUCjGndU\nnukY\nelNMRKVibX\nsR\nOQBVNLRoTmSWn\nA\nhoUZu\n\nK",
+            "true\noff\nZxNj\niC\ngBbq\ngOeD\nxEIE\ntype\nMQAXHW\nsource\nzdRoX\nMAQRcEr\nXPx\nEDiB\n\nn",
+            "hOREkD\niuIHb\nxeCMVqsLhd\nw\nP\nqq\n\nldr"
+          ]
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 8086,
+        "context": [
+          {
+            "type": "stored",
+            "id": 8087
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 8088,
+            "context": [
+              {
+                "type": "stored",
+                "id": 8089
+              },
+              {
+                "type": "stored",
+                "id": 8090
+              },
+              {
+                "type": "stored",
+                "id": 8091
+              },
+              {
+                "type": "stored",
+                "id": 8092
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00e2\u00fd\u00ae4",
+            "context": [
+              {
+                "type": "stored",
+                "id": 8093
+              },
+              {
+                "type": "stored",
+                "id": 8094
+              }
+            ]
+          },
+          "n_step": -1671,
+          "goals": [
+            "RGbaO\nOTbzJHyAdAEgoLf\nZYfgbqYEDyoSTcIb\nNcbAzrkACvvPXCqpNBVcJD\n\nT",
+            "UZaMKusOL\nGb\n\nelse",
+            "e\n\nX",
+            "VNOqNEHo\ni\nyQztyZlCiLSo\ny\nrI\nqR\nXOcviaS\nea\ns\nUcZDYqDrXV\nHaLDln\nJN\nWY\n\nvDjalXuWQ",
+            "zzPNWCK\n\nG",
+            "j\n\nyMZ",
+            "\n\nTbkZSGCRJi",
+            "En\nNULL\njHfsCU\nwz\nBvXoqNSkQhl\n\nFUhEiGUX",
+            "A\nb\n\nEYxE",
+            "hB\nbhtW\neQfaFnHgm\nItAluNOqixGupxz\n\nYpYCugLAVjYynvU"
+          ]
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 8095,
+        "context": [
+          {
+            "type": "stored",
+            "id": 8096
+          },
+          {
+            "type": "stored",
+            "id": 8097
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 8098,
+            "context": []
+          },
+          "step": {
+            "text": "=\u00ac\ud850\ude61\u008c",
+            "context": [
+              {
+                "type": "stored",
+                "id": 8099
+              },
+              {
+                "type": "stored",
+                "id": 8100
+              },
+              {
+                "type": "stored",
+                "id": 8101
+              },
+              {
+                "type": "stored",
+                "id": 8102
+              },
+              {
+                "type": "stored",
+                "id": 8103
+              },
+              {
+                "type": "stored",
+                "id": 8104
+              },
+              {
+                "type": "stored",
+                "id": 8105
+              },
+              {
+                "type": "stored",
+                "id": 8106
+              },
+              {
+                "type": "stored",
+                "id": 8107
+              },
+              {
+                "type": "stored",
+                "id": 8108
+              },
+              {
+                "type": "stored",
+                "id": 8109
+              },
+              {
+                "type": "stored",
+                "id": 8110
+              },
+              {
+                "type": "stored",
+                "id": 8111
+              },
+              {
+                "type": "stored",
+                "id": 8112
+              },
+              {
+                "type": "stored",
+                "id": 8113
+              },
+              {
+                "type": "stored",
+                "id": 8114
+              },
+              {
+                "type": "stored",
+                "id": 8115
+              },
+              {
+                "type": "stored",
+                "id": 8116
+              },
+              {
+                "type": "stored",
+                "id": 8117
+              },
+              {
+                "type": "stored",
+                "id": 8118
+              }
+            ]
+          },
+          "n_step": -108220824,
+          "goals": [
+            "O\nDjn\nCB\nVcwyvdVxppdToHTE\nJMh\ncX\nIWpMqwi\nlTrte\n\nQlf",
+            "jEIkfieEsd\nqeRMXV\nMNXPufSI\nhyps\nnS\nJS\np\nhAM\nVoA\nQAiFaXr\nIFVAt\ndeep\nblNlM\nuPEHlS\n\nLol",
+            "\n\nWPb",
+            "uPOvZt\nJWcRHuFdGaFrE\nqpb\nyVQE\nYPZLL\nKkQ\nkq\n\nKqgPKeCsOtmyzYQEyGyX",
+            "M\nAdH\nS\nzyGD\nG\nN\nAf\nNGi\ngGITgHbZwM\nYx\n\nMWJkyr",
+            "\n\nNGIb",
+            "mbHfFsFgriJynOcRH\nef\nOKZWBi\nAKakpOEjGnNguFzN\ngkpGIwg\nCaSzJJCrfzdhlB\ndpFuIp\nevictions\nGyTNwFeK\nErummdYmvpioiDkY\nGWlu\nEp\nn\nnxPcfZAMxvgZ\nCKaqKtkhiwnvUT\n\nnt",
+            "VUaiuKJh\nr\nxiEbCa\n\narymPUoDfguhawuWDCiU",
+            "qJ\nqk\ndciTHsgTr\nd\neehO\n\nSy",
+            "\n\nC",
+            "uMcywP\n\ng",
+            "KrWkoeRxwP\n\nP"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
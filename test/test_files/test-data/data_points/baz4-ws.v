@@ -0,0 +1,231 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz4/ws.v\", \"workspace\": \"/coq-dataset/repos/baz4\", \"repository\": \"/coq-dataset/repos/baz4\"}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 8237,
+        "context": [
+          {
+            "type": "stored",
+            "id": 8238
+          },
+          {
+            "type": "stored",
+            "id": 8239
+          },
+          {
+            "type": "stored",
+            "id": 8240
+          },
+          {
+            "type": "stored",
+            "id": 8241
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 8242,
+            "context": [
+              {
+                "type": "stored",
+                "id": 8243
+              },
+              {
+                "type": "stored",
+                "id": 8244
+              },
+              {
+                "type": "stored",
+                "id": 8245
+              },
+              {
+                "type": "stored",
+                "id": 8246
+              }
+            ]
+          },
+          "step": {
+            "text": "p\u0019\ud851\udc42",
+            "context": [
+              {
+                "type": "stored",
+                "id": 8247
+              },
+              {
+                "type": "stored",
+                "id": 8248
+              },
+              {
+                "type": "stored",
+                "id": 8249
+              }
+            ]
+          },
+          "n_step": 14831,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 8250,
+            "context": [
+              {
+                "type": "stored",
+                "id": 8251
+              },
+              {
+                "type": "stored",
+                "id": 8252
+              },
+              {
+                "type": "stored",
+                "id": 8253
+              },
+              {
+                "type": "stored",
+                "id": 8254
+              },
+              {
+                "type": "stored",
+                "id": 8255
+              },
+              {
+                "type": "stored",
+                "id": 8256
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00e9\u00c3\ud8be\udfaa\u0087[Kg",
+            "context": [
+              {
+                "type": "stored",
+                "id": 8257
+              },
+              {
+                "type": "stored",
+                "id": 8258
+              },
+              {
+                "type": "stored",
+                "id": 8259
+              },
+              {
+                "type": "stored",
+                "id": 8260
+              },
+              {
+                "type": "stored",
+                "id": 8261
+              },
+              {
+                "type": "stored",
+                "id": 8262
+              },
+              {
+                "type": "stored",
+                "id": 8263
+              },
+              {
+                "type": "stored",
+                "id": 8264
+              },
+              {
+                "type": "stored",
+                "id": 8265
+              },
+              {
+                "type": "stored",
+                "id": 8266
+              }
+            ]
+          },
+          "n_step": 385,
+          "goals": [
+            "SJBcpHSEonGnmnIOYWbtqG\njzguL\nb\nMbZUBm\n\npncRoczKWxZKb"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 8267,
+            "context": []
+          },
+          "step": {
+            "text": "\uda39\ude8e",
+            "context": [
+              {
+                "type": "stored",
+                "id": 8268
+              },
+              {
+                "type": "stored",
+                "id": 8269
+              },
+              {
+                "type": "stored",
+                "id": 8270
+              },
+              {
+                "type": "stored",
+                "id": 8271
+              },
+              {
+                "type": "stored",
+                "id": 8272
+              },
+              {
+                "type": "stored",
+                "id": 8273
+              },
+              {
+                "type": "stored",
+                "id": 8274
+              },
+              {
+                "type": "stored",
+                "id": 8275
+              }
+            ]
+          },
+          "n_step": 1548,
+          "goals": [
+            "lirTk\nV\nkDHyTQJZuUB\n\nrZoUYYcvDPLcov",
+            "SCA\nigNsnQQznE\nCbowe\nCTjFHYIQo\nreZPJBRaVby\n\nSNjkduaUUL",
+            "ZJ\nl\nc\nEkmXnOfVGCXoLoGG\ncubZjGuMOdZGWsUQmEoTok\n\nSIQzJTuuTicVW",
+            "\n\nKjp",
+            "\n\nH"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 8276,
+            "context": [
+              {
+                "type": "stored",
+                "id": 8277
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": []
+          },
+          "n_step": 143,
+          "goals": [
+            "\n\nxy",
+            "\n\nwslNFb",
+            "Ks\nnRTR\n\nSRL"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,363 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz4/xwkavopzgejci.v\", \"workspace\": \"/coq-dataset/repos/baz4\", \"repository\": \"/coq-dataset/repos/baz4\"}",
+    "{\"type\": \"stored\", \"id\": 7972}",
+    "{\"type\": \"stored\", \"id\": 7973}",
+    "{\"type\": \"stored\", \"id\": 7974}",
+    "{\"type\": \"stored\", \"id\": 7975}",
+    "{\"type\": \"stored\", \"id\": 7976}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 7977,
+        "context": []
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 7978,
+            "context": [
+              {
+                "type": "stored",
+                "id": 7979
+              },
+              {
+                "type": "stored",
+                "id": 7980
+              },
+              {
+                "type": "stored",
+                "id": 7981
+              },
+              {
+                "type": "stored",
+                "id": 7982
+              },
+              {
+                "type": "stored",
+                "id": 7983
+              },
+              {
+                "type": "stored",
+                "id": 7984
+              },
+              {
+                "type": "stored",
+                "id": 7985
+              },
+              {
+                "type": "stored",
+                "id": 7986
+              },
+              {
+                "type": "stored",
+                "id": 7987
+              },
+              {
+                "type": "stored",
+                "id": 7988
+              },
+              {
+                "type": "stored",
+                "id": 7989
+              },
+              {
+                "type": "stored",
+                "id": 7990
+              }
+            ]
+          },
+          "step": {
+            "text": "F",
+            "context": []
+          },
+          "n_step": -412403027583776256,
+          "goals": [
+            "tSMejs\nnAWQj\neWhMdeKQdjM\n\nauRu"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 7991,
+            "context": [
+              {
+                "type": "stored",
+                "id": 7992
+              },
+              {
+                "type": "stored",
+                "id": 7993
+              },
+              {
+                "type": "stored",
+                "id": 7994
+              },
+              {
+                "type": "stored",
+                "id": 7995
+              },
+              {
+                "type": "stored",
+                "id": 7996
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 7997
+              }
+            ]
+          },
+          "n_step": -12415461485,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 7998,
+            "context": [
+              {
+                "type": "stored",
+                "id": 7999
+              }
+            ]
+          },
+          "step": {
+            "text": "/\udb3e\udd4d1\ud932\udf9e\u00a1\u00b1",
+            "context": [
+              {
+                "type": "stored",
+                "id": 8000
+              },
+              {
+                "type": "stored",
+                "id": 8001
+              },
+              {
+                "type": "stored",
+                "id": 8002
+              }
+            ]
+          },
+          "n_step": -6906,
+          "goals": [
+            "ZPbg\ncmsQsxWmBXEUhGo\n\nH",
+            "R\n\ndwpU"
+          ]
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 8003,
+        "context": [
+          {
+            "type": "stored",
+            "id": 8004
+          },
+          {
+            "type": "stored",
+            "id": 8005
+          },
+          {
+            "type": "stored",
+            "id": 8006
+          },
+          {
+            "type": "stored",
+            "id": 8007
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 8008,
+            "context": [
+              {
+                "type": "stored",
+                "id": 8009
+              },
+              {
+                "type": "stored",
+                "id": 8010
+              },
+              {
+                "type": "stored",
+                "id": 8011
+              },
+              {
+                "type": "stored",
+                "id": 8012
+              },
+              {
+                "type": "stored",
+                "id": 8013
+              },
+              {
+                "type": "stored",
+                "id": 8014
+              }
+            ]
+          },
+          "step": {
+            "text": "\u0096\udba4\udeaac",
+            "context": [
+              {
+                "type": "stored",
+                "id": 8015
+              },
+              {
+                "type": "stored",
+                "id": 8016
+              },
+              {
+                "type": "stored",
+                "id": 8017
+              },
+              {
+                "type": "stored",
+                "id": 8018
+              },
+              {
+                "type": "stored",
+                "id": 8019
+              },
+              {
+                "type": "stored",
+                "id": 8020
+              },
+              {
+                "type": "stored",
+                "id": 8021
+              },
+              {
+                "type": "stored",
+                "id": 8022
+              },
+              {
+                "type": "stored",
+                "id": 8023
+              },
+              {
+                "type": "stored",
+                "id": 8024
+              },
+              {
+                "type": "stored",
+                "id": 8025
+              },
+              {
+                "type": "stored",
+                "id": 8026
+              },
+              {
+                "type": "stored",
+                "id": 8027
+              },
+              {
+                "type": "stored",
+                "id": 8028
+              },
+              {
+                "type": "stored",
+                "id": 8029
+              },
+              {
+                "type": "stored",
+                "id": 8030
+              },
+              {
+                "type": "stored",
+                "id": 8031
+              },
+              {
+                "type": "stored",
+                "id": 8032
+              },
+              {
+                "type": "stored",
+                "id": 8033
+              },
+              {
+                "type": "stored",
+                "id": 8034
+              },
+              {
+                "type": "stored",
+                "id": 8035
+              },
+              {
+                "type": "stored",
+                "id": 8036
+              },
+              {
+                "type": "stored",
+                "id": 8037
+              },
+              {
+                "type": "stored",
+                "id": 8038
+              },
+              {
+                "type": "stored",
+                "id": 8039
+              },
+              {
+                "type": "stored",
+                "id": 8040
+              },
+              {
+                "type": "stored",
+                "id": 8041
+              },
+              {
+                "type": "stored",
+                "id": 8042
+              },
+              {
+                "type": "stored",
+                "id": 8043
+              }
+            ]
+          },
+          "n_step": 33611,
+          "goals": [
+            "f\nKc\naIbAcg\nlHUtnFpqAfUZfFImjAL\nN\n\ntEQivNkGCv",
+            "Snt\n\nyPj",
+            "BL\naKS\nvO\nulERGPx\nyqFSzeqGAc\ny\n\neXIg",
+            "\n\nLCc",
+            "\n\no",
+            "uP\nEpySpGpc\n\nZnhDYLABR",
+            "balg\ns\n\nBmPglSQZ",
+            "lDLxrDCl\ndOVQVZvVtTKKohH\nMmqu\nGQSRd\nysvd\nHGLEJyv\n\npvTVNDLAf",
+            "xVfd\nyJUeXIkfqtaZUvlChloOAfAYxxUpJyolQp\nUnelk\npfVCi\nm\nuQkVzMzTuBY\nFcZYzzGb\ncSXYRT\nEYlG\ns\nsYfBiD\neJnAHrBPxpHKi\nKG\npSHpTeL\nrtHno\nLus\nIQF\nNM\nosOPAjQq\nXjAJeyngCc\n\nUXYaZi",
+            "wPPO\nJPnFmKR\nUPYD\n\nnNsLUiecSbn",
+            "ScCLRRFpHSVOg\nmodules\nX\nGzLFlPtctAeSzAdYO\nDmZM\nSzUpKr\nIO\ns\n\nuoErtTFI",
+            "Fq\nzbIfS\nmwezPPs\nFALSE\nzFNhsPGIMjHvPRKonhUbJqrsdGBlWkoIsUCenRGyLHHY\ndot\nfnAabfGtgji\nKa\nYHoUe\nbytes\noClgdY\nbxEbq\n\nQelAmZajdgcrEFxyitWLUb",
+            "content\ngLWUBU\n\nhs",
+            "eyESRHxo\nlAxicreMQXmXjwCO\niFBXttB\nd\nw\nz\nyaAvd\nOXixOLetvgadwWYvVHfTwXNxcfEPLySYs\nNone\nXD\njBFiiQIe\n\nDDk",
+            "d\nOqdamd\n\nIcEV",
+            "\n\nQkm",
+            "G\n\nKlGXT",
+            "sAE\neOyXgjiUgdXe\nT\nLA\nUTPCKOPjDxR\nNj\niWmXiWLsILgmu\niEGpi\nNostC\nnlbgBcTaVisdsE\nkL\nc\n\nR",
+            "QxFfJIuRuK\nV\nm\ngrOlO\n\nC",
+            "w\nSgFjuEbtwYXEdY\nJb\nNULL\npknmoR\nhyps\n\nuO",
+            "v\nYvN\nnHMET\nwP\nScunthorpe\nTbGvwzUePb\n\nOUjnVBBNEuWM",
+            "zIr\n\nnX",
+            "n\nj\n\nDBuFYbj"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,18 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz4/zeonxezsksldw.v\", \"workspace\": \"/coq-dataset/repos/baz4\", \"repository\": \"/coq-dataset/repos/baz4\"}",
+    "{\"type\": \"stored\", \"id\": 7960}",
+    "{\"type\": \"stored\", \"id\": 7961}",
+    "{\"type\": \"stored\", \"id\": 7962}",
+    "{\"type\": \"stored\", \"id\": 7963}",
+    "{\"type\": \"stored\", \"id\": 7964}",
+    "{\"type\": \"stored\", \"id\": 7965}",
+    "{\"type\": \"stored\", \"id\": 7966}",
+    "{\"type\": \"stored\", \"id\": 7967}",
+    "{\"type\": \"stored\", \"id\": 7968}",
+    "{\"type\": \"stored\", \"id\": 7969}",
+    "{\"type\": \"stored\", \"id\": 7970}",
+    "{\"type\": \"stored\", \"id\": 7971}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,6 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz5/a.v.v\", \"workspace\": \"/coq-dataset/repos/baz5\", \"repository\": \"/coq-dataset/repos/baz5\"}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
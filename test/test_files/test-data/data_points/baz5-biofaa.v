@@ -0,0 +1,38 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz5/biofaa.v\", \"workspace\": \"/coq-dataset/repos/baz5\", \"repository\": \"/coq-dataset/repos/baz5\"}",
+    "{\"type\": \"stored\", \"id\": 8669}",
+    "{\"type\": \"stored\", \"id\": 8670}",
+    "{\"type\": \"stored\", \"id\": 8671}",
+    "{\"type\": \"stored\", \"id\": 8672}",
+    "{\"type\": \"stored\", \"id\": 8673}",
+    "{\"type\": \"stored\", \"id\": 8674}",
+    "{\"type\": \"stored\", \"id\": 8675}",
+    "{\"type\": \"stored\", \"id\": 8676}",
+    "{\"type\": \"stored\", \"id\": 8677}",
+    "{\"type\": \"stored\", \"id\": 8678}",
+    "{\"type\": \"stored\", \"id\": 8679}",
+    "{\"type\": \"stored\", \"id\": 8680}",
+    "{\"type\": \"stored\", \"id\": 8681}",
+    "{\"type\": \"stored\", \"id\": 8682}",
+    "{\"type\": \"stored\", \"id\": 8683}",
+    "{\"type\": \"stored\", \"id\": 8684}",
+    "{\"type\": \"stored\", \"id\": 8685}",
+    "{\"type\": \"stored\", \"id\": 8686}",
+    "{\"type\": \"stored\", \"id\": 8687}",
+    "{\"type\": \"stored\", \"id\": 8688}",
+    "{\"type\": \"stored\", \"id\": 8689}",
+    "{\"type\": \"stored\", \"id\": 8690}",
+    "{\"type\": \"stored\", \"id\": 8691}",
+    "{\"type\": \"stored\", \"id\": 8692}",
+    "{\"type\": \"stored\", \"id\": 8693}",
+    "{\"type\": \"stored\", \"id\": 8694}",
+    "{\"type\": \"stored\", \"id\": 8695}",
+    "{\"type\": \"stored\", \"id\": 8696}",
+    "{\"type\": \"stored\", \"id\": 8697}",
+    "{\"type\": \"stored\", \"id\": 8698}",
+    "{\"type\": \"stored\", \"id\": 8699}",
+    "{\"type\": \"stored\", \"id\": 8700}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,185 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz5/bmzp.v\", \"workspace\": \"/coq-dataset/repos/baz5\", \"repository\": \"/coq-dataset/repos/baz5\"}",
+    "{\"type\": \"stored\", \"id\": 8278}",
+    "{\"type\": \"stored\", \"id\": 8279}",
+    "{\"type\": \"stored\", \"id\": 8280}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 8281,
+        "context": [
+          {
+            "type": "stored",
+            "id": 8282
+          },
+          {
+            "type": "stored",
+            "id": 8283
+          },
+          {
+            "type": "stored",
+            "id": 8284
+          },
+          {
+            "type": "stored",
+            "id": 8285
+          },
+          {
+            "type": "stored",
+            "id": 8286
+          },
+          {
+            "type": "stored",
+            "id": 8287
+          },
+          {
+            "type": "stored",
+            "id": 8288
+          },
+          {
+            "type": "stored",
+            "id": 8289
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 8290,
+            "context": [
+              {
+                "type": "stored",
+                "id": 8291
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00bbB2\uda2f\udd50j\u00b5",
+            "context": []
+          },
+          "n_step": 1246154,
+          "goals": [
+            "piYtt\nHQyCb\npUt\nmE\npY\nfK\n\nOFY",
+            "content\nZ\n\ndTloCTMpUJlbb"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 8292,
+            "context": [
+              {
+                "type": "stored",
+                "id": 8293
+              }
+            ]
+          },
+          "step": {
+            "text": ";\u0006\u0090\u0093\u00f4\u0007\u00b5\u00a1",
+            "context": []
+          },
+          "n_step": -1309422,
+          "goals": [
+            "fIKjei\nAT\nvww\nDefined\nYXLENLTimWzHXpOvmEYEh\nO\nOD\nosKcivpSLKhCwFygG\ne\nYUCceJoHvp\n\nMATvXmhsSPgYIA",
+            "pc\nICli\njqNSH\n\nU"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 8294,
+            "context": [
+              {
+                "type": "stored",
+                "id": 8295
+              },
+              {
+                "type": "stored",
+                "id": 8296
+              },
+              {
+                "type": "stored",
+                "id": 8297
+              },
+              {
+                "type": "stored",
+                "id": 8298
+              },
+              {
+                "type": "stored",
+                "id": 8299
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 8300
+              },
+              {
+                "type": "stored",
+                "id": 8301
+              },
+              {
+                "type": "stored",
+                "id": 8302
+              },
+              {
+                "type": "stored",
+                "id": 8303
+              },
+              {
+                "type": "stored",
+                "id": 8304
+              },
+              {
+                "type": "stored",
+                "id": 8305
+              },
+              {
+                "type": "stored",
+                "id": 8306
+              },
+              {
+                "type": "stored",
+                "id": 8307
+              },
+              {
+                "type": "stored",
+                "id": 8308
+              },
+              {
+                "type": "stored",
+                "id": 8309
+              },
+              {
+                "type": "stored",
+                "id": 8310
+              },
+              {
+                "type": "stored",
+                "id": 8311
+              },
+              {
+                "type": "stored",
+                "id": 8312
+              },
+              {
+                "type": "stored",
+                "id": 8313
+              }
+            ]
+          },
+          "n_step": -11256,
+          "goals": []
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,7 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz5/dz.v\", \"workspace\": \"/coq-dataset/repos/baz5\", \"repository\": \"/coq-dataset/repos/baz5\"}",
+    "{\"type\": \"stored\", \"id\": 8559}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
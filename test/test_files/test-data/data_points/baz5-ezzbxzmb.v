@@ -0,0 +1,45 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz5/ezzbxzmb.v\", \"workspace\": \"/coq-dataset/repos/baz5\", \"repository\": \"/coq-dataset/repos/baz5\"}",
+    "{\"type\": \"stored\", \"id\": 8533}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 8534,
+        "context": [
+          {
+            "type": "stored",
+            "id": 8535
+          },
+          {
+            "type": "stored",
+            "id": 8536
+          },
+          {
+            "type": "stored",
+            "id": 8537
+          },
+          {
+            "type": "stored",
+            "id": 8538
+          },
+          {
+            "type": "stored",
+            "id": 8539
+          },
+          {
+            "type": "stored",
+            "id": 8540
+          },
+          {
+            "type": "stored",
+            "id": 8541
+          }
+        ]
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
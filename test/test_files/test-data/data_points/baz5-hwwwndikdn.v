@@ -0,0 +1,87 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz5/hwwwndikdn.v\", \"workspace\": \"/coq-dataset/repos/baz5\", \"repository\": \"/coq-dataset/repos/baz5\"}",
+    "{\"type\": \"stored\", \"id\": 8509}",
+    "{\"type\": \"stored\", \"id\": 8510}",
+    "{\"type\": \"stored\", \"id\": 8511}",
+    "{\"type\": \"stored\", \"id\": 8512}",
+    "{\"type\": \"stored\", \"id\": 8513}",
+    "{\"type\": \"stored\", \"id\": 8514}",
+    "{\"type\": \"stored\", \"id\": 8515}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 8516,
+        "context": [
+          {
+            "type": "stored",
+            "id": 8517
+          },
+          {
+            "type": "stored",
+            "id": 8518
+          },
+          {
+            "type": "stored",
+            "id": 8519
+          },
+          {
+            "type": "stored",
+            "id": 8520
+          },
+          {
+            "type": "stored",
+            "id": 8521
+          },
+          {
+            "type": "stored",
+            "id": 8522
+          },
+          {
+            "type": "stored",
+            "id": 8523
+          },
+          {
+            "type": "stored",
+            "id": 8524
+          },
+          {
+            "type": "stored",
+            "id": 8525
+          },
+          {
+            "type": "stored",
+            "id": 8526
+          },
+          {
+            "type": "stored",
+            "id": 8527
+          },
+          {
+            "type": "stored",
+            "id": 8528
+          },
+          {
+            "type": "stored",
+            "id": 8529
+          },
+          {
+            "type": "stored",
+            "id": 8530
+          },
+          {
+            "type": "stored",
+            "id": 8531
+          },
+          {
+            "type": "stored",
+            "id": 8532
+          }
+        ]
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
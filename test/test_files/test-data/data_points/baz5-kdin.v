@@ -0,0 +1,95 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz5/kdin.v\", \"workspace\": \"/coq-dataset/repos/baz5\", \"repository\": \"/coq-dataset/repos/baz5\"}",
+    "{\"type\": \"stored\", \"id\": 8542}",
+    "{\"type\": \"stored\", \"id\": 8543}",
+    "{\"type\": \"stored\", \"id\": 8544}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 8545,
+        "context": [
+          {
+            "type": "stored",
+            "id": 8546
+          },
+          {
+            "type": "stored",
+            "id": 8547
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 8548,
+            "context": []
+          },
+          "step": {
+            "text": "\u00f6\u000e",
+            "context": [
+              {
+                "type": "stored",
+                "id": 8549
+              },
+              {
+                "type": "stored",
+                "id": 8550
+              },
+              {
+                "type": "stored",
+                "id": 8551
+              },
+              {
+                "type": "stored",
+                "id": 8552
+              },
+              {
+                "type": "stored",
+                "id": 8553
+              },
+              {
+                "type": "stored",
+                "id": 8554
+              },
+              {
+                "type": "stored",
+                "id": 8555
+              },
+              {
+                "type": "stored",
+                "id": 8556
+              },
+              {
+                "type": "stored",
+                "id": 8557
+              },
+              {
+                "type": "stored",
+                "id": 8558
+              }
+            ]
+          },
+          "n_step": 32455,
+          "goals": [
+            "\n\nVTy",
+            "NIL\n\nCzMKWX",
+            "v\nW\nOJnNA\nfQndh\ns\nbRx\nypeQanvYWqeN\nthen\nm\niW\nchMK\nuYMNH\nilhiAv\naPsHoASfH\ncHOlEnb\nTWAzFvpYFEKZYfZVAmnVhzEpQpRkYq\nOzYHmbQT\nfTh\nZzSD\nzj\nvFAjkiEOROxLRBmiK\nrerank\nDiWVSq\nDx\nVRUCJK\n\nItiKkkqxFcs",
+            "LGJvNAdvnFYBl\nMM\nIZeZMjZUJiY\nJj\nEmzXKUhNEKl\naKfbeYmgCY\n\nTdiozJBi",
+            "ylfYOWYgXgOZMhN\nAxXk\nMDiQ\nbBVv\nMjQswOZfEueY\nPvVUSyyB\nq\nec\npV\nGQhAXIAlo\nPFFk\nZUGH\nPrTPzYis\nGLkTEYKjgCUUXOQ\nH\nZ\nuITvLILrdCbODGZy\nvMZlBnsrpfh\n\nXxY",
+            "ksJAhd\nrydUt\nGrwlAKF\nHMPRuOXTlk\nUXp\nVjtnAtbu\n\npt",
+            "YyhIpEgq\n\nmS",
+            "wqivFJpNkxgZ\n\nsp",
+            "t\nzlUF\nycREOoz\n\npGbyvsBcPnEzqgOFW",
+            "Corollary\nwOYjEuh\nogprVKmLz\n\nYSOFFHxQqTusC",
+            "pE\n\nMQnHC",
+            "\n\nH"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,28 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz5/lljlmgwcmu.v\", \"workspace\": \"/coq-dataset/repos/baz5\", \"repository\": \"/coq-dataset/repos/baz5\"}",
+    "{\"type\": \"stored\", \"id\": 8783}",
+    "{\"type\": \"stored\", \"id\": 8784}",
+    "{\"type\": \"stored\", \"id\": 8785}",
+    "{\"type\": \"stored\", \"id\": 8786}",
+    "{\"type\": \"stored\", \"id\": 8787}",
+    "{\"type\": \"stored\", \"id\": 8788}",
+    "{\"type\": \"stored\", \"id\": 8789}",
+    "{\"type\": \"stored\", \"id\": 8790}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 8791,
+        "context": [
+          {
+            "type": "stored",
+            "id": 8792
+          }
+        ]
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
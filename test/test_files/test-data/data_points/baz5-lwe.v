@@ -0,0 +1,11 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz5/lwe.v\", \"workspace\": \"/coq-dataset/repos/baz5\", \"repository\": \"/coq-dataset/repos/baz5\"}",
+    "{\"type\": \"stored\", \"id\": 8327}",
+    "{\"type\": \"stored\", \"id\": 8328}",
+    "{\"type\": \"stored\", \"id\": 8329}",
+    "{\"type\": \"stored\", \"id\": 8330}",
+    "{\"type\": \"stored\", \"id\": 8331}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
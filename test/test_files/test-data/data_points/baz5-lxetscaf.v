@@ -0,0 +1,406 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz5/lxetscaf.v\", \"workspace\": \"/coq-dataset/repos/baz5\", \"repository\": \"/coq-dataset/repos/baz5\"}",
+    "{\"type\": \"stored\", \"id\": 8701}",
+    "{\"type\": \"stored\", \"id\": 8702}",
+    "{\"type\": \"stored\", \"id\": 8703}",
+    "{\"type\": \"stored\", \"id\": 8704}",
+    "{\"type\": \"stored\", \"id\": 8705}",
+    "{\"type\": \"stored\", \"id\": 8706}",
+    "{\"type\": \"stored\", \"id\": 8707}",
+    "{\"type\": \"stored\", \"id\": 8708}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 8709,
+        "context": [
+          {
+            "type": "stored",
+            "id": 8710
+          },
+          {
+            "type": "stored",
+            "id": 8711
+          },
+          {
+            "type": "stored",
+            "id": 8712
+          },
+          {
+            "type": "stored",
+            "id": 8713
+          },
+          {
+            "type": "stored",
+            "id": 8714
+          },
+          {
+            "type": "stored",
+            "id": 8715
+          },
+          {
+            "type": "stored",
+            "id": 8716
+          },
+          {
+            "type": "stored",
+            "id": 8717
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 8718,
+            "context": [
+              {
+                "type": "stored",
+                "id": 8719
+              }
+            ]
+          },
+          "step": {
+            "text": "f\ud9c4\udc0d",
+            "context": [
+              {
+                "type": "stored",
+                "id": 8720
+              }
+            ]
+          },
+          "n_step": 35756,
+          "goals": [
+            "NULL\nx\nqgniGPdt\n\nNiRWoBKDvlxZg",
+            "wqNImufrY\nYQET\njqAclfbkZlANN\nYqyRJAiNkgwjX\nM\nv\nLZzir\nG\n\nWVuJcu",
+            "pZGYHJWAU\nHe\nhuR\nJYM\nN\nTrue\n\nznWUlz"
+          ]
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 8721,
+        "context": []
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 8722,
+            "context": []
+          },
+          "step": {
+            "text": "\u00bd\u001bv\ud803\udd8f\u00a4d\u00ca\u00a6",
+            "context": [
+              {
+                "type": "stored",
+                "id": 8723
+              },
+              {
+                "type": "stored",
+                "id": 8724
+              },
+              {
+                "type": "stored",
+                "id": 8725
+              },
+              {
+                "type": "stored",
+                "id": 8726
+              },
+              {
+                "type": "stored",
+                "id": 8727
+              },
+              {
+                "type": "stored",
+                "id": 8728
+              },
+              {
+                "type": "stored",
+                "id": 8729
+              },
+              {
+                "type": "stored",
+                "id": 8730
+              },
+              {
+                "type": "stored",
+                "id": 8731
+              },
+              {
+                "type": "stored",
+                "id": 8732
+              },
+              {
+                "type": "stored",
+                "id": 8733
+              },
+              {
+                "type": "stored",
+                "id": 8734
+              },
+              {
+                "type": "stored",
+                "id": 8735
+              },
+              {
+                "type": "stored",
+                "id": 8736
+              },
+              {
+                "type": "stored",
+                "id": 8737
+              },
+              {
+                "type": "stored",
+                "id": 8738
+              },
+              {
+                "type": "stored",
+                "id": 8739
+              },
+              {
+                "type": "stored",
+                "id": 8740
+              },
+              {
+                "type": "stored",
+                "id": 8741
+              }
+            ]
+          },
+          "n_step": 15913,
+          "goals": [
+            "http\nXgII\nsVLAMzaVMcWqfnmCYPjgD\naIQHkj\nupiD\nFalse\nx\nCOROLLARY\nvrcRQjbNDJfQLyghCpOulgoKmiwCmwitS\nRcc\nlNfYszfya\n\ndurd",
+            "Hj\nVnqX\n\nwHcrX",
+            "wyqa\ncapabilities\nKHj\nWIPSKG\nOG\nULpWcl\nLdAbVGGUNKIvKuuRd\nYWEFkpcUFxHXBiVVnBXMzctArq\nClknIxVawUBM\nOty\nxIZunwhsqeLZZOc\nD\n\nvJMUBdmQIa",
+            "false\neBeIy\nthkCxYwn\nuc\nsvvyi\nx\nyTOhpstTMCalBlzlARaHtlQHVxFGJdazbu\nIw\nJbX\nYHFpy\n\nJqSmooRA",
+            "Btf\n\nQMpX",
+            "mKCiCsocLwx\n\nmMC",
+            "qIlAwJrqyhLVf\nbiJx\nd\nNpQpIaO\nYtTNQz\n\nal",
+            "V\nmrJ\nfDyaBBFnJyGIJEhzYEeNYL\nilAfrjBxNWBoQUeqqCgwLBfMXZJ\nRqOXmfr\nRYbiNZDMvZOo\n\nMgsN",
+            "pjav\naw\nUujSojauhs\n\nINF",
+            "SyIZKd\ngBjOOe\nQCos\ntuFettZaAJkgcKAyYzZwMd\noIiKzPzmNBKIIJeNL\nTRUE\nOlGDoF\nkBaitYGZgBPASTk\narray\nGkKGvf\nd\nM\nGOkSpX\n\nOIZAUNzRJtZuGwpGg"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 8742,
+            "context": [
+              {
+                "type": "stored",
+                "id": 8743
+              },
+              {
+                "type": "stored",
+                "id": 8744
+              },
+              {
+                "type": "stored",
+                "id": 8745
+              },
+              {
+                "type": "stored",
+                "id": 8746
+              }
+            ]
+          },
+          "step": {
+            "text": "~\u0090\u0001|\u008e\u00d0\ud94d\udd2e\u009e3F\u001a*\u4213a\u00b7\u00d1S\u00af\u00a8\u00ba\b\u0093",
+            "context": [
+              {
+                "type": "stored",
+                "id": 8747
+              },
+              {
+                "type": "stored",
+                "id": 8748
+              },
+              {
+                "type": "stored",
+                "id": 8749
+              }
+            ]
+          },
+          "n_step": 12115169232,
+          "goals": []
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 8750,
+        "context": [
+          {
+            "type": "stored",
+            "id": 8751
+          },
+          {
+            "type": "stored",
+            "id": 8752
+          },
+          {
+            "type": "stored",
+            "id": 8753
+          },
+          {
+            "type": "stored",
+            "id": 8754
+          },
+          {
+            "type": "stored",
+            "id": 8755
+          },
+          {
+            "type": "stored",
+            "id": 8756
+          },
+          {
+            "type": "stored",
+            "id": 8757
+          },
+          {
+            "type": "stored",
+            "id": 8758
+          },
+          {
+            "type": "stored",
+            "id": 8759
+          },
+          {
+            "type": "stored",
+            "id": 8760
+          },
+          {
+            "type": "stored",
+            "id": 8761
+          },
+          {
+            "type": "stored",
+            "id": 8762
+          },
+          {
+            "type": "stored",
+            "id": 8763
+          },
+          {
+            "type": "stored",
+            "id": 8764
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 8765,
+            "context": []
+          },
+          "step": {
+            "text": "\ud849\ude6f\u0093\u00c9",
+            "context": []
+          },
+          "n_step": 753,
+          "goals": [
+            "CGiIgGrU\nhyOZhfPoSv\n\nc",
+            "wYwekYFuQuPJsVuAh\nhEWlCWdX\nKAqjjg\nyFtq\nkXIMVJgr\n\nCzxxmxGbIW",
+            "vP\nuUnP\njhpDP\n\nE"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 8766,
+            "context": [
+              {
+                "type": "stored",
+                "id": 8767
+              },
+              {
+                "type": "stored",
+                "id": 8768
+              },
+              {
+                "type": "stored",
+                "id": 8769
+              },
+              {
+                "type": "stored",
+                "id": 8770
+              },
+              {
+                "type": "stored",
+                "id": 8771
+              },
+              {
+                "type": "stored",
+                "id": 8772
+              },
+              {
+                "type": "stored",
+                "id": 8773
+              },
+              {
+                "type": "stored",
+                "id": 8774
+              },
+              {
+                "type": "stored",
+                "id": 8775
+              },
+              {
+                "type": "stored",
+                "id": 8776
+              },
+              {
+                "type": "stored",
+                "id": 8777
+              },
+              {
+                "type": "stored",
+                "id": 8778
+              },
+              {
+                "type": "stored",
+                "id": 8779
+              }
+            ]
+          },
+          "step": {
+            "text": "}\u00c2\ud99a\udfc5r\u2d7b",
+            "context": [
+              {
+                "type": "stored",
+                "id": 8780
+              },
+              {
+                "type": "stored",
+                "id": 8781
+              },
+              {
+                "type": "stored",
+                "id": 8782
+              }
+            ]
+          },
+          "n_step": 4096,
+          "goals": [
+            "e\nJZdpBKsfgGCoipoJy\nundefined\nPCGECUQ\ntBEvGkqmVDl\nrWUCdI\nFawaPDP\nCtcQavV\nMEBkOPot\nsyT\ntIRh\neclAC\nmqPxuv\nNone\ngrKLR\ntkHe\nanLbt\n\nNi",
+            "ZOR\nnPyqNuTDj\nkd\na\nq\nFWlS\npAriwFGwdPHIsU\nh\ncrNBDA\njcU\nAUuR\n\ntDUEyxiHWQe",
+            "sQ\niJx\n\nTRUE",
+            "c\nWtzbif\nD\nPJKVt\nlTR\nJtU\ndUK\nr\nkE\noUPMBKvFuR\n\nwHXoIBcnlxaq",
+            "n\nsj\nOTIvIeFvxg\nHl\nYmXOiLYL\ntWwsSd\naiIXHwmsLIdYp\ns\nrPcrHTbi\nKRM\nZ\n\nwqzzwITI",
+            "ujkoZxPTM\nG\n\nvQQ"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,13 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz5/mj.v\", \"workspace\": \"/coq-dataset/repos/baz5\", \"repository\": \"/coq-dataset/repos/baz5\"}",
+    "{\"type\": \"stored\", \"id\": 8402}",
+    "{\"type\": \"stored\", \"id\": 8403}",
+    "{\"type\": \"stored\", \"id\": 8404}",
+    "{\"type\": \"stored\", \"id\": 8405}",
+    "{\"type\": \"stored\", \"id\": 8406}",
+    "{\"type\": \"stored\", \"id\": 8407}",
+    "{\"type\": \"stored\", \"id\": 8408}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,269 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz5/os.v\", \"workspace\": \"/coq-dataset/repos/baz5\", \"repository\": \"/coq-dataset/repos/baz5\"}",
+    "{\"type\": \"stored\", \"id\": 8460}",
+    "{\"type\": \"stored\", \"id\": 8461}",
+    "{\"type\": \"stored\", \"id\": 8462}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 8463,
+        "context": [
+          {
+            "type": "stored",
+            "id": 8464
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 8465,
+            "context": [
+              {
+                "type": "stored",
+                "id": 8466
+              },
+              {
+                "type": "stored",
+                "id": 8467
+              },
+              {
+                "type": "stored",
+                "id": 8468
+              },
+              {
+                "type": "stored",
+                "id": 8469
+              },
+              {
+                "type": "stored",
+                "id": 8470
+              },
+              {
+                "type": "stored",
+                "id": 8471
+              },
+              {
+                "type": "stored",
+                "id": 8472
+              },
+              {
+                "type": "stored",
+                "id": 8473
+              },
+              {
+                "type": "stored",
+                "id": 8474
+              }
+            ]
+          },
+          "step": {
+            "text": "S",
+            "context": []
+          },
+          "n_step": 292,
+          "goals": [
+            "qliF\nk\n\nPXYAhBP",
+            "rEE\nCO\n\nMNtoMo",
+            "AGOVP\nqAKubVskaW\npwkDFiZ\nsW\nadaRxY\nQlRuF\nitM\nRMFBRi\nv\nLm\nUENMOpCxMkVYvBZQPU\nUC\no\n\nU",
+            "OacSwUAAZ\nDIOUOpY\nvUkyzRKOsQ\njClkf\nxr\nSa\nuqn\nfnWWdjOY\nEqjYKbANCRxWrGFzEk\nsa\nANxv\ndn\n\nCbumBLoQ",
+            "retriever\ncwEZPTuCIbn\nTMjSS\nWaUFn\n\nRw",
+            "KOavrygc\nvmTbE\nIBDJIiXeh\nTRIh\nuIfLkQJUvbo\nvUpKPzKSfPukSnSdVgo\nS\nOOP\nZWf\nt\nU\nCJb\nNuqWy\nBvmbS\n\nsrc",
+            "Bujbns\nUqOL\num\n\nwAcyUAW",
+            "xHh\ntIIci\nvWLsmfajE\ntZV\ntrain\n\nJtX",
+            "jdccd\nquantize\nKMKCxLvCjX\nOERVqUVhxM\nfW\nNUL\nH\nBbySerxC\n\nP",
+            "SE\nBG\nVOyMZxEgZGcs\nI\nWK\nRZ\nG\nxbN\nfCHq\nRWMii\nmnWNf\n\nPxCdLTFbPzkeeMGDevmQGZReyJ",
+            "tvOBfXCb\nyjVpr\ngpPuDUnsTEB\nMTUe\nPq\nl\nmZdXZg\niQzZfmW\n\nUwYLfO",
+            "Y\npT\n\nKVEHj",
+            "v\nUQk\nimtubAcTn\n\nfDM",
+            "xyf\nCeMUVMfzsEzDoyTuX\nTsEnrklpuEIHygP\nkbQsFqlxIw\nFmngKy\nIfGRVq\nrwa\nval\n\nTT",
+            "MKRID\nszqVoPL\nVxPrr\nn\nQS\nTljyGRooDCr\nT\n\nhevKn"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 8475,
+            "context": [
+              {
+                "type": "stored",
+                "id": 8476
+              }
+            ]
+          },
+          "step": {
+            "text": "Theorem",
+            "context": []
+          },
+          "n_step": 51495339,
+          "goals": []
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 8477,
+        "context": [
+          {
+            "type": "stored",
+            "id": 8478
+          },
+          {
+            "type": "stored",
+            "id": 8479
+          },
+          {
+            "type": "stored",
+            "id": 8480
+          },
+          {
+            "type": "stored",
+            "id": 8481
+          },
+          {
+            "type": "stored",
+            "id": 8482
+          },
+          {
+            "type": "stored",
+            "id": 8483
+          },
+          {
+            "type": "stored",
+            "id": 8484
+          },
+          {
+            "type": "stored",
+            "id": 8485
+          },
+          {
+            "type": "stored",
+            "id": 8486
+          },
+          {
+            "type": "stored",
+            "id": 8487
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 8488,
+            "context": [
+              {
+                "type": "stored",
+                "id": 8489
+              },
+              {
+                "type": "stored",
+                "id": 8490
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00a3\u009fMy\u00018",
+            "context": [
+              {
+                "type": "stored",
+                "id": 8491
+              },
+              {
+                "type": "stored",
+                "id": 8492
+              },
+              {
+                "type": "stored",
+                "id": 8493
+              }
+            ]
+          },
+          "n_step": 3684,
+          "goals": [
+            "\n\nvSh"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 8494,
+            "context": [
+              {
+                "type": "stored",
+                "id": 8495
+              },
+              {
+                "type": "stored",
+                "id": 8496
+              },
+              {
+                "type": "stored",
+                "id": 8497
+              },
+              {
+                "type": "stored",
+                "id": 8498
+              },
+              {
+                "type": "stored",
+                "id": 8499
+              },
+              {
+                "type": "stored",
+                "id": 8500
+              }
+            ]
+          },
+          "step": {
+            "text": "\u009eF\"",
+            "context": [
+              {
+                "type": "stored",
+                "id": 8501
+              },
+              {
+                "type": "stored",
+                "id": 8502
+              },
+              {
+                "type": "stored",
+                "id": 8503
+              },
+              {
+                "type": "stored",
+                "id": 8504
+              },
+              {
+                "type": "stored",
+                "id": 8505
+              },
+              {
+                "type": "stored",
+                "id": 8506
+              },
+              {
+                "type": "stored",
+                "id": 8507
+              },
+              {
+                "type": "stored",
+                "id": 8508
+              }
+            ]
+          },
+          "n_step": 31741092630621344,
+          "goals": [
+            "wtORoKJfbQQj\nZ\nloSpUVBatTgLDeszzLh\nNMqYQFUkhUTbuZDxz\nTqhvYV\nzpq\n\nNouaHwNQ",
+            "DkHzGqZ\n\nBjX"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,103 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz5/ozglx.v\", \"workspace\": \"/coq-dataset/repos/baz5\", \"repository\": \"/coq-dataset/repos/baz5\"}",
+    "{\"type\": \"stored\", \"id\": 8431}",
+    "{\"type\": \"stored\", \"id\": 8432}",
+    "{\"type\": \"stored\", \"id\": 8433}",
+    "{\"type\": \"stored\", \"id\": 8434}",
+    "{\"type\": \"stored\", \"id\": 8435}",
+    "{\"type\": \"stored\", \"id\": 8436}",
+    "{\"type\": \"stored\", \"id\": 8437}",
+    "{\"type\": \"stored\", \"id\": 8438}",
+    "{\"type\": \"stored\", \"id\": 8439}",
+    "{\"type\": \"stored\", \"id\": 8440}",
+    "{\"type\": \"stored\", \"id\": 8441}",
+    "{\"type\": \"stored\", \"id\": 8442}",
+    "{\"type\": \"stored\", \"id\": 8443}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 8444,
+        "context": [
+          {
+            "type": "stored",
+            "id": 8445
+          },
+          {
+            "type": "stored",
+            "id": 8446
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 8447,
+            "context": [
+              {
+                "type": "stored",
+                "id": 8448
+              },
+              {
+                "type": "stored",
+                "id": 8449
+              },
+              {
+                "type": "stored",
+                "id": 8450
+              },
+              {
+                "type": "stored",
+                "id": 8451
+              },
+              {
+                "type": "stored",
+                "id": 8452
+              },
+              {
+                "type": "stored",
+                "id": 8453
+              },
+              {
+                "type": "stored",
+                "id": 8454
+              }
+            ]
+          },
+          "step": {
+            "text": "\ud81b\udf38",
+            "context": [
+              {
+                "type": "stored",
+                "id": 8455
+              },
+              {
+                "type": "stored",
+                "id": 8456
+              },
+              {
+                "type": "stored",
+                "id": 8457
+              },
+              {
+                "type": "stored",
+                "id": 8458
+              },
+              {
+                "type": "stored",
+                "id": 8459
+              }
+            ]
+          },
+          "n_step": -12883,
+          "goals": [
+            "SNYFF\no\nFUCAT\njktj\njHSATZltZwRRUH\nSE\nNMzoGiSUgxNo\nOZky\nrn\nOpbJlgcdjN\nX\nz\ndaqviVhsxVKdui\nSlsnkC\nDHAvWFsFdR\ncnndQbxGLXYfLut\ngqnGOHLgZ\nZmYnydUjrpJKX\no\nLPWpSsBY\ndQks\nxCaFdfTfDCbs\nv\nn\ndyVXHQra\nWTGEZ\n\nEEDim"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,22 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz5/qa.v\", \"workspace\": \"/coq-dataset/repos/baz5\", \"repository\": \"/coq-dataset/repos/baz5\"}",
+    "{\"type\": \"stored\", \"id\": 8332}",
+    "{\"type\": \"stored\", \"id\": 8333}",
+    "{\"type\": \"stored\", \"id\": 8334}",
+    "{\"type\": \"stored\", \"id\": 8335}",
+    "{\"type\": \"stored\", \"id\": 8336}",
+    "{\"type\": \"stored\", \"id\": 8337}",
+    "{\"type\": \"stored\", \"id\": 8338}",
+    "{\"type\": \"stored\", \"id\": 8339}",
+    "{\"type\": \"stored\", \"id\": 8340}",
+    "{\"type\": \"stored\", \"id\": 8341}",
+    "{\"type\": \"stored\", \"id\": 8342}",
+    "{\"type\": \"stored\", \"id\": 8343}",
+    "{\"type\": \"stored\", \"id\": 8344}",
+    "{\"type\": \"stored\", \"id\": 8345}",
+    "{\"type\": \"stored\", \"id\": 8346}",
+    "{\"type\": \"stored\", \"id\": 8347}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
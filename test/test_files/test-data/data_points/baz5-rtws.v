@@ -0,0 +1,12 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz5/rtws.v\", \"workspace\": \"/coq-dataset/repos/baz5\", \"repository\": \"/coq-dataset/repos/baz5\"}",
+    "{\"type\": \"stored\", \"id\": 8814}",
+    "{\"type\": \"stored\", \"id\": 8815}",
+    "{\"type\": \"stored\", \"id\": 8816}",
+    "{\"type\": \"stored\", \"id\": 8817}",
+    "{\"type\": \"stored\", \"id\": 8818}",
+    "{\"type\": \"stored\", \"id\": 8819}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,446 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz5/ryfexfcpe.v\", \"workspace\": \"/coq-dataset/repos/baz5\", \"repository\": \"/coq-dataset/repos/baz5\"}",
+    "{\"type\": \"stored\", \"id\": 8560}",
+    "{\"type\": \"stored\", \"id\": 8561}",
+    "{\"type\": \"stored\", \"id\": 8562}",
+    "{\"type\": \"stored\", \"id\": 8563}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 8564,
+        "context": [
+          {
+            "type": "stored",
+            "id": 8565
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 8566,
+            "context": [
+              {
+                "type": "stored",
+                "id": 8567
+              },
+              {
+                "type": "stored",
+                "id": 8568
+              }
+            ]
+          },
+          "step": {
+            "text": "9z\u0014\u009a\u00b1",
+            "context": [
+              {
+                "type": "stored",
+                "id": 8569
+              },
+              {
+                "type": "stored",
+                "id": 8570
+              },
+              {
+                "type": "stored",
+                "id": 8571
+              },
+              {
+                "type": "stored",
+                "id": 8572
+              },
+              {
+                "type": "stored",
+                "id": 8573
+              },
+              {
+                "type": "stored",
+                "id": 8574
+              },
+              {
+                "type": "stored",
+                "id": 8575
+              },
+              {
+                "type": "stored",
+                "id": 8576
+              }
+            ]
+          },
+          "n_step": 496,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 8577,
+            "context": [
+              {
+                "type": "stored",
+                "id": 8578
+              },
+              {
+                "type": "stored",
+                "id": 8579
+              },
+              {
+                "type": "stored",
+                "id": 8580
+              },
+              {
+                "type": "stored",
+                "id": 8581
+              },
+              {
+                "type": "stored",
+                "id": 8582
+              },
+              {
+                "type": "stored",
+                "id": 8583
+              },
+              {
+                "type": "stored",
+                "id": 8584
+              },
+              {
+                "type": "stored",
+                "id": 8585
+              }
+            ]
+          },
+          "step": {
+            "text": "\b\ud88e\udc25\udb41\udcd8\ud912\udedb1%\u009c\udaf7\udef7\u00fd-\u00f2;\u00df\ud900\udc87)\u0014\u00f4",
+            "context": [
+              {
+                "type": "stored",
+                "id": 8586
+              }
+            ]
+          },
+          "n_step": 5339939,
+          "goals": [
+            "Rl\npFeAAn\n\neZlVXOXulRXqStjLAqfEbQY",
+            "Ll\np\nGg\nMcEJc\nHdCYrErfwzDx\n\nmodule"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 8587,
+            "context": [
+              {
+                "type": "stored",
+                "id": 8588
+              },
+              {
+                "type": "stored",
+                "id": 8589
+              },
+              {
+                "type": "stored",
+                "id": 8590
+              },
+              {
+                "type": "stored",
+                "id": 8591
+              },
+              {
+                "type": "stored",
+                "id": 8592
+              },
+              {
+                "type": "stored",
+                "id": 8593
+              }
+            ]
+          },
+          "step": {
+            "text": "\u009a\u0084",
+            "context": [
+              {
+                "type": "stored",
+                "id": 8594
+              },
+              {
+                "type": "stored",
+                "id": 8595
+              },
+              {
+                "type": "stored",
+                "id": 8596
+              },
+              {
+                "type": "stored",
+                "id": 8597
+              },
+              {
+                "type": "stored",
+                "id": 8598
+              },
+              {
+                "type": "stored",
+                "id": 8599
+              },
+              {
+                "type": "stored",
+                "id": 8600
+              },
+              {
+                "type": "stored",
+                "id": 8601
+              }
+            ]
+          },
+          "n_step": -355687428096000,
+          "goals": [
+            "QNJxhwmBBPoGQRHh\nh\nNaN\nCGsDKnUpa\nGd\nArqVCO\n\nCngRxQlH",
+            "nDQtdUOBtLDQotaXe\nRxD\nyjWXNFowSzaNcbEzbWfwiTfwWBhX\nYKnkT\nWBhQI\nHGmWOjJ\nM\nHcbUxNQGNgem\n\nZbwmkrWGQAbN"
+          ]
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 8602,
+        "context": [
+          {
+            "type": "stored",
+            "id": 8603
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 8604,
+            "context": [
+              {
+                "type": "stored",
+                "id": 8605
+              },
+              {
+                "type": "stored",
+                "id": 8606
+              },
+              {
+                "type": "stored",
+                "id": 8607
+              },
+              {
+                "type": "stored",
+                "id": 8608
+              },
+              {
+                "type": "stored",
+                "id": 8609
+              }
+            ]
+          },
+          "step": {
+            "text": "C",
+            "context": [
+              {
+                "type": "stored",
+                "id": 8610
+              },
+              {
+                "type": "stored",
+                "id": 8611
+              },
+              {
+                "type": "stored",
+                "id": 8612
+              },
+              {
+                "type": "stored",
+                "id": 8613
+              }
+            ]
+          },
+          "n_step": 246,
+          "goals": [
+            "\n\nJH",
+            "Vujw\nDAQSpQNSnraBqb\nOwCzJhzCRqea\n\nlI"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 8614,
+            "context": [
+              {
+                "type": "stored",
+                "id": 8615
+              },
+              {
+                "type": "stored",
+                "id": 8616
+              },
+              {
+                "type": "stored",
+                "id": 8617
+              },
+              {
+                "type": "stored",
+                "id": 8618
+              },
+              {
+                "type": "stored",
+                "id": 8619
+              },
+              {
+                "type": "stored",
+                "id": 8620
+              }
+            ]
+          },
+          "step": {
+            "text": "L\u00e7\u0010\u00ab\ud8ef\udf92\u00f1",
+            "context": []
+          },
+          "n_step": 59593714388,
+          "goals": [
+            "pkMIQLaA\nbgshQdvdGkj\nchEb\npartition\n\nnkR",
+            "tsgXob\nVoDTJulrBNneG\nPScJ\nyeUWI\nQlROtn\nTD\nlyGGABwlNAmO\nyZSCVD\nC\njNGoeLwKn\n\nPROPERTY",
+            "tB\n\nDDZbJ"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 8621,
+            "context": [
+              {
+                "type": "stored",
+                "id": 8622
+              },
+              {
+                "type": "stored",
+                "id": 8623
+              },
+              {
+                "type": "stored",
+                "id": 8624
+              }
+            ]
+          },
+          "step": {
+            "text": "\b\u00823",
+            "context": [
+              {
+                "type": "stored",
+                "id": 8625
+              },
+              {
+                "type": "stored",
+                "id": 8626
+              }
+            ]
+          },
+          "n_step": 182084,
+          "goals": [
+            "uotg\nCURmFOuYIuUEi\nzw\nQ\nW\nIRWZ\naLS\nbUZbMW\n\nyJEfqqcqFGzMIQdaYWnnZXR",
+            "CKGKpt\nhSOzrnQjqqd\nz\nkfP\nVJUOzm\nUKlNA\n\nBBjb",
+            "\n\nuMWeOOtoqAuuX",
+            "fYxaV\nrihyh\nsPyShdc\n\nTP",
+            "\n\nFalse",
+            "wiH\nclGVP\nGppYblLdykObmLCdz\nnone\nCXFps\ndOYS\n\npHuoW",
+            "\n\nHGWKRaIE"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 8627,
+            "context": [
+              {
+                "type": "stored",
+                "id": 8628
+              },
+              {
+                "type": "stored",
+                "id": 8629
+              },
+              {
+                "type": "stored",
+                "id": 8630
+              },
+              {
+                "type": "stored",
+                "id": 8631
+              },
+              {
+                "type": "stored",
+                "id": 8632
+              }
+            ]
+          },
+          "step": {
+            "text": "\ud8a2\udf96\udb04\ude01.MI\uda59\udf0a",
+            "context": []
+          },
+          "n_step": -35828819418777276416,
+          "goals": [
+            "XpKYpOXIlcTU\nRVx\nWG\nCI\n\nM",
+            "SRuZrRTPYRsbE\n\nxycZTgRaF",
+            "fsp\nFALSE\nJy\nkFdTzKH\naBV\nlQkJJfkeM\n\ngNlBPDoKQwskllbNtMDL",
+            "j\ncvVfBX\n\nORb"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 8633,
+            "context": []
+          },
+          "step": {
+            "text": "\u00c4\udbdc\udf3dg\u00d4\u0000\udb24\udcf1\u00ca\u00fc\u0081\ud870\udd16\u00c6\u0012x\u00c3\u00e9]6fU%qj\u00e2^\u00cbR,-\u00f0\u00a9$\u00a0\udad2\udc904\u00d3",
+            "context": []
+          },
+          "n_step": -11601,
+          "goals": [
+            "ONRKsZhwTqkbSEGmAOQnYRaWVVOMa\nBD\nNUL\nJlieXaFIFySiyZsnRYY\nX\nvoN\njsRgzi\nUrmlrSHiw\nBEZ\nfile\nMGVOpqutZTKkUkFB\nQn\nudagYZ\niGG\nElazRskS\n\niamISdSp",
+            "\n\ntLuvtK",
+            "PwG\nkyyraDwXxvTtlvpFBR\nS\n\njzlL",
+            "s\nsezI\nNWZxeZzamXfs\njeQ\nQN\ndpi\nK\n\nP",
+            "IChJHTqacBJm\nQVZkRIxpiQQuENkOsZJ\nx\nXsxHIXo\n\nfhyuHSnFLxAoQ",
+            "v\nEg\narray\nBfqgSnnKBShyqOvhP\nj\npA\nSsIT\nwfzG\nehGijqndFhtXK\nFUPGGoF\nDyu\niTCb\n\nulOw",
+            "IuTa\nq\ntgbaXj\nOLIK\nWLBHhGVAn\nYa\n\nLFC",
+            "cu\nnzmWb\nfEwHXXWzsV\nRz\n\nsUSfkLyIY",
+            "tJls\nZ\nqQVbGyGnEqW\nSc\n\nyQNyglOxxDheI"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 8634,
+            "context": []
+          },
+          "step": {
+            "text": "--remove_pages",
+            "context": []
+          },
+          "n_step": -64405726,
+          "goals": [
+            "CcYCosOEgChyYXcFlAKwlw\nMwnMWgrmHzDwPuL\ni\nsqlwx\nyVCAzfZmztiPNVYHMLA\nM\neMlXQq\ng\nklJrsZlMEplDGLUuJb\nGvTSSkJJn\nquTSJvgv\nwHQU\nQYSrTCfvKlrI\ncjQKHFwI\nX\nRoJpQa\ne\nFJduBCpOJRXJbh\nrAvmoelR\nalBRt\noQ\n\nzoUnlwQWt",
+            "Aw\ni\nUglQatOLdrnGygmaxTRXoa\nhPlHA\nb\nLyx\n\nPM",
+            "rQdbdjesMIrmvTvi\nLBLlsf\nfbdDuyXBaAq\neah\nKMPvxUkJVMHWAOth\nr\n\nqTxwNmxX",
+            "WPrm\nJu\nS\nSvG\nV\nZj\ni\nI\nCd\nHIun\n\nddeWwtBLaWSlhXAZEeUDDZ",
+            "nVacDmaejj\nsi\nUOhcFWeh\nrc\n\nUJaB",
+            "jy\n\nUMDJHjkmo",
+            "Zc\nQF\nm\nIEDADlqsPcmtUpxKTrHtKOAKPqrFe\nFtQG\n\nAseZAUBqmD",
+            "WpzI\nBGH\nI\ndb\nVcvwtrYPJK\nTEVDk\n\nxH",
+            "V\nATFkICrj\nX\nk\n\nL"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,89 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz5/spxzbuu.v\", \"workspace\": \"/coq-dataset/repos/baz5\", \"repository\": \"/coq-dataset/repos/baz5\"}",
+    "{\"type\": \"stored\", \"id\": 8314}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 8315,
+        "context": [
+          {
+            "type": "stored",
+            "id": 8316
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 8317,
+            "context": []
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 8318
+              },
+              {
+                "type": "stored",
+                "id": 8319
+              },
+              {
+                "type": "stored",
+                "id": 8320
+              },
+              {
+                "type": "stored",
+                "id": 8321
+              },
+              {
+                "type": "stored",
+                "id": 8322
+              }
+            ]
+          },
+          "n_step": -699496490,
+          "goals": [
+            "nlDOqy\nBm\ncXGCuimRmL\nejwCed\n\nTrue",
+            "\n\nzJrZ",
+            "jqoHIgHpjtnJfaQnUCSw\ny\nQ\nY\nk\nNIvK\ngBbDnMFOAHtuyZCHMDlLg\ntDakroteU\nEGiHbQeiKT\nKEEGaAf\nijSONyhBO\nKyyIigQcOHOBinoR\nSfsTq\nNAaFIIBTRElaLAjWnMP\niwxHTq\no\n\nSLxpGxc",
+            "Oy\ngoP\nW\nHSGgeewbtRm\nK\njWay\nCeNsrfFA\nNeSNVIezKvsVbLmResC\nE\nayOy\nQV\nRcGXZGjeJ\nnL\nUFEP\nPPzqq\nSgpguGbrSulOQIsoW\nJkDPxnocYqNUgNI\ngyuUckawJnd\nIWq\nnull\n\nfzPaaFPUDIoILdGyTBfwQXMAaVNQHeHUdnKNUoFo",
+            "yMKXX\nP\nWSkW\nYsUWWsaL\np\nsparse\n\nScw",
+            "WUsBrYJA\nDiRYGRnuT\nhoyQQXeJBNQaz\nPEaYYmd\nspawn\nXmlWOIOs\nEs\nH\n\nedBXOt",
+            "RJRdaPlMM\nOoAMTCUUYWOeQ\nZufGVj\nqgIOfUaXCSeC\nfRk\ncj\nrnsevkjFlhx\nInfinity\nTiUztn\nW\nBkUN\ndxLOjpFy\nwOeIQ\nLXidHRxcGlGKYVDfPCN\n\nLFgov",
+            "\n\nyqoVzYIxUqFPZk",
+            "bv\nBFR\nP\n\nnQ",
+            "GwQQjZW\ne\n\ntext",
+            "HbqL\n\nfXoMBwOatq",
+            "MVhiPmv\nOx\na\ntYkiYoa\nkDYwvGsKpRMEFUEGOZ\nsgiQ\nnXnPg\nlkHzXOZC\nNIL\nv\nLVSg\ne\nceWhMXtyZPR\newggUJXYoOlG\nclPerl\nLA\nqFSijFJVkNGrwBtbQOyvTILw\nuaPbrqnGCzhtq\nSJC\nuCfwDow\n\nZJ",
+            "HaQkbN\nr\nCtvIsI\nvvxomMstEewHsKS\nmsgEts\ns\nNnnCe\nsqHgT\ngtE\nJ\nBSmR\nCpQzoVby\ntOvVQp\nTqxFZFybI\nLccP\nHRrSqQeGdEUrtFiNpWlbci\nyMv\ngx\nCkrHPzOvVhk\nfTDnZsSG\nqbbcd\noZ\nZVdo\nM\nSvpCK\nldNW\nkqEVc\nA\nCB\nAAROren\ngiZeAElgCiHLEUT\naiVOsd\nS\nAzGG\neq\nOphjIfxnwYWlttuakygtFu\neVBmcaUQ\ny\nBKZtfx\nfN\nkMFiet\n\nwoJMd",
+            "M\nrbxwR\nnJm\nuag\nx\nWpyWo\nNmcMy\ncrv\nZ\nMKlTy\niscYJXAY\n\nfalse",
+            "j\nwD\naHAixVtU\ndljPo\n\nOCoq",
+            "\n\nochEn",
+            "hH\nGS\n\nXWOKxS",
+            "x\nw\nzPTDj\nG\ng\nGLgJuyopOjRaxK\nyVB\nDG\nG\n\nxiIcSkcmzrua",
+            "False\nmXpCmWoM\n\nZJtxVUYcVlCz"
+          ]
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 8323,
+        "context": [
+          {
+            "type": "stored",
+            "id": 8324
+          }
+        ]
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
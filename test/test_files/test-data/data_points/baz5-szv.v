@@ -0,0 +1,8 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz5/szv.v\", \"workspace\": \"/coq-dataset/repos/baz5\", \"repository\": \"/coq-dataset/repos/baz5\"}",
+    "{\"type\": \"stored\", \"id\": 8325}",
+    "{\"type\": \"stored\", \"id\": 8326}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,27 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz5/tdk.v\", \"workspace\": \"/coq-dataset/repos/baz5\", \"repository\": \"/coq-dataset/repos/baz5\"}",
+    "{\"type\": \"stored\", \"id\": 8793}",
+    "{\"type\": \"stored\", \"id\": 8794}",
+    "{\"type\": \"stored\", \"id\": 8795}",
+    "{\"type\": \"stored\", \"id\": 8796}",
+    "{\"type\": \"stored\", \"id\": 8797}",
+    "{\"type\": \"stored\", \"id\": 8798}",
+    "{\"type\": \"stored\", \"id\": 8799}",
+    "{\"type\": \"stored\", \"id\": 8800}",
+    "{\"type\": \"stored\", \"id\": 8801}",
+    "{\"type\": \"stored\", \"id\": 8802}",
+    "{\"type\": \"stored\", \"id\": 8803}",
+    "{\"type\": \"stored\", \"id\": 8804}",
+    "{\"type\": \"stored\", \"id\": 8805}",
+    "{\"type\": \"stored\", \"id\": 8806}",
+    "{\"type\": \"stored\", \"id\": 8807}",
+    "{\"type\": \"stored\", \"id\": 8808}",
+    "{\"type\": \"stored\", \"id\": 8809}",
+    "{\"type\": \"stored\", \"id\": 8810}",
+    "{\"type\": \"stored\", \"id\": 8811}",
+    "{\"type\": \"stored\", \"id\": 8812}",
+    "{\"type\": \"stored\", \"id\": 8813}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,185 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz5/u.v\", \"workspace\": \"/coq-dataset/repos/baz5\", \"repository\": \"/coq-dataset/repos/baz5\"}",
+    "{\"type\": \"stored\", \"id\": 8635}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 8636,
+        "context": [
+          {
+            "type": "stored",
+            "id": 8637
+          },
+          {
+            "type": "stored",
+            "id": 8638
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 8639,
+            "context": [
+              {
+                "type": "stored",
+                "id": 8640
+              },
+              {
+                "type": "stored",
+                "id": 8641
+              },
+              {
+                "type": "stored",
+                "id": 8642
+              },
+              {
+                "type": "stored",
+                "id": 8643
+              },
+              {
+                "type": "stored",
+                "id": 8644
+              },
+              {
+                "type": "stored",
+                "id": 8645
+              },
+              {
+                "type": "stored",
+                "id": 8646
+              },
+              {
+                "type": "stored",
+                "id": 8647
+              }
+            ]
+          },
+          "step": {
+            "text": "J$",
+            "context": [
+              {
+                "type": "stored",
+                "id": 8648
+              },
+              {
+                "type": "stored",
+                "id": 8649
+              },
+              {
+                "type": "stored",
+                "id": 8650
+              },
+              {
+                "type": "stored",
+                "id": 8651
+              },
+              {
+                "type": "stored",
+                "id": 8652
+              },
+              {
+                "type": "stored",
+                "id": 8653
+              }
+            ]
+          },
+          "n_step": 226060,
+          "goals": [
+            "\n\npjbi",
+            "\n\nhHK",
+            "J\nAoFG\nBRD\n\nsentence",
+            "\n\ne",
+            "qb\niVEr\nYz\n\nEb",
+            "YhZmsX\n\naMT",
+            "raHb\nyss\nYxxWtsnuAdceWbiSNTHCY\nNMVRkPjO\nqZbfT\nE\ntaYAaOUV\nYt\nzN\nbNCe\nC\nVddyw\nrRWTllqlGa\ncU\nmMSdlo\n\nsHgdfHuJ",
+            "gcmNVZyflISxXRWWjDTuocUVHFuMhEDQf\nMdeT\nbArL\nv\nwH\nQiXwzS\ntdKx\n\neR",
+            "tzB\nmuUTZjKIHC\nMAVElNcPMTPlTEHS\nLfwE\nnjxp\nFtoiS\nf\nQ\nbo\n\npmXhtH"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 8654,
+            "context": [
+              {
+                "type": "stored",
+                "id": 8655
+              },
+              {
+                "type": "stored",
+                "id": 8656
+              },
+              {
+                "type": "stored",
+                "id": 8657
+              },
+              {
+                "type": "stored",
+                "id": 8658
+              },
+              {
+                "type": "stored",
+                "id": 8659
+              },
+              {
+                "type": "stored",
+                "id": 8660
+              },
+              {
+                "type": "stored",
+                "id": 8661
+              },
+              {
+                "type": "stored",
+                "id": 8662
+              },
+              {
+                "type": "stored",
+                "id": 8663
+              }
+            ]
+          },
+          "step": {
+            "text": "\udba5\udebd\"",
+            "context": [
+              {
+                "type": "stored",
+                "id": 8664
+              }
+            ]
+          },
+          "n_step": 8680,
+          "goals": [
+            "LHeCtnx\nlFKB\no\nAC\n\nr"
+          ]
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 8665,
+        "context": [
+          {
+            "type": "stored",
+            "id": 8666
+          },
+          {
+            "type": "stored",
+            "id": 8667
+          },
+          {
+            "type": "stored",
+            "id": 8668
+          }
+        ]
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
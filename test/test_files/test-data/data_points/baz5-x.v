@@ -0,0 +1,246 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz5/x.v\", \"workspace\": \"/coq-dataset/repos/baz5\", \"repository\": \"/coq-dataset/repos/baz5\"}",
+    "{\"type\": \"stored\", \"id\": 8348}",
+    "{\"type\": \"stored\", \"id\": 8349}",
+    "{\"type\": \"stored\", \"id\": 8350}",
+    "{\"type\": \"stored\", \"id\": 8351}",
+    "{\"type\": \"stored\", \"id\": 8352}",
+    "{\"type\": \"stored\", \"id\": 8353}",
+    "{\"type\": \"stored\", \"id\": 8354}",
+    "{\"type\": \"stored\", \"id\": 8355}",
+    "{\"type\": \"stored\", \"id\": 8356}",
+    "{\"type\": \"stored\", \"id\": 8357}",
+    "{\"type\": \"stored\", \"id\": 8358}",
+    "{\"type\": \"stored\", \"id\": 8359}",
+    "{\"type\": \"stored\", \"id\": 8360}",
+    "{\"type\": \"stored\", \"id\": 8361}",
+    "{\"type\": \"stored\", \"id\": 8362}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 8363,
+        "context": []
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 8364,
+            "context": [
+              {
+                "type": "stored",
+                "id": 8365
+              }
+            ]
+          },
+          "step": {
+            "text": "\uda0e\udd74\u00eb\u00d4ow",
+            "context": [
+              {
+                "type": "stored",
+                "id": 8366
+              },
+              {
+                "type": "stored",
+                "id": 8367
+              },
+              {
+                "type": "stored",
+                "id": 8368
+              },
+              {
+                "type": "stored",
+                "id": 8369
+              },
+              {
+                "type": "stored",
+                "id": 8370
+              },
+              {
+                "type": "stored",
+                "id": 8371
+              },
+              {
+                "type": "stored",
+                "id": 8372
+              },
+              {
+                "type": "stored",
+                "id": 8373
+              },
+              {
+                "type": "stored",
+                "id": 8374
+              },
+              {
+                "type": "stored",
+                "id": 8375
+              }
+            ]
+          },
+          "n_step": 186648069172,
+          "goals": [
+            "FElgqkZHizAFxjdeBO\nVsPUb\ncBICKnsM\ndLIBGnw\nXr\nKDyoIkv\n\nz",
+            "kEA\ns\nnZZ\nN\nrsMOLPjkFCade\nqbEEuPVQe\nfAQrJy\nIF\nmpa\nL\nucmzGMReO\nTXugUGmTXDVWcy\nwWs\nmpjO\nYU\nTPWQaUKwmw\nKeuGQqAljC\n\nyMUkmUAZIGP",
+            "dwT\nSsCXqWXnJchlrkUm\niS\n\nPDG",
+            "KPjEC\ngm\nPmV\n\nHhvYgh"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 8376,
+            "context": [
+              {
+                "type": "stored",
+                "id": 8377
+              },
+              {
+                "type": "stored",
+                "id": 8378
+              }
+            ]
+          },
+          "step": {
+            "text": "\udb22\udcacg\u00a3\u00ba\u00c2\u001b\u00c3w\u00c8\u0083>\u00ca",
+            "context": [
+              {
+                "type": "stored",
+                "id": 8379
+              },
+              {
+                "type": "stored",
+                "id": 8380
+              }
+            ]
+          },
+          "n_step": -85556669,
+          "goals": [
+            "FJMpLQmhyggffFeCB\n\nt",
+            "CyHW\nF\njkebz\ntNeUJ\nBSup\nuqKQIZy\nMFMVJueVK\ngFk\nNUL\njLCFS\nPDjcOQndnQM\ne\nwsubjw\nsIjsUD\nZWgdzKCmZCt\n\ndbizEucw",
+            "kxnsa\nif\nmethod\nWQMRMQCOjAOEEgimDdrUQHY\n\nXiwi"
+          ]
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 8381,
+        "context": [
+          {
+            "type": "stored",
+            "id": 8382
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 8383,
+            "context": [
+              {
+                "type": "stored",
+                "id": 8384
+              },
+              {
+                "type": "stored",
+                "id": 8385
+              },
+              {
+                "type": "stored",
+                "id": 8386
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 8387
+              },
+              {
+                "type": "stored",
+                "id": 8388
+              },
+              {
+                "type": "stored",
+                "id": 8389
+              },
+              {
+                "type": "stored",
+                "id": 8390
+              }
+            ]
+          },
+          "n_step": 65536,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 8391,
+            "context": [
+              {
+                "type": "stored",
+                "id": 8392
+              },
+              {
+                "type": "stored",
+                "id": 8393
+              },
+              {
+                "type": "stored",
+                "id": 8394
+              },
+              {
+                "type": "stored",
+                "id": 8395
+              },
+              {
+                "type": "stored",
+                "id": 8396
+              },
+              {
+                "type": "stored",
+                "id": 8397
+              },
+              {
+                "type": "stored",
+                "id": 8398
+              },
+              {
+                "type": "stored",
+                "id": 8399
+              },
+              {
+                "type": "stored",
+                "id": 8400
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00b8\u009d\u00b2\u0085\u00a4\u00e7\u00bb\bX5\u00b3R",
+            "context": [
+              {
+                "type": "stored",
+                "id": 8401
+              }
+            ]
+          },
+          "n_step": -31193,
+          "goals": [
+            "H\nurhDZLKU\nBU\n\nPkg",
+            "WUcn\n\ncPMzmfYapUYRsfWdV",
+            "PvC\n\nqyM"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
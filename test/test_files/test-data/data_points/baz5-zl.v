@@ -0,0 +1,145 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz5/zl.v\", \"workspace\": \"/coq-dataset/repos/baz5\", \"repository\": \"/coq-dataset/repos/baz5\"}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 8409,
+        "context": [
+          {
+            "type": "stored",
+            "id": 8410
+          },
+          {
+            "type": "stored",
+            "id": 8411
+          },
+          {
+            "type": "stored",
+            "id": 8412
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 8413,
+            "context": [
+              {
+                "type": "stored",
+                "id": 8414
+              },
+              {
+                "type": "stored",
+                "id": 8415
+              },
+              {
+                "type": "stored",
+                "id": 8416
+              },
+              {
+                "type": "stored",
+                "id": 8417
+              }
+            ]
+          },
+          "step": {
+            "text": "\ud864\ude34",
+            "context": [
+              {
+                "type": "stored",
+                "id": 8418
+              }
+            ]
+          },
+          "n_step": 13370,
+          "goals": [
+            "sNiJOuxh\nnull\nkgOfPCXkDrppAGtVKpZjnWboXlxB\nvRgw\nTYIz\n\nVP",
+            "stable\njp\nC\nRD\n\nxkM",
+            "false\nMLCXjnhTJ\nfZbtMzYeEQAedMv\nwRJJalh\nNone\njJu\nVA\nverbosity\nsVcL\n\ndzlMmzacClfekqujYunfLZcSVV",
+            "AMwVljbt\nsPW\nRZ\nHaQzzMF\nfXKA\nYsjyqwkL\n\nIpDYACFwjfN",
+            "\n\nJ",
+            "bKCG\nSdPl\nzhRNYKl\nNxmYQiONINMvFxAISbu\nRSHbQKgBIh\nWHo\nVlo\nif\nkSVKDPlZVJW\n\nNa",
+            "WCzr\nOsev\nUfBpuU\nl\nAlQyqHAF\nthen\nms\nK\nl\nldHvi\nCsgl\nNSzDjXizmxzZ\n\nTbD"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 8419,
+            "context": [
+              {
+                "type": "stored",
+                "id": 8420
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00bf\u0ffatV'\u00ad\u0089\u00f0.\u9dee",
+            "context": []
+          },
+          "n_step": -4653049,
+          "goals": [
+            "E\n\nKwjdwYVUkHukjIura"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 8421,
+            "context": []
+          },
+          "step": {
+            "text": "7\uda5b\ude88\u00ab\uda08\udeceE\f\u0010\u008e\udab7\udcc2\uda4d\udec6\u00b0",
+            "context": [
+              {
+                "type": "stored",
+                "id": 8422
+              },
+              {
+                "type": "stored",
+                "id": 8423
+              },
+              {
+                "type": "stored",
+                "id": 8424
+              },
+              {
+                "type": "stored",
+                "id": 8425
+              },
+              {
+                "type": "stored",
+                "id": 8426
+              },
+              {
+                "type": "stored",
+                "id": 8427
+              },
+              {
+                "type": "stored",
+                "id": 8428
+              },
+              {
+                "type": "stored",
+                "id": 8429
+              },
+              {
+                "type": "stored",
+                "id": 8430
+              }
+            ]
+          },
+          "n_step": -134074271337980544,
+          "goals": [
+            "AHl\nRVewfrTMOQC\njjUZWGp\nval\nd\nlXljttplykUmf\nH\nsKuYlId\nEYaTAC\nse\nxm\nwFjDxahJhPvs\nLTJxUgqcHE\njRmKaXlweHWTg\nurIizEgyjt\n\nif",
+            "ljgQFSp\nFlfvDcIVBAY\nISaU\nHHT\nMJMV\nt\nejXEmXcSum\n\niZokFLrhvhy"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
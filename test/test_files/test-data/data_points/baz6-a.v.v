@@ -0,0 +1,6 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz6/a.v.v\", \"workspace\": \"/coq-dataset/repos/baz6\", \"repository\": \"/coq-dataset/repos/baz6\"}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
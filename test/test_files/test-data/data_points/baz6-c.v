@@ -0,0 +1,92 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz6/c.v\", \"workspace\": \"/coq-dataset/repos/baz6\", \"repository\": \"/coq-dataset/repos/baz6\"}",
+    "{\"type\": \"stored\", \"id\": 9225}",
+    "{\"type\": \"stored\", \"id\": 9226}",
+    "{\"type\": \"stored\", \"id\": 9227}",
+    "{\"type\": \"stored\", \"id\": 9228}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 9229,
+        "context": []
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 9230,
+            "context": [
+              {
+                "type": "stored",
+                "id": 9231
+              },
+              {
+                "type": "stored",
+                "id": 9232
+              },
+              {
+                "type": "stored",
+                "id": 9233
+              },
+              {
+                "type": "stored",
+                "id": 9234
+              },
+              {
+                "type": "stored",
+                "id": 9235
+              },
+              {
+                "type": "stored",
+                "id": 9236
+              },
+              {
+                "type": "stored",
+                "id": 9237
+              },
+              {
+                "type": "stored",
+                "id": 9238
+              },
+              {
+                "type": "stored",
+                "id": 9239
+              },
+              {
+                "type": "stored",
+                "id": 9240
+              },
+              {
+                "type": "stored",
+                "id": 9241
+              }
+            ]
+          },
+          "step": {
+            "text": "\ud83d\udc4d\ud83c\udffb",
+            "context": [
+              {
+                "type": "stored",
+                "id": 9242
+              }
+            ]
+          },
+          "n_step": -2561,
+          "goals": [
+            "INF\nn\nmMUAPoPkdA\nhZZuheBdcunDqtl\n\njJcGBm",
+            "I\nwr\n\nCg",
+            "\n\nkV",
+            "VAgAfKYWfLVRlCQKGpBOetqMWpghEcetBtQRFO\nG\nuBzcIjE\nMLrf\nvoUsF\nIUoP\nU\nhOKFH\nXvTCzOwJYAGBPj\npcMoT\n\nqJm",
+            "\n\no",
+            "OISk\nXHBFpiYDhla\nHvSimEQbWfYrLCrO\nNIL\n\nGeqfubbn",
+            "else\nioRSJrgGTHjdoXozVM\nTjytHqqbMePSvl\nLoKSovvHi\n\nexplicit",
+            "COFIXPOINT\n\ns"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
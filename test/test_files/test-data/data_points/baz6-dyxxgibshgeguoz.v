@@ -0,0 +1,12 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz6/dyxxgibshgeguoz.v\", \"workspace\": \"/coq-dataset/repos/baz6\", \"repository\": \"/coq-dataset/repos/baz6\"}",
+    "{\"type\": \"stored\", \"id\": 8866}",
+    "{\"type\": \"stored\", \"id\": 8867}",
+    "{\"type\": \"stored\", \"id\": 8868}",
+    "{\"type\": \"stored\", \"id\": 8869}",
+    "{\"type\": \"stored\", \"id\": 8870}",
+    "{\"type\": \"stored\", \"id\": 8871}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,151 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz6/edjxvngakop.v\", \"workspace\": \"/coq-dataset/repos/baz6\", \"repository\": \"/coq-dataset/repos/baz6\"}",
+    "{\"type\": \"stored\", \"id\": 8820}",
+    "{\"type\": \"stored\", \"id\": 8821}",
+    "{\"type\": \"stored\", \"id\": 8822}",
+    "{\"type\": \"stored\", \"id\": 8823}",
+    "{\"type\": \"stored\", \"id\": 8824}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 8825,
+        "context": [
+          {
+            "type": "stored",
+            "id": 8826
+          },
+          {
+            "type": "stored",
+            "id": 8827
+          },
+          {
+            "type": "stored",
+            "id": 8828
+          },
+          {
+            "type": "stored",
+            "id": 8829
+          },
+          {
+            "type": "stored",
+            "id": 8830
+          },
+          {
+            "type": "stored",
+            "id": 8831
+          },
+          {
+            "type": "stored",
+            "id": 8832
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 8833,
+            "context": [
+              {
+                "type": "stored",
+                "id": 8834
+              },
+              {
+                "type": "stored",
+                "id": 8835
+              },
+              {
+                "type": "stored",
+                "id": 8836
+              },
+              {
+                "type": "stored",
+                "id": 8837
+              },
+              {
+                "type": "stored",
+                "id": 8838
+              },
+              {
+                "type": "stored",
+                "id": 8839
+              },
+              {
+                "type": "stored",
+                "id": 8840
+              },
+              {
+                "type": "stored",
+                "id": 8841
+              },
+              {
+                "type": "stored",
+                "id": 8842
+              },
+              {
+                "type": "stored",
+                "id": 8843
+              },
+              {
+                "type": "stored",
+                "id": 8844
+              },
+              {
+                "type": "stored",
+                "id": 8845
+              },
+              {
+                "type": "stored",
+                "id": 8846
+              },
+              {
+                "type": "stored",
+                "id": 8847
+              },
+              {
+                "type": "stored",
+                "id": 8848
+              },
+              {
+                "type": "stored",
+                "id": 8849
+              },
+              {
+                "type": "stored",
+                "id": 8850
+              },
+              {
+                "type": "stored",
+                "id": 8851
+              },
+              {
+                "type": "stored",
+                "id": 8852
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00c2\udb3a\udc42*\u00f1\ud849\ude9f",
+            "context": []
+          },
+          "n_step": -14705,
+          "goals": [
+            "Y\ncontext\nE\ns\nMu\nGwoii\nm\nESzx\niZ\nl\nOE\nR\nXHfHaqf\nuYx\nRcYjnIRzVwobza\nvpN\nSxgEbuZFHKAkLnrspkx\nHnzh\nsnYQ\nBV\n\nPyshxfAksgDIenJtGQt",
+            "jZ\n\nwItdjbXeN"
+          ]
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 8853,
+        "context": []
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
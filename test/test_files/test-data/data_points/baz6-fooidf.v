@@ -0,0 +1,7 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz6/fooidf.v\", \"workspace\": \"/coq-dataset/repos/baz6\", \"repository\": \"/coq-dataset/repos/baz6\"}",
+    "{\"type\": \"stored\", \"id\": 9082}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
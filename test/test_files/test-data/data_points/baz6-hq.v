@@ -0,0 +1,8 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz6/hq.v\", \"workspace\": \"/coq-dataset/repos/baz6\", \"repository\": \"/coq-dataset/repos/baz6\"}",
+    "{\"type\": \"stored\", \"id\": 8864}",
+    "{\"type\": \"stored\", \"id\": 8865}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,8 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz6/is.v\", \"workspace\": \"/coq-dataset/repos/baz6\", \"repository\": \"/coq-dataset/repos/baz6\"}",
+    "{\"type\": \"stored\", \"id\": 8862}",
+    "{\"type\": \"stored\", \"id\": 8863}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,154 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz6/jg.v\", \"workspace\": \"/coq-dataset/repos/baz6\", \"repository\": \"/coq-dataset/repos/baz6\"}",
+    "{\"type\": \"stored\", \"id\": 8988}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 8989,
+        "context": [
+          {
+            "type": "stored",
+            "id": 8990
+          },
+          {
+            "type": "stored",
+            "id": 8991
+          },
+          {
+            "type": "stored",
+            "id": 8992
+          },
+          {
+            "type": "stored",
+            "id": 8993
+          },
+          {
+            "type": "stored",
+            "id": 8994
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 8995,
+            "context": []
+          },
+          "step": {
+            "text": "\u00bfz",
+            "context": [
+              {
+                "type": "stored",
+                "id": 8996
+              },
+              {
+                "type": "stored",
+                "id": 8997
+              },
+              {
+                "type": "stored",
+                "id": 8998
+              },
+              {
+                "type": "stored",
+                "id": 8999
+              }
+            ]
+          },
+          "n_step": 26609,
+          "goals": [
+            "JT\neQY\nmL\nLzwXFsaMSNI\n\nE",
+            "YTOBSDg\nVirJXHxbW\nT\nIN\nq\nWTDR\nZATK\nZlOmcxMnNtuQvVpizeVfSQgstDBW\noCWhwDOOYLyP\n\nulIKRwKPDzbHD"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 9000,
+            "context": [
+              {
+                "type": "stored",
+                "id": 9001
+              },
+              {
+                "type": "stored",
+                "id": 9002
+              },
+              {
+                "type": "stored",
+                "id": 9003
+              },
+              {
+                "type": "stored",
+                "id": 9004
+              },
+              {
+                "type": "stored",
+                "id": 9005
+              }
+            ]
+          },
+          "step": {
+            "text": "T\u00cbk\u00aa\ud8ea\udd06\u00dc\u008fv\u00b0\u00b0 OZ",
+            "context": [
+              {
+                "type": "stored",
+                "id": 9006
+              },
+              {
+                "type": "stored",
+                "id": 9007
+              },
+              {
+                "type": "stored",
+                "id": 9008
+              },
+              {
+                "type": "stored",
+                "id": 9009
+              },
+              {
+                "type": "stored",
+                "id": 9010
+              },
+              {
+                "type": "stored",
+                "id": 9011
+              },
+              {
+                "type": "stored",
+                "id": 9012
+              },
+              {
+                "type": "stored",
+                "id": 9013
+              },
+              {
+                "type": "stored",
+                "id": 9014
+              },
+              {
+                "type": "stored",
+                "id": 9015
+              },
+              {
+                "type": "stored",
+                "id": 9016
+              },
+              {
+                "type": "stored",
+                "id": 9017
+              }
+            ]
+          },
+          "n_step": 2346747,
+          "goals": []
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,343 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz6/jsonrpc.v\", \"workspace\": \"/coq-dataset/repos/baz6\", \"repository\": \"/coq-dataset/repos/baz6\"}",
+    "{\"type\": \"stored\", \"id\": 9023}",
+    "{\"type\": \"stored\", \"id\": 9024}",
+    "{\"type\": \"stored\", \"id\": 9025}",
+    "{\"type\": \"stored\", \"id\": 9026}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 9027,
+        "context": [
+          {
+            "type": "stored",
+            "id": 9028
+          },
+          {
+            "type": "stored",
+            "id": 9029
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 9030,
+            "context": [
+              {
+                "type": "stored",
+                "id": 9031
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00d5\u00ea\u0090",
+            "context": [
+              {
+                "type": "stored",
+                "id": 9032
+              }
+            ]
+          },
+          "n_step": 886,
+          "goals": [
+            "JHFu\nLPSqmpjLyyjAycEbxBKErx\nyfExh\n\ncPy",
+            "cN\nrNT\ntQ\nDCureDyoYn\nLIEfm\nIq\nYRKQo\nglgvxX\n\nxVrVb",
+            "na\nzFY\nJhtcwXuDQZ\n\nVh",
+            "kRUXkusnlMk\nxC\nONSefI\n\nJpw",
+            "oiHAFHNobXBEEPCyI\nQlAJir\nztP\n\nxe",
+            "O\nqPRmNnH\nEdJUx\nhkhG\nCLocalAssum\nSkgibh\nRj\nGT\nGwIrE\naPh\nbAwWPdFw\nIGlj\n\nbymBcNEqJnZ",
+            "PI\niMcukQdNrPQAoAFBPoeifpkKm\nZp\n\nibClJjhEVYXfwQRjO",
+            "\n\nceAhfLdJ",
+            "gCeccrzQvDCp\nxZaj\nJysejGxCaDXr\nPaR\n\nLw",
+            "WiSJYREx\nsTPPMxE\nJSa\nd\n\nYZtZhpVLtK",
+            "\n\nh",
+            "dpJcNpL\nqmWAmlqtJwpdxwVjlJLkgPPInW\ncTVSfMXoMMD\ntuhiBSiaqXZ\nIdpBlkmZshfI\nr\nvKCpSSdYRm\ncO\nELbScjx\nwrABuE\nEsXeMVDn\nFXSRvH\nREe\n\npremise",
+            "zsLadBg\nmEwZdrWP\nvJcnKKf\nOeAK\nfjGitym\nRpTKiWsGh\nLJWZDPPJNqljMab\ncdmm\n\nLrq",
+            "rztFayEEjMxmFzph\nGpQ\nZVtqo\nH\nsqOSV\nfw\nDTmQW\nhNl\nIFO\nCWBPBtWBStqBt\nKvtRUYRksuTH\nTtkFjTonL\nMd\nS\nEeCbTK\nsvz\nOxwmErNpweNTvSEgQOvZFZl\n\nzC"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 9033,
+            "context": [
+              {
+                "type": "stored",
+                "id": 9034
+              },
+              {
+                "type": "stored",
+                "id": 9035
+              },
+              {
+                "type": "stored",
+                "id": 9036
+              }
+            ]
+          },
+          "step": {
+            "text": "\ufcfb\u00b9",
+            "context": [
+              {
+                "type": "stored",
+                "id": 9037
+              },
+              {
+                "type": "stored",
+                "id": 9038
+              },
+              {
+                "type": "stored",
+                "id": 9039
+              },
+              {
+                "type": "stored",
+                "id": 9040
+              },
+              {
+                "type": "stored",
+                "id": 9041
+              },
+              {
+                "type": "stored",
+                "id": 9042
+              },
+              {
+                "type": "stored",
+                "id": 9043
+              }
+            ]
+          },
+          "n_step": 5322,
+          "goals": [
+            "\n\nWmaVYMDPzaLnHHS",
+            "nVpPl\nUZyoW\n\nA",
+            "qIy\n\nB"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 9044,
+            "context": [
+              {
+                "type": "stored",
+                "id": 9045
+              },
+              {
+                "type": "stored",
+                "id": 9046
+              },
+              {
+                "type": "stored",
+                "id": 9047
+              },
+              {
+                "type": "stored",
+                "id": 9048
+              }
+            ]
+          },
+          "step": {
+            "text": "\u0097",
+            "context": [
+              {
+                "type": "stored",
+                "id": 9049
+              }
+            ]
+          },
+          "n_step": -715,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 9050,
+            "context": []
+          },
+          "step": {
+            "text": "file_context",
+            "context": [
+              {
+                "type": "stored",
+                "id": 9051
+              },
+              {
+                "type": "stored",
+                "id": 9052
+              },
+              {
+                "type": "stored",
+                "id": 9053
+              },
+              {
+                "type": "stored",
+                "id": 9054
+              },
+              {
+                "type": "stored",
+                "id": 9055
+              },
+              {
+                "type": "stored",
+                "id": 9056
+              },
+              {
+                "type": "stored",
+                "id": 9057
+              },
+              {
+                "type": "stored",
+                "id": 9058
+              },
+              {
+                "type": "stored",
+                "id": 9059
+              },
+              {
+                "type": "stored",
+                "id": 9060
+              },
+              {
+                "type": "stored",
+                "id": 9061
+              },
+              {
+                "type": "stored",
+                "id": 9062
+              },
+              {
+                "type": "stored",
+                "id": 9063
+              },
+              {
+                "type": "stored",
+                "id": 9064
+              }
+            ]
+          },
+          "n_step": -23564228,
+          "goals": [
+            "jsAO\nAS\nUMu\nUdaN\nFh\nJ\nigQjXYC\nGYmiMmlaOtItJuvbWWrvcysex\nsXfkpVG\n\naCJ",
+            "\n\nVm",
+            "LlFnb\nGnxZhpNtkvOgq\nFVBfTasD\nDQC\nOEgV\nOGVZP\nHsAzsogmL\nDUIsDIEwFVtIU\nPZDFDaRLQonckrE\nJJPwvOLhXpttQo\nQd\nJjGA\n\nc"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 9065,
+            "context": [
+              {
+                "type": "stored",
+                "id": 9066
+              },
+              {
+                "type": "stored",
+                "id": 9067
+              },
+              {
+                "type": "stored",
+                "id": 9068
+              }
+            ]
+          },
+          "step": {
+            "text": "\udbd1\udd3dmJ\udb23\udc01",
+            "context": [
+              {
+                "type": "stored",
+                "id": 9069
+              }
+            ]
+          },
+          "n_step": 1828350,
+          "goals": [
+            "ExHvGDNX\nf\nfXTaCv\nemlfg\nfqbv\n\notZqfvAwXrLoLUEMrMPtKwijAb"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 9070,
+            "context": [
+              {
+                "type": "stored",
+                "id": 9071
+              },
+              {
+                "type": "stored",
+                "id": 9072
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 9073
+              },
+              {
+                "type": "stored",
+                "id": 9074
+              },
+              {
+                "type": "stored",
+                "id": 9075
+              },
+              {
+                "type": "stored",
+                "id": 9076
+              },
+              {
+                "type": "stored",
+                "id": 9077
+              },
+              {
+                "type": "stored",
+                "id": 9078
+              }
+            ]
+          },
+          "n_step": 9280,
+          "goals": [
+            "gGtbhg\nZ\n\nproofs",
+            "KUc\npWZjAd\nInf\nsaMkJy\nsJvZ\n\nS"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 9079,
+            "context": [
+              {
+                "type": "stored",
+                "id": 9080
+              },
+              {
+                "type": "stored",
+                "id": 9081
+              }
+            ]
+          },
+          "step": {
+            "text": "\uda92\udcb0\uceb4",
+            "context": []
+          },
+          "n_step": -330,
+          "goals": [
+            "mAbbbSVJ\nYwv\nkGrBquqO\nAaT\n\nFvXZpWBFkM",
+            "gMoVHdAQCi\nFalse\n\nRmdLzY"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
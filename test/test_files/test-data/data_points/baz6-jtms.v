@@ -0,0 +1,17 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz6/jtms.v\", \"workspace\": \"/coq-dataset/repos/baz6\", \"repository\": \"/coq-dataset/repos/baz6\"}",
+    "{\"type\": \"stored\", \"id\": 9136}",
+    "{\"type\": \"stored\", \"id\": 9137}",
+    "{\"type\": \"stored\", \"id\": 9138}",
+    "{\"type\": \"stored\", \"id\": 9139}",
+    "{\"type\": \"stored\", \"id\": 9140}",
+    "{\"type\": \"stored\", \"id\": 9141}",
+    "{\"type\": \"stored\", \"id\": 9142}",
+    "{\"type\": \"stored\", \"id\": 9143}",
+    "{\"type\": \"stored\", \"id\": 9144}",
+    "{\"type\": \"stored\", \"id\": 9145}",
+    "{\"type\": \"stored\", \"id\": 9146}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
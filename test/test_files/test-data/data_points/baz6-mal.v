@@ -0,0 +1,60 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz6/mal.v\", \"workspace\": \"/coq-dataset/repos/baz6\", \"repository\": \"/coq-dataset/repos/baz6\"}",
+    "{\"type\": \"stored\", \"id\": 8854}",
+    "{\"type\": \"stored\", \"id\": 8855}",
+    "{\"type\": \"stored\", \"id\": 8856}",
+    "{\"type\": \"stored\", \"id\": 8857}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 8858,
+        "context": [
+          {
+            "type": "stored",
+            "id": 8859
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 8860,
+            "context": [
+              {
+                "type": "stored",
+                "id": 8861
+              }
+            ]
+          },
+          "step": {
+            "text": "\u0081",
+            "context": []
+          },
+          "n_step": -2442374710460204,
+          "goals": [
+            "woRx\n\ntttodu",
+            "F\nxcw\n\ni",
+            "AOPA\nozoDo\nZ\n\ntOxtFWvmKJrSUbwBCiUjSDpiSkrKlqsboh",
+            "zbr\ndcIztWUuk\nd\ns\nCS\nxFihcsUUBJ\nwg\n\nZ",
+            "ubeHKLhpr\nOlGOubqhqqG\nhZWR\n\nEYk",
+            "EcjCwkZ\nlaaGHJdkv\n\nI",
+            "jTQvmLBxLULVkbys\nu\nNjdNt\n\naSlFsfPbsoo",
+            "P\npQ\n\ncQGEK",
+            "tiYmTMrJqJcG\nGImaCbTUSnbkvOIKRvvKF\noe\nZW\nyWDghVcQgVuAuO\nIAcfK\nKs\nk\n\nI",
+            "PHDK\n\nFNIiorhwGbdfydwA",
+            "urB\nG\naNvN\nhuxB\nYijZymwpo\n\nlookups",
+            "rycVkZcxJMM\nR\nIwnosqsYejsapEcWsm\nozsVFPSvhHnB\nnbZ\n\nBWSJXJ",
+            "H\n\nNUL",
+            "l\nfv\nIq\n\nsw",
+            "BqHUtPAoQxIGQNQtH\noKnizrpaB\nMHSR\nS\nPxVnMtsVdxEDQXZLd\n\nwCSS",
+            "hnFw\nSvfoPinxATaibYN\nuri\nnoQh\ngVw\nofDySAhsVBHZiYORZqKFNlOMOulvol\nauTbGmFGIwdzWxHVPYVlVeWsZ\nPc\nrivk\ndlxIzc\nvZG\nV\nCMrfwWP\npXOl\nUBM\nHslZLyCUTIRBYPcIaOo\nnuHTSdmQE\nry\nYoGRX\nAxfQVtfLLVjYcAYcEs\nW\nSz\nSWrVHuwM\nqXWbjaxkNiACBVenYnFoem\nCLocalAssum\ncXv\nVYlQr\ndvBZ\nMxob\nl\nvq\nkMgNgV\nXXxRbgJGJRBKE\n\nohYrxofmKvjfuly"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
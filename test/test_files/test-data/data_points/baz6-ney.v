@@ -0,0 +1,275 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz6/ney.v\", \"workspace\": \"/coq-dataset/repos/baz6\", \"repository\": \"/coq-dataset/repos/baz6\"}",
+    "{\"type\": \"stored\", \"id\": 9147}",
+    "{\"type\": \"stored\", \"id\": 9148}",
+    "{\"type\": \"stored\", \"id\": 9149}",
+    "{\"type\": \"stored\", \"id\": 9150}",
+    "{\"type\": \"stored\", \"id\": 9151}",
+    "{\"type\": \"stored\", \"id\": 9152}",
+    "{\"type\": \"stored\", \"id\": 9153}",
+    "{\"type\": \"stored\", \"id\": 9154}",
+    "{\"type\": \"stored\", \"id\": 9155}",
+    "{\"type\": \"stored\", \"id\": 9156}",
+    "{\"type\": \"stored\", \"id\": 9157}",
+    "{\"type\": \"stored\", \"id\": 9158}",
+    "{\"type\": \"stored\", \"id\": 9159}",
+    "{\"type\": \"stored\", \"id\": 9160}",
+    "{\"type\": \"stored\", \"id\": 9161}",
+    "{\"type\": \"stored\", \"id\": 9162}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 9163,
+        "context": [
+          {
+            "type": "stored",
+            "id": 9164
+          },
+          {
+            "type": "stored",
+            "id": 9165
+          },
+          {
+            "type": "stored",
+            "id": 9166
+          },
+          {
+            "type": "stored",
+            "id": 9167
+          },
+          {
+            "type": "stored",
+            "id": 9168
+          },
+          {
+            "type": "stored",
+            "id": 9169
+          },
+          {
+            "type": "stored",
+            "id": 9170
+          },
+          {
+            "type": "stored",
+            "id": 9171
+          },
+          {
+            "type": "stored",
+            "id": 9172
+          },
+          {
+            "type": "stored",
+            "id": 9173
+          },
+          {
+            "type": "stored",
+            "id": 9174
+          },
+          {
+            "type": "stored",
+            "id": 9175
+          },
+          {
+            "type": "stored",
+            "id": 9176
+          },
+          {
+            "type": "stored",
+            "id": 9177
+          },
+          {
+            "type": "stored",
+            "id": 9178
+          },
+          {
+            "type": "stored",
+            "id": 9179
+          },
+          {
+            "type": "stored",
+            "id": 9180
+          },
+          {
+            "type": "stored",
+            "id": 9181
+          },
+          {
+            "type": "stored",
+            "id": 9182
+          },
+          {
+            "type": "stored",
+            "id": 9183
+          },
+          {
+            "type": "stored",
+            "id": 9184
+          },
+          {
+            "type": "stored",
+            "id": 9185
+          },
+          {
+            "type": "stored",
+            "id": 9186
+          },
+          {
+            "type": "stored",
+            "id": 9187
+          },
+          {
+            "type": "stored",
+            "id": 9188
+          },
+          {
+            "type": "stored",
+            "id": 9189
+          },
+          {
+            "type": "stored",
+            "id": 9190
+          },
+          {
+            "type": "stored",
+            "id": 9191
+          },
+          {
+            "type": "stored",
+            "id": 9192
+          },
+          {
+            "type": "stored",
+            "id": 9193
+          },
+          {
+            "type": "stored",
+            "id": 9194
+          },
+          {
+            "type": "stored",
+            "id": 9195
+          },
+          {
+            "type": "stored",
+            "id": 9196
+          },
+          {
+            "type": "stored",
+            "id": 9197
+          },
+          {
+            "type": "stored",
+            "id": 9198
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 9199,
+            "context": []
+          },
+          "step": {
+            "text": "\u00fa",
+            "context": [
+              {
+                "type": "stored",
+                "id": 9200
+              },
+              {
+                "type": "stored",
+                "id": 9201
+              },
+              {
+                "type": "stored",
+                "id": 9202
+              },
+              {
+                "type": "stored",
+                "id": 9203
+              },
+              {
+                "type": "stored",
+                "id": 9204
+              },
+              {
+                "type": "stored",
+                "id": 9205
+              },
+              {
+                "type": "stored",
+                "id": 9206
+              },
+              {
+                "type": "stored",
+                "id": 9207
+              },
+              {
+                "type": "stored",
+                "id": 9208
+              },
+              {
+                "type": "stored",
+                "id": 9209
+              },
+              {
+                "type": "stored",
+                "id": 9210
+              },
+              {
+                "type": "stored",
+                "id": 9211
+              }
+            ]
+          },
+          "n_step": 143407339976155424,
+          "goals": [
+            "vMd\n\nAIotUUjW"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 9212,
+            "context": [
+              {
+                "type": "stored",
+                "id": 9213
+              },
+              {
+                "type": "stored",
+                "id": 9214
+              },
+              {
+                "type": "stored",
+                "id": 9215
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 9216
+              }
+            ]
+          },
+          "n_step": 27544594516797752,
+          "goals": [
+            "CoDmjcoNjJuwzJZDCTyvWfF\nwaABVVaKSjir\n\noXiYhmj",
+            "kbzJGD\n\nwdPn",
+            "uA\nPPZR\n\nCXZ",
+            "\n\nlookups",
+            "G\nZC\nu\nMxsBlXsdyAf\nzRrWgk\nFJ\n\nZk",
+            "\n\nbeVKuwsv"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,21 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz6/odznfg.v\", \"workspace\": \"/coq-dataset/repos/baz6\", \"repository\": \"/coq-dataset/repos/baz6\"}",
+    "{\"type\": \"stored\", \"id\": 8872}",
+    "{\"type\": \"stored\", \"id\": 8873}",
+    "{\"type\": \"stored\", \"id\": 8874}",
+    "{\"type\": \"stored\", \"id\": 8875}",
+    "{\"type\": \"stored\", \"id\": 8876}",
+    "{\"type\": \"stored\", \"id\": 8877}",
+    "{\"type\": \"stored\", \"id\": 8878}",
+    "{\"type\": \"stored\", \"id\": 8879}",
+    "{\"type\": \"stored\", \"id\": 8880}",
+    "{\"type\": \"stored\", \"id\": 8881}",
+    "{\"type\": \"stored\", \"id\": 8882}",
+    "{\"type\": \"stored\", \"id\": 8883}",
+    "{\"type\": \"stored\", \"id\": 8884}",
+    "{\"type\": \"stored\", \"id\": 8885}",
+    "{\"type\": \"stored\", \"id\": 8886}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,290 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz6/orlsy.v\", \"workspace\": \"/coq-dataset/repos/baz6\", \"repository\": \"/coq-dataset/repos/baz6\"}",
+    "{\"type\": \"stored\", \"id\": 8935}",
+    "{\"type\": \"stored\", \"id\": 8936}",
+    "{\"type\": \"stored\", \"id\": 8937}",
+    "{\"type\": \"stored\", \"id\": 8938}",
+    "{\"type\": \"stored\", \"id\": 8939}",
+    "{\"type\": \"stored\", \"id\": 8940}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 8941,
+        "context": [
+          {
+            "type": "stored",
+            "id": 8942
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 8943,
+            "context": []
+          },
+          "step": {
+            "text": "\udbe5\udfeb",
+            "context": [
+              {
+                "type": "stored",
+                "id": 8944
+              },
+              {
+                "type": "stored",
+                "id": 8945
+              },
+              {
+                "type": "stored",
+                "id": 8946
+              },
+              {
+                "type": "stored",
+                "id": 8947
+              },
+              {
+                "type": "stored",
+                "id": 8948
+              },
+              {
+                "type": "stored",
+                "id": 8949
+              },
+              {
+                "type": "stored",
+                "id": 8950
+              },
+              {
+                "type": "stored",
+                "id": 8951
+              },
+              {
+                "type": "stored",
+                "id": 8952
+              },
+              {
+                "type": "stored",
+                "id": 8953
+              },
+              {
+                "type": "stored",
+                "id": 8954
+              },
+              {
+                "type": "stored",
+                "id": 8955
+              },
+              {
+                "type": "stored",
+                "id": 8956
+              },
+              {
+                "type": "stored",
+                "id": 8957
+              },
+              {
+                "type": "stored",
+                "id": 8958
+              },
+              {
+                "type": "stored",
+                "id": 8959
+              },
+              {
+                "type": "stored",
+                "id": 8960
+              },
+              {
+                "type": "stored",
+                "id": 8961
+              },
+              {
+                "type": "stored",
+                "id": 8962
+              },
+              {
+                "type": "stored",
+                "id": 8963
+              }
+            ]
+          },
+          "n_step": -18989,
+          "goals": [
+            "none\nmQv\ntAEVzK\nZrH\nQ\nNblN\njRFHE\nNaN\naBzxUZPpetSxQn\nILfW\nZEc\nojgs\nTC\npxlO\nqzLixqcLxlHg\ndAgtbZYDHOK\n\nSkoTdFujIYmorvGqUadbDnEKl",
+            "LPRvGigCTyZzgyU\nInfinity\nMUH\nWBqtZ\n\nCeiyIgMyUnVheW",
+            "hG\naMl\n\nRBIg",
+            "ND\nz\nLihIJRhY\noEwzQqaBG\nQBKahljoaPntBCeBObIA\nc\nSCS\nfalse\n\nuW"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 8964,
+            "context": [
+              {
+                "type": "stored",
+                "id": 8965
+              }
+            ]
+          },
+          "step": {
+            "text": "\u0091\ud904\udc83\u00c6\u00f1",
+            "context": [
+              {
+                "type": "stored",
+                "id": 8966
+              },
+              {
+                "type": "stored",
+                "id": 8967
+              },
+              {
+                "type": "stored",
+                "id": 8968
+              },
+              {
+                "type": "stored",
+                "id": 8969
+              },
+              {
+                "type": "stored",
+                "id": 8970
+              },
+              {
+                "type": "stored",
+                "id": 8971
+              },
+              {
+                "type": "stored",
+                "id": 8972
+              },
+              {
+                "type": "stored",
+                "id": 8973
+              },
+              {
+                "type": "stored",
+                "id": 8974
+              },
+              {
+                "type": "stored",
+                "id": 8975
+              },
+              {
+                "type": "stored",
+                "id": 8976
+              },
+              {
+                "type": "stored",
+                "id": 8977
+              },
+              {
+                "type": "stored",
+                "id": 8978
+              },
+              {
+                "type": "stored",
+                "id": 8979
+              },
+              {
+                "type": "stored",
+                "id": 8980
+              }
+            ]
+          },
+          "n_step": -5480,
+          "goals": [
+            "VFQxxXQZuhOktBXMRc\n\ncDdibgxwPDj",
+            "\n\nduMJ",
+            "rerank\np\n\nnBo",
+            "Wvdt\n\nyjeis"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 8981,
+            "context": []
+          },
+          "step": {
+            "text": "\u0090\ud9b4\ude11\udb10\ude81^&\b\ud9ed\udfcb%\u0092\ud8a0\udf70\ud8bb\udcf7",
+            "context": []
+          },
+          "n_step": -30784,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 8982,
+            "context": []
+          },
+          "step": {
+            "text": "",
+            "context": []
+          },
+          "n_step": -504473,
+          "goals": [
+            "q\nIX\nh\nBws\nh\n\nqRzmET",
+            "\n\nsiL",
+            "\n\nSRZN",
+            "\n\nSugRQTjPvsdKnmYGXFcgPRe",
+            "Id\n\nZMzehPdqJCPLnQJn",
+            "sXL\nQfZz\nUzGCyuofM\nZiESjhaIXtbwvuVJSreteOcZLrSfyuGcjaEFCiQ\ntPwQiYv\nHGUPCzsZNQbue\nwG\nIRi\ntnYRw\nbRLHKkqsIPDSjho\nz\nr\nnexMZX\nBXc\nN\nFcAFqJhihAc\nNUL\n\ntDziYFHHoe",
+            "\n\nRYlwOSv",
+            "\n\nMH",
+            "jE\nfl\naVedMlrbzRtltFk\n\nN",
+            "AG\nqhXmOZ\nMBPSlNhTTPJYPPXn\nNTglnucDYH\nYGQ\nUIEkyaNSaWRDQubzpksY\nCDfpu\n\np",
+            "fbGCjfsM\nFJtMzW\nNT\n\ncI",
+            "\n\nvmF",
+            "VF\ndkEXPQpZaclkW\nVdpC\nvQ\nke\ngdyntPE\nnIuIB\ngXmxK\nIkauTfBiC\nfUg\nVnhJgMOZcHfRixFYtOB\nSFoztkeb\njewWWc\nProperty\nRogg\n\niAcbjEC",
+            "false\nINF\nlongest\nyWQcbrzctb\nbP\nZK\nXLfU\ndPKyyZVIDt\n\nKATY",
+            "wFqHFJfocN\nUsrhgA\n\nG",
+            "RI\nNRI\nlHqaNTeg\ndCwzrVss\nwIi\nudcc\nYUBkQc\nynoahdEqRxn\njk\nPDotlW\n\nugorB",
+            "\n\nnOu",
+            "KAqe\nOHRJ\nMZQSi\nohl\n\nfile",
+            "AlOTeKpJbzhkiTXBuwJwHZFyYCCWNQIeAXl\n\ndiSEinfcgCH",
+            "FsNelZu\nW\nFUYN\nuBXRGbapOizvH\nzzr\nMWgOE\nZOkrbM\nuSh\ncJW\nOXIzoam\nx\naOzupqUE\nNjY\nE\nVPUNW\nRolpJkkGkpoUpUmkbtyawkPtcGsvf\nWMJAtAQUqraxtFHSeUdMgscMedJBsBz\nVT\ntczuPAl\ndUvnF\ntI\nTRzf\nfsfAHtceElUFZYcULRAN\nElcPAlJVIfSg\nvectorized\nTRUE\nVmG\n\nhREpkR",
+            "\n\nmxq",
+            "aDkQtWJwg\n\nsPF",
+            "b\nqKgY\nksm\nwhXKC\nj\nXUicwWEwLkVyf\nYtn\nPUXVvg\nDGC\nns\nzfbUmu\n\nseVOCYJR",
+            "PyEacWLlQNNDMxJ\nv\nbYwRpMT\nzjPHODkMc\n\nIISUHfA",
+            "\n\nGnYF",
+            "\n\nEBbVSwSGULve",
+            "djGNg\n\nYOUlEelu",
+            "TtNtqRFjSSvcr\nYLKTaZ\nsS\nOi\nG\noukTofmopeQhISJw\ngVGsPvTOkt\nqWxGwixS\ndxsJy\nHJKQH\nG\nfEOf\nAuHaajh\n\nfVaKvwk"
+          ]
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 8983,
+        "context": [
+          {
+            "type": "stored",
+            "id": 8984
+          },
+          {
+            "type": "stored",
+            "id": 8985
+          },
+          {
+            "type": "stored",
+            "id": 8986
+          },
+          {
+            "type": "stored",
+            "id": 8987
+          }
+        ]
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,350 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz6/pe.v\", \"workspace\": \"/coq-dataset/repos/baz6\", \"repository\": \"/coq-dataset/repos/baz6\"}",
+    "{\"type\": \"stored\", \"id\": 9243}",
+    "{\"type\": \"stored\", \"id\": 9244}",
+    "{\"type\": \"stored\", \"id\": 9245}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 9246,
+        "context": [
+          {
+            "type": "stored",
+            "id": 9247
+          },
+          {
+            "type": "stored",
+            "id": 9248
+          },
+          {
+            "type": "stored",
+            "id": 9249
+          },
+          {
+            "type": "stored",
+            "id": 9250
+          },
+          {
+            "type": "stored",
+            "id": 9251
+          },
+          {
+            "type": "stored",
+            "id": 9252
+          },
+          {
+            "type": "stored",
+            "id": 9253
+          },
+          {
+            "type": "stored",
+            "id": 9254
+          },
+          {
+            "type": "stored",
+            "id": 9255
+          },
+          {
+            "type": "stored",
+            "id": 9256
+          },
+          {
+            "type": "stored",
+            "id": 9257
+          },
+          {
+            "type": "stored",
+            "id": 9258
+          },
+          {
+            "type": "stored",
+            "id": 9259
+          },
+          {
+            "type": "stored",
+            "id": 9260
+          },
+          {
+            "type": "stored",
+            "id": 9261
+          },
+          {
+            "type": "stored",
+            "id": 9262
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 9263,
+            "context": [
+              {
+                "type": "stored",
+                "id": 9264
+              },
+              {
+                "type": "stored",
+                "id": 9265
+              },
+              {
+                "type": "stored",
+                "id": 9266
+              },
+              {
+                "type": "stored",
+                "id": 9267
+              },
+              {
+                "type": "stored",
+                "id": 9268
+              },
+              {
+                "type": "stored",
+                "id": 9269
+              },
+              {
+                "type": "stored",
+                "id": 9270
+              },
+              {
+                "type": "stored",
+                "id": 9271
+              }
+            ]
+          },
+          "step": {
+            "text": "\u0092\u00bbp\u0088",
+            "context": [
+              {
+                "type": "stored",
+                "id": 9272
+              },
+              {
+                "type": "stored",
+                "id": 9273
+              },
+              {
+                "type": "stored",
+                "id": 9274
+              }
+            ]
+          },
+          "n_step": 4268,
+          "goals": [
+            "NULL\nIEhRK\nKCPHuJslvqjQYG\nZqAkg\n\nP"
+          ]
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 9275,
+        "context": [
+          {
+            "type": "stored",
+            "id": 9276
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 9277,
+            "context": [
+              {
+                "type": "stored",
+                "id": 9278
+              },
+              {
+                "type": "stored",
+                "id": 9279
+              },
+              {
+                "type": "stored",
+                "id": 9280
+              },
+              {
+                "type": "stored",
+                "id": 9281
+              },
+              {
+                "type": "stored",
+                "id": 9282
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 9283
+              },
+              {
+                "type": "stored",
+                "id": 9284
+              },
+              {
+                "type": "stored",
+                "id": 9285
+              },
+              {
+                "type": "stored",
+                "id": 9286
+              }
+            ]
+          },
+          "n_step": 9014005,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 9287,
+            "context": [
+              {
+                "type": "stored",
+                "id": 9288
+              },
+              {
+                "type": "stored",
+                "id": 9289
+              },
+              {
+                "type": "stored",
+                "id": 9290
+              },
+              {
+                "type": "stored",
+                "id": 9291
+              },
+              {
+                "type": "stored",
+                "id": 9292
+              },
+              {
+                "type": "stored",
+                "id": 9293
+              },
+              {
+                "type": "stored",
+                "id": 9294
+              },
+              {
+                "type": "stored",
+                "id": 9295
+              },
+              {
+                "type": "stored",
+                "id": 9296
+              }
+            ]
+          },
+          "step": {
+            "text": "\ud9dc\udc92(",
+            "context": [
+              {
+                "type": "stored",
+                "id": 9297
+              }
+            ]
+          },
+          "n_step": -15512,
+          "goals": [
+            "posBtMFgcpE\nyY\nzIkMYx\nmXZ\nV\nwuoimUjmtldbWZ\nBgUk\nvKYtV\nKGqJ\nN\nbemP\nOiIZHwdngbFYvjkmN\nsqqfg\nf\nOzFJ\nQmvsNjnmGrYD\nntzgmtFJKSfeSmFaaDGJjdoshU\nllFV\ntw\nldY\nR\nZzUugcnEz\nc\n\nBC"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 9298,
+            "context": [
+              {
+                "type": "stored",
+                "id": 9299
+              },
+              {
+                "type": "stored",
+                "id": 9300
+              },
+              {
+                "type": "stored",
+                "id": 9301
+              },
+              {
+                "type": "stored",
+                "id": 9302
+              },
+              {
+                "type": "stored",
+                "id": 9303
+              },
+              {
+                "type": "stored",
+                "id": 9304
+              },
+              {
+                "type": "stored",
+                "id": 9305
+              },
+              {
+                "type": "stored",
+                "id": 9306
+              },
+              {
+                "type": "stored",
+                "id": 9307
+              },
+              {
+                "type": "stored",
+                "id": 9308
+              },
+              {
+                "type": "stored",
+                "id": 9309
+              }
+            ]
+          },
+          "step": {
+            "text": "L\udaa5\udfb5\u00ef:\u00f5B\nX$\u009eP",
+            "context": []
+          },
+          "n_step": -209,
+          "goals": [
+            "tKlG\nRkUhI\nFxE\nPpIPkjBbNL\nqdqIvm\nihbYCiIeZU\nwYNBRn\nnull\nrY\n\nNULL",
+            "pZI\nXo\nmnrASgJ\nEaRw\n\nMo",
+            "\n\nUGcMdyaffV"
+          ]
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 9310,
+        "context": [
+          {
+            "type": "stored",
+            "id": 9311
+          },
+          {
+            "type": "stored",
+            "id": 9312
+          },
+          {
+            "type": "stored",
+            "id": 9313
+          }
+        ]
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
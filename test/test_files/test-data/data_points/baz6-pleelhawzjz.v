@@ -0,0 +1,248 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz6/pleelhawzjz.v\", \"workspace\": \"/coq-dataset/repos/baz6\", \"repository\": \"/coq-dataset/repos/baz6\"}",
+    "{\"type\": \"stored\", \"id\": 9083}",
+    "{\"type\": \"stored\", \"id\": 9084}",
+    "{\"type\": \"stored\", \"id\": 9085}",
+    "{\"type\": \"stored\", \"id\": 9086}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 9087,
+        "context": [
+          {
+            "type": "stored",
+            "id": 9088
+          },
+          {
+            "type": "stored",
+            "id": 9089
+          },
+          {
+            "type": "stored",
+            "id": 9090
+          },
+          {
+            "type": "stored",
+            "id": 9091
+          },
+          {
+            "type": "stored",
+            "id": 9092
+          },
+          {
+            "type": "stored",
+            "id": 9093
+          },
+          {
+            "type": "stored",
+            "id": 9094
+          },
+          {
+            "type": "stored",
+            "id": 9095
+          },
+          {
+            "type": "stored",
+            "id": 9096
+          },
+          {
+            "type": "stored",
+            "id": 9097
+          },
+          {
+            "type": "stored",
+            "id": 9098
+          },
+          {
+            "type": "stored",
+            "id": 9099
+          },
+          {
+            "type": "stored",
+            "id": 9100
+          },
+          {
+            "type": "stored",
+            "id": 9101
+          },
+          {
+            "type": "stored",
+            "id": 9102
+          },
+          {
+            "type": "stored",
+            "id": 9103
+          },
+          {
+            "type": "stored",
+            "id": 9104
+          },
+          {
+            "type": "stored",
+            "id": 9105
+          },
+          {
+            "type": "stored",
+            "id": 9106
+          },
+          {
+            "type": "stored",
+            "id": 9107
+          },
+          {
+            "type": "stored",
+            "id": 9108
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 9109,
+            "context": [
+              {
+                "type": "stored",
+                "id": 9110
+              },
+              {
+                "type": "stored",
+                "id": 9111
+              },
+              {
+                "type": "stored",
+                "id": 9112
+              },
+              {
+                "type": "stored",
+                "id": 9113
+              },
+              {
+                "type": "stored",
+                "id": 9114
+              },
+              {
+                "type": "stored",
+                "id": 9115
+              },
+              {
+                "type": "stored",
+                "id": 9116
+              },
+              {
+                "type": "stored",
+                "id": 9117
+              },
+              {
+                "type": "stored",
+                "id": 9118
+              },
+              {
+                "type": "stored",
+                "id": 9119
+              }
+            ]
+          },
+          "step": {
+            "text": ")\u00e9\u00ec",
+            "context": []
+          },
+          "n_step": 788,
+          "goals": [
+            "um\nzsI\n\nQWWxlByzEyNMGqx",
+            "\n\nRNlBLj",
+            "IsI\nEf\nr\nlABMviOFI\nLND\nMqnBTdv\nV\nEHcI\ncsr\nRKWYlBmtHDd\nkaFUpvj\n\naSOddRWYRfGDWmFb",
+            "\n\ncgCtno",
+            "XLiWMSR\nbEgisHLutSJIA\nmlM\nh\ngO\nUXc\nKamoZHt\nbmp\nFoAhO\ncXBxeHgSG\nXqnRjQtZwLGxSN\n\nNUL"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 9120,
+            "context": []
+          },
+          "step": {
+            "text": "\udae6\uddad\ud8a1\udc59",
+            "context": [
+              {
+                "type": "stored",
+                "id": 9121
+              },
+              {
+                "type": "stored",
+                "id": 9122
+              }
+            ]
+          },
+          "n_step": 4252,
+          "goals": [
+            "lScc\nbLSjY\nuMGc\nk\nOTJ\nnx\nmDLk\nzklBDYHvgUzMoaAEWRVYhIcAm\nDHq\nAi\nRjEkoCUyVUjquT\nTzHWKIxZ\nlBlPLjUxB\nKi\nH\nyOL\nuFW\nwL\nT\nUYxpy\ndvKf\ngKUCLRwPye\nYoKao\nnFjT\n\nUuvw",
+            "\n\nLpkLMnzkpCmIvpPDPevFqodLaderA",
+            "zvDE\nUGuFiW\nPUtvOoR\n\nfXuCKwMkjy",
+            "b\n\nrMDMnTxw",
+            "m\nHsTJwfAgjmkVTxCpw\nmSvj\nNsASbW\nmL\nwtDy\nU\nX\nPjNcREDenfm\n\nwAbkETTkUquXRJyk",
+            "X\nrhJ\nlRkfvXDIXPogw\n\nIC",
+            "jKGZw\nFalse\nLYW\nO\nrn\nS\nypaPvEKJCxj\nUKwemByibTirqY\nPDfmNRcH\n\nEzGIg",
+            "t\nV\naMsZMUTwTUB\nZXxk\ni\nzenHFxI\nH\ni\nv\nphGxLYqckQkymheL\nDh\nWifnG\neNGub\nNU\nPUVtm\n\nzFAyNIvHYFf",
+            "A\nmMBiGgnY\nJENfPM\nn\n\nZ"
+          ]
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 9123,
+        "context": [
+          {
+            "type": "stored",
+            "id": 9124
+          },
+          {
+            "type": "stored",
+            "id": 9125
+          },
+          {
+            "type": "stored",
+            "id": 9126
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 9127,
+            "context": []
+          },
+          "step": {
+            "text": "\u00df\ud935\ude29\udadb\udfd8",
+            "context": [
+              {
+                "type": "stored",
+                "id": 9128
+              },
+              {
+                "type": "stored",
+                "id": 9129
+              }
+            ]
+          },
+          "n_step": -10769618,
+          "goals": [
+            "tji\nqIGlS\nKMsSJM\nsiK\nm\nVe\nYvAxCCDJq\nwCdLIGRXXhnKkTJUhrlphA\nwuhOslSDUoSpdnoPgEZBxvn\nsdcHDaid\nXyQVwyDw\nCBGUzzVQA\nJfljX\nOtROrEVtMpfACaKx\n\npMvnU",
+            "Nafcce\nQnlqmUTbCMr\n\nMc",
+            "\n\nkNb",
+            "\n\nDjK",
+            "PlwaOrkMvjIgJ\nUVU\nSaxpG\noOwH\nHpRZ\nztRxcJB\nRECORD\nsZoyGakZ\n\nyRdw",
+            "PBkNsxvsq\n\nwP"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,24 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz6/qw.v\", \"workspace\": \"/coq-dataset/repos/baz6\", \"repository\": \"/coq-dataset/repos/baz6\"}",
+    "{\"type\": \"stored\", \"id\": 9130}",
+    "{\"type\": \"stored\", \"id\": 9131}",
+    "{\"type\": \"stored\", \"id\": 9132}",
+    "{\"type\": \"stored\", \"id\": 9133}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 9134,
+        "context": [
+          {
+            "type": "stored",
+            "id": 9135
+          }
+        ]
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,239 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz6/s.v\", \"workspace\": \"/coq-dataset/repos/baz6\", \"repository\": \"/coq-dataset/repos/baz6\"}",
+    "{\"type\": \"stored\", \"id\": 8888}",
+    "{\"type\": \"stored\", \"id\": 8889}",
+    "{\"type\": \"stored\", \"id\": 8890}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 8891,
+        "context": [
+          {
+            "type": "stored",
+            "id": 8892
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 8893,
+            "context": [
+              {
+                "type": "stored",
+                "id": 8894
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 8895
+              },
+              {
+                "type": "stored",
+                "id": 8896
+              },
+              {
+                "type": "stored",
+                "id": 8897
+              },
+              {
+                "type": "stored",
+                "id": 8898
+              }
+            ]
+          },
+          "n_step": 50000,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 8899,
+            "context": [
+              {
+                "type": "stored",
+                "id": 8900
+              },
+              {
+                "type": "stored",
+                "id": 8901
+              },
+              {
+                "type": "stored",
+                "id": 8902
+              },
+              {
+                "type": "stored",
+                "id": 8903
+              },
+              {
+                "type": "stored",
+                "id": 8904
+              },
+              {
+                "type": "stored",
+                "id": 8905
+              }
+            ]
+          },
+          "step": {
+            "text": "o\u00dd",
+            "context": [
+              {
+                "type": "stored",
+                "id": 8906
+              },
+              {
+                "type": "stored",
+                "id": 8907
+              },
+              {
+                "type": "stored",
+                "id": 8908
+              },
+              {
+                "type": "stored",
+                "id": 8909
+              },
+              {
+                "type": "stored",
+                "id": 8910
+              },
+              {
+                "type": "stored",
+                "id": 8911
+              },
+              {
+                "type": "stored",
+                "id": 8912
+              },
+              {
+                "type": "stored",
+                "id": 8913
+              }
+            ]
+          },
+          "n_step": -49626,
+          "goals": [
+            "vjCjz\nnwY\nQraRxTwrdOsSktyCHFbw\nSBshjySRN\nUq\n\ni",
+            "\n\nwUr",
+            "\n\ndxxVDIa",
+            "\n\ns"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 8914,
+            "context": [
+              {
+                "type": "stored",
+                "id": 8915
+              },
+              {
+                "type": "stored",
+                "id": 8916
+              },
+              {
+                "type": "stored",
+                "id": 8917
+              },
+              {
+                "type": "stored",
+                "id": 8918
+              },
+              {
+                "type": "stored",
+                "id": 8919
+              },
+              {
+                "type": "stored",
+                "id": 8920
+              },
+              {
+                "type": "stored",
+                "id": 8921
+              },
+              {
+                "type": "stored",
+                "id": 8922
+              },
+              {
+                "type": "stored",
+                "id": 8923
+              },
+              {
+                "type": "stored",
+                "id": 8924
+              },
+              {
+                "type": "stored",
+                "id": 8925
+              },
+              {
+                "type": "stored",
+                "id": 8926
+              },
+              {
+                "type": "stored",
+                "id": 8927
+              },
+              {
+                "type": "stored",
+                "id": 8928
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 8929
+              },
+              {
+                "type": "stored",
+                "id": 8930
+              },
+              {
+                "type": "stored",
+                "id": 8931
+              },
+              {
+                "type": "stored",
+                "id": 8932
+              },
+              {
+                "type": "stored",
+                "id": 8933
+              },
+              {
+                "type": "stored",
+                "id": 8934
+              }
+            ]
+          },
+          "n_step": 514,
+          "goals": [
+            "aisUqwrJxq\nWtv\nDRWGnSdNnrSlcRwgeDJybkKMyNy\nqHYThKtneO\ndxBR\nsnVI\n\nK",
+            "sWQ\nxJk\nVWqdrGWqef\nfRl\nwwlaE\nipNqw\nZ\nm\nInf\notOBFNtXnCqgkNDsZLAW\nK\nWv\nzfe\nn\nL\nKgEdGfYktSaPGB\nDAscYwgtTOpbVKHbevKhZpMU\nZSubrCJZOviuucW\nUeMLdpPt\noFKkbyqB\n\ncG",
+            "\n\nvpKS",
+            "cxxtMzjd\nZu\nR\nvCScudlPGD\nnKC\nzuYotnSXsTpqiy\nJRSESUCjEyNIGn\ngQ\nxY\nNVD\nD\nHww\nib\nXWbXgB\n\nNCWP",
+            "H\nyQsriXe\nfGjZH\nxkTYUhs\npekMMm\nfHQt\nAD\ntkLhOE\nEqZbJBlZQLr\nrDIfqxXjuMb\nV\nORGlq\nLT\npBF\nC\nxDi\nKAUfRb\nLK\nAERDW\nJPS\n\nr",
+            "PviCZkYYkAJnaUTLZFLe\nBzPZmr\nYUe\nfTLmAYXqVFLtWk\n\nsEU",
+            "iduJOA\nTrue\nIfrp\nRjR\nDEBsX\ng\nxD\nphyUybnN\n\naaySRh",
+            "se\nV\ncTiozPdaCHfOnOx\nq\ngFnwiT\nTRUE\n\nnNv"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,13 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz6/si.v\", \"workspace\": \"/coq-dataset/repos/baz6\", \"repository\": \"/coq-dataset/repos/baz6\"}",
+    "{\"type\": \"stored\", \"id\": 9218}",
+    "{\"type\": \"stored\", \"id\": 9219}",
+    "{\"type\": \"stored\", \"id\": 9220}",
+    "{\"type\": \"stored\", \"id\": 9221}",
+    "{\"type\": \"stored\", \"id\": 9222}",
+    "{\"type\": \"stored\", \"id\": 9223}",
+    "{\"type\": \"stored\", \"id\": 9224}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
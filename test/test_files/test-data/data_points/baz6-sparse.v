@@ -0,0 +1,11 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz6/sparse.v\", \"workspace\": \"/coq-dataset/repos/baz6\", \"repository\": \"/coq-dataset/repos/baz6\"}",
+    "{\"type\": \"stored\", \"id\": 9018}",
+    "{\"type\": \"stored\", \"id\": 9019}",
+    "{\"type\": \"stored\", \"id\": 9020}",
+    "{\"type\": \"stored\", \"id\": 9021}",
+    "{\"type\": \"stored\", \"id\": 9022}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,178 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/baz6/srupkewx.v\", \"workspace\": \"/coq-dataset/repos/baz6\", \"repository\": \"/coq-dataset/repos/baz6\"}",
+    "{\"type\": \"stored\", \"id\": 9314}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 9315,
+        "context": []
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 9316,
+            "context": [
+              {
+                "type": "stored",
+                "id": 9317
+              },
+              {
+                "type": "stored",
+                "id": 9318
+              },
+              {
+                "type": "stored",
+                "id": 9319
+              },
+              {
+                "type": "stored",
+                "id": 9320
+              },
+              {
+                "type": "stored",
+                "id": 9321
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00ef\u00b4=\ud905\udf20\u00ca",
+            "context": [
+              {
+                "type": "stored",
+                "id": 9322
+              },
+              {
+                "type": "stored",
+                "id": 9323
+              },
+              {
+                "type": "stored",
+                "id": 9324
+              },
+              {
+                "type": "stored",
+                "id": 9325
+              },
+              {
+                "type": "stored",
+                "id": 9326
+              },
+              {
+                "type": "stored",
+                "id": 9327
+              },
+              {
+                "type": "stored",
+                "id": 9328
+              },
+              {
+                "type": "stored",
+                "id": 9329
+              },
+              {
+                "type": "stored",
+                "id": 9330
+              },
+              {
+                "type": "stored",
+                "id": 9331
+              },
+              {
+                "type": "stored",
+                "id": 9332
+              },
+              {
+                "type": "stored",
+                "id": 9333
+              },
+              {
+                "type": "stored",
+                "id": 9334
+              }
+            ]
+          },
+          "n_step": -395,
+          "goals": [
+            "\n\nHKK",
+            "ybbohB\nygqGZJdlYpO\nnr\nWlre\nvqWV\nVARIANT\nhoHBQZMKEfZKSAXNp\na\n\nxswi",
+            "kJ\nFhyGNhGEKW\n\nEdUbB",
+            "cbokAraZ\nXiM\n\nbnLIEuQ",
+            "UsZQrNHaoel\nAPxi\n\nTK",
+            "MjAxF\nWQ\nQ\n\nGLXrrZXa",
+            "M\nrzPo\nKkJrga\n\neclxePkmZjWpTdo",
+            "kAgczyu\n\nU",
+            "VZKy\nWusxKJgkiRyzCLl\nEa\naZ\nterm\n\nwJmR",
+            "ZiQllLnWOOBXu\ngXkVRFrW\nLoQcAKKCa\nNHGmXqGoIAZ\nFVgKcNgYCTa\nVXADPyg\n\nxzcr",
+            "tBI\nJkOBB\njBYX\nWNAcJFc\nah\nBS\nVEwxiaFmyn\nvCoUKfeLJmDMKJwxG\n\nXuefIesljW",
+            "\n\nTtwHjdkYnrULnC",
+            "rZRg\nCIklZbLd\nr\nrXDv\n\nbeUyF",
+            "tOzOrwHas\nBivaZPHyux\nV\n\ndseN",
+            "SsRJvccEDQvSU\nJlpz\nD\nQnBH\nMchHaoPRbzpeNcbeVfjk\nd\ntBNuXlinlaZ\nGyD\nryJcYwydQX\n\noaJhLBF",
+            "zBaFcqj\ngCvuPTw\nk\nqrtrafoj\n\npLdSxPUDL"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 9335,
+            "context": [
+              {
+                "type": "stored",
+                "id": 9336
+              },
+              {
+                "type": "stored",
+                "id": 9337
+              },
+              {
+                "type": "stored",
+                "id": 9338
+              },
+              {
+                "type": "stored",
+                "id": 9339
+              },
+              {
+                "type": "stored",
+                "id": 9340
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 9341
+              },
+              {
+                "type": "stored",
+                "id": 9342
+              },
+              {
+                "type": "stored",
+                "id": 9343
+              },
+              {
+                "type": "stored",
+                "id": 9344
+              },
+              {
+                "type": "stored",
+                "id": 9345
+              }
+            ]
+          },
+          "n_step": 959,
+          "goals": [
+            "AGOpbymy\n\nfor"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,6 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo1/cxgtyktokw.v\", \"workspace\": \"/coq-dataset/repos/foo1\", \"repository\": \"/coq-dataset/repos/foo1\"}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,9 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo1/ehkubffz.v\", \"workspace\": \"/coq-dataset/repos/foo1\", \"repository\": \"/coq-dataset/repos/foo1\"}",
+    "{\"type\": \"stored\", \"id\": 226}",
+    "{\"type\": \"stored\", \"id\": 227}",
+    "{\"type\": \"stored\", \"id\": 228}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,159 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo1/esv.v\", \"workspace\": \"/coq-dataset/repos/foo1\", \"repository\": \"/coq-dataset/repos/foo1\"}",
+    "{\"type\": \"stored\", \"id\": 273}",
+    "{\"type\": \"stored\", \"id\": 274}",
+    "{\"type\": \"stored\", \"id\": 275}",
+    "{\"type\": \"stored\", \"id\": 276}",
+    "{\"type\": \"stored\", \"id\": 277}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 278,
+        "context": [
+          {
+            "type": "stored",
+            "id": 279
+          },
+          {
+            "type": "stored",
+            "id": 280
+          },
+          {
+            "type": "stored",
+            "id": 281
+          },
+          {
+            "type": "stored",
+            "id": 282
+          },
+          {
+            "type": "stored",
+            "id": 283
+          },
+          {
+            "type": "stored",
+            "id": 284
+          },
+          {
+            "type": "stored",
+            "id": 285
+          },
+          {
+            "type": "stored",
+            "id": 286
+          },
+          {
+            "type": "stored",
+            "id": 287
+          },
+          {
+            "type": "stored",
+            "id": 288
+          },
+          {
+            "type": "stored",
+            "id": 289
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 290,
+            "context": []
+          },
+          "step": {
+            "text": "\u009et",
+            "context": [
+              {
+                "type": "stored",
+                "id": 291
+              }
+            ]
+          },
+          "n_step": 2460566,
+          "goals": [
+            "yNXK\nFVPDV\nzO\nqUw\nxcsYfJmyFtPIqPqnsU\nIAC\nUJ\nAMHpnnuTcwuSeI\npjatyq\nSbNz\npfyCA\nfA\ny\nxp\ndxhYqNDg\n\nxQ",
+            "pQz\nkqViBiyMb\nDAe\nuLsDQE\nyBSBdxP\neFq\nybB\nOIh\nE\ngE\nGFKHPr\nltatbZh\nLVorL\ndY\nEIsi\nnSCNJytP\nusgnycchUuNfIZIN\n\nbvhEUHdz",
+            "\n\npcN",
+            "PW\nI\njQSQHESVP\n\ntDzvBH"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 292,
+            "context": [
+              {
+                "type": "stored",
+                "id": 293
+              },
+              {
+                "type": "stored",
+                "id": 294
+              },
+              {
+                "type": "stored",
+                "id": 295
+              },
+              {
+                "type": "stored",
+                "id": 296
+              },
+              {
+                "type": "stored",
+                "id": 297
+              },
+              {
+                "type": "stored",
+                "id": 298
+              },
+              {
+                "type": "stored",
+                "id": 299
+              },
+              {
+                "type": "stored",
+                "id": 300
+              },
+              {
+                "type": "stored",
+                "id": 301
+              },
+              {
+                "type": "stored",
+                "id": 302
+              },
+              {
+                "type": "stored",
+                "id": 303
+              },
+              {
+                "type": "stored",
+                "id": 304
+              },
+              {
+                "type": "stored",
+                "id": 305
+              },
+              {
+                "type": "stored",
+                "id": 306
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": []
+          },
+          "n_step": -1632,
+          "goals": []
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,151 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo1/ha.v\", \"workspace\": \"/coq-dataset/repos/foo1\", \"repository\": \"/coq-dataset/repos/foo1\"}",
+    "{\"type\": \"stored\", \"id\": 1}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 2,
+        "context": [
+          {
+            "type": "stored",
+            "id": 3
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 4,
+            "context": [
+              {
+                "type": "stored",
+                "id": 5
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 6
+              },
+              {
+                "type": "stored",
+                "id": 7
+              },
+              {
+                "type": "stored",
+                "id": 8
+              },
+              {
+                "type": "stored",
+                "id": 9
+              },
+              {
+                "type": "stored",
+                "id": 10
+              }
+            ]
+          },
+          "n_step": -148640,
+          "goals": [
+            "yj\n\nQMBB",
+            "d\nrIW\ntrue\nLaYFqE\nkDwuS\nK\n\nBOxxFVqLijExXzR",
+            "\n\njChuD",
+            "uAa\nj\nfXqSSCkXdykloSB\nm\nKD\nHaJvLIH\nT\n\nquZMffCQ",
+            "yxP\ntXNhfrghreKyDR\ngW\nCZgeTnswPtua\n\nf"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 11,
+            "context": [
+              {
+                "type": "stored",
+                "id": 12
+              },
+              {
+                "type": "stored",
+                "id": 13
+              },
+              {
+                "type": "stored",
+                "id": 14
+              },
+              {
+                "type": "stored",
+                "id": 15
+              },
+              {
+                "type": "stored",
+                "id": 16
+              },
+              {
+                "type": "stored",
+                "id": 17
+              },
+              {
+                "type": "stored",
+                "id": 18
+              },
+              {
+                "type": "stored",
+                "id": 19
+              },
+              {
+                "type": "stored",
+                "id": 20
+              },
+              {
+                "type": "stored",
+                "id": 21
+              },
+              {
+                "type": "stored",
+                "id": 22
+              },
+              {
+                "type": "stored",
+                "id": 23
+              },
+              {
+                "type": "stored",
+                "id": 24
+              },
+              {
+                "type": "stored",
+                "id": 25
+              }
+            ]
+          },
+          "step": {
+            "text": "w\u00f4\u0011d\uda7e\udc63\u009e\ud875\udf61",
+            "context": [
+              {
+                "type": "stored",
+                "id": 26
+              },
+              {
+                "type": "stored",
+                "id": 27
+              }
+            ]
+          },
+          "n_step": -1423,
+          "goals": [
+            "Gy\nXbWxsmHsn\necPGAzz\nH\ndm\n\nt",
+            "yPKtnOWzXZ\nWe\niwHdYuVezmj\nInf\nRjQv\n\nopaJb",
+            "oberBJFtXYcN\n\nkFto",
+            "Ln\nH\nCnqlynqDMweC\nDrgIrM\nwTrZGoYOI\npRyJjsnNB\n\nXUm"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
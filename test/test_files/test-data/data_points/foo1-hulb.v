@@ -0,0 +1,13 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo1/hulb.v\", \"workspace\": \"/coq-dataset/repos/foo1\", \"repository\": \"/coq-dataset/repos/foo1\"}",
+    "{\"type\": \"stored\", \"id\": 145}",
+    "{\"type\": \"stored\", \"id\": 146}",
+    "{\"type\": \"stored\", \"id\": 147}",
+    "{\"type\": \"stored\", \"id\": 148}",
+    "{\"type\": \"stored\", \"id\": 149}",
+    "{\"type\": \"stored\", \"id\": 150}",
+    "{\"type\": \"stored\", \"id\": 151}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
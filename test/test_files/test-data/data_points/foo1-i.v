@@ -0,0 +1,98 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo1/i.v\", \"workspace\": \"/coq-dataset/repos/foo1\", \"repository\": \"/coq-dataset/repos/foo1\"}",
+    "{\"type\": \"stored\", \"id\": 200}",
+    "{\"type\": \"stored\", \"id\": 201}",
+    "{\"type\": \"stored\", \"id\": 202}",
+    "{\"type\": \"stored\", \"id\": 203}",
+    "{\"type\": \"stored\", \"id\": 204}",
+    "{\"type\": \"stored\", \"id\": 205}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 206,
+        "context": [
+          {
+            "type": "stored",
+            "id": 207
+          },
+          {
+            "type": "stored",
+            "id": 208
+          },
+          {
+            "type": "stored",
+            "id": 209
+          },
+          {
+            "type": "stored",
+            "id": 210
+          },
+          {
+            "type": "stored",
+            "id": 211
+          },
+          {
+            "type": "stored",
+            "id": 212
+          },
+          {
+            "type": "stored",
+            "id": 213
+          },
+          {
+            "type": "stored",
+            "id": 214
+          },
+          {
+            "type": "stored",
+            "id": 215
+          },
+          {
+            "type": "stored",
+            "id": 216
+          },
+          {
+            "type": "stored",
+            "id": 217
+          },
+          {
+            "type": "stored",
+            "id": 218
+          },
+          {
+            "type": "stored",
+            "id": 219
+          },
+          {
+            "type": "stored",
+            "id": 220
+          },
+          {
+            "type": "stored",
+            "id": 221
+          },
+          {
+            "type": "stored",
+            "id": 222
+          },
+          {
+            "type": "stored",
+            "id": 223
+          },
+          {
+            "type": "stored",
+            "id": 224
+          },
+          {
+            "type": "stored",
+            "id": 225
+          }
+        ]
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,324 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo1/ir.v\", \"workspace\": \"/coq-dataset/repos/foo1\", \"repository\": \"/coq-dataset/repos/foo1\"}",
+    "{\"type\": \"stored\", \"id\": 51}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 52,
+        "context": [
+          {
+            "type": "stored",
+            "id": 53
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 54,
+            "context": [
+              {
+                "type": "stored",
+                "id": 55
+              },
+              {
+                "type": "stored",
+                "id": 56
+              },
+              {
+                "type": "stored",
+                "id": 57
+              },
+              {
+                "type": "stored",
+                "id": 58
+              }
+            ]
+          },
+          "step": {
+            "text": "7\udaea\udd08=\u0083\u00d2\u00aa",
+            "context": []
+          },
+          "n_step": 123076875636061306880,
+          "goals": [
+            "LsA\nPsbsVAqpyjiyvKqlB\nJmhoZ\n\nZYOUIvS",
+            "oaC\nCbFbIE\nS\ncf\nergOP\n\nXof",
+            "b\nNkKFSfYmJpqVAzmmNtoL\nurls\ncFuCX\nEnfr\n\nz",
+            "Y\nYjSfpD\nvE\nyxfNW\nJEW\nK\noIoLJKTTz\n\neMGgYVWSPPdUUkn",
+            "ZJf\nccr\n\nUr",
+            "lxETjfIl\nJq\nName\n\nBGlz"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 59,
+            "context": []
+          },
+          "step": {
+            "text": "\u00ce\u00f9\u001c\u00f1\u00f8\u00e0r\u00de\udb59\ude8bI\u00f8\ud993\udd0fd\u00bc\u0013\u008e\uda23\udc22\ud8eb\ude7b\u00a6\u008b\u00c9\u00e8\u009d\u008a*\ud88d\uddcd",
+            "context": [
+              {
+                "type": "stored",
+                "id": 60
+              },
+              {
+                "type": "stored",
+                "id": 61
+              },
+              {
+                "type": "stored",
+                "id": 62
+              },
+              {
+                "type": "stored",
+                "id": 63
+              },
+              {
+                "type": "stored",
+                "id": 64
+              },
+              {
+                "type": "stored",
+                "id": 65
+              },
+              {
+                "type": "stored",
+                "id": 66
+              },
+              {
+                "type": "stored",
+                "id": 67
+              },
+              {
+                "type": "stored",
+                "id": 68
+              },
+              {
+                "type": "stored",
+                "id": 69
+              },
+              {
+                "type": "stored",
+                "id": 70
+              },
+              {
+                "type": "stored",
+                "id": 71
+              },
+              {
+                "type": "stored",
+                "id": 72
+              },
+              {
+                "type": "stored",
+                "id": 73
+              },
+              {
+                "type": "stored",
+                "id": 74
+              },
+              {
+                "type": "stored",
+                "id": 75
+              },
+              {
+                "type": "stored",
+                "id": 76
+              },
+              {
+                "type": "stored",
+                "id": 77
+              },
+              {
+                "type": "stored",
+                "id": 78
+              },
+              {
+                "type": "stored",
+                "id": 79
+              },
+              {
+                "type": "stored",
+                "id": 80
+              },
+              {
+                "type": "stored",
+                "id": 81
+              },
+              {
+                "type": "stored",
+                "id": 82
+              },
+              {
+                "type": "stored",
+                "id": 83
+              },
+              {
+                "type": "stored",
+                "id": 84
+              },
+              {
+                "type": "stored",
+                "id": 85
+              },
+              {
+                "type": "stored",
+                "id": 86
+              },
+              {
+                "type": "stored",
+                "id": 87
+              },
+              {
+                "type": "stored",
+                "id": 88
+              }
+            ]
+          },
+          "n_step": 16751051455,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 89,
+            "context": []
+          },
+          "step": {
+            "text": "\ud9a2\udc02\ud96a\udc1f\udbf7\uddc7\u0003\f\u00f0(\u00b6\u00f6\u00fbD\ud988\ude5d\u00a5\u00d9\u00fd\u0005",
+            "context": [
+              {
+                "type": "stored",
+                "id": 90
+              },
+              {
+                "type": "stored",
+                "id": 91
+              },
+              {
+                "type": "stored",
+                "id": 92
+              }
+            ]
+          },
+          "n_step": -145026868700140,
+          "goals": [
+            "WPvYGExa\nfEoNma\nrIDsGciQYh\nmZr\np\ngMa\nqEmDiZE\nyXkJZVhRgZaH\niLco\n\nTL",
+            "CcZSDYNNNV\nyctPJswuiI\n\ncADIkvH"
+          ]
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 93,
+        "context": [
+          {
+            "type": "stored",
+            "id": 94
+          },
+          {
+            "type": "stored",
+            "id": 95
+          },
+          {
+            "type": "stored",
+            "id": 96
+          },
+          {
+            "type": "stored",
+            "id": 97
+          },
+          {
+            "type": "stored",
+            "id": 98
+          },
+          {
+            "type": "stored",
+            "id": 99
+          },
+          {
+            "type": "stored",
+            "id": 100
+          },
+          {
+            "type": "stored",
+            "id": 101
+          },
+          {
+            "type": "stored",
+            "id": 102
+          },
+          {
+            "type": "stored",
+            "id": 103
+          },
+          {
+            "type": "stored",
+            "id": 104
+          },
+          {
+            "type": "stored",
+            "id": 105
+          },
+          {
+            "type": "stored",
+            "id": 106
+          },
+          {
+            "type": "stored",
+            "id": 107
+          },
+          {
+            "type": "stored",
+            "id": 108
+          },
+          {
+            "type": "stored",
+            "id": 109
+          },
+          {
+            "type": "stored",
+            "id": 110
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 111,
+            "context": []
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 112
+              },
+              {
+                "type": "stored",
+                "id": 113
+              },
+              {
+                "type": "stored",
+                "id": 114
+              }
+            ]
+          },
+          "n_step": 14787128,
+          "goals": [
+            "\n\ngSxQKQ"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,8 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo1/jkdloizppyxnz.v\", \"workspace\": \"/coq-dataset/repos/foo1\", \"repository\": \"/coq-dataset/repos/foo1\"}",
+    "{\"type\": \"stored\", \"id\": 307}",
+    "{\"type\": \"stored\", \"id\": 308}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
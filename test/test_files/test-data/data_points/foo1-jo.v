@@ -0,0 +1,14 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo1/jo.v\", \"workspace\": \"/coq-dataset/repos/foo1\", \"repository\": \"/coq-dataset/repos/foo1\"}",
+    "{\"type\": \"stored\", \"id\": 33}",
+    "{\"type\": \"stored\", \"id\": 34}",
+    "{\"type\": \"stored\", \"id\": 35}",
+    "{\"type\": \"stored\", \"id\": 36}",
+    "{\"type\": \"stored\", \"id\": 37}",
+    "{\"type\": \"stored\", \"id\": 38}",
+    "{\"type\": \"stored\", \"id\": 39}",
+    "{\"type\": \"stored\", \"id\": 40}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,72 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo1/jo.v.v\", \"workspace\": \"/coq-dataset/repos/foo1\", \"repository\": \"/coq-dataset/repos/foo1\"}",
+    "{\"type\": \"stored\", \"id\": 309}",
+    "{\"type\": \"stored\", \"id\": 310}",
+    "{\"type\": \"stored\", \"id\": 311}",
+    "{\"type\": \"stored\", \"id\": 312}",
+    "{\"type\": \"stored\", \"id\": 313}",
+    "{\"type\": \"stored\", \"id\": 314}",
+    "{\"type\": \"stored\", \"id\": 315}",
+    "{\"type\": \"stored\", \"id\": 316}",
+    "{\"type\": \"stored\", \"id\": 317}",
+    "{\"type\": \"stored\", \"id\": 318}",
+    "{\"type\": \"stored\", \"id\": 319}",
+    "{\"type\": \"stored\", \"id\": 320}",
+    "{\"type\": \"stored\", \"id\": 321}",
+    "{\"type\": \"stored\", \"id\": 322}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 323,
+        "context": []
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 324,
+            "context": []
+          },
+          "step": {
+            "text": ",U\u00b8\uda01\udec1_\u00ac\u0012",
+            "context": []
+          },
+          "n_step": -30921,
+          "goals": [
+            "undefined\nU\nmKniUfXZylCcMZTM\nhYXhQLVQcr\naccdpudT\nop\nwmkRPxO\nInf\nDQGPqP\nKva\nsgKvpzpYCInkmAYtdWJ\n\ntckKbmpYrcDnFtBAe",
+            "Q\nfi\nNrPHvRXEI\naBed\nTLxrZzfpfGkyxU\nh\nVnihnNjoNrx\nXZir\nsfebsTkqj\nLwX\nmT\nWFYQnJiKgGMi\nXSimwYwXbNe\nG\nTLN\nWU\nhxwA\nUMFxgRM\ndhWV\nsSgPmNB\nNMrkGWzrXU\n\nW",
+            "lqEmnLjwHBpb\nE\ndT\n\nZCmlccDEXoPXXfFL",
+            "NsX\nA\nHrOEHXNeSFWrmCe\nYOEZG\neFqL\n\nsgOZjLrRMDKUD",
+            "p\n\nz",
+            "fJJqtaxyTQyhIYykBro\nr\n\nUo",
+            "dUfylX\nrWNxtCYUZbuardzIxHek\nDMkap\n\nZxMfvr",
+            "False\n\naOqTYDMB",
+            "lrzm\n\nvfvNTYisMPNrFxfoRoV",
+            "cxAR\n\ncfH",
+            "PgPMWPru\nGmRidmKXQTYFTjJyaB\n\nEcYyIQUwPoODeCD",
+            "FHDBpuVF\nimrzcCSMTqzhkJNRBfqz\nOWOnIicuBuVU\nhALGv\n\nuDol",
+            "bOaUR\nc\nz\nFNRPhxWW\nQ\nfZzp\nyyJX\nXysKXFLr\nHwlVTk\nj\nzaBdHIrFYkD\nUJkhekkmi\ny\nr\nBCUsz\nFBYkxzEoh\nScunthorpe\nquR\nMfjE\nDutHoz\ngCVJvypBl\n\nnone",
+            "Swdq\nproj\nHiIicobhnAYhL\naNyMB\nviJGFCdcknY\njbqqB\n\ny",
+            "Fl\nlA\nxhSzz\nCgsJgYqVUvxoEy\nMLJGpvoWy\n\nViMI",
+            "X\nvgOBL\nefozvm\nVFuzXsQiZomEp\nCDRiCUDQVTJhhsXd\nqNTAos\nYUg\nRFTWAs\nZ\neVUNMC\nyytFpivvSJYAyV\nBjrVY\nOEVTZ\nGh\nlZYYTc\nGctnYYW\nBAugqKBeOsxvNe\nlat\nTpglnje\nTWrOQ\nwbZatT\nG\noWbBT\n\nipaE",
+            "oBncPuloeYwexKlfEnMtGz\nFDdPtkisdlLNGG\nlPMIj\n\nccCDkUF",
+            "V\nNV\np\nR\nx\nEsiLkk\n\nX",
+            "\n\nvvAjE",
+            "qafWWEaA\n\npuo"
+          ]
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 325,
+        "context": []
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
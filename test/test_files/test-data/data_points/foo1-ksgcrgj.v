@@ -0,0 +1,227 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo1/ksgcrgj.v\", \"workspace\": \"/coq-dataset/repos/foo1\", \"repository\": \"/coq-dataset/repos/foo1\"}",
+    "{\"type\": \"stored\", \"id\": 376}",
+    "{\"type\": \"stored\", \"id\": 377}",
+    "{\"type\": \"stored\", \"id\": 378}",
+    "{\"type\": \"stored\", \"id\": 379}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 380,
+        "context": []
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 381,
+            "context": [
+              {
+                "type": "stored",
+                "id": 382
+              },
+              {
+                "type": "stored",
+                "id": 383
+              },
+              {
+                "type": "stored",
+                "id": 384
+              }
+            ]
+          },
+          "step": {
+            "text": "\ud977\udf25\u009e;\u00ac",
+            "context": [
+              {
+                "type": "stored",
+                "id": 385
+              },
+              {
+                "type": "stored",
+                "id": 386
+              },
+              {
+                "type": "stored",
+                "id": 387
+              },
+              {
+                "type": "stored",
+                "id": 388
+              },
+              {
+                "type": "stored",
+                "id": 389
+              },
+              {
+                "type": "stored",
+                "id": 390
+              },
+              {
+                "type": "stored",
+                "id": 391
+              },
+              {
+                "type": "stored",
+                "id": 392
+              },
+              {
+                "type": "stored",
+                "id": 393
+              },
+              {
+                "type": "stored",
+                "id": 394
+              },
+              {
+                "type": "stored",
+                "id": 395
+              },
+              {
+                "type": "stored",
+                "id": 396
+              },
+              {
+                "type": "stored",
+                "id": 397
+              },
+              {
+                "type": "stored",
+                "id": 398
+              },
+              {
+                "type": "stored",
+                "id": 399
+              },
+              {
+                "type": "stored",
+                "id": 400
+              },
+              {
+                "type": "stored",
+                "id": 401
+              },
+              {
+                "type": "stored",
+                "id": 402
+              },
+              {
+                "type": "stored",
+                "id": 403
+              },
+              {
+                "type": "stored",
+                "id": 404
+              }
+            ]
+          },
+          "n_step": 218,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 405,
+            "context": [
+              {
+                "type": "stored",
+                "id": 406
+              },
+              {
+                "type": "stored",
+                "id": 407
+              },
+              {
+                "type": "stored",
+                "id": 408
+              },
+              {
+                "type": "stored",
+                "id": 409
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 410
+              },
+              {
+                "type": "stored",
+                "id": 411
+              },
+              {
+                "type": "stored",
+                "id": 412
+              }
+            ]
+          },
+          "n_step": 31609390,
+          "goals": [
+            "KwtLgXAitM\nFlROjQVRfU\nelse\n\nllYQ",
+            "dt\nTHgckt\nkNT\nPxg\nPLgcilNTBxiLg\nNUL\nKfQ\n\ndFVUlf",
+            "qz\nigb\nJhXtDBy\nZvJqembHWUixLGHwde\nebMcRsK\nvBC\nnDVVTRNJyqmQKbHsF\neUxbXNB\nzEFkQdEE\nImdOz\nJHcBTW\nEsq\nqNkYZaduqxc\n\nF",
+            "\n\nAlAywohSTa",
+            "rY\nym\ntLn\nkp\nk\nbWll\nR\noLj\nGOUOe\n\nh"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 413,
+            "context": [
+              {
+                "type": "stored",
+                "id": 414
+              },
+              {
+                "type": "stored",
+                "id": 415
+              },
+              {
+                "type": "stored",
+                "id": 416
+              }
+            ]
+          },
+          "step": {
+            "text": "\ud921\udcd1\u00aem\u00e5\u00df",
+            "context": [
+              {
+                "type": "stored",
+                "id": 417
+              },
+              {
+                "type": "stored",
+                "id": 418
+              },
+              {
+                "type": "stored",
+                "id": 419
+              },
+              {
+                "type": "stored",
+                "id": 420
+              }
+            ]
+          },
+          "n_step": -3928,
+          "goals": [
+            "\n\nD",
+            "tXRUJn\ncD\n\neISrCKM",
+            "\n\nsUH",
+            "\n\nT",
+            "\n\nZOz",
+            "\n\nVCvNUh",
+            "C\nxc\nrV\nNDRN\nLZ\n\nQdQOmF"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
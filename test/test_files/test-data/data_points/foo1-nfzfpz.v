@@ -0,0 +1,33 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo1/nfzfpz.v\", \"workspace\": \"/coq-dataset/repos/foo1\", \"repository\": \"/coq-dataset/repos/foo1\"}",
+    "{\"type\": \"stored\", \"id\": 246}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 247,
+        "context": [
+          {
+            "type": "stored",
+            "id": 248
+          },
+          {
+            "type": "stored",
+            "id": 249
+          },
+          {
+            "type": "stored",
+            "id": 250
+          },
+          {
+            "type": "stored",
+            "id": 251
+          }
+        ]
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
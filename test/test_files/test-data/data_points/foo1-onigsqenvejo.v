@@ -0,0 +1,21 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo1/onigsqenvejo.v\", \"workspace\": \"/coq-dataset/repos/foo1\", \"repository\": \"/coq-dataset/repos/foo1\"}",
+    "{\"type\": \"stored\", \"id\": 252}",
+    "{\"type\": \"stored\", \"id\": 253}",
+    "{\"type\": \"stored\", \"id\": 254}",
+    "{\"type\": \"stored\", \"id\": 255}",
+    "{\"type\": \"stored\", \"id\": 256}",
+    "{\"type\": \"stored\", \"id\": 257}",
+    "{\"type\": \"stored\", \"id\": 258}",
+    "{\"type\": \"stored\", \"id\": 259}",
+    "{\"type\": \"stored\", \"id\": 260}",
+    "{\"type\": \"stored\", \"id\": 261}",
+    "{\"type\": \"stored\", \"id\": 262}",
+    "{\"type\": \"stored\", \"id\": 263}",
+    "{\"type\": \"stored\", \"id\": 264}",
+    "{\"type\": \"stored\", \"id\": 265}",
+    "{\"type\": \"stored\", \"id\": 266}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
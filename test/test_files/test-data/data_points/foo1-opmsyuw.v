@@ -0,0 +1,47 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo1/opmsyuw.v\", \"workspace\": \"/coq-dataset/repos/foo1\", \"repository\": \"/coq-dataset/repos/foo1\"}",
+    "{\"type\": \"stored\", \"id\": 229}",
+    "{\"type\": \"stored\", \"id\": 230}",
+    "{\"type\": \"stored\", \"id\": 231}",
+    "{\"type\": \"stored\", \"id\": 232}",
+    "{\"type\": \"stored\", \"id\": 233}",
+    "{\"type\": \"stored\", \"id\": 234}",
+    "{\"type\": \"stored\", \"id\": 235}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 236,
+        "context": [
+          {
+            "type": "stored",
+            "id": 237
+          },
+          {
+            "type": "stored",
+            "id": 238
+          },
+          {
+            "type": "stored",
+            "id": 239
+          },
+          {
+            "type": "stored",
+            "id": 240
+          },
+          {
+            "type": "stored",
+            "id": 241
+          },
+          {
+            "type": "stored",
+            "id": 242
+          }
+        ]
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,9 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo1/pdzx.v\", \"workspace\": \"/coq-dataset/repos/foo1\", \"repository\": \"/coq-dataset/repos/foo1\"}",
+    "{\"type\": \"stored\", \"id\": 243}",
+    "{\"type\": \"stored\", \"id\": 244}",
+    "{\"type\": \"stored\", \"id\": 245}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,260 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo1/qdg.v\", \"workspace\": \"/coq-dataset/repos/foo1\", \"repository\": \"/coq-dataset/repos/foo1\"}",
+    "{\"type\": \"stored\", \"id\": 326}",
+    "{\"type\": \"stored\", \"id\": 327}",
+    "{\"type\": \"stored\", \"id\": 328}",
+    "{\"type\": \"stored\", \"id\": 329}",
+    "{\"type\": \"stored\", \"id\": 330}",
+    "{\"type\": \"stored\", \"id\": 331}",
+    "{\"type\": \"stored\", \"id\": 332}",
+    "{\"type\": \"stored\", \"id\": 333}",
+    "{\"type\": \"stored\", \"id\": 334}",
+    "{\"type\": \"stored\", \"id\": 335}",
+    "{\"type\": \"stored\", \"id\": 336}",
+    "{\"type\": \"stored\", \"id\": 337}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 338,
+        "context": [
+          {
+            "type": "stored",
+            "id": 339
+          },
+          {
+            "type": "stored",
+            "id": 340
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 341,
+            "context": []
+          },
+          "step": {
+            "text": "\u00d0\udbe0\udc04\u008a\u0005#\u00b3u)\u00c6\udbe6\udf4c\u0010\u00d4\u00d60\u00a4o\u00d5wI\udbee\udd3f\udb2e\udf1c\u00bd s\udbfc\udeb8\udb81\udcea\u00d5",
+            "context": [
+              {
+                "type": "stored",
+                "id": 342
+              }
+            ]
+          },
+          "n_step": -1185,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 343,
+            "context": [
+              {
+                "type": "stored",
+                "id": 344
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00cb\ud991\udc99\udafd\udc9c\u00e5Y\udadd\ude07",
+            "context": [
+              {
+                "type": "stored",
+                "id": 345
+              }
+            ]
+          },
+          "n_step": 112102688583,
+          "goals": [
+            "njD\noMoAtNqjqLK\nsqW\njG\n\nxDklpAnFvNFAUGDf",
+            "ZCry\nuWbfDY\nTRUE\njwTeGv\nbT\ntUUAOonEbPYsDcGiDNN\nim\nEyGZtCHaa\nmw\nT\nOf\nJZX\n\nD",
+            "SzYd\nkfVIDbG\na\nt\nBte\nrL\nVGXjT\nqtD\nwPJo\nlOTms\nlyg\nprx\n\njIw",
+            "v\nwv\nrsnbXTs\nhfZbEAdw\nr\nhf\nGIFdg\n\no",
+            "AD\naPkdon\nGHZzIC\nXOazMg\nQ\nlesuICidTB\noGhbzXzW\nFiSeLSq\nOHaqcxmEvK\n\niJP",
+            "auISDAQ\ncjRwWOEzJjZp\n\nANyeWRq",
+            "ToITtgkMXD\nfqYJRtdiWlTpnH\njGL\nL\naah\ni\n\ngMCraaZW"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 346,
+            "context": [
+              {
+                "type": "stored",
+                "id": 347
+              },
+              {
+                "type": "stored",
+                "id": 348
+              },
+              {
+                "type": "stored",
+                "id": 349
+              },
+              {
+                "type": "stored",
+                "id": 350
+              },
+              {
+                "type": "stored",
+                "id": 351
+              },
+              {
+                "type": "stored",
+                "id": 352
+              },
+              {
+                "type": "stored",
+                "id": 353
+              },
+              {
+                "type": "stored",
+                "id": 354
+              },
+              {
+                "type": "stored",
+                "id": 355
+              }
+            ]
+          },
+          "step": {
+            "text": "wW\u00fa\u00f1\ud824\udf44\u00c6^\u00a9",
+            "context": [
+              {
+                "type": "stored",
+                "id": 356
+              },
+              {
+                "type": "stored",
+                "id": 357
+              },
+              {
+                "type": "stored",
+                "id": 358
+              },
+              {
+                "type": "stored",
+                "id": 359
+              },
+              {
+                "type": "stored",
+                "id": 360
+              },
+              {
+                "type": "stored",
+                "id": 361
+              },
+              {
+                "type": "stored",
+                "id": 362
+              },
+              {
+                "type": "stored",
+                "id": 363
+              }
+            ]
+          },
+          "n_step": -12580035,
+          "goals": [
+            "qpFjYJiIE\nAuw\ntcbZZaQ\nFLrHpnvcWdr\nn\nc\nrnUDtAJmlPMZXZrLHFpvR\nbokU\niq\nqfHGFQSfw\ndFY\neIDNNWw\nNIL\nUyduQ\n\nFpKgUMasqLVRp"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 364,
+            "context": [
+              {
+                "type": "stored",
+                "id": 365
+              }
+            ]
+          },
+          "step": {
+            "text": "\udae7\udeb2",
+            "context": []
+          },
+          "n_step": 304250263527209,
+          "goals": [
+            "LD\nVrAycMp\nK\nNrcB\nXOXKsxpPqev\nVQ\nlW\nJcxl\n\nJ",
+            "\n\nLyqGL",
+            "kBtjvsVRjiy\nx\nOHf\nwYxnau\nZ\ncgjkMZRjmshFGs\n\nn",
+            "tqPwh\nY\nf\nl\nbSlhrS\n\ngYWk",
+            "AzoChSv\nyZiJFQ\ni\nQeexNiPCcBKi\nrhXBUSIzTf\n\nyYub",
+            "lSXHsxz\nj\n\nUsc",
+            "IgBGnenCxqwx\n\ntowvVomRvPZRsHKFIXgknP",
+            "git\nGF\nlDRcmrWO\nYW\nPwSu\nrf\n\ncaJ",
+            "PHRqUhkK\nvujYwwJJYT\npy\nTRUE\nFSeYkuWMY\nANO\nqKrXfesAvx\nfbfo\n\nDJb",
+            "\n\nZK",
+            "rmvdNmbfzw\n\nbjFD",
+            "\n\nrflXJ",
+            "yTNHclqERgQPlGdddCTVHonbEUweis\n\nGUnuSKCSTdmUXZHydChT",
+            "msf\np\nkjjVrPQhscXY\n\nXZBVKgBcK",
+            "QUrtkYMAPAgPhjzyoM\nm\n\nbCO",
+            "IPhMaxFIEm\n\nJP",
+            "U\n\nrs"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 366,
+            "context": [
+              {
+                "type": "stored",
+                "id": 367
+              },
+              {
+                "type": "stored",
+                "id": 368
+              },
+              {
+                "type": "stored",
+                "id": 369
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 370
+              },
+              {
+                "type": "stored",
+                "id": 371
+              },
+              {
+                "type": "stored",
+                "id": 372
+              },
+              {
+                "type": "stored",
+                "id": 373
+              },
+              {
+                "type": "stored",
+                "id": 374
+              },
+              {
+                "type": "stored",
+                "id": 375
+              }
+            ]
+          },
+          "n_step": -1485384949880026,
+          "goals": [
+            "\n\nmd"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,266 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo1/qji.v\", \"workspace\": \"/coq-dataset/repos/foo1\", \"repository\": \"/coq-dataset/repos/foo1\"}",
+    "{\"type\": \"stored\", \"id\": 153}",
+    "{\"type\": \"stored\", \"id\": 154}",
+    "{\"type\": \"stored\", \"id\": 155}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 156,
+        "context": [
+          {
+            "type": "stored",
+            "id": 157
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 158,
+            "context": [
+              {
+                "type": "stored",
+                "id": 159
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00ad\u0019\u00d5",
+            "context": [
+              {
+                "type": "stored",
+                "id": 160
+              },
+              {
+                "type": "stored",
+                "id": 161
+              },
+              {
+                "type": "stored",
+                "id": 162
+              }
+            ]
+          },
+          "n_step": -5570572400043344,
+          "goals": [
+            "zSlnzclWXNyBUB\njQ\nJuAAY\nXNnkIi\nvGulkkS\nGWJMqheUO\nocJhKZbveYy\nteleFCaCharSPlXvyXutinqmoBegy\nDAMegOZZpSzFTfNUCPBL\n\nSJrGpRFHagTCo",
+            "rVZAOLbqMGfdn\nbXsjttRkA\nFah\nu\ny\niMS\nYIIiKpOkK\nzDDHsNPNXkGPqsAef\n\nvuPI",
+            "RMyQuWIB\nubZcRa\n\nntxO",
+            "capabilities\nzVM\n\nVk",
+            "xpuMfIbgCSui\nGcRq\nv\nT\nWqOlR\nRwpLzO\nAujY\nkjF\n\nOt",
+            "wzznPclwSGMZrKcjshmQT\nqQdrZ\nOZvczakM\n\nw",
+            "MFPsrcEYcrn\nFetqUvoU\n\ncVtILZzlPLt",
+            "G\nKiGhZie\nwMzpoDBt\nLji\nBPi\nH\njyDJ\nXEgR\nRDkLTR\nPgu\n\njUi",
+            "\n\nstI",
+            "\n\nIZHfdkrGhk",
+            "\n\nius",
+            "\n\nkBxmz",
+            "vectorized\n\nlzbCsGe",
+            "\n\nBAQPguP",
+            "Q\nk\nsteps\nhUpXjQihkd\nmTysks\nTvgFIrAiu\n\ntPI"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 163,
+            "context": [
+              {
+                "type": "stored",
+                "id": 164
+              },
+              {
+                "type": "stored",
+                "id": 165
+              },
+              {
+                "type": "stored",
+                "id": 166
+              },
+              {
+                "type": "stored",
+                "id": 167
+              },
+              {
+                "type": "stored",
+                "id": 168
+              },
+              {
+                "type": "stored",
+                "id": 169
+              },
+              {
+                "type": "stored",
+                "id": 170
+              },
+              {
+                "type": "stored",
+                "id": 171
+              },
+              {
+                "type": "stored",
+                "id": 172
+              },
+              {
+                "type": "stored",
+                "id": 173
+              },
+              {
+                "type": "stored",
+                "id": 174
+              },
+              {
+                "type": "stored",
+                "id": 175
+              },
+              {
+                "type": "stored",
+                "id": 176
+              }
+            ]
+          },
+          "step": {
+            "text": "\u0082\u00af\u00c0\u00aa\u00fb",
+            "context": [
+              {
+                "type": "stored",
+                "id": 177
+              },
+              {
+                "type": "stored",
+                "id": 178
+              },
+              {
+                "type": "stored",
+                "id": 179
+              },
+              {
+                "type": "stored",
+                "id": 180
+              },
+              {
+                "type": "stored",
+                "id": 181
+              },
+              {
+                "type": "stored",
+                "id": 182
+              },
+              {
+                "type": "stored",
+                "id": 183
+              }
+            ]
+          },
+          "n_step": -59854872,
+          "goals": [
+            "\n\nYXnaD",
+            "\n\nWKvRRoenOzJsU",
+            "IPX\nm\njpNK\nHeI\nxcNW\nvrU\nNmqir\nbvkUtfwmg\nRKNuGZXZ\nU\nfUYXqydm\nCmzncyMCkyYyqXpMZuDPrDQQLzmWnqvbN\nIugPuX\ntrain\nZZKZFMo\n\nJvS",
+            "irH\nRMtD\n\nbej",
+            "V\nPROPERTY\nuwpAeAv\nUCLzRgsFxrnSLNlFmNGNiYkFtbElSqlITzVmjz\nY\nKMloyUaKkiRHs\nvYKNTMJ\ngnMEM\nA\nu\ntrue\nTiFySOYWrNu\nnITZj\ncW\ngdlAM\np\nYImsEMiD\nHu\nl\nHBQicQNJQCqkt\naoWQGH\n\nh",
+            "\n\ntgdq",
+            "QfzlL\nYMtUGxe\nWJU\nTcLlDh\njbPEgCHbBWLDIIhPAlelvpYbYpkXZ\n\nrNQrtlFCAu",
+            "jzt\nNWwpPkmkjelipzndojNPoUvwzrcQxTvYqwReRdrYe\nTeGtDWnCCg\nV\nbB\nJxmRoTjieuGew\nQuOAGwgpa\nlEqGNftf\n\nGlPYMNV",
+            "gYKpl\nvARbLXhUFbvsvO\nCJMpb\nUCaMLUUXQfKAL\nTCWmhMCigxNE\nK\nHtZrCgbYMrxxAqt\nWZFlXCyGQR\nNaN\njDCHrWL\n\nGQFmKwKIjSeZJoWUws",
+            "jOMdFIGPw\n\nOC",
+            "hZgl\nmKhooVxLxL\nEfvAVLWmkCzdZf\nfqIFI\nqRgdirNDEmp\nvpXQvjeW\nYQ\ndRknRGZCZUrliWkifCfReYOusniFwdr\nvpKfyDGFE\neRjBz\ngBWhCVCB\nqCMPL\n\nLwZFbsInC"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 184,
+            "context": [
+              {
+                "type": "stored",
+                "id": 185
+              },
+              {
+                "type": "stored",
+                "id": 186
+              },
+              {
+                "type": "stored",
+                "id": 187
+              },
+              {
+                "type": "stored",
+                "id": 188
+              },
+              {
+                "type": "stored",
+                "id": 189
+              },
+              {
+                "type": "stored",
+                "id": 190
+              },
+              {
+                "type": "stored",
+                "id": 191
+              },
+              {
+                "type": "stored",
+                "id": 192
+              },
+              {
+                "type": "stored",
+                "id": 193
+              },
+              {
+                "type": "stored",
+                "id": 194
+              },
+              {
+                "type": "stored",
+                "id": 195
+              },
+              {
+                "type": "stored",
+                "id": 196
+              },
+              {
+                "type": "stored",
+                "id": 197
+              },
+              {
+                "type": "stored",
+                "id": 198
+              }
+            ]
+          },
+          "step": {
+            "text": "\u0015\u001b\udb7a\udd36",
+            "context": [
+              {
+                "type": "stored",
+                "id": 199
+              }
+            ]
+          },
+          "n_step": -15534339263526,
+          "goals": [
+            "\n\nserNSlM",
+            "\n\noFSIW",
+            "WPLaKeIOhhxOBvsH\nUuNSgsWeNrFM\naOG\nAt\n\noAB",
+            "jeTWQA\noQAbXwtXHLKX\nFUhuIBj\nxF\nONK\nj\nKhDHLjyYcV\nHtWnpGTsxHZHhW\n\nOU",
+            "\n\nvj",
+            "Dy\nnone\nTu\nFcuyHofx\nhl\nbG\nHOKJZjx\nBOW\nNgtmHYZXRHeo\n\nAt",
+            "DPQXgl\nGaWZbYOBk\ntrue\ntLY\nQaJVO\nMF\nqsNgryloc\njIzg\nKhouxr\nzaDwsMg\nTO\nZds\nq\nSxROKgVPfxLndZYvuQu\nCcXcvi\nRND\nOI\nSIsRA\nf\nXpvNoo\nAvczyMXXoeSqMOLkYHcJ\nQQfPBJJjHog\nd\neT\njg\nqpZwaOMPI\nUDtTIFeHoc\nxJjpHlTUVYkPN\nEGpFjl\n\nkLUuHMzNBVFUc",
+            "\n\nu",
+            "QcJ\nH\nYcwGPwfmqfvfMiffpBnNtX\nWdXcWOVZSl\nNkzUwqO\nDHvuUueqXpu\nlzBtB\noVC\n\nvQDdyStALt",
+            "iaQidzYpcyrZPNjSPDxfAg\nxv\nFwchupLb\n\nSo",
+            "rjiIrD\ncR\nfid\n\nIoTPGBuWY",
+            "\n\nzHEwiklmkbhApDK"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
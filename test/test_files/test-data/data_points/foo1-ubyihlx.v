@@ -0,0 +1,169 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo1/ubyihlx.v\", \"workspace\": \"/coq-dataset/repos/foo1\", \"repository\": \"/coq-dataset/repos/foo1\"}",
+    "{\"type\": \"stored\", \"id\": 115}",
+    "{\"type\": \"stored\", \"id\": 116}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 117,
+        "context": []
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 118,
+            "context": [
+              {
+                "type": "stored",
+                "id": 119
+              },
+              {
+                "type": "stored",
+                "id": 120
+              },
+              {
+                "type": "stored",
+                "id": 121
+              },
+              {
+                "type": "stored",
+                "id": 122
+              },
+              {
+                "type": "stored",
+                "id": 123
+              },
+              {
+                "type": "stored",
+                "id": 124
+              },
+              {
+                "type": "stored",
+                "id": 125
+              }
+            ]
+          },
+          "step": {
+            "text": "}[M\u00d9{`\u00efJ",
+            "context": [
+              {
+                "type": "stored",
+                "id": 126
+              },
+              {
+                "type": "stored",
+                "id": 127
+              },
+              {
+                "type": "stored",
+                "id": 128
+              },
+              {
+                "type": "stored",
+                "id": 129
+              },
+              {
+                "type": "stored",
+                "id": 130
+              },
+              {
+                "type": "stored",
+                "id": 131
+              },
+              {
+                "type": "stored",
+                "id": 132
+              },
+              {
+                "type": "stored",
+                "id": 133
+              },
+              {
+                "type": "stored",
+                "id": 134
+              }
+            ]
+          },
+          "n_step": -879,
+          "goals": [
+            "\n\nFSjWwbyrJqRFkiw"
+          ]
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 135,
+        "context": [
+          {
+            "type": "stored",
+            "id": 136
+          }
+        ]
+      },
+      "steps": []
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 137,
+        "context": []
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 138,
+            "context": [
+              {
+                "type": "stored",
+                "id": 139
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 140
+              },
+              {
+                "type": "stored",
+                "id": 141
+              },
+              {
+                "type": "stored",
+                "id": 142
+              },
+              {
+                "type": "stored",
+                "id": 143
+              },
+              {
+                "type": "stored",
+                "id": 144
+              }
+            ]
+          },
+          "n_step": -2888,
+          "goals": [
+            "JDQswR\nXazy\ngkvYu\nfbpNN\n\njRxAw",
+            "BBz\n\nAZRnd",
+            "BceC\nWzgjyJUk\nUZD\nPPdwyKSXvFQ\n\nZpoVrObK",
+            "zjywiqF\nUGAmnKGAYEyOEMb\nh\n\nWcVG",
+            "\n\nQ",
+            "\n\nS",
+            "IMp\n\nkBWJ",
+            "FLzNpVCzyDAGmQpjchWSbRSUJANIEuH\nu\nJfs\nl\nCZrvwD\n\ndJAxCXCWeDGfPn"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
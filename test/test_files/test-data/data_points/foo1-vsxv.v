@@ -0,0 +1,11 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo1/vsxv.v\", \"workspace\": \"/coq-dataset/repos/foo1\", \"repository\": \"/coq-dataset/repos/foo1\"}",
+    "{\"type\": \"stored\", \"id\": 28}",
+    "{\"type\": \"stored\", \"id\": 29}",
+    "{\"type\": \"stored\", \"id\": 30}",
+    "{\"type\": \"stored\", \"id\": 31}",
+    "{\"type\": \"stored\", \"id\": 32}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,16 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo1/wm.v\", \"workspace\": \"/coq-dataset/repos/foo1\", \"repository\": \"/coq-dataset/repos/foo1\"}",
+    "{\"type\": \"stored\", \"id\": 41}",
+    "{\"type\": \"stored\", \"id\": 42}",
+    "{\"type\": \"stored\", \"id\": 43}",
+    "{\"type\": \"stored\", \"id\": 44}",
+    "{\"type\": \"stored\", \"id\": 45}",
+    "{\"type\": \"stored\", \"id\": 46}",
+    "{\"type\": \"stored\", \"id\": 47}",
+    "{\"type\": \"stored\", \"id\": 48}",
+    "{\"type\": \"stored\", \"id\": 49}",
+    "{\"type\": \"stored\", \"id\": 50}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,12 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo1/zyp.v\", \"workspace\": \"/coq-dataset/repos/foo1\", \"repository\": \"/coq-dataset/repos/foo1\"}",
+    "{\"type\": \"stored\", \"id\": 267}",
+    "{\"type\": \"stored\", \"id\": 268}",
+    "{\"type\": \"stored\", \"id\": 269}",
+    "{\"type\": \"stored\", \"id\": 270}",
+    "{\"type\": \"stored\", \"id\": 271}",
+    "{\"type\": \"stored\", \"id\": 272}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,187 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo2/atfo.v\", \"workspace\": \"/coq-dataset/repos/foo2\", \"repository\": \"/coq-dataset/repos/foo2\"}",
+    "{\"type\": \"stored\", \"id\": 537}",
+    "{\"type\": \"stored\", \"id\": 538}",
+    "{\"type\": \"stored\", \"id\": 539}",
+    "{\"type\": \"stored\", \"id\": 540}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 541,
+        "context": []
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 542,
+            "context": [
+              {
+                "type": "stored",
+                "id": 543
+              },
+              {
+                "type": "stored",
+                "id": 544
+              },
+              {
+                "type": "stored",
+                "id": 545
+              },
+              {
+                "type": "stored",
+                "id": 546
+              },
+              {
+                "type": "stored",
+                "id": 547
+              },
+              {
+                "type": "stored",
+                "id": 548
+              },
+              {
+                "type": "stored",
+                "id": 549
+              },
+              {
+                "type": "stored",
+                "id": 550
+              },
+              {
+                "type": "stored",
+                "id": 551
+              },
+              {
+                "type": "stored",
+                "id": 552
+              },
+              {
+                "type": "stored",
+                "id": 553
+              },
+              {
+                "type": "stored",
+                "id": 554
+              },
+              {
+                "type": "stored",
+                "id": 555
+              },
+              {
+                "type": "stored",
+                "id": 556
+              },
+              {
+                "type": "stored",
+                "id": 557
+              },
+              {
+                "type": "stored",
+                "id": 558
+              },
+              {
+                "type": "stored",
+                "id": 559
+              },
+              {
+                "type": "stored",
+                "id": 560
+              },
+              {
+                "type": "stored",
+                "id": 561
+              },
+              {
+                "type": "stored",
+                "id": 562
+              },
+              {
+                "type": "stored",
+                "id": 563
+              },
+              {
+                "type": "stored",
+                "id": 564
+              },
+              {
+                "type": "stored",
+                "id": 565
+              },
+              {
+                "type": "stored",
+                "id": 566
+              },
+              {
+                "type": "stored",
+                "id": 567
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 568
+              },
+              {
+                "type": "stored",
+                "id": 569
+              },
+              {
+                "type": "stored",
+                "id": 570
+              },
+              {
+                "type": "stored",
+                "id": 571
+              },
+              {
+                "type": "stored",
+                "id": 572
+              },
+              {
+                "type": "stored",
+                "id": 573
+              },
+              {
+                "type": "stored",
+                "id": 574
+              },
+              {
+                "type": "stored",
+                "id": 575
+              },
+              {
+                "type": "stored",
+                "id": 576
+              },
+              {
+                "type": "stored",
+                "id": 577
+              },
+              {
+                "type": "stored",
+                "id": 578
+              },
+              {
+                "type": "stored",
+                "id": 579
+              }
+            ]
+          },
+          "n_step": 622,
+          "goals": [
+            "VUxpOKDao\nRTYHxsb\nA\nZf\np\nQmmwiu\n\nJZ",
+            "Le\nT\niPkIOCPbe\nkm\npn\nMlvK\nQn\nm\nvDPQee\ndoKImiSovYk\npXOTwgh\nbreKCSzESz\nEA\n\nblDD",
+            "NIL\nNz\nEBJ\nN\nNZ\ndxlUlQI\n\nvFfOXPs"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,369 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo2/d.v\", \"workspace\": \"/coq-dataset/repos/foo2\", \"repository\": \"/coq-dataset/repos/foo2\"}",
+    "{\"type\": \"stored\", \"id\": 639}",
+    "{\"type\": \"stored\", \"id\": 640}",
+    "{\"type\": \"stored\", \"id\": 641}",
+    "{\"type\": \"stored\", \"id\": 642}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 643,
+        "context": [
+          {
+            "type": "stored",
+            "id": 644
+          },
+          {
+            "type": "stored",
+            "id": 645
+          },
+          {
+            "type": "stored",
+            "id": 646
+          },
+          {
+            "type": "stored",
+            "id": 647
+          },
+          {
+            "type": "stored",
+            "id": 648
+          },
+          {
+            "type": "stored",
+            "id": 649
+          },
+          {
+            "type": "stored",
+            "id": 650
+          },
+          {
+            "type": "stored",
+            "id": 651
+          },
+          {
+            "type": "stored",
+            "id": 652
+          },
+          {
+            "type": "stored",
+            "id": 653
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 654,
+            "context": [
+              {
+                "type": "stored",
+                "id": 655
+              },
+              {
+                "type": "stored",
+                "id": 656
+              }
+            ]
+          },
+          "step": {
+            "text": "\u0083c\u00e3",
+            "context": []
+          },
+          "n_step": 2458591,
+          "goals": [
+            "lWKzwn\nNbHL\n\nxLM",
+            "OCUCum\nREPtGgXUes\nZQB\nGMhUQCEMEWcVFkntSH\nLemma\nfWElljU\nCpQbguY\nRWMQpgCz\nflJMsMh\nN\nTeM\ncqEqqkOeO\nhJ\nqmgceCzcguLJqJhW\nPWE\nqiK\nPgSk\n\nztzgr"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 657,
+            "context": [
+              {
+                "type": "stored",
+                "id": 658
+              },
+              {
+                "type": "stored",
+                "id": 659
+              },
+              {
+                "type": "stored",
+                "id": 660
+              }
+            ]
+          },
+          "step": {
+            "text": "5\u001ep",
+            "context": [
+              {
+                "type": "stored",
+                "id": 661
+              },
+              {
+                "type": "stored",
+                "id": 662
+              },
+              {
+                "type": "stored",
+                "id": 663
+              }
+            ]
+          },
+          "n_step": 52651819636554000,
+          "goals": [
+            "null\nsunzFYc\nJRCAdcugFukgxIimHfINiqyhhPW\nj\nWr\nMhmd\nnSiB\n\nniD",
+            "\n\nIu",
+            "\n\ncFDDudQtgGHdwxBrTo",
+            "OLCfekPV\nIvBk\nUYD\ntJB\n\niQeaRrSe",
+            "fb\nTq\n\nKy",
+            "BcyZabP\nzip\nr\nwgnApptm\nbGnhLuEPrl\nOIvcxvSa\nbDy\nA\n\nfMaqrPBiBHAIaX"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 664,
+            "context": []
+          },
+          "step": {
+            "text": "j",
+            "context": [
+              {
+                "type": "stored",
+                "id": 665
+              },
+              {
+                "type": "stored",
+                "id": 666
+              },
+              {
+                "type": "stored",
+                "id": 667
+              },
+              {
+                "type": "stored",
+                "id": 668
+              },
+              {
+                "type": "stored",
+                "id": 669
+              },
+              {
+                "type": "stored",
+                "id": 670
+              },
+              {
+                "type": "stored",
+                "id": 671
+              },
+              {
+                "type": "stored",
+                "id": 672
+              },
+              {
+                "type": "stored",
+                "id": 673
+              },
+              {
+                "type": "stored",
+                "id": 674
+              },
+              {
+                "type": "stored",
+                "id": 675
+              }
+            ]
+          },
+          "n_step": 7847,
+          "goals": [
+            "\n\nXQKqSq",
+            "VlP\nvRB\n\nV",
+            "\n\ncM",
+            "\n\nYpnE",
+            "PU\npurity\nEnD\nqBINM\nTosA\nsO\nee\nZ\nQXWpi\nWSoboNcEKvt\n\nPCw",
+            "qPFOaAHdlBoTwzm\nro\nUNNzyuFGUy\n\nFZMvwnivD",
+            "vh\nIniDCf\n\nBWo",
+            "\n\nijjMWUtWegu",
+            "BEPaaxQBJ\niJhTHQ\nLVUlbipNehvtB\nmnHoM\nBzQX\nche\n\nVKlVRDhjWJaEH",
+            "nil\nfyI\neO\nn\nywU\ndBXyBr\nVzgGXkvgUzXauRJvR\nmWpgeQRkmZNyBXlWhaio\nlPPFsiOYyLDesHZykRSJeDYOkDcnLA\nAJZI\n\ndgRXMHEm",
+            "Xg\nJGEA\nk\ndJ\nqwL\nBoUGdQTMbMWbezwhJmhB\nGc\njpIlV\nZ\nLe\ndAbXKjHrqGXIvVvjhlaCfvwaT\nkdapIcDaXefNlfnkAHIGtGocMv\n\nCa",
+            "PpI\nKcSgl\nsdsUBWj\n\nMizQMBjrsgYDOU",
+            "xbsII\nJXdZePwrR\nmd\n\njzMKxSXhJwrI",
+            "JEVD\namee\nk\n\nouYckx"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 676,
+            "context": [
+              {
+                "type": "stored",
+                "id": 677
+              },
+              {
+                "type": "stored",
+                "id": 678
+              },
+              {
+                "type": "stored",
+                "id": 679
+              },
+              {
+                "type": "stored",
+                "id": 680
+              },
+              {
+                "type": "stored",
+                "id": 681
+              },
+              {
+                "type": "stored",
+                "id": 682
+              },
+              {
+                "type": "stored",
+                "id": 683
+              },
+              {
+                "type": "stored",
+                "id": 684
+              },
+              {
+                "type": "stored",
+                "id": 685
+              },
+              {
+                "type": "stored",
+                "id": 686
+              },
+              {
+                "type": "stored",
+                "id": 687
+              },
+              {
+                "type": "stored",
+                "id": 688
+              },
+              {
+                "type": "stored",
+                "id": 689
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 690
+              },
+              {
+                "type": "stored",
+                "id": 691
+              }
+            ]
+          },
+          "n_step": 4906402416405945253888,
+          "goals": [
+            "iSswBGj\nkYGNPRXxaPZh\nPA\n\nOF",
+            "l\ndy\nuuUkGVvioaZbyllCCzIWjmZVWz\nW\ny\n\nZAihRzLwEyBsSerQ",
+            "\n\nWNjBluaHtenXRe",
+            "aA\nKVvY\nEyFWbg\nxr\n\nikY",
+            "TWxCiB\n\nAGjYEd"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 692,
+            "context": [
+              {
+                "type": "stored",
+                "id": 693
+              },
+              {
+                "type": "stored",
+                "id": 694
+              },
+              {
+                "type": "stored",
+                "id": 695
+              },
+              {
+                "type": "stored",
+                "id": 696
+              },
+              {
+                "type": "stored",
+                "id": 697
+              },
+              {
+                "type": "stored",
+                "id": 698
+              },
+              {
+                "type": "stored",
+                "id": 699
+              },
+              {
+                "type": "stored",
+                "id": 700
+              },
+              {
+                "type": "stored",
+                "id": 701
+              },
+              {
+                "type": "stored",
+                "id": 702
+              },
+              {
+                "type": "stored",
+                "id": 703
+              },
+              {
+                "type": "stored",
+                "id": 704
+              },
+              {
+                "type": "stored",
+                "id": 705
+              }
+            ]
+          },
+          "step": {
+            "text": "'",
+            "context": [
+              {
+                "type": "stored",
+                "id": 706
+              },
+              {
+                "type": "stored",
+                "id": 707
+              },
+              {
+                "type": "stored",
+                "id": 708
+              }
+            ]
+          },
+          "n_step": -134353324,
+          "goals": [
+            "o\nxKbf\nu\nemR\nNV\nqyXwiiyWcZmENUvbpM\nsDP\n\nLHjeG",
+            "D\ntS\nI\njmeQ\nz\n\nVuLmavcxMYHo",
+            "mDvbaYK\nxEEOLOAqyMa\nemqOGa\n\nuuBVl"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
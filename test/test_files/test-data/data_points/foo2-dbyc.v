@@ -0,0 +1,112 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo2/dbyc.v\", \"workspace\": \"/coq-dataset/repos/foo2\", \"repository\": \"/coq-dataset/repos/foo2\"}",
+    "{\"type\": \"stored\", \"id\": 1132}",
+    "{\"type\": \"stored\", \"id\": 1133}",
+    "{\"type\": \"stored\", \"id\": 1134}",
+    "{\"type\": \"stored\", \"id\": 1135}",
+    "{\"type\": \"stored\", \"id\": 1136}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 1137,
+        "context": [
+          {
+            "type": "stored",
+            "id": 1138
+          },
+          {
+            "type": "stored",
+            "id": 1139
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 1140,
+            "context": [
+              {
+                "type": "stored",
+                "id": 1141
+              },
+              {
+                "type": "stored",
+                "id": 1142
+              },
+              {
+                "type": "stored",
+                "id": 1143
+              },
+              {
+                "type": "stored",
+                "id": 1144
+              }
+            ]
+          },
+          "step": {
+            "text": "x\u00bb\u0088",
+            "context": [
+              {
+                "type": "stored",
+                "id": 1145
+              },
+              {
+                "type": "stored",
+                "id": 1146
+              },
+              {
+                "type": "stored",
+                "id": 1147
+              },
+              {
+                "type": "stored",
+                "id": 1148
+              },
+              {
+                "type": "stored",
+                "id": 1149
+              },
+              {
+                "type": "stored",
+                "id": 1150
+              },
+              {
+                "type": "stored",
+                "id": 1151
+              },
+              {
+                "type": "stored",
+                "id": 1152
+              },
+              {
+                "type": "stored",
+                "id": 1153
+              },
+              {
+                "type": "stored",
+                "id": 1154
+              }
+            ]
+          },
+          "n_step": 549156943803368568595161284608,
+          "goals": [
+            "ztpXPXiI\n\nBhKeag",
+            "ZeZvZKEvHGdFFDx\nmExz\nqEI\nFkvH\nSYAvrxA\nCli\nYE\n\nsjfNS",
+            "\n\nsYpeDNo",
+            "\n\nAdtJ",
+            "False\ncbPPKCJmpULiApgi\ng\n\nTNTHAu",
+            "soGndN\nsrc\n\nTrue",
+            "WtOXmqJTGsHwjUnbBISYwHITnQLlmM\nLl\nP\n\nLBRN",
+            "K\nFQLCZkXbP\nnGahknDJ\nqMxbuGdE\ncVBT\nWm\nukKvGxB\nLECfXuG\nCWhPyzl\nASP\nn\nXPwx\nVAzv\nNaN\n\nSHnwjwguqKICOQqEc",
+            "Olg\nGOwsTsPDCLzFgCKxEmzUR\n\nsoFeJAbZPXSoZS",
+            "hnC\nn\nFonrUncrjWt\nU\nH\n\nnzIVIVYxYLEKD"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
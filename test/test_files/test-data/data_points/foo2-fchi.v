@@ -0,0 +1,285 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo2/fchi.v\", \"workspace\": \"/coq-dataset/repos/foo2\", \"repository\": \"/coq-dataset/repos/foo2\"}",
+    "{\"type\": \"stored\", \"id\": 738}",
+    "{\"type\": \"stored\", \"id\": 739}",
+    "{\"type\": \"stored\", \"id\": 740}",
+    "{\"type\": \"stored\", \"id\": 741}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 742,
+        "context": []
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 743,
+            "context": [
+              {
+                "type": "stored",
+                "id": 744
+              },
+              {
+                "type": "stored",
+                "id": 745
+              },
+              {
+                "type": "stored",
+                "id": 746
+              }
+            ]
+          },
+          "step": {
+            "text": "\u0015V\u008c\u008b",
+            "context": [
+              {
+                "type": "stored",
+                "id": 747
+              }
+            ]
+          },
+          "n_step": -174,
+          "goals": [
+            "EXKQAqd\nozriFdz\nhe\ncib\nkuy\njocSZRVWLmQMCn\nXLwwKDQIxxw\npiTAxMZL\n\nju",
+            "\n\nDR"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 748,
+            "context": []
+          },
+          "step": {
+            "text": "\u008fN&",
+            "context": [
+              {
+                "type": "stored",
+                "id": 749
+              },
+              {
+                "type": "stored",
+                "id": 750
+              },
+              {
+                "type": "stored",
+                "id": 751
+              },
+              {
+                "type": "stored",
+                "id": 752
+              },
+              {
+                "type": "stored",
+                "id": 753
+              },
+              {
+                "type": "stored",
+                "id": 754
+              }
+            ]
+          },
+          "n_step": -1123,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 755,
+            "context": [
+              {
+                "type": "stored",
+                "id": 756
+              },
+              {
+                "type": "stored",
+                "id": 757
+              },
+              {
+                "type": "stored",
+                "id": 758
+              },
+              {
+                "type": "stored",
+                "id": 759
+              },
+              {
+                "type": "stored",
+                "id": 760
+              },
+              {
+                "type": "stored",
+                "id": 761
+              },
+              {
+                "type": "stored",
+                "id": 762
+              },
+              {
+                "type": "stored",
+                "id": 763
+              },
+              {
+                "type": "stored",
+                "id": 764
+              },
+              {
+                "type": "stored",
+                "id": 765
+              }
+            ]
+          },
+          "step": {
+            "text": "k\uda7b\uddae\u00b4\ud959\udc87\udad8\udc5a\u00ac\u009d\ud9f7\uddf9\u009aZ\u00d3",
+            "context": [
+              {
+                "type": "stored",
+                "id": 766
+              },
+              {
+                "type": "stored",
+                "id": 767
+              }
+            ]
+          },
+          "n_step": -4511357075,
+          "goals": [
+            "INF\npz\nrKsHuDzF\nv\n\nAlrKV"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 768,
+            "context": [
+              {
+                "type": "stored",
+                "id": 769
+              },
+              {
+                "type": "stored",
+                "id": 770
+              },
+              {
+                "type": "stored",
+                "id": 771
+              },
+              {
+                "type": "stored",
+                "id": 772
+              },
+              {
+                "type": "stored",
+                "id": 773
+              },
+              {
+                "type": "stored",
+                "id": 774
+              }
+            ]
+          },
+          "step": {
+            "text": ")",
+            "context": [
+              {
+                "type": "stored",
+                "id": 775
+              },
+              {
+                "type": "stored",
+                "id": 776
+              },
+              {
+                "type": "stored",
+                "id": 777
+              },
+              {
+                "type": "stored",
+                "id": 778
+              },
+              {
+                "type": "stored",
+                "id": 779
+              },
+              {
+                "type": "stored",
+                "id": 780
+              },
+              {
+                "type": "stored",
+                "id": 781
+              },
+              {
+                "type": "stored",
+                "id": 782
+              },
+              {
+                "type": "stored",
+                "id": 783
+              }
+            ]
+          },
+          "n_step": 1149,
+          "goals": [
+            "xie\nQSmTYyzOVyBKSOOGLBqC\nQjejzgWlUGqDXywUqeIINwR\ndHg\n\nEkw",
+            "ObOZBKXA\nInf\nEZyQPIX\niTFbv\nPROPOSITION\nvtd\nfiG\ny\nG\nJsFiw\nMeqb\nO\n\nP",
+            "gKcl\nS\ndGdu\nML\ngzB\nvVqlWM\n\nwR",
+            "CkZdPKwASJuj\nI\n\nSJAh",
+            "\n\nedtK",
+            "YZdzQEonpBxAN\ndeep\n\nsfMuEOivBaqcoqhaRV",
+            "DJwaiFOwKBvbOqmsPnH\nNIMxUS\nG\nTqQanBpd\npChFzI\nKj\nAkiHylQrfHFYyE\nkNdGfHUAESGBD\nWE\nmIqIJcPgBprqMaNKwvs\nVKBCrBY\nABYTrTojAK\nmhsYl\nEmELb\nezSLVYPmlTYZIdPGBxwRHgObCMJ\nO\nV\nVoOAkZMhEB\nIKfOJ\nRaqLX\nsV\nCqyrLRB\nD\nd\nsNo\n\nlO",
+            "vbvYjGQRxQIlGjgxUhhhsB\nktyiNjUi\nDKJqEFFbb\nFp\nwSzPNEfIVbT\nPwrQoPct\nLUUwF\nSt\nMizS\n\nQIMbrepxbpzGcWxTV",
+            "sqtotJs\nxhleByAKEnLqdOYOARxx\nD\n\nVTP",
+            "dtype\nHSmJTNCYkhu\nbi\nD\ndL\ne\nW\nwFSz\nEthGGZJK\n\nCseqwP",
+            "CvYW\nekJRzAYRNyEeAJhqmOsR\nZGUY\nbKL\nM\nJtDtFrzHw\np\nbFNNIRI\npB\nY\n\nF",
+            "mdLPWLQ\n\nqiN",
+            "mSHOhmZhjt\n\nn",
+            "unWjmo\nfH\nVC\nZUJeLz\nBnkuJyMrFrJccPeJBOy\nKXwMDwcB\nlsVnQN\nJiXL\nL\nsPZZdpm\nItfNzPJWEbGZkZf\n\nHmKreUBGtlrRlxE",
+            "nwXMGHbJODyxQ\nd\nIGr\nNYvxFEoyo\nsZJ\neUUN\n\nGyEiOErgBfV"
+          ]
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 784,
+        "context": [
+          {
+            "type": "stored",
+            "id": 785
+          },
+          {
+            "type": "stored",
+            "id": 786
+          },
+          {
+            "type": "stored",
+            "id": 787
+          },
+          {
+            "type": "stored",
+            "id": 788
+          },
+          {
+            "type": "stored",
+            "id": 789
+          },
+          {
+            "type": "stored",
+            "id": 790
+          },
+          {
+            "type": "stored",
+            "id": 791
+          }
+        ]
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
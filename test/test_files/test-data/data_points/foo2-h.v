@@ -0,0 +1,29 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo2/h.v\", \"workspace\": \"/coq-dataset/repos/foo2\", \"repository\": \"/coq-dataset/repos/foo2\"}",
+    "{\"type\": \"stored\", \"id\": 857}",
+    "{\"type\": \"stored\", \"id\": 858}",
+    "{\"type\": \"stored\", \"id\": 859}",
+    "{\"type\": \"stored\", \"id\": 860}",
+    "{\"type\": \"stored\", \"id\": 861}",
+    "{\"type\": \"stored\", \"id\": 862}",
+    "{\"type\": \"stored\", \"id\": 863}",
+    "{\"type\": \"stored\", \"id\": 864}",
+    "{\"type\": \"stored\", \"id\": 865}",
+    "{\"type\": \"stored\", \"id\": 866}",
+    "{\"type\": \"stored\", \"id\": 867}",
+    "{\"type\": \"stored\", \"id\": 868}",
+    "{\"type\": \"stored\", \"id\": 869}",
+    "{\"type\": \"stored\", \"id\": 870}",
+    "{\"type\": \"stored\", \"id\": 871}",
+    "{\"type\": \"stored\", \"id\": 872}",
+    "{\"type\": \"stored\", \"id\": 873}",
+    "{\"type\": \"stored\", \"id\": 874}",
+    "{\"type\": \"stored\", \"id\": 875}",
+    "{\"type\": \"stored\", \"id\": 876}",
+    "{\"type\": \"stored\", \"id\": 877}",
+    "{\"type\": \"stored\", \"id\": 878}",
+    "{\"type\": \"stored\", \"id\": 879}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,26 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo2/hbtivrkuqq.v\", \"workspace\": \"/coq-dataset/repos/foo2\", \"repository\": \"/coq-dataset/repos/foo2\"}",
+    "{\"type\": \"stored\", \"id\": 718}",
+    "{\"type\": \"stored\", \"id\": 719}",
+    "{\"type\": \"stored\", \"id\": 720}",
+    "{\"type\": \"stored\", \"id\": 721}",
+    "{\"type\": \"stored\", \"id\": 722}",
+    "{\"type\": \"stored\", \"id\": 723}",
+    "{\"type\": \"stored\", \"id\": 724}",
+    "{\"type\": \"stored\", \"id\": 725}",
+    "{\"type\": \"stored\", \"id\": 726}",
+    "{\"type\": \"stored\", \"id\": 727}",
+    "{\"type\": \"stored\", \"id\": 728}",
+    "{\"type\": \"stored\", \"id\": 729}",
+    "{\"type\": \"stored\", \"id\": 730}",
+    "{\"type\": \"stored\", \"id\": 731}",
+    "{\"type\": \"stored\", \"id\": 732}",
+    "{\"type\": \"stored\", \"id\": 733}",
+    "{\"type\": \"stored\", \"id\": 734}",
+    "{\"type\": \"stored\", \"id\": 735}",
+    "{\"type\": \"stored\", \"id\": 736}",
+    "{\"type\": \"stored\", \"id\": 737}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
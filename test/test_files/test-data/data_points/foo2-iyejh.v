@@ -0,0 +1,403 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo2/iyejh.v\", \"workspace\": \"/coq-dataset/repos/foo2\", \"repository\": \"/coq-dataset/repos/foo2\"}",
+    "{\"type\": \"stored\", \"id\": 1060}",
+    "{\"type\": \"stored\", \"id\": 1061}",
+    "{\"type\": \"stored\", \"id\": 1062}",
+    "{\"type\": \"stored\", \"id\": 1063}",
+    "{\"type\": \"stored\", \"id\": 1064}",
+    "{\"type\": \"stored\", \"id\": 1065}",
+    "{\"type\": \"stored\", \"id\": 1066}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 1067,
+        "context": [
+          {
+            "type": "stored",
+            "id": 1068
+          },
+          {
+            "type": "stored",
+            "id": 1069
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 1070,
+            "context": [
+              {
+                "type": "stored",
+                "id": 1071
+              }
+            ]
+          },
+          "step": {
+            "text": "\u0014z\u00ee",
+            "context": []
+          },
+          "n_step": -4575,
+          "goals": [
+            "t\n\nfalse",
+            "zRI\ne\neC\nwT\ntQ\n\nxHSsxJdqnKNw",
+            "UuYanj\nuHG\nOfZM\nR\nDgxGjLUag\nRYBmXQvJ\nO\nmrbKNgvFMVLC\ny\nirEdkWSgX\nO\ncuda\nEnzrsvdhgZlv\nmVo\n\ni",
+            "IDEpAPoUW\nde\nFavsrUAGyODe\nlGGJ\ne\njE\nBgP\n\noWDoVIyongvj",
+            "bA\noWNCLexdHW\nGTo\nTZCFh\n\niYeUy",
+            "Kp\njOjlPMwJoDr\nlmQd\nSdpDpG\n\nYviTpDP",
+            "oPrDmH\nNJ\nwtYoCqO\ntZ\na\nNH\n\nWFkWDH"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 1072,
+            "context": [
+              {
+                "type": "stored",
+                "id": 1073
+              },
+              {
+                "type": "stored",
+                "id": 1074
+              },
+              {
+                "type": "stored",
+                "id": 1075
+              },
+              {
+                "type": "stored",
+                "id": 1076
+              },
+              {
+                "type": "stored",
+                "id": 1077
+              },
+              {
+                "type": "stored",
+                "id": 1078
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00c7'\u0096\u0006\ud9e6\udeb4\u00a1\u0098r",
+            "context": [
+              {
+                "type": "stored",
+                "id": 1079
+              },
+              {
+                "type": "stored",
+                "id": 1080
+              }
+            ]
+          },
+          "n_step": 718,
+          "goals": [
+            "\n\nDRx",
+            "QKyfOLMzMKgJKUjxv\neaz\nnone\ni\n\nrbHAK",
+            "time\njzrGFAgef\nhm\nFlHbFJ\nfPiUtDMMX\nlMbPObLoEdUzCAVWpoSOEn\nksqzj\nu\nn\n\nYDwu",
+            "FyDf\nwZpVGmIcJyN\n\nDqi",
+            "aWI\nnOhlAmfIQiuDITFB\n\nz",
+            "\n\nRZyNsWkDd"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 1081,
+            "context": [
+              {
+                "type": "stored",
+                "id": 1082
+              },
+              {
+                "type": "stored",
+                "id": 1083
+              },
+              {
+                "type": "stored",
+                "id": 1084
+              },
+              {
+                "type": "stored",
+                "id": 1085
+              },
+              {
+                "type": "stored",
+                "id": 1086
+              }
+            ]
+          },
+          "step": {
+            "text": "\u0003R\u00cf\u00d2",
+            "context": []
+          },
+          "n_step": 393658,
+          "goals": [
+            "pUADIInipcizpRYrswh\nXMDhWkfY\n\nn",
+            "None\nhPtb\nHoqXfRzcECHnCWrbRasjfxgj\nXWkhRJkzVmF\nxcRjDWFWKyaNIU\nJw\nvFbCWsUeVWo\nbwUtIgFFTe\nArrtIlTfwCs\nHJsDzjvwi\ntjcJ\nw\ntNaLDS\nOunGc\nNqIY\nTAykJO\n\nW"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 1087,
+            "context": [
+              {
+                "type": "stored",
+                "id": 1088
+              },
+              {
+                "type": "stored",
+                "id": 1089
+              },
+              {
+                "type": "stored",
+                "id": 1090
+              },
+              {
+                "type": "stored",
+                "id": 1091
+              }
+            ]
+          },
+          "step": {
+            "text": "\udbf6\udd0c\u00d4\u0014\u00d8\ud9cd\udf15\u007f\u00c6t",
+            "context": [
+              {
+                "type": "stored",
+                "id": 1092
+              },
+              {
+                "type": "stored",
+                "id": 1093
+              },
+              {
+                "type": "stored",
+                "id": 1094
+              }
+            ]
+          },
+          "n_step": 8449774,
+          "goals": [
+            "N\nmF\nffGd\nsKXdksumN\nWxRBXBiaEszhhABMM\n\nMFx",
+            "Wse\nYCxXo\nwPZkrUjKdmyuGrvKVoz\nfsZsxKvV\nPNEBfw\n\nxJ",
+            "v\nDstfxtylKUpvTttX\nQt\nDnKyDaVL\nWOmIcxXfikgs\ngzzxUe\n\nMHekv",
+            "gxhu\nizs\nRuyDUbPWhlHEBF\nNone\nPsGqwQZeVGIbo\nScunthorpe\n\nEcSRIhbcpwcd"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 1095,
+            "context": []
+          },
+          "step": {
+            "text": "(N\u0019\u00f0\u00d6\u00fc\u00c7",
+            "context": [
+              {
+                "type": "stored",
+                "id": 1096
+              }
+            ]
+          },
+          "n_step": -41006888766,
+          "goals": [
+            "qgiwUt\n\nwJWq",
+            "K\nbZWxWsEkPTvS\nVojgKebZo\n\nq"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 1097,
+            "context": [
+              {
+                "type": "stored",
+                "id": 1098
+              },
+              {
+                "type": "stored",
+                "id": 1099
+              }
+            ]
+          },
+          "step": {
+            "text": "iR\u00a5",
+            "context": []
+          },
+          "n_step": 1834,
+          "goals": [
+            "R\nNone\n\nZ"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 1100,
+            "context": [
+              {
+                "type": "stored",
+                "id": 1101
+              },
+              {
+                "type": "stored",
+                "id": 1102
+              },
+              {
+                "type": "stored",
+                "id": 1103
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 1104
+              },
+              {
+                "type": "stored",
+                "id": 1105
+              },
+              {
+                "type": "stored",
+                "id": 1106
+              }
+            ]
+          },
+          "n_step": 380,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 1107,
+            "context": [
+              {
+                "type": "stored",
+                "id": 1108
+              },
+              {
+                "type": "stored",
+                "id": 1109
+              }
+            ]
+          },
+          "step": {
+            "text": "\u009e",
+            "context": [
+              {
+                "type": "stored",
+                "id": 1110
+              },
+              {
+                "type": "stored",
+                "id": 1111
+              }
+            ]
+          },
+          "n_step": 8258950,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 1112,
+            "context": [
+              {
+                "type": "stored",
+                "id": 1113
+              },
+              {
+                "type": "stored",
+                "id": 1114
+              },
+              {
+                "type": "stored",
+                "id": 1115
+              },
+              {
+                "type": "stored",
+                "id": 1116
+              },
+              {
+                "type": "stored",
+                "id": 1117
+              },
+              {
+                "type": "stored",
+                "id": 1118
+              },
+              {
+                "type": "stored",
+                "id": 1119
+              },
+              {
+                "type": "stored",
+                "id": 1120
+              },
+              {
+                "type": "stored",
+                "id": 1121
+              },
+              {
+                "type": "stored",
+                "id": 1122
+              },
+              {
+                "type": "stored",
+                "id": 1123
+              },
+              {
+                "type": "stored",
+                "id": 1124
+              },
+              {
+                "type": "stored",
+                "id": 1125
+              },
+              {
+                "type": "stored",
+                "id": 1126
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 1127
+              },
+              {
+                "type": "stored",
+                "id": 1128
+              },
+              {
+                "type": "stored",
+                "id": 1129
+              },
+              {
+                "type": "stored",
+                "id": 1130
+              },
+              {
+                "type": "stored",
+                "id": 1131
+              }
+            ]
+          },
+          "n_step": 500,
+          "goals": []
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,14 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo2/longest.v\", \"workspace\": \"/coq-dataset/repos/foo2\", \"repository\": \"/coq-dataset/repos/foo2\"}",
+    "{\"type\": \"stored\", \"id\": 709}",
+    "{\"type\": \"stored\", \"id\": 710}",
+    "{\"type\": \"stored\", \"id\": 711}",
+    "{\"type\": \"stored\", \"id\": 712}",
+    "{\"type\": \"stored\", \"id\": 713}",
+    "{\"type\": \"stored\", \"id\": 714}",
+    "{\"type\": \"stored\", \"id\": 715}",
+    "{\"type\": \"stored\", \"id\": 716}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
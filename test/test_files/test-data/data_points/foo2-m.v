@@ -0,0 +1,276 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo2/m.v\", \"workspace\": \"/coq-dataset/repos/foo2\", \"repository\": \"/coq-dataset/repos/foo2\"}",
+    "{\"type\": \"stored\", \"id\": 421}",
+    "{\"type\": \"stored\", \"id\": 422}",
+    "{\"type\": \"stored\", \"id\": 423}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 424,
+        "context": [
+          {
+            "type": "stored",
+            "id": 425
+          },
+          {
+            "type": "stored",
+            "id": 426
+          },
+          {
+            "type": "stored",
+            "id": 427
+          },
+          {
+            "type": "stored",
+            "id": 428
+          },
+          {
+            "type": "stored",
+            "id": 429
+          }
+        ]
+      },
+      "steps": []
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 430,
+        "context": [
+          {
+            "type": "stored",
+            "id": 431
+          },
+          {
+            "type": "stored",
+            "id": 432
+          },
+          {
+            "type": "stored",
+            "id": 433
+          },
+          {
+            "type": "stored",
+            "id": 434
+          },
+          {
+            "type": "stored",
+            "id": 435
+          },
+          {
+            "type": "stored",
+            "id": 436
+          },
+          {
+            "type": "stored",
+            "id": 437
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 438,
+            "context": [
+              {
+                "type": "stored",
+                "id": 439
+              },
+              {
+                "type": "stored",
+                "id": 440
+              },
+              {
+                "type": "stored",
+                "id": 441
+              }
+            ]
+          },
+          "step": {
+            "text": "\uda1b\udde7",
+            "context": [
+              {
+                "type": "stored",
+                "id": 442
+              },
+              {
+                "type": "stored",
+                "id": 443
+              }
+            ]
+          },
+          "n_step": 11341,
+          "goals": [
+            "RrWqdBTaexNCJ\nsbatch\noSotuajBfVjv\n\nCff",
+            "eHsJpt\nEGQaNoVELhmGjhlPIKAD\nkhbX\nUbAccSFKtrDYwAYKPaLGRIwpUrDgm\nlONEdDrufRCHhUKTfKrpnwevggX\nFuKfyVWuSADPL\n\ngIjslUolE",
+            "\n\nQWPxDOIjW",
+            "wfj\nnoecsZ\nvnoqrNWEN\nr\nYQBQQ\nbCVMI\nvkIws\nor\nYjV\n\nTzqKKQG",
+            "\n\nPHjbJZmXt",
+            "l\nDGJXQK\nHF\nlcp\ndqLnc\nFzUziC\nHbytnklh\nnD\n\nsqSZXWj",
+            "TI\njrBMpwpc\n\nLO",
+            "ESSqVNCE\nNGuC\n\nqfcabh"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 444,
+            "context": [
+              {
+                "type": "stored",
+                "id": 445
+              },
+              {
+                "type": "stored",
+                "id": 446
+              },
+              {
+                "type": "stored",
+                "id": 447
+              }
+            ]
+          },
+          "step": {
+            "text": "\ud8ec\udddc\u00af\u0084r{\u00c9#B\u0010\ud98a\ude7a\u008a\u007fI`\u0081*j\u00fe\u00c71\u00a2\ud9ea\udf51\u00b8>\u0082'-\ud8a5\udf9b\ud943\udea5\ud863\ude58v\uda30\udd7a",
+            "context": []
+          },
+          "n_step": 6418,
+          "goals": [
+            "zPNQ\n\nAx"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 448,
+            "context": [
+              {
+                "type": "stored",
+                "id": 449
+              },
+              {
+                "type": "stored",
+                "id": 450
+              },
+              {
+                "type": "stored",
+                "id": 451
+              },
+              {
+                "type": "stored",
+                "id": 452
+              },
+              {
+                "type": "stored",
+                "id": 453
+              }
+            ]
+          },
+          "step": {
+            "text": "else",
+            "context": [
+              {
+                "type": "stored",
+                "id": 454
+              },
+              {
+                "type": "stored",
+                "id": 455
+              },
+              {
+                "type": "stored",
+                "id": 456
+              },
+              {
+                "type": "stored",
+                "id": 457
+              },
+              {
+                "type": "stored",
+                "id": 458
+              },
+              {
+                "type": "stored",
+                "id": 459
+              },
+              {
+                "type": "stored",
+                "id": 460
+              },
+              {
+                "type": "stored",
+                "id": 461
+              },
+              {
+                "type": "stored",
+                "id": 462
+              },
+              {
+                "type": "stored",
+                "id": 463
+              },
+              {
+                "type": "stored",
+                "id": 464
+              }
+            ]
+          },
+          "n_step": 2944,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 465,
+            "context": [
+              {
+                "type": "stored",
+                "id": 466
+              },
+              {
+                "type": "stored",
+                "id": 467
+              }
+            ]
+          },
+          "step": {
+            "text": "\u0091\udb89\uddb2:",
+            "context": [
+              {
+                "type": "stored",
+                "id": 468
+              },
+              {
+                "type": "stored",
+                "id": 469
+              },
+              {
+                "type": "stored",
+                "id": 470
+              },
+              {
+                "type": "stored",
+                "id": 471
+              }
+            ]
+          },
+          "n_step": 37264,
+          "goals": [
+            "\n\nTo",
+            "BBNLzHz\nol\n\nbNkxJFVRlD",
+            "vzEsCl\nfK\nkwGT\nk\nsoQmFb\nto\nNDp\ntcJaDPSqCZMrjgRA\nESo\nul\nuA\nKBlt\n\nmodule",
+            "\n\nNVfybdRXphTdbMoAyBgogaMpDKBWjleC",
+            "T\nYhvhNOz\npZnmJoEsGaGYD\ngI\n\nIMeSePVYeZm",
+            "uudgeJ\ncVGQ\nTWUfQzQ\n\ntIcOXMwKei",
+            "V\nferhEMgw\nbM\nHO\n\na",
+            "\n\nw"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
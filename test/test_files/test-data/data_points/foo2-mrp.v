@@ -0,0 +1,153 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo2/mrp.v\", \"workspace\": \"/coq-dataset/repos/foo2\", \"repository\": \"/coq-dataset/repos/foo2\"}",
+    "{\"type\": \"stored\", \"id\": 997}",
+    "{\"type\": \"stored\", \"id\": 998}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 999,
+        "context": [
+          {
+            "type": "stored",
+            "id": 1000
+          },
+          {
+            "type": "stored",
+            "id": 1001
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 1002,
+            "context": [
+              {
+                "type": "stored",
+                "id": 1003
+              },
+              {
+                "type": "stored",
+                "id": 1004
+              },
+              {
+                "type": "stored",
+                "id": 1005
+              },
+              {
+                "type": "stored",
+                "id": 1006
+              },
+              {
+                "type": "stored",
+                "id": 1007
+              },
+              {
+                "type": "stored",
+                "id": 1008
+              },
+              {
+                "type": "stored",
+                "id": 1009
+              },
+              {
+                "type": "stored",
+                "id": 1010
+              },
+              {
+                "type": "stored",
+                "id": 1011
+              },
+              {
+                "type": "stored",
+                "id": 1012
+              },
+              {
+                "type": "stored",
+                "id": 1013
+              },
+              {
+                "type": "stored",
+                "id": 1014
+              },
+              {
+                "type": "stored",
+                "id": 1015
+              },
+              {
+                "type": "stored",
+                "id": 1016
+              },
+              {
+                "type": "stored",
+                "id": 1017
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00e8\u0093\uda58\udf67?\ud878\udc0f",
+            "context": []
+          },
+          "n_step": 1000,
+          "goals": [
+            "\n\nGM",
+            "jLzQUbbANOoAHZIGF\nIIgCT\n\nV",
+            "\n\nyYCztgfWVhzs",
+            "Q\nYQFCQBLhy\nuv\nTLvOrH\n\nxNItbPxK",
+            "then\nptc\nVNUkCSWoABzOCdJFy\nu\nArsVIhOMKtksKj\nVernacDefinition\nqVI\nJTvbX\nSdjODisIiRIRDgCqTEdRpksefhOsWzfrkXJ\nG\nRvBXOnvlQhJTCKxNpKzCvDv\ncOX\n\nngQnOq",
+            "jFJw\nl\nh\nA\np\ng\n\nJaANNMtE",
+            "KWPQFubAGKiWu\n\nE"
+          ]
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 1018,
+        "context": [
+          {
+            "type": "stored",
+            "id": 1019
+          },
+          {
+            "type": "stored",
+            "id": 1020
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 1021,
+            "context": [
+              {
+                "type": "stored",
+                "id": 1022
+              },
+              {
+                "type": "stored",
+                "id": 1023
+              },
+              {
+                "type": "stored",
+                "id": 1024
+              }
+            ]
+          },
+          "step": {
+            "text": "\u009c\u0083f:\u0007=",
+            "context": []
+          },
+          "n_step": 18937071304,
+          "goals": []
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,206 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo2/qfdhl.v\", \"workspace\": \"/coq-dataset/repos/foo2\", \"repository\": \"/coq-dataset/repos/foo2\"}",
+    "{\"type\": \"stored\", \"id\": 1155}",
+    "{\"type\": \"stored\", \"id\": 1156}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 1157,
+        "context": [
+          {
+            "type": "stored",
+            "id": 1158
+          },
+          {
+            "type": "stored",
+            "id": 1159
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 1160,
+            "context": []
+          },
+          "step": {
+            "text": "\ud94f\udc49F\u00dd\u008br",
+            "context": [
+              {
+                "type": "stored",
+                "id": 1161
+              },
+              {
+                "type": "stored",
+                "id": 1162
+              }
+            ]
+          },
+          "n_step": 3415,
+          "goals": [
+            "PhrKTWVC\ntest\nTJvlA\ntW\nz\nhXrDQqjvkrIMSprmFQ\nwfg\nRfKJXI\n\nWODKjx",
+            "a\nfsPqhHNMAKXEaL\nsIAQHHcdNp\nTheorem\nosdQwDJtd\nKxcpOs\nqNmaT\n\nudP",
+            "zu\neitp\n\nu",
+            "l\nId\ndas\nvcPBVyNRIEZbdzUIgU\nDEFINITION\nJWmiBSsV\nkJ\nScunthorpe\n\nHqSrTm",
+            "NjkRTVG\n\nIN",
+            "\n\ncNXvBKnGRGDBESybiy",
+            "fbJVMwRzLcMYzyZXyelms\nHYrRk\n\nroDlYb",
+            "\n\nBI",
+            "\n\nFALSE",
+            "\n\nPbnegQRYiA",
+            "a\noipaTNxtSgO\n\npKBDzVIaJXv",
+            "kbBVe\n\nd"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 1163,
+            "context": [
+              {
+                "type": "stored",
+                "id": 1164
+              },
+              {
+                "type": "stored",
+                "id": 1165
+              },
+              {
+                "type": "stored",
+                "id": 1166
+              },
+              {
+                "type": "stored",
+                "id": 1167
+              },
+              {
+                "type": "stored",
+                "id": 1168
+              },
+              {
+                "type": "stored",
+                "id": 1169
+              },
+              {
+                "type": "stored",
+                "id": 1170
+              },
+              {
+                "type": "stored",
+                "id": 1171
+              },
+              {
+                "type": "stored",
+                "id": 1172
+              }
+            ]
+          },
+          "step": {
+            "text": "C",
+            "context": [
+              {
+                "type": "stored",
+                "id": 1173
+              },
+              {
+                "type": "stored",
+                "id": 1174
+              },
+              {
+                "type": "stored",
+                "id": 1175
+              },
+              {
+                "type": "stored",
+                "id": 1176
+              },
+              {
+                "type": "stored",
+                "id": 1177
+              },
+              {
+                "type": "stored",
+                "id": 1178
+              },
+              {
+                "type": "stored",
+                "id": 1179
+              },
+              {
+                "type": "stored",
+                "id": 1180
+              }
+            ]
+          },
+          "n_step": -250,
+          "goals": [
+            "Hm\nMbF\n\nzixM",
+            "Qi\nSW\ngkhbXdhZHQvn\nwZ\nMKrkVkToITtfmCZPnZ\nlYjUzc\ncgglf\nRbzR\nEuifedn\no\njTnjalMChYXEqQF\nf\np\ndO\nHXDz\nyrBarM\nCc\nydLvoyTpkskqsSbckROT\nxaTq\n\nutXnra",
+            "qWNLArBKghDQ\nieFcN\ncQOdRsUPN\naVhLiDfgRBsevoNwsdY\njZrxqheWJNX\nZnhVfEVcwxBekSp\ns\ntrue\njqknL\n\nFALSE",
+            "Id\n\nNuDteKcLrYAXqEOzXuyDvIeTaOji",
+            "exNk\n\nlCxsfVUArGYvNxjs",
+            "e\nFfEdp\njsJS\n\nqHy",
+            "O\nfdEH\n\nvf",
+            "JfIYNfQrLYS\nBbkLGH\nXmrhnYHY\ns\n\ntrue",
+            "dRhBE\nrkCOj\n\nCxa",
+            "rXYomHCWA\nCUtUCl\npDsRJATkC\n\nX",
+            "WsG\nk\nOchIJs\nWi\nUlk\nULwqGHd\n\nVvnsd"
+          ]
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 1181,
+        "context": [
+          {
+            "type": "stored",
+            "id": 1182
+          },
+          {
+            "type": "stored",
+            "id": 1183
+          },
+          {
+            "type": "stored",
+            "id": 1184
+          },
+          {
+            "type": "stored",
+            "id": 1185
+          },
+          {
+            "type": "stored",
+            "id": 1186
+          },
+          {
+            "type": "stored",
+            "id": 1187
+          },
+          {
+            "type": "stored",
+            "id": 1188
+          },
+          {
+            "type": "stored",
+            "id": 1189
+          },
+          {
+            "type": "stored",
+            "id": 1190
+          },
+          {
+            "type": "stored",
+            "id": 1191
+          }
+        ]
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
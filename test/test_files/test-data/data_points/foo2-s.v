@@ -0,0 +1,13 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo2/s.v\", \"workspace\": \"/coq-dataset/repos/foo2\", \"repository\": \"/coq-dataset/repos/foo2\"}",
+    "{\"type\": \"stored\", \"id\": 472}",
+    "{\"type\": \"stored\", \"id\": 473}",
+    "{\"type\": \"stored\", \"id\": 474}",
+    "{\"type\": \"stored\", \"id\": 475}",
+    "{\"type\": \"stored\", \"id\": 476}",
+    "{\"type\": \"stored\", \"id\": 477}",
+    "{\"type\": \"stored\", \"id\": 478}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,349 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo2/tvtlqoktuuwvzqdigivvcjt.v\", \"workspace\": \"/coq-dataset/repos/foo2\", \"repository\": \"/coq-dataset/repos/foo2\"}",
+    "{\"type\": \"stored\", \"id\": 580}",
+    "{\"type\": \"stored\", \"id\": 581}",
+    "{\"type\": \"stored\", \"id\": 582}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 583,
+        "context": []
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 584,
+            "context": [
+              {
+                "type": "stored",
+                "id": 585
+              },
+              {
+                "type": "stored",
+                "id": 586
+              },
+              {
+                "type": "stored",
+                "id": 587
+              },
+              {
+                "type": "stored",
+                "id": 588
+              }
+            ]
+          },
+          "step": {
+            "text": "\u0005\u00aeL\u00ba\u00f5",
+            "context": [
+              {
+                "type": "stored",
+                "id": 589
+              },
+              {
+                "type": "stored",
+                "id": 590
+              },
+              {
+                "type": "stored",
+                "id": 591
+              }
+            ]
+          },
+          "n_step": -84309,
+          "goals": [
+            "tF\ntrue\n\ncosts"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 592,
+            "context": [
+              {
+                "type": "stored",
+                "id": 593
+              },
+              {
+                "type": "stored",
+                "id": 594
+              },
+              {
+                "type": "stored",
+                "id": 595
+              }
+            ]
+          },
+          "step": {
+            "text": "\u0091",
+            "context": [
+              {
+                "type": "stored",
+                "id": 596
+              },
+              {
+                "type": "stored",
+                "id": 597
+              }
+            ]
+          },
+          "n_step": 267,
+          "goals": [
+            "D\nT\ndGmHgYZ\nnone\nAoqZLkHDsLX\npldWBGSqeW\nVVRFpGNsLQ\nole\nMR\nSABxgesJHsOLScNo\ng\nNone\nKigee\nIuuOwIQImV\nGzo\naNoit\n\nrepository",
+            "Wb\nZaB\nsn\n\nv",
+            "\n\nn",
+            "OAtBjI\ncBx\n\nVNKzWoMbxNoDBQ",
+            "I\nDskWizB\nQP\n\nGOS"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 598,
+            "context": [
+              {
+                "type": "stored",
+                "id": 599
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 600
+              },
+              {
+                "type": "stored",
+                "id": 601
+              },
+              {
+                "type": "stored",
+                "id": 602
+              },
+              {
+                "type": "stored",
+                "id": 603
+              },
+              {
+                "type": "stored",
+                "id": 604
+              },
+              {
+                "type": "stored",
+                "id": 605
+              },
+              {
+                "type": "stored",
+                "id": 606
+              },
+              {
+                "type": "stored",
+                "id": 607
+              }
+            ]
+          },
+          "n_step": 625,
+          "goals": [
+            "x\n\nP"
+          ]
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 608,
+        "context": [
+          {
+            "type": "stored",
+            "id": 609
+          },
+          {
+            "type": "stored",
+            "id": 610
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 611,
+            "context": []
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 612
+              },
+              {
+                "type": "stored",
+                "id": 613
+              }
+            ]
+          },
+          "n_step": 3643496,
+          "goals": [
+            "tCqLQwBRDhlxkEl\nQCZXRws\n\nRH",
+            "swfI\n\nrITio"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 614,
+            "context": [
+              {
+                "type": "stored",
+                "id": 615
+              },
+              {
+                "type": "stored",
+                "id": 616
+              },
+              {
+                "type": "stored",
+                "id": 617
+              },
+              {
+                "type": "stored",
+                "id": 618
+              }
+            ]
+          },
+          "step": {
+            "text": "\u008abS\u0006z",
+            "context": [
+              {
+                "type": "stored",
+                "id": 619
+              },
+              {
+                "type": "stored",
+                "id": 620
+              },
+              {
+                "type": "stored",
+                "id": 621
+              }
+            ]
+          },
+          "n_step": 503,
+          "goals": [
+            "i\nOd\ncbe\nFCc\n\nSegts",
+            "KStygSgB\nyleALpNt\nmOC\n\nnnJs",
+            "BjQNWOmmb\nVEGJqB\nNUFwd\n\nSW",
+            "vT\nBRfSwEvsHiqr\nUCDJCw\nrp\nG\nfUKAgKFm\n\nnq",
+            "\n\nf",
+            "EfYSrhhXulqNCIBqDxxf\nT\nTKHS\n\nQrUjRBxU"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 622,
+            "context": []
+          },
+          "step": {
+            "text": "\udb1e\udec9",
+            "context": [
+              {
+                "type": "stored",
+                "id": 623
+              },
+              {
+                "type": "stored",
+                "id": 624
+              },
+              {
+                "type": "stored",
+                "id": 625
+              },
+              {
+                "type": "stored",
+                "id": 626
+              },
+              {
+                "type": "stored",
+                "id": 627
+              },
+              {
+                "type": "stored",
+                "id": 628
+              },
+              {
+                "type": "stored",
+                "id": 629
+              },
+              {
+                "type": "stored",
+                "id": 630
+              },
+              {
+                "type": "stored",
+                "id": 631
+              },
+              {
+                "type": "stored",
+                "id": 632
+              },
+              {
+                "type": "stored",
+                "id": 633
+              }
+            ]
+          },
+          "n_step": 4765668484375,
+          "goals": [
+            "WkAtCfmRHXIxPkn\nd\nB\ngGlr\nRWIgoCoW\njcpHC\nXZZqkf\ntySkCc\nN\nULNJTmK\nwpweQNNIyWmRYpQg\nlogs\nPINfrqgd\nub\nWPxDmDufOcgUIFxHKtPOikjxjpG\nz\ntp\nZX\nIYtXmLpjPQHc\npz\ny\n\nVPJlxJ"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 634,
+            "context": [
+              {
+                "type": "stored",
+                "id": 635
+              },
+              {
+                "type": "stored",
+                "id": 636
+              },
+              {
+                "type": "stored",
+                "id": 637
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00d1\u0002\udb2e\ude3d\udafd\udd2a\u0013v8",
+            "context": [
+              {
+                "type": "stored",
+                "id": 638
+              }
+            ]
+          },
+          "n_step": 15452,
+          "goals": [
+            "sFYcm\nQIYc\nx\nQiKWcJGbBYlo\n\nDEl",
+            "\n\njedFcqa",
+            "bnFSjxG\n\nbAqzQNksBFhuOW",
+            "cgG\nPr\nbkkTb\nv\ncbBaRWZeeq\nthen\nFxNTxmbskSe\nNaN\n\nlp",
+            "RK\n\nPjQOsJWuxP",
+            "mUPdFlLaEIrN\nmodel\nTrUpNRZ\nOmarOwSumYg\nlNrYdIu\naJvu\nY\nquIvMrAurua\nyIkY\nNP\nz\njB\n\nrbrBO"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
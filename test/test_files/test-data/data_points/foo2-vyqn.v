@@ -0,0 +1,394 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo2/vyqn.v\", \"workspace\": \"/coq-dataset/repos/foo2\", \"repository\": \"/coq-dataset/repos/foo2\"}",
+    "{\"type\": \"stored\", \"id\": 918}",
+    "{\"type\": \"stored\", \"id\": 919}",
+    "{\"type\": \"stored\", \"id\": 920}",
+    "{\"type\": \"stored\", \"id\": 921}",
+    "{\"type\": \"stored\", \"id\": 922}",
+    "{\"type\": \"stored\", \"id\": 923}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 924,
+        "context": [
+          {
+            "type": "stored",
+            "id": 925
+          },
+          {
+            "type": "stored",
+            "id": 926
+          },
+          {
+            "type": "stored",
+            "id": 927
+          },
+          {
+            "type": "stored",
+            "id": 928
+          },
+          {
+            "type": "stored",
+            "id": 929
+          },
+          {
+            "type": "stored",
+            "id": 930
+          },
+          {
+            "type": "stored",
+            "id": 931
+          },
+          {
+            "type": "stored",
+            "id": 932
+          },
+          {
+            "type": "stored",
+            "id": 933
+          },
+          {
+            "type": "stored",
+            "id": 934
+          },
+          {
+            "type": "stored",
+            "id": 935
+          },
+          {
+            "type": "stored",
+            "id": 936
+          },
+          {
+            "type": "stored",
+            "id": 937
+          },
+          {
+            "type": "stored",
+            "id": 938
+          },
+          {
+            "type": "stored",
+            "id": 939
+          },
+          {
+            "type": "stored",
+            "id": 940
+          },
+          {
+            "type": "stored",
+            "id": 941
+          },
+          {
+            "type": "stored",
+            "id": 942
+          },
+          {
+            "type": "stored",
+            "id": 943
+          },
+          {
+            "type": "stored",
+            "id": 944
+          },
+          {
+            "type": "stored",
+            "id": 945
+          },
+          {
+            "type": "stored",
+            "id": 946
+          },
+          {
+            "type": "stored",
+            "id": 947
+          },
+          {
+            "type": "stored",
+            "id": 948
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 949,
+            "context": [
+              {
+                "type": "stored",
+                "id": 950
+              },
+              {
+                "type": "stored",
+                "id": 951
+              },
+              {
+                "type": "stored",
+                "id": 952
+              },
+              {
+                "type": "stored",
+                "id": 953
+              },
+              {
+                "type": "stored",
+                "id": 954
+              },
+              {
+                "type": "stored",
+                "id": 955
+              },
+              {
+                "type": "stored",
+                "id": 956
+              },
+              {
+                "type": "stored",
+                "id": 957
+              },
+              {
+                "type": "stored",
+                "id": 958
+              },
+              {
+                "type": "stored",
+                "id": 959
+              },
+              {
+                "type": "stored",
+                "id": 960
+              },
+              {
+                "type": "stored",
+                "id": 961
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": []
+          },
+          "n_step": 14406367066,
+          "goals": [
+            "\n\nNebTuR",
+            "ssPTQknpnZXw\nq\nDT\ndrMNtq\nHr\na\nb\nvxW\nyJbny\n\nzCOvyMdllE",
+            "SybpYRpLQBtDE\nbBKD\nE\ntSy\nHVfFhMBStBtWjBadp\nlN\n\nGBF",
+            "null\nkGU\n\nu",
+            "UDNkAzGv\nfkDUMH\nDIfaJQrfmPFSECvP\nN\n\nJZVvJa",
+            "longest\n\nOdB",
+            "HK\nBhVlPnIbogxQpnuulUH\nBnZqO\nhmVdF\n\nmhhZCmokBQfG",
+            "ArEJ\nnxSP\nC\nxklRI\ncFXltM\nVPgi\nwd\n\nLjw",
+            "TORNoMWkYsvPUex\nVauCISWRQYvff\nkQBy\nGvAvyj\nPogb\nT\nWX\nbr\nFADqF\nUfNOccDFQMVvXIwUmYsbgldS\n\nP",
+            "ZzHKKxNGjTYnBNolDg\nY\nV\np\nwSh\n\nvoUUPqPvGIBmiBpV",
+            "gcGDFFFgk\n\nZgWYxB",
+            "gNR\nF\nRPCpeak\nO\nMwTveAY\ngBqFtF\n\nUaFcSx",
+            "aPoqtQFLgX\ncEfy\nZam\n\nmvKN",
+            "\n\nbwfB",
+            "GlR\nRFjPQP\nvuaEgzUo\n\nK",
+            "E\ntoQ\ntryLcs\ncsr\niqEoB\nMZmquKl\n\nKblBK",
+            "NfM\nMMFWQIrZ\nZXgCbv\nHf\n\nSLOxaHufTiYv"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 962,
+            "context": [
+              {
+                "type": "stored",
+                "id": 963
+              }
+            ]
+          },
+          "step": {
+            "text": "\ud968\udd57\u00e0",
+            "context": [
+              {
+                "type": "stored",
+                "id": 964
+              }
+            ]
+          },
+          "n_step": -753,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 965,
+            "context": []
+          },
+          "step": {
+            "text": "\uda6c\udc5e\u008c:\u00ab5\u00b0\uda90\udf5d",
+            "context": [
+              {
+                "type": "stored",
+                "id": 966
+              },
+              {
+                "type": "stored",
+                "id": 967
+              }
+            ]
+          },
+          "n_step": -5485,
+          "goals": [
+            "tRNxPFXTanw\n\nAmUhDqZ",
+            "u\nfUtY\nYpHt\nlH\nMTyzXCqb\nbUElnNI\nIfF\nm\nhPhQ\nzpZJkVEiM\nhwI\nejD\ndKeL\nl\nLneoRfwCxBokVcUeHGZPfK\nV\nJjyvu\nMOmvdueB\n\nPQzs",
+            "f\nrmQVpvu\nXPFXauuCCR\nBkbzYfYjYb\nerDpEelgEzYU\nBH\nemNLCihxnZXrOuB\n\ni"
+          ]
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 968,
+        "context": [
+          {
+            "type": "stored",
+            "id": 969
+          },
+          {
+            "type": "stored",
+            "id": 970
+          },
+          {
+            "type": "stored",
+            "id": 971
+          },
+          {
+            "type": "stored",
+            "id": 972
+          },
+          {
+            "type": "stored",
+            "id": 973
+          },
+          {
+            "type": "stored",
+            "id": 974
+          },
+          {
+            "type": "stored",
+            "id": 975
+          },
+          {
+            "type": "stored",
+            "id": 976
+          },
+          {
+            "type": "stored",
+            "id": 977
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 978,
+            "context": [
+              {
+                "type": "stored",
+                "id": 979
+              },
+              {
+                "type": "stored",
+                "id": 980
+              },
+              {
+                "type": "stored",
+                "id": 981
+              },
+              {
+                "type": "stored",
+                "id": 982
+              },
+              {
+                "type": "stored",
+                "id": 983
+              },
+              {
+                "type": "stored",
+                "id": 984
+              },
+              {
+                "type": "stored",
+                "id": 985
+              },
+              {
+                "type": "stored",
+                "id": 986
+              },
+              {
+                "type": "stored",
+                "id": 987
+              },
+              {
+                "type": "stored",
+                "id": 988
+              },
+              {
+                "type": "stored",
+                "id": 989
+              },
+              {
+                "type": "stored",
+                "id": 990
+              },
+              {
+                "type": "stored",
+                "id": 991
+              },
+              {
+                "type": "stored",
+                "id": 992
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 993
+              },
+              {
+                "type": "stored",
+                "id": 994
+              },
+              {
+                "type": "stored",
+                "id": 995
+              },
+              {
+                "type": "stored",
+                "id": 996
+              }
+            ]
+          },
+          "n_step": -42058771306,
+          "goals": [
+            "kMFgvic\nFVNBxcsMy\nFmJvnxV\nCWYlIKfJOf\n\ncontent",
+            "F\nj\nOCdCVF\nTcEsI\n\nY",
+            "\n\npgMTbNGST",
+            "WpUPp\n\nc",
+            "\n\ngSQi",
+            "fO\n\nDfpsBwG",
+            "\n\npfimmhz",
+            "Fyr\ndcnUfvqtWAtUhnAT\nOPcErNtRzRwQkwb\nYpxu\nxZZFqHb\neWORom\ni\n\nXIOGw",
+            "GH\nbZ\nNone\nyYEkrtvkIgd\n\noUWz",
+            "owjVOpfyrRwKDuJ\nYryKey\nsXaSb\n\ntEDIs",
+            "Scunthorpe\nO\nGlg\nnM\nMRBwSqfzM\naFLtGpLfGVTJJMxBYqe\nBWRLwbLRdmS\nymJw\nbgkYI\ndrVt\nxYwndrWci\nQ\nDquVGErPXk\nbtbLSAwd\n\nzGnyPUsHjkV",
+            "UVNTLUEvjoHT\nE\nW\nMsnbX\ndejiVrz\ny\nQvclH\ngWrNWtC\npKeZWjIoE\no\nfw\na\nGbl\nzklsILriGuTZQtztQCshrpAvkpqUsfo\ng\nWgSbvQ\nE\nVKxxrHJrYcNPbtYeNYCDpVYGbpjUfqXAXr\nx\n\nzL"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,332 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo2/w.v\", \"workspace\": \"/coq-dataset/repos/foo2\", \"repository\": \"/coq-dataset/repos/foo2\"}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 479,
+        "context": [
+          {
+            "type": "stored",
+            "id": 480
+          },
+          {
+            "type": "stored",
+            "id": 481
+          },
+          {
+            "type": "stored",
+            "id": 482
+          },
+          {
+            "type": "stored",
+            "id": 483
+          },
+          {
+            "type": "stored",
+            "id": 484
+          },
+          {
+            "type": "stored",
+            "id": 485
+          },
+          {
+            "type": "stored",
+            "id": 486
+          },
+          {
+            "type": "stored",
+            "id": 487
+          },
+          {
+            "type": "stored",
+            "id": 488
+          },
+          {
+            "type": "stored",
+            "id": 489
+          },
+          {
+            "type": "stored",
+            "id": 490
+          },
+          {
+            "type": "stored",
+            "id": 491
+          },
+          {
+            "type": "stored",
+            "id": 492
+          },
+          {
+            "type": "stored",
+            "id": 493
+          },
+          {
+            "type": "stored",
+            "id": 494
+          },
+          {
+            "type": "stored",
+            "id": 495
+          },
+          {
+            "type": "stored",
+            "id": 496
+          },
+          {
+            "type": "stored",
+            "id": 497
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 498,
+            "context": [
+              {
+                "type": "stored",
+                "id": 499
+              },
+              {
+                "type": "stored",
+                "id": 500
+              },
+              {
+                "type": "stored",
+                "id": 501
+              },
+              {
+                "type": "stored",
+                "id": 502
+              },
+              {
+                "type": "stored",
+                "id": 503
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 504
+              },
+              {
+                "type": "stored",
+                "id": 505
+              }
+            ]
+          },
+          "n_step": 5816,
+          "goals": [
+            "crHMniefeU\nrhWfD\no\nolim\npX\nAusyDEL\nr\nnull\nynFzn\nIqJCPwEQvqf\n\nUNxFpwGtxavm",
+            "R\nUogkkyMbZVo\nDqC\nUG\nxtpMsOoXoe\nDjmbANq\nDuKRRH\njkHOfxq\nGaI\nthen\nNaN\nto\ngt\n\nJtdVldKQYayjFXPCQswYtU",
+            "cXinm\nntSxmQPxL\n\ntE",
+            "ymW\nLPdF\nZnayvN\n\nOQnkVIVL"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 506,
+            "context": [
+              {
+                "type": "stored",
+                "id": 507
+              },
+              {
+                "type": "stored",
+                "id": 508
+              },
+              {
+                "type": "stored",
+                "id": 509
+              },
+              {
+                "type": "stored",
+                "id": 510
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": []
+          },
+          "n_step": -20466728619,
+          "goals": [
+            "\n\nV",
+            "\n\nN",
+            "XCZtXG\nstored\nQcp\nOPv\nvFuZyt\nzA\nVLNRbgCWpSShZoxRsbsf\nhRGvRlVIh\nm\nUDV\nyIZHAKWBwN\nlui\nzGreS\n\noe",
+            "\n\nSanTJ",
+            "oTzsRNlsGFes\nMktiPzIbAtyI\ntd\n\nXJnWbFApKA",
+            "\n\nPrXizmaJTTSvPhTHGWf",
+            "rkEaC\nHelRIvCweY\nEsoOXh\n\nIYb",
+            "gsd\nDm\naNZfCXE\nRDgw\nXgmVSbT\n\nNhmvqT",
+            "HPZHga\n\nkuGK",
+            "H\nXcT\n\nKas",
+            "Q\nlMvZ\nR\n\nYRrWiUKuzdE",
+            "Rw\nzPcNaEII\n\nHAUsx",
+            "qRKkXpocX\nlFuCXqHgqHxS\nTrue\n\nnu",
+            "lKICfE\nsy\nENAgiBTaXSwOlkLUwaI\nAGZSd\n\nkCdGf",
+            "gj\n\nvbj",
+            "\n\nv",
+            "\n\na"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 511,
+            "context": []
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 512
+              },
+              {
+                "type": "stored",
+                "id": 513
+              },
+              {
+                "type": "stored",
+                "id": 514
+              },
+              {
+                "type": "stored",
+                "id": 515
+              },
+              {
+                "type": "stored",
+                "id": 516
+              },
+              {
+                "type": "stored",
+                "id": 517
+              },
+              {
+                "type": "stored",
+                "id": 518
+              },
+              {
+                "type": "stored",
+                "id": 519
+              }
+            ]
+          },
+          "n_step": -447,
+          "goals": [
+            "\n\naXBtchBxybYvqvF",
+            "DE\n\nformatters"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 520,
+            "context": []
+          },
+          "step": {
+            "text": "\u00b6\u000b\ud856\udece(\u00c4F\uda65\udcd5\ud988\ude1b\u0090",
+            "context": []
+          },
+          "n_step": 600,
+          "goals": [
+            "HTIl\ny\nbXf\nPG\n\nWR",
+            "\n\nGiTSHrIg",
+            "kneWO\nLcfZ\nLTT\nsJTxtFQhCF\njttiQiszmGlsbA\nafaDAJc\nM\nDrLRfOTcdoRDHAo\nlFkUmdeSJ\n\nIdEnLulq"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 521,
+            "context": [
+              {
+                "type": "stored",
+                "id": 522
+              },
+              {
+                "type": "stored",
+                "id": 523
+              },
+              {
+                "type": "stored",
+                "id": 524
+              },
+              {
+                "type": "stored",
+                "id": 525
+              },
+              {
+                "type": "stored",
+                "id": 526
+              },
+              {
+                "type": "stored",
+                "id": 527
+              },
+              {
+                "type": "stored",
+                "id": 528
+              }
+            ]
+          },
+          "step": {
+            "text": "none",
+            "context": [
+              {
+                "type": "stored",
+                "id": 529
+              }
+            ]
+          },
+          "n_step": -6035348348845617152,
+          "goals": [
+            "VSaxrYwDNtNjEsvRxj\nCQRJ\nQxeFSCZt\nU\nJcmWiS\ny\nYYgsX\nEzRK\nRSffuE\nU\njnEaaewQ\nAkU\nHGakRHoieaW\n\nEulWjAAGA",
+            "rVpCzLtswJPzGaXsbTTg\nt\nlyimRwmVUaa\ngZCZHY\nmnuXWPqNjcD\nzlKjPWZrBlHQY\n\noWgYlvXQa"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 530,
+            "context": []
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 531
+              },
+              {
+                "type": "stored",
+                "id": 532
+              }
+            ]
+          },
+          "n_step": -389836,
+          "goals": [
+            "\n\nx",
+            "VMMKYt\nmvfydTOWpLU\nT\nA\nZ\nlMJt\n\nTnIH",
+            "JdCwfitwv\n\nN",
+            "hW\nES\nF\nC\nqikoiz\nRUYwtZ\nUkXe\n\nbBg",
+            "iDDkwnpP\ntaSw\nlTYiRLEWWlxpyl\nnWWWiCdrAMOAkhSYGW\nBEti\nQGhQD\nelse\nsez\nZzDMJ\nEdqwdw\n\nvroEWycmzW",
+            "dzlP\n\nrTJNLrJVYv",
+            "ICK\nHQhwY\n\nVL",
+            "MkIaUK\ngIQHBezKZAx\nUe\ntextDocumentSync\nHMBnvG\nYsEThEPomhk\nY\nmYrVGT\ni\nhMtM\nvIRLNlmAVcoub\nP\nOIrBNgrBeeGKXUjAPSDqmrDmP\n\nW"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,20 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo2/xshebfaaewfssc.v\", \"workspace\": \"/coq-dataset/repos/foo2\", \"repository\": \"/coq-dataset/repos/foo2\"}",
+    "{\"type\": \"stored\", \"id\": 1025}",
+    "{\"type\": \"stored\", \"id\": 1026}",
+    "{\"type\": \"stored\", \"id\": 1027}",
+    "{\"type\": \"stored\", \"id\": 1028}",
+    "{\"type\": \"stored\", \"id\": 1029}",
+    "{\"type\": \"stored\", \"id\": 1030}",
+    "{\"type\": \"stored\", \"id\": 1031}",
+    "{\"type\": \"stored\", \"id\": 1032}",
+    "{\"type\": \"stored\", \"id\": 1033}",
+    "{\"type\": \"stored\", \"id\": 1034}",
+    "{\"type\": \"stored\", \"id\": 1035}",
+    "{\"type\": \"stored\", \"id\": 1036}",
+    "{\"type\": \"stored\", \"id\": 1037}",
+    "{\"type\": \"stored\", \"id\": 1038}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,84 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo2/xylioprbsqlsnfxuyp.v\", \"workspace\": \"/coq-dataset/repos/foo2\", \"repository\": \"/coq-dataset/repos/foo2\"}",
+    "{\"type\": \"stored\", \"id\": 1039}",
+    "{\"type\": \"stored\", \"id\": 1040}",
+    "{\"type\": \"stored\", \"id\": 1041}",
+    "{\"type\": \"stored\", \"id\": 1042}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 1043,
+        "context": [
+          {
+            "type": "stored",
+            "id": 1044
+          },
+          {
+            "type": "stored",
+            "id": 1045
+          },
+          {
+            "type": "stored",
+            "id": 1046
+          },
+          {
+            "type": "stored",
+            "id": 1047
+          },
+          {
+            "type": "stored",
+            "id": 1048
+          },
+          {
+            "type": "stored",
+            "id": 1049
+          },
+          {
+            "type": "stored",
+            "id": 1050
+          },
+          {
+            "type": "stored",
+            "id": 1051
+          },
+          {
+            "type": "stored",
+            "id": 1052
+          },
+          {
+            "type": "stored",
+            "id": 1053
+          },
+          {
+            "type": "stored",
+            "id": 1054
+          },
+          {
+            "type": "stored",
+            "id": 1055
+          },
+          {
+            "type": "stored",
+            "id": 1056
+          },
+          {
+            "type": "stored",
+            "id": 1057
+          },
+          {
+            "type": "stored",
+            "id": 1058
+          },
+          {
+            "type": "stored",
+            "id": 1059
+          }
+        ]
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
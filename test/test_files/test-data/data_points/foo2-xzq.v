@@ -0,0 +1,355 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo2/xzq.v\", \"workspace\": \"/coq-dataset/repos/foo2\", \"repository\": \"/coq-dataset/repos/foo2\"}",
+    "{\"type\": \"stored\", \"id\": 792}",
+    "{\"type\": \"stored\", \"id\": 793}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 794,
+        "context": []
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 795,
+            "context": [
+              {
+                "type": "stored",
+                "id": 796
+              },
+              {
+                "type": "stored",
+                "id": 797
+              },
+              {
+                "type": "stored",
+                "id": 798
+              },
+              {
+                "type": "stored",
+                "id": 799
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00c8.\u00b8",
+            "context": [
+              {
+                "type": "stored",
+                "id": 800
+              },
+              {
+                "type": "stored",
+                "id": 801
+              }
+            ]
+          },
+          "n_step": -666,
+          "goals": [
+            "pH\nBLLrlxEK\nMlSU\nUL\nEKLP\nMkHndRMXZBm\nNone\n\ntnXmnL",
+            "\n\nddZ",
+            "VKLxzrvxLw\n\nxNz",
+            "\n\nywQ",
+            "vSQWjdpziqHigUGRdKgF\n\nDfsadR",
+            "True\ndruE\nPhpEZCUEyAZFJdmckmbEzJlbKYfGNCGsZcpGLZjJM\ngg\nKKQRrO\njScw\nykgtl\n\nB",
+            "QT\naGo\noQopt\nrJKrDzonl\noWF\n\nvtyizF",
+            "BWwqrGzbxWdg\nyPJBBg\nMCV\nRKLkGlO\nFyFg\n\nRgFe",
+            "evpr\nXxCc\npN\nkYxLAT\nWXfDGvvqJDSKAjZfMx\nfzVxGpUgJe\n\nU",
+            "uTSFRXxLndCzx\nFolIyLhDsLu\nOTlU\nnkwPFb\nQ\nY\nU\n\nF",
+            "Dsx\nJV\nEN\n\nnU",
+            "VlP\nFeTBxRWuoC\n\nAoCVPrAPhlwz",
+            "eqOfO\n\nbWCNchEysFidd"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 802,
+            "context": [
+              {
+                "type": "stored",
+                "id": 803
+              },
+              {
+                "type": "stored",
+                "id": 804
+              },
+              {
+                "type": "stored",
+                "id": 805
+              },
+              {
+                "type": "stored",
+                "id": 806
+              },
+              {
+                "type": "stored",
+                "id": 807
+              },
+              {
+                "type": "stored",
+                "id": 808
+              },
+              {
+                "type": "stored",
+                "id": 809
+              },
+              {
+                "type": "stored",
+                "id": 810
+              },
+              {
+                "type": "stored",
+                "id": 811
+              },
+              {
+                "type": "stored",
+                "id": 812
+              },
+              {
+                "type": "stored",
+                "id": 813
+              }
+            ]
+          },
+          "step": {
+            "text": "\udad6\udc4a",
+            "context": [
+              {
+                "type": "stored",
+                "id": 814
+              },
+              {
+                "type": "stored",
+                "id": 815
+              }
+            ]
+          },
+          "n_step": -18381361,
+          "goals": [
+            "YBjjFBxGAuIgyIOo\nZNfDU\nkSQKlKxK\nTFdRgH\nkmcWoBHiwGpt\njvDvVygzoAzdSAXMEWQZ\n\nPMCcXoH",
+            "DvSlFq\nFNDWIQ\nWLi\n\nZvhV",
+            "\n\nbeqKaEPEjgvAx"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 816,
+            "context": [
+              {
+                "type": "stored",
+                "id": 817
+              },
+              {
+                "type": "stored",
+                "id": 818
+              },
+              {
+                "type": "stored",
+                "id": 819
+              },
+              {
+                "type": "stored",
+                "id": 820
+              }
+            ]
+          },
+          "step": {
+            "text": "O\u00d0\u0011\ud92d\udce0\u00a5\udb0a\udee1p\u0092",
+            "context": [
+              {
+                "type": "stored",
+                "id": 821
+              },
+              {
+                "type": "stored",
+                "id": 822
+              },
+              {
+                "type": "stored",
+                "id": 823
+              },
+              {
+                "type": "stored",
+                "id": 824
+              },
+              {
+                "type": "stored",
+                "id": 825
+              }
+            ]
+          },
+          "n_step": 8220,
+          "goals": [
+            "lwRubO\nUZgNv\nXoFShKE\nrrHd\nqqgNeyttrCsVC\nj\nXuxdUIwZgJE\nzHlmUkg\nsJdSeYxu\nWrOZHKQCHyNa\nqW\ndL\n\nInkOFkfu",
+            "Scunthorpe\nMA\n\nmWVmycEb",
+            "\n\nXWoVmat",
+            "IurZUQLFt\nnF\nFmaSbQnE\nQBjvNhuxL\ncT\nmrvqxavgfhCzFD\nDdIdVxpyV\n\nzEMrH",
+            "ezgw\naiDK\n\nHTjADRToFzQIrI",
+            "tNZT\nXcbVb\ns\nVBhKNGkmfROD\nMueZvpPQeNVjnY\ntweFbDE\n\nxjkqiAsLpraeZ",
+            "mGAWP\nsf\nivNTJ\nif\nc\nMxqavyPnxxiOiSuyewe\nY\njKsVD\nAh\nTcIXfBAkOkXKi\nlbclP\nPeAXqZ\nj\nbreYBDFkhN\nIOb\nc\ncBvg\nBbiUgNmF\ncNFhCmhsb\nNg\n\nbHUl",
+            "\n\nf",
+            "axKqOij\nyq\ntypes\nvtQLe\ne\naYj\nkIvCULUBe\nSFHimax\nOOKOHpNWWqXU\nYZ\nWIuu\nT\nZfYnsNQYlSs\nS\nnil\nwdghODPMAcQXPLUeil\n\nnVxTE",
+            "BD\nSPcx\nzG\nOE\nufcFO\nyEZmZwY\nqZA\nQiNwVUSjmTcxC\n\nz",
+            "iEjf\nJSbZ\n\nfalse",
+            "eu\n\ntactic",
+            "VEbjLbggU\nj\nsBjrg\n\nMNbfAZvhBRMl",
+            "hoiGJmZVdNhlr\nQpXHrdRD\nmOrJrGycieWOvtBKiOuDqS\nhcVy\nala\n\nlp",
+            "uYRjGg\nFByva\nIhztX\n\nYu"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 826,
+            "context": [
+              {
+                "type": "stored",
+                "id": 827
+              },
+              {
+                "type": "stored",
+                "id": 828
+              },
+              {
+                "type": "stored",
+                "id": 829
+              },
+              {
+                "type": "stored",
+                "id": 830
+              },
+              {
+                "type": "stored",
+                "id": 831
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 832
+              },
+              {
+                "type": "stored",
+                "id": 833
+              },
+              {
+                "type": "stored",
+                "id": 834
+              },
+              {
+                "type": "stored",
+                "id": 835
+              },
+              {
+                "type": "stored",
+                "id": 836
+              },
+              {
+                "type": "stored",
+                "id": 837
+              },
+              {
+                "type": "stored",
+                "id": 838
+              },
+              {
+                "type": "stored",
+                "id": 839
+              },
+              {
+                "type": "stored",
+                "id": 840
+              }
+            ]
+          },
+          "n_step": 243388016604502,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 841,
+            "context": [
+              {
+                "type": "stored",
+                "id": 842
+              },
+              {
+                "type": "stored",
+                "id": 843
+              },
+              {
+                "type": "stored",
+                "id": 844
+              },
+              {
+                "type": "stored",
+                "id": 845
+              }
+            ]
+          },
+          "step": {
+            "text": "\uda1d\udfdev\u00aexZ\u00a5",
+            "context": [
+              {
+                "type": "stored",
+                "id": 846
+              },
+              {
+                "type": "stored",
+                "id": 847
+              },
+              {
+                "type": "stored",
+                "id": 848
+              },
+              {
+                "type": "stored",
+                "id": 849
+              },
+              {
+                "type": "stored",
+                "id": 850
+              },
+              {
+                "type": "stored",
+                "id": 851
+              },
+              {
+                "type": "stored",
+                "id": 852
+              },
+              {
+                "type": "stored",
+                "id": 853
+              },
+              {
+                "type": "stored",
+                "id": 854
+              },
+              {
+                "type": "stored",
+                "id": 855
+              },
+              {
+                "type": "stored",
+                "id": 856
+              }
+            ]
+          },
+          "n_step": 653499835,
+          "goals": []
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,9 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo2/z.v\", \"workspace\": \"/coq-dataset/repos/foo2\", \"repository\": \"/coq-dataset/repos/foo2\"}",
+    "{\"type\": \"stored\", \"id\": 533}",
+    "{\"type\": \"stored\", \"id\": 534}",
+    "{\"type\": \"stored\", \"id\": 535}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
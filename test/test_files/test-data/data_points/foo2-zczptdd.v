@@ -0,0 +1,201 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo2/zczptdd.v\", \"workspace\": \"/coq-dataset/repos/foo2\", \"repository\": \"/coq-dataset/repos/foo2\"}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 880,
+        "context": [
+          {
+            "type": "stored",
+            "id": 881
+          },
+          {
+            "type": "stored",
+            "id": 882
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 883,
+            "context": [
+              {
+                "type": "stored",
+                "id": 884
+              },
+              {
+                "type": "stored",
+                "id": 885
+              },
+              {
+                "type": "stored",
+                "id": 886
+              },
+              {
+                "type": "stored",
+                "id": 887
+              },
+              {
+                "type": "stored",
+                "id": 888
+              },
+              {
+                "type": "stored",
+                "id": 889
+              },
+              {
+                "type": "stored",
+                "id": 890
+              },
+              {
+                "type": "stored",
+                "id": 891
+              },
+              {
+                "type": "stored",
+                "id": 892
+              },
+              {
+                "type": "stored",
+                "id": 893
+              },
+              {
+                "type": "stored",
+                "id": 894
+              },
+              {
+                "type": "stored",
+                "id": 895
+              },
+              {
+                "type": "stored",
+                "id": 896
+              },
+              {
+                "type": "stored",
+                "id": 897
+              },
+              {
+                "type": "stored",
+                "id": 898
+              },
+              {
+                "type": "stored",
+                "id": 899
+              },
+              {
+                "type": "stored",
+                "id": 900
+              },
+              {
+                "type": "stored",
+                "id": 901
+              },
+              {
+                "type": "stored",
+                "id": 902
+              },
+              {
+                "type": "stored",
+                "id": 903
+              },
+              {
+                "type": "stored",
+                "id": 904
+              },
+              {
+                "type": "stored",
+                "id": 905
+              },
+              {
+                "type": "stored",
+                "id": 906
+              },
+              {
+                "type": "stored",
+                "id": 907
+              },
+              {
+                "type": "stored",
+                "id": 908
+              }
+            ]
+          },
+          "step": {
+            "text": "\u0017\u00be$\u00b0\u0010\u00a9\uda30\udc48a\uda67\udd0a",
+            "context": [
+              {
+                "type": "stored",
+                "id": 909
+              },
+              {
+                "type": "stored",
+                "id": 910
+              },
+              {
+                "type": "stored",
+                "id": 911
+              },
+              {
+                "type": "stored",
+                "id": 912
+              },
+              {
+                "type": "stored",
+                "id": 913
+              },
+              {
+                "type": "stored",
+                "id": 914
+              },
+              {
+                "type": "stored",
+                "id": 915
+              },
+              {
+                "type": "stored",
+                "id": 916
+              },
+              {
+                "type": "stored",
+                "id": 917
+              }
+            ]
+          },
+          "n_step": -436690438,
+          "goals": [
+            "KGRRkaex\nCxu\nI\nsYvteT\nLc\nUDBfdcDdnWxl\njbTzDiGc\nWdzEWFekAKXfVgnFYMlMCGaeKy\nHqQUpnd\nDEPtsLBdwCwYuEqdOf\n\nNM",
+            "GZB\nsrc\nRFEWhdU\nqe\nKzVkuwlYfklDNre\n\nTFg",
+            "Q\nlTKZFEoVF\nWW\npYewTVUxT\ncB\n\nJmLFAnu",
+            "sbJve\nproofs\nQpnABWyPCLyfudhUOy\nI\nFmvgmqm\nk\n\nXipkeOhPPN",
+            "PR\ne\nNCVkcIQQmOQwRITpXix\nFuzUFGj\nWRq\nttJ\nlB\nZc\nNgSl\nQuOqMnbs\nINF\nuDNWRcEJEq\n\nixVdjO",
+            "HfqgxVQEhOzqXP\nkbTJsckUZT\niWiPFvrmObJ\nVbu\nDepVlseegwCJLJpnmnE\nK\nLAD\nZyWMDu\nDuS\nMu\nkNcFNsaHsBLbMGxAMTFZI\nVmc\nuU\nu\nKPTG\nYEoI\nxdBdd\naUVudjtW\npOlYhDOnVm\n\ntFtqxys",
+            "T\nEHIShoFn\nBfyPOChKyGR\n\nxnFchJzKk",
+            "EC\nD\nmy\nsCEqOijbYY\nw\n\nP",
+            "tf\ng\nP\nfwKKK\nTkVwJ\n\noFfVm",
+            "ODQEPSpcUXwrQXxVd\n\neumdGha",
+            "qEDDnXr\nPHRc\n\nkNrERaBskz",
+            "\n\naLRoCR",
+            "ad\nwoFjvl\nQd\nifliKtXe\nlFZgpI\n\nFnyF",
+            "lgPW\nprQzjIcvPSlc\nD\n\nmGCgH",
+            "c\nCEjGpIXXHXH\nOsj\n\nn",
+            "\n\nzfnUi",
+            "rl\noq\niBvJJyZmJEG\nxsveZifrrovu\nkJYdTUMR\n\nNsOZNQ",
+            "VxUSAKA\nXKLhUWvtNGQ\nbq\nU\nOGXupHlYaBANDiVAiRf\nRUFF\nV\nswmvRDwCQzKFySGBUECAikg\nb\nM\nIMdZmzso\nzbfbPMdzqcOU\nv\nQl\niw\nv\nsep\nWYtv\nnJpbxOOEc\nQxUOim\njdr\nRW\neBFmijW\nM\nyb\nAlQwSHlCZl\nocwOk\n\nNRgXocIIKojivaCQUqtfP",
+            "VUsqW\ndZOTEnp\nvqKpUY\niIwETNQdoEvz\n\nT",
+            "KRs\nQhTV\nnMZ\nKw\nLB\n\nWWgdoh",
+            "q\nem\npeJv\ncEnwEh\nStaM\nkSkxiXsUEDeQKaDx\nnWbMAnC\nkTVMwHLPlum\n\nOeh",
+            "DqYSPr\nBGkZyMMplDo\nXh\neaprhfmBGuAwu\n\nvuqA",
+            "Ni\n\nbk",
+            "UVBcibkuI\nD\nEcESUa\nEMhRTenqTrmYI\n\nKCycW"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
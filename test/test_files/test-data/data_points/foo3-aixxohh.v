@@ -0,0 +1,131 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo3/aixxohh.v\", \"workspace\": \"/coq-dataset/repos/foo3\", \"repository\": \"/coq-dataset/repos/foo3\"}",
+    "{\"type\": \"stored\", \"id\": 1451}",
+    "{\"type\": \"stored\", \"id\": 1452}",
+    "{\"type\": \"stored\", \"id\": 1453}",
+    "{\"type\": \"stored\", \"id\": 1454}",
+    "{\"type\": \"stored\", \"id\": 1455}",
+    "{\"type\": \"stored\", \"id\": 1456}",
+    "{\"type\": \"stored\", \"id\": 1457}",
+    "{\"type\": \"stored\", \"id\": 1458}",
+    "{\"type\": \"stored\", \"id\": 1459}",
+    "{\"type\": \"stored\", \"id\": 1460}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 1461,
+        "context": [
+          {
+            "type": "stored",
+            "id": 1462
+          },
+          {
+            "type": "stored",
+            "id": 1463
+          },
+          {
+            "type": "stored",
+            "id": 1464
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 1465,
+            "context": []
+          },
+          "step": {
+            "text": "\udbe7\udc07\ud8c5\udcca",
+            "context": []
+          },
+          "n_step": 48405,
+          "goals": [
+            "\n\nRxT",
+            "FKq\nwPOwIapLJmCjF\nv\nMJS\nSD\ngDBQ\nBg\nPJT\nkua\n\nigYWxwnADVNrB",
+            "hucWzzAPDExQHbWsYtf\nhrlNquXZzkTNlwwwR\nIrGTgwcXGTjOqCrYOLyLYvKWXOgxHeb\ny\nIfByynondT\nkHo\ngAmCANgQ\npydJR\nzqpznygvf\nxbsYAFXD\nLaGmlxp\nVgHJDeInJl\nVI\n\nid",
+            "tTREDXMYEVW\nDbFDLAjTa\nfjnelu\nHjIhlkpfS\nfPOvAaKDpxsSndMTLDCwSuF\nEEI\nOflmFAU\nbreadth\nVHbE\neR\n\nRWn",
+            "IE\nNVhSNGBQSuvC\nzxnhep\nKULkwcPX\nlZnZ\nsOMphKJSYHvN\n\nR",
+            "GzicmYBfVLfXC\nZt\nEIKCEAnAYa\nkGhrM\nFz\natwQns\nGv\neFjzSjF\njQ\neHZk\neOGZvqQga\nMhcVGCIxRY\ntrain\n\ntJaO",
+            "PSwgRQ\n\nHfgZEkqPSTmG"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 1466,
+            "context": [
+              {
+                "type": "stored",
+                "id": 1467
+              }
+            ]
+          },
+          "step": {
+            "text": ">\u0010\ud99a\udd55\u00adT\u001b\uda4e\ude27=",
+            "context": [
+              {
+                "type": "stored",
+                "id": 1468
+              },
+              {
+                "type": "stored",
+                "id": 1469
+              },
+              {
+                "type": "stored",
+                "id": 1470
+              }
+            ]
+          },
+          "n_step": 23001,
+          "goals": [
+            "ZSbaezYTzqDTRv\nRV\nU\nxv\n\nPL",
+            "M\nQJzRmy\n\nGCtjAVq",
+            "Ij\nu\nKd\n\nHNEpkaGW",
+            "Mk\nI\nBud\nNdWGWusJpa\n\ngojDlcNHYdiRrtVosQ"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 1471,
+            "context": [
+              {
+                "type": "stored",
+                "id": 1472
+              },
+              {
+                "type": "stored",
+                "id": 1473
+              },
+              {
+                "type": "stored",
+                "id": 1474
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00bdX",
+            "context": []
+          },
+          "n_step": 447,
+          "goals": [
+            "KdMYocs\ngW\nRHRxg\n\nyDmXhgQoTjMnF",
+            "hgAMVWNvCE\nz\nLZ\nFJDtkzSmLywf\nFAyJ\ndriEf\n\nImWFUEui",
+            "\n\ngXihsfZEEKewaKMcSTQRu",
+            "e\nONdYVZmbS\noBZOYVUartk\nzwF\nr\nlJEN\nhSA\nb\n\nTSN",
+            "syuwnrCdujmXGwoT\nSFYhlbcN\nkTPGFNmANQAVwfX\nCsZwA\nBOJ\n\nA",
+            "cvHvVvsCA\n\nMxJQjWxdwST",
+            "RVo\njXYkP\nCnsSwdqiAcJDze\npZsc\n\nEeaY",
+            "tRwwebH\nall\nzepW\nhuCKrS\njB\nJhkg\nmoYcCiUBDOBu\nhaU\nKX\n\nSuOMqAm"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
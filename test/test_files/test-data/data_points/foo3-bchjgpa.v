@@ -0,0 +1,128 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo3/bchjgpa.v\", \"workspace\": \"/coq-dataset/repos/foo3\", \"repository\": \"/coq-dataset/repos/foo3\"}",
+    "{\"type\": \"stored\", \"id\": 1582}",
+    "{\"type\": \"stored\", \"id\": 1583}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 1584,
+        "context": [
+          {
+            "type": "stored",
+            "id": 1585
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 1586,
+            "context": [
+              {
+                "type": "stored",
+                "id": 1587
+              },
+              {
+                "type": "stored",
+                "id": 1588
+              },
+              {
+                "type": "stored",
+                "id": 1589
+              },
+              {
+                "type": "stored",
+                "id": 1590
+              },
+              {
+                "type": "stored",
+                "id": 1591
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00f18b",
+            "context": [
+              {
+                "type": "stored",
+                "id": 1592
+              },
+              {
+                "type": "stored",
+                "id": 1593
+              }
+            ]
+          },
+          "n_step": -157844,
+          "goals": [
+            "\n\nGwysMacy",
+            "V\nu\nDBa\nDagP\n\nPfUZppk",
+            "TLDzHp\nhkL\nHwdgS\ncU\nHKAPUiPDdVLQbG\nvGpiFARSb\nNMtkwkRkl\n\niGjMuLAgsI",
+            "wb\nNvyKaemsBO\nmuuvI\neyoPGuPQnKGDszdFz\nHaf\nxoMkNkCGuLIaFmCMJJQLpkVY\nhakXDZgSWqWiIfMWrd\nN\nqab\nt\nrBJ\n\nb"
+          ]
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 1594,
+        "context": [
+          {
+            "type": "stored",
+            "id": 1595
+          },
+          {
+            "type": "stored",
+            "id": 1596
+          },
+          {
+            "type": "stored",
+            "id": 1597
+          },
+          {
+            "type": "stored",
+            "id": 1598
+          },
+          {
+            "type": "stored",
+            "id": 1599
+          },
+          {
+            "type": "stored",
+            "id": 1600
+          },
+          {
+            "type": "stored",
+            "id": 1601
+          },
+          {
+            "type": "stored",
+            "id": 1602
+          },
+          {
+            "type": "stored",
+            "id": 1603
+          },
+          {
+            "type": "stored",
+            "id": 1604
+          },
+          {
+            "type": "stored",
+            "id": 1605
+          },
+          {
+            "type": "stored",
+            "id": 1606
+          }
+        ]
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
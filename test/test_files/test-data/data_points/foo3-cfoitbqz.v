@@ -0,0 +1,37 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo3/cfoitbqz.v\", \"workspace\": \"/coq-dataset/repos/foo3\", \"repository\": \"/coq-dataset/repos/foo3\"}",
+    "{\"type\": \"stored\", \"id\": 1697}",
+    "{\"type\": \"stored\", \"id\": 1698}",
+    "{\"type\": \"stored\", \"id\": 1699}",
+    "{\"type\": \"stored\", \"id\": 1700}",
+    "{\"type\": \"stored\", \"id\": 1701}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 1702,
+        "context": [
+          {
+            "type": "stored",
+            "id": 1703
+          },
+          {
+            "type": "stored",
+            "id": 1704
+          },
+          {
+            "type": "stored",
+            "id": 1705
+          },
+          {
+            "type": "stored",
+            "id": 1706
+          }
+        ]
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,9 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo3/crpu.v\", \"workspace\": \"/coq-dataset/repos/foo3\", \"repository\": \"/coq-dataset/repos/foo3\"}",
+    "{\"type\": \"stored\", \"id\": 1680}",
+    "{\"type\": \"stored\", \"id\": 1681}",
+    "{\"type\": \"stored\", \"id\": 1682}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,22 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo3/d.v\", \"workspace\": \"/coq-dataset/repos/foo3\", \"repository\": \"/coq-dataset/repos/foo3\"}",
+    "{\"type\": \"stored\", \"id\": 1337}",
+    "{\"type\": \"stored\", \"id\": 1338}",
+    "{\"type\": \"stored\", \"id\": 1339}",
+    "{\"type\": \"stored\", \"id\": 1340}",
+    "{\"type\": \"stored\", \"id\": 1341}",
+    "{\"type\": \"stored\", \"id\": 1342}",
+    "{\"type\": \"stored\", \"id\": 1343}",
+    "{\"type\": \"stored\", \"id\": 1344}",
+    "{\"type\": \"stored\", \"id\": 1345}",
+    "{\"type\": \"stored\", \"id\": 1346}",
+    "{\"type\": \"stored\", \"id\": 1347}",
+    "{\"type\": \"stored\", \"id\": 1348}",
+    "{\"type\": \"stored\", \"id\": 1349}",
+    "{\"type\": \"stored\", \"id\": 1350}",
+    "{\"type\": \"stored\", \"id\": 1351}",
+    "{\"type\": \"stored\", \"id\": 1352}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
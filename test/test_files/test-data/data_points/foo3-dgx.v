@@ -0,0 +1,23 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo3/dgx.v\", \"workspace\": \"/coq-dataset/repos/foo3\", \"repository\": \"/coq-dataset/repos/foo3\"}",
+    "{\"type\": \"stored\", \"id\": 1320}",
+    "{\"type\": \"stored\", \"id\": 1321}",
+    "{\"type\": \"stored\", \"id\": 1322}",
+    "{\"type\": \"stored\", \"id\": 1323}",
+    "{\"type\": \"stored\", \"id\": 1324}",
+    "{\"type\": \"stored\", \"id\": 1325}",
+    "{\"type\": \"stored\", \"id\": 1326}",
+    "{\"type\": \"stored\", \"id\": 1327}",
+    "{\"type\": \"stored\", \"id\": 1328}",
+    "{\"type\": \"stored\", \"id\": 1329}",
+    "{\"type\": \"stored\", \"id\": 1330}",
+    "{\"type\": \"stored\", \"id\": 1331}",
+    "{\"type\": \"stored\", \"id\": 1332}",
+    "{\"type\": \"stored\", \"id\": 1333}",
+    "{\"type\": \"stored\", \"id\": 1334}",
+    "{\"type\": \"stored\", \"id\": 1335}",
+    "{\"type\": \"stored\", \"id\": 1336}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
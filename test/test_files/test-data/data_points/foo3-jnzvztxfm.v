@@ -0,0 +1,295 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo3/jnzvztxfm.v\", \"workspace\": \"/coq-dataset/repos/foo3\", \"repository\": \"/coq-dataset/repos/foo3\"}",
+    "{\"type\": \"stored\", \"id\": 1397}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 1398,
+        "context": []
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 1399,
+            "context": [
+              {
+                "type": "stored",
+                "id": 1400
+              }
+            ]
+          },
+          "step": {
+            "text": "j\u00ff",
+            "context": [
+              {
+                "type": "stored",
+                "id": 1401
+              },
+              {
+                "type": "stored",
+                "id": 1402
+              },
+              {
+                "type": "stored",
+                "id": 1403
+              },
+              {
+                "type": "stored",
+                "id": 1404
+              },
+              {
+                "type": "stored",
+                "id": 1405
+              },
+              {
+                "type": "stored",
+                "id": 1406
+              },
+              {
+                "type": "stored",
+                "id": 1407
+              },
+              {
+                "type": "stored",
+                "id": 1408
+              },
+              {
+                "type": "stored",
+                "id": 1409
+              },
+              {
+                "type": "stored",
+                "id": 1410
+              },
+              {
+                "type": "stored",
+                "id": 1411
+              },
+              {
+                "type": "stored",
+                "id": 1412
+              },
+              {
+                "type": "stored",
+                "id": 1413
+              },
+              {
+                "type": "stored",
+                "id": 1414
+              },
+              {
+                "type": "stored",
+                "id": 1415
+              },
+              {
+                "type": "stored",
+                "id": 1416
+              },
+              {
+                "type": "stored",
+                "id": 1417
+              }
+            ]
+          },
+          "n_step": -1818751,
+          "goals": [
+            "CoAfUyABWFymlpy\nAUIkzuQK\nOx\nApHUYacUa\nSAEAw\n\nsgeLTWtTDlh",
+            "oPSMpOfzNIPNyQKnqitNUEAJJAKJHstHQMrnCUfcCahNOrNtkkrV\nInqUcHaNW\nLtn\n\ngVxVGLPoBbuDdunRLhb",
+            "\n\nq",
+            "TQG\ngBqCmccSvcnqQjct\npdiH\nR\nv\nkt\nnu\nNUL\nXfi\ntavqz\nlazAuO\nFacjwX\nFteTxtK\na\nFn\n\noH",
+            "k\nbqT\nUoZoLYhq\n\nH",
+            "hCnG\n\nipmPlUPfuTHZhofyjQhw"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 1418,
+            "context": []
+          },
+          "step": {
+            "text": "P",
+            "context": [
+              {
+                "type": "stored",
+                "id": 1419
+              },
+              {
+                "type": "stored",
+                "id": 1420
+              }
+            ]
+          },
+          "n_step": 11310,
+          "goals": [
+            "wjIGMj\nrRUWRgtZZQfqlt\nsAsWC\ncz\nf\nI\n\nnjvX",
+            "MrvEvbuwxq\npE\nZExnRKIHYzHNG\n\nOVGb"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 1421,
+            "context": [
+              {
+                "type": "stored",
+                "id": 1422
+              },
+              {
+                "type": "stored",
+                "id": 1423
+              },
+              {
+                "type": "stored",
+                "id": 1424
+              },
+              {
+                "type": "stored",
+                "id": 1425
+              },
+              {
+                "type": "stored",
+                "id": 1426
+              },
+              {
+                "type": "stored",
+                "id": 1427
+              },
+              {
+                "type": "stored",
+                "id": 1428
+              },
+              {
+                "type": "stored",
+                "id": 1429
+              }
+            ]
+          },
+          "step": {
+            "text": "S|\u00f3\u00a4\u0004\u41ba\"r\u008eA",
+            "context": [
+              {
+                "type": "stored",
+                "id": 1430
+              },
+              {
+                "type": "stored",
+                "id": 1431
+              },
+              {
+                "type": "stored",
+                "id": 1432
+              },
+              {
+                "type": "stored",
+                "id": 1433
+              },
+              {
+                "type": "stored",
+                "id": 1434
+              },
+              {
+                "type": "stored",
+                "id": 1435
+              },
+              {
+                "type": "stored",
+                "id": 1436
+              },
+              {
+                "type": "stored",
+                "id": 1437
+              },
+              {
+                "type": "stored",
+                "id": 1438
+              },
+              {
+                "type": "stored",
+                "id": 1439
+              },
+              {
+                "type": "stored",
+                "id": 1440
+              }
+            ]
+          },
+          "n_step": 20328,
+          "goals": [
+            "ylwF\nDsjwZyO\n\nZN",
+            "Bpb\nOMjH\naCtHXsKmKHlWlMys\noddVeCd\noXEKNPamkXSOLTL\n\ntvXaykZfiqzz",
+            "timeout\nnPxLPI\nJ\nvCQPLzeLpnYGoUhJmkDaBqZ\n\nNsMoD",
+            "MX\nD\najReYqLgKtTs\nthen\n\njrljUxhjefwH"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 1441,
+            "context": [
+              {
+                "type": "stored",
+                "id": 1442
+              },
+              {
+                "type": "stored",
+                "id": 1443
+              },
+              {
+                "type": "stored",
+                "id": 1444
+              }
+            ]
+          },
+          "step": {
+            "text": "7\ud80e\ude7d\u001d",
+            "context": [
+              {
+                "type": "stored",
+                "id": 1445
+              },
+              {
+                "type": "stored",
+                "id": 1446
+              },
+              {
+                "type": "stored",
+                "id": 1447
+              },
+              {
+                "type": "stored",
+                "id": 1448
+              },
+              {
+                "type": "stored",
+                "id": 1449
+              },
+              {
+                "type": "stored",
+                "id": 1450
+              }
+            ]
+          },
+          "n_step": -220371915,
+          "goals": [
+            "\n\nZDVsOqniB",
+            "decoder\nh\nlPGlWKZ\nmYiJhKUd\nBDLktjVBJ\nzLZ\nSshIvxkbxSuBtNXKjXGACU\ngOeLxPMIsuaYlJTfIUZAexMoY\nhnzvcHNag\nCJB\necAgaeVy\neKPT\n\nEdPeO",
+            "yoW\ntyFv\nINLuZAIB\nmcVTsgg\nHCQMKHve\nBDQCdJ\nTDThZODB\nVboyJJjZBW\ncA\nCFoWZYa\nKtWAVcojYbeEOdSAVSkPbv\nINSTANCE\nPBRbHTQbmQXkkRpoIvfoOjFGTzI\nsz\nlwREJ\n\ns",
+            "\n\nWiBF",
+            "\n\nFV",
+            "\n\nBVkw",
+            "UBPePkFqM\nRBOCth\n\nnbHk",
+            "QnXaRR\ndCKDbTEMV\n\nYyX",
+            "\n\ndependencies",
+            "\n\nw",
+            "\n\nVjXokXu"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
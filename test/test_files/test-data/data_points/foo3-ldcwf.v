@@ -0,0 +1,109 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo3/ldcwf.v\", \"workspace\": \"/coq-dataset/repos/foo3\", \"repository\": \"/coq-dataset/repos/foo3\"}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 1659,
+        "context": [
+          {
+            "type": "stored",
+            "id": 1660
+          },
+          {
+            "type": "stored",
+            "id": 1661
+          },
+          {
+            "type": "stored",
+            "id": 1662
+          },
+          {
+            "type": "stored",
+            "id": 1663
+          },
+          {
+            "type": "stored",
+            "id": 1664
+          },
+          {
+            "type": "stored",
+            "id": 1665
+          },
+          {
+            "type": "stored",
+            "id": 1666
+          },
+          {
+            "type": "stored",
+            "id": 1667
+          },
+          {
+            "type": "stored",
+            "id": 1668
+          },
+          {
+            "type": "stored",
+            "id": 1669
+          },
+          {
+            "type": "stored",
+            "id": 1670
+          },
+          {
+            "type": "stored",
+            "id": 1671
+          },
+          {
+            "type": "stored",
+            "id": 1672
+          },
+          {
+            "type": "stored",
+            "id": 1673
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 1674,
+            "context": [
+              {
+                "type": "stored",
+                "id": 1675
+              },
+              {
+                "type": "stored",
+                "id": 1676
+              },
+              {
+                "type": "stored",
+                "id": 1677
+              },
+              {
+                "type": "stored",
+                "id": 1678
+              },
+              {
+                "type": "stored",
+                "id": 1679
+              }
+            ]
+          },
+          "step": {
+            "text": " \udb7c\ude88*",
+            "context": []
+          },
+          "n_step": 1217,
+          "goals": [
+            "W\nPaRbwlRhvLUvBIgRnMeNvDOCJQ\no\n\nx"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
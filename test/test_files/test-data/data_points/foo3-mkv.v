@@ -0,0 +1,187 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo3/mkv.v\", \"workspace\": \"/coq-dataset/repos/foo3\", \"repository\": \"/coq-dataset/repos/foo3\"}",
+    "{\"type\": \"stored\", \"id\": 1477}",
+    "{\"type\": \"stored\", \"id\": 1478}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 1479,
+        "context": [
+          {
+            "type": "stored",
+            "id": 1480
+          },
+          {
+            "type": "stored",
+            "id": 1481
+          },
+          {
+            "type": "stored",
+            "id": 1482
+          },
+          {
+            "type": "stored",
+            "id": 1483
+          },
+          {
+            "type": "stored",
+            "id": 1484
+          },
+          {
+            "type": "stored",
+            "id": 1485
+          },
+          {
+            "type": "stored",
+            "id": 1486
+          },
+          {
+            "type": "stored",
+            "id": 1487
+          },
+          {
+            "type": "stored",
+            "id": 1488
+          },
+          {
+            "type": "stored",
+            "id": 1489
+          },
+          {
+            "type": "stored",
+            "id": 1490
+          },
+          {
+            "type": "stored",
+            "id": 1491
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 1492,
+            "context": [
+              {
+                "type": "stored",
+                "id": 1493
+              },
+              {
+                "type": "stored",
+                "id": 1494
+              },
+              {
+                "type": "stored",
+                "id": 1495
+              },
+              {
+                "type": "stored",
+                "id": 1496
+              },
+              {
+                "type": "stored",
+                "id": 1497
+              },
+              {
+                "type": "stored",
+                "id": 1498
+              },
+              {
+                "type": "stored",
+                "id": 1499
+              },
+              {
+                "type": "stored",
+                "id": 1500
+              },
+              {
+                "type": "stored",
+                "id": 1501
+              },
+              {
+                "type": "stored",
+                "id": 1502
+              },
+              {
+                "type": "stored",
+                "id": 1503
+              },
+              {
+                "type": "stored",
+                "id": 1504
+              },
+              {
+                "type": "stored",
+                "id": 1505
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 1506
+              },
+              {
+                "type": "stored",
+                "id": 1507
+              },
+              {
+                "type": "stored",
+                "id": 1508
+              },
+              {
+                "type": "stored",
+                "id": 1509
+              },
+              {
+                "type": "stored",
+                "id": 1510
+              }
+            ]
+          },
+          "n_step": -13731622832297490474074112,
+          "goals": []
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 1511,
+        "context": [
+          {
+            "type": "stored",
+            "id": 1512
+          },
+          {
+            "type": "stored",
+            "id": 1513
+          },
+          {
+            "type": "stored",
+            "id": 1514
+          },
+          {
+            "type": "stored",
+            "id": 1515
+          },
+          {
+            "type": "stored",
+            "id": 1516
+          },
+          {
+            "type": "stored",
+            "id": 1517
+          }
+        ]
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,82 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo3/mnxm.v\", \"workspace\": \"/coq-dataset/repos/foo3\", \"repository\": \"/coq-dataset/repos/foo3\"}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 1683,
+        "context": [
+          {
+            "type": "stored",
+            "id": 1684
+          },
+          {
+            "type": "stored",
+            "id": 1685
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 1686,
+            "context": [
+              {
+                "type": "stored",
+                "id": 1687
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 1688
+              },
+              {
+                "type": "stored",
+                "id": 1689
+              },
+              {
+                "type": "stored",
+                "id": 1690
+              },
+              {
+                "type": "stored",
+                "id": 1691
+              },
+              {
+                "type": "stored",
+                "id": 1692
+              },
+              {
+                "type": "stored",
+                "id": 1693
+              },
+              {
+                "type": "stored",
+                "id": 1694
+              },
+              {
+                "type": "stored",
+                "id": 1695
+              },
+              {
+                "type": "stored",
+                "id": 1696
+              }
+            ]
+          },
+          "n_step": -755,
+          "goals": [
+            "\n\nwcqqXEKBSnko"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,18 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo3/one.v\", \"workspace\": \"/coq-dataset/repos/foo3\", \"repository\": \"/coq-dataset/repos/foo3\"}",
+    "{\"type\": \"stored\", \"id\": 1655}",
+    "{\"type\": \"stored\", \"id\": 1656}",
+    "{\"type\": \"stored\", \"id\": 1657}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 1658,
+        "context": []
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,263 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo3/pdotgaklf.v\", \"workspace\": \"/coq-dataset/repos/foo3\", \"repository\": \"/coq-dataset/repos/foo3\"}",
+    "{\"type\": \"stored\", \"id\": 1607}",
+    "{\"type\": \"stored\", \"id\": 1608}",
+    "{\"type\": \"stored\", \"id\": 1609}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 1610,
+        "context": [
+          {
+            "type": "stored",
+            "id": 1611
+          },
+          {
+            "type": "stored",
+            "id": 1612
+          },
+          {
+            "type": "stored",
+            "id": 1613
+          },
+          {
+            "type": "stored",
+            "id": 1614
+          },
+          {
+            "type": "stored",
+            "id": 1615
+          }
+        ]
+      },
+      "steps": []
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 1616,
+        "context": [
+          {
+            "type": "stored",
+            "id": 1617
+          },
+          {
+            "type": "stored",
+            "id": 1618
+          },
+          {
+            "type": "stored",
+            "id": 1619
+          },
+          {
+            "type": "stored",
+            "id": 1620
+          },
+          {
+            "type": "stored",
+            "id": 1621
+          },
+          {
+            "type": "stored",
+            "id": 1622
+          },
+          {
+            "type": "stored",
+            "id": 1623
+          },
+          {
+            "type": "stored",
+            "id": 1624
+          },
+          {
+            "type": "stored",
+            "id": 1625
+          },
+          {
+            "type": "stored",
+            "id": 1626
+          },
+          {
+            "type": "stored",
+            "id": 1627
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 1628,
+            "context": [
+              {
+                "type": "stored",
+                "id": 1629
+              },
+              {
+                "type": "stored",
+                "id": 1630
+              },
+              {
+                "type": "stored",
+                "id": 1631
+              },
+              {
+                "type": "stored",
+                "id": 1632
+              },
+              {
+                "type": "stored",
+                "id": 1633
+              },
+              {
+                "type": "stored",
+                "id": 1634
+              },
+              {
+                "type": "stored",
+                "id": 1635
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 1636
+              },
+              {
+                "type": "stored",
+                "id": 1637
+              }
+            ]
+          },
+          "n_step": 130,
+          "goals": [
+            "ACRiJUSQOoKn\nydNIwLR\nanPew\nfGKVo\n\nnNWPNajb",
+            "lUWCOFwO\njfsoVh\naxlSufCAVKzNT\nEioQyefSHfou\nln\nZh\n\nxvo",
+            "tD\nePz\nIbwz\nw\n\nj",
+            "\n\nWWY",
+            "UrwJ\nswnJY\nI\n\nqkEaHEA"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 1638,
+            "context": [
+              {
+                "type": "stored",
+                "id": 1639
+              }
+            ]
+          },
+          "step": {
+            "text": "\r\udabd\udd80",
+            "context": []
+          },
+          "n_step": 36291,
+          "goals": [
+            "\n\nthen",
+            "x\nxvvMTBIOn\nQWNM\nNYeN\nbKibVPjFFGlZAE\nCSPVsiPDta\nj\nuIO\n\nthen",
+            "hFfbUNy\nLi\nbaM\nUZsYIAwZCWdGsTgTG\nxQwO\nd\nG\nKKkIbg\n\nu",
+            "Jn\n\nUbNjpiXvnc"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 1640,
+            "context": [
+              {
+                "type": "stored",
+                "id": 1641
+              }
+            ]
+          },
+          "step": {
+            "text": "=\u007f\u00e1\u009f\ud9f5\udd12\u00b2\u00ec4\ti\u001dw",
+            "context": [
+              {
+                "type": "stored",
+                "id": 1642
+              },
+              {
+                "type": "stored",
+                "id": 1643
+              }
+            ]
+          },
+          "n_step": 11525183690315290509860322158099562496,
+          "goals": [
+            "c\n\nGreQrOeZ",
+            "IsRmPDxIAVtmzVs\nIpPV\no\nQ\n\nod"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 1644,
+            "context": [
+              {
+                "type": "stored",
+                "id": 1645
+              },
+              {
+                "type": "stored",
+                "id": 1646
+              },
+              {
+                "type": "stored",
+                "id": 1647
+              },
+              {
+                "type": "stored",
+                "id": 1648
+              },
+              {
+                "type": "stored",
+                "id": 1649
+              },
+              {
+                "type": "stored",
+                "id": 1650
+              },
+              {
+                "type": "stored",
+                "id": 1651
+              },
+              {
+                "type": "stored",
+                "id": 1652
+              }
+            ]
+          },
+          "step": {
+            "text": "A;o\u0089\u00cd\udac7\uddda\u00b4\udbda\udf89\u00bd$\udbfe\udfc6\u00a6\ud881\udf6f$\ud98d\udf36\u00f4\u00ac6\u001e\udb9b\ude3e\n\ud97b\udd91\u001d\u00c3<\u00ea\ud951\udc8e\ud954\udc2e\u0001\u00ce\u00ea\u0019\u0095T\ud9b4\udfb1",
+            "context": [
+              {
+                "type": "stored",
+                "id": 1653
+              },
+              {
+                "type": "stored",
+                "id": 1654
+              }
+            ]
+          },
+          "n_step": 7426,
+          "goals": [
+            "\n\nNrNPxsQ",
+            "g\nbhJVNWFdpU\nMqJfayHTex\nQ\nCGELKWp\nvgeuzuOE\n\nRkShk",
+            "twd\no\nfrwMqeWgauju\n\nJS",
+            "HtutLDALw\nwqAw\nZirXEH\ncdwCDZj\nQeUW\nqGBzLEOeb\nTVOd\nA\nGW\ntKV\nNPVLOMHtbkrgp\nTvRewEl\nWqEUrlJx\ni\nelzZBrnw\n\nWbEwqFyg"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,128 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo3/pdzeklkxnba.v\", \"workspace\": \"/coq-dataset/repos/foo3\", \"repository\": \"/coq-dataset/repos/foo3\"}",
+    "{\"type\": \"stored\", \"id\": 1560}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 1561,
+        "context": [
+          {
+            "type": "stored",
+            "id": 1562
+          },
+          {
+            "type": "stored",
+            "id": 1563
+          },
+          {
+            "type": "stored",
+            "id": 1564
+          },
+          {
+            "type": "stored",
+            "id": 1565
+          },
+          {
+            "type": "stored",
+            "id": 1566
+          },
+          {
+            "type": "stored",
+            "id": 1567
+          },
+          {
+            "type": "stored",
+            "id": 1568
+          },
+          {
+            "type": "stored",
+            "id": 1569
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 1570,
+            "context": [
+              {
+                "type": "stored",
+                "id": 1571
+              },
+              {
+                "type": "stored",
+                "id": 1572
+              },
+              {
+                "type": "stored",
+                "id": 1573
+              },
+              {
+                "type": "stored",
+                "id": 1574
+              },
+              {
+                "type": "stored",
+                "id": 1575
+              },
+              {
+                "type": "stored",
+                "id": 1576
+              },
+              {
+                "type": "stored",
+                "id": 1577
+              },
+              {
+                "type": "stored",
+                "id": 1578
+              },
+              {
+                "type": "stored",
+                "id": 1579
+              },
+              {
+                "type": "stored",
+                "id": 1580
+              }
+            ]
+          },
+          "step": {
+            "text": "\u0081\u00df\t\u0098(\u00ea",
+            "context": [
+              {
+                "type": "stored",
+                "id": 1581
+              }
+            ]
+          },
+          "n_step": 18895,
+          "goals": [
+            "JVYmOK\nPyLuPusYh\njstsfTRDcKLSvTbHe\nltFJrnqlk\nFai\ncIIEVQRXDHM\nr\nda\ntD\n\noFyoQOBwx",
+            "\n\nwo",
+            "m\nzkL\nvLwgnVdIBRCyTOU\naXlZv\nlA\nP\nRELATION\nbnph\nKiXOzo\nr\no\nm\nassistant\nCeyQfUuxBdHfpoNhX\nRm\nzjcYIcCYS\n\nhSjJFzqQSivaIy",
+            "C\nmwT\n\nqDZI",
+            "Zt\njs\nHssaTJblYteUFqZRMquQHyT\nI\nsGPg\nThqEx\nofSsJqb\nHnAJC\n\nZI",
+            "XCmodXNNWaNGYB\npt\nQcL\nj\nSiTMdi\nOrumwg\nsBo\nWZC\njE\nDD\nZaRuxDHQfsGTlIqYegRXqUG\nHnSmfVTl\nMLg\nNNYnQGcA\nEonSeuH\nclIZMwaYdJkJdw\nwvK\n\nuxwHCBti",
+            "HkWaQInh\nY\nfhY\nBaT\nbXuABLBo\nvbpiKP\nXGGvJY\n\nPQapoVo",
+            "CnoHK\n\nx",
+            "QiZOPNkjEowrlq\n\nmgMmCJz",
+            "a\nafVQ\nHVNVmRYPovJW\nnone\ntsV\nZG\nzZJD\nRxTRkTrB\na\nL\ndGWlWqE\ncn\n\nVY",
+            "ixsfkGZg\nv\ndB\nvqkdJBPgbqmafxH\nAKqVPYpkGKVqc\nQEhIwHIXT\neRNBXFrSsFi\nwtCIL\nk\noDdgDduatg\npkwx\nPuyRym\nAUqZROPlzaOjfwk\nLjBPwfB\ngK\ng\nYhivxWHk\nnFWSV\nvG\nnyCUfDppuysmKpZvAqtb\nxQmnPU\n\nfP",
+            "yC\nY\nu\nfouwaUamLAzuYX\nDVz\nioeLBVYyAOz\nnull\nAYLeXz\nk\nZkwTind\nTTjeanu\njPEG\nFBViSTGNLC\n\nD",
+            "\n\nAQo",
+            "VQw\n\nHuDyJ",
+            "lKqDHp\nWkoMtcSr\n\nIHs",
+            "YM\nxvKCyPLb\nyKvr\nRTASLpOfvnDUPxKNk\npwlWmcigmcTt\n\nmvxUZ",
+            "f\nQba\nQWkPQvQl\n\nRQ",
+            "Ql\nIRIPgFsvCaehEo\np\nFbDWVSUvNHhQelCsJc\nMgF\nTWGJJ\niP\nYLksUw\nwi\nQnqLQVQYcAXZmJMAXpsc\nGVV\nT\nPBBJhM\nBvASLvfGfHxGuvAdTx\noItfmGpSda\nj\nbLUcvyWs\nTjWLH\n\nx"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
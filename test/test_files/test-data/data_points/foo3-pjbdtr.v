@@ -0,0 +1,228 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo3/pjbdtr.v\", \"workspace\": \"/coq-dataset/repos/foo3\", \"repository\": \"/coq-dataset/repos/foo3\"}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 1353,
+        "context": [
+          {
+            "type": "stored",
+            "id": 1354
+          },
+          {
+            "type": "stored",
+            "id": 1355
+          },
+          {
+            "type": "stored",
+            "id": 1356
+          },
+          {
+            "type": "stored",
+            "id": 1357
+          },
+          {
+            "type": "stored",
+            "id": 1358
+          },
+          {
+            "type": "stored",
+            "id": 1359
+          },
+          {
+            "type": "stored",
+            "id": 1360
+          },
+          {
+            "type": "stored",
+            "id": 1361
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 1362,
+            "context": []
+          },
+          "step": {
+            "text": "\u0000\u00d2\u0095\u00d4\ud892\udca4",
+            "context": [
+              {
+                "type": "stored",
+                "id": 1363
+              },
+              {
+                "type": "stored",
+                "id": 1364
+              },
+              {
+                "type": "stored",
+                "id": 1365
+              },
+              {
+                "type": "stored",
+                "id": 1366
+              },
+              {
+                "type": "stored",
+                "id": 1367
+              },
+              {
+                "type": "stored",
+                "id": 1368
+              },
+              {
+                "type": "stored",
+                "id": 1369
+              },
+              {
+                "type": "stored",
+                "id": 1370
+              },
+              {
+                "type": "stored",
+                "id": 1371
+              }
+            ]
+          },
+          "n_step": 70,
+          "goals": [
+            "NmRCaXxna\nmhm\ngjVnatt\nNIL\nYlWh\nEkgzpUlmBvr\nflgz\nsGnkVnqx\noMKCRQdL\n\nfAPxgsZVhhtgwqAoqBO",
+            "K\nmnVE\n\nCOFIXPOINT",
+            "JV\n\ncWufQtsUTmvovmbY",
+            "UrViGb\nscVBD\njdtFo\nzV\no\nRWRpZpVo\n\ngIGqxIA",
+            "Q\nsfMo\nfalse\nJzvBNHcSkS\nOvG\nIN\nWzcuuF\nXBp\nLJZRXDtyaxLH\nTYCJze\nZmVFoI\ne\nsJP\nbh\nXB\noIJ\nREMARK\nwI\nBIFW\naY\nBC\nur\nqXsWHj\n\nBX"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 1372,
+            "context": [
+              {
+                "type": "stored",
+                "id": 1373
+              },
+              {
+                "type": "stored",
+                "id": 1374
+              },
+              {
+                "type": "stored",
+                "id": 1375
+              },
+              {
+                "type": "stored",
+                "id": 1376
+              }
+            ]
+          },
+          "step": {
+            "text": "B\u00dd",
+            "context": [
+              {
+                "type": "stored",
+                "id": 1377
+              },
+              {
+                "type": "stored",
+                "id": 1378
+              },
+              {
+                "type": "stored",
+                "id": 1379
+              },
+              {
+                "type": "stored",
+                "id": 1380
+              },
+              {
+                "type": "stored",
+                "id": 1381
+              },
+              {
+                "type": "stored",
+                "id": 1382
+              },
+              {
+                "type": "stored",
+                "id": 1383
+              },
+              {
+                "type": "stored",
+                "id": 1384
+              }
+            ]
+          },
+          "n_step": 9966,
+          "goals": [
+            "rhSb\nNNGBpfoAuruLDUhp\n\ntextDocumentSync",
+            "\n\nNIL",
+            "wRFS\nomfEldjFeEJp\npfSD\nalMWMnNGRRnNP\n\nyZk",
+            "ane\nQLVXQYuLJpH\ny\naYlNJs\n\nuKjRA",
+            "FCwdk\nUk\nEk\nTH\nZ\nuOj\nfnFQ\nktKQieA\nlsaB\nP\nTGaMkkmS\n\nPDNZBtowtzXTBn",
+            "eIcz\nPhu\nj\nwaXf\nBK\nexxMx\nuaKQXiEboNVwgZ\nname\nw\n\nikodh"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 1385,
+            "context": [
+              {
+                "type": "stored",
+                "id": 1386
+              },
+              {
+                "type": "stored",
+                "id": 1387
+              },
+              {
+                "type": "stored",
+                "id": 1388
+              },
+              {
+                "type": "stored",
+                "id": 1389
+              },
+              {
+                "type": "stored",
+                "id": 1390
+              },
+              {
+                "type": "stored",
+                "id": 1391
+              }
+            ]
+          },
+          "step": {
+            "text": "Eai\u00a5",
+            "context": [
+              {
+                "type": "stored",
+                "id": 1392
+              },
+              {
+                "type": "stored",
+                "id": 1393
+              },
+              {
+                "type": "stored",
+                "id": 1394
+              }
+            ]
+          },
+          "n_step": 32926685,
+          "goals": [
+            "iOQLvozgjTZBlmet\nyiSMF\nWefXPwlBw\nFqpVoWhtlWuMxjtNkzqUJ\nOsqY\nhtfv\nNpkavW\nX\npN\nEUZqcVDUN\nb\nzkklrwBFQSBijIQQjOkngHoeDsyz\nRpWu\nplkitauElesrwHzhSsfvRnUYJWK\n\nFcZFPYipWQQ"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
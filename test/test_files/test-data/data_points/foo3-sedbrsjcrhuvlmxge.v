@@ -0,0 +1,245 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo3/sedbrsjcrhuvlmxge.v\", \"workspace\": \"/coq-dataset/repos/foo3\", \"repository\": \"/coq-dataset/repos/foo3\"}",
+    "{\"type\": \"stored\", \"id\": 1518}",
+    "{\"type\": \"stored\", \"id\": 1519}",
+    "{\"type\": \"stored\", \"id\": 1520}",
+    "{\"type\": \"stored\", \"id\": 1521}",
+    "{\"type\": \"stored\", \"id\": 1522}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 1523,
+        "context": [
+          {
+            "type": "stored",
+            "id": 1524
+          },
+          {
+            "type": "stored",
+            "id": 1525
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 1526,
+            "context": [
+              {
+                "type": "stored",
+                "id": 1527
+              }
+            ]
+          },
+          "step": {
+            "text": "\u0015\udb87\udfcfK{\u0099\u00ca\u00d3e",
+            "context": [
+              {
+                "type": "stored",
+                "id": 1528
+              },
+              {
+                "type": "stored",
+                "id": 1529
+              },
+              {
+                "type": "stored",
+                "id": 1530
+              },
+              {
+                "type": "stored",
+                "id": 1531
+              },
+              {
+                "type": "stored",
+                "id": 1532
+              },
+              {
+                "type": "stored",
+                "id": 1533
+              },
+              {
+                "type": "stored",
+                "id": 1534
+              },
+              {
+                "type": "stored",
+                "id": 1535
+              },
+              {
+                "type": "stored",
+                "id": 1536
+              }
+            ]
+          },
+          "n_step": -11426789,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 1537,
+            "context": []
+          },
+          "step": {
+            "text": "\u00f8",
+            "context": [
+              {
+                "type": "stored",
+                "id": 1538
+              },
+              {
+                "type": "stored",
+                "id": 1539
+              },
+              {
+                "type": "stored",
+                "id": 1540
+              },
+              {
+                "type": "stored",
+                "id": 1541
+              }
+            ]
+          },
+          "n_step": -2506552,
+          "goals": [
+            "\n\nasz",
+            "ovnc\nxPT\nDirPath\n\nv",
+            "theorem\nSJ\nV\nT\n\nXKV",
+            "vdWgwJS\nA\nPJl\nlzZgexyY\n\neW",
+            "bNVFOh\nNaN\nKGrpssmRoQpGOY\nsMmCa\nAOp\na\nIRShyBiJMgNdSmPV\ner\nQ\nfid\nVBPpywYXw\nzj\nzcHXZAAG\nMBlNuuOzLRniD\nxYAo\nVmpsTFo\n\nAZ",
+            "bxYrdA\n\nYRfDQh",
+            "\n\nMXsc",
+            "Uqmq\ngo\nVCPZAn\n\nGSwe",
+            "kVWFM\nIqMQlcqi\niWW\nZB\nZo\nZx\n\nyrS",
+            "jpMbCm\nQyH\n\nTP",
+            "HCseXZYCWZZm\n\nFALSE",
+            "ffsmIHmsgUi\nwzJgf\nv\nL\nKruNJgmRg\np\nldijnPtwTTbc\nkc\nZthtn\n\nIHS",
+            "j\nREY\nlCk\nXTWl\nvocab\nH\nqVPJLH\noOPzK\n\npPMXsX",
+            "W\n\nt",
+            "Q\nAIKkP\nj\nfRcbL\nF\ncZ\n\nWR",
+            "aTjJwQ\nAkMxeiUBLDld\nnUrcXIrA\nYhjFYgsgGTlf\ngR\nZXh\noRkPQsnxBtEeJ\nndxoidE\nhJxtntyTmRDCwHGlBJqiF\nYotz\nww\npsQy\nyPo\nvJlPrVnnD\nsBXEhhhMGUI\ngDDzB\n\nfrCF",
+            "odaobUKPSloRnz\nojw\nQpPnd\ngWVPlC\nhpcpvReRBcfgwr\nRN\nX\ncyV\npRomYWLtUPkZ\nTBcnwZL\n\nR",
+            "rvhXQAfaLKd\ntH\nWWwVviNaBgN\nBF\nf\nZurxxMlM\nFN\n\nCOFIXPOINT"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 1542,
+            "context": []
+          },
+          "step": {
+            "text": "\u0090",
+            "context": []
+          },
+          "n_step": -1266,
+          "goals": [
+            "\n\nVU",
+            "DPo\no\n\nP",
+            "formatters\nbIg\nUOk\neERCbNvfWMOIsk\neRW\ni\n\nTVJ",
+            "WWyxo\nT\nkind\nLFsMG\nEjYWD\nss\nGAOQD\n\nTOO",
+            "\n\npG",
+            "lIj\n\nuMwp",
+            "PHLoLME\ndOnxo\nfxvdEEnVUIEbz\nfunnefOAAddi\n\nLxhznDB",
+            "\n\nuMZpdMGC"
+          ]
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 1543,
+        "context": [
+          {
+            "type": "stored",
+            "id": 1544
+          },
+          {
+            "type": "stored",
+            "id": 1545
+          },
+          {
+            "type": "stored",
+            "id": 1546
+          },
+          {
+            "type": "stored",
+            "id": 1547
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 1548,
+            "context": [
+              {
+                "type": "stored",
+                "id": 1549
+              }
+            ]
+          },
+          "step": {
+            "text": "\udb88\udee8\udb0b\udeb4",
+            "context": [
+              {
+                "type": "stored",
+                "id": 1550
+              },
+              {
+                "type": "stored",
+                "id": 1551
+              },
+              {
+                "type": "stored",
+                "id": 1552
+              },
+              {
+                "type": "stored",
+                "id": 1553
+              },
+              {
+                "type": "stored",
+                "id": 1554
+              },
+              {
+                "type": "stored",
+                "id": 1555
+              },
+              {
+                "type": "stored",
+                "id": 1556
+              },
+              {
+                "type": "stored",
+                "id": 1557
+              },
+              {
+                "type": "stored",
+                "id": 1558
+              },
+              {
+                "type": "stored",
+                "id": 1559
+              }
+            ]
+          },
+          "n_step": -1038995,
+          "goals": [
+            "\n\nQjBFDrgFhhjHL",
+            "kGRgkwEfxleBPDcXlCfhDsz\nssCHTJ\nWqGlNr\nInf\nId\npBTptxqfdzoPvMDBQNYDKbFcY\ng\ngIgCuoYeMXm\ne\n\nadgTQRACeTODIwI",
+            "JtV\njz\nxBL\nvBinN\nR\nF\nCYX\nbVg\nq\nGsiB\nw\n\nQmQPkjqbJuGw"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,8 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo3/sfcjbryve.v\", \"workspace\": \"/coq-dataset/repos/foo3\", \"repository\": \"/coq-dataset/repos/foo3\"}",
+    "{\"type\": \"stored\", \"id\": 1475}",
+    "{\"type\": \"stored\", \"id\": 1476}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,379 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo3/wrr.v\", \"workspace\": \"/coq-dataset/repos/foo3\", \"repository\": \"/coq-dataset/repos/foo3\"}",
+    "{\"type\": \"stored\", \"id\": 1192}",
+    "{\"type\": \"stored\", \"id\": 1193}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 1194,
+        "context": [
+          {
+            "type": "stored",
+            "id": 1195
+          },
+          {
+            "type": "stored",
+            "id": 1196
+          },
+          {
+            "type": "stored",
+            "id": 1197
+          },
+          {
+            "type": "stored",
+            "id": 1198
+          },
+          {
+            "type": "stored",
+            "id": 1199
+          },
+          {
+            "type": "stored",
+            "id": 1200
+          },
+          {
+            "type": "stored",
+            "id": 1201
+          },
+          {
+            "type": "stored",
+            "id": 1202
+          },
+          {
+            "type": "stored",
+            "id": 1203
+          },
+          {
+            "type": "stored",
+            "id": 1204
+          },
+          {
+            "type": "stored",
+            "id": 1205
+          },
+          {
+            "type": "stored",
+            "id": 1206
+          },
+          {
+            "type": "stored",
+            "id": 1207
+          },
+          {
+            "type": "stored",
+            "id": 1208
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 1209,
+            "context": [
+              {
+                "type": "stored",
+                "id": 1210
+              },
+              {
+                "type": "stored",
+                "id": 1211
+              },
+              {
+                "type": "stored",
+                "id": 1212
+              },
+              {
+                "type": "stored",
+                "id": 1213
+              },
+              {
+                "type": "stored",
+                "id": 1214
+              },
+              {
+                "type": "stored",
+                "id": 1215
+              },
+              {
+                "type": "stored",
+                "id": 1216
+              },
+              {
+                "type": "stored",
+                "id": 1217
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00cb",
+            "context": [
+              {
+                "type": "stored",
+                "id": 1218
+              },
+              {
+                "type": "stored",
+                "id": 1219
+              }
+            ]
+          },
+          "n_step": -1359,
+          "goals": [
+            "NacDjPjB\ngMeqmfGRl\nSfOiCwUPh\nAE\nuo\n\nkzEh",
+            "nOupUlduY\nS\nGeRjcxA\n\nPqPoIj"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 1220,
+            "context": [
+              {
+                "type": "stored",
+                "id": 1221
+              }
+            ]
+          },
+          "step": {
+            "text": "\uda75\uddda\u0003\u00e2S",
+            "context": [
+              {
+                "type": "stored",
+                "id": 1222
+              }
+            ]
+          },
+          "n_step": 317,
+          "goals": [
+            "DIQOjA\nokGojVf\nt\nMxISqZY\n\nVqlH"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 1223,
+            "context": [
+              {
+                "type": "stored",
+                "id": 1224
+              },
+              {
+                "type": "stored",
+                "id": 1225
+              },
+              {
+                "type": "stored",
+                "id": 1226
+              },
+              {
+                "type": "stored",
+                "id": 1227
+              },
+              {
+                "type": "stored",
+                "id": 1228
+              },
+              {
+                "type": "stored",
+                "id": 1229
+              },
+              {
+                "type": "stored",
+                "id": 1230
+              }
+            ]
+          },
+          "step": {
+            "text": "proof_script",
+            "context": []
+          },
+          "n_step": 1280,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 1231,
+            "context": [
+              {
+                "type": "stored",
+                "id": 1232
+              },
+              {
+                "type": "stored",
+                "id": 1233
+              },
+              {
+                "type": "stored",
+                "id": 1234
+              },
+              {
+                "type": "stored",
+                "id": 1235
+              },
+              {
+                "type": "stored",
+                "id": 1236
+              },
+              {
+                "type": "stored",
+                "id": 1237
+              },
+              {
+                "type": "stored",
+                "id": 1238
+              },
+              {
+                "type": "stored",
+                "id": 1239
+              },
+              {
+                "type": "stored",
+                "id": 1240
+              },
+              {
+                "type": "stored",
+                "id": 1241
+              },
+              {
+                "type": "stored",
+                "id": 1242
+              },
+              {
+                "type": "stored",
+                "id": 1243
+              },
+              {
+                "type": "stored",
+                "id": 1244
+              },
+              {
+                "type": "stored",
+                "id": 1245
+              },
+              {
+                "type": "stored",
+                "id": 1246
+              },
+              {
+                "type": "stored",
+                "id": 1247
+              },
+              {
+                "type": "stored",
+                "id": 1248
+              },
+              {
+                "type": "stored",
+                "id": 1249
+              },
+              {
+                "type": "stored",
+                "id": 1250
+              },
+              {
+                "type": "stored",
+                "id": 1251
+              },
+              {
+                "type": "stored",
+                "id": 1252
+              },
+              {
+                "type": "stored",
+                "id": 1253
+              },
+              {
+                "type": "stored",
+                "id": 1254
+              },
+              {
+                "type": "stored",
+                "id": 1255
+              },
+              {
+                "type": "stored",
+                "id": 1256
+              },
+              {
+                "type": "stored",
+                "id": 1257
+              },
+              {
+                "type": "stored",
+                "id": 1258
+              }
+            ]
+          },
+          "step": {
+            "text": "\u0010\u00e6R\u00f9\u0000\u00d4\\h",
+            "context": [
+              {
+                "type": "stored",
+                "id": 1259
+              },
+              {
+                "type": "stored",
+                "id": 1260
+              },
+              {
+                "type": "stored",
+                "id": 1261
+              },
+              {
+                "type": "stored",
+                "id": 1262
+              },
+              {
+                "type": "stored",
+                "id": 1263
+              },
+              {
+                "type": "stored",
+                "id": 1264
+              },
+              {
+                "type": "stored",
+                "id": 1265
+              },
+              {
+                "type": "stored",
+                "id": 1266
+              },
+              {
+                "type": "stored",
+                "id": 1267
+              },
+              {
+                "type": "stored",
+                "id": 1268
+              },
+              {
+                "type": "stored",
+                "id": 1269
+              },
+              {
+                "type": "stored",
+                "id": 1270
+              },
+              {
+                "type": "stored",
+                "id": 1271
+              },
+              {
+                "type": "stored",
+                "id": 1272
+              }
+            ]
+          },
+          "n_step": 175872,
+          "goals": []
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,267 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo3/wya.v\", \"workspace\": \"/coq-dataset/repos/foo3\", \"repository\": \"/coq-dataset/repos/foo3\"}",
+    "{\"type\": \"stored\", \"id\": 1707}",
+    "{\"type\": \"stored\", \"id\": 1708}",
+    "{\"type\": \"stored\", \"id\": 1709}",
+    "{\"type\": \"stored\", \"id\": 1710}",
+    "{\"type\": \"stored\", \"id\": 1711}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 1712,
+        "context": [
+          {
+            "type": "stored",
+            "id": 1713
+          },
+          {
+            "type": "stored",
+            "id": 1714
+          },
+          {
+            "type": "stored",
+            "id": 1715
+          },
+          {
+            "type": "stored",
+            "id": 1716
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 1717,
+            "context": [
+              {
+                "type": "stored",
+                "id": 1718
+              },
+              {
+                "type": "stored",
+                "id": 1719
+              },
+              {
+                "type": "stored",
+                "id": 1720
+              },
+              {
+                "type": "stored",
+                "id": 1721
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00b9",
+            "context": [
+              {
+                "type": "stored",
+                "id": 1722
+              },
+              {
+                "type": "stored",
+                "id": 1723
+              },
+              {
+                "type": "stored",
+                "id": 1724
+              },
+              {
+                "type": "stored",
+                "id": 1725
+              },
+              {
+                "type": "stored",
+                "id": 1726
+              },
+              {
+                "type": "stored",
+                "id": 1727
+              },
+              {
+                "type": "stored",
+                "id": 1728
+              },
+              {
+                "type": "stored",
+                "id": 1729
+              },
+              {
+                "type": "stored",
+                "id": 1730
+              },
+              {
+                "type": "stored",
+                "id": 1731
+              },
+              {
+                "type": "stored",
+                "id": 1732
+              }
+            ]
+          },
+          "n_step": 206613,
+          "goals": [
+            "M\n\nYovYNLqCRz",
+            "xFU\n\nKe",
+            "tokens\nCPpNg\nss\nSaDxurYlhYvrRoquaVMxKDphlgRebyDn\n\nFofAk",
+            "kcmY\nBQoeypDl\nG\n\nC",
+            "laJ\nj\n\nmz",
+            "\n\neqFFkR",
+            "\n\nw",
+            "a\nb\npSdrJHg\n\nstate",
+            "\n\nDuyhGtApF",
+            "uVRu\nwnDEhuEuaSRbvx\nYBsQgbexx\nEby\nmpSYdTdIwFYoPHRPPGNywsFt\n\nhn",
+            "s\nDYK\nMGQ\naj\n\nZlgZKloiO",
+            "Ko\nMn\nx\nUx\ngkm\nwaxUiocrZzD\nZfovQCWWqTQM\neCOxYyJOZQKjVpd\nU\nZ\nizGTdV\n\nsAdlcVA",
+            "Hb\n\nYVfyEm"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 1733,
+            "context": []
+          },
+          "step": {
+            "text": "A\udb0b\udef3z",
+            "context": [
+              {
+                "type": "stored",
+                "id": 1734
+              }
+            ]
+          },
+          "n_step": 42988029009573781504,
+          "goals": [
+            "XmemtpXzWCBIc\nWKXl\ncpqpF\nAzNYXKGleQTttzBE\nbytes\niGpTlv\n\nq",
+            "R\nlvpxaI\nueDo\nz\nn\nNULL\nVZJEBGCd\nyP\n\nE",
+            "gZu\ntJZXAxagnwxRIwOKcWqoemEemyDxWvGPDMJwFyVO\nyt\nmTmmB\nQwnJTLo\n\nyHrb"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 1735,
+            "context": []
+          },
+          "step": {
+            "text": "\ud884\udc58\u000e\u00ee\ud909\udcd8\u00fb",
+            "context": [
+              {
+                "type": "stored",
+                "id": 1736
+              },
+              {
+                "type": "stored",
+                "id": 1737
+              }
+            ]
+          },
+          "n_step": -2914428516493,
+          "goals": [
+            "QitNJGn\nc\nU\nVYV\nkcmyFdbldXv\n\nzK",
+            "QZH\nmf\n\nIPHWteSWl",
+            "JjxadseF\na\n\nsVs",
+            "ojsVYFF\nnobzpgLRryS\nv\nhBz\n\nK",
+            "S\nNo\no\n\npOvcYHXoh",
+            "\n\nFalse",
+            "wfEVROUzTG\n\nCcEr",
+            "\n\nAFGhNTmZSpZYqqZ"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 1738,
+            "context": [
+              {
+                "type": "stored",
+                "id": 1739
+              }
+            ]
+          },
+          "step": {
+            "text": "\u009b\u0011E\u001d:\u00e6",
+            "context": []
+          },
+          "n_step": -35642020,
+          "goals": []
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 1740,
+        "context": [
+          {
+            "type": "stored",
+            "id": 1741
+          },
+          {
+            "type": "stored",
+            "id": 1742
+          },
+          {
+            "type": "stored",
+            "id": 1743
+          },
+          {
+            "type": "stored",
+            "id": 1744
+          },
+          {
+            "type": "stored",
+            "id": 1745
+          },
+          {
+            "type": "stored",
+            "id": 1746
+          },
+          {
+            "type": "stored",
+            "id": 1747
+          },
+          {
+            "type": "stored",
+            "id": 1748
+          },
+          {
+            "type": "stored",
+            "id": 1749
+          },
+          {
+            "type": "stored",
+            "id": 1750
+          },
+          {
+            "type": "stored",
+            "id": 1751
+          },
+          {
+            "type": "stored",
+            "id": 1752
+          },
+          {
+            "type": "stored",
+            "id": 1753
+          },
+          {
+            "type": "stored",
+            "id": 1754
+          },
+          {
+            "type": "stored",
+            "id": 1755
+          }
+        ]
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
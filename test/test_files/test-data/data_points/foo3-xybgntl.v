@@ -0,0 +1,233 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo3/xybgntl.v\", \"workspace\": \"/coq-dataset/repos/foo3\", \"repository\": \"/coq-dataset/repos/foo3\"}",
+    "{\"type\": \"stored\", \"id\": 1273}",
+    "{\"type\": \"stored\", \"id\": 1274}",
+    "{\"type\": \"stored\", \"id\": 1275}",
+    "{\"type\": \"stored\", \"id\": 1276}",
+    "{\"type\": \"stored\", \"id\": 1277}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 1278,
+        "context": [
+          {
+            "type": "stored",
+            "id": 1279
+          }
+        ]
+      },
+      "steps": []
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 1280,
+        "context": []
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 1281,
+            "context": [
+              {
+                "type": "stored",
+                "id": 1282
+              },
+              {
+                "type": "stored",
+                "id": 1283
+              },
+              {
+                "type": "stored",
+                "id": 1284
+              },
+              {
+                "type": "stored",
+                "id": 1285
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00d0\u0001rg",
+            "context": [
+              {
+                "type": "stored",
+                "id": 1286
+              },
+              {
+                "type": "stored",
+                "id": 1287
+              },
+              {
+                "type": "stored",
+                "id": 1288
+              },
+              {
+                "type": "stored",
+                "id": 1289
+              },
+              {
+                "type": "stored",
+                "id": 1290
+              }
+            ]
+          },
+          "n_step": -39427897,
+          "goals": [
+            "TfZ\ncrQxPLndSkZuoX\nU\nNULL\n\nLvh",
+            "KJk\n\nNIL",
+            "\n\nrenvCyy",
+            "o\nzLkAxWWZlaTo\nSW\nBXPDQtfRqnWVoyc\nX\nVfJVqBJL\nttQimm\nAkknspgbTLJ\n\nxLr",
+            "bvY\n\nxcw",
+            "zhbpipQDEtRn\nn\ntimeout\ns\nVsx\nwATW\njba\nlrHdFYsnIzhX\ntBWsc\nZqF\nBEMQpLHBYVNqKzN\nohvtQjCLs\n\nEfWRJUE",
+            "BNJFmJzJvMUR\njTjBHg\nS\nwD\nQm\nWAA\nT\nBO\n\nVTMURtYiYjpwoFwZsD",
+            "xOcxY\nb\n\nOuK",
+            "y\nYrEg\nJk\nqeK\n\nsgiXNjp"
+          ]
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 1291,
+        "context": [
+          {
+            "type": "stored",
+            "id": 1292
+          },
+          {
+            "type": "stored",
+            "id": 1293
+          },
+          {
+            "type": "stored",
+            "id": 1294
+          },
+          {
+            "type": "stored",
+            "id": 1295
+          },
+          {
+            "type": "stored",
+            "id": 1296
+          },
+          {
+            "type": "stored",
+            "id": 1297
+          },
+          {
+            "type": "stored",
+            "id": 1298
+          },
+          {
+            "type": "stored",
+            "id": 1299
+          },
+          {
+            "type": "stored",
+            "id": 1300
+          },
+          {
+            "type": "stored",
+            "id": 1301
+          },
+          {
+            "type": "stored",
+            "id": 1302
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 1303,
+            "context": [
+              {
+                "type": "stored",
+                "id": 1304
+              },
+              {
+                "type": "stored",
+                "id": 1305
+              },
+              {
+                "type": "stored",
+                "id": 1306
+              },
+              {
+                "type": "stored",
+                "id": 1307
+              },
+              {
+                "type": "stored",
+                "id": 1308
+              }
+            ]
+          },
+          "step": {
+            "text": "f\u00b9S\ud93d\udda7\u00ed\u00ac$P",
+            "context": [
+              {
+                "type": "stored",
+                "id": 1309
+              },
+              {
+                "type": "stored",
+                "id": 1310
+              },
+              {
+                "type": "stored",
+                "id": 1311
+              },
+              {
+                "type": "stored",
+                "id": 1312
+              },
+              {
+                "type": "stored",
+                "id": 1313
+              },
+              {
+                "type": "stored",
+                "id": 1314
+              },
+              {
+                "type": "stored",
+                "id": 1315
+              },
+              {
+                "type": "stored",
+                "id": 1316
+              },
+              {
+                "type": "stored",
+                "id": 1317
+              },
+              {
+                "type": "stored",
+                "id": 1318
+              },
+              {
+                "type": "stored",
+                "id": 1319
+              }
+            ]
+          },
+          "n_step": -613,
+          "goals": [
+            "MjDXWDEMQBt\nuNIXHJblEg\nwas\n\nBF",
+            "NJrQ\n\nOauXxL",
+            "\n\nn",
+            "Gy\n\nMJZw"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
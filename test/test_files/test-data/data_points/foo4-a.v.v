@@ -0,0 +1,6 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo4/a.v.v\", \"workspace\": \"/coq-dataset/repos/foo4\", \"repository\": \"/coq-dataset/repos/foo4\"}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,10 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo4/appiunxjikry.v\", \"workspace\": \"/coq-dataset/repos/foo4\", \"repository\": \"/coq-dataset/repos/foo4\"}",
+    "{\"type\": \"stored\", \"id\": 2293}",
+    "{\"type\": \"stored\", \"id\": 2294}",
+    "{\"type\": \"stored\", \"id\": 2295}",
+    "{\"type\": \"stored\", \"id\": 2296}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,410 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo4/asazfy.v\", \"workspace\": \"/coq-dataset/repos/foo4\", \"repository\": \"/coq-dataset/repos/foo4\"}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 1756,
+        "context": []
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 1757,
+            "context": []
+          },
+          "step": {
+            "text": "\u00cd\u0005",
+            "context": [
+              {
+                "type": "stored",
+                "id": 1758
+              },
+              {
+                "type": "stored",
+                "id": 1759
+              }
+            ]
+          },
+          "n_step": -723,
+          "goals": [
+            "\n\nyYiT",
+            "SmRBOWd\npeNj\nTurZ\npwRleb\np\ntarget\nSBMYDciYeaaRW\nxwgqxoa\n\nXf",
+            "GLLPFaOTCdNfjCbcPRjsJomLWhFJYSsLtTMeGbBTr\nf\nO\nitEwOCS\n\nRebXQeWEiuHFegf"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 1760,
+            "context": [
+              {
+                "type": "stored",
+                "id": 1761
+              },
+              {
+                "type": "stored",
+                "id": 1762
+              },
+              {
+                "type": "stored",
+                "id": 1763
+              },
+              {
+                "type": "stored",
+                "id": 1764
+              },
+              {
+                "type": "stored",
+                "id": 1765
+              },
+              {
+                "type": "stored",
+                "id": 1766
+              },
+              {
+                "type": "stored",
+                "id": 1767
+              }
+            ]
+          },
+          "step": {
+            "text": "\u0013",
+            "context": [
+              {
+                "type": "stored",
+                "id": 1768
+              },
+              {
+                "type": "stored",
+                "id": 1769
+              },
+              {
+                "type": "stored",
+                "id": 1770
+              }
+            ]
+          },
+          "n_step": -1943,
+          "goals": [
+            "Zvq\nuser\nrzHOHtz\nI\n\nHdrny",
+            "\n\nnHPqPDrIgLuLYwesGpii",
+            "Kj\n\nOfiyxQd",
+            "ytrx\nRzF\nKBoCB\nbMGZit\npcF\nsparse\ntnx\nLgAwdimQ\nlG\nkIm\nOajkT\nX\nhSPifmzdrzfFRPSOUj\nnScWjofw\nGVjElyKeicAB\nLmNf\n\nOyMm",
+            "MDK\nIEzHagCbb\nvwFP\ngJ\nlYpGXmV\npcMce\nYqwhuNMJZ\nD\na\nNtUv\nhjPcVu\n\nZEwxKqblQKnLDz",
+            "\n\nfzsdxHq",
+            "VR\nhAg\neDzHc\ncontext\n\nEESduCM",
+            "AAw\nQga\nQLFNRMwZKZ\nwlBbfUW\nFYmjAXKBy\njxmbeycHcToEsxFYHVAN\npE\nXcIgTXDmMBVxDDOqsiRZTvINlMj\n\nePEXVMTo"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 1771,
+            "context": []
+          },
+          "step": {
+            "text": "`l\ud838\udf9f",
+            "context": [
+              {
+                "type": "stored",
+                "id": 1772
+              },
+              {
+                "type": "stored",
+                "id": 1773
+              },
+              {
+                "type": "stored",
+                "id": 1774
+              },
+              {
+                "type": "stored",
+                "id": 1775
+              },
+              {
+                "type": "stored",
+                "id": 1776
+              },
+              {
+                "type": "stored",
+                "id": 1777
+              },
+              {
+                "type": "stored",
+                "id": 1778
+              },
+              {
+                "type": "stored",
+                "id": 1779
+              }
+            ]
+          },
+          "n_step": 187254,
+          "goals": [
+            "\n\nqjK",
+            "yB\nK\npqqRZqa\nyWPlegqp\nsYJUycsgwxZhH\nhETbzUoAaYXksdnhAAaNaUMETQcQQGB\nWZvSbkqowej\n\nqfclnWFqwleOhHwZPv",
+            "oDVy\nIsr\neNefha\nAoBkvONCWLnfEK\nZVNDySCt\nkYkaE\nl\nAEPoXvilkMMoi\nH\n\nEzAexxOADvc",
+            "\n\nj",
+            "k\n\nBRAwR",
+            "ONN\ner\nACDFRdSZTGkHMBTQBfX\ntrue\ncontext\n\ndqJOkExXUwHJDDSmJ",
+            "e\n\nur",
+            "WJAbW\nW\ngpRRlVCxHQNfsfSxGujyjikAuT\nZmsBEfWrQIeG\neh\nproof\nD\nguzOBUENzMfiTXmtjzAp\ntZlZNPr\nHl\nf\n\nIaV"
+          ]
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 1780,
+        "context": []
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 1781,
+            "context": [
+              {
+                "type": "stored",
+                "id": 1782
+              },
+              {
+                "type": "stored",
+                "id": 1783
+              },
+              {
+                "type": "stored",
+                "id": 1784
+              },
+              {
+                "type": "stored",
+                "id": 1785
+              },
+              {
+                "type": "stored",
+                "id": 1786
+              },
+              {
+                "type": "stored",
+                "id": 1787
+              },
+              {
+                "type": "stored",
+                "id": 1788
+              },
+              {
+                "type": "stored",
+                "id": 1789
+              },
+              {
+                "type": "stored",
+                "id": 1790
+              },
+              {
+                "type": "stored",
+                "id": 1791
+              }
+            ]
+          },
+          "step": {
+            "text": "\t\uda1d\udefc\u001f\ud998\ude32",
+            "context": []
+          },
+          "n_step": 7480,
+          "goals": [
+            "\n\nPVhB"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 1792,
+            "context": [
+              {
+                "type": "stored",
+                "id": 1793
+              },
+              {
+                "type": "stored",
+                "id": 1794
+              },
+              {
+                "type": "stored",
+                "id": 1795
+              },
+              {
+                "type": "stored",
+                "id": 1796
+              },
+              {
+                "type": "stored",
+                "id": 1797
+              }
+            ]
+          },
+          "step": {
+            "text": "\udb5f\udf94",
+            "context": []
+          },
+          "n_step": -42432059,
+          "goals": [
+            "p\nJNaJUga\nAO\nixcvxtb\nbkTwUwpwisAefvp\nI\nHDZwoi\n\nooAk",
+            "NULL\nn\nFTmyPKFJxZTnzH\noBNu\nRH\ncTH\nJxE\nMYtvZGwrZQzsgKslR\nzOlKnXcWs\nQgu\nJ\ncBp\n\nX",
+            "vrKq\nzQSRa\nfTMbBhTJi\nNTcKoROccWVTMBH\nUIPIlLCLDa\nySYeN\nZiH\nZWgf\nmvqY\njwtyuausgvNLbn\nNt\n\nuPZGMaNM",
+            "kDCpx\njL\nng\nbnCIHIRlOS\nzXgeMOrm\nlnZm\nKDfJQj\n\nCT"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 1798,
+            "context": [
+              {
+                "type": "stored",
+                "id": 1799
+              },
+              {
+                "type": "stored",
+                "id": 1800
+              },
+              {
+                "type": "stored",
+                "id": 1801
+              },
+              {
+                "type": "stored",
+                "id": 1802
+              },
+              {
+                "type": "stored",
+                "id": 1803
+              }
+            ]
+          },
+          "step": {
+            "text": "\udaf7\udf3c'\u00b2\u00e8",
+            "context": [
+              {
+                "type": "stored",
+                "id": 1804
+              },
+              {
+                "type": "stored",
+                "id": 1805
+              },
+              {
+                "type": "stored",
+                "id": 1806
+              },
+              {
+                "type": "stored",
+                "id": 1807
+              },
+              {
+                "type": "stored",
+                "id": 1808
+              },
+              {
+                "type": "stored",
+                "id": 1809
+              },
+              {
+                "type": "stored",
+                "id": 1810
+              },
+              {
+                "type": "stored",
+                "id": 1811
+              }
+            ]
+          },
+          "n_step": -198443,
+          "goals": [
+            "vVqDB\n\nelse"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 1812,
+            "context": []
+          },
+          "step": {
+            "text": "\ud89a\udd48i\u00fc",
+            "context": [
+              {
+                "type": "stored",
+                "id": 1813
+              },
+              {
+                "type": "stored",
+                "id": 1814
+              },
+              {
+                "type": "stored",
+                "id": 1815
+              },
+              {
+                "type": "stored",
+                "id": 1816
+              },
+              {
+                "type": "stored",
+                "id": 1817
+              },
+              {
+                "type": "stored",
+                "id": 1818
+              },
+              {
+                "type": "stored",
+                "id": 1819
+              }
+            ]
+          },
+          "n_step": 813751,
+          "goals": [
+            "RYSlRHNGRrbYdzgKyWeRbLi\n\ntrue",
+            "YS\nSBSM\ntrue\nbNI\n\nZIMmqi",
+            "gA\nOOVIZCP\nyA\nudJi\nJlfiEZlpUUGZsYg\nHacPwla\nmRE\nAT\nUtNPw\nbL\n\nEakrmAmu",
+            "N\nZoLXO\n\naRPwb",
+            "ldlWlv\n\nZq",
+            "Q\n\nz",
+            "sJrEZdVJyIbmEoVcNKK\nGRlpXZ\nIZ\n\niIdZJL",
+            "hKl\nPf\nHEAD\n\nzFuwMwpAKat"
+          ]
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 1820,
+        "context": [
+          {
+            "type": "stored",
+            "id": 1821
+          },
+          {
+            "type": "stored",
+            "id": 1822
+          },
+          {
+            "type": "stored",
+            "id": 1823
+          },
+          {
+            "type": "stored",
+            "id": 1824
+          }
+        ]
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
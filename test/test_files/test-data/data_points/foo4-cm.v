@@ -0,0 +1,143 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo4/cm.v\", \"workspace\": \"/coq-dataset/repos/foo4\", \"repository\": \"/coq-dataset/repos/foo4\"}",
+    "{\"type\": \"stored\", \"id\": 2181}",
+    "{\"type\": \"stored\", \"id\": 2182}",
+    "{\"type\": \"stored\", \"id\": 2183}",
+    "{\"type\": \"stored\", \"id\": 2184}",
+    "{\"type\": \"stored\", \"id\": 2185}",
+    "{\"type\": \"stored\", \"id\": 2186}",
+    "{\"type\": \"stored\", \"id\": 2187}",
+    "{\"type\": \"stored\", \"id\": 2188}",
+    "{\"type\": \"stored\", \"id\": 2189}",
+    "{\"type\": \"stored\", \"id\": 2190}",
+    "{\"type\": \"stored\", \"id\": 2191}",
+    "{\"type\": \"stored\", \"id\": 2192}",
+    "{\"type\": \"stored\", \"id\": 2193}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 2194,
+        "context": []
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 2195,
+            "context": [
+              {
+                "type": "stored",
+                "id": 2196
+              },
+              {
+                "type": "stored",
+                "id": 2197
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 2198
+              },
+              {
+                "type": "stored",
+                "id": 2199
+              },
+              {
+                "type": "stored",
+                "id": 2200
+              },
+              {
+                "type": "stored",
+                "id": 2201
+              },
+              {
+                "type": "stored",
+                "id": 2202
+              }
+            ]
+          },
+          "n_step": 72738939,
+          "goals": [
+            "\n\nnil"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 2203,
+            "context": [
+              {
+                "type": "stored",
+                "id": 2204
+              },
+              {
+                "type": "stored",
+                "id": 2205
+              },
+              {
+                "type": "stored",
+                "id": 2206
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": []
+          },
+          "n_step": 86097034,
+          "goals": [
+            "D\nLYjgvohyTeYabb\n\neHHu",
+            "C\nwBRZGUjV\nVh\nxMjshQbVtzX\n\nL",
+            "\n\nlYBvYQ",
+            "xSBbJTVr\nin\n\nf",
+            "nFSMNxpfBhptQlFkPpdoPgxFLm\n\nkhyS",
+            "V\nkCkttkg\ndRZr\n\nNfkDdqF",
+            "XSLp\nHqZNdohIsN\n\nM"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 2207,
+            "context": [
+              {
+                "type": "stored",
+                "id": 2208
+              },
+              {
+                "type": "stored",
+                "id": 2209
+              },
+              {
+                "type": "stored",
+                "id": 2210
+              },
+              {
+                "type": "stored",
+                "id": 2211
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00f9\u00a0\ud9b8\udea5\u00ca\ud92f\udc34\udbeb\udc12\ud8ad\udcd9\u00d1",
+            "context": [
+              {
+                "type": "stored",
+                "id": 2212
+              }
+            ]
+          },
+          "n_step": 257,
+          "goals": []
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
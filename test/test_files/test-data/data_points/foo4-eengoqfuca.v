@@ -0,0 +1,363 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo4/eengoqfuca.v\", \"workspace\": \"/coq-dataset/repos/foo4\", \"repository\": \"/coq-dataset/repos/foo4\"}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 1847,
+        "context": [
+          {
+            "type": "stored",
+            "id": 1848
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 1849,
+            "context": [
+              {
+                "type": "stored",
+                "id": 1850
+              },
+              {
+                "type": "stored",
+                "id": 1851
+              },
+              {
+                "type": "stored",
+                "id": 1852
+              },
+              {
+                "type": "stored",
+                "id": 1853
+              },
+              {
+                "type": "stored",
+                "id": 1854
+              },
+              {
+                "type": "stored",
+                "id": 1855
+              },
+              {
+                "type": "stored",
+                "id": 1856
+              },
+              {
+                "type": "stored",
+                "id": 1857
+              },
+              {
+                "type": "stored",
+                "id": 1858
+              },
+              {
+                "type": "stored",
+                "id": 1859
+              },
+              {
+                "type": "stored",
+                "id": 1860
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00dd%\u00b9z\u6f1b*\u00e9\u00d5",
+            "context": [
+              {
+                "type": "stored",
+                "id": 1861
+              },
+              {
+                "type": "stored",
+                "id": 1862
+              },
+              {
+                "type": "stored",
+                "id": 1863
+              },
+              {
+                "type": "stored",
+                "id": 1864
+              }
+            ]
+          },
+          "n_step": -5935,
+          "goals": [
+            "n\n\nUE",
+            "P\nC\nrAPGToX\nLMgq\nAjIwwCdFocwYp\nuyQcF\nso\nXVt\naUmMslMdpZXL\nMKL\nJtHqDgU\nwaz\nfYzkoDZF\nwnYIZSf\nirt\n\nl"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 1865,
+            "context": [
+              {
+                "type": "stored",
+                "id": 1866
+              },
+              {
+                "type": "stored",
+                "id": 1867
+              },
+              {
+                "type": "stored",
+                "id": 1868
+              },
+              {
+                "type": "stored",
+                "id": 1869
+              },
+              {
+                "type": "stored",
+                "id": 1870
+              },
+              {
+                "type": "stored",
+                "id": 1871
+              }
+            ]
+          },
+          "step": {
+            "text": "\ua383",
+            "context": [
+              {
+                "type": "stored",
+                "id": 1872
+              },
+              {
+                "type": "stored",
+                "id": 1873
+              },
+              {
+                "type": "stored",
+                "id": 1874
+              },
+              {
+                "type": "stored",
+                "id": 1875
+              },
+              {
+                "type": "stored",
+                "id": 1876
+              },
+              {
+                "type": "stored",
+                "id": 1877
+              },
+              {
+                "type": "stored",
+                "id": 1878
+              },
+              {
+                "type": "stored",
+                "id": 1879
+              },
+              {
+                "type": "stored",
+                "id": 1880
+              }
+            ]
+          },
+          "n_step": 500,
+          "goals": [
+            "lib\nfE\n\nAKp",
+            "jy\nxgamN\n\nPE",
+            "\n\nwJmR",
+            "JqAkx\n\nPAuodoLIji",
+            "KlhZEuhIL\n\nR",
+            "HdHA\nVWtkw\nGTV\n\nGh",
+            "\n\nwyXtM",
+            "eu\nUzUztu\n\niQXyqOTq"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 1881,
+            "context": [
+              {
+                "type": "stored",
+                "id": 1882
+              },
+              {
+                "type": "stored",
+                "id": 1883
+              },
+              {
+                "type": "stored",
+                "id": 1884
+              },
+              {
+                "type": "stored",
+                "id": 1885
+              },
+              {
+                "type": "stored",
+                "id": 1886
+              },
+              {
+                "type": "stored",
+                "id": 1887
+              },
+              {
+                "type": "stored",
+                "id": 1888
+              }
+            ]
+          },
+          "step": {
+            "text": "\u000b\u0010\u0097",
+            "context": []
+          },
+          "n_step": -256,
+          "goals": [
+            "GTKFrmChXp\nafVaJkgu\nlhKvAsCtTRscsryHXWfwriA\npurity\nNUL\nCZIMtKL\nUl\np\nfFiiiyo\nfD\nGyP\nVup\niSEYoJf\nqTOBCkjFAKflxbD\nJSHh\nBRMj\nVEApEzXfogQmfYWoFDgDJT\nFkSjj\nMyfAFQNBuRXPoMYUNvV\nIDQwrQXi\nBfYueHYxznfGwDqkB\nhLJ\niOareVJVRPcdgHObBtqKu\nVWcbzRraHg\np\nfHZbu\n\nUjjQTCjKpGO",
+            "go\n\nK",
+            "Qhlp\nJVdiN\nD\n\nKcMey",
+            "PN\nzeOizM\nxmj\nMlQjGcVSrBvT\nu\nAu\nGkluw\n\nVWYJyFe",
+            "fSnWqYTnXm\nSBttx\nWvDPzhQK\na\nZuSNjl\n\nvDPG",
+            "wTkW\nhzoK\njbJyxscLBWk\n\nnIehdMxtL",
+            "JxoNIBjvWsA\nExrerNauJYzvsEvgymz\nlIjyr\nrzVvhxxpONm\n\nT"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 1889,
+            "context": []
+          },
+          "step": {
+            "text": "\ud8be\udc9fS\u00950\u00c5*\u00b9\uda5a\udef0\u00b5\ue73b\u00ac\u00cc\u001f\uda33\ude9bT",
+            "context": [
+              {
+                "type": "stored",
+                "id": 1890
+              },
+              {
+                "type": "stored",
+                "id": 1891
+              },
+              {
+                "type": "stored",
+                "id": 1892
+              },
+              {
+                "type": "stored",
+                "id": 1893
+              },
+              {
+                "type": "stored",
+                "id": 1894
+              },
+              {
+                "type": "stored",
+                "id": 1895
+              },
+              {
+                "type": "stored",
+                "id": 1896
+              },
+              {
+                "type": "stored",
+                "id": 1897
+              }
+            ]
+          },
+          "n_step": 1157,
+          "goals": [
+            "p\nxRXfby\nD\nUNrp\nAfLHOLxyBNAjO\nwajBXWDHJdN\nFti\nuNuHmZ\nzfa\npremises\naRfbAqMkzqd\niL\nt\n\nYBR",
+            "QhDiPJXt\n\nQNOZPNQeJMyLMFxtSLqZ"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 1898,
+            "context": [
+              {
+                "type": "stored",
+                "id": 1899
+              },
+              {
+                "type": "stored",
+                "id": 1900
+              },
+              {
+                "type": "stored",
+                "id": 1901
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00fb\u00e8",
+            "context": [
+              {
+                "type": "stored",
+                "id": 1902
+              },
+              {
+                "type": "stored",
+                "id": 1903
+              },
+              {
+                "type": "stored",
+                "id": 1904
+              },
+              {
+                "type": "stored",
+                "id": 1905
+              }
+            ]
+          },
+          "n_step": 274877906944,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 1906,
+            "context": []
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 1907
+              },
+              {
+                "type": "stored",
+                "id": 1908
+              }
+            ]
+          },
+          "n_step": 262143,
+          "goals": [
+            "WuR\nhAMLwMNIPhV\n\nyc",
+            "BvVx\nmNas\nJdUc\nkvWmtmQ\nsSUASCB\n\nTxhWOJ",
+            "rddzNV\nqfLGxyXltdBYCspf\nYFHboqEEOihYIknMgJSjtkT\nNLxIn\n\npfZP",
+            "\n\nfgSgnc",
+            "r\nicmjx\nyTZg\nL\nCUWP\nYxp\nyWqYrF\nUvdpV\n\nx",
+            "SjzxPCKZ\naHNeBPpijZO\nTAtXSc\nthen\nzu\nBhXr\nYDzWnprIUkdDokFrfYasLWaQdzZtf\nNaN\n\nPtM",
+            "\n\nIULKl",
+            "Om\nFh\nHWciGJCD\nzpwbABQHHSOCdllMbeGAqXoNPFZtTtsdFzqg\nRTuuUlR\ngSFAl\n\nlkbJKNFe",
+            "eWKl\nuNzt\nxj\nFm\nSd\nFdupFGJuHeJ\ndhR\nllRWKdVCa\nw\nOZFSU\nQVO\nptCXX\niVrkjRabXJERTiN\naqVycKiHlaUDxxYZtSRIkfRHNzqnL\nrbwQmDQhie\noIFsnvX\nSMJCGarIdDy\nwhgkHmRsDYgdrMOuPkggp\nhyaHZB\nvhXQNBvpFXdQQFMMPgQK\nTIn\nZZwe\nxU\nEcBwiSjPxGGfH\nyqQD\noiILS\nQbuDM\nJfZStU\n\nZhvkWTziOoStlFsUqYliEKluGSlBp",
+            "ASxR\nfGvPASoPHHDyUNWtIYyxb\nq\ntnTk\neA\nblANz\nyYHPLyhhDqqXzmtHDSxbOaHkvqNIrxv\ngAyoUnXpUtlfFoJZIF\nPymshAAdqLwYtslneLr\nformatters\nC\n\nJSxrmP",
+            "sentence\n\nlmoTkA",
+            "oJHwtZLDgHEOJoNloS\n\noZbHDYKSbsFpj",
+            "YvTQjL\nSKj\nLTofacpemwtYmWHyWJYYencJrcg\nvLmI\nG\nje\nRbVpXuTyVthyqmUOtLbiSHDW\nkE\naxUisNtNro\n\nnone",
+            "aAX\n\nBNlteAQOB",
+            "OtekUarYI\nscfMA\n\nvrRkr"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
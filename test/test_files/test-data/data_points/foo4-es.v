@@ -0,0 +1,279 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo4/es.v\", \"workspace\": \"/coq-dataset/repos/foo4\", \"repository\": \"/coq-dataset/repos/foo4\"}",
+    "{\"type\": \"stored\", \"id\": 1909}",
+    "{\"type\": \"stored\", \"id\": 1910}",
+    "{\"type\": \"stored\", \"id\": 1911}",
+    "{\"type\": \"stored\", \"id\": 1912}",
+    "{\"type\": \"stored\", \"id\": 1913}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 1914,
+        "context": [
+          {
+            "type": "stored",
+            "id": 1915
+          },
+          {
+            "type": "stored",
+            "id": 1916
+          },
+          {
+            "type": "stored",
+            "id": 1917
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 1918,
+            "context": []
+          },
+          "step": {
+            "text": "xhH",
+            "context": [
+              {
+                "type": "stored",
+                "id": 1919
+              },
+              {
+                "type": "stored",
+                "id": 1920
+              },
+              {
+                "type": "stored",
+                "id": 1921
+              }
+            ]
+          },
+          "n_step": -919493099,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 1922,
+            "context": [
+              {
+                "type": "stored",
+                "id": 1923
+              },
+              {
+                "type": "stored",
+                "id": 1924
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00c7I\ud895\udc0cc\u00e4\u00cf)\u00e7\u0001",
+            "context": []
+          },
+          "n_step": 39904196,
+          "goals": [
+            "YzyeBVyGEk\nBvlmph\n\nIudRbWimN"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 1925,
+            "context": [
+              {
+                "type": "stored",
+                "id": 1926
+              },
+              {
+                "type": "stored",
+                "id": 1927
+              },
+              {
+                "type": "stored",
+                "id": 1928
+              },
+              {
+                "type": "stored",
+                "id": 1929
+              },
+              {
+                "type": "stored",
+                "id": 1930
+              },
+              {
+                "type": "stored",
+                "id": 1931
+              }
+            ]
+          },
+          "step": {
+            "text": "m\udb45\ude55\ud9b6\udc77\u00c7\u009a\u00ac\u00a1T",
+            "context": [
+              {
+                "type": "stored",
+                "id": 1932
+              },
+              {
+                "type": "stored",
+                "id": 1933
+              },
+              {
+                "type": "stored",
+                "id": 1934
+              },
+              {
+                "type": "stored",
+                "id": 1935
+              },
+              {
+                "type": "stored",
+                "id": 1936
+              },
+              {
+                "type": "stored",
+                "id": 1937
+              },
+              {
+                "type": "stored",
+                "id": 1938
+              },
+              {
+                "type": "stored",
+                "id": 1939
+              },
+              {
+                "type": "stored",
+                "id": 1940
+              },
+              {
+                "type": "stored",
+                "id": 1941
+              },
+              {
+                "type": "stored",
+                "id": 1942
+              }
+            ]
+          },
+          "n_step": 41907238871109599232,
+          "goals": [
+            "then\nName\nONWLhbToK\ntTvHrDn\nu\nD\n\nhKuWASf",
+            "T\nmMBFvm\nveh\nGNvQV\nFUNCTION\nXmG\nSBJzK\nelse\n\ns",
+            "nSEUr\n\nhAg",
+            "eUWhl\nZXHWoxKeneVhpBiipv\neuUkaKJJxsGASuERFfQFzhyLDkMpmIDqrzYZvVxbwIIEjRDrFge\ny\nT\nY\nnuB\nQE\nFuQemgznzaW\nHoz\nnWTNKCSWoD\niDmCGdORWf\nUToUtGK\ncU\nlLLpL\nWjjv\nwIWsEZg\nRMvDEw\nMLUbkq\nrtfAWHFBBW\noM\n\ncthJrBfo",
+            "jHJR\nnkUrSowFAR\nXLJTF\nWQoIw\nkB\nYQOvCmbyko\ntDS\nnzBUk\nY\nuxgNn\nkNjujLyqGSIFVW\nrslrXlObqzJQz\nB\nrUe\nBghjooQ\nGbFnC\n\ndL",
+            "UnBzDtHQCy\n\nFyQT",
+            "Property\nJJPk\nINF\nItlg\nuQXd\no\noUaSLVx\nXDQcmN\n\nWI",
+            "\n\nuM",
+            "qmki\ns\nXGXKz\nL\npremises\nQggHqbZovyTsePl\nBvMojqQskb\n\na",
+            "\n\nc",
+            "e\nrepository\nm\nZpfaLwaMT\nLxp\nmEojvoC\nMhSZSEwzytPDtX\n\nSoEXKPymhAKh"
+          ]
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 1943,
+        "context": []
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 1944,
+            "context": [
+              {
+                "type": "stored",
+                "id": 1945
+              },
+              {
+                "type": "stored",
+                "id": 1946
+              },
+              {
+                "type": "stored",
+                "id": 1947
+              },
+              {
+                "type": "stored",
+                "id": 1948
+              },
+              {
+                "type": "stored",
+                "id": 1949
+              },
+              {
+                "type": "stored",
+                "id": 1950
+              },
+              {
+                "type": "stored",
+                "id": 1951
+              },
+              {
+                "type": "stored",
+                "id": 1952
+              },
+              {
+                "type": "stored",
+                "id": 1953
+              },
+              {
+                "type": "stored",
+                "id": 1954
+              },
+              {
+                "type": "stored",
+                "id": 1955
+              },
+              {
+                "type": "stored",
+                "id": 1956
+              },
+              {
+                "type": "stored",
+                "id": 1957
+              }
+            ]
+          },
+          "step": {
+            "text": "true",
+            "context": [
+              {
+                "type": "stored",
+                "id": 1958
+              },
+              {
+                "type": "stored",
+                "id": 1959
+              },
+              {
+                "type": "stored",
+                "id": 1960
+              },
+              {
+                "type": "stored",
+                "id": 1961
+              },
+              {
+                "type": "stored",
+                "id": 1962
+              }
+            ]
+          },
+          "n_step": 77541122,
+          "goals": [
+            "rTVx\n\nVhP",
+            "HqWsHhQiT\ni\nSc\nuaOi\nGcUma\nHxjqZT\nuJu\nSrrhygzYBkTHL\nrASaKeoL\nHxUR\nNxuTr\nkB\ndAnCwQgnyb\nCr\nnull\nbmliSy\n\nE",
+            "None\nensLknJZNVE\nycR\noxzIMuwQgNEGcRiyf\n\nvcVo"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
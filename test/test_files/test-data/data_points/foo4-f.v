@@ -0,0 +1,9 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo4/f.v\", \"workspace\": \"/coq-dataset/repos/foo4\", \"repository\": \"/coq-dataset/repos/foo4\"}",
+    "{\"type\": \"stored\", \"id\": 2178}",
+    "{\"type\": \"stored\", \"id\": 2179}",
+    "{\"type\": \"stored\", \"id\": 2180}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,174 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo4/fx.v\", \"workspace\": \"/coq-dataset/repos/foo4\", \"repository\": \"/coq-dataset/repos/foo4\"}",
+    "{\"type\": \"stored\", \"id\": 2072}",
+    "{\"type\": \"stored\", \"id\": 2073}",
+    "{\"type\": \"stored\", \"id\": 2074}",
+    "{\"type\": \"stored\", \"id\": 2075}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 2076,
+        "context": []
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 2077,
+            "context": [
+              {
+                "type": "stored",
+                "id": 2078
+              },
+              {
+                "type": "stored",
+                "id": 2079
+              },
+              {
+                "type": "stored",
+                "id": 2080
+              },
+              {
+                "type": "stored",
+                "id": 2081
+              },
+              {
+                "type": "stored",
+                "id": 2082
+              },
+              {
+                "type": "stored",
+                "id": 2083
+              },
+              {
+                "type": "stored",
+                "id": 2084
+              },
+              {
+                "type": "stored",
+                "id": 2085
+              },
+              {
+                "type": "stored",
+                "id": 2086
+              },
+              {
+                "type": "stored",
+                "id": 2087
+              },
+              {
+                "type": "stored",
+                "id": 2088
+              },
+              {
+                "type": "stored",
+                "id": 2089
+              }
+            ]
+          },
+          "step": {
+            "text": "6\u00b4\f",
+            "context": []
+          },
+          "n_step": 171,
+          "goals": [
+            "xIp\nVZU\nOOlyvLJgGs\n\nYa",
+            "ZqDKsyia\nf\nxVgNY\n\nBMPuX",
+            "SesSVi\nhbX\n\nAOVs",
+            "\n\nMAXrPFd",
+            "sNliMp\nH\ngRDcF\nBmOIw\nr\nc\nptABgFFpoXfOxhn\nSWRS\nd\nUO\niGDDC\n\nJvrxu",
+            "raMKzE\n\nsearch",
+            "SeBDEGqg\n\nf",
+            "MAGTvYwkG\n\nlchv",
+            "ZdSntrE\nBsvTOFX\n\nKRVIf",
+            "SETOID\nPjGQtKc\nJDZ\nI\nuasNLBxm\ngEmbasw\nOn\nNOTATION\npD\nwvZp\nWdAQy\nZfkYHEYahfsnsGHt\n\ns"
+          ]
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 2090,
+        "context": [
+          {
+            "type": "stored",
+            "id": 2091
+          },
+          {
+            "type": "stored",
+            "id": 2092
+          },
+          {
+            "type": "stored",
+            "id": 2093
+          },
+          {
+            "type": "stored",
+            "id": 2094
+          },
+          {
+            "type": "stored",
+            "id": 2095
+          },
+          {
+            "type": "stored",
+            "id": 2096
+          },
+          {
+            "type": "stored",
+            "id": 2097
+          },
+          {
+            "type": "stored",
+            "id": 2098
+          },
+          {
+            "type": "stored",
+            "id": 2099
+          },
+          {
+            "type": "stored",
+            "id": 2100
+          },
+          {
+            "type": "stored",
+            "id": 2101
+          },
+          {
+            "type": "stored",
+            "id": 2102
+          },
+          {
+            "type": "stored",
+            "id": 2103
+          },
+          {
+            "type": "stored",
+            "id": 2104
+          },
+          {
+            "type": "stored",
+            "id": 2105
+          },
+          {
+            "type": "stored",
+            "id": 2106
+          },
+          {
+            "type": "stored",
+            "id": 2107
+          },
+          {
+            "type": "stored",
+            "id": 2108
+          }
+        ]
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,307 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo4/gz.v\", \"workspace\": \"/coq-dataset/repos/foo4\", \"repository\": \"/coq-dataset/repos/foo4\"}",
+    "{\"type\": \"stored\", \"id\": 2113}",
+    "{\"type\": \"stored\", \"id\": 2114}",
+    "{\"type\": \"stored\", \"id\": 2115}",
+    "{\"type\": \"stored\", \"id\": 2116}",
+    "{\"type\": \"stored\", \"id\": 2117}",
+    "{\"type\": \"stored\", \"id\": 2118}",
+    "{\"type\": \"stored\", \"id\": 2119}",
+    "{\"type\": \"stored\", \"id\": 2120}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 2121,
+        "context": [
+          {
+            "type": "stored",
+            "id": 2122
+          },
+          {
+            "type": "stored",
+            "id": 2123
+          },
+          {
+            "type": "stored",
+            "id": 2124
+          },
+          {
+            "type": "stored",
+            "id": 2125
+          },
+          {
+            "type": "stored",
+            "id": 2126
+          },
+          {
+            "type": "stored",
+            "id": 2127
+          },
+          {
+            "type": "stored",
+            "id": 2128
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 2129,
+            "context": [
+              {
+                "type": "stored",
+                "id": 2130
+              },
+              {
+                "type": "stored",
+                "id": 2131
+              },
+              {
+                "type": "stored",
+                "id": 2132
+              },
+              {
+                "type": "stored",
+                "id": 2133
+              },
+              {
+                "type": "stored",
+                "id": 2134
+              }
+            ]
+          },
+          "step": {
+            "text": "\u0013Q\ud990\udce0\u00ae\u00009aq\udb09\udc5f",
+            "context": [
+              {
+                "type": "stored",
+                "id": 2135
+              },
+              {
+                "type": "stored",
+                "id": 2136
+              },
+              {
+                "type": "stored",
+                "id": 2137
+              },
+              {
+                "type": "stored",
+                "id": 2138
+              }
+            ]
+          },
+          "n_step": 712,
+          "goals": [
+            "iN\nltocmqvYHCLuKVaXbUBAAH\nTyr\nOTHER\nG\nDAwc\nHFLvXFH\nQMAFzorlgJunDixa\nDh\nFPMb\nJWaMvjuVqW\njS\nZDtUdJzovLZUSFou\nAPxmtBEVPrlIePUC\nQo\nzjrKce\nmN\njFt\nyMeCmefk\nR\nLiwXSTYegiiHEAgZFWvnlZt\nzNqujv\nydMibWlNef\nn\nRTJzR\nelse\nBzeC\n\nLVlk"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 2139,
+            "context": [
+              {
+                "type": "stored",
+                "id": 2140
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00c8\u00ab\u00e7`\uda5a\udc60\ud9f6\ude56\u00bd\u00e7\udb48\udee5\u00a0\u00b9\ud8bd\udca2V1\u00c9B\u0086\"\ud8ab\ude37\u00fa",
+            "context": [
+              {
+                "type": "stored",
+                "id": 2141
+              },
+              {
+                "type": "stored",
+                "id": 2142
+              }
+            ]
+          },
+          "n_step": -915,
+          "goals": [
+            "BDyaVuVTHlMUx\nRp\n\nI",
+            "VJWidpFRKqTcJQMxBCDK\nkv\niGpDckYZtg\n\ngtyZwOejBatq"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 2143,
+            "context": [
+              {
+                "type": "stored",
+                "id": 2144
+              },
+              {
+                "type": "stored",
+                "id": 2145
+              },
+              {
+                "type": "stored",
+                "id": 2146
+              },
+              {
+                "type": "stored",
+                "id": 2147
+              },
+              {
+                "type": "stored",
+                "id": 2148
+              },
+              {
+                "type": "stored",
+                "id": 2149
+              },
+              {
+                "type": "stored",
+                "id": 2150
+              },
+              {
+                "type": "stored",
+                "id": 2151
+              },
+              {
+                "type": "stored",
+                "id": 2152
+              },
+              {
+                "type": "stored",
+                "id": 2153
+              },
+              {
+                "type": "stored",
+                "id": 2154
+              },
+              {
+                "type": "stored",
+                "id": 2155
+              }
+            ]
+          },
+          "step": {
+            "text": "Zt\u0084\u009a%\u0085\u00faA\u0095\u00a5\ud818\udec0\uda6e\udc19",
+            "context": [
+              {
+                "type": "stored",
+                "id": 2156
+              },
+              {
+                "type": "stored",
+                "id": 2157
+              },
+              {
+                "type": "stored",
+                "id": 2158
+              },
+              {
+                "type": "stored",
+                "id": 2159
+              },
+              {
+                "type": "stored",
+                "id": 2160
+              },
+              {
+                "type": "stored",
+                "id": 2161
+              },
+              {
+                "type": "stored",
+                "id": 2162
+              },
+              {
+                "type": "stored",
+                "id": 2163
+              },
+              {
+                "type": "stored",
+                "id": 2164
+              },
+              {
+                "type": "stored",
+                "id": 2165
+              },
+              {
+                "type": "stored",
+                "id": 2166
+              }
+            ]
+          },
+          "n_step": -1815,
+          "goals": [
+            "\n\nX",
+            "RLBt\nB\nTK\nZEyBREa\n\nH"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 2167,
+            "context": [
+              {
+                "type": "stored",
+                "id": 2168
+              }
+            ]
+          },
+          "step": {
+            "text": "\u001e\ue5ae\udbcc\udec6",
+            "context": [
+              {
+                "type": "stored",
+                "id": 2169
+              },
+              {
+                "type": "stored",
+                "id": 2170
+              },
+              {
+                "type": "stored",
+                "id": 2171
+              },
+              {
+                "type": "stored",
+                "id": 2172
+              },
+              {
+                "type": "stored",
+                "id": 2173
+              },
+              {
+                "type": "stored",
+                "id": 2174
+              },
+              {
+                "type": "stored",
+                "id": 2175
+              },
+              {
+                "type": "stored",
+                "id": 2176
+              },
+              {
+                "type": "stored",
+                "id": 2177
+              }
+            ]
+          },
+          "n_step": 207,
+          "goals": [
+            "OUnmwYy\nyIvBZ\nMTXbtCpfNhynYPkMvvXYyUIE\nejtL\nqQzggI\nn\nmsReUfzpnwxwnLdwDx\n\nbGGxYrALupTUnkDXnQ",
+            "DTvCnSeU\n\nxMnjLGSXjckdfSUfCN",
+            "PGEx\nGD\nGsX\niY\nelVmMbHqYeYDbufrdRUwsERXfGA\nmkHv\n\nBSiunSQ",
+            "hzba\ncsr\nVyfbzsOuJXOj\nbXRT\n\nWgDNjeLEObw",
+            "Wq\nMCfIviDsEDuWrLgkzt\n\nbDrGVkZWvk"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
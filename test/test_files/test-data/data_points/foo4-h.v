@@ -0,0 +1,137 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo4/h.v\", \"workspace\": \"/coq-dataset/repos/foo4\", \"repository\": \"/coq-dataset/repos/foo4\"}",
+    "{\"type\": \"stored\", \"id\": 1963}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 1964,
+        "context": [
+          {
+            "type": "stored",
+            "id": 1965
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 1966,
+            "context": [
+              {
+                "type": "stored",
+                "id": 1967
+              },
+              {
+                "type": "stored",
+                "id": 1968
+              },
+              {
+                "type": "stored",
+                "id": 1969
+              },
+              {
+                "type": "stored",
+                "id": 1970
+              },
+              {
+                "type": "stored",
+                "id": 1971
+              },
+              {
+                "type": "stored",
+                "id": 1972
+              },
+              {
+                "type": "stored",
+                "id": 1973
+              },
+              {
+                "type": "stored",
+                "id": 1974
+              },
+              {
+                "type": "stored",
+                "id": 1975
+              },
+              {
+                "type": "stored",
+                "id": 1976
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00a2\udbd1\ude85",
+            "context": [
+              {
+                "type": "stored",
+                "id": 1977
+              },
+              {
+                "type": "stored",
+                "id": 1978
+              },
+              {
+                "type": "stored",
+                "id": 1979
+              }
+            ]
+          },
+          "n_step": 72057594037927935,
+          "goals": [
+            "cnXnnpGK\n\nBvWA"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 1980,
+            "context": []
+          },
+          "step": {
+            "text": "Z",
+            "context": [
+              {
+                "type": "stored",
+                "id": 1981
+              },
+              {
+                "type": "stored",
+                "id": 1982
+              },
+              {
+                "type": "stored",
+                "id": 1983
+              },
+              {
+                "type": "stored",
+                "id": 1984
+              },
+              {
+                "type": "stored",
+                "id": 1985
+              },
+              {
+                "type": "stored",
+                "id": 1986
+              },
+              {
+                "type": "stored",
+                "id": 1987
+              },
+              {
+                "type": "stored",
+                "id": 1988
+              }
+            ]
+          },
+          "n_step": 1098853,
+          "goals": []
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
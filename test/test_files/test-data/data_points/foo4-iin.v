@@ -0,0 +1,12 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo4/iin.v\", \"workspace\": \"/coq-dataset/repos/foo4\", \"repository\": \"/coq-dataset/repos/foo4\"}",
+    "{\"type\": \"stored\", \"id\": 2213}",
+    "{\"type\": \"stored\", \"id\": 2214}",
+    "{\"type\": \"stored\", \"id\": 2215}",
+    "{\"type\": \"stored\", \"id\": 2216}",
+    "{\"type\": \"stored\", \"id\": 2217}",
+    "{\"type\": \"stored\", \"id\": 2218}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
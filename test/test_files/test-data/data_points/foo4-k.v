@@ -0,0 +1,81 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo4/k.v\", \"workspace\": \"/coq-dataset/repos/foo4\", \"repository\": \"/coq-dataset/repos/foo4\"}",
+    "{\"type\": \"stored\", \"id\": 1825}",
+    "{\"type\": \"stored\", \"id\": 1826}",
+    "{\"type\": \"stored\", \"id\": 1827}",
+    "{\"type\": \"stored\", \"id\": 1828}",
+    "{\"type\": \"stored\", \"id\": 1829}",
+    "{\"type\": \"stored\", \"id\": 1830}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 1831,
+        "context": [
+          {
+            "type": "stored",
+            "id": 1832
+          },
+          {
+            "type": "stored",
+            "id": 1833
+          },
+          {
+            "type": "stored",
+            "id": 1834
+          },
+          {
+            "type": "stored",
+            "id": 1835
+          },
+          {
+            "type": "stored",
+            "id": 1836
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 1837,
+            "context": [
+              {
+                "type": "stored",
+                "id": 1838
+              },
+              {
+                "type": "stored",
+                "id": 1839
+              }
+            ]
+          },
+          "step": {
+            "text": "\ud92f\udfe6",
+            "context": []
+          },
+          "n_step": 41055,
+          "goals": [
+            "nh\nMAnTEjA\n\nqZo",
+            "Zd\ncnCMx\nsUUpaUhOxxUsqInSrpk\npIKqaw\n\nwuHGmQkyMaQ",
+            "ic\nvloSvZjkpybhkiOqYsaX\nRQHBKA\ntt\nuT\nqCKyMRWsL\nGSSV\n\nkpkfjAHCnyDtXM",
+            "\n\nB",
+            "yvQMmBENzm\nSU\ntbjLbspJfCVT\n\nb",
+            "HNjq\nnXUeQhF\n\nm",
+            "KrxCLtlAl\nfa\nmE\n\nGp",
+            "pYoZPE\nv\nkzCkb\ntU\nzrimjD\nbEpbe\nBBC\n\nGHppzzDtsjXGvOv",
+            "Yt\nzGlHezBxE\nHApme\nJZcgAWRUqSZvhqkY\nGsjDuHZJyvWNDXvmS\nDRQxzlK\nZzmuGGSfL\nDclWut\npP\nvj\n\nsOORnOwsWmXR",
+            "TSc\nf\noCiVQV\n\nTxcQhNgcL",
+            "F\nr\nLQurhKFPQakxoVeQAZYMjo\n\nUghYnxG",
+            "sd\nS\nsjIiMXLyIeuCZzjAA\ndjgT\ngM\n\nbRfuB",
+            "Inf\nAwXjjmFlJl\nInfinity\npVAXI\nCaGluedZVvzbGYFrONP\nH\nFsxHWKADC\nOlEKlbpfrdbyyXGLfuhVvyBAHyIRINU\nTyn\nP\nR\n\nzS",
+            "CODK\nC\nqOeTxyhJsgBkaH\nMKOD\no\nGbgEjwASTvFfnlB\nt\nMHySUktT\nj\nBpkFuezVcA\nkJz\nmOpPaQPxLEx\nfJDYu\nzvlP\nGy\nnMkDuOGpXw\nN\nBtqGlmeUYPx\nZgKA\nUbgy\n\nUwpEHLge",
+            "Hw\nUMJsNVmF\nMATWJIRTRNggstz\n\nFnDjUI"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
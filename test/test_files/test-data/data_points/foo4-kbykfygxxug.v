@@ -0,0 +1,12 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo4/kbykfygxxug.v\", \"workspace\": \"/coq-dataset/repos/foo4\", \"repository\": \"/coq-dataset/repos/foo4\"}",
+    "{\"type\": \"stored\", \"id\": 1989}",
+    "{\"type\": \"stored\", \"id\": 1990}",
+    "{\"type\": \"stored\", \"id\": 1991}",
+    "{\"type\": \"stored\", \"id\": 1992}",
+    "{\"type\": \"stored\", \"id\": 1993}",
+    "{\"type\": \"stored\", \"id\": 1994}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,10 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo4/lipwujeaghtujvyj.v\", \"workspace\": \"/coq-dataset/repos/foo4\", \"repository\": \"/coq-dataset/repos/foo4\"}",
+    "{\"type\": \"stored\", \"id\": 2272}",
+    "{\"type\": \"stored\", \"id\": 2273}",
+    "{\"type\": \"stored\", \"id\": 2274}",
+    "{\"type\": \"stored\", \"id\": 2275}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,11 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo4/lvhvaixaf.v\", \"workspace\": \"/coq-dataset/repos/foo4\", \"repository\": \"/coq-dataset/repos/foo4\"}",
+    "{\"type\": \"stored\", \"id\": 2267}",
+    "{\"type\": \"stored\", \"id\": 2268}",
+    "{\"type\": \"stored\", \"id\": 2269}",
+    "{\"type\": \"stored\", \"id\": 2270}",
+    "{\"type\": \"stored\", \"id\": 2271}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,13 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo4/pe.v\", \"workspace\": \"/coq-dataset/repos/foo4\", \"repository\": \"/coq-dataset/repos/foo4\"}",
+    "{\"type\": \"stored\", \"id\": 1840}",
+    "{\"type\": \"stored\", \"id\": 1841}",
+    "{\"type\": \"stored\", \"id\": 1842}",
+    "{\"type\": \"stored\", \"id\": 1843}",
+    "{\"type\": \"stored\", \"id\": 1844}",
+    "{\"type\": \"stored\", \"id\": 1845}",
+    "{\"type\": \"stored\", \"id\": 1846}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,423 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo4/qvgx.v\", \"workspace\": \"/coq-dataset/repos/foo4\", \"repository\": \"/coq-dataset/repos/foo4\"}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 1995,
+        "context": [
+          {
+            "type": "stored",
+            "id": 1996
+          },
+          {
+            "type": "stored",
+            "id": 1997
+          },
+          {
+            "type": "stored",
+            "id": 1998
+          },
+          {
+            "type": "stored",
+            "id": 1999
+          },
+          {
+            "type": "stored",
+            "id": 2000
+          },
+          {
+            "type": "stored",
+            "id": 2001
+          },
+          {
+            "type": "stored",
+            "id": 2002
+          },
+          {
+            "type": "stored",
+            "id": 2003
+          },
+          {
+            "type": "stored",
+            "id": 2004
+          },
+          {
+            "type": "stored",
+            "id": 2005
+          },
+          {
+            "type": "stored",
+            "id": 2006
+          },
+          {
+            "type": "stored",
+            "id": 2007
+          },
+          {
+            "type": "stored",
+            "id": 2008
+          },
+          {
+            "type": "stored",
+            "id": 2009
+          },
+          {
+            "type": "stored",
+            "id": 2010
+          },
+          {
+            "type": "stored",
+            "id": 2011
+          },
+          {
+            "type": "stored",
+            "id": 2012
+          },
+          {
+            "type": "stored",
+            "id": 2013
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 2014,
+            "context": [
+              {
+                "type": "stored",
+                "id": 2015
+              },
+              {
+                "type": "stored",
+                "id": 2016
+              },
+              {
+                "type": "stored",
+                "id": 2017
+              },
+              {
+                "type": "stored",
+                "id": 2018
+              },
+              {
+                "type": "stored",
+                "id": 2019
+              },
+              {
+                "type": "stored",
+                "id": 2020
+              },
+              {
+                "type": "stored",
+                "id": 2021
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00f4\u0018\u008c",
+            "context": [
+              {
+                "type": "stored",
+                "id": 2022
+              }
+            ]
+          },
+          "n_step": -166901,
+          "goals": [
+            "GwYcRfsyv\nEV\nGwudU\nVT\nGjlvkqWqMhnPjdIU\nuv\nTRUE\nilQz\nftCckAWTShyaBTme\neF\n\nxGc",
+            "oR\nStkfnd\ns\nSbEiDVKxX\nGYMEm\nR\nHzguMUhqaGR\nducqoVDtEUDGc\n\nhg",
+            "\n\nW",
+            "\n\nDeoBgRe"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 2023,
+            "context": [
+              {
+                "type": "stored",
+                "id": 2024
+              },
+              {
+                "type": "stored",
+                "id": 2025
+              },
+              {
+                "type": "stored",
+                "id": 2026
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 2027
+              }
+            ]
+          },
+          "n_step": 1073206,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 2028,
+            "context": []
+          },
+          "step": {
+            "text": "\u008e\udb86\udef1\uf61ft",
+            "context": [
+              {
+                "type": "stored",
+                "id": 2029
+              },
+              {
+                "type": "stored",
+                "id": 2030
+              },
+              {
+                "type": "stored",
+                "id": 2031
+              },
+              {
+                "type": "stored",
+                "id": 2032
+              },
+              {
+                "type": "stored",
+                "id": 2033
+              },
+              {
+                "type": "stored",
+                "id": 2034
+              }
+            ]
+          },
+          "n_step": -8819498629,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 2035,
+            "context": [
+              {
+                "type": "stored",
+                "id": 2036
+              },
+              {
+                "type": "stored",
+                "id": 2037
+              },
+              {
+                "type": "stored",
+                "id": 2038
+              },
+              {
+                "type": "stored",
+                "id": 2039
+              },
+              {
+                "type": "stored",
+                "id": 2040
+              },
+              {
+                "type": "stored",
+                "id": 2041
+              },
+              {
+                "type": "stored",
+                "id": 2042
+              }
+            ]
+          },
+          "step": {
+            "text": "\ud8f0\udf6d\u2ced\u00bc\u0096]\u0090\u00cb",
+            "context": [
+              {
+                "type": "stored",
+                "id": 2043
+              },
+              {
+                "type": "stored",
+                "id": 2044
+              },
+              {
+                "type": "stored",
+                "id": 2045
+              },
+              {
+                "type": "stored",
+                "id": 2046
+              },
+              {
+                "type": "stored",
+                "id": 2047
+              },
+              {
+                "type": "stored",
+                "id": 2048
+              },
+              {
+                "type": "stored",
+                "id": 2049
+              },
+              {
+                "type": "stored",
+                "id": 2050
+              },
+              {
+                "type": "stored",
+                "id": 2051
+              },
+              {
+                "type": "stored",
+                "id": 2052
+              }
+            ]
+          },
+          "n_step": 96,
+          "goals": [
+            "Cq\nr\nInf\n\nInfinity",
+            "M\nLKCoU\nU\nINF\nKLwa\nMBFeXUPId\nUpzZgvqAafBE\nPtNxnjGMbaEgEHL\nd\nBYd\nR\nbmMvrUxi\nyV\nrdK\nK\nUyk\nWtuvEQWdzfFz\nFjrwxHkLK\nA\nlQWRwAZr\niOIzRmucLVE\n\nH",
+            "\n\nSCw",
+            "N\ntKw\nAEKscoXrjO\n\njznS",
+            "vt\nesIeMFkIoqGuTgYrEpMTZJrbVCbH\nJRKMql\nYofubgsw\nJU\npJIBPPhGFbQiDu\nTc\neImdR\nRgClLwQOwMoOtywtKlNzayWpa\nC\nTAbw\nLb\n\nde"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 2053,
+            "context": []
+          },
+          "step": {
+            "text": "\uda04\ude4e\u009f",
+            "context": [
+              {
+                "type": "stored",
+                "id": 2054
+              },
+              {
+                "type": "stored",
+                "id": 2055
+              },
+              {
+                "type": "stored",
+                "id": 2056
+              },
+              {
+                "type": "stored",
+                "id": 2057
+              },
+              {
+                "type": "stored",
+                "id": 2058
+              }
+            ]
+          },
+          "n_step": -24073,
+          "goals": [
+            "s\nNF\nYYk\niycXop\nieKBycmS\nRCdj\nlqYuRPCYyrVk\nPUTuHRZv\nPtTDDergWuzRk\nyTuKGNx\nTkrKM\nEjOhJOIPcs\nhDLY\npP\n\nxQ",
+            "I\npOc\nNmcd\nEUM\nOmizaGmHWs\nFlWfJS\nKa\ntVTUN\nfNbYH\naMlwzqHeTMwHT\nyjKangPeDgSWvWULlUXdCRTbSrb\nnLk\nM\nBjHofj\nBDPFulC\npZ\ntdYopF\ngPsmAiua\nYRRHqlcUBJ\nHwgwIVOignI\nupe\nqJj\nhUWQxnyiTZKIEjdap\nkyzo\nHt\njG\nhjU\nEpYCtoNRh\nqsCQVMtnaK\nXZ\nP\nESeLdEv\nXfcm\nHLOeY\n\nDCn",
+            "eltGi\nHrLIhs\nRF\ncOgMsXDK\nAPgF\nmGvnDtu\nMNDqHlEiOLTD\nGrwPgz\n\nlXphrqaWJlvOguOoK",
+            "Rv\nEi\n\nZTSd",
+            "SfRZv\ngWguKM\ngpBxCBIc\n\nWIKslUGQv"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 2059,
+            "context": [
+              {
+                "type": "stored",
+                "id": 2060
+              },
+              {
+                "type": "stored",
+                "id": 2061
+              },
+              {
+                "type": "stored",
+                "id": 2062
+              }
+            ]
+          },
+          "step": {
+            "text": "\u0014",
+            "context": [
+              {
+                "type": "stored",
+                "id": 2063
+              }
+            ]
+          },
+          "n_step": -11289682824319,
+          "goals": [
+            "AspPcGhOkm\nrINOycW\nK\nBdyyMcH\ntTwJK\nQWO\ny\nsiIBeBf\nw\nbu\n\nLnD",
+            "hAX\niwzRBEqNROQOYqDMGk\nP\naYXvTvo\n\na",
+            "True\nmwMw\nIu\nqTSRaT\nod\nkbyQHAw\nNB\n\npqZOdAsM"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 2064,
+            "context": [
+              {
+                "type": "stored",
+                "id": 2065
+              },
+              {
+                "type": "stored",
+                "id": 2066
+              },
+              {
+                "type": "stored",
+                "id": 2067
+              },
+              {
+                "type": "stored",
+                "id": 2068
+              },
+              {
+                "type": "stored",
+                "id": 2069
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00df}\u0097\u0015\u009e\u0d32\u009dk\u0007\u00ba\udbf9\udf82\u0098\ud995\udc638Z",
+            "context": [
+              {
+                "type": "stored",
+                "id": 2070
+              },
+              {
+                "type": "stored",
+                "id": 2071
+              }
+            ]
+          },
+          "n_step": 6112817151,
+          "goals": [
+            "LHmibR\npmnDhB\nYvPqQA\nQeWugocAyrU\ntF\nVkkYjBoWfWKnUtNm\njBhastympdHokhaPNujHEgTqPdS\nSprkNShLpRsvDqqfQo\nAFb\nqueue\n\nDrY",
+            "Lcx\nNgggariwxYMM\n\nF",
+            "UKekMHtFXSUmYUlkOqMFJKKh\nvG\nVeVOMW\nCXhDYRTK\n\nKnScXrlWy",
+            "split\n\nzzhpg",
+            "fGxfTgbDRqNWG\npartition\n\nZI"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,22 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo4/sbdif.v\", \"workspace\": \"/coq-dataset/repos/foo4\", \"repository\": \"/coq-dataset/repos/foo4\"}",
+    "{\"type\": \"stored\", \"id\": 2277}",
+    "{\"type\": \"stored\", \"id\": 2278}",
+    "{\"type\": \"stored\", \"id\": 2279}",
+    "{\"type\": \"stored\", \"id\": 2280}",
+    "{\"type\": \"stored\", \"id\": 2281}",
+    "{\"type\": \"stored\", \"id\": 2282}",
+    "{\"type\": \"stored\", \"id\": 2283}",
+    "{\"type\": \"stored\", \"id\": 2284}",
+    "{\"type\": \"stored\", \"id\": 2285}",
+    "{\"type\": \"stored\", \"id\": 2286}",
+    "{\"type\": \"stored\", \"id\": 2287}",
+    "{\"type\": \"stored\", \"id\": 2288}",
+    "{\"type\": \"stored\", \"id\": 2289}",
+    "{\"type\": \"stored\", \"id\": 2290}",
+    "{\"type\": \"stored\", \"id\": 2291}",
+    "{\"type\": \"stored\", \"id\": 2292}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
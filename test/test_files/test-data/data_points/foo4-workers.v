@@ -0,0 +1,223 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo4/workers.v\", \"workspace\": \"/coq-dataset/repos/foo4\", \"repository\": \"/coq-dataset/repos/foo4\"}",
+    "{\"type\": \"stored\", \"id\": 2219}",
+    "{\"type\": \"stored\", \"id\": 2220}",
+    "{\"type\": \"stored\", \"id\": 2221}",
+    "{\"type\": \"stored\", \"id\": 2222}",
+    "{\"type\": \"stored\", \"id\": 2223}",
+    "{\"type\": \"stored\", \"id\": 2224}",
+    "{\"type\": \"stored\", \"id\": 2225}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 2226,
+        "context": [
+          {
+            "type": "stored",
+            "id": 2227
+          },
+          {
+            "type": "stored",
+            "id": 2228
+          },
+          {
+            "type": "stored",
+            "id": 2229
+          },
+          {
+            "type": "stored",
+            "id": 2230
+          },
+          {
+            "type": "stored",
+            "id": 2231
+          },
+          {
+            "type": "stored",
+            "id": 2232
+          },
+          {
+            "type": "stored",
+            "id": 2233
+          },
+          {
+            "type": "stored",
+            "id": 2234
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 2235,
+            "context": [
+              {
+                "type": "stored",
+                "id": 2236
+              },
+              {
+                "type": "stored",
+                "id": 2237
+              },
+              {
+                "type": "stored",
+                "id": 2238
+              },
+              {
+                "type": "stored",
+                "id": 2239
+              },
+              {
+                "type": "stored",
+                "id": 2240
+              },
+              {
+                "type": "stored",
+                "id": 2241
+              },
+              {
+                "type": "stored",
+                "id": 2242
+              },
+              {
+                "type": "stored",
+                "id": 2243
+              },
+              {
+                "type": "stored",
+                "id": 2244
+              },
+              {
+                "type": "stored",
+                "id": 2245
+              },
+              {
+                "type": "stored",
+                "id": 2246
+              },
+              {
+                "type": "stored",
+                "id": 2247
+              },
+              {
+                "type": "stored",
+                "id": 2248
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00a5",
+            "context": [
+              {
+                "type": "stored",
+                "id": 2249
+              },
+              {
+                "type": "stored",
+                "id": 2250
+              },
+              {
+                "type": "stored",
+                "id": 2251
+              },
+              {
+                "type": "stored",
+                "id": 2252
+              },
+              {
+                "type": "stored",
+                "id": 2253
+              },
+              {
+                "type": "stored",
+                "id": 2254
+              },
+              {
+                "type": "stored",
+                "id": 2255
+              },
+              {
+                "type": "stored",
+                "id": 2256
+              }
+            ]
+          },
+          "n_step": 62318,
+          "goals": [
+            "bq\niPhKDkAWBCc\n\nNaN",
+            "RmfTpJm\nG\nLDjv\nWKznXmx\nrcuD\nELeOAcW\neM\nFGfZWlEiTMPCLGGlZsS\nE\nENdxKfA\n\nd",
+            "classical\nHaNRwU\nqlZ\nbLXbBGRuFj\nZNA\nXEyNrkMYzJdkNDsa\nhVGXOfgOXonuMVIV\nCyDZnCuKYgl\n\nu",
+            "e\nAaxaJpcZQzTBr\ng\njX\naE\nglekQOzGZKKt\nxgti\nAvpfLP\nN\ndJxJEoFvtvrlMT\ndkSiecxO\nSXUf\nPWGSvCvV\nJs\nrnNXItyDoO\nN\nLm\nAgdzhWlYw\nazW\n\nVJ",
+            "VbTFUbfjQqF\noNgsgRnyquQLtqacf\nANX\nuHO\ndfsgBaZmi\nc\n\nutWBFZBMOp",
+            "fMcHKqYMOYQPHzSDA\nHP\nwbz\n\nE",
+            "YZw\n\niFZFX",
+            "example\nSPIHG\nNFUiJl\nvKy\nQyVmdPsAbl\nbsT\n\nnNojxsE",
+            "NgbKvVWcUPk\nZaCj\nxxvgqZPq\n\nZEm"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 2257,
+            "context": []
+          },
+          "step": {
+            "text": "\u00b6\u008e",
+            "context": [
+              {
+                "type": "stored",
+                "id": 2258
+              },
+              {
+                "type": "stored",
+                "id": 2259
+              },
+              {
+                "type": "stored",
+                "id": 2260
+              },
+              {
+                "type": "stored",
+                "id": 2261
+              },
+              {
+                "type": "stored",
+                "id": 2262
+              },
+              {
+                "type": "stored",
+                "id": 2263
+              },
+              {
+                "type": "stored",
+                "id": 2264
+              },
+              {
+                "type": "stored",
+                "id": 2265
+              },
+              {
+                "type": "stored",
+                "id": 2266
+              }
+            ]
+          },
+          "n_step": 63117,
+          "goals": [
+            "Defined\nIJ\nJOFQmc\nUhjzSOO\nEFVqgvOyusUfAHEcLMvghxVat\nFkjT\nN\nv\nHqEbjFR\nwloW\n\nO",
+            "b\nYXvPU\n\ndCUrd",
+            "m\ndrJOIB\npopLtPeIfiqiWEkM\n\nFalse",
+            "TS\n\nXOwCvs",
+            "\n\nn",
+            "aEn\nogJcDgvLEyKM\nP\nI\nJz\n\nfalse",
+            "X\nrUHdI\nNULL\nwLM\nY\nXrs\n\nxO"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
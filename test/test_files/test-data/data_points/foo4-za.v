@@ -0,0 +1,10 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo4/za.v\", \"workspace\": \"/coq-dataset/repos/foo4\", \"repository\": \"/coq-dataset/repos/foo4\"}",
+    "{\"type\": \"stored\", \"id\": 2109}",
+    "{\"type\": \"stored\", \"id\": 2110}",
+    "{\"type\": \"stored\", \"id\": 2111}",
+    "{\"type\": \"stored\", \"id\": 2112}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
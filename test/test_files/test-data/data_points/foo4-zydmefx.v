@@ -0,0 +1,61 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo4/zydmefx.v\", \"workspace\": \"/coq-dataset/repos/foo4\", \"repository\": \"/coq-dataset/repos/foo4\"}",
+    "{\"type\": \"stored\", \"id\": 2297}",
+    "{\"type\": \"stored\", \"id\": 2298}",
+    "{\"type\": \"stored\", \"id\": 2299}",
+    "{\"type\": \"stored\", \"id\": 2300}",
+    "{\"type\": \"stored\", \"id\": 2301}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 2302,
+        "context": [
+          {
+            "type": "stored",
+            "id": 2303
+          },
+          {
+            "type": "stored",
+            "id": 2304
+          },
+          {
+            "type": "stored",
+            "id": 2305
+          },
+          {
+            "type": "stored",
+            "id": 2306
+          },
+          {
+            "type": "stored",
+            "id": 2307
+          },
+          {
+            "type": "stored",
+            "id": 2308
+          },
+          {
+            "type": "stored",
+            "id": 2309
+          },
+          {
+            "type": "stored",
+            "id": 2310
+          },
+          {
+            "type": "stored",
+            "id": 2311
+          },
+          {
+            "type": "stored",
+            "id": 2312
+          }
+        ]
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,6 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo5/a.v.v\", \"workspace\": \"/coq-dataset/repos/foo5\", \"repository\": \"/coq-dataset/repos/foo5\"}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,120 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo5/ah.v\", \"workspace\": \"/coq-dataset/repos/foo5\", \"repository\": \"/coq-dataset/repos/foo5\"}",
+    "{\"type\": \"stored\", \"id\": 2381}",
+    "{\"type\": \"stored\", \"id\": 2382}",
+    "{\"type\": \"stored\", \"id\": 2383}",
+    "{\"type\": \"stored\", \"id\": 2384}",
+    "{\"type\": \"stored\", \"id\": 2385}",
+    "{\"type\": \"stored\", \"id\": 2386}",
+    "{\"type\": \"stored\", \"id\": 2387}",
+    "{\"type\": \"stored\", \"id\": 2388}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 2389,
+        "context": [
+          {
+            "type": "stored",
+            "id": 2390
+          },
+          {
+            "type": "stored",
+            "id": 2391
+          },
+          {
+            "type": "stored",
+            "id": 2392
+          },
+          {
+            "type": "stored",
+            "id": 2393
+          }
+        ]
+      },
+      "steps": []
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 2394,
+        "context": [
+          {
+            "type": "stored",
+            "id": 2395
+          },
+          {
+            "type": "stored",
+            "id": 2396
+          },
+          {
+            "type": "stored",
+            "id": 2397
+          },
+          {
+            "type": "stored",
+            "id": 2398
+          },
+          {
+            "type": "stored",
+            "id": 2399
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 2400,
+            "context": []
+          },
+          "step": {
+            "text": "\uda59\udcdd\\\u00e0\u0006\u00e8\u00ee\ud9d5\ude7a\u00c5<!",
+            "context": []
+          },
+          "n_step": -130,
+          "goals": [
+            "D\nVAyW\njhxdsZaj\nnlyWnj\ngpFN\nUaM\ngSG\nCrdwVgkoqcIp\n\nwco",
+            "RhaFYrZS\n\ni",
+            "Vo\nNc\nzYpAap\n\nrXzOcPkqdT"
+          ]
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 2401,
+        "context": [
+          {
+            "type": "stored",
+            "id": 2402
+          },
+          {
+            "type": "stored",
+            "id": 2403
+          },
+          {
+            "type": "stored",
+            "id": 2404
+          },
+          {
+            "type": "stored",
+            "id": 2405
+          }
+        ]
+      },
+      "steps": []
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 2406,
+        "context": []
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,216 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo5/cleknjqjxjixxnsnzef.v\", \"workspace\": \"/coq-dataset/repos/foo5\", \"repository\": \"/coq-dataset/repos/foo5\"}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 2334,
+        "context": [
+          {
+            "type": "stored",
+            "id": 2335
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 2336,
+            "context": [
+              {
+                "type": "stored",
+                "id": 2337
+              },
+              {
+                "type": "stored",
+                "id": 2338
+              }
+            ]
+          },
+          "step": {
+            "text": "]\udb30\udf7f\ud85e\udedfs\u00dd\u00a3^\ud8bc\uded3\udadf\ude6e",
+            "context": [
+              {
+                "type": "stored",
+                "id": 2339
+              }
+            ]
+          },
+          "n_step": -344,
+          "goals": [
+            "P\nMCACZVxPbXCYvIddcpDfsZBnr\ntCF\nQYxmXRAAY\nuW\njKAzzKMji\n\nuzk",
+            "qicxT\n\ncLUDpijxDEt",
+            "he\njCRG\naL\n\nMwiFvQQcEahW",
+            "OGYo\nlLM\nP\nQZFM\n\ngmUTpVt",
+            "DznAlFFAZvF\nhDBeNb\nentries\ncdmuUY\nq\n\nvtn",
+            "EpPwkEPX\n\nVXqxbvwq",
+            "lt\nRqDWsU\n\nlQbhAWhjDrSG",
+            "SRAMDRhps\nArf\n\nlpqX",
+            "\n\npf",
+            "LixxCR\nblGy\n\nXRuFfNXryIUpXSjtgpNec"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 2340,
+            "context": []
+          },
+          "step": {
+            "text": "\u0088\ud8d2\udf0c\ud908\ude8d",
+            "context": [
+              {
+                "type": "stored",
+                "id": 2341
+              },
+              {
+                "type": "stored",
+                "id": 2342
+              },
+              {
+                "type": "stored",
+                "id": 2343
+              },
+              {
+                "type": "stored",
+                "id": 2344
+              },
+              {
+                "type": "stored",
+                "id": 2345
+              },
+              {
+                "type": "stored",
+                "id": 2346
+              },
+              {
+                "type": "stored",
+                "id": 2347
+              },
+              {
+                "type": "stored",
+                "id": 2348
+              },
+              {
+                "type": "stored",
+                "id": 2349
+              }
+            ]
+          },
+          "n_step": 4132577799272,
+          "goals": [
+            "BuOW\nNj\n\nRye",
+            "tSh\nSZlMqokhZsb\nwLH\nfbQbmV\nwbZcjDbS\nWF\nbasic\n\ntNEUHB",
+            "\n\nnKP",
+            "\n\nmNnnJpMFadi"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 2350,
+            "context": [
+              {
+                "type": "stored",
+                "id": 2351
+              },
+              {
+                "type": "stored",
+                "id": 2352
+              },
+              {
+                "type": "stored",
+                "id": 2353
+              },
+              {
+                "type": "stored",
+                "id": 2354
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00bc\udb70\udfff\u00c4\u00830",
+            "context": [
+              {
+                "type": "stored",
+                "id": 2355
+              },
+              {
+                "type": "stored",
+                "id": 2356
+              }
+            ]
+          },
+          "n_step": -15655,
+          "goals": [
+            "\n\nRCtsZueMGsuJo",
+            "a\nPEgzLArb\nL\nt\ncVdVFdsqgl\nU\nJSNJvPcNn\nLsmhrBhVrQDKGe\ntbkLsJ\nCnKSm\nd\nsKKzyxGAIRgkBO\nfvTEptNp\nqmeaCv\nx\n\nzyA",
+            "Gm\nINF\nR\nZ\nJa\nyl\nxFUrwbUiGJx\nK\nyjfQnhaPTmqK\nA\niNO\nCkO\neEwFUHk\nN\nS\n\nsXEjXdHmCRECREWdeXvAE",
+            "HYRGIBk\nAj\nQUMSkJri\n\nbY",
+            "Inq\nJmnCMr\nX\nHA\nStzy\nNULL\na\nRbxSsBw\nsVlQQ\n\nrqb",
+            "zoHj\n\nNaN"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 2357,
+            "context": [
+              {
+                "type": "stored",
+                "id": 2358
+              },
+              {
+                "type": "stored",
+                "id": 2359
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00d6\u00b8\u00e21",
+            "context": [
+              {
+                "type": "stored",
+                "id": 2360
+              },
+              {
+                "type": "stored",
+                "id": 2361
+              },
+              {
+                "type": "stored",
+                "id": 2362
+              },
+              {
+                "type": "stored",
+                "id": 2363
+              },
+              {
+                "type": "stored",
+                "id": 2364
+              },
+              {
+                "type": "stored",
+                "id": 2365
+              }
+            ]
+          },
+          "n_step": -6116,
+          "goals": [
+            "zt\nY\n\nuxKKJJVw",
+            "uq\nkwj\nQFdoIaxKTPpm\ncyQHRbLJgbI\njpWGIHC\nfOuDQmRoQXpeCB\nTM\nwSOd\nMOGGbpWratCfHBeJAN\nd\nuCiB\nsLIJhpM\nVigRxxDqb\n\nWZli",
+            "\n\nxoxb",
+            "\n\nAHDPWVD",
+            "ZCnUS\nbvDMYWcmwz\nk\nCl\ncr\ntOxMrGto\nuf\nLb\nKJueLlB\n\niLc",
+            "t\n\nb",
+            "KBOvceMXMtL\niMWPGoqU\nqCQ\nmU\nefBC\nEq\nsZNg\nzWDppk\nOiXMy\nFALSE\nT\njKH\nT\nK\nAMaMPHOdXG\n\nnone",
+            "eNurx\nRECORD\nQ\nhxixbUSItTsbFIEmUjoBZsCtuS\n\nfcnwaU"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,7 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo5/des.v.v\", \"workspace\": \"/coq-dataset/repos/foo5\", \"repository\": \"/coq-dataset/repos/foo5\"}",
+    "{\"type\": \"stored\", \"id\": 2366}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
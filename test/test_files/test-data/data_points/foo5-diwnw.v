@@ -0,0 +1,9 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo5/diwnw.v\", \"workspace\": \"/coq-dataset/repos/foo5\", \"repository\": \"/coq-dataset/repos/foo5\"}",
+    "{\"type\": \"stored\", \"id\": 2576}",
+    "{\"type\": \"stored\", \"id\": 2577}",
+    "{\"type\": \"stored\", \"id\": 2578}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
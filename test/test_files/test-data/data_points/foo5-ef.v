@@ -0,0 +1,277 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo5/ef.v\", \"workspace\": \"/coq-dataset/repos/foo5\", \"repository\": \"/coq-dataset/repos/foo5\"}",
+    "{\"type\": \"stored\", \"id\": 2638}",
+    "{\"type\": \"stored\", \"id\": 2639}",
+    "{\"type\": \"stored\", \"id\": 2640}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 2641,
+        "context": [
+          {
+            "type": "stored",
+            "id": 2642
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 2643,
+            "context": []
+          },
+          "step": {
+            "text": "\u0001\u00f4ip\u00ad\u0099",
+            "context": []
+          },
+          "n_step": -1437322375418198,
+          "goals": [
+            "gKwQHUR\nytnwj\nHk\nriPKtHenUNn\nYrzZSEpqZyHOr\nFmHEkPNdcYww\nAqTKWK\nel\nPL\nM\nHkIFeO\nWHJDo\n\nshNzTssiTqAcGlWnUuIxradKWL",
+            "MNfr\nuCoWDiYCy\nTrue\nCNQ\nmeuyoGnkbyw\nB\nCfU\njuNSo\nN\nxo\n\nGyqN",
+            "s\n\ntKMkKYizhOUOGWwvcXMpiEZLHcR"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 2644,
+            "context": [
+              {
+                "type": "stored",
+                "id": 2645
+              },
+              {
+                "type": "stored",
+                "id": 2646
+              }
+            ]
+          },
+          "step": {
+            "text": "?y<|e\u0012\b",
+            "context": []
+          },
+          "n_step": -289,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 2647,
+            "context": []
+          },
+          "step": {
+            "text": "\uda93\udd80T\udb60\udfb9(\u009f\u001f\u0004",
+            "context": [
+              {
+                "type": "stored",
+                "id": 2648
+              },
+              {
+                "type": "stored",
+                "id": 2649
+              },
+              {
+                "type": "stored",
+                "id": 2650
+              },
+              {
+                "type": "stored",
+                "id": 2651
+              },
+              {
+                "type": "stored",
+                "id": 2652
+              },
+              {
+                "type": "stored",
+                "id": 2653
+              },
+              {
+                "type": "stored",
+                "id": 2654
+              },
+              {
+                "type": "stored",
+                "id": 2655
+              },
+              {
+                "type": "stored",
+                "id": 2656
+              },
+              {
+                "type": "stored",
+                "id": 2657
+              }
+            ]
+          },
+          "n_step": 84813124,
+          "goals": [
+            "\n\nVNyn",
+            "\n\nzOeQT",
+            "RECORD\n\nhVSlSJgMHvy",
+            "xExf\nnF\ndPmkAr\nT\n\nR",
+            "bdTomUU\nV\nUFYbdUoyxVPZjxPoPzL\naOapmD\ncIlgYpZFGGjBQS\nY\n\ndvwxmH",
+            "WCjPoUeZqtmN\n\ng",
+            "nuGHha\nKFNCEg\nPrKgXlVvbu\nQf\nBispws\n\nexKwwUAy",
+            "qeUzaxx\nm\nWr\nDR\nzlkE\nk\nqEEJ\npB\n\nCUgCoVbBlfQOHmUCdftQQuMctSJZufHW",
+            "Vo\nd\nretriever\nAIELvaU\nPpPJQUXQjnsG\nShIhiWueqwxJKzAnC\nuMVUwIFOFA\nrHV\nD\nLGouZ\nNi\nyFwOAZ\nhvd\n\nfsh",
+            "n\ntrKocU\ncaVij\nH\n\nEkbVaTYgckZfkHrYM",
+            "WFWO\nQt\noQ\nwgOwiL\nykK\n\nLkmIS",
+            "True\nJGiU\nMDImAFXqjRWRDxGIJoIp\nwYdLlXEnPWPZXLHkw\nxPWntiW\npremises\nvA\ng\nmi\nPjWssxQMiOsb\nd\n\nw"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 2658,
+            "context": [
+              {
+                "type": "stored",
+                "id": 2659
+              },
+              {
+                "type": "stored",
+                "id": 2660
+              }
+            ]
+          },
+          "step": {
+            "text": "\u008b",
+            "context": [
+              {
+                "type": "stored",
+                "id": 2661
+              },
+              {
+                "type": "stored",
+                "id": 2662
+              },
+              {
+                "type": "stored",
+                "id": 2663
+              },
+              {
+                "type": "stored",
+                "id": 2664
+              },
+              {
+                "type": "stored",
+                "id": 2665
+              },
+              {
+                "type": "stored",
+                "id": 2666
+              },
+              {
+                "type": "stored",
+                "id": 2667
+              },
+              {
+                "type": "stored",
+                "id": 2668
+              }
+            ]
+          },
+          "n_step": 64769451,
+          "goals": [
+            "gDJEC\nrtYWTxWivHAtFg\nq\nbcQy\nJFN\nbxuHcS\nFWiuVDwg\nDwaoQpweRcKUMmqd\nWARNING\n\nWRZLN"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 2669,
+            "context": [
+              {
+                "type": "stored",
+                "id": 2670
+              },
+              {
+                "type": "stored",
+                "id": 2671
+              },
+              {
+                "type": "stored",
+                "id": 2672
+              }
+            ]
+          },
+          "step": {
+            "text": "1\u0084\uaf90\ud96d\udd06",
+            "context": [
+              {
+                "type": "stored",
+                "id": 2673
+              }
+            ]
+          },
+          "n_step": -765987,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 2674,
+            "context": [
+              {
+                "type": "stored",
+                "id": 2675
+              },
+              {
+                "type": "stored",
+                "id": 2676
+              },
+              {
+                "type": "stored",
+                "id": 2677
+              },
+              {
+                "type": "stored",
+                "id": 2678
+              },
+              {
+                "type": "stored",
+                "id": 2679
+              },
+              {
+                "type": "stored",
+                "id": 2680
+              },
+              {
+                "type": "stored",
+                "id": 2681
+              },
+              {
+                "type": "stored",
+                "id": 2682
+              },
+              {
+                "type": "stored",
+                "id": 2683
+              },
+              {
+                "type": "stored",
+                "id": 2684
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 2685
+              }
+            ]
+          },
+          "n_step": 42958,
+          "goals": []
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
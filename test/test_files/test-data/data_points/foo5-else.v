@@ -0,0 +1,7 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo5/else.v\", \"workspace\": \"/coq-dataset/repos/foo5\", \"repository\": \"/coq-dataset/repos/foo5\"}",
+    "{\"type\": \"stored\", \"id\": 2549}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,356 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo5/epoxgmx.v\", \"workspace\": \"/coq-dataset/repos/foo5\", \"repository\": \"/coq-dataset/repos/foo5\"}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 2579,
+        "context": []
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 2580,
+            "context": [
+              {
+                "type": "stored",
+                "id": 2581
+              }
+            ]
+          },
+          "step": {
+            "text": ")\u00e1F\u00da*\u00ed",
+            "context": [
+              {
+                "type": "stored",
+                "id": 2582
+              },
+              {
+                "type": "stored",
+                "id": 2583
+              },
+              {
+                "type": "stored",
+                "id": 2584
+              },
+              {
+                "type": "stored",
+                "id": 2585
+              },
+              {
+                "type": "stored",
+                "id": 2586
+              },
+              {
+                "type": "stored",
+                "id": 2587
+              }
+            ]
+          },
+          "n_step": 97365948,
+          "goals": [
+            "A\nwOSbur\nWWqFUak\nqOcU\nf\n\newTtMjzORReJJntyb",
+            "rFXaiEMd\nfreeze\nymfdTey\n\nvKBVOGVues",
+            "aQut\n\nDSwIdewaZKFcfaYCsgiL",
+            "Fjby\nENcXE\nL\nywKYutcwfpUhA\nV\nHMdLdGfbT\nEde\n\ngVwVF",
+            "YsfEFvoQUO\niaeh\ndmWgiYMeFwNGxDerUSKJLVvPFoQuOFCTRvVI\nLIr\nkOvanA\n\nQrHyvNgczWcruLsmy",
+            "uI\nAenPedG\nzjRIr\ndfjAdi\nibe\n\nGvxmMDMbd",
+            "cA\nINn\nQslac\nyVkjVCaxZlhFXYLEJ\nLmecW\n\nJQYltsa"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 2588,
+            "context": []
+          },
+          "step": {
+            "text": "R\u0019\u00f0\u000b\u00dc,\u00ec\u00ea\u00eb\uda65\udcc0\udbef\udc96\ud861\udd83\u0014\ud9a8\udcfc<_\u0091\u0097VD",
+            "context": [
+              {
+                "type": "stored",
+                "id": 2589
+              },
+              {
+                "type": "stored",
+                "id": 2590
+              }
+            ]
+          },
+          "n_step": 99999999999999999,
+          "goals": [
+            "YVmg\nDpBJsCZ\ni\nSe\ng\nQfybqk\nYnJ\nJnwyCodBWzJEiIFP\nHgt\n\nmEoLvUDs",
+            "BQgy\nnxH\nrKFFlRu\nVcbiEhLuqGdXtQeJNViUoJ\nikn\nE\nwl\nrx\nbEj\n\nB",
+            "\n\no",
+            "WLaSU\nfiMoVpjYSZHy\nVWXBfpBOOysEkJYP\njui\nD\n\nE",
+            "SPoy\nUi\nv\njOhZVhV\nCrUVwlbUStSNSfjz\naAiYRDUQNthtW\nAoHsGk\n\ncVoOV",
+            "zEmnSpeUdbEhy\nieas\n\nCsRo",
+            "oZZURseUU\nstable\nhx\nYcFi\nOV\nVhJiXTIkaiNeROAF\n\nGGQUYtgA",
+            "\n\nk",
+            "DcR\nFalse\nDjNdwdLfEOx\nJl\nhYHhKQ\naTao\nuWBvNUnQaNV\nBO\ntSCRn\n\nB",
+            "BWDXvjlO\nCOINDUCTIVE\nO\nidscXQMt\nPpXUJzjA\nW\nwlr\nPcAljDfXxkFtlQMHrRwD\n\nkGsXRwvmgUGRMgjTmNJSm",
+            "dZh\n\nwQ",
+            "jCfA\nHEFcL\nmesZaP\nNone\nSo\nRhDaqwruasCXK\nRhC\nP\na\niPjYTxgSAYXGxxhKILOsqR\nzogQzvjAabOzGN\nM\nVoW\nNINmLYuDtY\n\nGtnKfz",
+            "oImIhczUeIryDXCHVktGX\nJM\n\nvHqf"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 2591,
+            "context": [
+              {
+                "type": "stored",
+                "id": 2592
+              },
+              {
+                "type": "stored",
+                "id": 2593
+              },
+              {
+                "type": "stored",
+                "id": 2594
+              },
+              {
+                "type": "stored",
+                "id": 2595
+              },
+              {
+                "type": "stored",
+                "id": 2596
+              },
+              {
+                "type": "stored",
+                "id": 2597
+              },
+              {
+                "type": "stored",
+                "id": 2598
+              },
+              {
+                "type": "stored",
+                "id": 2599
+              },
+              {
+                "type": "stored",
+                "id": 2600
+              }
+            ]
+          },
+          "step": {
+            "text": "_f\u00f2\u00e1\u00e8D\u0094\u001e",
+            "context": []
+          },
+          "n_step": 18541522773552,
+          "goals": [
+            "\n\ntXEd",
+            "akGp\njki\nG\nxSkgsk\nT\nDZZAEJegqdGbHoHvhSmJLX\nQLC\nFh\nM\naRaKRKhWtDqPChRPK\nioR\n\nWkhVvm",
+            "TTiqmbpW\nB\nH\ndrSCRXZICN\nnaka\ncvFcTKeAX\n\nyXLReGJkyMabFhX",
+            "CtDSqYULxuA\nwZJcx\n\na",
+            "BF\nZ\nppwHpV\nVlDvNwwpLBFzNDsIIueQcFQIUz\nRMddrR\ntPTiexm\nXCy\nrHBlYJYXNkNw\nt\nN\nA\nHXTCkQXcotKlQjkOvu\nGh\nInfinity\ngYVdSxE\n\nMgUU",
+            "lY\n\nowrBFIjfhQrGApfUxeaWIv",
+            "\n\nmryhYOKuwJOtyDYBIUAfQbh",
+            "FR\nji\nB\nWIjoblSUKfzqdCLFl\nMDJI\n\nUUFEeBYKU"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 2601,
+            "context": [
+              {
+                "type": "stored",
+                "id": 2602
+              },
+              {
+                "type": "stored",
+                "id": 2603
+              },
+              {
+                "type": "stored",
+                "id": 2604
+              }
+            ]
+          },
+          "step": {
+            "text": "n\uda7a\udd5e",
+            "context": []
+          },
+          "n_step": -54366464303912129134592,
+          "goals": [
+            "kt\nworkers\nuJEkDghm\nONAQxkzs\nb\nlgf\n\nKDA",
+            "\n\nwysjN",
+            "lyG\nMnz\n\nZ",
+            "\n\nU",
+            "Abc\nXg\nueXkefxVO\nDRs\nfUR\nf\nq\n\nZVZNMHln"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 2605,
+            "context": [
+              {
+                "type": "stored",
+                "id": 2606
+              }
+            ]
+          },
+          "step": {
+            "text": "\u007f\u008b\ud90e\ude6e\u0093T\u00af-\u00a8",
+            "context": [
+              {
+                "type": "stored",
+                "id": 2607
+              },
+              {
+                "type": "stored",
+                "id": 2608
+              }
+            ]
+          },
+          "n_step": -86348368675,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 2609,
+            "context": [
+              {
+                "type": "stored",
+                "id": 2610
+              },
+              {
+                "type": "stored",
+                "id": 2611
+              }
+            ]
+          },
+          "step": {
+            "text": "h\ud85f\uddfac\u00d4",
+            "context": []
+          },
+          "n_step": -21502715368356374904832,
+          "goals": [
+            "LrBjPORs\n\ngUUt"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 2612,
+            "context": [
+              {
+                "type": "stored",
+                "id": 2613
+              },
+              {
+                "type": "stored",
+                "id": 2614
+              },
+              {
+                "type": "stored",
+                "id": 2615
+              },
+              {
+                "type": "stored",
+                "id": 2616
+              },
+              {
+                "type": "stored",
+                "id": 2617
+              },
+              {
+                "type": "stored",
+                "id": 2618
+              },
+              {
+                "type": "stored",
+                "id": 2619
+              },
+              {
+                "type": "stored",
+                "id": 2620
+              },
+              {
+                "type": "stored",
+                "id": 2621
+              },
+              {
+                "type": "stored",
+                "id": 2622
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00bb\uda8f\udfad\u009e\u0086\udbdc\udcbc",
+            "context": [
+              {
+                "type": "stored",
+                "id": 2623
+              },
+              {
+                "type": "stored",
+                "id": 2624
+              },
+              {
+                "type": "stored",
+                "id": 2625
+              },
+              {
+                "type": "stored",
+                "id": 2626
+              },
+              {
+                "type": "stored",
+                "id": 2627
+              },
+              {
+                "type": "stored",
+                "id": 2628
+              },
+              {
+                "type": "stored",
+                "id": 2629
+              },
+              {
+                "type": "stored",
+                "id": 2630
+              },
+              {
+                "type": "stored",
+                "id": 2631
+              },
+              {
+                "type": "stored",
+                "id": 2632
+              },
+              {
+                "type": "stored",
+                "id": 2633
+              },
+              {
+                "type": "stored",
+                "id": 2634
+              }
+            ]
+          },
+          "n_step": -7806654,
+          "goals": [
+            "eFVgHoGQUPhcFa\nUrKDlfwGrwYVFNpRpiokIaywoI\ndogIliwJeTzWvZBGvlCivRZmQa\nvIRdJ\nIPDRbg\nCvOQfGakVSvFSm\nHEU\nuN\n\nYkhm",
+            "ZOvtWg\nOtGjU\nQ\nIbXitN\nKOc\nOz\ncUNSGwh\nHCA\nAto\nhKPcvgMiw\nNone\nvaoyEDJIarPgwNp\n\nVJ",
+            "YeEUYHLnBfGc\nrStK\nz\noagNik\ni\n\nb",
+            "zFUHTqd\nEGDOdYa\nQSnd\nqeR\n\nClFwi",
+            "bwZ\neFtGIJBF\nGyCXnfuSWTyjgHDBXuzq\nAlhNeCfJAdo\nCBIwPaZ\nIdSPxnszBYUrXM\nGoLxd\nLjzyxLAXL\nFUnhz\n\nutA",
+            "wnINQ\nNnTd\nF\nYDFRtoBSO\nRqkXYuoI\noqT\nBfglmZQkxdrYYKlZGwHQUGg\nAt\ncywMqVSfkxVbIuBqnvMUfQcfUxWbldnYbI\nv\nZdR\nGLltd\nDmfZHJxD\nkbcSVmFvehgUeowtAOmvFOVZI\ny\nntvIi\nkwXCWnIftPH\ncrPOOp\naDlo\nKQoHH\n\nVjikmdEwXaWNNL",
+            "A\n\nCDpcIQv"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,8 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo5/false.v\", \"workspace\": \"/coq-dataset/repos/foo5\", \"repository\": \"/coq-dataset/repos/foo5\"}",
+    "{\"type\": \"stored\", \"id\": 2379}",
+    "{\"type\": \"stored\", \"id\": 2380}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,9 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo5/hsxadakpgwon.v\", \"workspace\": \"/coq-dataset/repos/foo5\", \"repository\": \"/coq-dataset/repos/foo5\"}",
+    "{\"type\": \"stored\", \"id\": 2635}",
+    "{\"type\": \"stored\", \"id\": 2636}",
+    "{\"type\": \"stored\", \"id\": 2637}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,68 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo5/lfiyzagqvkjvu.v\", \"workspace\": \"/coq-dataset/repos/foo5\", \"repository\": \"/coq-dataset/repos/foo5\"}",
+    "{\"type\": \"stored\", \"id\": 2550}",
+    "{\"type\": \"stored\", \"id\": 2551}",
+    "{\"type\": \"stored\", \"id\": 2552}",
+    "{\"type\": \"stored\", \"id\": 2553}",
+    "{\"type\": \"stored\", \"id\": 2554}",
+    "{\"type\": \"stored\", \"id\": 2555}",
+    "{\"type\": \"stored\", \"id\": 2556}",
+    "{\"type\": \"stored\", \"id\": 2557}",
+    "{\"type\": \"stored\", \"id\": 2558}",
+    "{\"type\": \"stored\", \"id\": 2559}",
+    "{\"type\": \"stored\", \"id\": 2560}",
+    "{\"type\": \"stored\", \"id\": 2561}",
+    "{\"type\": \"stored\", \"id\": 2562}",
+    "{\"type\": \"stored\", \"id\": 2563}",
+    "{\"type\": \"stored\", \"id\": 2564}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 2565,
+        "context": [
+          {
+            "type": "stored",
+            "id": 2566
+          },
+          {
+            "type": "stored",
+            "id": 2567
+          },
+          {
+            "type": "stored",
+            "id": 2568
+          },
+          {
+            "type": "stored",
+            "id": 2569
+          },
+          {
+            "type": "stored",
+            "id": 2570
+          },
+          {
+            "type": "stored",
+            "id": 2571
+          }
+        ]
+      },
+      "steps": []
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 2572,
+        "context": [
+          {
+            "type": "stored",
+            "id": 2573
+          }
+        ]
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,334 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo5/mrrbhf.v\", \"workspace\": \"/coq-dataset/repos/foo5\", \"repository\": \"/coq-dataset/repos/foo5\"}",
+    "{\"type\": \"stored\", \"id\": 2455}",
+    "{\"type\": \"stored\", \"id\": 2456}",
+    "{\"type\": \"stored\", \"id\": 2457}",
+    "{\"type\": \"stored\", \"id\": 2458}",
+    "{\"type\": \"stored\", \"id\": 2459}",
+    "{\"type\": \"stored\", \"id\": 2460}",
+    "{\"type\": \"stored\", \"id\": 2461}",
+    "{\"type\": \"stored\", \"id\": 2462}",
+    "{\"type\": \"stored\", \"id\": 2463}",
+    "{\"type\": \"stored\", \"id\": 2464}",
+    "{\"type\": \"stored\", \"id\": 2465}",
+    "{\"type\": \"stored\", \"id\": 2466}",
+    "{\"type\": \"stored\", \"id\": 2467}",
+    "{\"type\": \"stored\", \"id\": 2468}",
+    "{\"type\": \"stored\", \"id\": 2469}",
+    "{\"type\": \"stored\", \"id\": 2470}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 2471,
+        "context": [
+          {
+            "type": "stored",
+            "id": 2472
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 2473,
+            "context": [
+              {
+                "type": "stored",
+                "id": 2474
+              },
+              {
+                "type": "stored",
+                "id": 2475
+              },
+              {
+                "type": "stored",
+                "id": 2476
+              },
+              {
+                "type": "stored",
+                "id": 2477
+              },
+              {
+                "type": "stored",
+                "id": 2478
+              },
+              {
+                "type": "stored",
+                "id": 2479
+              },
+              {
+                "type": "stored",
+                "id": 2480
+              }
+            ]
+          },
+          "step": {
+            "text": "z\u008b\u00f4~\u00ed\u0018",
+            "context": [
+              {
+                "type": "stored",
+                "id": 2481
+              },
+              {
+                "type": "stored",
+                "id": 2482
+              }
+            ]
+          },
+          "n_step": 1039976,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 2483,
+            "context": []
+          },
+          "step": {
+            "text": "II\u00ba\u0090\u00c5u\u00fb\u00a0\u00f7r\u0087\uda49\udf3f!\u008e",
+            "context": []
+          },
+          "n_step": -757,
+          "goals": [
+            "mNHvPGMGbOXFtkPBCkq\navCkoHd\nqDOQ\n\nsDZbQSboCr",
+            "HNGrE\nlgS\ngs\n\nJgDbj",
+            "YDfiUtgX\nJkuXNTvApwYD\nhEyDTBULUJPriPlAsKhHI\n\njSvbhNQQvJ",
+            "\n\noUEqRy",
+            "f\nLWS\n\nrKNYnx",
+            "OSHNH\nRqda\nb\namfAVg\nZcmrqOlOE\nT\naxlHvvU\nTFRMMwGRAfSkT\nmY\n\nPhYLfDHLp",
+            "XnkFts\nhzgDFYNrOk\n\nJiI",
+            "\n\nXm",
+            "oqW\ndTF\nU\nInfinity\nIPB\nnn\nAO\n\nOhqFeNLOSj",
+            "ytKBqA\n\nnKDvcKxZ",
+            "z\n\nZ"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 2484,
+            "context": [
+              {
+                "type": "stored",
+                "id": 2485
+              },
+              {
+                "type": "stored",
+                "id": 2486
+              },
+              {
+                "type": "stored",
+                "id": 2487
+              },
+              {
+                "type": "stored",
+                "id": 2488
+              },
+              {
+                "type": "stored",
+                "id": 2489
+              },
+              {
+                "type": "stored",
+                "id": 2490
+              },
+              {
+                "type": "stored",
+                "id": 2491
+              },
+              {
+                "type": "stored",
+                "id": 2492
+              },
+              {
+                "type": "stored",
+                "id": 2493
+              },
+              {
+                "type": "stored",
+                "id": 2494
+              },
+              {
+                "type": "stored",
+                "id": 2495
+              },
+              {
+                "type": "stored",
+                "id": 2496
+              },
+              {
+                "type": "stored",
+                "id": 2497
+              },
+              {
+                "type": "stored",
+                "id": 2498
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00bd\u00db\udb9b\udc38\u0011p",
+            "context": [
+              {
+                "type": "stored",
+                "id": 2499
+              },
+              {
+                "type": "stored",
+                "id": 2500
+              },
+              {
+                "type": "stored",
+                "id": 2501
+              },
+              {
+                "type": "stored",
+                "id": 2502
+              }
+            ]
+          },
+          "n_step": 155,
+          "goals": [
+            "\n\nwsOBSkgvREwiuGFAWOsFzo",
+            "s\nVa\ne\n\nuU",
+            "JZ\neLLjqIgyAblLlm\nqLCtKDB\nYdcu\n\nO",
+            "LSnOk\n\nyza",
+            "Yv\nv\npgVu\n\nATKMQwxWyoVEzhYpzkjvGivUMSemq",
+            "R\nShxrwOmSVnG\np\nO\neTVJZdvNbUo\nPbuH\nYX\nPwI\nhGpLEFmyYKFLfPiv\nGrqpIKbEaOv\nQjXjPyLgzSl\nqDMKp\n\ntrue",
+            "Y\nJXYvRIbCSk\nRiGGxo\nFALSE\nZArGvEJloxHe\nSCLeXhhRyxHO\npXSuGnooa\nInhAWFSoTJ\nchange\niHWzTyKiPuV\nsGDZLGJsP\nQ\nayoHUpBLystmJVpNgBog\nb\n\nXglBg",
+            "ZOFD\njnxnTtMj\ncuU\nKsLpekkuDo\ngRWsbjc\n\nzsZy"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 2503,
+            "context": [
+              {
+                "type": "stored",
+                "id": 2504
+              },
+              {
+                "type": "stored",
+                "id": 2505
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00b8\u000f",
+            "context": [
+              {
+                "type": "stored",
+                "id": 2506
+              },
+              {
+                "type": "stored",
+                "id": 2507
+              },
+              {
+                "type": "stored",
+                "id": 2508
+              },
+              {
+                "type": "stored",
+                "id": 2509
+              },
+              {
+                "type": "stored",
+                "id": 2510
+              },
+              {
+                "type": "stored",
+                "id": 2511
+              },
+              {
+                "type": "stored",
+                "id": 2512
+              },
+              {
+                "type": "stored",
+                "id": 2513
+              },
+              {
+                "type": "stored",
+                "id": 2514
+              },
+              {
+                "type": "stored",
+                "id": 2515
+              },
+              {
+                "type": "stored",
+                "id": 2516
+              },
+              {
+                "type": "stored",
+                "id": 2517
+              },
+              {
+                "type": "stored",
+                "id": 2518
+              },
+              {
+                "type": "stored",
+                "id": 2519
+              },
+              {
+                "type": "stored",
+                "id": 2520
+              },
+              {
+                "type": "stored",
+                "id": 2521
+              },
+              {
+                "type": "stored",
+                "id": 2522
+              },
+              {
+                "type": "stored",
+                "id": 2523
+              },
+              {
+                "type": "stored",
+                "id": 2524
+              },
+              {
+                "type": "stored",
+                "id": 2525
+              },
+              {
+                "type": "stored",
+                "id": 2526
+              },
+              {
+                "type": "stored",
+                "id": 2527
+              },
+              {
+                "type": "stored",
+                "id": 2528
+              },
+              {
+                "type": "stored",
+                "id": 2529
+              },
+              {
+                "type": "stored",
+                "id": 2530
+              }
+            ]
+          },
+          "n_step": -126,
+          "goals": [
+            "\n\ng"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
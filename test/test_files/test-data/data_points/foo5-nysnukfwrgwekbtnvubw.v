@@ -0,0 +1,9 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo5/nysnukfwrgwekbtnvubw.v\", \"workspace\": \"/coq-dataset/repos/foo5\", \"repository\": \"/coq-dataset/repos/foo5\"}",
+    "{\"type\": \"stored\", \"id\": 2531}",
+    "{\"type\": \"stored\", \"id\": 2532}",
+    "{\"type\": \"stored\", \"id\": 2533}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
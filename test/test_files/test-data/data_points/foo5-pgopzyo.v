@@ -0,0 +1,12 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo5/pgopzyo.v\", \"workspace\": \"/coq-dataset/repos/foo5\", \"repository\": \"/coq-dataset/repos/foo5\"}",
+    "{\"type\": \"stored\", \"id\": 2407}",
+    "{\"type\": \"stored\", \"id\": 2408}",
+    "{\"type\": \"stored\", \"id\": 2409}",
+    "{\"type\": \"stored\", \"id\": 2410}",
+    "{\"type\": \"stored\", \"id\": 2411}",
+    "{\"type\": \"stored\", \"id\": 2412}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
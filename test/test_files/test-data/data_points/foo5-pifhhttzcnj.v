@@ -0,0 +1,27 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo5/pifhhttzcnj.v\", \"workspace\": \"/coq-dataset/repos/foo5\", \"repository\": \"/coq-dataset/repos/foo5\"}",
+    "{\"type\": \"stored\", \"id\": 2313}",
+    "{\"type\": \"stored\", \"id\": 2314}",
+    "{\"type\": \"stored\", \"id\": 2315}",
+    "{\"type\": \"stored\", \"id\": 2316}",
+    "{\"type\": \"stored\", \"id\": 2317}",
+    "{\"type\": \"stored\", \"id\": 2318}",
+    "{\"type\": \"stored\", \"id\": 2319}",
+    "{\"type\": \"stored\", \"id\": 2320}",
+    "{\"type\": \"stored\", \"id\": 2321}",
+    "{\"type\": \"stored\", \"id\": 2322}",
+    "{\"type\": \"stored\", \"id\": 2323}",
+    "{\"type\": \"stored\", \"id\": 2324}",
+    "{\"type\": \"stored\", \"id\": 2325}",
+    "{\"type\": \"stored\", \"id\": 2326}",
+    "{\"type\": \"stored\", \"id\": 2327}",
+    "{\"type\": \"stored\", \"id\": 2328}",
+    "{\"type\": \"stored\", \"id\": 2329}",
+    "{\"type\": \"stored\", \"id\": 2330}",
+    "{\"type\": \"stored\", \"id\": 2331}",
+    "{\"type\": \"stored\", \"id\": 2332}",
+    "{\"type\": \"stored\", \"id\": 2333}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
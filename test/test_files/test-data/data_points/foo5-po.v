@@ -0,0 +1,30 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo5/po.v\", \"workspace\": \"/coq-dataset/repos/foo5\", \"repository\": \"/coq-dataset/repos/foo5\"}",
+    "{\"type\": \"stored\", \"id\": 2369}",
+    "{\"type\": \"stored\", \"id\": 2370}",
+    "{\"type\": \"stored\", \"id\": 2371}",
+    "{\"type\": \"stored\", \"id\": 2372}",
+    "{\"type\": \"stored\", \"id\": 2373}",
+    "{\"type\": \"stored\", \"id\": 2374}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 2375,
+        "context": [
+          {
+            "type": "stored",
+            "id": 2376
+          },
+          {
+            "type": "stored",
+            "id": 2377
+          }
+        ]
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
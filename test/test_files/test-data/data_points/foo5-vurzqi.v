@@ -0,0 +1,8 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo5/vurzqi.v\", \"workspace\": \"/coq-dataset/repos/foo5\", \"repository\": \"/coq-dataset/repos/foo5\"}",
+    "{\"type\": \"stored\", \"id\": 2574}",
+    "{\"type\": \"stored\", \"id\": 2575}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,184 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo5/w.v\", \"workspace\": \"/coq-dataset/repos/foo5\", \"repository\": \"/coq-dataset/repos/foo5\"}",
+    "{\"type\": \"stored\", \"id\": 2414}",
+    "{\"type\": \"stored\", \"id\": 2415}",
+    "{\"type\": \"stored\", \"id\": 2416}",
+    "{\"type\": \"stored\", \"id\": 2417}",
+    "{\"type\": \"stored\", \"id\": 2418}",
+    "{\"type\": \"stored\", \"id\": 2419}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 2420,
+        "context": [
+          {
+            "type": "stored",
+            "id": 2421
+          },
+          {
+            "type": "stored",
+            "id": 2422
+          },
+          {
+            "type": "stored",
+            "id": 2423
+          },
+          {
+            "type": "stored",
+            "id": 2424
+          },
+          {
+            "type": "stored",
+            "id": 2425
+          },
+          {
+            "type": "stored",
+            "id": 2426
+          },
+          {
+            "type": "stored",
+            "id": 2427
+          },
+          {
+            "type": "stored",
+            "id": 2428
+          },
+          {
+            "type": "stored",
+            "id": 2429
+          },
+          {
+            "type": "stored",
+            "id": 2430
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 2431,
+            "context": [
+              {
+                "type": "stored",
+                "id": 2432
+              },
+              {
+                "type": "stored",
+                "id": 2433
+              },
+              {
+                "type": "stored",
+                "id": 2434
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 2435
+              },
+              {
+                "type": "stored",
+                "id": 2436
+              },
+              {
+                "type": "stored",
+                "id": 2437
+              },
+              {
+                "type": "stored",
+                "id": 2438
+              },
+              {
+                "type": "stored",
+                "id": 2439
+              },
+              {
+                "type": "stored",
+                "id": 2440
+              },
+              {
+                "type": "stored",
+                "id": 2441
+              },
+              {
+                "type": "stored",
+                "id": 2442
+              },
+              {
+                "type": "stored",
+                "id": 2443
+              },
+              {
+                "type": "stored",
+                "id": 2444
+              },
+              {
+                "type": "stored",
+                "id": 2445
+              }
+            ]
+          },
+          "n_step": 614882,
+          "goals": [
+            "rEreZOtDl\noSQ\nJVrJjtG\nxy\nePuVk\nCfue\n\nPU",
+            "lMl\nj\nDJeKv\n\nS",
+            "TsUODu\n\nfzv"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 2446,
+            "context": []
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 2447
+              },
+              {
+                "type": "stored",
+                "id": 2448
+              },
+              {
+                "type": "stored",
+                "id": 2449
+              },
+              {
+                "type": "stored",
+                "id": 2450
+              },
+              {
+                "type": "stored",
+                "id": 2451
+              },
+              {
+                "type": "stored",
+                "id": 2452
+              },
+              {
+                "type": "stored",
+                "id": 2453
+              },
+              {
+                "type": "stored",
+                "id": 2454
+              }
+            ]
+          },
+          "n_step": 134217728,
+          "goals": []
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
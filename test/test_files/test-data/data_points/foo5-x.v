@@ -0,0 +1,21 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo5/x.v\", \"workspace\": \"/coq-dataset/repos/foo5\", \"repository\": \"/coq-dataset/repos/foo5\"}",
+    "{\"type\": \"stored\", \"id\": 2534}",
+    "{\"type\": \"stored\", \"id\": 2535}",
+    "{\"type\": \"stored\", \"id\": 2536}",
+    "{\"type\": \"stored\", \"id\": 2537}",
+    "{\"type\": \"stored\", \"id\": 2538}",
+    "{\"type\": \"stored\", \"id\": 2539}",
+    "{\"type\": \"stored\", \"id\": 2540}",
+    "{\"type\": \"stored\", \"id\": 2541}",
+    "{\"type\": \"stored\", \"id\": 2542}",
+    "{\"type\": \"stored\", \"id\": 2543}",
+    "{\"type\": \"stored\", \"id\": 2544}",
+    "{\"type\": \"stored\", \"id\": 2545}",
+    "{\"type\": \"stored\", \"id\": 2546}",
+    "{\"type\": \"stored\", \"id\": 2547}",
+    "{\"type\": \"stored\", \"id\": 2548}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
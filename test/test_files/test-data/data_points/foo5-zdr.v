@@ -0,0 +1,8 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo5/zdr.v\", \"workspace\": \"/coq-dataset/repos/foo5\", \"repository\": \"/coq-dataset/repos/foo5\"}",
+    "{\"type\": \"stored\", \"id\": 2367}",
+    "{\"type\": \"stored\", \"id\": 2368}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
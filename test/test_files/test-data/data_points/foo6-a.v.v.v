@@ -0,0 +1,6 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo6/a.v.v.v\", \"workspace\": \"/coq-dataset/repos/foo6\", \"repository\": \"/coq-dataset/repos/foo6\"}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,15 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo6/afxmsi.v\", \"workspace\": \"/coq-dataset/repos/foo6\", \"repository\": \"/coq-dataset/repos/foo6\"}",
+    "{\"type\": \"stored\", \"id\": 3062}",
+    "{\"type\": \"stored\", \"id\": 3063}",
+    "{\"type\": \"stored\", \"id\": 3064}",
+    "{\"type\": \"stored\", \"id\": 3065}",
+    "{\"type\": \"stored\", \"id\": 3066}",
+    "{\"type\": \"stored\", \"id\": 3067}",
+    "{\"type\": \"stored\", \"id\": 3068}",
+    "{\"type\": \"stored\", \"id\": 3069}",
+    "{\"type\": \"stored\", \"id\": 3070}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
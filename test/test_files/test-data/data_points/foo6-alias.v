@@ -0,0 +1,242 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo6/alias.v\", \"workspace\": \"/coq-dataset/repos/foo6\", \"repository\": \"/coq-dataset/repos/foo6\"}",
+    "{\"type\": \"stored\", \"id\": 2947}",
+    "{\"type\": \"stored\", \"id\": 2948}",
+    "{\"type\": \"stored\", \"id\": 2949}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 2950,
+        "context": [
+          {
+            "type": "stored",
+            "id": 2951
+          },
+          {
+            "type": "stored",
+            "id": 2952
+          },
+          {
+            "type": "stored",
+            "id": 2953
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 2954,
+            "context": [
+              {
+                "type": "stored",
+                "id": 2955
+              },
+              {
+                "type": "stored",
+                "id": 2956
+              }
+            ]
+          },
+          "step": {
+            "text": "\u0097",
+            "context": [
+              {
+                "type": "stored",
+                "id": 2957
+              },
+              {
+                "type": "stored",
+                "id": 2958
+              },
+              {
+                "type": "stored",
+                "id": 2959
+              }
+            ]
+          },
+          "n_step": 236138925912551,
+          "goals": [
+            "\n\nBBJPQUG",
+            "s\nGOtlK\nAYjIkDpVEqhksjSpLZ\n\nyYFEzZJi"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 2960,
+            "context": [
+              {
+                "type": "stored",
+                "id": 2961
+              },
+              {
+                "type": "stored",
+                "id": 2962
+              }
+            ]
+          },
+          "step": {
+            "text": "\u0099\u00c8@+\udad3\udc82@",
+            "context": [
+              {
+                "type": "stored",
+                "id": 2963
+              },
+              {
+                "type": "stored",
+                "id": 2964
+              },
+              {
+                "type": "stored",
+                "id": 2965
+              },
+              {
+                "type": "stored",
+                "id": 2966
+              },
+              {
+                "type": "stored",
+                "id": 2967
+              },
+              {
+                "type": "stored",
+                "id": 2968
+              }
+            ]
+          },
+          "n_step": 89706835871143018496,
+          "goals": [
+            "Vbh\nRSxn\ns\nCFbmsLJzS\nQOPCQotmRV\nDZ\nNMVcfDX\nIV\nsGkRxiGxYa\nbJZscHJ\nqav\n\nalias",
+            "YFz\ntrkGTTrgTp\niMZ\n\necWPEt",
+            "Of\nq\nP\nCLocalAssum\nM\nZCGz\n\nfkNYoLo"
+          ]
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 2969,
+        "context": [
+          {
+            "type": "stored",
+            "id": 2970
+          },
+          {
+            "type": "stored",
+            "id": 2971
+          },
+          {
+            "type": "stored",
+            "id": 2972
+          },
+          {
+            "type": "stored",
+            "id": 2973
+          },
+          {
+            "type": "stored",
+            "id": 2974
+          },
+          {
+            "type": "stored",
+            "id": 2975
+          },
+          {
+            "type": "stored",
+            "id": 2976
+          },
+          {
+            "type": "stored",
+            "id": 2977
+          },
+          {
+            "type": "stored",
+            "id": 2978
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 2979,
+            "context": [
+              {
+                "type": "stored",
+                "id": 2980
+              },
+              {
+                "type": "stored",
+                "id": 2981
+              },
+              {
+                "type": "stored",
+                "id": 2982
+              },
+              {
+                "type": "stored",
+                "id": 2983
+              },
+              {
+                "type": "stored",
+                "id": 2984
+              },
+              {
+                "type": "stored",
+                "id": 2985
+              }
+            ]
+          },
+          "step": {
+            "text": "Z\ud88e\udceb\u00e4\ud97f\udf18",
+            "context": [
+              {
+                "type": "stored",
+                "id": 2986
+              }
+            ]
+          },
+          "n_step": -2180192,
+          "goals": [
+            "ylyCEEdGi\n\nbD"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 2987,
+            "context": [
+              {
+                "type": "stored",
+                "id": 2988
+              },
+              {
+                "type": "stored",
+                "id": 2989
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00baA9N\uda61\udd44\ud9ec\udc4f",
+            "context": [
+              {
+                "type": "stored",
+                "id": 2990
+              }
+            ]
+          },
+          "n_step": -55959,
+          "goals": [
+            "\n\nqPF",
+            "ODXNBPTLFRq\nNs\n\nf"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
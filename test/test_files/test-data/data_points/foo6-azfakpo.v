@@ -0,0 +1,378 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo6/azfakpo.v\", \"workspace\": \"/coq-dataset/repos/foo6\", \"repository\": \"/coq-dataset/repos/foo6\"}",
+    "{\"type\": \"stored\", \"id\": 2773}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 2774,
+        "context": [
+          {
+            "type": "stored",
+            "id": 2775
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 2776,
+            "context": [
+              {
+                "type": "stored",
+                "id": 2777
+              },
+              {
+                "type": "stored",
+                "id": 2778
+              },
+              {
+                "type": "stored",
+                "id": 2779
+              }
+            ]
+          },
+          "step": {
+            "text": "undefined",
+            "context": []
+          },
+          "n_step": 144,
+          "goals": [
+            "lmg\nSqkerxU\nI\n\neJvACfanIEMRpvUv",
+            "q\nyNvojwCprDK\nr\ncodellama\nQ\nDmk\nI\nkGGI\nP\nuCMzUqsWLfIOystlh\nkjDtjhRNAjrQ\nGX\n\ne",
+            "czRJnNDJ\n\nGf",
+            "dJ\nmc\nUbmbYKn\ncTcgkDXAPxiswteNY\nEzABUkiOhukLwYyfyxKVzMpYqtjQ\ndB\n\nFshRGoIoZxOJYJn",
+            "k\nhwySmlntCc\nWzy\n\nMSXqd",
+            "term\nPROPOSITION\nbwXECwAl\nNULL\nR\nhG\nC\ni\ndF\nnhq\nZW\nsF\nsNVgWMNWjoIvhscSIH\nZUj\nJsh\nbBJWfxyqerrjQQyolLmkjJjwfeBoIPX\nYNNHe\n\nIzRABNcYJq",
+            "ff\niEFzRzepnm\nMPF\nkHoGNBU\n\nqiYypW"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 2780,
+            "context": [
+              {
+                "type": "stored",
+                "id": 2781
+              },
+              {
+                "type": "stored",
+                "id": 2782
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 2783
+              },
+              {
+                "type": "stored",
+                "id": 2784
+              },
+              {
+                "type": "stored",
+                "id": 2785
+              }
+            ]
+          },
+          "n_step": -227,
+          "goals": [
+            "zf\nq\nz\nGSgRHcwb\ngdncokjacXObDQc\nBBR\ntqOuRZ\nPpGDUZeBIstbherhgAFVaonArbi\ndByOHgqMgC\na\nU\nif\nPk\nKV\ndYIPGu\nmmDSGd\nbKyvicNLmg\n\nPorbUsJL",
+            "rerank\nvWH\na\n\ngHg",
+            "cNiT\nzA\nPuCEzmVNN\nog\nkciaBLVX\nL\n\nCctxCaVy",
+            "GSW\nfwTfnbNvU\nDERIVE\nH\nnQYwNo\nPR\nFDUAHbzFVBmeDmFQUFywLwmVu\nNULL\nnb\nWgIyZcWLb\nVwZmlyu\n\nYVHzsrQNq",
+            "rHafEfrjbazwEGcnylvS\neSvGs\nv\nLr\n\nlbh",
+            "CisF\nS\n\nd",
+            "V\neG\n\nKhJGpglHauaVOvTC",
+            "zU\nrnlg\nTc\nISGSmjnSvU\nnOHxCnr\n\npU",
+            "TAG\nvOhRUPZadS\ngygQh\nsmpx\nhmgzQf\n\nO"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 2786,
+            "context": [
+              {
+                "type": "stored",
+                "id": 2787
+              },
+              {
+                "type": "stored",
+                "id": 2788
+              }
+            ]
+          },
+          "step": {
+            "text": "\u000e\u00d6\u00ea\u008d\u00c1\u0080X",
+            "context": []
+          },
+          "n_step": -2695313,
+          "goals": [
+            "V\nhdRj\nkurrFW\n\nbBNJVJ",
+            "pxNeiBJEP\nOWYd\nPxnuH\neHH\n\nO",
+            "data\nfEIMVUyeDxwMKYtjJo\n\nIFfg",
+            "Ly\nTfmdj\nHjPGzh\ngvRhmmM\nAKAl\n\nHjJy"
+          ]
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 2789,
+        "context": [
+          {
+            "type": "stored",
+            "id": 2790
+          },
+          {
+            "type": "stored",
+            "id": 2791
+          },
+          {
+            "type": "stored",
+            "id": 2792
+          },
+          {
+            "type": "stored",
+            "id": 2793
+          },
+          {
+            "type": "stored",
+            "id": 2794
+          },
+          {
+            "type": "stored",
+            "id": 2795
+          },
+          {
+            "type": "stored",
+            "id": 2796
+          },
+          {
+            "type": "stored",
+            "id": 2797
+          },
+          {
+            "type": "stored",
+            "id": 2798
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 2799,
+            "context": [
+              {
+                "type": "stored",
+                "id": 2800
+              },
+              {
+                "type": "stored",
+                "id": 2801
+              },
+              {
+                "type": "stored",
+                "id": 2802
+              },
+              {
+                "type": "stored",
+                "id": 2803
+              },
+              {
+                "type": "stored",
+                "id": 2804
+              },
+              {
+                "type": "stored",
+                "id": 2805
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 2806
+              },
+              {
+                "type": "stored",
+                "id": 2807
+              },
+              {
+                "type": "stored",
+                "id": 2808
+              }
+            ]
+          },
+          "n_step": -2929530,
+          "goals": [
+            "l\nSy\nb\nzBoSmW\nc\niapgCs\nrXIZRJpElSBwH\nYFzYkS\nr\nHmoUdh\n\nVbKmdjuRvdMy",
+            "ej\njujk\nZbZKHu\nTIBAMYAhnji\nPr\ntYBXOGJ\nR\nlemma\n\nInfinity",
+            "P\nZ\nvJPnzfYuiPcv\n\ntZU",
+            "FNC\nX\nsJHoN\ngTlr\npLiiPNCX\nf\nZ\nA\nd\n\neiuZEAPEAHyYp",
+            "SG\nZU\nXYooLOzgV\nNPyaoSwPFqkZs\nsNwDY\nAP\nkCY\nedb\ngJTAMQfE\nYpBTMOT\nnt\nma\nE\n\nuyNDnGRD",
+            "\n\nSD",
+            "fpsRhhNiECYHmzpJyDMIp\npoLOwiRbJ\ntL\nzn\nUNj\nGPt\nb\nKLOVy\nDH\nPekeHhmOxDKAGrjp\nHsFjczCIvUqNDn\nEWAu\nW\nhy\nsTiKwLZyMxt\nlqCH\nYdy\nSE\nMBZJLWo\neCs\n\nl",
+            "j\ntmkhMhKd\n\nWo",
+            "LXl\nnull\nZ\n\nXRIhXq"
+          ]
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 2809,
+        "context": [
+          {
+            "type": "stored",
+            "id": 2810
+          }
+        ]
+      },
+      "steps": []
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 2811,
+        "context": [
+          {
+            "type": "stored",
+            "id": 2812
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 2813,
+            "context": [
+              {
+                "type": "stored",
+                "id": 2814
+              },
+              {
+                "type": "stored",
+                "id": 2815
+              },
+              {
+                "type": "stored",
+                "id": 2816
+              },
+              {
+                "type": "stored",
+                "id": 2817
+              }
+            ]
+          },
+          "step": {
+            "text": "\u0005\u00d2\u00b5;\udb3b\udd2c",
+            "context": [
+              {
+                "type": "stored",
+                "id": 2818
+              },
+              {
+                "type": "stored",
+                "id": 2819
+              },
+              {
+                "type": "stored",
+                "id": 2820
+              },
+              {
+                "type": "stored",
+                "id": 2821
+              },
+              {
+                "type": "stored",
+                "id": 2822
+              },
+              {
+                "type": "stored",
+                "id": 2823
+              }
+            ]
+          },
+          "n_step": 460,
+          "goals": [
+            "NUjyjpi\ndYVq\nu\nPBJorS\nZbJUih\ncontext\na\nNIIkPCMnQXzaFzWyDk\njAzB\nwDqNxslQzgyNNQAi\n\nlWK"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 2824,
+            "context": []
+          },
+          "step": {
+            "text": "\u001eBs\u00c6\udb8c\udfd2",
+            "context": [
+              {
+                "type": "stored",
+                "id": 2825
+              },
+              {
+                "type": "stored",
+                "id": 2826
+              },
+              {
+                "type": "stored",
+                "id": 2827
+              }
+            ]
+          },
+          "n_step": -2484563037967529696552812544,
+          "goals": [
+            "\n\nP",
+            "YB\n\nsBGwHOl",
+            "\n\nRojDVaJm"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 2828,
+            "context": []
+          },
+          "step": {
+            "text": "\u0096\u00be\u00a27",
+            "context": [
+              {
+                "type": "stored",
+                "id": 2829
+              },
+              {
+                "type": "stored",
+                "id": 2830
+              }
+            ]
+          },
+          "n_step": 525547055240733920427032631574528,
+          "goals": [
+            "NYX\njl\nO\np\nHYNUGH\nuP\nTLV\nhoZeLq\nQfFiUPWdSi\nl\nKf\nFGd\n\nnImwtYQvL",
+            "\n\nNzWzrIoCQFYp",
+            "MwF\nfajkMnlAX\nYrub\nCjbt\nnil\nP\nOq\neJvYuzaxh\npBBxdmRF\nYoIvaJG\na\nSxQw\nbi\nPqgNaPhA\nJVaTDzzqKXAgKeZW\niPxSUz\n\nnil",
+            "gvl\nlJXEwugLuElRU\nXHGLKW\n\nAqix",
+            "J\n\nz",
+            "e\nQlJl\nsur\nbTzMenTbnySrD\nXoTNgNkqegRtHUOILAt\nMDNVP\nnDugu\nbfhQIlXDCe\nkoMJFZ\n\nqxSelImdk"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,14 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo6/cwpkixe.v\", \"workspace\": \"/coq-dataset/repos/foo6\", \"repository\": \"/coq-dataset/repos/foo6\"}",
+    "{\"type\": \"stored\", \"id\": 2725}",
+    "{\"type\": \"stored\", \"id\": 2726}",
+    "{\"type\": \"stored\", \"id\": 2727}",
+    "{\"type\": \"stored\", \"id\": 2728}",
+    "{\"type\": \"stored\", \"id\": 2729}",
+    "{\"type\": \"stored\", \"id\": 2730}",
+    "{\"type\": \"stored\", \"id\": 2731}",
+    "{\"type\": \"stored\", \"id\": 2732}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,69 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo6/eqshsjw.v\", \"workspace\": \"/coq-dataset/repos/foo6\", \"repository\": \"/coq-dataset/repos/foo6\"}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 2751,
+        "context": [
+          {
+            "type": "stored",
+            "id": 2752
+          },
+          {
+            "type": "stored",
+            "id": 2753
+          },
+          {
+            "type": "stored",
+            "id": 2754
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 2755,
+            "context": [
+              {
+                "type": "stored",
+                "id": 2756
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00d3",
+            "context": [
+              {
+                "type": "stored",
+                "id": 2757
+              },
+              {
+                "type": "stored",
+                "id": 2758
+              },
+              {
+                "type": "stored",
+                "id": 2759
+              },
+              {
+                "type": "stored",
+                "id": 2760
+              }
+            ]
+          },
+          "n_step": -15422,
+          "goals": [
+            "Q\ncnJzWurS\nP\nFSHcFeuKhUXSahawWrCJ\nvLjZQF\neLX\ntJyF\nOBLIGATION\ns\ngmMx\nxwyQ\n\nlIqvtH",
+            "dlXL\nAmummPxkk\n\nBVT",
+            "hXC\nl\nvFPNs\n\nSgs",
+            "WT\n\npsAcMl"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
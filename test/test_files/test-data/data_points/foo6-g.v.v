@@ -0,0 +1,51 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo6/g.v.v\", \"workspace\": \"/coq-dataset/repos/foo6\", \"repository\": \"/coq-dataset/repos/foo6\"}",
+    "{\"type\": \"stored\", \"id\": 3042}",
+    "{\"type\": \"stored\", \"id\": 3043}",
+    "{\"type\": \"stored\", \"id\": 3044}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 3045,
+        "context": [
+          {
+            "type": "stored",
+            "id": 3046
+          },
+          {
+            "type": "stored",
+            "id": 3047
+          },
+          {
+            "type": "stored",
+            "id": 3048
+          },
+          {
+            "type": "stored",
+            "id": 3049
+          },
+          {
+            "type": "stored",
+            "id": 3050
+          },
+          {
+            "type": "stored",
+            "id": 3051
+          },
+          {
+            "type": "stored",
+            "id": 3052
+          },
+          {
+            "type": "stored",
+            "id": 3053
+          }
+        ]
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,8 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo6/ghjnhkrbx.v\", \"workspace\": \"/coq-dataset/repos/foo6\", \"repository\": \"/coq-dataset/repos/foo6\"}",
+    "{\"type\": \"stored\", \"id\": 2945}",
+    "{\"type\": \"stored\", \"id\": 2946}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,9 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo6/ho.v\", \"workspace\": \"/coq-dataset/repos/foo6\", \"repository\": \"/coq-dataset/repos/foo6\"}",
+    "{\"type\": \"stored\", \"id\": 2748}",
+    "{\"type\": \"stored\", \"id\": 2749}",
+    "{\"type\": \"stored\", \"id\": 2750}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
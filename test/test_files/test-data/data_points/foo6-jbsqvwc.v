@@ -0,0 +1,45 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo6/jbsqvwc.v\", \"workspace\": \"/coq-dataset/repos/foo6\", \"repository\": \"/coq-dataset/repos/foo6\"}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 2927,
+        "context": [
+          {
+            "type": "stored",
+            "id": 2928
+          }
+        ]
+      },
+      "steps": []
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 2929,
+        "context": [
+          {
+            "type": "stored",
+            "id": 2930
+          },
+          {
+            "type": "stored",
+            "id": 2931
+          },
+          {
+            "type": "stored",
+            "id": 2932
+          },
+          {
+            "type": "stored",
+            "id": 2933
+          }
+        ]
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,169 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo6/llu.v\", \"workspace\": \"/coq-dataset/repos/foo6\", \"repository\": \"/coq-dataset/repos/foo6\"}",
+    "{\"type\": \"stored\", \"id\": 2687}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 2688,
+        "context": [
+          {
+            "type": "stored",
+            "id": 2689
+          },
+          {
+            "type": "stored",
+            "id": 2690
+          },
+          {
+            "type": "stored",
+            "id": 2691
+          },
+          {
+            "type": "stored",
+            "id": 2692
+          },
+          {
+            "type": "stored",
+            "id": 2693
+          },
+          {
+            "type": "stored",
+            "id": 2694
+          },
+          {
+            "type": "stored",
+            "id": 2695
+          },
+          {
+            "type": "stored",
+            "id": 2696
+          },
+          {
+            "type": "stored",
+            "id": 2697
+          },
+          {
+            "type": "stored",
+            "id": 2698
+          },
+          {
+            "type": "stored",
+            "id": 2699
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 2700,
+            "context": [
+              {
+                "type": "stored",
+                "id": 2701
+              },
+              {
+                "type": "stored",
+                "id": 2702
+              },
+              {
+                "type": "stored",
+                "id": 2703
+              },
+              {
+                "type": "stored",
+                "id": 2704
+              },
+              {
+                "type": "stored",
+                "id": 2705
+              }
+            ]
+          },
+          "step": {
+            "text": "\ud9e9\udd11\ud9c8\udcb0",
+            "context": []
+          },
+          "n_step": 22629,
+          "goals": [
+            "lwEUAtw\nN\nyliWofCcE\nFDTPuQZ\nMnv\ncnRaTQkm\nwAQq\nAUPRtDiKBBY\nAMe\nGo\n\nMvSlOYdfxAF",
+            "IYdeShdWf\nWw\niBIFEpfOBnWYXHRESyWqbsVRTFY\nlbwOLhrbZQ\n\nQIummFlDqDKupEeoEj",
+            "co\ntheories\nbW\nCyOuBoN\nhGmzCKe\neGvUijCY\ncWghnlBhihsckZFSqKdAnC\nYGRXOxDIxjRXkmRz\nPIBXYH\nVmNTCTAQfI\nW\nS\n\nBmw",
+            "mbvYNHsWjOBXaFaTdYpJyGgWLjVEzI\nNmkBmROgAXywRa\ny\nZEu\ncLor\nHOenzqsnNZLJWXQHlP\nvwYj\ndoiyV\nP\nV\nZs\n\nz",
+            "Zldk\n\niEI",
+            "l\nHt\ndskXPPEIh\nAVBgLUSg\nmcpG\n\nzEWnQMZgIzou",
+            "UszdhrLZ\nNDxHb\n\nyTq"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 2706,
+            "context": [
+              {
+                "type": "stored",
+                "id": 2707
+              },
+              {
+                "type": "stored",
+                "id": 2708
+              },
+              {
+                "type": "stored",
+                "id": 2709
+              },
+              {
+                "type": "stored",
+                "id": 2710
+              },
+              {
+                "type": "stored",
+                "id": 2711
+              }
+            ]
+          },
+          "step": {
+            "text": "(\u256f\u00b0\u25a1\u00b0\uff09\u256f\ufe35 \u253b\u2501\u253b)",
+            "context": [
+              {
+                "type": "stored",
+                "id": 2712
+              },
+              {
+                "type": "stored",
+                "id": 2713
+              },
+              {
+                "type": "stored",
+                "id": 2714
+              },
+              {
+                "type": "stored",
+                "id": 2715
+              }
+            ]
+          },
+          "n_step": -2083535164062,
+          "goals": [
+            "BZnxKioEY\nHSJ\n\ncyXGp",
+            "YJZRE\n\nxinR",
+            "UTz\nXVko\npkaPVXpZVKTyqcxELv\nMoFiztDwS\ndbxbNe\ndBwkN\n\nGVQ",
+            "qcrIbmVzR\n\nA",
+            "l\nB\nmzV\nb\nyqnVYl\nkgzGX\nJ\nMe\nogfQLcm\n\ng",
+            "stBJvb\nK\nXqtTzMR\naDK\nmQsadZqQ\ndNhPuLFTsfiPhJJGoBn\n\nW",
+            "UGWidtNi\njiBr\nd\n\ncT",
+            "YBoEVCldCIdqDhC\nMFLrbnx\n\nU",
+            "NUL\n\nHmxP",
+            "XEhkbQvZSAStVkL\n\njYBvGfGY",
+            "yYruucCPfYhA\nL\nDXJ\nu\nBaEN\nRcH\nJowBnjskGEH\nO\nrt\ntrain\nOduptevOnfUfEgDre\nzy\nj\n\nW",
+            "I\nwBJYEPa\n\nF",
+            "LTSvyn\nhu\nv\n\nAqG"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,15 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo6/md.v\", \"workspace\": \"/coq-dataset/repos/foo6\", \"repository\": \"/coq-dataset/repos/foo6\"}",
+    "{\"type\": \"stored\", \"id\": 2716}",
+    "{\"type\": \"stored\", \"id\": 2717}",
+    "{\"type\": \"stored\", \"id\": 2718}",
+    "{\"type\": \"stored\", \"id\": 2719}",
+    "{\"type\": \"stored\", \"id\": 2720}",
+    "{\"type\": \"stored\", \"id\": 2721}",
+    "{\"type\": \"stored\", \"id\": 2722}",
+    "{\"type\": \"stored\", \"id\": 2723}",
+    "{\"type\": \"stored\", \"id\": 2724}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
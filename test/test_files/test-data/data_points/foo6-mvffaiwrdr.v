@@ -0,0 +1,8 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo6/mvffaiwrdr.v\", \"workspace\": \"/coq-dataset/repos/foo6\", \"repository\": \"/coq-dataset/repos/foo6\"}",
+    "{\"type\": \"stored\", \"id\": 3071}",
+    "{\"type\": \"stored\", \"id\": 3072}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
@@ -0,0 +1,38 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo6/nphjrt.v\", \"workspace\": \"/coq-dataset/repos/foo6\", \"repository\": \"/coq-dataset/repos/foo6\"}",
+    "{\"type\": \"stored\", \"id\": 3031}",
+    "{\"type\": \"stored\", \"id\": 3032}",
+    "{\"type\": \"stored\", \"id\": 3033}",
+    "{\"type\": \"stored\", \"id\": 3034}",
+    "{\"type\": \"stored\", \"id\": 3035}",
+    "{\"type\": \"stored\", \"id\": 3036}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 3037,
+        "context": [
+          {
+            "type": "stored",
+            "id": 3038
+          },
+          {
+            "type": "stored",
+            "id": 3039
+          },
+          {
+            "type": "stored",
+            "id": 3040
+          },
+          {
+            "type": "stored",
+            "id": 3041
+          }
+        ]
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,21 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo6/puji.v\", \"workspace\": \"/coq-dataset/repos/foo6\", \"repository\": \"/coq-dataset/repos/foo6\"}",
+    "{\"type\": \"stored\", \"id\": 2733}",
+    "{\"type\": \"stored\", \"id\": 2734}",
+    "{\"type\": \"stored\", \"id\": 2735}",
+    "{\"type\": \"stored\", \"id\": 2736}",
+    "{\"type\": \"stored\", \"id\": 2737}",
+    "{\"type\": \"stored\", \"id\": 2738}",
+    "{\"type\": \"stored\", \"id\": 2739}",
+    "{\"type\": \"stored\", \"id\": 2740}",
+    "{\"type\": \"stored\", \"id\": 2741}",
+    "{\"type\": \"stored\", \"id\": 2742}",
+    "{\"type\": \"stored\", \"id\": 2743}",
+    "{\"type\": \"stored\", \"id\": 2744}",
+    "{\"type\": \"stored\", \"id\": 2745}",
+    "{\"type\": \"stored\", \"id\": 2746}",
+    "{\"type\": \"stored\", \"id\": 2747}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
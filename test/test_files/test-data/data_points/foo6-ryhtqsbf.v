@@ -0,0 +1,221 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo6/ryhtqsbf.v\", \"workspace\": \"/coq-dataset/repos/foo6\", \"repository\": \"/coq-dataset/repos/foo6\"}",
+    "{\"type\": \"stored\", \"id\": 2991}",
+    "{\"type\": \"stored\", \"id\": 2992}",
+    "{\"type\": \"stored\", \"id\": 2993}",
+    "{\"type\": \"stored\", \"id\": 2994}",
+    "{\"type\": \"stored\", \"id\": 2995}",
+    "{\"type\": \"stored\", \"id\": 2996}",
+    "{\"type\": \"stored\", \"id\": 2997}",
+    "{\"type\": \"stored\", \"id\": 2998}",
+    "{\"type\": \"stored\", \"id\": 2999}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 3000,
+        "context": [
+          {
+            "type": "stored",
+            "id": 3001
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 3002,
+            "context": [
+              {
+                "type": "stored",
+                "id": 3003
+              }
+            ]
+          },
+          "step": {
+            "text": "\udbbe\udf2a\udb23\udfd0l\u0000\u0099T",
+            "context": [
+              {
+                "type": "stored",
+                "id": 3004
+              },
+              {
+                "type": "stored",
+                "id": 3005
+              }
+            ]
+          },
+          "n_step": -169,
+          "goals": [
+            "JwdfHXJjTOgbcAclj\npidT\nNjZBcu\nFgZK\nSuF\nDvdjT\nXk\nzNYDWSNafmtqD\ngZajulmoK\nXMQ\nt\n\nvzm",
+            "\n\nEe",
+            "Ed\nxW\n\nHsf",
+            "BWqyUsMqHcfAtEap\nzy\nvQZ\nExmgTz\nn\nUCrop\nND\n\nHvfUxHAUwJUTybgjyYXIJ",
+            "hDmI\nRELATION\n\nINF",
+            "l\ny\nQLDQ\n\nmnGxI",
+            "S\nxoRtASGvb\nfIYJFEzsbCluwm\nEC\nyLEVPHAtnfDmw\n\nAqs",
+            "CaTr\n\nie",
+            "r\nnEnTYsXFC\ntimeout\nrSPBoHmW\ng\nO\n\nwUQrSoBqOMtCzPy",
+            "aJHT\n\npZp",
+            "Kkh\n\nf",
+            "GTL\nc\nLrTl\nqwnQ\nGqZZPW\nY\n\nS"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 3006,
+            "context": []
+          },
+          "step": {
+            "text": "h",
+            "context": [
+              {
+                "type": "stored",
+                "id": 3007
+              },
+              {
+                "type": "stored",
+                "id": 3008
+              },
+              {
+                "type": "stored",
+                "id": 3009
+              },
+              {
+                "type": "stored",
+                "id": 3010
+              }
+            ]
+          },
+          "n_step": 17732,
+          "goals": [
+            "ULJSFCyWU\n\nV",
+            "L\nshFImbfGDPIygTAUASvYYdlMVEpYKl\nKFv\nxwiq\n\nScunthorpe"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 3011,
+            "context": []
+          },
+          "step": {
+            "text": "\ud835\udc13\ud835\udc21\ud835\udc1e \ud835\udc2a\ud835\udc2e\ud835\udc22\ud835\udc1c\ud835\udc24 \ud835\udc1b\ud835\udc2b\ud835\udc28\ud835\udc30\ud835\udc27 \ud835\udc1f\ud835\udc28\ud835\udc31 \ud835\udc23\ud835\udc2e\ud835\udc26\ud835\udc29\ud835\udc2c \ud835\udc28\ud835\udc2f\ud835\udc1e\ud835\udc2b \ud835\udc2d\ud835\udc21\ud835\udc1e \ud835\udc25\ud835\udc1a\ud835\udc33\ud835\udc32 \ud835\udc1d\ud835\udc28\ud835\udc20",
+            "context": [
+              {
+                "type": "stored",
+                "id": 3012
+              },
+              {
+                "type": "stored",
+                "id": 3013
+              },
+              {
+                "type": "stored",
+                "id": 3014
+              },
+              {
+                "type": "stored",
+                "id": 3015
+              },
+              {
+                "type": "stored",
+                "id": 3016
+              }
+            ]
+          },
+          "n_step": -46,
+          "goals": [
+            "QwD\nbnJJhvhjt\nb\nznlKZhdScVnn\nLJFA\nMhAKLvqIPK\numFJVujqotwxWysb\nNdSQ\nfMojOOfwVFHUw\nita\nQTxmwjvZEA\n\nFWIMXaiE",
+            "xnujDiqprjliKzsctLPcKWi\nWAJkbDTi\nOXRUen\nL\nnkm\njidufWBIqezBKgNIXMZm\nNone\nPCa\ncTEeJXNA\nTM\nG\nwmqdq\nrYZXaO\n\nEnPg",
+            "C\ntYV\nQTcBsCplkPsZZ\nGYDUhYlyln\nvnwRbuSEkgJZmZez\nnOft\nFbDoFE\nITY\nAOvDVNavYQXmw\nWWfXZsBPL\nW\n\ntSmbKnXn",
+            "\n\ngfhxlVNIqGmQyVOcazvPTins",
+            "ECLC\nk\ngrAA\nPAoAEdtexQAaq\nxi\nGPRLCAEgc\ndJRSqHhgv\nBZmZlbQPYO\nuK\nrKC\nOUNp\n\nhdDsb",
+            "FNnboHROrPP\naQCizYIcV\nXtKpfXhKTygsxlHHLhhFrW\nSDbMeiLtvrDvp\njRnKEJWeVdYS\nGKXJtCSaRa\njnuF\nVoijcWCn\nOQTe\nw\nZL\nYKgD\nscG\nNH\n\nGhDAhdyEu",
+            "Y\nFaZp\n\nNIL",
+            "c\nmqAtUSCSHSHDkevpvYkG\noxVosaQ\nundefined\n\nE",
+            "o\nt\nSDU\n\nzIoNEC",
+            "\n\nhGxEqZo",
+            "\n\nnV"
+          ]
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 3017,
+        "context": []
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 3018,
+            "context": [
+              {
+                "type": "stored",
+                "id": 3019
+              },
+              {
+                "type": "stored",
+                "id": 3020
+              },
+              {
+                "type": "stored",
+                "id": 3021
+              },
+              {
+                "type": "stored",
+                "id": 3022
+              },
+              {
+                "type": "stored",
+                "id": 3023
+              }
+            ]
+          },
+          "step": {
+            "text": "U\ud9dc\udf6d%\ud8b0\udfe6\udbc1\udc70\u00ab",
+            "context": [
+              {
+                "type": "stored",
+                "id": 3024
+              },
+              {
+                "type": "stored",
+                "id": 3025
+              },
+              {
+                "type": "stored",
+                "id": 3026
+              },
+              {
+                "type": "stored",
+                "id": 3027
+              },
+              {
+                "type": "stored",
+                "id": 3028
+              },
+              {
+                "type": "stored",
+                "id": 3029
+              },
+              {
+                "type": "stored",
+                "id": 3030
+              }
+            ]
+          },
+          "n_step": -7511,
+          "goals": []
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,8 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo6/t.v\", \"workspace\": \"/coq-dataset/repos/foo6\", \"repository\": \"/coq-dataset/repos/foo6\"}",
+    "{\"type\": \"stored\", \"id\": 2761}",
+    "{\"type\": \"stored\", \"id\": 2762}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
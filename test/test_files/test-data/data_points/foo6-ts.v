@@ -0,0 +1,55 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo6/ts.v\", \"workspace\": \"/coq-dataset/repos/foo6\", \"repository\": \"/coq-dataset/repos/foo6\"}",
+    "{\"type\": \"stored\", \"id\": 2934}",
+    "{\"type\": \"stored\", \"id\": 2935}",
+    "{\"type\": \"stored\", \"id\": 2936}",
+    "{\"type\": \"stored\", \"id\": 2937}",
+    "{\"type\": \"stored\", \"id\": 2938}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 2939,
+        "context": []
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 2940,
+            "context": [
+              {
+                "type": "stored",
+                "id": 2941
+              },
+              {
+                "type": "stored",
+                "id": 2942
+              },
+              {
+                "type": "stored",
+                "id": 2943
+              }
+            ]
+          },
+          "step": {
+            "text": "3\u00f7\u0096,I\f\u007fs\u00b35",
+            "context": [
+              {
+                "type": "stored",
+                "id": 2944
+              }
+            ]
+          },
+          "n_step": 1626532,
+          "goals": [
+            "\n\nEojk",
+            "XN\njWiTf\nnzhVkkb\nBQqqYVhFdiuOlCi\nA\n\np"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -0,0 +1,19 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo6/w.v.v\", \"workspace\": \"/coq-dataset/repos/foo6\", \"repository\": \"/coq-dataset/repos/foo6\"}",
+    "{\"type\": \"stored\", \"id\": 2768}",
+    "{\"type\": \"stored\", \"id\": 2769}",
+    "{\"type\": \"stored\", \"id\": 2770}",
+    "{\"type\": \"stored\", \"id\": 2771}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 2772,
+        "context": []
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
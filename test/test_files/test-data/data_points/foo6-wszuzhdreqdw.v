@@ -0,0 +1,38 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo6/wszuzhdreqdw.v\", \"workspace\": \"/coq-dataset/repos/foo6\", \"repository\": \"/coq-dataset/repos/foo6\"}",
+    "{\"type\": \"stored\", \"id\": 3054}",
+    "{\"type\": \"stored\", \"id\": 3055}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 3056,
+        "context": [
+          {
+            "type": "stored",
+            "id": 3057
+          },
+          {
+            "type": "stored",
+            "id": 3058
+          },
+          {
+            "type": "stored",
+            "id": 3059
+          },
+          {
+            "type": "stored",
+            "id": 3060
+          },
+          {
+            "type": "stored",
+            "id": 3061
+          }
+        ]
+      },
+      "steps": []
+    }
+  ]
+}
\ No newline at end of file
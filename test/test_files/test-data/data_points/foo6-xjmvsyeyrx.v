@@ -0,0 +1,177 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo6/xjmvsyeyrx.v\", \"workspace\": \"/coq-dataset/repos/foo6\", \"repository\": \"/coq-dataset/repos/foo6\"}",
+    "{\"type\": \"stored\", \"id\": 2894}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 2895,
+        "context": [
+          {
+            "type": "stored",
+            "id": 2896
+          },
+          {
+            "type": "stored",
+            "id": 2897
+          },
+          {
+            "type": "stored",
+            "id": 2898
+          },
+          {
+            "type": "stored",
+            "id": 2899
+          },
+          {
+            "type": "stored",
+            "id": 2900
+          },
+          {
+            "type": "stored",
+            "id": 2901
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 2902,
+            "context": []
+          },
+          "step": {
+            "text": "\u00c9\uda5f\udf7b\u00f7\ud9fd\udd28\udad9\udc81\u001e\udbc4\udd87",
+            "context": [
+              {
+                "type": "stored",
+                "id": 2903
+              },
+              {
+                "type": "stored",
+                "id": 2904
+              },
+              {
+                "type": "stored",
+                "id": 2905
+              },
+              {
+                "type": "stored",
+                "id": 2906
+              },
+              {
+                "type": "stored",
+                "id": 2907
+              },
+              {
+                "type": "stored",
+                "id": 2908
+              },
+              {
+                "type": "stored",
+                "id": 2909
+              },
+              {
+                "type": "stored",
+                "id": 2910
+              },
+              {
+                "type": "stored",
+                "id": 2911
+              }
+            ]
+          },
+          "n_step": 634,
+          "goals": [
+            "NSWfVerz\nvheapBucV\nISNwlZHGG\nGYRziqzLaXs\nL\nydxvwPhrnhWZpuXYYTHF\nt\n\nt",
+            "undefined\n\nDJZfWE",
+            "sI\nZxRATe\nSIjIXAbqVGjpnwzZRAQv\nRv\nc\nXTdTTU\np\nZyY\nLuiktWHbyyrgZs\nBj\nFwqBQHCoWFBYkFWyGyeZL\nKlAbze\n\nsh"
+          ]
+        }
+      ]
+    },
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 2912,
+        "context": [
+          {
+            "type": "stored",
+            "id": 2913
+          },
+          {
+            "type": "stored",
+            "id": 2914
+          },
+          {
+            "type": "stored",
+            "id": 2915
+          },
+          {
+            "type": "stored",
+            "id": 2916
+          },
+          {
+            "type": "stored",
+            "id": 2917
+          },
+          {
+            "type": "stored",
+            "id": 2918
+          },
+          {
+            "type": "stored",
+            "id": 2919
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 2920,
+            "context": [
+              {
+                "type": "stored",
+                "id": 2921
+              },
+              {
+                "type": "stored",
+                "id": 2922
+              }
+            ]
+          },
+          "step": {
+            "text": "",
+            "context": [
+              {
+                "type": "stored",
+                "id": 2923
+              },
+              {
+                "type": "stored",
+                "id": 2924
+              },
+              {
+                "type": "stored",
+                "id": 2925
+              },
+              {
+                "type": "stored",
+                "id": 2926
+              }
+            ]
+          },
+          "n_step": 1635922773,
+          "goals": [
+            "KXk\nL\naV\nSR\njaFRkciWtdaOkQuLJM\n\nolxqDvM",
+            "x\nG\nOZtVW\nBeDl\ntSDC\nYw\nblI\nxp\nZmbSGeVRV\nDgyd\nwg\nJt\nEuLcU\nTcVaw\nupvzCiD\nZ\noqrcjqDZ\nxYEyOArzXylrGKHbiMuFMmM\nECxOJooOkduIPjVfZUnv\nsexWWcScLBFyw\nvpLTAwH\nmQZC\n\nWrTNtLI",
+            "xAr\n\nDWNuzqWy"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
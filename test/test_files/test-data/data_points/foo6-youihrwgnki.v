@@ -0,0 +1,11 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo6/youihrwgnki.v\", \"workspace\": \"/coq-dataset/repos/foo6\", \"repository\": \"/coq-dataset/repos/foo6\"}",
+    "{\"type\": \"stored\", \"id\": 2763}",
+    "{\"type\": \"stored\", \"id\": 2764}",
+    "{\"type\": \"stored\", \"id\": 2765}",
+    "{\"type\": \"stored\", \"id\": 2766}",
+    "{\"type\": \"stored\", \"id\": 2767}"
+  ],
+  "proofs": []
+}
\ No newline at end of file
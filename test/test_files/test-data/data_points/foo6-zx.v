@@ -0,0 +1,264 @@
+{
+  "file_context": [
+    "{\"file\": \"/coq-dataset/repos/foo6/zx.v\", \"workspace\": \"/coq-dataset/repos/foo6\", \"repository\": \"/coq-dataset/repos/foo6\"}",
+    "{\"type\": \"stored\", \"id\": 2831}",
+    "{\"type\": \"stored\", \"id\": 2832}",
+    "{\"type\": \"stored\", \"id\": 2833}",
+    "{\"type\": \"stored\", \"id\": 2834}",
+    "{\"type\": \"stored\", \"id\": 2835}",
+    "{\"type\": \"stored\", \"id\": 2836}",
+    "{\"type\": \"stored\", \"id\": 2837}",
+    "{\"type\": \"stored\", \"id\": 2838}",
+    "{\"type\": \"stored\", \"id\": 2839}",
+    "{\"type\": \"stored\", \"id\": 2840}",
+    "{\"type\": \"stored\", \"id\": 2841}",
+    "{\"type\": \"stored\", \"id\": 2842}",
+    "{\"type\": \"stored\", \"id\": 2843}",
+    "{\"type\": \"stored\", \"id\": 2844}",
+    "{\"type\": \"stored\", \"id\": 2845}",
+    "{\"type\": \"stored\", \"id\": 2846}"
+  ],
+  "proofs": [
+    {
+      "theorem": {
+        "type": "stored",
+        "id": 2847,
+        "context": [
+          {
+            "type": "stored",
+            "id": 2848
+          },
+          {
+            "type": "stored",
+            "id": 2849
+          },
+          {
+            "type": "stored",
+            "id": 2850
+          },
+          {
+            "type": "stored",
+            "id": 2851
+          },
+          {
+            "type": "stored",
+            "id": 2852
+          }
+        ]
+      },
+      "steps": [
+        {
+          "term": {
+            "type": "stored",
+            "id": 2853,
+            "context": [
+              {
+                "type": "stored",
+                "id": 2854
+              },
+              {
+                "type": "stored",
+                "id": 2855
+              },
+              {
+                "type": "stored",
+                "id": 2856
+              }
+            ]
+          },
+          "step": {
+            "text": "\u00d7\u0098Oc\ud894\udec7\ud84f\udca7|y\u00ad\u00be\ud84f\ude10\u0099J\f/\u009b\u0010",
+            "context": [
+              {
+                "type": "stored",
+                "id": 2857
+              },
+              {
+                "type": "stored",
+                "id": 2858
+              },
+              {
+                "type": "stored",
+                "id": 2859
+              },
+              {
+                "type": "stored",
+                "id": 2860
+              },
+              {
+                "type": "stored",
+                "id": 2861
+              },
+              {
+                "type": "stored",
+                "id": 2862
+              },
+              {
+                "type": "stored",
+                "id": 2863
+              },
+              {
+                "type": "stored",
+                "id": 2864
+              },
+              {
+                "type": "stored",
+                "id": 2865
+              },
+              {
+                "type": "stored",
+                "id": 2866
+              },
+              {
+                "type": "stored",
+                "id": 2867
+              },
+              {
+                "type": "stored",
+                "id": 2868
+              },
+              {
+                "type": "stored",
+                "id": 2869
+              },
+              {
+                "type": "stored",
+                "id": 2870
+              }
+            ]
+          },
+          "n_step": -39994,
+          "goals": []
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 2871,
+            "context": [
+              {
+                "type": "stored",
+                "id": 2872
+              },
+              {
+                "type": "stored",
+                "id": 2873
+              },
+              {
+                "type": "stored",
+                "id": 2874
+              },
+              {
+                "type": "stored",
+                "id": 2875
+              }
+            ]
+          },
+          "step": {
+            "text": "\u009a",
+            "context": [
+              {
+                "type": "stored",
+                "id": 2876
+              },
+              {
+                "type": "stored",
+                "id": 2877
+              },
+              {
+                "type": "stored",
+                "id": 2878
+              },
+              {
+                "type": "stored",
+                "id": 2879
+              },
+              {
+                "type": "stored",
+                "id": 2880
+              },
+              {
+                "type": "stored",
+                "id": 2881
+              },
+              {
+                "type": "stored",
+                "id": 2882
+              },
+              {
+                "type": "stored",
+                "id": 2883
+              },
+              {
+                "type": "stored",
+                "id": 2884
+              }
+            ]
+          },
+          "n_step": -2435317893044240,
+          "goals": [
+            "btnsJ\nScunthorpe\nGqC\nduAxp\n\nxXWylB",
+            "NLSGrTjcZUdsXzmi\n\nZxHSHrTFnLyOeR",
+            "cwgIytBuMW\nDjAknxqAbWu\ntShMWXGeMWiiI\nPVxpKEBP\nvbFVgHVyw\nOxOi\n\nFdaVAWnLaktQkGtsVS",
+            "\n\ndDeUSkVGdwlsrnU",
+            "ausPgmcLM\nf\nJGAlyt\nb\neHVH\nj\nwmK\nGANLLCkOPee\nKD\nNIMAaImPcIEgdg\nUKwYnBa\nOlX\nvHdAA\nKTnqCB\nzglxHcUTJnihOfvVbAmpmI\n\nK",
+            "lQryfRs\nhz\nsSLZiekTstARKNn\nMFSWQFSJTCqOXvwkGVybVNdTvK\nN\nclient\netucb\nif\nfile\naavRfR\nz\n\nMO",
+            "pHBjanKNx\nleft\nLSGj\nPIrD\nyBsbxWLl\nCXfMGBopVWK\nkdlFJCPYEBCmWAoDlZ\nuc\n\ncrA",
+            "\n\naMluUsKgFEdsYQikbZO",
+            "HlYpy\nf\nIxvDOE\nkYJrHNZSrRwv\niOCdrU\nEASgXvSjwWGdVnNWwR\nmnOvyFZCVElHJCOEqfJoIlEgFxLqL\n\nmGZXUjEGb",
+            "z\nGvoA\nRV\n\nng"
+          ]
+        },
+        {
+          "term": {
+            "type": "stored",
+            "id": 2885,
+            "context": [
+              {
+                "type": "stored",
+                "id": 2886
+              }
+            ]
+          },
+          "step": {
+            "text": "F",
+            "context": [
+              {
+                "type": "stored",
+                "id": 2887
+              },
+              {
+                "type": "stored",
+                "id": 2888
+              },
+              {
+                "type": "stored",
+                "id": 2889
+              },
+              {
+                "type": "stored",
+                "id": 2890
+              },
+              {
+                "type": "stored",
+                "id": 2891
+              },
+              {
+                "type": "stored",
+                "id": 2892
+              },
+              {
+                "type": "stored",
+                "id": 2893
+              }
+            ]
+          },
+          "n_step": 146353,
+          "goals": [
+            "phRsX\nk\nooMjWOerHxs\nfSmTsONo\nAM\nE\nVs\nqd\nMEvBeelT\nCoeqjCcI\n\nO",
+            "G\nHj\nNBieyXJk\nwU\n\nZKvdTXMeW"
+          ]
+        }
+      ]
+    }
+  ]
+}
\ No newline at end of file
@@ -1,5 +1,23 @@
+from __future__ import annotations
+from typing import Any, Optional
+from dataclasses import dataclass
 from pathlib import Path
-from model_deployment.fast_client import FastLspClient, ClientWrapper
+
+from coqpyt.lsp.structs import (
+    Position,
+    Range,
+    TextDocumentContentChangeEvent,
+    TextDocumentIdentifier,
+    TextDocumentItem,
+    VersionedTextDocumentIdentifier,
+)
+
+from model_deployment.fast_client import (
+    FastLspClient,
+    ClientWrapper,
+    common_prefix_len,
+    offset_to_position,
+)
 
 
 class TestFastClient:
@@ -21,6 +39,94 @@ class TestFastClient:
         cls.wrapper = ClientWrapper(fast_client, file_uri)
 
 
+@dataclass
+class FakeSpan:
+    range: Range
+    span: Optional[Any]
+
+
+@dataclass
+class FakeDocument:
+    spans: list[FakeSpan]
+
+
+class FakeLspClient:
+    """Applies changes like an incremental server. Sentences end in periods."""
+
+    def __init__(self, incremental_sync: bool) -> None:
+        self.incremental_sync = incremental_sync
+        self.text = ""
+        self.changes: list[TextDocumentContentChangeEvent] = []
+
+    def didOpen(self, textDocument: TextDocumentItem) -> None:
+        self.text = textDocument.text
+
+    def didChange(
+        self,
+        textDocument: VersionedTextDocumentIdentifier,
+        contentChanges: list[TextDocumentContentChangeEvent],
+    ) -> None:
+        for change in contentChanges:
+            self.changes.append(change)
+            if change.range is None:
+                self.text = change.text
+                continue
+            start = self.__to_offset(change.range.start)
+            end = self.__to_offset(change.range.end)
+            self.text = self.text[:start] + change.text + self.text[end:]
+
+    def get_document(self, textDocument: TextDocumentIdentifier) -> FakeDocument:
+        spans: list[FakeSpan] = []
+        for i, c in enumerate(self.text):
+            if c == ".":
+                end = offset_to_position(self.text, i + 1)
+                spans.append(FakeSpan(Range(end, end), "ast"))
+        end = offset_to_position(self.text, len(self.text))
+        spans.append(FakeSpan(Range(end, end), None))
+        return FakeDocument(spans)
+
+    def __to_offset(self, position: Position) -> int:
+        lines = self.text.split("\n")
+        return sum(len(l) + 1 for l in lines[: position.line]) + position.character
+
+
+class TestIncrementalWrite:
+    PREFIX = "Lemma a : True.\nProof. auto.\nQed.\n\nLemma b :\n  True."
+
+    def test_incremental_changes(self):
+        client = FakeLspClient(incremental_sync=True)
+        wrapper = ClientWrapper(client, "file:///fake.v")
+        wrapper.write(self.PREFIX)
+        for proof in ["\nProof.", "\nProof.\n  exact I.", "\nProof.\n  auto.", ""]:
+            wrapper.write(self.PREFIX + proof)
+            assert client.text == self.PREFIX + proof
+            assert len(client.changes[-1].text) <= len(proof) + 1
+        assert all(c.range is not None for c in client.changes)
+
+    def test_full_changes(self):
+        client = FakeLspClient(incremental_sync=False)
+        wrapper = ClientWrapper(client, "file:///fake.v")
+        wrapper.write(self.PREFIX)
+        assert client.changes[-1].range is None
+        assert client.text == self.PREFIX
+
+    def test_steps_after_prefix(self):
+        client = FakeLspClient(incremental_sync=True)
+        wrapper = ClientWrapper(client, "file:///fake.v")
+        proof = "\nProof.\n  intros. exact I."
+        all_steps = wrapper.write_and_get_steps(self.PREFIX + proof)
+        assert "".join(s.text for s in all_steps) == self.PREFIX + proof
+        new_steps = wrapper.write_and_get_steps(self.PREFIX + proof, len(self.PREFIX))
+        assert [s.text for s in new_steps] == ["\nProof.", "\n  intros.", " exact I."]
+        assert [s.text for s in all_steps[-3:]] == [s.text for s in new_steps]
+
+    def test_common_prefix_len(self):
+        assert common_prefix_len("abcdef", "abcxyz") == 3
+        assert common_prefix_len("abc", "abcdef") == 3
+        assert common_prefix_len("", "abc") == 0
+        assert common_prefix_len("abc", "xbc") == 0
+
+
 TEST_CASE = r"""\
 (** This file is part of CoqEAL, the Coq Effective Algebra Library.
 (c) Copyright INRIA and University of Gothenburg, see LICENSE *)
@@ -0,0 +1,138 @@
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from model_deployment.lsp_pool import LspWorkerPool
+
+
+class FakeWrapper:
+    def __init__(self) -> None:
+        self.content = ""
+
+
+class FakeWorker:
+    def __init__(self, worker_id: int) -> None:
+        self.worker_id = worker_id
+        self.killed = False
+        self.wrapper = FakeWrapper()
+
+    def kill(self) -> None:
+        self.killed = True
+
+
+class FakeWorkerFactory:
+    def __init__(self) -> None:
+        self.workers: list[FakeWorker] = []
+        self.lock = threading.Lock()
+
+    def __call__(self) -> FakeWorker:
+        with self.lock:
+            worker = FakeWorker(len(self.workers))
+            self.workers.append(worker)
+        return worker
+
+
+class FailingWorkerFactory:
+    """Starts num_workers workers, then fails like a worker that timed out."""
+
+    def __init__(self, factory: FakeWorkerFactory, num_workers: int) -> None:
+        self.factory = factory
+        self.num_workers = num_workers
+
+    def __call__(self) -> FakeWorker:
+        if self.num_workers <= len(self.factory.workers):
+            raise RuntimeError("Timed out checking the file prefix.")
+        return self.factory()
+
+
+class TestLspWorkerPool:
+    def test_concurrent_checks(self):
+        factory = FakeWorkerFactory()
+        pool = LspWorkerPool(factory, 3, 0)
+        in_use: set[int] = set()
+        max_in_use = 0
+        lock = threading.Lock()
+
+        def check(_: int) -> None:
+            nonlocal max_in_use
+            worker = pool.acquire()
+            with lock:
+                assert worker.worker_id not in in_use
+                in_use.add(worker.worker_id)
+                max_in_use = max(max_in_use, len(in_use))
+            time.sleep(0.01)
+            with lock:
+                in_use.remove(worker.worker_id)
+            pool.release(worker)
+
+        with ThreadPoolExecutor(6) as executor:
+            list(executor.map(check, range(24)))
+        assert max_in_use == 3
+        assert pool.get_stats()["free"] == 3
+        pool.close()
+        assert all(w.killed for w in factory.workers)
+
+    def test_replace_uses_spare(self):
+        factory = FakeWorkerFactory()
+        pool = LspWorkerPool(factory, 1, 1)
+        worker = pool.acquire()
+        pool.replace(worker)
+        assert worker.killed
+        spare = pool.acquire()
+        assert spare.worker_id != worker.worker_id
+        pool.release(spare)
+        for _ in range(100):
+            if pool.get_stats()["spares"] == 1:
+                break
+            time.sleep(0.01)
+        stats = pool.get_stats()
+        assert stats["spares"] == 1
+        assert stats["replacements"] == 1
+        assert len(factory.workers) == 3
+        pool.close()
+        assert all(w.killed for w in factory.workers)
+
+    def test_replace_without_spare(self):
+        factory = FakeWorkerFactory()
+        pool = LspWorkerPool(factory, 1, 0)
+        worker = pool.acquire()
+        pool.replace(worker)
+        new_worker = pool.acquire()
+        assert new_worker.worker_id == 1
+        pool.release(new_worker)
+        pool.close()
+
+    def test_prefers_shared_prefix(self):
+        factory = FakeWorkerFactory()
+        pool = LspWorkerPool(factory, 3, 0)
+        workers = [pool.acquire() for _ in range(3)]
+        for worker, content in zip(workers, ["Lemma a.", "Lemma b. auto.", "x"]):
+            worker.wrapper.content = content
+            pool.release(worker)
+        assert pool.acquire("Lemma b. intros.") is workers[1]
+        assert pool.acquire("Lemma a. auto.") is workers[0]
+        pool.close()
+
+    def test_failed_start_raises(self):
+        factory = FakeWorkerFactory()
+        pool = LspWorkerPool(FailingWorkerFactory(factory, 1), 1, 0)
+        worker = pool.acquire()
+        pool.replace(worker)
+        with pytest.raises(RuntimeError):
+            pool.acquire()
+        with pytest.raises(RuntimeError):
+            pool.peek()
+        pool.close()
+
+    def test_failed_start_after_spare(self):
+        factory = FakeWorkerFactory()
+        pool = LspWorkerPool(FailingWorkerFactory(factory, 2), 1, 1)
+        worker = pool.acquire()
+        pool.replace(worker)
+        spare = pool.acquire()
+        pool.replace(spare)
+        with pytest.raises(RuntimeError):
+            pool.acquire()
+        pool.close()
@@ -0,0 +1,178 @@
+from typing import Optional
+
+import torch
+from tokenizers import Tokenizer, models, pre_tokenizers, decoders, trainers
+from transformers import GPT2Config, GPT2LMHeadModel, PreTrainedTokenizerFast
+
+from model_deployment.model_wrapper import DecoderLocalWrapper, RecRequest
+from model_deployment.prefix_cache import (
+    PrefixKVCache,
+    expand_past,
+    past_num_bytes,
+)
+from tactic_gen.lm_example import LmExample
+from tactic_gen.tactic_data import ProofPremiseCollator, NEWLINE_RESPONSE_TEMPLATE
+
+
+def make_past(num_tokens: int) -> tuple[tuple[torch.Tensor, ...], ...]:
+    return tuple(
+        (torch.zeros(1, 2, num_tokens, 4), torch.zeros(1, 2, num_tokens, 4))
+        for _ in range(2)
+    )
+
+
+class TestPrefixKVCache:
+    def test_lru_bytes(self):
+        entry_bytes = past_num_bytes(make_past(8))
+        cache = PrefixKVCache(2 * entry_bytes)
+        keys = [
+            PrefixKVCache.get_key(torch.tensor([i, 1, 2]), torch.ones(3))
+            for i in range(3)
+        ]
+        cache.put(keys[0], make_past(8))
+        cache.put(keys[1], make_past(8))
+        assert cache.get(keys[0]) is not None
+        cache.put(keys[2], make_past(8))
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) is not None
+        assert cache.get(keys[2]) is not None
+        assert cache.num_bytes == 2 * entry_bytes
+        assert cache.evictions == 1
+        cache.put(keys[1], make_past(32))
+        assert cache.get(keys[1]) is None
+
+    def test_key_includes_mask(self):
+        ids = torch.tensor([3, 4, 5])
+        assert PrefixKVCache.get_key(ids, torch.tensor([1, 1, 1])) != (
+            PrefixKVCache.get_key(ids, torch.tensor([1, 0, 1]))
+        )
+
+    def test_theorem_stats(self):
+        cache = PrefixKVCache(2**20)
+        cache.record("a", False, 10, 20)
+        cache.record("a", True, 10, 30)
+        cache.record("b", True, 5, 10)
+        a_stats = cache.get_stats("a")
+        assert a_stats["lookups"] == 2
+        assert a_stats["hit_rate"] == 0.5
+        assert a_stats["reused_token_rate"] == 10 / 50
+        assert cache.get_stats()["hits"] == 2
+        assert cache.get_stats("c")["lookups"] == 0
+
+    def test_expand_past(self):
+        past = tuple(
+            (torch.arange(2.0).view(2, 1, 1, 1), torch.arange(2.0).view(2, 1, 1, 1))
+            for _ in range(2)
+        )
+        expanded = expand_past(past, 3)
+        assert expanded[0][0].flatten().tolist() == [0, 0, 0, 1, 1, 1]
+        assert expand_past(past, 1) is past
+
+
+class TestCachedGenerate:
+    def generate(
+        self, wrapper: DecoderLocalWrapper, token_mask_str: Optional[str], beam: bool
+    ) -> tuple[torch.Tensor, torch.Tensor]:
+        tokenize = wrapper._DecoderLocalWrapper__tokenize
+        get_prompt_past = wrapper._DecoderLocalWrapper__get_prompt_past
+        request = RecRequest(self.example, 1, "", True, token_mask_str, "add_0_r")
+        input_ids, attention_mask = tokenize(request)
+        n = 3 if beam else 1
+        past = None
+        if wrapper.prefix_cache is not None:
+            past = get_prompt_past("add_0_r", input_ids, attention_mask, n)
+            assert past is not None
+        with torch.inference_mode():
+            outputs = self.model.generate(
+                input_ids[None],
+                max_new_tokens=8,
+                return_dict_in_generate=True,
+                output_scores=True,
+                num_return_sequences=n,
+                do_sample=False,
+                num_beams=n,
+                attention_mask=attention_mask[None],
+                pad_token_id=self.tokenizer.eos_token_id,
+                past_key_values=past,
+            )
+        return outputs.sequences, torch.stack(outputs.scores)
+
+    def test_matches_uncached(self):
+        for token_mask_str in [None, "proof"]:
+            for beam in [False, True]:
+                expected_seqs, expected_scores = self.generate(
+                    self.uncached, token_mask_str, beam
+                )
+                # The first call fills the cache and the second reuses it.
+                for _ in range(2):
+                    seqs, scores = self.generate(self.cached, token_mask_str, beam)
+                    assert torch.equal(seqs, expected_seqs)
+                    assert torch.allclose(scores, expected_scores, atol=1e-4)
+        stats = self.prefix_cache.get_stats()
+        assert 0 < stats["hits"]
+
+    def test_recs_match_uncached(self):
+        for token_mask_str in [None, "proof"]:
+            expected = self.uncached.get_recs(
+                self.example, 3, "", True, token_mask_str, "add_0_r"
+            )
+            result = self.cached.get_recs(
+                self.example, 3, "", True, token_mask_str, "add_0_r"
+            )
+            assert result.next_tactic_list == expected.next_tactic_list
+            assert torch.allclose(
+                torch.tensor(result.score_list),
+                torch.tensor(expected.score_list),
+                atol=1e-4,
+            )
+
+    @classmethod
+    def setup_class(cls):
+        torch.manual_seed(0)
+        cls.example = LmExample(
+            "Proof.\nintros n.\n",
+            "n : nat\n============================\nn + 0 = n",
+            ["induction n."],
+            ["Proof. auto. Qed.", "Proof. intros. reflexivity. Qed."],
+            ["Lemma add_0_r : forall n, n + 0 = n.", "Lemma add_comm : a + b = b + a."],
+        )
+        collator = ProofPremiseCollator(64, 64, 64, 64, 64, False)
+        tokenizer = Tokenizer(models.BPE())
+        tokenizer.pre_tokenizer = pre_tokenizers.ByteLevel(add_prefix_space=False)
+        tokenizer.decoder = decoders.ByteLevel()
+        trainer = trainers.BpeTrainer(
+            vocab_size=300,
+            special_tokens=["<eos>"],
+            initial_alphabet=pre_tokenizers.ByteLevel.alphabet(),
+        )
+        corpus = [
+            collator.PREMISE_SEP
+            + "\n".join(cls.example.premises)
+            + collator.PROOF_SEP
+            + "\n".join(cls.example.proofs)
+            + collator.STATE_SEP
+            + cls.example.proof_state
+            + collator.SCRIPT_SEP
+            + cls.example.proof_script
+            + NEWLINE_RESPONSE_TEMPLATE
+        ]
+        tokenizer.train_from_iterator(corpus * 4, trainer)
+        cls.tokenizer = PreTrainedTokenizerFast(
+            tokenizer_object=tokenizer, eos_token="<eos>"
+        )
+        config = GPT2Config(
+            vocab_size=len(cls.tokenizer),
+            n_positions=512,
+            n_embd=32,
+            n_layer=2,
+            n_head=2,
+            initializer_range=0.5,
+            eos_token_id=cls.tokenizer.eos_token_id,
+            bos_token_id=cls.tokenizer.eos_token_id,
+        )
+        cls.model = GPT2LMHeadModel(config).eval()
+        cls.prefix_cache = PrefixKVCache(2**24)
+        cls.uncached = DecoderLocalWrapper(cls.model, cls.tokenizer, collator, 512)
+        cls.cached = DecoderLocalWrapper(
+            cls.model, cls.tokenizer, collator, 512, cls.prefix_cache
+        )
@@ -0,0 +1,43 @@
+from model_deployment.proof_check_cache import ProofCheckCache, normalize_proof
+
+
+def put_proof(cache: ProofCheckCache[str], proof: str, value: str, rejects: bool):
+    key = normalize_proof(proof)
+    sentences = [normalize_proof(s) for s in proof.split("\n") if s.strip()]
+    cache.put(key, value, sentences, rejects)
+
+
+class TestProofCheckCache:
+    def test_exact_hits(self):
+        cache: ProofCheckCache[str] = ProofCheckCache(8)
+        put_proof(cache, "\nProof.\n  intros n.", "valid", False)
+        assert cache.get(normalize_proof("\nProof.  intros   n.")) == "valid"
+        assert cache.get(normalize_proof("\nProof.\n  intros m.")) is None
+        stats = cache.get_stats()
+        assert stats["lookups"] == 2
+        assert stats["hits"] == 1
+
+    def test_rejecting_prefix(self):
+        cache: ProofCheckCache[str] = ProofCheckCache(8)
+        put_proof(cache, "\nProof.", "valid", False)
+        put_proof(cache, "\nProof.\n  apply H.", "invalid", True)
+        key = normalize_proof("\nProof.\n  apply H.\n  auto.")
+        assert cache.get_rejecting_prefix(key) == ["Proof.", "apply H."]
+        assert cache.get_rejecting_prefix(normalize_proof("Proof. apply H.2.")) is None
+        assert cache.get_rejecting_prefix(normalize_proof("Proof. auto.")) is None
+        assert cache.get_stats()["prefix_rejections"] == 1
+
+    def test_unfinished_sentence_does_not_reject(self):
+        cache: ProofCheckCache[str] = ProofCheckCache(8)
+        put_proof(cache, "\nProof.\n  apply", "invalid", True)
+        assert cache.get_rejecting_prefix(normalize_proof("Proof. apply H.")) is None
+
+    def test_eviction(self):
+        cache: ProofCheckCache[str] = ProofCheckCache(2)
+        put_proof(cache, "\nProof.\n  apply H.", "invalid", True)
+        put_proof(cache, "\nProof.\n  auto.", "valid", False)
+        put_proof(cache, "\nProof.\n  intros.", "valid", False)
+        assert len(cache) == 2
+        assert cache.get(normalize_proof("Proof. apply H.")) is None
+        assert cache.get_rejecting_prefix(normalize_proof("Proof. apply H. a.")) is None
+        assert cache.get(normalize_proof("Proof. auto.")) == "valid"
@@ -0,0 +1,57 @@
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from model_deployment.request_batcher import RequestBatcher
+
+
+class TestRequestBatcher:
+    def test_results_in_order(self):
+        batches: list[list[int]] = []
+
+        def run_batch(requests: list[int]) -> list[int]:
+            batches.append(requests)
+            return [2 * r for r in requests]
+
+        batcher = RequestBatcher(run_batch, 4, 0.05)
+        with ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(batcher.submit, range(16)))
+        assert results == [2 * r for r in range(16)]
+        assert all(len(b) <= 4 for b in batches)
+        assert sorted(r for b in batches for r in b) == list(range(16))
+        stats = batcher.get_stats()
+        assert stats["num_requests"] == 16
+        assert stats["num_batches"] == len(batches)
+        assert stats["mean_batch_size"] > 1
+
+    def test_waits_for_batch(self):
+        release = threading.Event()
+        batch_sizes: list[int] = []
+
+        def run_batch(requests: list[int]) -> list[int]:
+            # Hold the worker so later requests queue up together.
+            release.wait()
+            batch_sizes.append(len(requests))
+            return requests
+
+        batcher = RequestBatcher(run_batch, 8, 0)
+        with ThreadPoolExecutor(5) as executor:
+            first = executor.submit(batcher.submit, 0)
+            time.sleep(0.05)
+            rest = [executor.submit(batcher.submit, i) for i in range(1, 5)]
+            time.sleep(0.05)
+            release.set()
+            assert first.result() == 0
+            assert [f.result() for f in rest] == [1, 2, 3, 4]
+        assert batch_sizes == [1, 4]
+        assert batcher.get_stats()["max_queue_wait"] >= 0.05
+
+    def test_exception(self):
+        def run_batch(requests: list[int]) -> list[int]:
+            raise ValueError("bad batch")
+
+        batcher = RequestBatcher(run_batch, 2, 0)
+        with pytest.raises(ValueError):
+            batcher.submit(0)
@@ -0,0 +1,51 @@
+import torch
+from tokenizers import Regex, Tokenizer, models, pre_tokenizers, decoders
+from transformers import PreTrainedTokenizerFast
+
+from model_deployment.model_wrapper import TacticEndProcessor
+
+
+class TestTacticEndProcessor:
+    def test_forces_eos_after_sentence(self):
+        prompt = self.encode("goal")
+        processor = TacticEndProcessor(self.tokenizer, len(prompt))
+        eos_id = self.tokenizer.eos_token_id
+        for generated, should_end in [
+            ("intros x .", False),
+            ("intros x . ", True),
+            ("intros x .\n", True),
+            ("rewrite Nat.add", False),
+            ("rewrite Nat.add ", False),
+        ]:
+            input_ids = torch.tensor([prompt + self.encode(generated)])
+            scores = processor(input_ids, torch.zeros(1, len(self.vocab)))
+            assert bool(torch.all(scores[0, :eos_id] == -torch.inf)) == should_end
+            assert scores[0, eos_id] == 0
+
+    def test_ignores_prompt(self):
+        prompt = self.encode("goal . \n")
+        processor = TacticEndProcessor(self.tokenizer, len(prompt))
+        scores = torch.zeros(1, len(self.vocab))
+        new_scores = processor(torch.tensor([prompt]), scores.clone())
+        assert torch.equal(new_scores, scores)
+
+    def test_trim(self):
+        assert TacticEndProcessor.trim("intros x.\n apply H.") == "intros x."
+        assert TacticEndProcessor.trim("rewrite Nat.add_comm.") == (
+            "rewrite Nat.add_comm."
+        )
+        assert TacticEndProcessor.trim("auto") == "auto"
+
+    def encode(self, text: str) -> list[int]:
+        return self.tokenizer.encode(text, add_special_tokens=False)
+
+    @classmethod
+    def setup_class(cls):
+        words = ["goal", "intros", "x", ".", " ", "\n", "rewrite", "Nat.add", "apply"]
+        cls.vocab = {w: i for i, w in enumerate(words + ["<eos>"])}
+        tokenizer = Tokenizer(models.WordLevel(cls.vocab, unk_token="<eos>"))
+        tokenizer.pre_tokenizer = pre_tokenizers.Split(Regex(r"\s"), "isolated")
+        tokenizer.decoder = decoders.Fuse()
+        cls.tokenizer = PreTrainedTokenizerFast(
+            tokenizer_object=tokenizer, eos_token="<eos>"
+        )
@@ -0,0 +1,139 @@
+from typing import Optional
+
+import torch
+from hypothesis import given, strategies as st
+from tokenizers import Tokenizer, models, pre_tokenizers, decoders, trainers
+from transformers import PreTrainedTokenizerFast
+
+from model_deployment.model_wrapper import (
+    TokenMask,
+    find_id_start_idx,
+    find_id_start_idxs,
+    get_enclosing_seps,
+    get_sep_ids,
+    offsets_attention_mask,
+    transform_attention_mask,
+)
+from tactic_gen.lm_example import LmExample
+from tactic_gen.tactic_data import (
+    NoScriptCollator,
+    ProofPremiseCollator,
+    NEWLINE_RESPONSE_TEMPLATE,
+)
+
+
+def loop_start_idx(t: torch.Tensor, s: torch.Tensor) -> Optional[int]:
+    for i in range(t.shape[0] - s.shape[0] + 1):
+        if torch.all(t[i : i + s.shape[0]] == s):
+            return i
+    return None
+
+
+class TestFindIdStartIdx:
+    @given(
+        st.lists(st.integers(0, 3), max_size=12),
+        st.lists(st.integers(0, 3), min_size=1, max_size=3),
+    )
+    def test_matches_loop(self, t: list[int], s: list[int]):
+        t_tensor = torch.tensor(t, dtype=torch.long)
+        s_tensor = torch.tensor(s, dtype=torch.long)
+        assert find_id_start_idx(t_tensor, s_tensor) == loop_start_idx(
+            t_tensor, s_tensor
+        )
+
+    def test_batch(self):
+        t = torch.tensor([[1, 2, 3, 2, 3], [2, 3, 1, 1, 1], [1, 1, 1, 1, 1]])
+        assert find_id_start_idxs(t, torch.tensor([2, 3])).tolist() == [1, 0, -1]
+
+
+class TestTokenMask:
+    def test_collate_input(self):
+        collator = ProofPremiseCollator(64, 64, 64, 64, 64, False)
+        expected = (
+            collator.PREMISE_SEP
+            + "\n".join(self.example.premises[::-1])
+            + collator.PROOF_SEP
+            + "\n".join(self.example.proofs[::-1])
+            + collator.STATE_SEP
+            + self.example.proof_state
+            + collator.SCRIPT_SEP
+            + self.example.proof_script
+            + NEWLINE_RESPONSE_TEMPLATE
+        )
+        text, offsets = collator.collate_input_with_offsets(
+            self.tokenizer, self.example
+        )
+        assert collator.collate_input(self.tokenizer, self.example) == expected
+        assert text == expected
+        for sep, offset in offsets.items():
+            assert text[offset : offset + len(sep)] == sep
+
+    def test_offsets_match_search(self):
+        collators = [
+            ProofPremiseCollator(64, 64, 64, 64, 64, False),
+            NoScriptCollator(64, 64, 64, 64, False),
+        ]
+        for collator in collators:
+            sep_ids = get_sep_ids(collator, self.tokenizer)
+            text, offsets = collator.collate_input_with_offsets(
+                self.tokenizer, self.example
+            )
+            inputs = self.tokenizer(
+                text, return_tensors="pt", return_offsets_mapping=True
+            )
+            for token_mask in TokenMask:
+                if isinstance(collator, NoScriptCollator) and (
+                    token_mask == TokenMask.SCRIPT
+                ):
+                    continue
+                start_str, end_str = get_enclosing_seps(collator, token_mask)
+                search_mask = transform_attention_mask(
+                    collator,
+                    self.tokenizer,
+                    token_mask,
+                    inputs["input_ids"],
+                    inputs["attention_mask"],
+                    sep_ids,
+                )
+                offset_mask = offsets_attention_mask(
+                    inputs["offset_mapping"],
+                    inputs["attention_mask"],
+                    offsets[start_str],
+                    offsets[end_str],
+                )
+                assert 0 < int((search_mask == 0).sum())
+                assert torch.equal(search_mask, offset_mask)
+
+    @classmethod
+    def setup_class(cls):
+        cls.example = LmExample(
+            "Proof.\nintros n.\n",
+            "n : nat\n============================\nn + 0 = n",
+            ["induction n."],
+            ["Proof. auto. Qed.", "Proof. intros. reflexivity. Qed."],
+            ["Lemma add_0_r : forall n, n + 0 = n.", "Lemma add_comm : a + b = b + a."],
+        )
+        collator = ProofPremiseCollator(64, 64, 64, 64, 64, False)
+        tokenizer = Tokenizer(models.BPE())
+        tokenizer.pre_tokenizer = pre_tokenizers.ByteLevel(add_prefix_space=False)
+        tokenizer.decoder = decoders.ByteLevel()
+        trainer = trainers.BpeTrainer(
+            vocab_size=300,
+            special_tokens=["<eos>"],
+            initial_alphabet=pre_tokenizers.ByteLevel.alphabet(),
+        )
+        corpus = [
+            collator.PREMISE_SEP
+            + "\n".join(cls.example.premises)
+            + collator.PROOF_SEP
+            + "\n".join(cls.example.proofs)
+            + collator.STATE_SEP
+            + cls.example.proof_state
+            + collator.SCRIPT_SEP
+            + cls.example.proof_script
+            + NEWLINE_RESPONSE_TEMPLATE
+        ]
+        tokenizer.train_from_iterator(corpus * 4, trainer)
+        cls.tokenizer = PreTrainedTokenizerFast(
+            tokenizer_object=tokenizer, eos_token="<eos>"
+        )
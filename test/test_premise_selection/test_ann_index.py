@@ -0,0 +1,74 @@
+import shutil
+from pathlib import Path
+
+import numpy as np
+from hypothesis import given, settings, strategies as st
+
+from premise_selection.premise_ann_index import IVFIndex
+from util.ranking import top_k_indices
+
+
+def clustered_embs(seed: int, num_vectors: int, dim: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(16, dim)) * 4
+    labels = rng.integers(0, len(centers), size=num_vectors)
+    embs = centers[labels] + rng.normal(size=(num_vectors, dim))
+    return embs.astype(np.float32)
+
+
+class TestIVFIndex:
+    INDEX_LOC = Path("ivf-index-test")
+
+    @settings(max_examples=20, deadline=None)
+    @given(
+        st.integers(min_value=0, max_value=2**16),
+        st.integers(min_value=1, max_value=30),
+    )
+    def test_all_probes_is_exact(self, seed: int, k: int):
+        embs = clustered_embs(seed, 300, 8)
+        index = IVFIndex.build(embs, 16, num_probes=16, num_iters=3)
+        rng = np.random.default_rng(seed)
+        allowed_ids = rng.choice(len(embs), 100, replace=False)
+        query = rng.normal(size=8).astype(np.float32)
+        exact_scores = embs[allowed_ids] @ query
+        positions, scores = index.search(query, allowed_ids, k, embs)
+        assert positions == top_k_indices(exact_scores, k)
+        assert np.allclose(scores, exact_scores[positions])
+
+    @settings(max_examples=20, deadline=None)
+    @given(
+        st.integers(min_value=0, max_value=2**16),
+        st.integers(min_value=0, max_value=40),
+    )
+    def test_returns_k_allowed(self, seed: int, num_allowed: int):
+        embs = clustered_embs(seed, 300, 8)
+        index = IVFIndex.build(embs, 32, num_probes=1, num_iters=3)
+        rng = np.random.default_rng(seed)
+        allowed_ids = rng.choice(len(embs), num_allowed, replace=False)
+        query = rng.normal(size=8).astype(np.float32)
+        positions, _ = index.search(query, allowed_ids, 10, embs)
+        assert len(positions) == min(10, num_allowed)
+        assert len(set(positions)) == len(positions)
+        assert all(0 <= p < num_allowed for p in positions)
+
+    def test_save_load(self):
+        embs = clustered_embs(0, 200, 4)
+        index = IVFIndex.build(embs, 8, num_probes=2, sdb_hash="abc")
+        index.save(self.INDEX_LOC)
+        loaded_index = IVFIndex.load(self.INDEX_LOC)
+        assert loaded_index.num_probes == 2
+        assert loaded_index.sdb_hash == "abc"
+        assert np.array_equal(loaded_index.centroids, index.centroids)
+        assert np.array_equal(loaded_index.assignments, index.assignments)
+
+    def test_stale_index(self):
+        embs = clustered_embs(0, 200, 4)
+        IVFIndex.build(embs, 8, num_probes=2, sdb_hash="abc").save(self.INDEX_LOC)
+        assert IVFIndex.load_checked(self.INDEX_LOC, 200, "abc") is not None
+        assert IVFIndex.load_checked(self.INDEX_LOC, 201, "abc") is None
+        assert IVFIndex.load_checked(self.INDEX_LOC, 200, "def") is None
+
+    @classmethod
+    def teardown_class(cls) -> None:
+        if cls.INDEX_LOC.exists():
+            shutil.rmtree(cls.INDEX_LOC)
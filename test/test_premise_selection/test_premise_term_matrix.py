@@ -0,0 +1,53 @@
+from hypothesis import given, strategies as st
+
+from coqpyt.coq.structs import TermType
+
+from data_management.dataset_file import Sentence, get_ids_from_sentence
+from premise_selection.premise_term_matrix import PremiseTermMatrix
+from proof_retrieval.bm25 import bm25
+from proof_retrieval.tfidf import tf_idf
+
+terms = st.text(alphabet="abcde", min_size=1, max_size=2)
+premise_texts = st.lists(st.lists(terms, max_size=8).map(" ".join), max_size=12)
+
+
+def to_premises(texts: list[str], stored: bool) -> list[Sentence]:
+    premises: list[Sentence] = []
+    for i, text in enumerate(texts):
+        premise = Sentence.from_text(text, TermType.LEMMA)
+        # Distinct ids even for repeated texts, like a real sentence db.
+        premise.db_idx = i if stored else None
+        premises.append(premise)
+    return premises
+
+
+class TestPremiseTermMatrix:
+    @given(st.lists(terms, max_size=6), premise_texts, premise_texts, st.booleans())
+    def test_matches_sparse_functions(
+        self, query: list[str], seen: list[str], texts: list[str], stored: bool
+    ):
+        matrix = PremiseTermMatrix()
+        matrix.get_rows(to_premises(seen, not stored))
+        premises = to_premises(texts, stored)
+        docs = [get_ids_from_sentence(p) for p in premises]
+        assert matrix.bm25(query, premises) == bm25(query, docs)
+        assert matrix.tf_idf(query, premises) == tf_idf(query, docs)
+        # Rows are reused once encoded.
+        num_rows = matrix.num_rows
+        assert matrix.bm25(query, premises) == bm25(query, docs)
+        assert matrix.num_rows == num_rows
+
+    @given(st.lists(terms, max_size=6), st.lists(premise_texts, max_size=6))
+    def test_interleaved_batches(self, query: list[str], batches: list[list[str]]):
+        matrix = PremiseTermMatrix()
+        all_premises: list[Sentence] = []
+        for batch in batches:
+            premises = to_premises(batch, False)
+            all_premises.extend(premises)
+            docs = [get_ids_from_sentence(p) for p in premises]
+            assert matrix.bm25(query, premises) == bm25(query, docs)
+            all_docs = [get_ids_from_sentence(p) for p in all_premises]
+            assert matrix.tf_idf(query, all_premises) == tf_idf(query, all_docs)
+        matrix.finalize()
+        all_docs = [get_ids_from_sentence(p) for p in all_premises]
+        assert matrix.bm25(query, all_premises) == bm25(query, all_docs)
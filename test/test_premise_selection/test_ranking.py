@@ -0,0 +1,25 @@
+from typing import Optional
+
+from hypothesis import given, strategies as st
+
+from util.ranking import top_k_indices, iter_ranked_indices
+
+# Few distinct values so that ties are common.
+scores = st.lists(st.sampled_from([0.0, 0.5, 1.0, 2.5, -1.0]), max_size=30)
+
+
+def sort_indices(scores: list[float]) -> list[int]:
+    return sorted(range(len(scores)), key=lambda idx: -1 * scores[idx])
+
+
+class TestRanking:
+    @given(scores, st.one_of(st.none(), st.integers(min_value=0, max_value=35)))
+    def test_top_k_matches_sort(self, scores: list[float], k: Optional[int]):
+        expected = sort_indices(scores)
+        if k is not None:
+            expected = expected[:k]
+        assert top_k_indices(scores, k) == expected
+
+    @given(scores)
+    def test_iter_ranked_matches_sort(self, scores: list[float]):
+        assert list(iter_ranked_indices(scores)) == sort_indices(scores)
@@ -2,12 +2,18 @@ import hashlib
 import torch
 import shutil
 from pathlib import Path
+from typing import Callable
 import os
 
+import numpy as np
+import pytest
+
 from util.util import get_fresh_path
 
 from data_management.sentence_db import SentenceDB, DBSentence
-from premise_selection.premise_vector_db import VectorDB
+from premise_selection.premise_vector_db import VectorDB, BuildManifest
+from util.ranking import top_k_indices
+from util.vector_db_utils import EmbeddingMatrix, get_embs, get_page_loc, load_page
 
 
 def encode_fn(db_ss: list[DBSentence]) -> torch.Tensor:
@@ -20,6 +26,10 @@ def encode_fn(db_ss: list[DBSentence]) -> torch.Tensor:
     return torch.tensor(hashs)
 
 
+def encode_fn_factory(device: str) -> Callable[[list[DBSentence]], torch.Tensor]:
+    return encode_fn
+
+
 def get_ordered_sentences(ss: list[DBSentence], db_idxs: list[int]) -> list[DBSentence]:
     ordered: list[DBSentence] = []
     for idx in db_idxs:
@@ -51,6 +61,17 @@ class TestVectorDB:
         assert act is not None
         assert torch.allclose(act, exp)
 
+    def test_retrieve_cpu_pages(self):
+        load_page.cache_clear()
+        page = load_page(self.vdb_loc, 1, "cpu")
+        assert page is not None
+        assert torch.equal(page, encode_fn(self.test_sentences[1:3]))
+        idxs = [4, 1, 5]
+        exp = encode_fn(get_ordered_sentences(self.test_sentences, idxs))
+        act = get_embs(idxs, 2, self.vdb_loc, "cpu")
+        assert act is not None
+        assert torch.equal(act, exp)
+
     @classmethod
     def setup_class(cls) -> None:
         cls.sdb_loc = get_fresh_path(Path("."), "test_sdb")
@@ -77,3 +98,197 @@ class TestVectorDB:
             os.remove(cls.sdb_loc)
         if os.path.exists(cls.vdb_loc):
             shutil.rmtree(cls.vdb_loc)
+
+
+class TestEmbeddingMatrix:
+    # The test embeddings are integers below 256, which int8 cannot hold.
+    @pytest.mark.parametrize("storage_dtype", ["float16", "float32"])
+    def test_matches_pages(self, storage_dtype: str):
+        page_vdb = VectorDB.load(self.vdb_loc)
+        EmbeddingMatrix.from_pages(
+            self.vdb_loc, storage_dtype, page_vdb.page_size, page_vdb.sdb_hash
+        )
+        matrix_vdb = VectorDB.load(self.vdb_loc)
+        assert matrix_vdb.emb_matrix is not None
+        assert len(matrix_vdb.emb_matrix) == len(self.test_sentences) + 1
+        for idxs in [[1, 2, 3, 4, 5], [5, 3, 3, 4, 3, 1, 1, 2, 1], []]:
+            exp = page_vdb.get_embs(idxs) if 0 < len(idxs) else None
+            act = matrix_vdb.get_embs(idxs)
+            assert act is not None
+            if exp is not None:
+                assert act.dtype == exp.dtype
+                assert torch.equal(act, exp)
+        assert torch.equal(matrix_vdb.get(3), page_vdb.get(3))
+        assert matrix_vdb.get_embs([len(self.test_sentences) + 1]) is None
+        assert matrix_vdb.get_embs([1, -1]) is None
+
+    def test_stale_matrix(self):
+        page_vdb = VectorDB.load(self.vdb_loc)
+        EmbeddingMatrix.from_pages(self.vdb_loc, "float32", page_vdb.page_size, "old")
+        assert VectorDB.load(self.vdb_loc).emb_matrix is None
+
+        EmbeddingMatrix.from_pages(
+            self.vdb_loc, "float32", page_vdb.page_size, page_vdb.sdb_hash
+        )
+        last_page_loc = get_page_loc(self.vdb_loc, 1)
+        last_page = torch.load(last_page_loc)
+        try:
+            torch.save(last_page[:1], last_page_loc)
+            assert VectorDB.load(self.vdb_loc).emb_matrix is None
+        finally:
+            torch.save(last_page, last_page_loc)
+        assert VectorDB.load(self.vdb_loc).emb_matrix is not None
+
+    def teardown_method(self) -> None:
+        for name in [EmbeddingMatrix.EMBS_NAME, EmbeddingMatrix.METADATA_NAME]:
+            if (self.vdb_loc / name).exists():
+                os.remove(self.vdb_loc / name)
+
+    @classmethod
+    def setup_class(cls) -> None:
+        cls.sdb_loc = get_fresh_path(Path("."), "test_matrix_sdb")
+        cls.test_sentences = [
+            DBSentence(text, "", "", "", 0) for text in ["a", "b", "c", "d", "e"]
+        ]
+        sdb = SentenceDB.create(cls.sdb_loc)
+        for ts in cls.test_sentences:
+            sdb.insert_sentence(ts)
+        cls.vdb_loc = get_fresh_path(Path("."), "test_matrix_vdb")
+        vdb = VectorDB.create_premise_db(
+            cls.vdb_loc, 4, "test_vector_db", encode_fn, cls.sdb_loc
+        )
+        vdb.save()
+
+    @classmethod
+    def teardown_class(cls) -> None:
+        if os.path.exists(cls.sdb_loc):
+            os.remove(cls.sdb_loc)
+        if os.path.exists(cls.vdb_loc):
+            shutil.rmtree(cls.vdb_loc)
+
+
+class TestQuantizedRanking:
+    """Tracks how much quantized storage changes retrieval rankings."""
+
+    NUM_VECTORS = 3000
+    PAGE_SIZE = 1024
+    DIM = 256
+    NUM_QUERIES = 50
+    K = 20
+    MIN_RECALLS = {"int8": 0.95, "float16": 0.99, "float32": 1.0}
+
+    @pytest.mark.parametrize("storage_dtype", EmbeddingMatrix.STORAGE_DTYPES)
+    def test_top_k_recall(self, storage_dtype: str):
+        matrix = EmbeddingMatrix.from_pages(self.vdb_loc, storage_dtype)
+        all_idxs = list(range(self.NUM_VECTORS))
+        embs = matrix.get_embs(all_idxs, "cpu")
+        assert embs is not None
+        assert embs.dtype == torch.float32
+        max_errors = (embs - self.embs).abs().max(dim=1).values
+        assert torch.all(max_errors <= self.embs.abs().max(dim=1).values / 127)
+
+        exact_scores = self.queries @ self.embs.T
+        scores = self.queries @ embs.T
+        recalls: list[float] = []
+        for exact_row, row in zip(exact_scores.tolist(), scores.tolist()):
+            exact_top = set(top_k_indices(exact_row, self.K))
+            top = set(top_k_indices(row, self.K))
+            recalls.append(len(exact_top & top) / self.K)
+        assert self.MIN_RECALLS[storage_dtype] <= np.mean(recalls)
+
+    def teardown_method(self) -> None:
+        for name in [
+            EmbeddingMatrix.EMBS_NAME,
+            EmbeddingMatrix.SCALES_NAME,
+            EmbeddingMatrix.METADATA_NAME,
+        ]:
+            if (self.vdb_loc / name).exists():
+                os.remove(self.vdb_loc / name)
+
+    @classmethod
+    def setup_class(cls) -> None:
+        generator = torch.Generator().manual_seed(0)
+        cls.embs = torch.randn(cls.NUM_VECTORS, cls.DIM, generator=generator)
+        # Queries close to stored vectors have near ties at the top.
+        query_idxs = torch.randint(
+            cls.NUM_VECTORS, (cls.NUM_QUERIES,), generator=generator
+        )
+        cls.queries = cls.embs[query_idxs] + torch.randn(
+            cls.NUM_QUERIES, cls.DIM, generator=generator
+        )
+        cls.vdb_loc = get_fresh_path(Path("."), "test_quantized_vdb")
+        os.makedirs(cls.vdb_loc)
+        for page_idx, start in enumerate(range(0, cls.NUM_VECTORS, cls.PAGE_SIZE)):
+            page = cls.embs[start : start + cls.PAGE_SIZE].clone()
+            torch.save(page, get_page_loc(cls.vdb_loc, page_idx))
+
+    @classmethod
+    def teardown_class(cls) -> None:
+        if os.path.exists(cls.vdb_loc):
+            shutil.rmtree(cls.vdb_loc)
+
+
+class TestBuildPremiseDB:
+    PAGE_SIZE = 4
+
+    def build(self) -> VectorDB:
+        return VectorDB.build_premise_db(
+            self.vdb_loc,
+            self.PAGE_SIZE,
+            "test_vector_db",
+            encode_fn_factory,
+            self.sdb_loc,
+            ["cpu", "cpu"],
+        )
+
+    def test_matches_create(self):
+        vdb = self.build()
+        manifest = BuildManifest.load(self.vdb_loc)
+        assert manifest.done_pages == set(range(manifest.num_pages))
+        idxs = list(range(1, len(self.test_sentences) + 1))
+        assert torch.equal(vdb.get_embs(idxs), self.expected_embs)
+
+    def test_resume(self):
+        self.build()
+        manifest = BuildManifest.load(self.vdb_loc)
+        # Page 0 counts as done and page 1 was interrupted.
+        torch.save(torch.zeros(self.PAGE_SIZE, 32), get_page_loc(self.vdb_loc, 0))
+        torch.save(torch.zeros(1, 32), get_page_loc(self.vdb_loc, 1))
+        manifest.done_pages.remove(1)
+        manifest.save(self.vdb_loc)
+        vdb = self.build()
+        assert torch.equal(
+            torch.load(get_page_loc(self.vdb_loc, 0)), torch.zeros(4, 32)
+        )
+        idxs = list(range(self.PAGE_SIZE, len(self.test_sentences) + 1))
+        assert torch.equal(vdb.get_embs(idxs), self.expected_embs[idxs[0] - 1 :])
+
+    def test_other_page_size(self):
+        self.build()
+        with pytest.raises(ValueError):
+            VectorDB.build_premise_db(
+                self.vdb_loc, 3, "", encode_fn_factory, self.sdb_loc, ["cpu"]
+            )
+
+    def teardown_method(self) -> None:
+        if os.path.exists(self.vdb_loc):
+            shutil.rmtree(self.vdb_loc)
+
+    @classmethod
+    def setup_class(cls) -> None:
+        cls.sdb_loc = get_fresh_path(Path("."), "test_build_sdb")
+        cls.test_sentences = [
+            DBSentence(str(i), "", "", "", 0) for i in range(2 * cls.PAGE_SIZE + 1)
+        ]
+        sdb = SentenceDB.create(cls.sdb_loc)
+        for ts in cls.test_sentences:
+            sdb.insert_sentence(ts)
+        sdb.commit()
+        sdb.close()
+        cls.vdb_loc = get_fresh_path(Path("."), "test_build_vdb")
+        cls.expected_embs = encode_fn(cls.test_sentences)
+
+    @classmethod
+    def teardown_class(cls) -> None:
+        if os.path.exists(cls.sdb_loc):
+            os.remove(cls.sdb_loc)
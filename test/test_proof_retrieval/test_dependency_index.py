@@ -0,0 +1,176 @@
+import os
+import shutil
+from pathlib import Path
+
+from hypothesis import given, settings, HealthCheck, strategies as st
+
+from coqpyt.coq.structs import TermType
+
+from data_management.dataset_file import (
+    DatasetFile,
+    FileContext,
+    FocusedStep,
+    Proof,
+    Sentence,
+    StepID,
+    Term,
+    DPCache,
+    DATA_POINTS_NAME,
+)
+from data_management.sentence_db import SentenceDB
+from proof_retrieval.dependency_index import DependencyIndex
+from proof_retrieval.proof_idx import ProofStateIdx
+from proof_retrieval.proof_retriever import (
+    DeepProofRetrieverClient,
+    SparseKind,
+    SparseProofRetriever,
+    get_available_proofs,
+)
+
+
+def premise_from(file_path: str) -> Sentence:
+    return Sentence(f"Lemma l : {file_path}.", file_path, [], TermType.LEMMA, 0, None)
+
+
+class LocalDeepClient(DeepProofRetrieverClient):
+    """Scores the available steps in reverse order instead of asking a server."""
+
+    def get_step_scores(
+        self, step_idx: int, proof: Proof, dp_obj: DatasetFile
+    ) -> tuple[list[StepID], list[float]]:
+        step_ids = [s for s, _ in self.get_available_step_hashes(proof, dp_obj)]
+        return step_ids, [-float(i) for i in range(len(step_ids))]
+
+
+class TestDependencyIndex:
+    DB_PATH = Path("dependency-index-test.db")
+    DATA_LOC = Path("dependency-index-test-data")
+    DEP_FILES = ["/ws/repos/p/a.v", "/ws/repos/p/b.v"]
+    KEY_FILE = "/ws/repos/p/c.v"
+
+    def save_dp(self, file: str, premises: list[Sentence], proofs: list[Proof]):
+        file_proofs = [Proof(p.theorem, p.steps, i) for i, p in enumerate(proofs)]
+        dp_obj = DatasetFile(FileContext(file, "ws", "p", premises), file_proofs)
+        dp_obj.save(
+            self.DATA_LOC / DATA_POINTS_NAME / dp_obj.dp_name,
+            self.db,
+            insert_allowed=True,
+        )
+        return dp_obj
+
+    @settings(
+        max_examples=20,
+        deadline=None,
+        suppress_health_check=[HealthCheck.data_too_large, HealthCheck.too_slow],
+    )
+    @given(
+        st.lists(st.lists(st.from_type(Proof), max_size=3), min_size=2, max_size=2),
+        st.lists(st.from_type(Proof), min_size=1, max_size=3),
+    )
+    def test_matches_available_proofs(
+        self, dep_proofs: list[list[Proof]], key_proofs: list[Proof]
+    ):
+        if self.DATA_LOC.exists():
+            shutil.rmtree(self.DATA_LOC)
+        for file, proofs in zip(self.DEP_FILES, dep_proofs):
+            self.save_dp(file, [], proofs)
+        premises = [premise_from(f) for f in self.DEP_FILES + ["/ws/repos/p/d.v"]]
+        key_dp = self.save_dp(self.KEY_FILE, premises, key_proofs)
+
+        index = DependencyIndex.build(self.DATA_LOC, self.db)
+        index.save(DependencyIndex.get_index_loc(self.DATA_LOC))
+        index = DependencyIndex.load(DependencyIndex.get_index_loc(self.DATA_LOC))
+        assert index.dependencies[key_dp.dp_name] == ["p-a.v", "p-b.v"]
+
+        key_proof = Proof(key_dp.proofs[0].theorem, [], -1)
+        available_proofs = get_available_proofs(
+            key_proof, key_dp, DPCache(), self.DATA_LOC, self.db
+        )
+        expected_steps = [
+            (
+                (p_obj.dp_name, p.proof_idx, i),
+                ProofStateIdx.hash_proof_step(i, p, p_obj.dp_name),
+            )
+            for p, p_obj in available_proofs
+            if p_obj.dp_name != key_dp.dp_name
+            for i in range(len(p.steps))
+        ]
+        dep_steps = [
+            ((step_id.file, step_id.proof_idx, step_id.step_idx), step_hash)
+            for step_id, step_hash in index.iter_dep_steps(key_dp.dp_name)
+        ]
+        assert dep_steps == expected_steps
+        assert index.num_dep_steps(key_dp.dp_name) == len(expected_steps)
+
+    def save_dep_files(self, proofs: list[Proof]) -> None:
+        if self.DATA_LOC.exists():
+            shutil.rmtree(self.DATA_LOC)
+        for file in self.DEP_FILES:
+            self.save_dp(file, [], proofs)
+        premises = [premise_from(f) for f in self.DEP_FILES]
+        self.save_dp(self.KEY_FILE, premises, [])
+
+    @settings(
+        max_examples=1,
+        deadline=None,
+        suppress_health_check=[HealthCheck.data_too_large, HealthCheck.too_slow],
+    )
+    @given(st.lists(st.from_type(Proof), min_size=2, max_size=3))
+    def test_rebuilds_stale_index(self, proofs: list[Proof]):
+        self.save_dep_files(proofs[:1])
+        index = DependencyIndex.load_or_build(self.DATA_LOC, self.db)
+        assert DependencyIndex.get_index_loc(self.DATA_LOC).exists()
+        assert len(index.proof_tables["p-a.v"].proofs) == 1
+        reloaded = DependencyIndex.load_or_build(self.DATA_LOC, self.db)
+        assert reloaded.fingerprint == index.fingerprint
+
+        self.save_dp(self.DEP_FILES[0], [], proofs)
+        rebuilt = DependencyIndex.load_or_build(self.DATA_LOC, self.db)
+        assert rebuilt.fingerprint != index.fingerprint
+        assert len(rebuilt.proof_tables["p-a.v"].proofs) == len(proofs)
+
+    def test_step_ids_load_no_dependency(self):
+        steps = [FocusedStep.from_step_text(t) for t in ["intros.", "auto."]]
+        proofs = [Proof(Term.from_text("Lemma x : True.", TermType.LEMMA), steps, 0)]
+        self.save_dep_files(proofs)
+        index = DependencyIndex.load_or_build(self.DATA_LOC, self.db)
+        key_dp = DatasetFile.load(self.DATA_LOC / DATA_POINTS_NAME / "p-c.v", self.db)
+        client = LocalDeepClient(
+            [], ProofStateIdx({}), self.db, self.DATA_LOC, 1, False, index
+        )
+        client.dp_cache = DPCache()
+        key_proof = Proof(proofs[0].theorem, [], -1)
+        expected = [s for s, _ in index.iter_dep_steps(key_dp.dp_name)]
+        step_ids = client.get_similar_step_ids(0, key_proof, key_dp, False)
+        assert step_ids == expected
+        assert len(client.dp_cache) == 0
+
+        proof_steps = client.iter_similar_proof_steps(0, key_proof, key_dp, False)
+        ref_proof, step_id = next(proof_steps)
+        assert step_id == expected[0]
+        assert ref_proof.steps[step_id.step_idx].step.text == "intros."
+        assert len(client.dp_cache) == 1
+
+    def test_dep_index_cache_size(self):
+        self.save_dep_files([])
+        retriever = SparseProofRetriever(
+            SparseKind.BM25, 1, self.DATA_LOC, self.db, None, False, 1
+        )
+        a_index = retriever.get_dep_index("p-a.v")
+        assert retriever.get_dep_index("p-a.v") is a_index
+        retriever.get_dep_index("p-b.v")
+        assert list(retriever.dep_indices) == ["p-b.v"]
+
+    @classmethod
+    def setup_class(cls) -> None:
+        if cls.DB_PATH.exists():
+            os.remove(cls.DB_PATH)
+        cls.db = SentenceDB.create(cls.DB_PATH)
+
+    @classmethod
+    def teardown_class(cls) -> None:
+        cls.db.close()
+        if cls.DB_PATH.exists():
+            os.remove(cls.DB_PATH)
+        if cls.DATA_LOC.exists():
+            shutil.rmtree(cls.DATA_LOC)
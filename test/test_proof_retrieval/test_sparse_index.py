@@ -0,0 +1,100 @@
+from hypothesis import given, strategies as st
+
+from proof_retrieval.bm25 import bm25, CorpusStats
+from proof_retrieval.tfidf import tf_idf
+from proof_retrieval.sparse_index import (
+    InvertedIndex,
+    ProofStepIndex,
+    ClosureStatsCache,
+    IndexPart,
+    closure_stats,
+    bm25_scores,
+    tf_idf_scores,
+    rank_docs,
+)
+
+terms = st.text(alphabet="abcde", min_size=1, max_size=2)
+docs = st.lists(st.lists(terms, max_size=8), max_size=6)
+corpora = st.lists(docs, max_size=4)
+limits = st.lists(st.integers(min_value=0, max_value=6), min_size=4, max_size=4)
+
+
+def build_parts(corpus: list[list[list[str]]], limits: list[int]) -> list[IndexPart]:
+    parts: list[IndexPart] = []
+    for part_docs, limit in zip(corpus, limits):
+        index = InvertedIndex()
+        for doc in part_docs:
+            index.add_doc(doc)
+        parts.append((index, min(limit, index.num_docs)))
+    return parts
+
+
+def flat_docs(corpus: list[list[list[str]]], parts: list[IndexPart]) -> list[list[str]]:
+    flat: list[list[str]] = []
+    for part_docs, (_, limit) in zip(corpus, parts):
+        flat.extend(part_docs[:limit])
+    return flat
+
+
+def dense_scores(
+    sparse: dict[tuple[int, int], float], parts: list[IndexPart]
+) -> list[float]:
+    scores: list[float] = []
+    for part_idx, (_, limit) in enumerate(parts):
+        for doc_id in range(limit):
+            scores.append(sparse.get((part_idx, doc_id), 0))
+    return scores
+
+
+class TestSparseIndex:
+    @given(st.lists(terms, max_size=6), corpora, limits)
+    def test_bm25_matches(
+        self, query: list[str], corpus: list[list[list[str]]], limits: list[int]
+    ):
+        parts = build_parts(corpus, limits)
+        expected = bm25(query, flat_docs(corpus, parts))
+        assert dense_scores(bm25_scores(query, parts), parts) == expected
+
+    @given(st.lists(terms, max_size=6), corpora, limits)
+    def test_tf_idf_matches(
+        self, query: list[str], corpus: list[list[list[str]]], limits: list[int]
+    ):
+        parts = build_parts(corpus, limits)
+        expected = tf_idf(query, flat_docs(corpus, parts))
+        assert dense_scores(tf_idf_scores(query, parts), parts) == expected
+
+    @given(st.lists(terms, max_size=6), corpora)
+    def test_rank_matches_sort(self, query: list[str], corpus: list[list[list[str]]]):
+        parts = build_parts(corpus, [len(d) for d in corpus])
+        scores = bm25_scores(query, parts)
+        dense = dense_scores(scores, parts)
+        keys = [(p, d) for p, (_, limit) in enumerate(parts) for d in range(limit)]
+        expected = sorted(range(len(dense)), key=lambda idx: -1 * dense[idx])
+        assert list(rank_docs(scores, parts)) == [keys[i] for i in expected]
+
+    @given(st.lists(terms, max_size=6), corpora, limits)
+    def test_cached_closure_stats(
+        self, query: list[str], corpus: list[list[list[str]]], limits: list[int]
+    ):
+        parts = build_parts(corpus, limits)
+        if 0 == len(parts):
+            return
+        dep_indices: list[ProofStepIndex] = []
+        for i, (index, _) in enumerate(parts[1:]):
+            step_index = ProofStepIndex(f"dep-{i}")
+            step_index.index = index
+            dep_indices.append(step_index)
+        full_parts = parts[:1] + [(d.index, d.index.num_docs) for d in dep_indices]
+
+        cache = ClosureStatsCache()
+        dep_stats = cache.get_stats(dep_indices)
+        assert cache.get_stats(list(reversed(dep_indices))) is dep_stats
+        stats = closure_stats(query, parts[:1], dep_stats)
+        assert stats == closure_stats(query, full_parts)
+        assert bm25_scores(query, full_parts, stats) == bm25_scores(query, full_parts)
+
+    @given(st.lists(terms, max_size=6), docs)
+    def test_bm25_with_stats(self, query: list[str], doc_list: list[list[str]]):
+        stats = CorpusStats.from_corpus(doc_list)
+        assert bm25(query, doc_list, stats=stats) == bm25(query, doc_list)
+        assert tf_idf(query, doc_list, stats=stats) == tf_idf(query, doc_list)
@@ -0,0 +1,61 @@
+import shutil
+from pathlib import Path
+
+import torch
+from peft import LoraConfig, get_peft_model
+from transformers import LlamaConfig, LlamaForCausalLM
+
+from tactic_gen.train_decoder import get_cpu_model
+
+
+class TestCPUModel:
+    BASE_LOC = Path("cpu-model-test-base")
+    ADAPTER_LOC = Path("cpu-model-test-adapter")
+
+    def test_merges_lora(self):
+        model = get_cpu_model(str(self.ADAPTER_LOC), quantize=False)
+        with torch.inference_mode():
+            logits = model(self.input_ids).logits
+        assert torch.allclose(logits, self.expected_logits, atol=1e-5)
+
+    def test_quantizes_linear_layers(self):
+        model = get_cpu_model(str(self.ADAPTER_LOC))
+        assert not any(isinstance(m, torch.nn.Linear) for m in model.modules())
+        with torch.inference_mode():
+            logits = model(self.input_ids).logits
+        assert (
+            logits.argmax(-1) == self.expected_logits.argmax(-1)
+        ).float().mean() > 0.9
+
+    @classmethod
+    def setup_class(cls) -> None:
+        torch.manual_seed(0)
+        config = LlamaConfig(
+            vocab_size=64,
+            hidden_size=32,
+            intermediate_size=64,
+            num_hidden_layers=2,
+            num_attention_heads=4,
+        )
+        LlamaForCausalLM(config).save_pretrained(cls.BASE_LOC)
+        base_model = LlamaForCausalLM.from_pretrained(cls.BASE_LOC)
+        lora_conf = LoraConfig(
+            r=4, target_modules=["q_proj", "v_proj"], task_type="CAUSAL_LM"
+        )
+        peft_model = get_peft_model(base_model, lora_conf)
+        # LoRA starts as the identity; move it so merging matters.
+        for name, param in peft_model.named_parameters():
+            if "lora_B" in name:
+                torch.nn.init.normal_(param)
+        peft_model.save_pretrained(cls.ADAPTER_LOC)
+        cls.input_ids = torch.randint(
+            0, 64, (2, 12), generator=torch.Generator().manual_seed(0)
+        )
+        with torch.inference_mode():
+            cls.expected_logits = peft_model(cls.input_ids).logits
+
+    @classmethod
+    def teardown_class(cls) -> None:
+        for loc in [cls.BASE_LOC, cls.ADAPTER_LOC]:
+            if loc.exists():
+                shutil.rmtree(loc)
@@ -2,7 +2,11 @@ import os
 import shutil
 import subprocess
 
-from data_management.create_file_data_point import get_data_point, get_switch_loc
+from data_management.create_file_data_point import (
+    get_data_point,
+    get_switch_loc,
+    save_data_point,
+)
 from data_management.sentence_db import SentenceDB
 from data_management.splits import DATA_POINTS_NAME, REPOS_NAME
 from test_utils.utils import (
@@ -46,13 +50,9 @@ def setup_project_dataset():
         list_thms_loc, workspace_loc, sentence_db, True, get_switch_loc()
     )
 
-    defs_dp.save(
-        TEST_MINI_DATASET_LOC / DATA_POINTS_NAME / defs_dp.dp_name,
-        sentence_db,
-        insert_allowed=True,
+    save_data_point(
+        defs_dp, TEST_MINI_DATASET_LOC / DATA_POINTS_NAME / defs_dp.dp_name, sentence_db
     )
-    thms_dp.save(
-        TEST_MINI_DATASET_LOC / DATA_POINTS_NAME / thms_dp.dp_name,
-        sentence_db,
-        insert_allowed=True,
+    save_data_point(
+        thms_dp, TEST_MINI_DATASET_LOC / DATA_POINTS_NAME / thms_dp.dp_name, sentence_db
     )